@@ -1,2 +1,3 @@
 ariadne-codegen --config tableau-queries.toml
 ariadne-codegen --config tableau-customops.toml
+python ../../tools/msgspec_codegen.py tableau_queries --exclude tableau_queries.input_types -o tableau_structs.py
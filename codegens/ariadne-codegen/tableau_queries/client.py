@@ -272,6 +272,7 @@ class Client(AsyncBaseClient):
                   id
                   upstreamFields {
                     __typename
+                    id
                     name
                     datasource {
                       __typename
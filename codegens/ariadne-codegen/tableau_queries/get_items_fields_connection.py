@@ -56,6 +56,7 @@ class GetItemsFieldsConnectionFieldsConnectionNodesUpstreamFields(BaseModel):
         "HierarchyField",
         "SetField",
     ] = Field(alias="__typename")
+    id: str
     name: Optional[str]
     datasource: Optional[
         "GetItemsFieldsConnectionFieldsConnectionNodesUpstreamFieldsDatasource"
@@ -0,0 +1,89 @@
+from .columnar import ColumnarBuilder
+from .cost import (
+    DEFAULT_LIST_SIZE,
+    TABLEAU_DEFAULT_FIRST,
+    TABLEAU_MAX_FIRST,
+    TABLEAU_NODE_LIMIT,
+    NodeCountEstimator,
+    estimate_nodes,
+    max_safe_first,
+)
+from .entities import EntityCache
+from .ids import IdInterner
+from .lineage import (
+    LineageBuilder,
+    LineageGraph,
+    column_key,
+    custom_sql_table_edges,
+    embedded_datasource_edges,
+    field_edges,
+    sheet_edges,
+)
+from .lineage_store import LineageDelta, LineageStore
+from .operations import Operation, call_arguments, get_operation, list_operations
+from .pagination import choose_first, get_connection, paginate, paginate_data
+from .parallel import ValidationPool
+from .planner import (
+    FollowUpQuery,
+    QueryPlan,
+    QueryPlanner,
+    SplittingClient,
+    SplittingClientMixin,
+)
+from .schema import SCHEMA_PATH, load_schema
+from .sinks import NDJSONSink, ParquetSink, Sink, page_nodes, stream_to_sink
+from .validation import (
+    DocumentValidationError,
+    DocumentValidator,
+    ValidatingClient,
+    ValidatingClientMixin,
+    default_validator,
+)
+
+__all__ = [
+    "ColumnarBuilder",
+    "DEFAULT_LIST_SIZE",
+    "DocumentValidationError",
+    "DocumentValidator",
+    "EntityCache",
+    "FollowUpQuery",
+    "IdInterner",
+    "LineageBuilder",
+    "LineageDelta",
+    "LineageGraph",
+    "LineageStore",
+    "NDJSONSink",
+    "NodeCountEstimator",
+    "Operation",
+    "ParquetSink",
+    "QueryPlan",
+    "QueryPlanner",
+    "SCHEMA_PATH",
+    "Sink",
+    "SplittingClient",
+    "SplittingClientMixin",
+    "TABLEAU_DEFAULT_FIRST",
+    "TABLEAU_MAX_FIRST",
+    "TABLEAU_NODE_LIMIT",
+    "ValidatingClient",
+    "ValidatingClientMixin",
+    "ValidationPool",
+    "call_arguments",
+    "choose_first",
+    "column_key",
+    "custom_sql_table_edges",
+    "default_validator",
+    "embedded_datasource_edges",
+    "estimate_nodes",
+    "field_edges",
+    "get_connection",
+    "get_operation",
+    "list_operations",
+    "load_schema",
+    "max_safe_first",
+    "page_nodes",
+    "paginate",
+    "paginate_data",
+    "sheet_edges",
+    "stream_to_sink",
+]
@@ -0,0 +1,270 @@
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLOutputType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    get_named_type,
+    is_composite_type,
+    parse,
+)
+
+from .operations import get_operation
+from .schema import load_schema
+
+try:
+    import numpy  # type: ignore[import-not-found,unused-ignore]
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
+try:
+    import pyarrow  # type: ignore[import-not-found,unused-ignore]
+except ImportError:
+    pyarrow = None  # type: ignore[assignment]
+
+_SCALAR_KINDS = {"Int": "int", "Float": "float", "Boolean": "bool"}
+
+
+class _ScalarColumn:
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self.valid = bytearray()
+        self.values: Union[array, bytearray, List[Any]]
+        if kind == "int":
+            self.values = array("q")
+        elif kind == "float":
+            self.values = array("d")
+        elif kind == "bool":
+            self.values = bytearray()
+        else:
+            self.values = []
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.valid.append(0)
+            self.values.append(None if self.kind == "object" else 0)
+        else:
+            self.valid.append(1)
+            self.values.append(value)
+
+    def _numeric_values(self) -> Any:
+        dtype = {"int": numpy.int64, "float": numpy.float64, "bool": numpy.bool_}
+        return numpy.frombuffer(self.values, dtype=dtype[self.kind])
+
+    def to_numpy(self, path: str, out: Dict[str, Any]) -> None:
+        if self.kind == "object":
+            values = numpy.empty(len(self.values), dtype=object)
+            values[:] = self.values
+        else:
+            values = self._numeric_values()
+        valid = numpy.frombuffer(self.valid, dtype=numpy.bool_)
+        out[path] = values if valid.all() else numpy.ma.array(values, mask=~valid)
+
+    def to_arrow(self) -> Any:
+        mask = ~numpy.frombuffer(self.valid, dtype=numpy.bool_)
+        if self.kind == "object":
+            return pyarrow.array(self.values, type=pyarrow.string(), mask=mask)
+        return pyarrow.array(self._numeric_values(), mask=mask)
+
+
+class _StructColumn:
+    def __init__(self, fields: Dict[str, Any]) -> None:
+        self.fields = fields
+        self.valid = bytearray()
+
+    def append(self, value: Optional[Dict[str, Any]]) -> None:
+        if value is None:
+            self.valid.append(0)
+            for column in self.fields.values():
+                column.append(None)
+        else:
+            self.valid.append(1)
+            for key, column in self.fields.items():
+                column.append(value.get(key))
+
+    def to_numpy(self, path: str, out: Dict[str, Any]) -> None:
+        for key, column in self.fields.items():
+            column.to_numpy(f"{path}.{key}" if path else key, out)
+
+    def to_arrow(self) -> Any:
+        return pyarrow.StructArray.from_arrays(
+            [column.to_arrow() for column in self.fields.values()],
+            names=list(self.fields),
+            mask=pyarrow.array(~numpy.frombuffer(self.valid, dtype=numpy.bool_)),
+        )
+
+
+class _ListColumn:
+    def __init__(self, item: Any) -> None:
+        self.item = item
+        self.offsets = array("q", [0])
+        self.valid = bytearray()
+
+    def append(self, value: Optional[List[Any]]) -> None:
+        if value is None:
+            self.valid.append(0)
+            self.offsets.append(self.offsets[-1])
+        else:
+            self.valid.append(1)
+            for item in value:
+                self.item.append(item)
+            self.offsets.append(self.offsets[-1] + len(value))
+
+    def to_numpy(self, path: str, out: Dict[str, Any]) -> None:
+        out[path] = numpy.frombuffer(self.offsets, dtype=numpy.int64)
+        self.item.to_numpy(f"{path}[]", out)
+
+    def to_arrow(self) -> Any:
+        return pyarrow.LargeListArray.from_arrays(
+            pyarrow.array(numpy.frombuffer(self.offsets, dtype=numpy.int64)),
+            self.item.to_arrow(),
+            mask=pyarrow.array(~numpy.frombuffer(self.valid, dtype=numpy.bool_)),
+        )
+
+
+class ColumnarBuilder:
+    """
+    Flattens connection nodes from raw response JSON into column arrays.
+
+    The column layout is derived once from the `nodes` selection set of
+    the operation: scalars become typed arrays (int64, float64, bool) or
+    string lists, objects become groups of child columns, and lists become
+    an int64 offsets array over their flattened items, like Arrow list
+    arrays. Inline fragments contribute their fields as nullable columns.
+    No pydantic model is built for any row.
+    """
+
+    def __init__(
+        self,
+        document: Union[str, DocumentNode],
+        schema: Optional[GraphQLSchema] = None,
+        operation_name: Optional[str] = None,
+    ) -> None:
+        self.schema = schema or load_schema()
+        ast = parse(document) if isinstance(document, str) else document
+        operation = next(
+            definition
+            for definition in ast.definitions
+            if isinstance(definition, OperationDefinitionNode)
+            and (
+                operation_name is None
+                or (definition.name and definition.name.value == operation_name)
+            )
+        )
+        connection = operation.selection_set.selections[0]
+        assert isinstance(connection, FieldNode) and connection.selection_set
+        query_type = self.schema.query_type
+        assert query_type is not None
+        connection_type = get_named_type(query_type.fields[connection.name.value].type)
+        assert isinstance(connection_type, GraphQLObjectType)
+        nodes = next(
+            selection
+            for selection in connection.selection_set.selections
+            if isinstance(selection, FieldNode) and selection.name.value == "nodes"
+        )
+        assert nodes.selection_set is not None
+
+        self.connection_key = (connection.alias or connection.name).value
+        self._rows = _StructColumn(
+            self._struct_fields(
+                nodes.selection_set,
+                get_named_type(connection_type.fields["nodes"].type),
+            )
+        )
+
+    @classmethod
+    def for_operation(cls, method: str) -> "ColumnarBuilder":
+        """Builder for the nodes of `tableau_queries.Client.<method>`."""
+        operation = get_operation(method)
+        return cls(operation.document, operation_name=operation.name)
+
+    def __len__(self) -> int:
+        return len(self._rows.valid)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._rows.fields)
+
+    def append_page(self, data: Dict[str, Any]) -> None:
+        """Appends the nodes of one page of response `data`."""
+        self.append_nodes(data[self.connection_key]["nodes"])
+
+    def append_nodes(self, nodes: Iterable[Dict[str, Any]]) -> None:
+        for node in nodes:
+            self._rows.append(node)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Returns flat NumPy arrays keyed by dotted path. A list column `a`
+        gives an offsets array under `a` and its items under `a[]`.
+        """
+        if numpy is None:
+            raise ImportError("NumPy export requires 'numpy' package.")
+        out: Dict[str, Any] = {}
+        self._rows.to_numpy("", out)
+        return out
+
+    def to_arrow(self) -> Any:
+        """Returns a `pyarrow.Table` with one row per node."""
+        if pyarrow is None or numpy is None:
+            raise ImportError("Arrow export requires 'pyarrow' and 'numpy' packages.")
+        return pyarrow.Table.from_arrays(
+            [column.to_arrow() for column in self._rows.fields.values()],
+            names=self.columns,
+        )
+
+    def _struct_fields(
+        self, selection_set: SelectionSetNode, parent_type: Any
+    ) -> Dict[str, Any]:
+        fields: Dict[str, Any] = {}
+        for selection in selection_set.selections:
+            if isinstance(selection, InlineFragmentNode):
+                fragment_type = (
+                    self.schema.get_type(selection.type_condition.name.value)
+                    if selection.type_condition
+                    else parent_type
+                )
+                _merge(
+                    fields, self._struct_fields(selection.selection_set, fragment_type)
+                )
+            elif isinstance(selection, FieldNode):
+                key = (selection.alias or selection.name).value
+                if selection.name.value == "__typename":
+                    column: Any = _ScalarColumn("object")
+                else:
+                    definition = parent_type.fields[selection.name.value]
+                    column = self._column(definition.type, selection)
+                _merge(fields, {key: column})
+        return fields
+
+    def _column(self, type_: GraphQLOutputType, selection: FieldNode) -> Any:
+        if isinstance(type_, GraphQLNonNull):
+            return self._column(type_.of_type, selection)
+        if isinstance(type_, GraphQLList):
+            return _ListColumn(self._column(type_.of_type, selection))
+        if is_composite_type(type_):
+            assert selection.selection_set is not None
+            return _StructColumn(self._struct_fields(selection.selection_set, type_))
+        return _ScalarColumn(_SCALAR_KINDS.get(get_named_type(type_).name, "object"))
+
+
+def _merge(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    for key, column in source.items():
+        existing = target.get(key)
+        if existing is None:
+            target[key] = column
+        elif isinstance(existing, _StructColumn) and isinstance(column, _StructColumn):
+            _merge(existing.fields, column.fields)
+        elif isinstance(existing, _ListColumn) and isinstance(column, _ListColumn):
+            if isinstance(existing.item, _StructColumn) and isinstance(
+                column.item, _StructColumn
+            ):
+                _merge(existing.item.fields, column.item.fields)
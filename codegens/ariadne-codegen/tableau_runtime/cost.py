@@ -0,0 +1,280 @@
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLList,
+    GraphQLNamedType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    SelectionNode,
+    SelectionSetNode,
+    VariableNode,
+    get_named_type,
+    get_nullable_type,
+    is_composite_type,
+    parse,
+    value_from_ast_untyped,
+)
+
+from .schema import load_schema
+
+# Default of the `metadata.query.limits.count` setting on Tableau Server.
+TABLEAU_NODE_LIMIT = 20000
+# Tableau caps `first` at 1000 and uses 100 when it is not provided.
+TABLEAU_MAX_FIRST = 1000
+TABLEAU_DEFAULT_FIRST = 100
+# Assumed fan-out of list fields that cannot be paginated, e.g. `Sheet.tags`.
+DEFAULT_LIST_SIZE = 10
+
+
+class NodeCountEstimator:
+    """
+    Estimates the worst-case number of nodes a document makes Tableau resolve.
+
+    Every object in the response counts as one node. Lists multiply the cost
+    of their selections: connection `nodes` by the `first` argument of the
+    connection (the default of its variable, or `default_first` when it is
+    not given, as Tableau does), any other list by `list_size` or a
+    per-field override keyed by `Type.field`. Inline fragments on different
+    types are mutually exclusive, so only the most expensive one counts.
+    """
+
+    def __init__(
+        self,
+        schema: Optional[GraphQLSchema] = None,
+        list_size: int = DEFAULT_LIST_SIZE,
+        list_sizes: Optional[Mapping[str, int]] = None,
+        default_first: int = TABLEAU_DEFAULT_FIRST,
+    ) -> None:
+        self._schema = schema
+        self.list_size = list_size
+        self.list_sizes = dict(list_sizes or {})
+        self.default_first = default_first
+
+    @property
+    def schema(self) -> GraphQLSchema:
+        if self._schema is None:
+            self._schema = load_schema()
+        return self._schema
+
+    def estimate(
+        self,
+        document: Union[str, DocumentNode],
+        variables: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+    ) -> int:
+        """Returns the worst-case node count of one operation of the document."""
+        ast = parse(document) if isinstance(document, str) else document
+        operation = _get_operation(ast, operation_name)
+        fragments = {
+            definition.name.value: definition
+            for definition in ast.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        root = self.schema.get_root_type(operation.operation)
+        if root is None:
+            raise ValueError(f"Schema has no {operation.operation.value} type.")
+        values = {
+            definition.variable.name.value: value_from_ast_untyped(
+                definition.default_value
+            )
+            for definition in operation.variable_definitions or ()
+            if definition.default_value is not None
+        }
+        values.update(variables or {})
+        return self._selection_set_cost(
+            operation.selection_set, root, values, fragments, None
+        )
+
+    def max_safe_first(
+        self,
+        document: Union[str, DocumentNode],
+        limit: int = TABLEAU_NODE_LIMIT,
+        variables: Optional[Dict[str, Any]] = None,
+        variable: str = "first",
+        max_first: int = TABLEAU_MAX_FIRST,
+        operation_name: Optional[str] = None,
+    ) -> int:
+        """
+        Returns the largest value of the `first` variable that keeps the
+        estimate within `limit`, or 0 if not even a single item fits.
+        """
+        ast = parse(document) if isinstance(document, str) else document
+        base = dict(variables or {})
+
+        def fits(first: int) -> bool:
+            base[variable] = first
+            return self.estimate(ast, base, operation_name) <= limit
+
+        low, high = 0, max_first
+        while low < high:
+            middle = (low + high + 1) // 2
+            if fits(middle):
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def field_cost(
+        self,
+        field: FieldNode,
+        parent_type: GraphQLNamedType,
+        variables: Optional[Dict[str, Any]] = None,
+        fragments: Optional[Dict[str, FragmentDefinitionNode]] = None,
+    ) -> int:
+        """Returns the worst-case node count of one field of `parent_type`."""
+        return self._field_cost(
+            field, parent_type, variables or {}, fragments or {}, None
+        )
+
+    def selection_cost(
+        self,
+        selection: SelectionNode,
+        parent_type: GraphQLNamedType,
+        variables: Optional[Dict[str, Any]] = None,
+        fragments: Optional[Dict[str, FragmentDefinitionNode]] = None,
+    ) -> int:
+        """Same as `field_cost`, for a field or a fragment of `parent_type`."""
+        return self._selection_set_cost(
+            SelectionSetNode(selections=(selection,)),
+            parent_type,
+            variables or {},
+            fragments or {},
+            None,
+        )
+
+    def _selection_set_cost(
+        self,
+        selection_set: SelectionSetNode,
+        parent_type: GraphQLNamedType,
+        variables: Dict[str, Any],
+        fragments: Dict[str, FragmentDefinitionNode],
+        page_size: Optional[int],
+    ) -> int:
+        cost = 0
+        fragment_costs: Dict[str, int] = {}
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                cost += self._field_cost(
+                    selection, parent_type, variables, fragments, page_size
+                )
+                continue
+
+            if isinstance(selection, FragmentSpreadNode):
+                fragment = fragments[selection.name.value]
+                type_name = fragment.type_condition.name.value
+                sub_selection_set = fragment.selection_set
+            elif isinstance(selection, InlineFragmentNode):
+                type_name = (
+                    selection.type_condition.name.value
+                    if selection.type_condition
+                    else parent_type.name
+                )
+                sub_selection_set = selection.selection_set
+            else:
+                continue
+
+            fragment_type = self.schema.get_type(type_name)
+            assert fragment_type is not None
+            fragment_cost = self._selection_set_cost(
+                sub_selection_set, fragment_type, variables, fragments, page_size
+            )
+            if type_name == parent_type.name:
+                cost += fragment_cost
+            else:
+                fragment_costs[type_name] = (
+                    fragment_costs.get(type_name, 0) + fragment_cost
+                )
+        return cost + max(fragment_costs.values(), default=0)
+
+    def _field_cost(
+        self,
+        field: FieldNode,
+        parent_type: GraphQLNamedType,
+        variables: Dict[str, Any],
+        fragments: Dict[str, FragmentDefinitionNode],
+        page_size: Optional[int],
+    ) -> int:
+        name = field.name.value
+        if name.startswith("__") or field.selection_set is None:
+            return 0
+
+        definition = getattr(parent_type, "fields", {}).get(name)
+        if definition is None:
+            raise ValueError(f"Unknown field {parent_type.name}.{name}.")
+        field_type = get_named_type(definition.type)
+        if not is_composite_type(field_type):
+            return 0
+
+        first = self._first_argument(field, field_type, variables)
+        if isinstance(get_nullable_type(definition.type), GraphQLList):
+            width = self.list_sizes.get(
+                f"{parent_type.name}.{name}",
+                page_size if page_size is not None else self.list_size,
+            )
+        else:
+            width = 1
+
+        children = self._selection_set_cost(
+            field.selection_set, field_type, variables, fragments, first
+        )
+        return width * (1 + children)
+
+    def _first_argument(
+        self, field: FieldNode, field_type: GraphQLNamedType, variables: Dict[str, Any]
+    ) -> Optional[int]:
+        for argument in field.arguments or ():
+            if argument.name.value != "first":
+                continue
+            value = argument.value
+            if isinstance(value, IntValueNode):
+                return int(value.value)
+            if isinstance(value, VariableNode):
+                provided = variables.get(value.name.value)
+                return self.default_first if provided is None else int(provided)
+        # A connection without `first` still returns a page of `nodes`.
+        if "nodes" in getattr(field_type, "fields", {}):
+            return self.default_first
+        return None
+
+
+def _get_operation(
+    document: DocumentNode, operation_name: Optional[str]
+) -> OperationDefinitionNode:
+    operations: List[OperationDefinitionNode] = [
+        definition
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    ]
+    for operation in operations:
+        if operation_name is None or (
+            operation.name and operation.name.value == operation_name
+        ):
+            return operation
+    raise ValueError(f"Operation {operation_name!r} not found in document.")
+
+
+def estimate_nodes(
+    document: Union[str, DocumentNode],
+    variables: Optional[Dict[str, Any]] = None,
+    operation_name: Optional[str] = None,
+) -> int:
+    """Shortcut for `NodeCountEstimator().estimate(...)` with the defaults."""
+    return NodeCountEstimator().estimate(document, variables, operation_name)
+
+
+def max_safe_first(
+    document: Union[str, DocumentNode],
+    limit: int = TABLEAU_NODE_LIMIT,
+    variables: Optional[Dict[str, Any]] = None,
+    operation_name: Optional[str] = None,
+) -> int:
+    """Shortcut for `NodeCountEstimator().max_safe_first(...)` with the defaults."""
+    return NodeCountEstimator().max_safe_first(
+        document, limit, variables, operation_name=operation_name
+    )
@@ -0,0 +1,90 @@
+from typing import Any, Dict, Hashable, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+from .ids import IdInterner
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+EntityKey = Tuple[type, str, Hashable]
+
+
+class EntityCache:
+    """
+    Identity map that keeps a single instance per Tableau entity.
+
+    Entities are keyed by `__typename` + `id` (and by model class, since
+    two selections of the same entity are different models). Interning a
+    response walks it top-down: an entity already in the map replaces the
+    freshly validated copy, and its subtree is not visited again. The map
+    outlives single responses, so repeated workbooks, datasources and
+    databases are shared across all pages of a crawl and can be compared
+    with `is`.
+
+    With an `IdInterner`, entities are keyed by integer handle and the
+    `id` of every new entity is replaced by the interner's canonical copy.
+    """
+
+    def __init__(self, ids: Optional[IdInterner] = None) -> None:
+        self.ids = ids
+        self._entities: Dict[EntityKey, BaseModel] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __contains__(self, model: object) -> bool:
+        if not isinstance(model, BaseModel):
+            return False
+        key = self.key(model)
+        return key is not None and self._entities.get(key) is model
+
+    def key(self, model: BaseModel) -> Any:
+        """Returns the identity of the model, or `None` if it has no `id`."""
+        entity_id = model.__dict__.get("id")
+        if entity_id is None:
+            return None
+        if self.ids is not None:
+            entity_id = self.ids.intern(entity_id)
+        typename = model.__dict__.get("typename__") or type(model).__name__
+        return (type(model), typename, entity_id)
+
+    def intern(self, model: ModelT) -> ModelT:
+        """Interns every entity of the model tree and returns the canonical root."""
+        return self._intern_value(model)
+
+    def clear(self) -> None:
+        self._entities.clear()
+        self.hits = self.misses = 0
+
+    def _intern_value(self, value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return self._intern_model(value)
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                interned = self._intern_value(item)
+                if interned is not item:
+                    value[index] = interned
+        return value
+
+    def _intern_model(self, model: BaseModel) -> BaseModel:
+        key = self.key(model)
+        if key is not None:
+            canonical = self._entities.get(key)
+            if canonical is not None:
+                self.hits += 1
+                return canonical
+            self.misses += 1
+            self._entities[key] = model
+            if self.ids is not None:
+                model.__dict__["id"] = self.ids.lookup(key[2])
+
+        # Bypass `validate_assignment`: the values are already validated.
+        fields = model.__dict__
+        for name in type(model).model_fields:
+            value = fields.get(name)
+            interned = self._intern_value(value)
+            if interned is not value:
+                fields[name] = interned
+        return model
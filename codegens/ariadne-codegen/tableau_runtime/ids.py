@@ -0,0 +1,69 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from pydantic import BaseModel
+
+
+class IdInterner:
+    """
+    Maps Tableau entity IDs to dense integer handles and back.
+
+    Each ID string is stored once: the dict key and the reverse-lookup
+    entry are the same object, and `canonical()` / `intern_model()` make
+    response models point at it as well, so thousands of copies of the
+    same UUID collapse into one. Handles are consecutive from 0, which
+    lets lineage structures index plain arrays with them.
+    """
+
+    def __init__(self, ids: Iterable[str] = ()) -> None:
+        self._handles: Dict[str, int] = {}
+        self._ids: List[str] = []
+        for entity_id in ids:
+            self.intern(entity_id)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, entity_id: object) -> bool:
+        return entity_id in self._handles
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def intern(self, entity_id: str) -> int:
+        """Returns the handle of the ID, allocating the next one if it is new."""
+        handle = self._handles.get(entity_id)
+        if handle is None:
+            handle = self._handles[entity_id] = len(self._ids)
+            self._ids.append(entity_id)
+        return handle
+
+    def intern_many(self, ids: Iterable[str]) -> List[int]:
+        return [self.intern(entity_id) for entity_id in ids]
+
+    def get(self, entity_id: str) -> Optional[int]:
+        """Returns the handle of the ID without allocating one."""
+        return self._handles.get(entity_id)
+
+    def lookup(self, handle: int) -> str:
+        """Returns the ID behind a handle."""
+        return self._ids[handle]
+
+    def canonical(self, entity_id: str) -> str:
+        """Returns the single stored copy of the ID."""
+        return self._ids[self.intern(entity_id)]
+
+    def intern_model(self, model: Any) -> Any:
+        """Points every `id` field of the model tree at its canonical string."""
+        if isinstance(model, list):
+            for item in model:
+                self.intern_model(item)
+        elif isinstance(model, BaseModel):
+            fields = model.__dict__
+            entity_id = fields.get("id")
+            if isinstance(entity_id, str):
+                fields["id"] = self.canonical(entity_id)
+            for name in type(model).model_fields:
+                value = fields.get(name)
+                if isinstance(value, (BaseModel, list)):
+                    self.intern_model(value)
+        return model
@@ -0,0 +1,298 @@
+from array import array
+from typing import Any, Iterable, Iterator, List, Optional, Set, Tuple
+
+from tableau_queries.get_items_custom_sql_tables_connection import (
+    GetItemsCustomSQLTablesConnection,
+)
+from tableau_queries.get_items_fields_connection import GetItemsFieldsConnection
+
+from .ids import IdInterner
+
+try:
+    import numpy  # type: ignore[import-not-found,unused-ignore]
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
+
+def column_key(table_id: str, name: Optional[str]) -> str:
+    """Identity of a column that the operations only select by table + name."""
+    return f"{table_id}/{name}"
+
+
+class LineageGraph:
+    """
+    Immutable lineage graph in compressed sparse row (CSR) form.
+
+    Vertices are `IdInterner` handles and edges point downstream, from
+    the object that is read to the object that reads it. Both directions
+    are stored as an `offsets` / `targets` pair of NumPy int64 arrays, so
+    neighbour lookups are slices and traversals expand a whole frontier at
+    once against a visited mask, which keeps graphs with millions of
+    edges compact and fast to build and walk.
+    """
+
+    def __init__(
+        self,
+        ids: IdInterner,
+        offsets: Any,
+        targets: Any,
+        reverse_offsets: Any,
+        reverse_targets: Any,
+    ) -> None:
+        self.ids = ids
+        self._offsets = offsets
+        self._targets = targets
+        self._reverse_offsets = reverse_offsets
+        self._reverse_targets = reverse_targets
+
+    @classmethod
+    def from_edges(
+        cls, ids: IdInterner, sources: Iterable[int], targets: Iterable[int]
+    ) -> "LineageGraph":
+        """Builds the graph from parallel arrays of edge endpoints (handles)."""
+        if numpy is None:
+            raise ImportError("Lineage graphs require 'numpy' package.")
+        sources = _int64_array(sources)
+        targets = _int64_array(targets)
+        if len(sources) != len(targets):
+            raise ValueError("Edge sources and targets differ in length.")
+        offsets, csr_targets = _to_csr(len(ids), sources, targets)
+        reverse_offsets, reverse_targets = _to_csr(len(ids), targets, sources)
+        return cls(ids, offsets, csr_targets, reverse_offsets, reverse_targets)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._targets)
+
+    def edges(self) -> Iterator[Tuple[str, str]]:
+        lookup = self.ids.lookup
+        for source in range(self.vertex_count):
+            for target in self.downstream_handles(source).tolist():
+                yield lookup(source), lookup(target)
+
+    def downstream_handles(self, handle: int) -> Any:
+        if handle >= self.vertex_count:
+            return self._targets[:0]
+        return self._targets[self._offsets[handle] : self._offsets[handle + 1]]
+
+    def upstream_handles(self, handle: int) -> Any:
+        if handle >= self.vertex_count:
+            return self._reverse_targets[:0]
+        return self._reverse_targets[
+            self._reverse_offsets[handle] : self._reverse_offsets[handle + 1]
+        ]
+
+    def downstream(self, entity_id: str) -> List[str]:
+        """Objects that read `entity_id` directly."""
+        return self._lookup(self.downstream_handles(self._handle(entity_id)).tolist())
+
+    def upstream(self, entity_id: str) -> List[str]:
+        """Objects that `entity_id` reads directly."""
+        return self._lookup(self.upstream_handles(self._handle(entity_id)).tolist())
+
+    def descendants(self, entity_id: str, max_depth: Optional[int] = None) -> Set[str]:
+        """Transitive closure downstream of `entity_id`, excluding itself."""
+        return self.impact([entity_id], max_depth)
+
+    def ancestors(self, entity_id: str, max_depth: Optional[int] = None) -> Set[str]:
+        """Transitive closure upstream of `entity_id`, excluding itself."""
+        handles = self._reach(
+            [self._handle(entity_id)],
+            self._reverse_offsets,
+            self._reverse_targets,
+            max_depth,
+        )
+        return set(self._lookup(handles))
+
+    def impact(
+        self, entity_ids: Iterable[str], max_depth: Optional[int] = None
+    ) -> Set[str]:
+        """Everything downstream of any of `entity_ids`, excluding themselves."""
+        handles = self._reach(
+            [self._handle(entity_id) for entity_id in entity_ids],
+            self._offsets,
+            self._targets,
+            max_depth,
+        )
+        return set(self._lookup(handles))
+
+    def _handle(self, entity_id: str) -> int:
+        handle = self.ids.get(entity_id)
+        if handle is None:
+            raise KeyError(entity_id)
+        return handle
+
+    def _lookup(self, handles: Iterable[int]) -> List[str]:
+        lookup = self.ids.lookup
+        return [lookup(handle) for handle in handles]
+
+    def _reach(
+        self,
+        starts: List[int],
+        offsets: Any,
+        targets: Any,
+        max_depth: Optional[int],
+    ) -> List[int]:
+        visited = numpy.zeros(len(self.ids), dtype=bool)
+        frontier = numpy.array(starts, dtype=numpy.int64)
+        visited[frontier] = True
+        frontier = frontier[frontier < self.vertex_count]
+        reached = []
+        depth = 0
+        while len(frontier) and (max_depth is None or depth < max_depth):
+            # The rows of the whole frontier, gathered with one index array.
+            begins = offsets[frontier]
+            lengths = offsets[frontier + 1] - begins
+            ends = numpy.cumsum(lengths)
+            positions = numpy.arange(ends[-1]) + numpy.repeat(
+                begins - ends + lengths, lengths
+            )
+            neighbours = _distinct(targets[positions])
+            frontier = neighbours[~visited[neighbours]]
+            visited[frontier] = True
+            reached.append(frontier)
+            depth += 1
+        if not reached:
+            return []
+        return numpy.concatenate(reached).tolist()
+
+
+def _int64_array(values: Iterable[int]) -> Any:
+    if isinstance(values, array) and values.typecode == "q":
+        return numpy.frombuffer(values, dtype=numpy.int64)
+    return numpy.fromiter(values, dtype=numpy.int64)
+
+
+def _to_csr(vertex_count: int, sources: Any, targets: Any) -> Tuple[Any, Any]:
+    """Sorts edges by source, then target, and drops duplicate edges."""
+    # One int64 key per edge sorts much faster than `lexsort` on two.
+    edges = _distinct(sources * vertex_count + targets)
+    row_length = max(vertex_count, 1)
+    offsets = numpy.zeros(vertex_count + 1, dtype=numpy.int64)
+    numpy.cumsum(
+        numpy.bincount(edges // row_length, minlength=vertex_count),
+        out=offsets[1:],
+    )
+    return offsets, edges % row_length
+
+
+def _distinct(values: Any) -> Any:
+    """Sorted distinct `values`: `numpy.unique` without its overhead."""
+    values = numpy.sort(values)
+    if len(values) > 1:
+        values = values[numpy.concatenate(([True], values[1:] != values[:-1]))]
+    return values
+
+
+Edge = Tuple[str, str]
+
+
+def field_edges(node: Any) -> Iterator[Edge]:
+    """Edges into a `fieldsConnection` node from its upstream fields/columns."""
+    # Upstream fields are keyed by `id` like the nodes themselves, so the
+    # edges of one page chain into those of the next.
+    for upstream_field in node.upstream_fields:
+        if upstream_field:
+            yield upstream_field.id, node.id
+    for column in node.upstream_columns:
+        if column and column.table:
+            yield column_key(column.table.id, column.name), node.id
+
+
+def custom_sql_table_edges(node: Any) -> Iterator[Edge]:
+    """
+    Database -> table -> custom SQL table -> column -> datasource edges of a
+    `customSQLTablesConnection` node, plus the upstream tables of every
+    datasource reading one of its columns.
+    """
+    if node.database:
+        yield node.database.id, node.id
+    for table in node.tables:
+        yield from _table_edges(table, node.id)
+    for column in node.columns:
+        column_id = column_key(node.id, column.name)
+        yield node.id, column_id
+        for reference in column.referenced_by_fields or ():
+            datasource = reference and reference.datasource
+            if not datasource:
+                continue
+            yield column_id, datasource.id
+            for table in datasource.upstream_tables:
+                yield from _table_edges(table, datasource.id)
+
+
+def sheet_edges(node: Any) -> Iterator[Edge]:
+    """Datasource -> field -> sheet edges of a `sheetsConnection` node."""
+    for datasource_field in node.datasource_fields or ():
+        if not datasource_field:
+            continue
+        yield datasource_field.id, node.id
+        if datasource_field.datasource:
+            yield datasource_field.datasource.id, datasource_field.id
+        remote_field = getattr(datasource_field, "remote_field", None)
+        if remote_field:
+            yield remote_field.id, datasource_field.id
+
+
+def embedded_datasource_edges(node: Any) -> Iterator[Edge]:
+    """
+    Edges of an `embeddedDatasourcesConnection` node: upstream tables and
+    datasources into it, and it into its fields, downstream sheets and
+    workbook.
+    """
+    for table in node.upstream_tables:
+        yield from _table_edges(table, node.id)
+    for upstream in node.upstream_datasources:
+        yield upstream.id, node.id
+    for datasource_field in node.fields:
+        yield node.id, datasource_field.id
+    for sheet in node.downstream_sheets:
+        yield node.id, sheet.id
+    if node.workbook:
+        yield node.id, node.workbook.id
+
+
+def _table_edges(table: Any, reader_id: str) -> Iterator[Edge]:
+    if table.database:
+        yield table.database.id, table.id
+    yield table.id, reader_id
+
+
+class LineageBuilder:
+    """
+    Collects lineage edges from typed responses and builds a `LineageGraph`.
+
+    Columns, which the operations select without an `id`, are identified
+    by `column_key()`, so the same column reached from a custom SQL table
+    and from a field's `upstreamColumns` ends up as one vertex.
+    """
+
+    def __init__(self, ids: Optional[IdInterner] = None) -> None:
+        self.ids = ids if ids is not None else IdInterner()
+        self._sources = array("q")
+        self._targets = array("q")
+
+    def add_edge(self, upstream: str, downstream: str) -> None:
+        self._sources.append(self.ids.intern(upstream))
+        self._targets.append(self.ids.intern(downstream))
+
+    def add_edges(self, edges: Iterable[Edge]) -> None:
+        for upstream, downstream in edges:
+            self.add_edge(upstream, downstream)
+
+    def add_fields_page(self, page: GetItemsFieldsConnection) -> None:
+        for node in page.fields_connection.nodes:
+            self.add_edges(field_edges(node))
+
+    def add_custom_sql_tables_page(
+        self, page: GetItemsCustomSQLTablesConnection
+    ) -> None:
+        for node in page.custom_sql_tables_connection.nodes:
+            self.add_edges(custom_sql_table_edges(node))
+
+    def build(self) -> LineageGraph:
+        return LineageGraph.from_edges(self.ids, self._sources, self._targets)
@@ -0,0 +1,210 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from tableau_queries.get_items_embedded_datasources_connection import (
+    GetItemsEmbeddedDatasourcesConnection,
+)
+from tableau_queries.get_items_fields_connection import GetItemsFieldsConnection
+from tableau_queries.get_items_sheets_connection import GetItemsSheetsConnection
+
+from .ids import IdInterner
+from .lineage import (
+    Edge,
+    LineageGraph,
+    embedded_datasource_edges,
+    field_edges,
+    sheet_edges,
+)
+
+
+@dataclass
+class LineageDelta:
+    """Edges that actually appeared or disappeared after an update."""
+
+    added: List[Edge] = field(default_factory=list)
+    removed: List[Edge] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+class LineageStore:
+    """
+    Mutable lineage graph that is updated with deltas instead of rebuilt.
+
+    Every edge is owned by the node it was read from (a sheet, field or
+    embedded datasource). Re-fetching a node replaces the edges it owns,
+    an edge stays in the graph while any owner still reports it, and only
+    the edges that really changed touch the forward/reverse adjacency.
+    Transitive `descendants()` / `ancestors()` results are cached, and a
+    changed edge `u -> v` only evicts the cached closures that contain
+    `u` (downstream) or `v` (upstream). Those are found through an index
+    from every vertex to the cached closures it is in, so the cost of an
+    update follows the size of the change and of the closures it evicts,
+    not the size of the graph or of the cache.
+    """
+
+    def __init__(self, ids: Optional[IdInterner] = None) -> None:
+        self.ids = ids if ids is not None else IdInterner()
+        self._owned: Dict[int, Set[Tuple[int, int]]] = {}
+        self._references: Dict[Tuple[int, int], int] = {}
+        self._downstream: Dict[int, Set[int]] = {}
+        self._upstream: Dict[int, Set[int]] = {}
+        self._descendants: Dict[int, Set[int]] = {}
+        self._ancestors: Dict[int, Set[int]] = {}
+        # Vertex -> starts of the cached closures containing it (or from it).
+        self._descendants_index: Dict[int, Set[int]] = {}
+        self._ancestors_index: Dict[int, Set[int]] = {}
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._references)
+
+    def apply(self, owner: str, edges: Iterable[Edge]) -> LineageDelta:
+        """Replaces the edges owned by `owner` with `edges`."""
+        intern = self.ids.intern
+        new = {(intern(upstream), intern(downstream)) for upstream, downstream in edges}
+        owner_handle = intern(owner)
+        old = self._owned.get(owner_handle, set())
+        if new:
+            self._owned[owner_handle] = new
+        else:
+            self._owned.pop(owner_handle, None)
+
+        delta = LineageDelta()
+        for edge in new - old:
+            count = self._references.get(edge, 0)
+            self._references[edge] = count + 1
+            if count == 0:
+                self._link(*edge)
+                delta.added.append(self._edge_ids(edge))
+        for edge in old - new:
+            count = self._references[edge] - 1
+            if count:
+                self._references[edge] = count
+            else:
+                del self._references[edge]
+                self._unlink(*edge)
+                delta.removed.append(self._edge_ids(edge))
+        return delta
+
+    def remove(self, owner: str) -> LineageDelta:
+        """Drops every edge owned by `owner`, e.g. after it was deleted."""
+        return self.apply(owner, ())
+
+    def apply_sheets_page(self, page: GetItemsSheetsConnection) -> LineageDelta:
+        return self._apply_nodes(page.sheets_connection.nodes, sheet_edges)
+
+    def apply_fields_page(self, page: GetItemsFieldsConnection) -> LineageDelta:
+        return self._apply_nodes(page.fields_connection.nodes, field_edges)
+
+    def apply_embedded_datasources_page(
+        self, page: GetItemsEmbeddedDatasourcesConnection
+    ) -> LineageDelta:
+        return self._apply_nodes(
+            page.embedded_datasources_connection.nodes, embedded_datasource_edges
+        )
+
+    def downstream(self, entity_id: str) -> Set[str]:
+        return self._lookup(self._downstream.get(self._handle(entity_id), ()))
+
+    def upstream(self, entity_id: str) -> Set[str]:
+        return self._lookup(self._upstream.get(self._handle(entity_id), ()))
+
+    def descendants(self, entity_id: str) -> Set[str]:
+        handle = self._handle(entity_id)
+        return self._lookup(
+            self._closure(
+                handle, self._downstream, self._descendants, self._descendants_index
+            )
+        )
+
+    def ancestors(self, entity_id: str) -> Set[str]:
+        handle = self._handle(entity_id)
+        return self._lookup(
+            self._closure(
+                handle, self._upstream, self._ancestors, self._ancestors_index
+            )
+        )
+
+    def freeze(self) -> LineageGraph:
+        """Returns an immutable CSR snapshot for bulk traversals."""
+        sources = array("q", (source for source, _ in self._references))
+        targets = array("q", (target for _, target in self._references))
+        return LineageGraph.from_edges(self.ids, sources, targets)
+
+    def _apply_nodes(
+        self, nodes: Iterable[Any], edges_of: Callable[[Any], Iterable[Edge]]
+    ) -> LineageDelta:
+        delta = LineageDelta()
+        for node in nodes:
+            node_delta = self.apply(node.id, edges_of(node))
+            delta.added.extend(node_delta.added)
+            delta.removed.extend(node_delta.removed)
+        return delta
+
+    def _link(self, source: int, target: int) -> None:
+        self._invalidate(source, target)
+        self._downstream.setdefault(source, set()).add(target)
+        self._upstream.setdefault(target, set()).add(source)
+
+    def _unlink(self, source: int, target: int) -> None:
+        self._invalidate(source, target)
+        self._discard(self._downstream, source, target)
+        self._discard(self._upstream, target, source)
+
+    def _invalidate(self, source: int, target: int) -> None:
+        for cache, index, vertex in (
+            (self._descendants, self._descendants_index, source),
+            (self._ancestors, self._ancestors_index, target),
+        ):
+            for start in index.pop(vertex, ()):
+                for member in (start, *cache.pop(start)):
+                    starts = index.get(member)
+                    if starts is not None:
+                        starts.discard(start)
+                        if not starts:
+                            del index[member]
+
+    @staticmethod
+    def _discard(adjacency: Dict[int, Set[int]], vertex: int, other: int) -> None:
+        neighbours = adjacency.get(vertex)
+        if neighbours is not None:
+            neighbours.discard(other)
+            if not neighbours:
+                del adjacency[vertex]
+
+    @staticmethod
+    def _closure(
+        start: int,
+        adjacency: Dict[int, Set[int]],
+        cache: Dict[int, Set[int]],
+        index: Dict[int, Set[int]],
+    ) -> Set[int]:
+        closure = cache.get(start)
+        if closure is None:
+            closure = set()
+            stack = [start]
+            while stack:
+                for neighbour in adjacency.get(stack.pop(), ()):
+                    if neighbour not in closure and neighbour != start:
+                        closure.add(neighbour)
+                        stack.append(neighbour)
+            cache[start] = closure
+            for member in (start, *closure):
+                index.setdefault(member, set()).add(start)
+        return closure
+
+    def _handle(self, entity_id: str) -> int:
+        handle = self.ids.get(entity_id)
+        if handle is None:
+            raise KeyError(entity_id)
+        return handle
+
+    def _lookup(self, handles: Iterable[int]) -> Set[str]:
+        lookup = self.ids.lookup
+        return {lookup(handle) for handle in handles}
+
+    def _edge_ids(self, edge: Tuple[int, int]) -> Edge:
+        return self.ids.lookup(edge[0]), self.ids.lookup(edge[1])
@@ -0,0 +1,100 @@
+import inspect
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Type, get_type_hints
+
+from pydantic import BaseModel
+
+from tableau_queries.client import Client
+
+
+@dataclass(frozen=True)
+class Operation:
+    """A generated `tableau_queries.Client` method and what it sends."""
+
+    method: str
+    name: str
+    document: str
+    model: Type[BaseModel]
+
+    @property
+    def connection_field(self) -> str:
+        """Python name of the connection field on the response model."""
+        return next(iter(self.model.model_fields))
+
+    @property
+    def connection_alias(self) -> str:
+        """JSON name of the connection field in the response data."""
+        field = self.model.model_fields[self.connection_field]
+        return field.alias or self.connection_field
+
+
+class _Captured(Exception):
+    def __init__(self, arguments: Dict[str, Any]) -> None:
+        self.arguments = arguments
+
+
+class _RecordingClient(Client):
+    """Client whose `execute` gives back the document instead of sending it."""
+
+    def __init__(self) -> None:  # pylint: disable=super-init-not-called
+        pass
+
+    async def execute(
+        self,
+        query: str,
+        operation_name: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        raise _Captured(
+            {
+                "query": query,
+                "operation_name": operation_name,
+                "variables": variables,
+                **kwargs,
+            }
+        )
+
+
+def call_arguments(method: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """
+    Returns the keyword arguments `tableau_queries.Client.<method>(*args,
+    **kwargs)` passes to `execute()`: `query`, `operation_name`,
+    `variables` and any extra keyword arguments.
+    """
+    coroutine = getattr(Client, method)(_RecordingClient(), *args, **kwargs)
+    try:
+        coroutine.send(None)
+    except _Captured as captured:
+        return captured.arguments
+    finally:
+        coroutine.close()
+    raise RuntimeError(f"{method} did not call execute().")  # pragma: no cover
+
+
+@lru_cache(maxsize=None)
+def get_operation(method: str) -> Operation:
+    """
+    Returns the operation sent by `tableau_queries.Client.<method>`.
+
+    The document is taken from the generated method itself, so it always
+    matches what ariadne-codegen emitted, including the `__typename`
+    selections it adds for unions and interfaces.
+    """
+    arguments = call_arguments(method)
+    return Operation(
+        method=method,
+        name=arguments["operation_name"] or method,
+        document=arguments["query"],
+        model=get_type_hints(getattr(Client, method))["return"],
+    )
+
+
+def list_operations() -> Dict[str, Operation]:
+    """Returns every query of the generated client, keyed by method name."""
+    return {
+        name: get_operation(name)
+        for name, function in sorted(vars(Client).items())
+        if not name.startswith("_") and inspect.iscoroutinefunction(function)
+    }
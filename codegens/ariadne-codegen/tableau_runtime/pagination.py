@@ -0,0 +1,106 @@
+from typing import Any, AsyncIterator, Dict, Optional
+
+from pydantic import BaseModel
+
+from tableau_queries.client import Client
+
+from .cost import TABLEAU_NODE_LIMIT, NodeCountEstimator
+from .entities import EntityCache
+from .operations import Operation, get_operation
+from .parallel import ValidationPool
+
+
+def get_connection(page: BaseModel) -> Any:
+    """Returns the connection object (`nodes` + `page_info`) of a page."""
+    return getattr(page, next(iter(type(page).model_fields)))
+
+
+def choose_first(
+    operation: Operation,
+    node_limit: int = TABLEAU_NODE_LIMIT,
+    estimator: Optional[NodeCountEstimator] = None,
+) -> int:
+    """Returns the largest page size of the operation within `node_limit`."""
+    estimator = estimator or NodeCountEstimator()
+    first = estimator.max_safe_first(
+        operation.document, node_limit, operation_name=operation.name
+    )
+    if first < 1:
+        raise ValueError(
+            f"{operation.name} exceeds {node_limit} nodes even with first=1."
+        )
+    return first
+
+
+async def paginate(
+    client: Client,
+    method: str,
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    node_limit: int = TABLEAU_NODE_LIMIT,
+    estimator: Optional[NodeCountEstimator] = None,
+    entity_cache: Optional[EntityCache] = None,
+    validation_pool: Optional[ValidationPool] = None,
+    **kwargs: Any,
+) -> AsyncIterator[BaseModel]:
+    """
+    Yields every page of `client.<method>(first=..., after=...)`.
+
+    When `first` is not given, the largest page size whose estimated node
+    count stays within `node_limit` is used, so no request is sent that
+    Tableau would reject for being too large. With an `entity_cache`, the
+    entities of every page are interned before the page is yielded. With
+    a `validation_pool`, pages are validated in the pool instead of on the
+    event loop.
+    """
+    if first is None:
+        first = choose_first(get_operation(method), node_limit, estimator)
+
+    while True:
+        if validation_pool is not None:
+            page = await validation_pool.fetch(
+                client, method, first=first, after=after, **kwargs
+            )
+        else:
+            page = await getattr(client, method)(first=first, after=after, **kwargs)
+        if entity_cache is not None:
+            page = entity_cache.intern(page)
+        yield page
+
+        page_info = get_connection(page).page_info
+        if not page_info.has_next_page:
+            return
+        after = page_info.end_cursor
+
+
+async def paginate_data(
+    client: Client,
+    method: str,
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    node_limit: int = TABLEAU_NODE_LIMIT,
+    estimator: Optional[NodeCountEstimator] = None,
+    **kwargs: Any,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Like `paginate()`, but yields the raw response `data` of every page
+    without validating it into the generated response model.
+    """
+    operation = get_operation(method)
+    if first is None:
+        first = choose_first(operation, node_limit, estimator)
+
+    while True:
+        response = await client.execute(
+            query=operation.document,
+            operation_name=operation.name,
+            variables={"first": first, "after": after},
+            **kwargs,
+        )
+        data = client.get_data(response)
+        yield data
+
+        page_info = data[operation.connection_alias]["pageInfo"]
+        if not page_info["hasNextPage"]:
+            return
+        after = page_info["endCursor"]
@@ -0,0 +1,185 @@
+import asyncio
+import gc
+import json
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from types import ModuleType
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import httpx
+import msgspec
+from pydantic import BaseModel
+
+import tableau_structs
+from tableau_queries.client import Client
+from tableau_queries.exceptions import (
+    GraphQLClientGraphQLMultiError,
+    GraphQLClientHttpError,
+    GraphQLClientInvalidResponseError,
+)
+
+from .operations import call_arguments, get_operation
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+Call = Tuple[str, Dict[str, Any]]
+
+_OK = 0
+_ERRORS = 1
+_INVALID = 2
+
+
+@lru_cache(maxsize=None)
+def _json_decoder(struct: type) -> msgspec.json.Decoder:
+    return msgspec.json.Decoder(
+        msgspec.defstruct(f"{struct.__name__}Response", [("data", struct)])
+    )
+
+
+def _decode_body(struct: type, content: bytes) -> Tuple[int, Any]:
+    """
+    Parses and validates a raw response body in a worker.
+
+    The body is decoded straight from JSON into `{"data": struct}` and the
+    data is sent back as msgpack bytes, which cross the process boundary
+    as one buffer. Only when decoding fails is the body parsed again to
+    report GraphQL errors the way `get_data()` does.
+    """
+    try:
+        data = _json_decoder(struct).decode(content).data
+    except msgspec.DecodeError as exc:
+        decode_error = exc
+    else:
+        return _OK, msgspec.msgpack.encode(data)
+
+    try:
+        response_json = json.loads(content)
+    except ValueError:
+        return _INVALID, None
+    if (not isinstance(response_json, dict)) or (
+        "data" not in response_json and "errors" not in response_json
+    ):
+        return _INVALID, None
+    if response_json.get("errors"):
+        return _ERRORS, (response_json["errors"], response_json.get("data"))
+    raise decode_error
+
+
+def _build_model(model: Type[ModelT], data: bytes) -> ModelT:
+    # Building a page only allocates; collections would repeatedly walk
+    # the models built so far, which is most of the time it takes.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return model.model_validate(msgspec.msgpack.decode(data))
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class ValidationPool:
+    """
+    Moves JSON parsing and validation of responses off the event loop.
+
+    Requests are still sent by the client on asyncio, but the raw body of
+    every response is handed to `executor` (a `ProcessPoolExecutor` by
+    default), which decodes and validates it into the msgspec struct of
+    the operation's response model (the struct of the same name in
+    `structs`, generated by `msgspec_codegen.py`) and sends the data back
+    as msgpack. The event loop only builds the pydantic model from it,
+    without parsing JSON and with the garbage collector paused: a pickled
+    model tree costs the event loop as much to unpickle as to validate.
+    See `tools/bench_validation_pool.py`.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        structs: ModuleType = tableau_structs,
+    ) -> None:
+        self._owns_executor = executor is None
+        self.executor = executor or ProcessPoolExecutor(max_workers=max_workers)
+        self.structs = structs
+
+    def __enter__(self) -> "ValidationPool":
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self.executor.shutdown()
+
+    async def validate(self, model: Type[ModelT], response: httpx.Response) -> ModelT:
+        """
+        Validates `response` into `model` in the pool, raising as `get_data()`
+        (but `msgspec.ValidationError` for invalid data).
+        """
+        if not response.is_success:
+            raise GraphQLClientHttpError(
+                status_code=response.status_code, response=response
+            )
+
+        struct = getattr(self.structs, model.__name__)
+        status, result = await asyncio.get_running_loop().run_in_executor(
+            self.executor, _decode_body, struct, response.content
+        )
+        if status == _INVALID:
+            raise GraphQLClientInvalidResponseError(response=response)
+        if status == _ERRORS:
+            errors, data = result
+            raise GraphQLClientGraphQLMultiError.from_errors_dicts(
+                errors_dicts=errors, data=data
+            )
+        return _build_model(model, result)
+
+    async def fetch(
+        self, client: Client, method: str, *args: Any, **kwargs: Any
+    ) -> BaseModel:
+        """Same as `await client.<method>(*args, **kwargs)`, validated in the pool."""
+        response = await client.execute(**call_arguments(method, *args, **kwargs))
+        return await self.validate(get_operation(method).model, response)
+
+    async def fetch_ordered(
+        self, client: Client, calls: Iterable[Call], concurrency: int = 16
+    ) -> AsyncIterator[BaseModel]:
+        """
+        Runs `(method, kwargs)` calls with up to `concurrency` of them in
+        flight and yields their models in the order of `calls`.
+
+        A finished call waits for the calls before it, and no new call is
+        started until the oldest one has been yielded, so a slow response
+        holds back at most `concurrency` results.
+        """
+        pending: Deque["asyncio.Task[BaseModel]"] = deque()
+        try:
+            for method, kwargs in calls:
+                pending.append(
+                    asyncio.create_task(self.fetch(client, method, **kwargs))
+                )
+                if len(pending) >= concurrency:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def fetch_all(
+        self, client: Client, calls: Iterable[Call], concurrency: int = 16
+    ) -> List[BaseModel]:
+        return [page async for page in self.fetch_ordered(client, calls, concurrency)]
@@ -0,0 +1,418 @@
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+import httpx
+from graphql import (
+    ArgumentNode,
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    GraphQLObjectType,
+    InlineFragmentNode,
+    ListTypeNode,
+    NamedTypeNode,
+    NameNode,
+    ObjectFieldNode,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    VariableDefinitionNode,
+    VariableNode,
+    get_named_type,
+    parse,
+    print_ast,
+)
+
+from tableau_queries.client import Client
+
+from .cost import TABLEAU_NODE_LIMIT, NodeCountEstimator
+
+
+@dataclass(frozen=True)
+class FollowUpQuery:
+    """Fetches one heavy subtree of the connection nodes, by node ID."""
+
+    name: str
+    document: str
+    response_keys: Tuple[str, ...]
+    batch_size: int
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """A root query plus the follow-up queries needed to complete its nodes."""
+
+    root: str
+    connection_key: str
+    followups: Tuple[FollowUpQuery, ...] = field(default_factory=tuple)
+
+    @property
+    def is_split(self) -> bool:
+        return bool(self.followups)
+
+
+class QueryPlanner:
+    """
+    Splits connection queries that exceed the node limit.
+
+    The root query keeps the connection, its `pageInfo` and the selections
+    of `nodes` that fit the node budget: the heaviest object, list or
+    inline fragment selections of `nodes` at the page size of the query
+    are moved out one at a time until the rest is within `node_limit`.
+    Each heavy subtree moves to a follow-up query that re-fetches the same
+    connection filtered by `idWithin`, in batches sized to stay within
+    `node_limit`. Heavy subtrees can also be named explicitly with
+    `heavy_fields` (response keys of fields), keyed by operation name.
+    """
+
+    def __init__(
+        self,
+        node_limit: int = TABLEAU_NODE_LIMIT,
+        heavy_fields: Optional[Mapping[str, Sequence[str]]] = None,
+        estimator: Optional[NodeCountEstimator] = None,
+    ) -> None:
+        self.node_limit = node_limit
+        self.heavy_fields = {k: tuple(v) for k, v in (heavy_fields or {}).items()}
+        self.estimator = estimator or NodeCountEstimator()
+        self._plans: Dict[Tuple[str, Any], QueryPlan] = {}
+
+    def plan(
+        self, document: str, variables: Optional[Dict[str, Any]] = None
+    ) -> QueryPlan:
+        """Returns the plan for the document; plans are cached per page size."""
+        variables = variables or {}
+        key = (
+            hashlib.sha256(document.encode("utf-8")).hexdigest(),
+            variables.get("first"),
+        )
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._plans[key] = self._build_plan(document, variables)
+        return plan
+
+    def _build_plan(self, document: str, variables: Dict[str, Any]) -> QueryPlan:
+        ast = parse(document)
+        operations = [
+            d for d in ast.definitions if isinstance(d, OperationDefinitionNode)
+        ]
+        unsplit = QueryPlan(root=document, connection_key="")
+        if (
+            len(operations) != 1
+            or operations[0].operation != OperationType.QUERY
+            or len(operations[0].selection_set.selections) != 1
+            or any(isinstance(d, FragmentDefinitionNode) for d in ast.definitions)
+        ):
+            return unsplit
+
+        operation = operations[0]
+        connection = operation.selection_set.selections[0]
+        if not isinstance(connection, FieldNode) or connection.selection_set is None:
+            return unsplit
+        named = {
+            s.name.value: s
+            for s in connection.selection_set.selections
+            if isinstance(s, FieldNode)
+        }
+        nodes = named.get("nodes")
+        if nodes is None or nodes.selection_set is None:
+            return unsplit
+
+        schema = self.estimator.schema
+        query_type = schema.query_type
+        assert query_type is not None
+        root_field = query_type.fields.get(connection.name.value)
+        if root_field is None:
+            return unsplit
+        filter_argument = root_field.args.get("filter")
+        if filter_argument is None or "idWithin" not in getattr(
+            get_named_type(filter_argument.type), "fields", {}
+        ):
+            return unsplit
+        connection_type = get_named_type(root_field.type)
+        assert isinstance(connection_type, GraphQLObjectType)
+        node_type = get_named_type(connection_type.fields["nodes"].type)
+
+        operation_name = operation.name.value if operation.name else "Query"
+        heavy = self._heavy_selections(
+            operation_name, operation, connection, nodes, node_type, variables
+        )
+        if not heavy:
+            return unsplit
+
+        followups = tuple(
+            self._followup(operation_name, connection, nodes, selection)
+            for selection in heavy
+        )
+        return QueryPlan(
+            root=print_ast(_root_document(operation, connection, nodes, heavy)),
+            connection_key=_response_key(connection),
+            followups=followups,
+        )
+
+    def _heavy_selections(
+        self,
+        operation_name: str,
+        operation: OperationDefinitionNode,
+        connection: FieldNode,
+        nodes: FieldNode,
+        node_type: Any,
+        variables: Dict[str, Any],
+    ) -> List[Any]:
+        assert nodes.selection_set is not None
+        selections = nodes.selection_set.selections
+        explicit = self.heavy_fields.get(operation_name)
+        if explicit is not None:
+            return [
+                s
+                for s in selections
+                if isinstance(s, FieldNode) and _response_key(s) in explicit
+            ]
+
+        costs = {
+            id(s): self.estimator.selection_cost(s, node_type, variables)
+            for s in selections
+            if s.selection_set is not None
+        }
+        candidates = sorted(
+            (s for s in selections if costs.get(id(s), 0) > 0),
+            key=lambda s: costs[id(s)],
+            reverse=True,
+        )
+        heavy: List[Any] = []
+        for selection in candidates:
+            root = _root_document(operation, connection, nodes, heavy)
+            if self.estimator.estimate(root, variables) <= self.node_limit:
+                break
+            heavy.append(selection)
+        # Follow-ups run in the order of the selections in the document.
+        return [s for s in selections if any(s is h for h in heavy)]
+
+    def _followup(
+        self,
+        operation_name: str,
+        connection: FieldNode,
+        nodes: FieldNode,
+        selection: Any,
+    ) -> FollowUpQuery:
+        name = f"{operation_name}_{_selection_name(selection)}"
+        followup_connection = FieldNode(
+            alias=connection.alias,
+            name=connection.name,
+            arguments=[
+                ArgumentNode(
+                    name=NameNode(value="filter"),
+                    value=ObjectValueNode(
+                        fields=[
+                            ObjectFieldNode(
+                                name=NameNode(value="idWithin"),
+                                value=VariableNode(name=NameNode(value="ids")),
+                            )
+                        ]
+                    ),
+                ),
+                ArgumentNode(
+                    name=NameNode(value="first"),
+                    value=VariableNode(name=NameNode(value="first")),
+                ),
+            ],
+            directives=[],
+            selection_set=SelectionSetNode(
+                selections=[_with_selections(nodes, _ensure_id([selection]))]
+            ),
+        )
+        document = DocumentNode(
+            definitions=[
+                OperationDefinitionNode(
+                    operation=OperationType.QUERY,
+                    name=NameNode(value=name),
+                    variable_definitions=[
+                        VariableDefinitionNode(
+                            variable=VariableNode(name=NameNode(value="ids")),
+                            type=ListTypeNode(
+                                type=NamedTypeNode(name=NameNode(value="ID"))
+                            ),
+                            directives=[],
+                        ),
+                        VariableDefinitionNode(
+                            variable=VariableNode(name=NameNode(value="first")),
+                            type=NamedTypeNode(name=NameNode(value="Int")),
+                            directives=[],
+                        ),
+                    ],
+                    directives=[],
+                    selection_set=SelectionSetNode(selections=[followup_connection]),
+                )
+            ]
+        )
+        batch_size = self.estimator.max_safe_first(document, self.node_limit)
+        if batch_size < 1:
+            raise ValueError(
+                f"{name} exceeds {self.node_limit} nodes even for a single node."
+            )
+        return FollowUpQuery(
+            name=name,
+            document=print_ast(document),
+            response_keys=_response_keys(selection),
+            batch_size=batch_size,
+        )
+
+
+def _response_key(field_node: FieldNode) -> str:
+    return (field_node.alias or field_node.name).value
+
+
+def _selection_name(selection: Any) -> str:
+    if isinstance(selection, InlineFragmentNode):
+        type_condition = selection.type_condition
+        return f"on{type_condition.name.value}" if type_condition else "fragment"
+    return _response_key(selection)
+
+
+def _response_keys(selection: Any) -> Tuple[str, ...]:
+    """Response keys a selection of `nodes` adds to a node."""
+    if isinstance(selection, FieldNode):
+        return (_response_key(selection),)
+    keys: Dict[str, None] = {}
+    for child in selection.selection_set.selections:
+        keys.update(dict.fromkeys(_response_keys(child)))
+    return tuple(keys)
+
+
+def _root_document(
+    operation: OperationDefinitionNode,
+    connection: FieldNode,
+    nodes: FieldNode,
+    heavy: List[Any],
+) -> DocumentNode:
+    """The operation without the `heavy` selections of `nodes`."""
+    assert connection.selection_set is not None and nodes.selection_set is not None
+    root_nodes = _with_selections(
+        nodes,
+        _ensure_id(
+            [
+                s
+                for s in nodes.selection_set.selections
+                if not any(s is h for h in heavy)
+            ]
+        ),
+    )
+    root_connection = _with_selections(
+        connection,
+        [root_nodes if s is nodes else s for s in connection.selection_set.selections],
+    )
+    return DocumentNode(
+        definitions=[
+            OperationDefinitionNode(
+                operation=operation.operation,
+                name=operation.name,
+                variable_definitions=operation.variable_definitions,
+                directives=operation.directives,
+                selection_set=SelectionSetNode(selections=[root_connection]),
+            )
+        ]
+    )
+
+
+def _with_selections(field_node: FieldNode, selections: List[Any]) -> FieldNode:
+    return FieldNode(
+        alias=field_node.alias,
+        name=field_node.name,
+        arguments=field_node.arguments,
+        directives=field_node.directives,
+        selection_set=SelectionSetNode(selections=selections),
+    )
+
+
+def _ensure_id(selections: List[Any]) -> List[Any]:
+    has_id = any(
+        isinstance(s, FieldNode) and s.alias is None and s.name.value == "id"
+        for s in selections
+    )
+    if has_id:
+        return selections
+    return [
+        FieldNode(name=NameNode(value="id"), arguments=[], directives=[])
+    ] + selections
+
+
+def stitch(
+    data: Dict[str, Any], plan: QueryPlan, followup: FollowUpQuery, fetched: Any
+) -> Set[Any]:
+    """
+    Copies the subtrees of a follow-up response into the root data, and
+    returns the IDs of the nodes it completed.
+    """
+    by_id = {node["id"]: node for node in fetched[plan.connection_key]["nodes"]}
+    completed = set()
+    for node in data[plan.connection_key]["nodes"]:
+        source = by_id.get(node["id"])
+        if source is None:
+            continue
+        # Keys of an inline fragment are only there for nodes of its type.
+        for key in followup.response_keys:
+            if key in source:
+                node[key] = source[key]
+        completed.add(node["id"])
+    return completed
+
+
+class SplittingClientMixin:
+    """
+    Client mixin that runs oversized connection queries as a `QueryPlan`.
+
+    The stitched data is handed back as a regular response, so the
+    generated methods validate it into their usual response models.
+    """
+
+    def __init__(
+        self, *args: Any, planner: Optional[QueryPlanner] = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.planner = planner or QueryPlanner()
+
+    async def execute(
+        self,
+        query: str,
+        operation_name: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        plan = self.planner.plan(query, variables)
+        if not plan.is_split:
+            return await super().execute(  # type: ignore[misc]
+                query, operation_name=operation_name, variables=variables, **kwargs
+            )
+
+        response = await super().execute(  # type: ignore[misc]
+            plan.root, operation_name=operation_name, variables=variables, **kwargs
+        )
+        data = self.get_data(response)  # type: ignore[attr-defined]
+        ids = [node["id"] for node in data[plan.connection_key]["nodes"]]
+        completed = set(ids)
+        for followup in plan.followups:
+            followup_completed: Set[Any] = set()
+            for start in range(0, len(ids), followup.batch_size):
+                batch = ids[start : start + followup.batch_size]
+                batch_response = await super().execute(  # type: ignore[misc]
+                    followup.document,
+                    operation_name=followup.name,
+                    variables={"ids": batch, "first": len(batch)},
+                    **kwargs,
+                )
+                fetched = self.get_data(batch_response)  # type: ignore[attr-defined]
+                followup_completed |= stitch(data, plan, followup, fetched)
+            completed &= followup_completed
+        # Nodes deleted between the root query and a follow-up cannot be
+        # completed, so they are dropped instead of failing validation.
+        data[plan.connection_key]["nodes"] = [
+            node
+            for node in data[plan.connection_key]["nodes"]
+            if node["id"] in completed
+        ]
+        return httpx.Response(200, json={"data": data}, request=response.request)
+
+
+class SplittingClient(SplittingClientMixin, Client):
+    """`tableau_queries.Client` that splits queries over the node limit."""
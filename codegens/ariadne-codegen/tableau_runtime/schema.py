@@ -0,0 +1,52 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from graphql import (
+    GraphQLSchema,
+    ObjectTypeDefinitionNode,
+    TypeDefinitionNode,
+    build_ast_schema,
+    parse,
+)
+
+SCHEMA_PATH = (
+    Path(__file__).resolve().parents[3]
+    / "schemas"
+    / "tableau"
+    / "schema-no-introspection-types.graphql"
+)
+
+
+@lru_cache(maxsize=None)
+def load_schema(path: Optional[str] = None) -> GraphQLSchema:
+    """Builds the Tableau schema once per path and reuses it afterwards.
+
+    Building the full Metadata API SDL takes a couple of seconds, so every
+    helper in this package (and every tool of `tools/`) goes through this
+    loader instead of calling `build_schema` itself.
+
+    `schema.graphql` and the strawberry SDL re-declare the introspection
+    types and `Query.__schema` / `Query.__type` as ordinary definitions,
+    which graphql-core refuses to validate or execute against. They are
+    dropped, since graphql-core provides introspection itself, so any of
+    the `schemas/tableau` SDL files gives the same schema.
+    """
+    source = Path(path) if path else SCHEMA_PATH
+    document = parse(source.read_text(encoding="utf-8"))
+    document.definitions = tuple(
+        definition
+        for definition in document.definitions
+        if not (
+            isinstance(definition, TypeDefinitionNode)
+            and definition.name.value.startswith("__")
+        )
+    )
+    for definition in document.definitions:
+        if isinstance(definition, ObjectTypeDefinitionNode):
+            definition.fields = tuple(
+                field
+                for field in definition.fields or ()
+                if not field.name.value.startswith("__")
+            )
+    return build_ast_schema(document)
@@ -0,0 +1,177 @@
+import abc
+import asyncio
+import json
+from contextlib import suppress
+from pathlib import Path
+from typing import IO, Any, AsyncIterator, Dict, List, Optional, Union
+
+from pydantic import BaseModel
+
+from .columnar import ColumnarBuilder
+from .pagination import get_connection
+
+try:
+    import pyarrow.parquet  # type: ignore[import-not-found,unused-ignore]
+except ImportError:
+    pyarrow = None  # type: ignore[assignment]
+
+Page = Union[BaseModel, Dict[str, Any]]
+
+
+def page_nodes(page: Page) -> List[Any]:
+    """Nodes of a validated page (`paginate`) or of raw data (`paginate_data`)."""
+    if isinstance(page, BaseModel):
+        return list(get_connection(page).nodes)
+    return next(iter(page.values()))["nodes"]
+
+
+class Sink(abc.ABC):
+    """
+    Destination for the nodes of a paginated crawl.
+
+    Blocking I/O runs in a worker thread, so writing one page overlaps
+    with fetching the next one.
+    """
+
+    async def write_page(self, page: Page) -> None:
+        await asyncio.to_thread(self._write_nodes, page_nodes(page))
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close)
+
+    async def __aenter__(self) -> "Sink":
+        return self
+
+    async def __aexit__(
+        self, exc_type: object, exc_val: object, exc_tb: object
+    ) -> None:
+        await self.close()
+
+    @abc.abstractmethod
+    def _write_nodes(self, nodes: List[Any]) -> None:
+        """Writes the nodes of one page; runs in a worker thread."""
+
+    @abc.abstractmethod
+    def _close(self) -> None:
+        """Flushes and releases the destination; runs in a worker thread."""
+
+
+class NDJSONSink(Sink):
+    """Writes one JSON object per node, using the GraphQL field names."""
+
+    def __init__(self, target: Union[str, Path, IO[str]]) -> None:
+        self._owns_file = isinstance(target, (str, Path))
+        self._file: IO[str] = (
+            open(target, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+            if isinstance(target, (str, Path))
+            else target
+        )
+        self.written = 0
+
+    def _write_nodes(self, nodes: List[Any]) -> None:
+        lines = [
+            (
+                node.model_dump_json(by_alias=True)
+                if isinstance(node, BaseModel)
+                else json.dumps(node, separators=(",", ":"))
+            )
+            for node in nodes
+        ]
+        if lines:
+            self._file.write("\n".join(lines) + "\n")
+        self.written += len(lines)
+
+    def _close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class ParquetSink(Sink):
+    """
+    Writes nodes to a Parquet file in row groups of `row_group_size`.
+
+    Nodes are buffered in a `ColumnarBuilder` for the operation of
+    `tableau_queries.Client.<method>`, so at most one row group is held in
+    memory at a time.
+    """
+
+    def __init__(
+        self, path: Union[str, Path], method: str, row_group_size: int = 10000
+    ) -> None:
+        if pyarrow is None:
+            raise ImportError("Parquet export requires 'pyarrow' package.")
+        self.path = Path(path)
+        self.method = method
+        self.row_group_size = row_group_size
+        self.written = 0
+        self._builder = ColumnarBuilder.for_operation(method)
+        self._writer: Optional[Any] = None
+
+    def _write_nodes(self, nodes: List[Any]) -> None:
+        for node in nodes:
+            if isinstance(node, BaseModel):
+                node = node.model_dump(by_alias=True, mode="json")
+            self._builder.append_nodes((node,))
+            if len(self._builder) >= self.row_group_size:
+                self._flush()
+
+    def _flush(self) -> None:
+        if not len(self._builder):
+            return
+        table = self._builder.to_arrow()
+        if self._writer is None:
+            self._writer = pyarrow.parquet.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
+        self.written += table.num_rows
+        self._builder = ColumnarBuilder.for_operation(self.method)
+
+    def _close(self) -> None:
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+
+
+async def stream_to_sink(
+    pages: AsyncIterator[Page], sink: Sink, max_pending_pages: int = 2
+) -> int:
+    """
+    Streams every page into `sink` and returns the number of pages written.
+
+    Fetching and writing run concurrently through a queue of at most
+    `max_pending_pages` pages. When the sink falls behind, the queue fills
+    up and the next page is not requested until a slot frees, so memory
+    stays flat however many pages the crawl has.
+    """
+    queue: "asyncio.Queue[Optional[Page]]" = asyncio.Queue(maxsize=max_pending_pages)
+
+    async def produce() -> None:
+        # No sentinel after a cancellation: the sink failed and nothing is
+        # reading the queue any more, so a full queue would never drain.
+        try:
+            async for page in pages:
+                await queue.put(page)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            await queue.put(None)
+            raise
+        await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    written = 0
+    try:
+        while True:
+            page = await queue.get()
+            if page is None:
+                break
+            await sink.write_page(page)
+            written += 1
+        await producer
+    finally:
+        if not producer.done():
+            producer.cancel()
+            with suppress(asyncio.CancelledError):
+                await producer
+    return written
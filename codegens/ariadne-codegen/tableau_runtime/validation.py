@@ -0,0 +1,115 @@
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
+
+import httpx
+from graphql import (
+    DocumentNode,
+    GraphQLError,
+    GraphQLSchema,
+    parse,
+    print_ast,
+    validate,
+)
+
+from tableau_customops.client import Client
+from tableau_customops.exceptions import GraphQLClientGraphQLMultiError
+
+from .schema import load_schema
+
+
+class DocumentValidationError(GraphQLClientGraphQLMultiError):
+    """Raised when a document is rejected locally, before it is sent."""
+
+
+class DocumentValidator:
+    """
+    Validates GraphQL documents against the Tableau schema.
+
+    Results are memoized by the SHA-256 of the printed document, so the
+    same operation sent once per page is only parsed and validated once.
+    """
+
+    def __init__(
+        self, schema: Optional[GraphQLSchema] = None, max_size: int = 1024
+    ) -> None:
+        self._schema = schema
+        self._max_size = max_size
+        self._results: "OrderedDict[str, Tuple[GraphQLError, ...]]" = OrderedDict()
+
+    @property
+    def schema(self) -> GraphQLSchema:
+        if self._schema is None:
+            self._schema = load_schema()
+        return self._schema
+
+    def validate(self, document: Union[str, DocumentNode]) -> Tuple[GraphQLError, ...]:
+        """Returns the validation errors of the document, empty if valid."""
+        source = document if isinstance(document, str) else print_ast(document)
+        key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+        errors = self._results.get(key)
+        if errors is not None:
+            self._results.move_to_end(key)
+            return errors
+
+        try:
+            ast = document if isinstance(document, DocumentNode) else parse(source)
+        except GraphQLError as exc:
+            errors = (exc,)
+        else:
+            errors = tuple(validate(self.schema, ast))
+
+        self._results[key] = errors
+        if len(self._results) > self._max_size:
+            self._results.popitem(last=False)
+        return errors
+
+    def check(self, document: Union[str, DocumentNode]) -> None:
+        """Raises `DocumentValidationError` if the document is not valid."""
+        errors = self.validate(document)
+        if errors:
+            raise DocumentValidationError.from_errors_dicts(
+                errors_dicts=[error.formatted for error in errors]
+            )
+
+    def cache_info(self) -> Dict[str, int]:
+        return {"size": len(self._results), "max_size": self._max_size}
+
+
+@lru_cache(maxsize=None)
+def default_validator() -> DocumentValidator:
+    """Validator shared by every client that does not bring its own."""
+    return DocumentValidator()
+
+
+class ValidatingClientMixin:
+    """
+    Client mixin that validates every document locally before executing it.
+
+    Mix it in front of a generated client, e.g.
+    `class Client(ValidatingClientMixin, tableau_customops.Client)`.
+    """
+
+    def __init__(
+        self, *args: Any, validator: Optional[DocumentValidator] = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.validator = validator or default_validator()
+
+    async def execute(
+        self,
+        query: str,
+        operation_name: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        self.validator.check(query)
+        return await super().execute(  # type: ignore[misc]
+            query, operation_name=operation_name, variables=variables, **kwargs
+        )
+
+
+class ValidatingClient(ValidatingClientMixin, Client):
+    """`tableau_customops.Client` with local validation of custom operations."""
@@ -0,0 +1,1595 @@
+# Generated by tools/msgspec_codegen.py
+# Source: tableau_queries
+
+from typing import Any, List, Literal, Optional, Union
+
+import msgspec
+
+from tableau_queries.enums import (
+    FieldDataType,
+    FieldRole,
+    FieldRoleCategory,
+    RemoteType,
+)
+
+
+class GetItemsCustomSQLTablesConnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"custom_sql_tables_connection": "customSQLTablesConnection"},
+):
+    custom_sql_tables_connection: (
+        "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnection"
+    )
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnection(
+    msgspec.Struct, kw_only=True, gc=False, rename={"page_info": "pageInfo"}
+):
+    nodes: List["GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodes"]
+    page_info: "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionPageInfo"
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodes(
+    msgspec.Struct, kw_only=True, gc=False, rename={"connection_type": "connectionType"}
+):
+    id: str
+    name: Optional[str]
+    query: Optional[str]
+    columns: List[
+        "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumns"
+    ]
+    tables: List[
+        "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesTables"
+    ]
+    connection_type: Optional[str]
+    database: Optional[
+        "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesDatabase"
+    ]
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumns(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"remote_type": "remoteType", "referenced_by_fields": "referencedByFields"},
+):
+    id: str
+    name: Optional[str]
+    remote_type: RemoteType
+    description: Optional[str]
+    referenced_by_fields: Optional[
+        List[
+            Optional[
+                "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFields"
+            ]
+        ]
+    ]
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFields(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    datasource: Optional[
+        Union[
+            "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourceDatasource",
+            "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourceEmbeddedDatasource",
+            "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourcePublishedDatasource",
+        ]
+    ]
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourceDatasource(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="Datasource",
+    rename={"upstream_tables": "upstreamTables"},
+):
+    id: str
+    name: Optional[str]
+    upstream_tables: List[
+        "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourceDatasourceUpstreamTables"
+    ]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourceDatasourceUpstreamTables(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "schema_": "schema",
+        "full_name": "fullName",
+        "connection_type": "connectionType",
+    },
+):
+    id: str
+    name: Optional[str]
+    database: Optional[
+        "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourceDatasourceUpstreamTablesDatabase"
+    ]
+    schema_: Optional[str]
+    full_name: Optional[str]
+    connection_type: Optional[str]
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourceDatasourceUpstreamTablesDatabase(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename__": "__typename"}
+):
+    typename__: Literal[
+        "CloudFile",
+        "DataCloud",
+        "Database",
+        "DatabaseServer",
+        "File",
+        "WebDataConnector",
+    ]
+    name: Optional[str]
+    id: str
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourceEmbeddedDatasource(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="EmbeddedDatasource",
+    rename={"upstream_tables": "upstreamTables"},
+):
+    id: str
+    name: Optional[str]
+    upstream_tables: List[
+        "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourceEmbeddedDatasourceUpstreamTables"
+    ]
+    workbook: Optional[
+        "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourceEmbeddedDatasourceWorkbook"
+    ]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourceEmbeddedDatasourceUpstreamTables(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "schema_": "schema",
+        "full_name": "fullName",
+        "connection_type": "connectionType",
+    },
+):
+    id: str
+    name: Optional[str]
+    database: Optional[
+        "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourceEmbeddedDatasourceUpstreamTablesDatabase"
+    ]
+    schema_: Optional[str]
+    full_name: Optional[str]
+    connection_type: Optional[str]
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourceEmbeddedDatasourceUpstreamTablesDatabase(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename__": "__typename"}
+):
+    typename__: Literal[
+        "CloudFile",
+        "DataCloud",
+        "Database",
+        "DatabaseServer",
+        "File",
+        "WebDataConnector",
+    ]
+    name: Optional[str]
+    id: str
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourceEmbeddedDatasourceWorkbook(
+    msgspec.Struct, kw_only=True, gc=False, rename={"project_name": "projectName"}
+):
+    id: str
+    name: Optional[str]
+    project_name: Optional[str]
+    luid: str
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourcePublishedDatasource(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="PublishedDatasource",
+    rename={"upstream_tables": "upstreamTables", "project_name": "projectName"},
+):
+    id: str
+    name: Optional[str]
+    upstream_tables: List[
+        "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourcePublishedDatasourceUpstreamTables"
+    ]
+    project_name: Optional[str]
+    luid: str
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourcePublishedDatasourceUpstreamTables(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "schema_": "schema",
+        "full_name": "fullName",
+        "connection_type": "connectionType",
+    },
+):
+    id: str
+    name: Optional[str]
+    database: Optional[
+        "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourcePublishedDatasourceUpstreamTablesDatabase"
+    ]
+    schema_: Optional[str]
+    full_name: Optional[str]
+    connection_type: Optional[str]
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesColumnsReferencedByFieldsDatasourcePublishedDatasourceUpstreamTablesDatabase(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename__": "__typename"}
+):
+    typename__: Literal[
+        "CloudFile",
+        "DataCloud",
+        "Database",
+        "DatabaseServer",
+        "File",
+        "WebDataConnector",
+    ]
+    name: Optional[str]
+    id: str
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesTables(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "schema_": "schema",
+        "full_name": "fullName",
+        "connection_type": "connectionType",
+        "columns_connection": "columnsConnection",
+    },
+):
+    id: str
+    name: Optional[str]
+    database: Optional[
+        "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesTablesDatabase"
+    ]
+    schema_: Optional[str]
+    full_name: Optional[str]
+    connection_type: Optional[str]
+    description: Optional[str]
+    columns_connection: Optional[
+        "GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesTablesColumnsConnection"
+    ]
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesTablesDatabase(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename__": "__typename"}
+):
+    typename__: Literal[
+        "CloudFile",
+        "DataCloud",
+        "Database",
+        "DatabaseServer",
+        "File",
+        "WebDataConnector",
+    ]
+    name: Optional[str]
+    id: str
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesTablesColumnsConnection(
+    msgspec.Struct, kw_only=True, gc=False, rename={"total_count": "totalCount"}
+):
+    total_count: int
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionNodesDatabase(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename__": "__typename", "connection_type": "connectionType"},
+):
+    typename__: Literal[
+        "CloudFile",
+        "DataCloud",
+        "Database",
+        "DatabaseServer",
+        "File",
+        "WebDataConnector",
+    ]
+    name: Optional[str]
+    id: str
+    connection_type: Optional[str]
+
+
+class GetItemsCustomSQLTablesConnectionCustomSqlTablesConnectionPageInfo(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"has_next_page": "hasNextPage", "end_cursor": "endCursor"},
+):
+    has_next_page: bool
+    end_cursor: Optional[str]
+
+
+class GetItemsDatabaseTablesConnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"database_tables_connection": "databaseTablesConnection"},
+):
+    database_tables_connection: (
+        "GetItemsDatabaseTablesConnectionDatabaseTablesConnection"
+    )
+
+
+class GetItemsDatabaseTablesConnectionDatabaseTablesConnection(
+    msgspec.Struct, kw_only=True, gc=False, rename={"page_info": "pageInfo"}
+):
+    nodes: List["GetItemsDatabaseTablesConnectionDatabaseTablesConnectionNodes"]
+    page_info: "GetItemsDatabaseTablesConnectionDatabaseTablesConnectionPageInfo"
+
+
+class GetItemsDatabaseTablesConnectionDatabaseTablesConnectionNodes(
+    msgspec.Struct, kw_only=True, gc=False, rename={"is_embedded": "isEmbedded"}
+):
+    id: str
+    is_embedded: Optional[bool]
+    columns: List[
+        "GetItemsDatabaseTablesConnectionDatabaseTablesConnectionNodesColumns"
+    ]
+
+
+class GetItemsDatabaseTablesConnectionDatabaseTablesConnectionNodesColumns(
+    msgspec.Struct, kw_only=True, gc=False, rename={"remote_type": "remoteType"}
+):
+    remote_type: RemoteType
+    name: Optional[str]
+
+
+class GetItemsDatabaseTablesConnectionDatabaseTablesConnectionPageInfo(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"has_next_page": "hasNextPage", "end_cursor": "endCursor"},
+):
+    has_next_page: bool
+    end_cursor: Optional[str]
+
+
+class GetItemsEmbeddedDatasourcesConnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"embedded_datasources_connection": "embeddedDatasourcesConnection"},
+):
+    embedded_datasources_connection: (
+        "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnection"
+    )
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnection(
+    msgspec.Struct, kw_only=True, gc=False, rename={"page_info": "pageInfo"}
+):
+    nodes: List[
+        "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodes"
+    ]
+    page_info: (
+        "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionPageInfo"
+    )
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodes(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename__": "__typename",
+        "has_extracts": "hasExtracts",
+        "extract_last_refresh_time": "extractLastRefreshTime",
+        "extract_last_incremental_update_time": "extractLastIncrementalUpdateTime",
+        "extract_last_update_time": "extractLastUpdateTime",
+        "downstream_sheets": "downstreamSheets",
+        "upstream_tables": "upstreamTables",
+        "upstream_datasources": "upstreamDatasources",
+    },
+):
+    typename__: Literal["EmbeddedDatasource"]
+    id: str
+    name: Optional[str]
+    has_extracts: Optional[bool]
+    extract_last_refresh_time: Optional[Any]
+    extract_last_incremental_update_time: Optional[Any]
+    extract_last_update_time: Optional[Any]
+    downstream_sheets: List[
+        "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesDownstreamSheets"
+    ]
+    upstream_tables: List[
+        "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesUpstreamTables"
+    ]
+    fields: List[
+        Union[
+            "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField_BinField",
+            "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField_CombinedField",
+            "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField_CombinedSetField",
+            "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField_DatasourceField",
+            "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField_Field",
+            "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField_HierarchyField",
+            "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField_SetField",
+            "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsCalculatedField",
+            "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsColumnField",
+            "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsGroupField",
+        ]
+    ]
+    upstream_datasources: List[
+        "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesUpstreamDatasources"
+    ]
+    workbook: Optional[
+        "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesWorkbook"
+    ]
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesDownstreamSheets(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    name: Optional[str]
+    id: str
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesUpstreamTables(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "schema_": "schema",
+        "full_name": "fullName",
+        "connection_type": "connectionType",
+        "columns_connection": "columnsConnection",
+    },
+):
+    id: str
+    name: Optional[str]
+    database: Optional[
+        "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesUpstreamTablesDatabase"
+    ]
+    schema_: Optional[str]
+    full_name: Optional[str]
+    connection_type: Optional[str]
+    description: Optional[str]
+    columns_connection: Optional[
+        "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesUpstreamTablesColumnsConnection"
+    ]
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesUpstreamTablesDatabase(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename__": "__typename"}
+):
+    typename__: Literal[
+        "CloudFile",
+        "DataCloud",
+        "Database",
+        "DatabaseServer",
+        "File",
+        "WebDataConnector",
+    ]
+    name: Optional[str]
+    id: str
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesUpstreamTablesColumnsConnection(
+    msgspec.Struct, kw_only=True, gc=False, rename={"total_count": "totalCount"}
+):
+    total_count: int
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    is_hidden: Optional[bool]
+    folder_name: Optional[str]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField_BinField(
+    GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField,
+    tag="BinField",
+):
+    pass
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField_CombinedField(
+    GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField,
+    tag="CombinedField",
+):
+    pass
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField_CombinedSetField(
+    GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField,
+    tag="CombinedSetField",
+):
+    pass
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField_DatasourceField(
+    GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField,
+    tag="DatasourceField",
+):
+    pass
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField_Field(
+    GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField,
+    tag="Field",
+):
+    pass
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField_HierarchyField(
+    GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField,
+    tag="HierarchyField",
+):
+    pass
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField_SetField(
+    GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsField,
+    tag="SetField",
+):
+    pass
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsCalculatedField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CalculatedField",
+    rename={
+        "is_hidden": "isHidden",
+        "folder_name": "folderName",
+        "data_type": "dataType",
+        "default_format": "defaultFormat",
+    },
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    is_hidden: Optional[bool]
+    folder_name: Optional[str]
+    role: Optional[FieldRole]
+    data_type: Optional[FieldDataType]
+    default_format: Optional[str]
+    aggregation: Optional[str]
+    formula: Optional[str]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsColumnField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="ColumnField",
+    rename={
+        "is_hidden": "isHidden",
+        "folder_name": "folderName",
+        "data_category": "dataCategory",
+        "data_type": "dataType",
+        "default_format": "defaultFormat",
+    },
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    is_hidden: Optional[bool]
+    folder_name: Optional[str]
+    data_category: Optional[FieldRoleCategory]
+    role: Optional[FieldRole]
+    data_type: Optional[FieldDataType]
+    default_format: Optional[str]
+    aggregation: Optional[str]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesFieldsGroupField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="GroupField",
+    rename={
+        "is_hidden": "isHidden",
+        "folder_name": "folderName",
+        "data_type": "dataType",
+    },
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    is_hidden: Optional[bool]
+    folder_name: Optional[str]
+    role: Optional[FieldRole]
+    data_type: Optional[FieldDataType]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesUpstreamDatasources(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    id: str
+    name: Optional[str]
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesWorkbook(
+    msgspec.Struct, kw_only=True, gc=False, rename={"project_name": "projectName"}
+):
+    id: str
+    name: Optional[str]
+    project_name: Optional[str]
+    luid: str
+    owner: "GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesWorkbookOwner"
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionNodesWorkbookOwner(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    username: Optional[str]
+
+
+class GetItemsEmbeddedDatasourcesConnectionEmbeddedDatasourcesConnectionPageInfo(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"has_next_page": "hasNextPage", "end_cursor": "endCursor"},
+):
+    has_next_page: bool
+    end_cursor: Optional[str]
+
+
+class GetItemsFieldsConnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"fields_connection": "fieldsConnection"},
+):
+    fields_connection: "GetItemsFieldsConnectionFieldsConnection"
+
+
+class GetItemsFieldsConnectionFieldsConnection(
+    msgspec.Struct, kw_only=True, gc=False, rename={"page_info": "pageInfo"}
+):
+    nodes: List["GetItemsFieldsConnectionFieldsConnectionNodes"]
+    page_info: "GetItemsFieldsConnectionFieldsConnectionPageInfo"
+
+
+class GetItemsFieldsConnectionFieldsConnectionNodes(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename__": "__typename",
+        "upstream_fields": "upstreamFields",
+        "upstream_columns": "upstreamColumns",
+    },
+):
+    typename__: Literal[
+        "BinField",
+        "CalculatedField",
+        "ColumnField",
+        "CombinedField",
+        "CombinedSetField",
+        "DatasourceField",
+        "Field",
+        "GroupField",
+        "HierarchyField",
+        "SetField",
+    ]
+    id: str
+    upstream_fields: List[
+        Optional["GetItemsFieldsConnectionFieldsConnectionNodesUpstreamFields"]
+    ]
+    upstream_columns: List[
+        Optional["GetItemsFieldsConnectionFieldsConnectionNodesUpstreamColumns"]
+    ]
+
+
+class GetItemsFieldsConnectionFieldsConnectionNodesUpstreamFields(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename__": "__typename"}
+):
+    typename__: Literal[
+        "BinField",
+        "CalculatedField",
+        "ColumnField",
+        "CombinedField",
+        "CombinedSetField",
+        "DatasourceField",
+        "Field",
+        "GroupField",
+        "HierarchyField",
+        "SetField",
+    ]
+    id: str
+    name: Optional[str]
+    datasource: Optional[
+        "GetItemsFieldsConnectionFieldsConnectionNodesUpstreamFieldsDatasource"
+    ]
+
+
+class GetItemsFieldsConnectionFieldsConnectionNodesUpstreamFieldsDatasource(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename__": "__typename"}
+):
+    typename__: Literal["Datasource", "EmbeddedDatasource", "PublishedDatasource"]
+    id: str
+
+
+class GetItemsFieldsConnectionFieldsConnectionNodesUpstreamColumns(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    name: Optional[str]
+    table: Optional["GetItemsFieldsConnectionFieldsConnectionNodesUpstreamColumnsTable"]
+
+
+class GetItemsFieldsConnectionFieldsConnectionNodesUpstreamColumnsTable(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename__": "__typename"}
+):
+    typename__: Literal[
+        "CustomSQLTable", "DatabaseTable", "Table", "VirtualConnectionTable"
+    ]
+    id: str
+
+
+class GetItemsFieldsConnectionFieldsConnectionPageInfo(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"has_next_page": "hasNextPage", "end_cursor": "endCursor"},
+):
+    has_next_page: bool
+    end_cursor: Optional[str]
+
+
+class GetItemsPublishedDatasourcesConnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"published_datasources_connection": "publishedDatasourcesConnection"},
+):
+    published_datasources_connection: (
+        "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnection"
+    )
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnection(
+    msgspec.Struct, kw_only=True, gc=False, rename={"page_info": "pageInfo"}
+):
+    nodes: List[
+        "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodes"
+    ]
+    page_info: (
+        "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionPageInfo"
+    )
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodes(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename__": "__typename",
+        "has_extracts": "hasExtracts",
+        "extract_last_refresh_time": "extractLastRefreshTime",
+        "extract_last_incremental_update_time": "extractLastIncrementalUpdateTime",
+        "extract_last_update_time": "extractLastUpdateTime",
+        "upstream_tables": "upstreamTables",
+        "project_name": "projectName",
+    },
+):
+    typename__: Literal["PublishedDatasource"]
+    id: str
+    name: Optional[str]
+    luid: str
+    has_extracts: Optional[bool]
+    extract_last_refresh_time: Optional[Any]
+    extract_last_incremental_update_time: Optional[Any]
+    extract_last_update_time: Optional[Any]
+    upstream_tables: List[
+        "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesUpstreamTables"
+    ]
+    fields: List[
+        Union[
+            "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField_BinField",
+            "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField_CombinedField",
+            "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField_CombinedSetField",
+            "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField_DatasourceField",
+            "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField_Field",
+            "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField_HierarchyField",
+            "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField_SetField",
+            "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsCalculatedField",
+            "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsColumnField",
+            "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsGroupField",
+        ]
+    ]
+    owner: (
+        "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesOwner"
+    )
+    description: Optional[str]
+    uri: Optional[str]
+    project_name: Optional[str]
+    tags: List[
+        "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesTags"
+    ]
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesUpstreamTables(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "schema_": "schema",
+        "full_name": "fullName",
+        "connection_type": "connectionType",
+        "columns_connection": "columnsConnection",
+    },
+):
+    id: str
+    name: Optional[str]
+    database: Optional[
+        "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesUpstreamTablesDatabase"
+    ]
+    schema_: Optional[str]
+    full_name: Optional[str]
+    connection_type: Optional[str]
+    description: Optional[str]
+    columns_connection: Optional[
+        "GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesUpstreamTablesColumnsConnection"
+    ]
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesUpstreamTablesDatabase(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename__": "__typename"}
+):
+    typename__: Literal[
+        "CloudFile",
+        "DataCloud",
+        "Database",
+        "DatabaseServer",
+        "File",
+        "WebDataConnector",
+    ]
+    name: Optional[str]
+    id: str
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesUpstreamTablesColumnsConnection(
+    msgspec.Struct, kw_only=True, gc=False, rename={"total_count": "totalCount"}
+):
+    total_count: int
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    is_hidden: Optional[bool]
+    folder_name: Optional[str]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField_BinField(
+    GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField,
+    tag="BinField",
+):
+    pass
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField_CombinedField(
+    GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField,
+    tag="CombinedField",
+):
+    pass
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField_CombinedSetField(
+    GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField,
+    tag="CombinedSetField",
+):
+    pass
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField_DatasourceField(
+    GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField,
+    tag="DatasourceField",
+):
+    pass
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField_Field(
+    GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField,
+    tag="Field",
+):
+    pass
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField_HierarchyField(
+    GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField,
+    tag="HierarchyField",
+):
+    pass
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField_SetField(
+    GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsField,
+    tag="SetField",
+):
+    pass
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsCalculatedField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CalculatedField",
+    rename={
+        "is_hidden": "isHidden",
+        "folder_name": "folderName",
+        "data_type": "dataType",
+        "default_format": "defaultFormat",
+    },
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    is_hidden: Optional[bool]
+    folder_name: Optional[str]
+    role: Optional[FieldRole]
+    data_type: Optional[FieldDataType]
+    default_format: Optional[str]
+    aggregation: Optional[str]
+    formula: Optional[str]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsColumnField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="ColumnField",
+    rename={
+        "is_hidden": "isHidden",
+        "folder_name": "folderName",
+        "data_category": "dataCategory",
+        "data_type": "dataType",
+        "default_format": "defaultFormat",
+    },
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    is_hidden: Optional[bool]
+    folder_name: Optional[str]
+    data_category: Optional[FieldRoleCategory]
+    role: Optional[FieldRole]
+    data_type: Optional[FieldDataType]
+    default_format: Optional[str]
+    aggregation: Optional[str]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesFieldsGroupField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="GroupField",
+    rename={
+        "is_hidden": "isHidden",
+        "folder_name": "folderName",
+        "data_type": "dataType",
+    },
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    is_hidden: Optional[bool]
+    folder_name: Optional[str]
+    role: Optional[FieldRole]
+    data_type: Optional[FieldDataType]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesOwner(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    username: Optional[str]
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionNodesTags(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    name: Optional[str]
+
+
+class GetItemsPublishedDatasourcesConnectionPublishedDatasourcesConnectionPageInfo(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"has_next_page": "hasNextPage", "end_cursor": "endCursor"},
+):
+    has_next_page: bool
+    end_cursor: Optional[str]
+
+
+class GetItemsSheetsConnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"sheets_connection": "sheetsConnection"},
+):
+    sheets_connection: "GetItemsSheetsConnectionSheetsConnection"
+
+
+class GetItemsSheetsConnectionSheetsConnection(
+    msgspec.Struct, kw_only=True, gc=False, rename={"page_info": "pageInfo"}
+):
+    nodes: List["GetItemsSheetsConnectionSheetsConnectionNodes"]
+    page_info: "GetItemsSheetsConnectionSheetsConnectionPageInfo"
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodes(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "created_at": "createdAt",
+        "updated_at": "updatedAt",
+        "contained_in_dashboards": "containedInDashboards",
+        "datasource_fields": "datasourceFields",
+    },
+):
+    id: str
+    name: Optional[str]
+    path: Optional[str]
+    luid: str
+    created_at: Any
+    updated_at: Any
+    tags: List["GetItemsSheetsConnectionSheetsConnectionNodesTags"]
+    contained_in_dashboards: Optional[
+        List[
+            Optional[
+                "GetItemsSheetsConnectionSheetsConnectionNodesContainedInDashboards"
+            ]
+        ]
+    ]
+    workbook: Optional["GetItemsSheetsConnectionSheetsConnectionNodesWorkbook"]
+    datasource_fields: Optional[
+        List[
+            Optional[
+                Union[
+                    "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField_BinField",
+                    "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField_CombinedField",
+                    "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField_CombinedSetField",
+                    "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField_Field",
+                    "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField_HierarchyField",
+                    "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField_SetField",
+                    "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsCalculatedField",
+                    "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsColumnField",
+                    "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceField",
+                    "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsGroupField",
+                ]
+            ]
+        ]
+    ]
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesTags(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    name: Optional[str]
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesContainedInDashboards(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    name: Optional[str]
+    path: Optional[str]
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesWorkbook(
+    msgspec.Struct, kw_only=True, gc=False, rename={"project_name": "projectName"}
+):
+    id: str
+    name: Optional[str]
+    project_name: Optional[str]
+    luid: str
+    owner: "GetItemsSheetsConnectionSheetsConnectionNodesWorkbookOwner"
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesWorkbookOwner(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    username: Optional[str]
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename"
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    datasource: Optional[
+        "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsFieldDatasource"
+    ]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField_BinField(
+    GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField, tag="BinField"
+):
+    pass
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField_CombinedField(
+    GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField,
+    tag="CombinedField",
+):
+    pass
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField_CombinedSetField(
+    GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField,
+    tag="CombinedSetField",
+):
+    pass
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField_Field(
+    GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField, tag="Field"
+):
+    pass
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField_HierarchyField(
+    GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField,
+    tag="HierarchyField",
+):
+    pass
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField_SetField(
+    GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsField, tag="SetField"
+):
+    pass
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsFieldDatasource(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename__": "__typename"}
+):
+    typename__: Literal["Datasource", "EmbeddedDatasource", "PublishedDatasource"]
+    id: str
+    name: Optional[str]
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsCalculatedField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CalculatedField",
+    rename={"data_type": "dataType"},
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    datasource: Optional[
+        "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsCalculatedFieldDatasource"
+    ]
+    role: Optional[FieldRole]
+    data_type: Optional[FieldDataType]
+    aggregation: Optional[str]
+    formula: Optional[str]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsCalculatedFieldDatasource(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename__": "__typename"}
+):
+    typename__: Literal["Datasource", "EmbeddedDatasource", "PublishedDatasource"]
+    id: str
+    name: Optional[str]
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsColumnField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="ColumnField",
+    rename={"data_category": "dataCategory", "data_type": "dataType"},
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    datasource: Optional[
+        "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsColumnFieldDatasource"
+    ]
+    data_category: Optional[FieldRoleCategory]
+    role: Optional[FieldRole]
+    data_type: Optional[FieldDataType]
+    aggregation: Optional[str]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsColumnFieldDatasource(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename__": "__typename"}
+):
+    typename__: Literal["Datasource", "EmbeddedDatasource", "PublishedDatasource"]
+    id: str
+    name: Optional[str]
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="DatasourceField",
+    rename={"remote_field": "remoteField"},
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    datasource: Optional[
+        "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldDatasource"
+    ]
+    remote_field: Optional[
+        Union[
+            "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField_BinField",
+            "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField_CombinedField",
+            "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField_CombinedSetField",
+            "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField_DatasourceField",
+            "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField_Field",
+            "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField_HierarchyField",
+            "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField_SetField",
+            "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldCalculatedField",
+            "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldColumnField",
+            "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldGroupField",
+        ]
+    ]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldDatasource(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename__": "__typename"}
+):
+    typename__: Literal["Datasource", "EmbeddedDatasource", "PublishedDatasource"]
+    id: str
+    name: Optional[str]
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    rename={"folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    folder_name: Optional[str]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField_BinField(
+    GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField,
+    tag="BinField",
+):
+    pass
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField_CombinedField(
+    GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField,
+    tag="CombinedField",
+):
+    pass
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField_CombinedSetField(
+    GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField,
+    tag="CombinedSetField",
+):
+    pass
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField_DatasourceField(
+    GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField,
+    tag="DatasourceField",
+):
+    pass
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField_Field(
+    GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField,
+    tag="Field",
+):
+    pass
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField_HierarchyField(
+    GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField,
+    tag="HierarchyField",
+):
+    pass
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField_SetField(
+    GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldField,
+    tag="SetField",
+):
+    pass
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldCalculatedField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CalculatedField",
+    rename={"folder_name": "folderName", "data_type": "dataType"},
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    folder_name: Optional[str]
+    role: Optional[FieldRole]
+    data_type: Optional[FieldDataType]
+    aggregation: Optional[str]
+    formula: Optional[str]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldColumnField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="ColumnField",
+    rename={
+        "folder_name": "folderName",
+        "data_category": "dataCategory",
+        "data_type": "dataType",
+    },
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    folder_name: Optional[str]
+    data_category: Optional[FieldRoleCategory]
+    role: Optional[FieldRole]
+    data_type: Optional[FieldDataType]
+    aggregation: Optional[str]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsDatasourceFieldRemoteFieldGroupField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="GroupField",
+    rename={"folder_name": "folderName", "data_type": "dataType"},
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    folder_name: Optional[str]
+    role: Optional[FieldRole]
+    data_type: Optional[FieldDataType]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsGroupField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="GroupField",
+    rename={"data_type": "dataType"},
+):
+    id: str
+    name: Optional[str]
+    description: Optional[str]
+    datasource: Optional[
+        "GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsGroupFieldDatasource"
+    ]
+    role: Optional[FieldRole]
+    data_type: Optional[FieldDataType]
+
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItemsSheetsConnectionSheetsConnectionNodesDatasourceFieldsGroupFieldDatasource(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename__": "__typename"}
+):
+    typename__: Literal["Datasource", "EmbeddedDatasource", "PublishedDatasource"]
+    id: str
+    name: Optional[str]
+
+
+class GetItemsSheetsConnectionSheetsConnectionPageInfo(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"has_next_page": "hasNextPage", "end_cursor": "endCursor"},
+):
+    has_next_page: bool
+    end_cursor: Optional[str]
+
+
+class GetItemsWorkbooksConnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"workbooks_connection": "workbooksConnection"},
+):
+    workbooks_connection: "GetItemsWorkbooksConnectionWorkbooksConnection"
+
+
+class GetItemsWorkbooksConnectionWorkbooksConnection(
+    msgspec.Struct, kw_only=True, gc=False, rename={"page_info": "pageInfo"}
+):
+    nodes: List["GetItemsWorkbooksConnectionWorkbooksConnectionNodes"]
+    page_info: "GetItemsWorkbooksConnectionWorkbooksConnectionPageInfo"
+
+
+class GetItemsWorkbooksConnectionWorkbooksConnectionNodes(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "project_name": "projectName",
+        "created_at": "createdAt",
+        "updated_at": "updatedAt",
+        "embedded_datasources": "embeddedDatasources",
+    },
+):
+    id: str
+    name: Optional[str]
+    luid: str
+    uri: Optional[str]
+    project_name: Optional[str]
+    owner: "GetItemsWorkbooksConnectionWorkbooksConnectionNodesOwner"
+    description: Optional[str]
+    created_at: Any
+    updated_at: Any
+    tags: List["GetItemsWorkbooksConnectionWorkbooksConnectionNodesTags"]
+    sheets: List["GetItemsWorkbooksConnectionWorkbooksConnectionNodesSheets"]
+    dashboards: List["GetItemsWorkbooksConnectionWorkbooksConnectionNodesDashboards"]
+    embedded_datasources: List[
+        "GetItemsWorkbooksConnectionWorkbooksConnectionNodesEmbeddedDatasources"
+    ]
+
+
+class GetItemsWorkbooksConnectionWorkbooksConnectionNodesOwner(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    username: Optional[str]
+
+
+class GetItemsWorkbooksConnectionWorkbooksConnectionNodesTags(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    name: Optional[str]
+
+
+class GetItemsWorkbooksConnectionWorkbooksConnectionNodesSheets(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    id: str
+
+
+class GetItemsWorkbooksConnectionWorkbooksConnectionNodesDashboards(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    id: str
+
+
+class GetItemsWorkbooksConnectionWorkbooksConnectionNodesEmbeddedDatasources(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    id: str
+
+
+class GetItemsWorkbooksConnectionWorkbooksConnectionPageInfo(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"has_next_page": "hasNextPage", "end_cursor": "endCursor"},
+):
+    has_next_page: bool
+    end_cursor: Optional[str]
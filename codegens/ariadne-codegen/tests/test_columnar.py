@@ -0,0 +1,88 @@
+import numpy
+
+from tableau_runtime import ColumnarBuilder
+
+SHEETS = """
+query Sheets {
+  sheetsConnection {
+    nodes { id index workbook { name } tags { name } }
+    pageInfo { hasNextPage }
+  }
+}
+"""
+
+PAGE = {
+    "sheetsConnection": {
+        "nodes": [
+            {
+                "id": "s0",
+                "index": 3,
+                "workbook": {"name": "Sales"},
+                "tags": [{"name": "a"}, {"name": "b"}],
+            },
+            {"id": "s1", "index": None, "workbook": None, "tags": []},
+            {"id": "s2", "index": 5, "workbook": {"name": None}, "tags": None},
+        ],
+        "pageInfo": {"hasNextPage": False},
+    }
+}
+
+
+def test_flattens_nodes_into_columns():
+    builder = ColumnarBuilder(SHEETS)
+    builder.append_page(PAGE)
+    assert len(builder) == 3
+    assert builder.columns == ["id", "index", "workbook", "tags"]
+
+    columns = builder.to_numpy()
+    assert sorted(columns) == ["id", "index", "tags", "tags[].name", "workbook.name"]
+    assert columns["id"].tolist() == ["s0", "s1", "s2"]
+    assert columns["index"].dtype == numpy.int64
+    assert columns["index"].tolist() == [3, None, 5]
+    assert columns["workbook.name"].tolist() == ["Sales", None, None]
+    # Lists are offsets into their flattened items, like Arrow lists.
+    assert columns["tags"].tolist() == [0, 2, 2, 2]
+    assert columns["tags[].name"].tolist() == ["a", "b"]
+
+
+def test_arrow_table_keeps_nesting_and_nulls():
+    builder = ColumnarBuilder(SHEETS)
+    builder.append_page(PAGE)
+    table = builder.to_arrow()
+
+    assert table.to_pylist() == [
+        {
+            "id": "s0",
+            "index": 3,
+            "workbook": {"name": "Sales"},
+            "tags": [{"name": "a"}, {"name": "b"}],
+        },
+        {"id": "s1", "index": None, "workbook": None, "tags": []},
+        {"id": "s2", "index": 5, "workbook": {"name": None}, "tags": None},
+    ]
+
+
+def test_inline_fragments_add_nullable_columns():
+    builder = ColumnarBuilder("""
+        {
+          fieldsConnection {
+            nodes { __typename id ... on ColumnField { isHidden } }
+          }
+        }
+        """)
+    builder.append_nodes(
+        [
+            {"__typename": "ColumnField", "id": "f0", "isHidden": True},
+            {"__typename": "CalculatedField", "id": "f1"},
+        ]
+    )
+    columns = builder.to_numpy()
+    assert columns["__typename"].tolist() == ["ColumnField", "CalculatedField"]
+    assert columns["isHidden"].dtype == numpy.bool_
+    assert columns["isHidden"].tolist() == [True, None]
+
+
+def test_builder_for_generated_operation():
+    builder = ColumnarBuilder.for_operation("get_items_fields_connection")
+    assert builder.connection_key == "fieldsConnection"
+    assert builder.columns == ["__typename", "id", "upstreamFields", "upstreamColumns"]
@@ -0,0 +1,41 @@
+from tableau_runtime import NodeCountEstimator, estimate_nodes, max_safe_first
+
+# One node per sheet and one per workbook: 1 + first * 2.
+SHEETS = "sheetsConnection{} {{ nodes {{ id workbook {{ id }} }} }}"
+
+
+def test_literal_first():
+    assert estimate_nodes("{ %s }" % SHEETS.format("(first: 5)")) == 11
+
+
+def test_variable_first():
+    document = "query Q($first: Int) { %s }" % SHEETS.format("(first: $first)")
+    assert estimate_nodes(document, {"first": 5}) == 11
+    assert estimate_nodes(document) == 201
+
+
+def test_defaulted_variable_first():
+    document = "query Q($first: Int = 5) { %s }" % SHEETS.format("(first: $first)")
+    assert estimate_nodes(document) == 11
+    assert estimate_nodes(document, {"first": 7}) == 15
+
+
+def test_missing_first_uses_tableau_default():
+    assert estimate_nodes("{ %s }" % SHEETS.format("")) == 201
+    estimator = NodeCountEstimator(default_first=20)
+    assert estimator.estimate("{ %s }" % SHEETS.format("")) == 41
+
+
+def test_lists_outside_connections_use_list_size():
+    document = "{ %s }" % SHEETS.format("(first: 2)").replace(
+        "workbook { id }", "tags { id }"
+    )
+    assert estimate_nodes(document) == 1 + 2 * (1 + 10)
+    estimator = NodeCountEstimator(list_sizes={"Sheet.tags": 3})
+    assert estimator.estimate(document) == 1 + 2 * (1 + 3)
+
+
+def test_max_safe_first():
+    document = "query Q($first: Int) { %s }" % SHEETS.format("(first: $first)")
+    assert max_safe_first(document, limit=201) == 100
+    assert max_safe_first(document, limit=2) == 0
@@ -0,0 +1,82 @@
+from tableau_queries.get_items_fields_connection import GetItemsFieldsConnection
+from tableau_runtime import EntityCache, IdInterner
+
+
+def _page(*field_ids):
+    return GetItemsFieldsConnection.model_validate(
+        {
+            "fieldsConnection": {
+                "nodes": [
+                    {
+                        "__typename": "ColumnField",
+                        "id": field_id,
+                        "upstreamFields": [],
+                        "upstreamColumns": [
+                            {
+                                "name": "region",
+                                "table": {
+                                    "__typename": "DatabaseTable",
+                                    # Built per node, so equal but not identical.
+                                    "id": "".join(["table", "-1"]),
+                                },
+                            }
+                        ],
+                    }
+                    for field_id in field_ids
+                ],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        }
+    )
+
+
+def _tables(page):
+    return [
+        column.table
+        for node in page.fields_connection.nodes
+        for column in node.upstream_columns
+    ]
+
+
+def test_repeated_entities_share_one_instance():
+    cache = EntityCache()
+    first = cache.intern(_page("f0", "f1"))
+    tables = _tables(first)
+    assert tables[0] is tables[1]
+    assert tables[0] in cache
+
+    second = cache.intern(_page("f1", "f2"))
+    assert _tables(second)[0] is tables[0]
+    # An entity already in the map replaces the new copy, subtree included.
+    assert second.fields_connection.nodes[0] is first.fields_connection.nodes[1]
+    # f0, f1, f2 and the table; the table is hit twice, the second f1
+    # once, and the table under the second f1 is not visited again.
+    assert len(cache) == 4
+    assert (cache.hits, cache.misses) == (3, 4)
+
+
+def test_models_without_id_are_not_entities():
+    cache = EntityCache()
+    page = cache.intern(_page("f0"))
+    column = page.fields_connection.nodes[0].upstream_columns[0]
+    assert cache.key(column) is None
+    assert column not in cache
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_id_interner_canonical_ids():
+    ids = IdInterner()
+    cache = EntityCache(ids)
+    page = cache.intern(_page("f0", "f1"))
+
+    assert ids.get("table-1") is not None
+    table = _tables(page)[0]
+    assert table.id is ids.canonical("".join(["table", "-1"]))
+    assert cache.key(table)[2] == ids.get("table-1")
+    assert [ids.lookup(handle) for handle in ids.intern_many(["f0", "f1"])] == [
+        "f0",
+        "f1",
+    ]
@@ -0,0 +1,94 @@
+from tableau_queries.get_items_fields_connection import GetItemsFieldsConnection
+from tableau_runtime import IdInterner, LineageBuilder, LineageGraph, LineageStore
+
+
+def _fields_page(*nodes):
+    return GetItemsFieldsConnection.model_validate(
+        {
+            "fieldsConnection": {
+                "nodes": [
+                    {
+                        "__typename": "ColumnField",
+                        "id": field_id,
+                        "upstreamFields": [
+                            {
+                                "__typename": "ColumnField",
+                                "id": upstream_id,
+                                "name": upstream_id.upper(),
+                                "datasource": {
+                                    "__typename": "PublishedDatasource",
+                                    "id": "datasource",
+                                },
+                            }
+                            for upstream_id in upstream_ids
+                        ],
+                        "upstreamColumns": [],
+                    }
+                    for field_id, upstream_ids in nodes
+                ],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        }
+    )
+
+
+# f0 -> f1 -> f2, with each hop reported by a different node.
+PAGE = _fields_page(("f1", ["f0"]), ("f2", ["f1"]))
+
+
+def test_graph_closure_spans_two_field_hops():
+    builder = LineageBuilder()
+    builder.add_fields_page(PAGE)
+    graph = builder.build()
+
+    assert graph.descendants("f0") == {"f1", "f2"}
+    assert graph.ancestors("f2") == {"f0", "f1"}
+    assert graph.descendants("f0", max_depth=1) == {"f1"}
+
+
+def test_graph_drops_duplicate_edges_and_handles_cycles():
+    builder = LineageBuilder()
+    builder.add_edges(
+        [("a", "c"), ("a", "b"), ("a", "c"), ("b", "c"), ("c", "a"), ("c", "d")]
+    )
+    graph = builder.build()
+
+    assert graph.edge_count == 5
+    assert sorted(graph.downstream("a")) == ["b", "c"]
+    assert sorted(graph.upstream("c")) == ["a", "b"]
+    assert graph.descendants("a") == {"b", "c", "d"}
+    assert graph.impact(["b", "d"], max_depth=1) == {"c"}
+    # Entities interned after the build are isolated vertices.
+    builder.ids.intern("e")
+    assert graph.descendants("e") == set()
+
+
+def test_graph_without_edges():
+    graph = LineageGraph.from_edges(IdInterner(), [], [])
+    assert graph.vertex_count == 0
+    assert list(graph.edges()) == []
+
+
+def test_store_closure_spans_two_field_hops():
+    store = LineageStore()
+    store.apply_fields_page(PAGE)
+
+    assert store.descendants("f0") == {"f1", "f2"}
+    assert store.ancestors("f2") == {"f0", "f1"}
+
+
+def test_store_updates_cached_closures():
+    store = LineageStore()
+    store.apply_fields_page(PAGE)
+    store.apply("g1", [("g0", "g1")])
+    assert store.descendants("f0") == {"f1", "f2"}
+    assert store.descendants("g0") == {"g1"}
+
+    store.apply_fields_page(_fields_page(("f3", ["f2"])))
+    assert store.descendants("f0") == {"f1", "f2", "f3"}
+    assert store.ancestors("f3") == {"f0", "f1", "f2"}
+
+    store.remove("f1")
+    assert store.descendants("f0") == set()
+    assert store.ancestors("f3") == {"f1", "f2"}
+    assert store.descendants("g0") == {"g1"}
@@ -0,0 +1,160 @@
+import asyncio
+import json
+import math
+
+import httpx
+from graphql import graphql_sync
+
+from tableau_runtime import (
+    NodeCountEstimator,
+    QueryPlanner,
+    SplittingClient,
+    get_operation,
+    load_schema,
+)
+from tableau_runtime.planner import stitch
+
+FIELDS = get_operation("get_items_fields_connection")
+
+
+def _node(index):
+    return {
+        "__typename": "ColumnField",
+        "id": f"f{index}",
+        "upstreamFields": [
+            {
+                "__typename": "ColumnField",
+                "id": f"f{index}-up",
+                "name": f"F{index}",
+                "datasource": {"__typename": "PublishedDatasource", "id": "ds"},
+            }
+        ],
+        "upstreamColumns": [
+            {"name": f"c{index}", "table": {"__typename": "DatabaseTable", "id": "t"}}
+        ],
+    }
+
+
+NODES = [_node(index) for index in range(7)]
+
+
+def _execute(document, variables, nodes=NODES):
+    if "ids" in variables:
+        nodes = [node for node in nodes if node["id"] in variables["ids"]]
+    root = {
+        "fieldsConnection": {
+            "nodes": nodes,
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+        }
+    }
+    result = graphql_sync(load_schema(), document, root, variable_values=variables)
+    assert not result.errors, result.errors
+    return result.data
+
+
+def test_heavy_selections_follow_the_node_budget():
+    # 1 + 100 * (1 + 20 + 20) + 1 (pageInfo); moving one list fits 2500.
+    assert NodeCountEstimator().estimate(FIELDS.document, {"first": 100}) == 4102
+    plan = QueryPlanner(node_limit=2500).plan(FIELDS.document, {"first": 100})
+
+    assert [followup.response_keys for followup in plan.followups] == [
+        ("upstreamFields",)
+    ]
+    assert "upstreamFields" not in plan.root
+    assert "upstreamColumns" in plan.root
+    estimator = NodeCountEstimator()
+    assert estimator.estimate(plan.root, {"first": 100}) <= 2500
+    followup = plan.followups[0]
+    assert followup.name == "GetItems_fieldsConnection_upstreamFields"
+    assert estimator.estimate(followup.document, {"first": followup.batch_size}) <= 2500
+
+    assert not QueryPlanner().plan(FIELDS.document, {"first": 100}).is_split
+
+
+def test_split_moves_inline_fragments():
+    document = """
+    query Fields($first: Int) {
+      fieldsConnection(first: $first) {
+        nodes {
+          id
+          ... on ColumnField { upstreamFields { id name } }
+        }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+    """
+    plan = QueryPlanner(node_limit=500).plan(document, {"first": 100})
+
+    (followup,) = plan.followups
+    assert followup.name == "Fields_onColumnField"
+    assert followup.response_keys == ("upstreamFields",)
+    assert "upstreamFields" not in plan.root
+
+    data = _execute(plan.root, {"first": 100})
+    fetched = _execute(followup.document, {"ids": ["f1"], "first": 1})
+    assert stitch(data, plan, followup, fetched) == {"f1"}
+    stitched = data["fieldsConnection"]["nodes"]
+    assert stitched[1]["upstreamFields"] == [{"id": "f1-up", "name": "F1"}]
+    assert "upstreamFields" not in stitched[0]
+
+
+def test_splitting_client_stitches_followups_into_the_page():
+    planner = QueryPlanner(node_limit=100)
+    plan = planner.plan(FIELDS.document, {"first": 7})
+    assert len(plan.followups) == 2
+    sent = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        sent.append(body)
+        data = _execute(body["query"], body["variables"])
+        return httpx.Response(200, json={"data": data})
+
+    async def run():
+        client = SplittingClient(
+            url="http://tableau/api/metadata/graphql",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            planner=planner,
+        )
+        return await client.get_items_fields_connection(first=7)
+
+    page = asyncio.run(run())
+    expected = FIELDS.model.model_validate(_execute(FIELDS.document, {"first": 7}))
+    assert page == expected
+    batches = [math.ceil(7 / followup.batch_size) for followup in plan.followups]
+    assert len(sent) == 1 + sum(batches)
+    estimator = NodeCountEstimator()
+    assert all(
+        estimator.estimate(body["query"], body["variables"]) <= 100 for body in sent
+    )
+
+
+def test_stitch_drops_nodes_missing_from_followups():
+    planner = QueryPlanner(node_limit=100)
+
+    def handler(request):
+        body = json.loads(request.content)
+        # f3 is deleted between the root query and the follow-ups.
+        nodes = [node for node in NODES if node["id"] != "f3"]
+        if "ids" not in body["variables"]:
+            nodes = NODES
+        data = _execute(body["query"], body["variables"], nodes)
+        return httpx.Response(200, json={"data": data})
+
+    async def run():
+        client = SplittingClient(
+            url="http://tableau/api/metadata/graphql",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            planner=planner,
+        )
+        return await client.get_items_fields_connection(first=7)
+
+    page = asyncio.run(run())
+    assert [node.id for node in page.fields_connection.nodes] == [
+        "f0",
+        "f1",
+        "f2",
+        "f4",
+        "f5",
+        "f6",
+    ]
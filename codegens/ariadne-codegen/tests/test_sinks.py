@@ -0,0 +1,160 @@
+import asyncio
+import io
+import json
+
+import pyarrow.parquet
+import pytest
+
+from tableau_queries.get_items_fields_connection import GetItemsFieldsConnection
+from tableau_runtime import NDJSONSink, ParquetSink, Sink, page_nodes, stream_to_sink
+
+
+def _data(*field_ids):
+    return {
+        "fieldsConnection": {
+            "nodes": [
+                {
+                    "__typename": "ColumnField",
+                    "id": field_id,
+                    "upstreamFields": [],
+                    "upstreamColumns": [
+                        {
+                            "name": "region",
+                            "table": {"__typename": "DatabaseTable", "id": "t"},
+                        }
+                    ],
+                }
+                for field_id in field_ids
+            ],
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+        }
+    }
+
+
+# Raw `paginate_data` pages and validated `paginate` pages.
+DATA_PAGES = [_data("f0", "f1"), _data("f2")]
+MODEL_PAGES = [GetItemsFieldsConnection.model_validate(page) for page in DATA_PAGES]
+
+
+async def _pages(pages):
+    for page in pages:
+        yield page
+
+
+def _stream(pages, sink, **kwargs):
+    async def run():
+        async with sink:
+            return await stream_to_sink(_pages(pages), sink, **kwargs)
+
+    return asyncio.run(run())
+
+
+def test_page_nodes():
+    assert page_nodes(DATA_PAGES[0]) == DATA_PAGES[0]["fieldsConnection"]["nodes"]
+    assert page_nodes(MODEL_PAGES[0]) == MODEL_PAGES[0].fields_connection.nodes
+
+
+@pytest.mark.parametrize("pages", [DATA_PAGES, MODEL_PAGES], ids=["data", "models"])
+def test_ndjson_sink(pages):
+    buffer = io.StringIO()
+    sink = NDJSONSink(buffer)
+    assert _stream(pages, sink) == 2
+    rows = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert rows == [*page_nodes(DATA_PAGES[0]), *page_nodes(DATA_PAGES[1])]
+    assert sink.written == 3
+
+
+def test_ndjson_sink_owns_files_it_opens(tmp_path):
+    path = tmp_path / "fields.ndjson"
+    sink = NDJSONSink(path)
+    _stream(DATA_PAGES, sink)
+    assert sink._file.closed
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+
+
+@pytest.mark.parametrize("pages", [DATA_PAGES, MODEL_PAGES], ids=["data", "models"])
+def test_parquet_sink(pages, tmp_path):
+    path = tmp_path / "fields.parquet"
+    sink = ParquetSink(path, "get_items_fields_connection", row_group_size=2)
+    assert _stream(pages, sink) == 2
+    assert sink.written == 3
+
+    parquet = pyarrow.parquet.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 2
+    rows = parquet.read().to_pylist()
+    assert [row["id"] for row in rows] == ["f0", "f1", "f2"]
+    assert rows[0]["upstreamColumns"] == [
+        {"name": "region", "table": {"__typename": "DatabaseTable", "id": "t"}}
+    ]
+
+
+class _RecordingSink(Sink):
+    def __init__(self, fail_on=None):
+        self.pages = []
+        self.fail_on = fail_on
+
+    def _write_nodes(self, nodes):
+        if len(self.pages) == self.fail_on:
+            raise OSError("disk full")
+        self.pages.append([node["id"] for node in nodes])
+
+    def _close(self):
+        pass
+
+
+def test_stream_applies_backpressure():
+    fetched = []
+
+    async def pages():
+        for index in range(6):
+            fetched.append(index)
+            yield _data(f"f{index}")
+
+    class SlowSink(_RecordingSink):
+        async def write_page(self, page):
+            # The producer can only be `max_pending_pages` (+1 in hand)
+            # pages ahead of the writer.
+            assert len(fetched) - len(self.pages) <= 3
+            await asyncio.sleep(0)
+            await super().write_page(page)
+
+    sink = SlowSink()
+
+    async def run():
+        return await stream_to_sink(pages(), sink, max_pending_pages=1)
+
+    assert asyncio.run(run()) == 6
+    assert sink.pages == [[f"f{index}"] for index in range(6)]
+
+
+def test_sink_failure_stops_the_producer():
+    produced = []
+
+    async def pages():
+        try:
+            for index in range(100):
+                produced.append(index)
+                yield _data(f"f{index}")
+        finally:
+            produced.append("closed")
+
+    with pytest.raises(OSError, match="disk full"):
+        asyncio.run(stream_to_sink(pages(), _RecordingSink(fail_on=1)))
+    assert produced[-1] == "closed"
+    assert len(produced) < 10
+
+
+def test_producer_failure_propagates():
+    async def pages():
+        yield _data("f0")
+        raise RuntimeError("fetch failed")
+
+    sink = _RecordingSink()
+    with pytest.raises(RuntimeError, match="fetch failed"):
+        asyncio.run(stream_to_sink(pages(), sink))
+    assert sink.pages == [["f0"]]
+
+
+def test_sinks_are_abstract():
+    with pytest.raises(TypeError):
+        Sink()  # type: ignore[abstract]
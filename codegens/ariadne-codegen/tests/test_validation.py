@@ -0,0 +1,83 @@
+import asyncio
+
+import httpx
+import pytest
+
+from tableau_runtime import DocumentValidationError, DocumentValidator, ValidatingClient
+from tableau_runtime import validation
+
+VALID = "{ sheetsConnection(first: 1) { nodes { id } } }"
+INVALID = "{ sheetsConnection(first: 1) { nodes { colour } } }"
+
+
+@pytest.fixture
+def validate_calls(monkeypatch):
+    calls = []
+
+    def counting_validate(schema, ast):
+        calls.append(ast)
+        return original(schema, ast)
+
+    original = validation.validate
+    monkeypatch.setattr(validation, "validate", counting_validate)
+    return calls
+
+
+def test_results_are_cached_per_document(validate_calls):
+    validator = DocumentValidator()
+
+    assert validator.validate(VALID) == ()
+    assert validator.validate(VALID) == ()
+    assert len(validate_calls) == 1
+
+    errors = validator.validate(INVALID)
+    assert "colour" in errors[0].message
+    assert validator.validate(INVALID) is errors
+    assert len(validate_calls) == 2
+    assert validator.cache_info() == {"size": 2, "max_size": 1024}
+
+
+def test_least_recently_used_result_is_evicted(validate_calls):
+    validator = DocumentValidator(max_size=2)
+    validator.validate(VALID)
+    validator.validate(INVALID)
+    validator.validate(VALID)  # hit: INVALID is now the oldest
+    validator.validate("{ workbooksConnection(first: 1) { nodes { id } } }")
+    assert len(validate_calls) == 3
+
+    validator.validate(VALID)
+    assert len(validate_calls) == 3
+    validator.validate(INVALID)
+    assert len(validate_calls) == 4
+    assert validator.cache_info()["size"] == 2
+
+
+def test_syntax_errors_are_cached(validate_calls):
+    validator = DocumentValidator()
+    (error,) = validator.validate("{ sheetsConnection {")
+    assert "Syntax Error" in error.message
+    assert validator.validate("{ sheetsConnection {") == (error,)
+    assert validate_calls == []
+
+
+def test_check_raises_before_sending():
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(200, json={"data": {}})
+
+    async def run(query):
+        client = ValidatingClient(
+            url="http://tableau/api/metadata/graphql",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        return await client.execute(query)
+
+    with pytest.raises(DocumentValidationError) as raised:
+        asyncio.run(run(INVALID))
+    assert "colour" in raised.value.errors[0].message
+    assert sent == []
+
+    assert asyncio.run(run(VALID)).status_code == 200
+    assert len(sent) == 1
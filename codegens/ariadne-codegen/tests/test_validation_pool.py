@@ -0,0 +1,138 @@
+import asyncio
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pyarrow.parquet
+import pytest
+
+from tableau_queries.client import Client
+from tableau_queries.exceptions import GraphQLClientGraphQLMultiError
+from tableau_queries.get_items_fields_connection import GetItemsFieldsConnection
+from tableau_runtime import (
+    EntityCache,
+    NDJSONSink,
+    ParquetSink,
+    ValidationPool,
+    paginate,
+    stream_to_sink,
+)
+
+
+def _node(field_id):
+    return {
+        "__typename": "ColumnField",
+        "id": field_id,
+        "upstreamFields": [
+            {
+                "__typename": "ColumnField",
+                "id": f"{field_id}-upstream",
+                "name": field_id.upper(),
+                "datasource": {"__typename": "PublishedDatasource", "id": "ds"},
+            }
+        ],
+        "upstreamColumns": [],
+    }
+
+
+# Three pages of two fields, chained by cursor.
+PAGES = {
+    None: ["f0", "f1"],
+    "1": ["f2", "f3"],
+    "2": ["f4", "f5"],
+}
+
+
+def _data(after):
+    cursors = list(PAGES)
+    position = cursors.index(after)
+    has_next = position + 1 < len(cursors)
+    return {
+        "fieldsConnection": {
+            "nodes": [_node(field_id) for field_id in PAGES[after]],
+            "pageInfo": {
+                "hasNextPage": has_next,
+                "endCursor": cursors[position + 1] if has_next else None,
+            },
+        }
+    }
+
+
+def _handler(request):
+    after = json.loads(request.content)["variables"].get("after")
+    return httpx.Response(200, json={"data": _data(after)})
+
+
+def _client(handler=_handler):
+    return Client(
+        url="http://tableau/api/metadata/graphql",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def _crawl(sink, **kwargs):
+    async def run():
+        with ValidationPool(executor=ThreadPoolExecutor(2)) as pool:
+            pages = paginate(
+                _client(),
+                "get_items_fields_connection",
+                first=2,
+                validation_pool=pool,
+                **kwargs,
+            )
+            async with sink:
+                return await stream_to_sink(pages, sink)
+
+    return asyncio.run(run())
+
+
+def test_pool_pages_are_models():
+    async def run():
+        with ValidationPool(executor=ThreadPoolExecutor(2)) as pool:
+            return [
+                page
+                async for page in paginate(
+                    _client(),
+                    "get_items_fields_connection",
+                    first=2,
+                    validation_pool=pool,
+                )
+            ]
+
+    pages = asyncio.run(run())
+    expected = [
+        GetItemsFieldsConnection.model_validate(_data(after)) for after in PAGES
+    ]
+    assert pages == expected
+
+
+def test_pool_into_ndjson_sink():
+    buffer = io.StringIO()
+    sink = NDJSONSink(buffer)
+    assert _crawl(sink) == 3
+    rows = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert [row["id"] for row in rows] == ["f0", "f1", "f2", "f3", "f4", "f5"]
+    assert rows[0] == _node("f0")
+    assert sink.written == 6
+
+
+def test_pool_into_parquet_sink(tmp_path):
+    path = tmp_path / "fields.parquet"
+    sink = ParquetSink(path, "get_items_fields_connection", row_group_size=4)
+    assert _crawl(sink, entity_cache=EntityCache()) == 3
+    table = pyarrow.parquet.read_table(path)
+    assert table.column("id").to_pylist() == ["f0", "f1", "f2", "f3", "f4", "f5"]
+    assert sink.written == 6
+
+
+def test_pool_raises_graphql_errors():
+    def failing(request):
+        return httpx.Response(200, json={"data": None, "errors": [{"message": "no"}]})
+
+    async def run():
+        with ValidationPool(executor=ThreadPoolExecutor(1)) as pool:
+            await pool.fetch(_client(failing), "get_items_fields_connection", first=2)
+
+    with pytest.raises(GraphQLClientGraphQLMultiError):
+        asyncio.run(run())
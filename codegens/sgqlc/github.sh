@@ -2,3 +2,7 @@
 sgqlc-codegen schema --docstrings ../../schemas/github/schema.json github_schema.py
 # this genrates the queries
 sgqlc-codegen operation --schema ../../schemas/github/schema.json github_schema github_operations.py github_operations.gql
+# this builds the operations lazily, on first access
+python ../../tools/sgqlc_lazy_operations.py github_operations.py
+# this generates the fast-importing schema package (no docstrings, types built on first use)
+python ../../tools/sgqlc_fast_schema.py github_schema.py github_schema_fast
@@ -1,3 +1,4 @@
+import functools
 import sgqlc.types
 import sgqlc.operation
 import github_schema
@@ -9,10 +10,10 @@ __all__ = ('Operations',)
 
 
 def query_list_issues():
-    _op = sgqlc.operation.Operation(_schema_root.query_type, name='ListIssues', variables=dict(owner=sgqlc.types.Arg(sgqlc.types.non_null(_schema.String)), name=sgqlc.types.Arg(sgqlc.types.non_null(_schema.String)), desiredOrderBy=sgqlc.types.Arg(_schema.IssueOrder, default={'field': 'CREATED_AT', 'direction': 'ASC'}), filterStates=sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null(_schema.IssueState)), default=('OPEN',))))
+    _op = sgqlc.operation.Operation(_schema_root.query_type, name='ListIssues', variables=dict(owner=sgqlc.types.Arg(sgqlc.types.non_null(_schema.String)), name=sgqlc.types.Arg(sgqlc.types.non_null(_schema.String)), desiredOrderBy=sgqlc.types.Arg(_schema.IssueOrder, default={'field': 'CREATED_AT', 'direction': 'ASC'}), filterStates=sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null(_schema.IssueState)), default=('OPEN',)), after=sgqlc.types.Arg(_schema.String)))
     _op_repository = _op.repository(owner=sgqlc.types.Variable('owner'), name=sgqlc.types.Variable('name'))
     _op_repository.__typename__()
-    _op_repository_issues = _op_repository.issues(first=100, order_by=sgqlc.types.Variable('desiredOrderBy'), states=sgqlc.types.Variable('filterStates'))
+    _op_repository_issues = _op_repository.issues(first=100, after=sgqlc.types.Variable('after'), order_by=sgqlc.types.Variable('desiredOrderBy'), states=sgqlc.types.Variable('filterStates'))
     _op_repository_issues_nodes = _op_repository_issues.nodes()
     _op_repository_issues_nodes.number(__alias__='n')
     _op_repository_issues_nodes.title()
@@ -23,11 +24,31 @@ def query_list_issues():
     _op_repository_issues_page_info.end_cursor()
     _op_repository_rulesets = _op_repository.rulesets(last=None, include_parents=False)
     _op_repository_rulesets.total_count()
+    _op_rate_limit = _op.rate_limit()
+    _op_rate_limit.cost()
+    _op_rate_limit.remaining()
+    _op_rate_limit.reset_at()
     return _op
 
 
+class _LazyOperation:
+    def __init__(self, build):
+        self.build = build
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        operation = self.build()
+        operation.__to_graphql__ = functools.lru_cache(maxsize=None)(
+            operation.__to_graphql__
+        )
+        setattr(owner, self.name, operation)
+        return operation
+
+
 class Query:
-    list_issues = query_list_issues()
+    list_issues = _LazyOperation(query_list_issues)
 
 
 class Operations:
@@ -0,0 +1,1553 @@
+# Generated by tools/sgqlc_fast_schema.py
+# Source: github_schema.py
+
+import importlib
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+
+class _LazySchema(sgqlc.types.Schema):
+    """A schema that builds each type the first time it is looked up."""
+
+    def __init__(self, modules):
+        self._modules = dict(modules)
+        self._roots = {}
+        super().__init__()
+
+    def _build(self, name):
+        module = self._modules.pop(name, None)
+        if module is None:
+            return False
+        getattr(importlib.import_module(f"{__name__}.{module}"), name)()
+        return True
+
+    def _build_all(self):
+        while self._modules:
+            self._build(next(iter(self._modules)))
+
+    def __getitem__(self, key):
+        try:
+            return super().__getitem__(key)
+        except KeyError:
+            if not self._build(key):
+                raise
+        return super().__getitem__(key)
+
+    def __getattr__(self, key):
+        if key.startswith("_"):
+            raise AttributeError(key)
+        try:
+            return super().__getattr__(key)
+        except AttributeError:
+            if not self._build(key):
+                raise
+        return super().__getattr__(key)
+
+    def __contains__(self, key):
+        return key in self._modules or super().__contains__(key)
+
+    def __iter__(self):
+        self._build_all()
+        return super().__iter__()
+
+    def __to_graphql__(self, *args, **kwargs):
+        self._build_all()
+        return super().__to_graphql__(*args, **kwargs)
+
+    def _root(kind):
+        def get(self):
+            root = self._roots.get(kind)
+            # Registering a type reads the root types, also while the
+            # root type itself is being built.
+            if isinstance(root, str) and root in self:
+                root = self._roots[kind] = self[root]
+            return root
+
+        def set(self, value):
+            self._roots[kind] = value
+
+        return property(get, set)
+
+    query_type = _root("query")
+    mutation_type = _root("mutation")
+    subscription_type = _root("subscription")
+    del _root
+
+
+github_schema = _LazySchema({
+    'AbortQueuedMigrationsInput': 'inputs',
+    'AbortQueuedMigrationsPayload': 'objects',
+    'AcceptEnterpriseAdministratorInvitationInput': 'inputs',
+    'AcceptEnterpriseAdministratorInvitationPayload': 'objects',
+    'AcceptTopicSuggestionInput': 'inputs',
+    'AcceptTopicSuggestionPayload': 'objects',
+    'Actor': 'interfaces',
+    'ActorLocation': 'objects',
+    'ActorType': 'enums',
+    'AddAssigneesToAssignableInput': 'inputs',
+    'AddAssigneesToAssignablePayload': 'objects',
+    'AddCommentInput': 'inputs',
+    'AddCommentPayload': 'objects',
+    'AddDiscussionCommentInput': 'inputs',
+    'AddDiscussionCommentPayload': 'objects',
+    'AddDiscussionPollVoteInput': 'inputs',
+    'AddDiscussionPollVotePayload': 'objects',
+    'AddEnterpriseOrganizationMemberInput': 'inputs',
+    'AddEnterpriseOrganizationMemberPayload': 'objects',
+    'AddEnterpriseSupportEntitlementInput': 'inputs',
+    'AddEnterpriseSupportEntitlementPayload': 'objects',
+    'AddLabelsToLabelableInput': 'inputs',
+    'AddLabelsToLabelablePayload': 'objects',
+    'AddProjectCardInput': 'inputs',
+    'AddProjectCardPayload': 'objects',
+    'AddProjectColumnInput': 'inputs',
+    'AddProjectColumnPayload': 'objects',
+    'AddProjectV2DraftIssueInput': 'inputs',
+    'AddProjectV2DraftIssuePayload': 'objects',
+    'AddProjectV2ItemByIdInput': 'inputs',
+    'AddProjectV2ItemByIdPayload': 'objects',
+    'AddPullRequestReviewCommentInput': 'inputs',
+    'AddPullRequestReviewCommentPayload': 'objects',
+    'AddPullRequestReviewInput': 'inputs',
+    'AddPullRequestReviewPayload': 'objects',
+    'AddPullRequestReviewThreadInput': 'inputs',
+    'AddPullRequestReviewThreadPayload': 'objects',
+    'AddReactionInput': 'inputs',
+    'AddReactionPayload': 'objects',
+    'AddStarInput': 'inputs',
+    'AddStarPayload': 'objects',
+    'AddUpvoteInput': 'inputs',
+    'AddUpvotePayload': 'objects',
+    'AddVerifiableDomainInput': 'inputs',
+    'AddVerifiableDomainPayload': 'objects',
+    'AddedToMergeQueueEvent': 'objects',
+    'AddedToProjectEvent': 'objects',
+    'AnnouncementBanner': 'interfaces',
+    'App': 'objects',
+    'ApproveDeploymentsInput': 'inputs',
+    'ApproveDeploymentsPayload': 'objects',
+    'ApproveVerifiableDomainInput': 'inputs',
+    'ApproveVerifiableDomainPayload': 'objects',
+    'ArchiveProjectV2ItemInput': 'inputs',
+    'ArchiveProjectV2ItemPayload': 'objects',
+    'ArchiveRepositoryInput': 'inputs',
+    'ArchiveRepositoryPayload': 'objects',
+    'Assignable': 'interfaces',
+    'AssignedEvent': 'objects',
+    'Assignee': 'unions',
+    'AuditEntry': 'interfaces',
+    'AuditEntryActor': 'unions',
+    'AuditLogOrder': 'inputs',
+    'AuditLogOrderField': 'enums',
+    'AutoMergeDisabledEvent': 'objects',
+    'AutoMergeEnabledEvent': 'objects',
+    'AutoMergeRequest': 'objects',
+    'AutoRebaseEnabledEvent': 'objects',
+    'AutoSquashEnabledEvent': 'objects',
+    'AutomaticBaseChangeFailedEvent': 'objects',
+    'AutomaticBaseChangeSucceededEvent': 'objects',
+    'Base64String': 'scalars',
+    'BaseRefChangedEvent': 'objects',
+    'BaseRefDeletedEvent': 'objects',
+    'BaseRefForcePushedEvent': 'objects',
+    'BigInt': 'scalars',
+    'Blame': 'objects',
+    'BlameRange': 'objects',
+    'Blob': 'objects',
+    'Bot': 'objects',
+    'BranchActorAllowanceActor': 'unions',
+    'BranchNamePatternParameters': 'objects',
+    'BranchNamePatternParametersInput': 'inputs',
+    'BranchProtectionRule': 'objects',
+    'BranchProtectionRuleConflict': 'objects',
+    'BranchProtectionRuleConflictConnection': 'connections',
+    'BranchProtectionRuleConflictEdge': 'objects',
+    'BranchProtectionRuleConnection': 'connections',
+    'BranchProtectionRuleEdge': 'objects',
+    'BulkSponsorship': 'inputs',
+    'BypassActor': 'unions',
+    'BypassForcePushAllowance': 'objects',
+    'BypassForcePushAllowanceConnection': 'connections',
+    'BypassForcePushAllowanceEdge': 'objects',
+    'BypassPullRequestAllowance': 'objects',
+    'BypassPullRequestAllowanceConnection': 'connections',
+    'BypassPullRequestAllowanceEdge': 'objects',
+    'CVSS': 'objects',
+    'CWE': 'objects',
+    'CWEConnection': 'connections',
+    'CWEEdge': 'objects',
+    'CancelEnterpriseAdminInvitationInput': 'inputs',
+    'CancelEnterpriseAdminInvitationPayload': 'objects',
+    'CancelSponsorshipInput': 'inputs',
+    'CancelSponsorshipPayload': 'objects',
+    'ChangeUserStatusInput': 'inputs',
+    'ChangeUserStatusPayload': 'objects',
+    'CheckAnnotation': 'objects',
+    'CheckAnnotationConnection': 'connections',
+    'CheckAnnotationData': 'inputs',
+    'CheckAnnotationEdge': 'objects',
+    'CheckAnnotationLevel': 'enums',
+    'CheckAnnotationPosition': 'objects',
+    'CheckAnnotationRange': 'inputs',
+    'CheckAnnotationSpan': 'objects',
+    'CheckConclusionState': 'enums',
+    'CheckRun': 'objects',
+    'CheckRunAction': 'inputs',
+    'CheckRunConnection': 'connections',
+    'CheckRunEdge': 'objects',
+    'CheckRunFilter': 'inputs',
+    'CheckRunOutput': 'inputs',
+    'CheckRunOutputImage': 'inputs',
+    'CheckRunState': 'enums',
+    'CheckRunStateCount': 'objects',
+    'CheckRunType': 'enums',
+    'CheckStatusState': 'enums',
+    'CheckStep': 'objects',
+    'CheckStepConnection': 'connections',
+    'CheckStepEdge': 'objects',
+    'CheckSuite': 'objects',
+    'CheckSuiteAutoTriggerPreference': 'inputs',
+    'CheckSuiteConnection': 'connections',
+    'CheckSuiteEdge': 'objects',
+    'CheckSuiteFilter': 'inputs',
+    'Claimable': 'unions',
+    'ClearLabelsFromLabelableInput': 'inputs',
+    'ClearLabelsFromLabelablePayload': 'objects',
+    'ClearProjectV2ItemFieldValueInput': 'inputs',
+    'ClearProjectV2ItemFieldValuePayload': 'objects',
+    'CloneProjectInput': 'inputs',
+    'CloneProjectPayload': 'objects',
+    'CloneTemplateRepositoryInput': 'inputs',
+    'CloneTemplateRepositoryPayload': 'objects',
+    'Closable': 'interfaces',
+    'CloseDiscussionInput': 'inputs',
+    'CloseDiscussionPayload': 'objects',
+    'CloseIssueInput': 'inputs',
+    'CloseIssuePayload': 'objects',
+    'ClosePullRequestInput': 'inputs',
+    'ClosePullRequestPayload': 'objects',
+    'ClosedEvent': 'objects',
+    'Closer': 'unions',
+    'CodeOfConduct': 'objects',
+    'CollaboratorAffiliation': 'enums',
+    'Comment': 'interfaces',
+    'CommentAuthorAssociation': 'enums',
+    'CommentCannotUpdateReason': 'enums',
+    'CommentDeletedEvent': 'objects',
+    'Commit': 'objects',
+    'CommitAuthor': 'inputs',
+    'CommitAuthorEmailPatternParameters': 'objects',
+    'CommitAuthorEmailPatternParametersInput': 'inputs',
+    'CommitComment': 'objects',
+    'CommitCommentConnection': 'connections',
+    'CommitCommentEdge': 'objects',
+    'CommitCommentThread': 'objects',
+    'CommitConnection': 'connections',
+    'CommitContributionOrder': 'inputs',
+    'CommitContributionOrderField': 'enums',
+    'CommitContributionsByRepository': 'objects',
+    'CommitEdge': 'objects',
+    'CommitHistoryConnection': 'connections',
+    'CommitMessage': 'inputs',
+    'CommitMessagePatternParameters': 'objects',
+    'CommitMessagePatternParametersInput': 'inputs',
+    'CommittableBranch': 'inputs',
+    'CommitterEmailPatternParameters': 'objects',
+    'CommitterEmailPatternParametersInput': 'inputs',
+    'Comparison': 'objects',
+    'ComparisonCommitConnection': 'connections',
+    'ComparisonStatus': 'enums',
+    'ConnectedEvent': 'objects',
+    'Contribution': 'interfaces',
+    'ContributionCalendar': 'objects',
+    'ContributionCalendarDay': 'objects',
+    'ContributionCalendarMonth': 'objects',
+    'ContributionCalendarWeek': 'objects',
+    'ContributionLevel': 'enums',
+    'ContributionOrder': 'inputs',
+    'ContributionsCollection': 'objects',
+    'ConvertProjectCardNoteToIssueInput': 'inputs',
+    'ConvertProjectCardNoteToIssuePayload': 'objects',
+    'ConvertPullRequestToDraftInput': 'inputs',
+    'ConvertPullRequestToDraftPayload': 'objects',
+    'ConvertToDraftEvent': 'objects',
+    'ConvertedNoteToIssueEvent': 'objects',
+    'ConvertedToDiscussionEvent': 'objects',
+    'CopyProjectV2Input': 'inputs',
+    'CopyProjectV2Payload': 'objects',
+    'CreateAttributionInvitationInput': 'inputs',
+    'CreateAttributionInvitationPayload': 'objects',
+    'CreateBranchProtectionRuleInput': 'inputs',
+    'CreateBranchProtectionRulePayload': 'objects',
+    'CreateCheckRunInput': 'inputs',
+    'CreateCheckRunPayload': 'objects',
+    'CreateCheckSuiteInput': 'inputs',
+    'CreateCheckSuitePayload': 'objects',
+    'CreateCommitOnBranchInput': 'inputs',
+    'CreateCommitOnBranchPayload': 'objects',
+    'CreateDiscussionInput': 'inputs',
+    'CreateDiscussionPayload': 'objects',
+    'CreateEnterpriseOrganizationInput': 'inputs',
+    'CreateEnterpriseOrganizationPayload': 'objects',
+    'CreateEnvironmentInput': 'inputs',
+    'CreateEnvironmentPayload': 'objects',
+    'CreateIpAllowListEntryInput': 'inputs',
+    'CreateIpAllowListEntryPayload': 'objects',
+    'CreateIssueInput': 'inputs',
+    'CreateIssuePayload': 'objects',
+    'CreateLinkedBranchInput': 'inputs',
+    'CreateLinkedBranchPayload': 'objects',
+    'CreateMigrationSourceInput': 'inputs',
+    'CreateMigrationSourcePayload': 'objects',
+    'CreateProjectInput': 'inputs',
+    'CreateProjectPayload': 'objects',
+    'CreateProjectV2FieldInput': 'inputs',
+    'CreateProjectV2FieldPayload': 'objects',
+    'CreateProjectV2Input': 'inputs',
+    'CreateProjectV2Payload': 'objects',
+    'CreatePullRequestInput': 'inputs',
+    'CreatePullRequestPayload': 'objects',
+    'CreateRefInput': 'inputs',
+    'CreateRefPayload': 'objects',
+    'CreateRepositoryInput': 'inputs',
+    'CreateRepositoryPayload': 'objects',
+    'CreateRepositoryRulesetInput': 'inputs',
+    'CreateRepositoryRulesetPayload': 'objects',
+    'CreateSponsorsListingInput': 'inputs',
+    'CreateSponsorsListingPayload': 'objects',
+    'CreateSponsorsTierInput': 'inputs',
+    'CreateSponsorsTierPayload': 'objects',
+    'CreateSponsorshipInput': 'inputs',
+    'CreateSponsorshipPayload': 'objects',
+    'CreateSponsorshipsInput': 'inputs',
+    'CreateSponsorshipsPayload': 'objects',
+    'CreateTeamDiscussionCommentInput': 'inputs',
+    'CreateTeamDiscussionCommentPayload': 'objects',
+    'CreateTeamDiscussionInput': 'inputs',
+    'CreateTeamDiscussionPayload': 'objects',
+    'CreatedCommitContribution': 'objects',
+    'CreatedCommitContributionConnection': 'connections',
+    'CreatedCommitContributionEdge': 'objects',
+    'CreatedIssueContribution': 'objects',
+    'CreatedIssueContributionConnection': 'connections',
+    'CreatedIssueContributionEdge': 'objects',
+    'CreatedIssueOrRestrictedContribution': 'unions',
+    'CreatedPullRequestContribution': 'objects',
+    'CreatedPullRequestContributionConnection': 'connections',
+    'CreatedPullRequestContributionEdge': 'objects',
+    'CreatedPullRequestOrRestrictedContribution': 'unions',
+    'CreatedPullRequestReviewContribution': 'objects',
+    'CreatedPullRequestReviewContributionConnection': 'connections',
+    'CreatedPullRequestReviewContributionEdge': 'objects',
+    'CreatedRepositoryContribution': 'objects',
+    'CreatedRepositoryContributionConnection': 'connections',
+    'CreatedRepositoryContributionEdge': 'objects',
+    'CreatedRepositoryOrRestrictedContribution': 'unions',
+    'CrossReferencedEvent': 'objects',
+    'DeclineTopicSuggestionInput': 'inputs',
+    'DeclineTopicSuggestionPayload': 'objects',
+    'DefaultRepositoryPermissionField': 'enums',
+    'Deletable': 'interfaces',
+    'DeleteBranchProtectionRuleInput': 'inputs',
+    'DeleteBranchProtectionRulePayload': 'objects',
+    'DeleteDeploymentInput': 'inputs',
+    'DeleteDeploymentPayload': 'objects',
+    'DeleteDiscussionCommentInput': 'inputs',
+    'DeleteDiscussionCommentPayload': 'objects',
+    'DeleteDiscussionInput': 'inputs',
+    'DeleteDiscussionPayload': 'objects',
+    'DeleteEnvironmentInput': 'inputs',
+    'DeleteEnvironmentPayload': 'objects',
+    'DeleteIpAllowListEntryInput': 'inputs',
+    'DeleteIpAllowListEntryPayload': 'objects',
+    'DeleteIssueCommentInput': 'inputs',
+    'DeleteIssueCommentPayload': 'objects',
+    'DeleteIssueInput': 'inputs',
+    'DeleteIssuePayload': 'objects',
+    'DeleteLinkedBranchInput': 'inputs',
+    'DeleteLinkedBranchPayload': 'objects',
+    'DeleteProjectCardInput': 'inputs',
+    'DeleteProjectCardPayload': 'objects',
+    'DeleteProjectColumnInput': 'inputs',
+    'DeleteProjectColumnPayload': 'objects',
+    'DeleteProjectInput': 'inputs',
+    'DeleteProjectPayload': 'objects',
+    'DeleteProjectV2FieldInput': 'inputs',
+    'DeleteProjectV2FieldPayload': 'objects',
+    'DeleteProjectV2Input': 'inputs',
+    'DeleteProjectV2ItemInput': 'inputs',
+    'DeleteProjectV2ItemPayload': 'objects',
+    'DeleteProjectV2Payload': 'objects',
+    'DeleteProjectV2WorkflowInput': 'inputs',
+    'DeleteProjectV2WorkflowPayload': 'objects',
+    'DeletePullRequestReviewCommentInput': 'inputs',
+    'DeletePullRequestReviewCommentPayload': 'objects',
+    'DeletePullRequestReviewInput': 'inputs',
+    'DeletePullRequestReviewPayload': 'objects',
+    'DeleteRefInput': 'inputs',
+    'DeleteRefPayload': 'objects',
+    'DeleteRepositoryRulesetInput': 'inputs',
+    'DeleteRepositoryRulesetPayload': 'objects',
+    'DeleteTeamDiscussionCommentInput': 'inputs',
+    'DeleteTeamDiscussionCommentPayload': 'objects',
+    'DeleteTeamDiscussionInput': 'inputs',
+    'DeleteTeamDiscussionPayload': 'objects',
+    'DeleteVerifiableDomainInput': 'inputs',
+    'DeleteVerifiableDomainPayload': 'objects',
+    'DemilestonedEvent': 'objects',
+    'DependabotUpdate': 'objects',
+    'DependabotUpdateError': 'objects',
+    'DependencyGraphEcosystem': 'enums',
+    'DeployKey': 'objects',
+    'DeployKeyConnection': 'connections',
+    'DeployKeyEdge': 'objects',
+    'DeployedEvent': 'objects',
+    'Deployment': 'objects',
+    'DeploymentConnection': 'connections',
+    'DeploymentEdge': 'objects',
+    'DeploymentEnvironmentChangedEvent': 'objects',
+    'DeploymentOrder': 'inputs',
+    'DeploymentOrderField': 'enums',
+    'DeploymentProtectionRule': 'objects',
+    'DeploymentProtectionRuleConnection': 'connections',
+    'DeploymentProtectionRuleEdge': 'objects',
+    'DeploymentProtectionRuleType': 'enums',
+    'DeploymentRequest': 'objects',
+    'DeploymentRequestConnection': 'connections',
+    'DeploymentRequestEdge': 'objects',
+    'DeploymentReview': 'objects',
+    'DeploymentReviewConnection': 'connections',
+    'DeploymentReviewEdge': 'objects',
+    'DeploymentReviewState': 'enums',
+    'DeploymentReviewer': 'unions',
+    'DeploymentReviewerConnection': 'connections',
+    'DeploymentReviewerEdge': 'objects',
+    'DeploymentState': 'enums',
+    'DeploymentStatus': 'objects',
+    'DeploymentStatusConnection': 'connections',
+    'DeploymentStatusEdge': 'objects',
+    'DeploymentStatusState': 'enums',
+    'DequeuePullRequestInput': 'inputs',
+    'DequeuePullRequestPayload': 'objects',
+    'DiffSide': 'enums',
+    'DisablePullRequestAutoMergeInput': 'inputs',
+    'DisablePullRequestAutoMergePayload': 'objects',
+    'DisconnectedEvent': 'objects',
+    'Discussion': 'objects',
+    'DiscussionCategory': 'objects',
+    'DiscussionCategoryConnection': 'connections',
+    'DiscussionCategoryEdge': 'objects',
+    'DiscussionCloseReason': 'enums',
+    'DiscussionComment': 'objects',
+    'DiscussionCommentConnection': 'connections',
+    'DiscussionCommentEdge': 'objects',
+    'DiscussionConnection': 'connections',
+    'DiscussionEdge': 'objects',
+    'DiscussionOrder': 'inputs',
+    'DiscussionOrderField': 'enums',
+    'DiscussionPoll': 'objects',
+    'DiscussionPollOption': 'objects',
+    'DiscussionPollOptionConnection': 'connections',
+    'DiscussionPollOptionEdge': 'objects',
+    'DiscussionPollOptionOrder': 'inputs',
+    'DiscussionPollOptionOrderField': 'enums',
+    'DiscussionState': 'enums',
+    'DiscussionStateReason': 'enums',
+    'DismissPullRequestReviewInput': 'inputs',
+    'DismissPullRequestReviewPayload': 'objects',
+    'DismissReason': 'enums',
+    'DismissRepositoryVulnerabilityAlertInput': 'inputs',
+    'DismissRepositoryVulnerabilityAlertPayload': 'objects',
+    'DraftIssue': 'objects',
+    'DraftPullRequestReviewComment': 'inputs',
+    'DraftPullRequestReviewThread': 'inputs',
+    'EnablePullRequestAutoMergeInput': 'inputs',
+    'EnablePullRequestAutoMergePayload': 'objects',
+    'EnqueuePullRequestInput': 'inputs',
+    'EnqueuePullRequestPayload': 'objects',
+    'Enterprise': 'objects',
+    'EnterpriseAdministratorConnection': 'connections',
+    'EnterpriseAdministratorEdge': 'objects',
+    'EnterpriseAdministratorInvitation': 'objects',
+    'EnterpriseAdministratorInvitationConnection': 'connections',
+    'EnterpriseAdministratorInvitationEdge': 'objects',
+    'EnterpriseAdministratorInvitationOrder': 'inputs',
+    'EnterpriseAdministratorInvitationOrderField': 'enums',
+    'EnterpriseAdministratorRole': 'enums',
+    'EnterpriseAllowPrivateRepositoryForkingPolicyValue': 'enums',
+    'EnterpriseAuditEntryData': 'interfaces',
+    'EnterpriseBillingInfo': 'objects',
+    'EnterpriseDefaultRepositoryPermissionSettingValue': 'enums',
+    'EnterpriseEnabledDisabledSettingValue': 'enums',
+    'EnterpriseEnabledSettingValue': 'enums',
+    'EnterpriseFailedInvitationConnection': 'connections',
+    'EnterpriseFailedInvitationEdge': 'objects',
+    'EnterpriseIdentityProvider': 'objects',
+    'EnterpriseMember': 'unions',
+    'EnterpriseMemberConnection': 'connections',
+    'EnterpriseMemberEdge': 'objects',
+    'EnterpriseMemberOrder': 'inputs',
+    'EnterpriseMemberOrderField': 'enums',
+    'EnterpriseMembersCanCreateRepositoriesSettingValue': 'enums',
+    'EnterpriseMembersCanMakePurchasesSettingValue': 'enums',
+    'EnterpriseOrganizationMembershipConnection': 'connections',
+    'EnterpriseOrganizationMembershipEdge': 'objects',
+    'EnterpriseOutsideCollaboratorConnection': 'connections',
+    'EnterpriseOutsideCollaboratorEdge': 'objects',
+    'EnterpriseOwnerInfo': 'objects',
+    'EnterprisePendingMemberInvitationConnection': 'connections',
+    'EnterprisePendingMemberInvitationEdge': 'objects',
+    'EnterpriseRepositoryInfo': 'objects',
+    'EnterpriseRepositoryInfoConnection': 'connections',
+    'EnterpriseRepositoryInfoEdge': 'objects',
+    'EnterpriseServerInstallation': 'objects',
+    'EnterpriseServerInstallationConnection': 'connections',
+    'EnterpriseServerInstallationEdge': 'objects',
+    'EnterpriseServerInstallationMembershipConnection': 'connections',
+    'EnterpriseServerInstallationMembershipEdge': 'objects',
+    'EnterpriseServerInstallationOrder': 'inputs',
+    'EnterpriseServerInstallationOrderField': 'enums',
+    'EnterpriseServerUserAccount': 'objects',
+    'EnterpriseServerUserAccountConnection': 'connections',
+    'EnterpriseServerUserAccountEdge': 'objects',
+    'EnterpriseServerUserAccountEmail': 'objects',
+    'EnterpriseServerUserAccountEmailConnection': 'connections',
+    'EnterpriseServerUserAccountEmailEdge': 'objects',
+    'EnterpriseServerUserAccountEmailOrder': 'inputs',
+    'EnterpriseServerUserAccountEmailOrderField': 'enums',
+    'EnterpriseServerUserAccountOrder': 'inputs',
+    'EnterpriseServerUserAccountOrderField': 'enums',
+    'EnterpriseServerUserAccountsUpload': 'objects',
+    'EnterpriseServerUserAccountsUploadConnection': 'connections',
+    'EnterpriseServerUserAccountsUploadEdge': 'objects',
+    'EnterpriseServerUserAccountsUploadOrder': 'inputs',
+    'EnterpriseServerUserAccountsUploadOrderField': 'enums',
+    'EnterpriseServerUserAccountsUploadSyncState': 'enums',
+    'EnterpriseUserAccount': 'objects',
+    'EnterpriseUserAccountMembershipRole': 'enums',
+    'EnterpriseUserDeployment': 'enums',
+    'Environment': 'objects',
+    'EnvironmentConnection': 'connections',
+    'EnvironmentEdge': 'objects',
+    'ExternalIdentity': 'objects',
+    'ExternalIdentityAttribute': 'objects',
+    'ExternalIdentityConnection': 'connections',
+    'ExternalIdentityEdge': 'objects',
+    'ExternalIdentitySamlAttributes': 'objects',
+    'ExternalIdentityScimAttributes': 'objects',
+    'FileAddition': 'inputs',
+    'FileChanges': 'inputs',
+    'FileDeletion': 'inputs',
+    'FileViewedState': 'enums',
+    'FollowOrganizationInput': 'inputs',
+    'FollowOrganizationPayload': 'objects',
+    'FollowUserInput': 'inputs',
+    'FollowUserPayload': 'objects',
+    'FollowerConnection': 'connections',
+    'FollowingConnection': 'connections',
+    'FundingLink': 'objects',
+    'FundingPlatform': 'enums',
+    'GenericHovercardContext': 'objects',
+    'Gist': 'objects',
+    'GistComment': 'objects',
+    'GistCommentConnection': 'connections',
+    'GistCommentEdge': 'objects',
+    'GistConnection': 'connections',
+    'GistEdge': 'objects',
+    'GistFile': 'objects',
+    'GistOrder': 'inputs',
+    'GistOrderField': 'enums',
+    'GistPrivacy': 'enums',
+    'GitActor': 'objects',
+    'GitActorConnection': 'connections',
+    'GitActorEdge': 'objects',
+    'GitHubMetadata': 'objects',
+    'GitObject': 'interfaces',
+    'GitObjectID': 'scalars',
+    'GitSSHRemote': 'scalars',
+    'GitSignature': 'interfaces',
+    'GitSignatureState': 'enums',
+    'GitTimestamp': 'scalars',
+    'GpgSignature': 'objects',
+    'GrantEnterpriseOrganizationsMigratorRoleInput': 'inputs',
+    'GrantEnterpriseOrganizationsMigratorRolePayload': 'objects',
+    'GrantMigratorRoleInput': 'inputs',
+    'GrantMigratorRolePayload': 'objects',
+    'HTML': 'scalars',
+    'HeadRefDeletedEvent': 'objects',
+    'HeadRefForcePushedEvent': 'objects',
+    'HeadRefRestoredEvent': 'objects',
+    'Hovercard': 'objects',
+    'HovercardContext': 'interfaces',
+    'IdentityProviderConfigurationState': 'enums',
+    'InviteEnterpriseAdminInput': 'inputs',
+    'InviteEnterpriseAdminPayload': 'objects',
+    'IpAllowListEnabledSettingValue': 'enums',
+    'IpAllowListEntry': 'objects',
+    'IpAllowListEntryConnection': 'connections',
+    'IpAllowListEntryEdge': 'objects',
+    'IpAllowListEntryOrder': 'inputs',
+    'IpAllowListEntryOrderField': 'enums',
+    'IpAllowListForInstalledAppsEnabledSettingValue': 'enums',
+    'IpAllowListOwner': 'unions',
+    'Issue': 'objects',
+    'IssueClosedStateReason': 'enums',
+    'IssueComment': 'objects',
+    'IssueCommentConnection': 'connections',
+    'IssueCommentEdge': 'objects',
+    'IssueCommentOrder': 'inputs',
+    'IssueCommentOrderField': 'enums',
+    'IssueConnection': 'connections',
+    'IssueContributionsByRepository': 'objects',
+    'IssueEdge': 'objects',
+    'IssueFilters': 'inputs',
+    'IssueOrPullRequest': 'unions',
+    'IssueOrder': 'inputs',
+    'IssueOrderField': 'enums',
+    'IssueState': 'enums',
+    'IssueStateReason': 'enums',
+    'IssueTemplate': 'objects',
+    'IssueTimelineConnection': 'connections',
+    'IssueTimelineItem': 'unions',
+    'IssueTimelineItemEdge': 'objects',
+    'IssueTimelineItems': 'unions',
+    'IssueTimelineItemsConnection': 'connections',
+    'IssueTimelineItemsEdge': 'objects',
+    'IssueTimelineItemsItemType': 'enums',
+    'JoinedGitHubContribution': 'objects',
+    'Label': 'objects',
+    'LabelConnection': 'connections',
+    'LabelEdge': 'objects',
+    'LabelOrder': 'inputs',
+    'LabelOrderField': 'enums',
+    'Labelable': 'interfaces',
+    'LabeledEvent': 'objects',
+    'Language': 'objects',
+    'LanguageConnection': 'connections',
+    'LanguageEdge': 'objects',
+    'LanguageOrder': 'inputs',
+    'LanguageOrderField': 'enums',
+    'License': 'objects',
+    'LicenseRule': 'objects',
+    'LinkProjectV2ToRepositoryInput': 'inputs',
+    'LinkProjectV2ToRepositoryPayload': 'objects',
+    'LinkProjectV2ToTeamInput': 'inputs',
+    'LinkProjectV2ToTeamPayload': 'objects',
+    'LinkRepositoryToProjectInput': 'inputs',
+    'LinkRepositoryToProjectPayload': 'objects',
+    'LinkedBranch': 'objects',
+    'LinkedBranchConnection': 'connections',
+    'LinkedBranchEdge': 'objects',
+    'LockLockableInput': 'inputs',
+    'LockLockablePayload': 'objects',
+    'LockReason': 'enums',
+    'Lockable': 'interfaces',
+    'LockedEvent': 'objects',
+    'Mannequin': 'objects',
+    'MannequinConnection': 'connections',
+    'MannequinEdge': 'objects',
+    'MannequinOrder': 'inputs',
+    'MannequinOrderField': 'enums',
+    'MarkDiscussionCommentAsAnswerInput': 'inputs',
+    'MarkDiscussionCommentAsAnswerPayload': 'objects',
+    'MarkFileAsViewedInput': 'inputs',
+    'MarkFileAsViewedPayload': 'objects',
+    'MarkProjectV2AsTemplateInput': 'inputs',
+    'MarkProjectV2AsTemplatePayload': 'objects',
+    'MarkPullRequestReadyForReviewInput': 'inputs',
+    'MarkPullRequestReadyForReviewPayload': 'objects',
+    'MarkedAsDuplicateEvent': 'objects',
+    'MarketplaceCategory': 'objects',
+    'MarketplaceListing': 'objects',
+    'MarketplaceListingConnection': 'connections',
+    'MarketplaceListingEdge': 'objects',
+    'MemberStatusable': 'interfaces',
+    'MembersCanDeleteReposClearAuditEntry': 'objects',
+    'MembersCanDeleteReposDisableAuditEntry': 'objects',
+    'MembersCanDeleteReposEnableAuditEntry': 'objects',
+    'MentionedEvent': 'objects',
+    'MergeBranchInput': 'inputs',
+    'MergeBranchPayload': 'objects',
+    'MergeCommitMessage': 'enums',
+    'MergeCommitTitle': 'enums',
+    'MergePullRequestInput': 'inputs',
+    'MergePullRequestPayload': 'objects',
+    'MergeQueue': 'objects',
+    'MergeQueueConfiguration': 'objects',
+    'MergeQueueEntry': 'objects',
+    'MergeQueueEntryConnection': 'connections',
+    'MergeQueueEntryEdge': 'objects',
+    'MergeQueueEntryState': 'enums',
+    'MergeQueueMergingStrategy': 'enums',
+    'MergeableState': 'enums',
+    'MergedEvent': 'objects',
+    'Migration': 'interfaces',
+    'MigrationSource': 'objects',
+    'MigrationSourceType': 'enums',
+    'MigrationState': 'enums',
+    'Milestone': 'objects',
+    'MilestoneConnection': 'connections',
+    'MilestoneEdge': 'objects',
+    'MilestoneItem': 'unions',
+    'MilestoneOrder': 'inputs',
+    'MilestoneOrderField': 'enums',
+    'MilestoneState': 'enums',
+    'MilestonedEvent': 'objects',
+    'Minimizable': 'interfaces',
+    'MinimizeCommentInput': 'inputs',
+    'MinimizeCommentPayload': 'objects',
+    'MoveProjectCardInput': 'inputs',
+    'MoveProjectCardPayload': 'objects',
+    'MoveProjectColumnInput': 'inputs',
+    'MoveProjectColumnPayload': 'objects',
+    'MovedColumnsInProjectEvent': 'objects',
+    'Mutation': 'objects',
+    'Node': 'interfaces',
+    'NotificationRestrictionSettingValue': 'enums',
+    'OIDCProvider': 'objects',
+    'OIDCProviderType': 'enums',
+    'OauthApplicationAuditEntryData': 'interfaces',
+    'OauthApplicationCreateAuditEntry': 'objects',
+    'OauthApplicationCreateAuditEntryState': 'enums',
+    'OperationType': 'enums',
+    'OrderDirection': 'enums',
+    'OrgAddBillingManagerAuditEntry': 'objects',
+    'OrgAddMemberAuditEntry': 'objects',
+    'OrgAddMemberAuditEntryPermission': 'enums',
+    'OrgBlockUserAuditEntry': 'objects',
+    'OrgConfigDisableCollaboratorsOnlyAuditEntry': 'objects',
+    'OrgConfigEnableCollaboratorsOnlyAuditEntry': 'objects',
+    'OrgCreateAuditEntry': 'objects',
+    'OrgCreateAuditEntryBillingPlan': 'enums',
+    'OrgDisableOauthAppRestrictionsAuditEntry': 'objects',
+    'OrgDisableSamlAuditEntry': 'objects',
+    'OrgDisableTwoFactorRequirementAuditEntry': 'objects',
+    'OrgEnableOauthAppRestrictionsAuditEntry': 'objects',
+    'OrgEnableSamlAuditEntry': 'objects',
+    'OrgEnableTwoFactorRequirementAuditEntry': 'objects',
+    'OrgEnterpriseOwnerOrder': 'inputs',
+    'OrgEnterpriseOwnerOrderField': 'enums',
+    'OrgInviteMemberAuditEntry': 'objects',
+    'OrgInviteToBusinessAuditEntry': 'objects',
+    'OrgOauthAppAccessApprovedAuditEntry': 'objects',
+    'OrgOauthAppAccessDeniedAuditEntry': 'objects',
+    'OrgOauthAppAccessRequestedAuditEntry': 'objects',
+    'OrgRemoveBillingManagerAuditEntry': 'objects',
+    'OrgRemoveBillingManagerAuditEntryReason': 'enums',
+    'OrgRemoveMemberAuditEntry': 'objects',
+    'OrgRemoveMemberAuditEntryMembershipType': 'enums',
+    'OrgRemoveMemberAuditEntryReason': 'enums',
+    'OrgRemoveOutsideCollaboratorAuditEntry': 'objects',
+    'OrgRemoveOutsideCollaboratorAuditEntryMembershipType': 'enums',
+    'OrgRemoveOutsideCollaboratorAuditEntryReason': 'enums',
+    'OrgRestoreMemberAuditEntry': 'objects',
+    'OrgRestoreMemberAuditEntryMembership': 'unions',
+    'OrgRestoreMemberMembershipOrganizationAuditEntryData': 'objects',
+    'OrgRestoreMemberMembershipRepositoryAuditEntryData': 'objects',
+    'OrgRestoreMemberMembershipTeamAuditEntryData': 'objects',
+    'OrgUnblockUserAuditEntry': 'objects',
+    'OrgUpdateDefaultRepositoryPermissionAuditEntry': 'objects',
+    'OrgUpdateDefaultRepositoryPermissionAuditEntryPermission': 'enums',
+    'OrgUpdateMemberAuditEntry': 'objects',
+    'OrgUpdateMemberAuditEntryPermission': 'enums',
+    'OrgUpdateMemberRepositoryCreationPermissionAuditEntry': 'objects',
+    'OrgUpdateMemberRepositoryCreationPermissionAuditEntryVisibility': 'enums',
+    'OrgUpdateMemberRepositoryInvitationPermissionAuditEntry': 'objects',
+    'Organization': 'objects',
+    'OrganizationAuditEntry': 'unions',
+    'OrganizationAuditEntryConnection': 'connections',
+    'OrganizationAuditEntryData': 'interfaces',
+    'OrganizationAuditEntryEdge': 'objects',
+    'OrganizationConnection': 'connections',
+    'OrganizationEdge': 'objects',
+    'OrganizationEnterpriseOwnerConnection': 'connections',
+    'OrganizationEnterpriseOwnerEdge': 'objects',
+    'OrganizationIdentityProvider': 'objects',
+    'OrganizationInvitation': 'objects',
+    'OrganizationInvitationConnection': 'connections',
+    'OrganizationInvitationEdge': 'objects',
+    'OrganizationInvitationRole': 'enums',
+    'OrganizationInvitationSource': 'enums',
+    'OrganizationInvitationType': 'enums',
+    'OrganizationMemberConnection': 'connections',
+    'OrganizationMemberEdge': 'objects',
+    'OrganizationMemberRole': 'enums',
+    'OrganizationMembersCanCreateRepositoriesSettingValue': 'enums',
+    'OrganizationMigration': 'objects',
+    'OrganizationMigrationState': 'enums',
+    'OrganizationOrUser': 'unions',
+    'OrganizationOrder': 'inputs',
+    'OrganizationOrderField': 'enums',
+    'OrganizationTeamsHovercardContext': 'objects',
+    'OrganizationsHovercardContext': 'objects',
+    'Package': 'objects',
+    'PackageConnection': 'connections',
+    'PackageEdge': 'objects',
+    'PackageFile': 'objects',
+    'PackageFileConnection': 'connections',
+    'PackageFileEdge': 'objects',
+    'PackageFileOrder': 'inputs',
+    'PackageFileOrderField': 'enums',
+    'PackageOrder': 'inputs',
+    'PackageOrderField': 'enums',
+    'PackageOwner': 'interfaces',
+    'PackageStatistics': 'objects',
+    'PackageTag': 'objects',
+    'PackageType': 'enums',
+    'PackageVersion': 'objects',
+    'PackageVersionConnection': 'connections',
+    'PackageVersionEdge': 'objects',
+    'PackageVersionOrder': 'inputs',
+    'PackageVersionOrderField': 'enums',
+    'PackageVersionStatistics': 'objects',
+    'PageInfo': 'objects',
+    'PatchStatus': 'enums',
+    'PermissionGranter': 'unions',
+    'PermissionSource': 'objects',
+    'PinIssueInput': 'inputs',
+    'PinIssuePayload': 'objects',
+    'PinnableItem': 'unions',
+    'PinnableItemConnection': 'connections',
+    'PinnableItemEdge': 'objects',
+    'PinnableItemType': 'enums',
+    'PinnedDiscussion': 'objects',
+    'PinnedDiscussionConnection': 'connections',
+    'PinnedDiscussionEdge': 'objects',
+    'PinnedDiscussionGradient': 'enums',
+    'PinnedDiscussionPattern': 'enums',
+    'PinnedEvent': 'objects',
+    'PinnedIssue': 'objects',
+    'PinnedIssueConnection': 'connections',
+    'PinnedIssueEdge': 'objects',
+    'PreciseDateTime': 'scalars',
+    'PrivateRepositoryForkingDisableAuditEntry': 'objects',
+    'PrivateRepositoryForkingEnableAuditEntry': 'objects',
+    'ProfileItemShowcase': 'objects',
+    'ProfileOwner': 'interfaces',
+    'Project': 'objects',
+    'ProjectCard': 'objects',
+    'ProjectCardArchivedState': 'enums',
+    'ProjectCardConnection': 'connections',
+    'ProjectCardEdge': 'objects',
+    'ProjectCardItem': 'unions',
+    'ProjectCardState': 'enums',
+    'ProjectColumn': 'objects',
+    'ProjectColumnConnection': 'connections',
+    'ProjectColumnEdge': 'objects',
+    'ProjectColumnPurpose': 'enums',
+    'ProjectConnection': 'connections',
+    'ProjectEdge': 'objects',
+    'ProjectOrder': 'inputs',
+    'ProjectOrderField': 'enums',
+    'ProjectOwner': 'interfaces',
+    'ProjectProgress': 'objects',
+    'ProjectState': 'enums',
+    'ProjectTemplate': 'enums',
+    'ProjectV2': 'objects',
+    'ProjectV2Actor': 'unions',
+    'ProjectV2ActorConnection': 'connections',
+    'ProjectV2ActorEdge': 'objects',
+    'ProjectV2Collaborator': 'inputs',
+    'ProjectV2Connection': 'connections',
+    'ProjectV2CustomFieldType': 'enums',
+    'ProjectV2Edge': 'objects',
+    'ProjectV2Field': 'objects',
+    'ProjectV2FieldCommon': 'interfaces',
+    'ProjectV2FieldConfiguration': 'unions',
+    'ProjectV2FieldConfigurationConnection': 'connections',
+    'ProjectV2FieldConfigurationEdge': 'objects',
+    'ProjectV2FieldConnection': 'connections',
+    'ProjectV2FieldEdge': 'objects',
+    'ProjectV2FieldOrder': 'inputs',
+    'ProjectV2FieldOrderField': 'enums',
+    'ProjectV2FieldType': 'enums',
+    'ProjectV2FieldValue': 'inputs',
+    'ProjectV2Filters': 'inputs',
+    'ProjectV2Item': 'objects',
+    'ProjectV2ItemConnection': 'connections',
+    'ProjectV2ItemContent': 'unions',
+    'ProjectV2ItemEdge': 'objects',
+    'ProjectV2ItemFieldDateValue': 'objects',
+    'ProjectV2ItemFieldIterationValue': 'objects',
+    'ProjectV2ItemFieldLabelValue': 'objects',
+    'ProjectV2ItemFieldMilestoneValue': 'objects',
+    'ProjectV2ItemFieldNumberValue': 'objects',
+    'ProjectV2ItemFieldPullRequestValue': 'objects',
+    'ProjectV2ItemFieldRepositoryValue': 'objects',
+    'ProjectV2ItemFieldReviewerValue': 'objects',
+    'ProjectV2ItemFieldSingleSelectValue': 'objects',
+    'ProjectV2ItemFieldTextValue': 'objects',
+    'ProjectV2ItemFieldUserValue': 'objects',
+    'ProjectV2ItemFieldValue': 'unions',
+    'ProjectV2ItemFieldValueCommon': 'interfaces',
+    'ProjectV2ItemFieldValueConnection': 'connections',
+    'ProjectV2ItemFieldValueEdge': 'objects',
+    'ProjectV2ItemFieldValueOrder': 'inputs',
+    'ProjectV2ItemFieldValueOrderField': 'enums',
+    'ProjectV2ItemOrder': 'inputs',
+    'ProjectV2ItemOrderField': 'enums',
+    'ProjectV2ItemType': 'enums',
+    'ProjectV2IterationField': 'objects',
+    'ProjectV2IterationFieldConfiguration': 'objects',
+    'ProjectV2IterationFieldIteration': 'objects',
+    'ProjectV2Order': 'inputs',
+    'ProjectV2OrderField': 'enums',
+    'ProjectV2Owner': 'interfaces',
+    'ProjectV2Recent': 'interfaces',
+    'ProjectV2Roles': 'enums',
+    'ProjectV2SingleSelectField': 'objects',
+    'ProjectV2SingleSelectFieldOption': 'objects',
+    'ProjectV2SingleSelectFieldOptionColor': 'enums',
+    'ProjectV2SingleSelectFieldOptionInput': 'inputs',
+    'ProjectV2SortBy': 'objects',
+    'ProjectV2SortByConnection': 'connections',
+    'ProjectV2SortByEdge': 'objects',
+    'ProjectV2SortByField': 'objects',
+    'ProjectV2SortByFieldConnection': 'connections',
+    'ProjectV2SortByFieldEdge': 'objects',
+    'ProjectV2State': 'enums',
+    'ProjectV2View': 'objects',
+    'ProjectV2ViewConnection': 'connections',
+    'ProjectV2ViewEdge': 'objects',
+    'ProjectV2ViewLayout': 'enums',
+    'ProjectV2ViewOrder': 'inputs',
+    'ProjectV2ViewOrderField': 'enums',
+    'ProjectV2Workflow': 'objects',
+    'ProjectV2WorkflowConnection': 'connections',
+    'ProjectV2WorkflowEdge': 'objects',
+    'ProjectV2WorkflowOrder': 'inputs',
+    'ProjectV2WorkflowsOrderField': 'enums',
+    'PublicKey': 'objects',
+    'PublicKeyConnection': 'connections',
+    'PublicKeyEdge': 'objects',
+    'PublishSponsorsTierInput': 'inputs',
+    'PublishSponsorsTierPayload': 'objects',
+    'PullRequest': 'objects',
+    'PullRequestChangedFile': 'objects',
+    'PullRequestChangedFileConnection': 'connections',
+    'PullRequestChangedFileEdge': 'objects',
+    'PullRequestCommit': 'objects',
+    'PullRequestCommitCommentThread': 'objects',
+    'PullRequestCommitConnection': 'connections',
+    'PullRequestCommitEdge': 'objects',
+    'PullRequestConnection': 'connections',
+    'PullRequestContributionsByRepository': 'objects',
+    'PullRequestEdge': 'objects',
+    'PullRequestMergeMethod': 'enums',
+    'PullRequestOrder': 'inputs',
+    'PullRequestOrderField': 'enums',
+    'PullRequestParameters': 'objects',
+    'PullRequestParametersInput': 'inputs',
+    'PullRequestReview': 'objects',
+    'PullRequestReviewComment': 'objects',
+    'PullRequestReviewCommentConnection': 'connections',
+    'PullRequestReviewCommentEdge': 'objects',
+    'PullRequestReviewCommentState': 'enums',
+    'PullRequestReviewConnection': 'connections',
+    'PullRequestReviewContributionsByRepository': 'objects',
+    'PullRequestReviewDecision': 'enums',
+    'PullRequestReviewEdge': 'objects',
+    'PullRequestReviewEvent': 'enums',
+    'PullRequestReviewState': 'enums',
+    'PullRequestReviewThread': 'objects',
+    'PullRequestReviewThreadConnection': 'connections',
+    'PullRequestReviewThreadEdge': 'objects',
+    'PullRequestReviewThreadSubjectType': 'enums',
+    'PullRequestRevisionMarker': 'objects',
+    'PullRequestState': 'enums',
+    'PullRequestTemplate': 'objects',
+    'PullRequestThread': 'objects',
+    'PullRequestTimelineConnection': 'connections',
+    'PullRequestTimelineItem': 'unions',
+    'PullRequestTimelineItemEdge': 'objects',
+    'PullRequestTimelineItems': 'unions',
+    'PullRequestTimelineItemsConnection': 'connections',
+    'PullRequestTimelineItemsEdge': 'objects',
+    'PullRequestTimelineItemsItemType': 'enums',
+    'PullRequestUpdateState': 'enums',
+    'Push': 'objects',
+    'PushAllowance': 'objects',
+    'PushAllowanceActor': 'unions',
+    'PushAllowanceConnection': 'connections',
+    'PushAllowanceEdge': 'objects',
+    'Query': 'objects',
+    'RateLimit': 'objects',
+    'Reactable': 'interfaces',
+    'ReactingUserConnection': 'connections',
+    'ReactingUserEdge': 'objects',
+    'Reaction': 'objects',
+    'ReactionConnection': 'connections',
+    'ReactionContent': 'enums',
+    'ReactionEdge': 'objects',
+    'ReactionGroup': 'objects',
+    'ReactionOrder': 'inputs',
+    'ReactionOrderField': 'enums',
+    'Reactor': 'unions',
+    'ReactorConnection': 'connections',
+    'ReactorEdge': 'objects',
+    'ReadyForReviewEvent': 'objects',
+    'Ref': 'objects',
+    'RefConnection': 'connections',
+    'RefEdge': 'objects',
+    'RefNameConditionTarget': 'objects',
+    'RefNameConditionTargetInput': 'inputs',
+    'RefOrder': 'inputs',
+    'RefOrderField': 'enums',
+    'RefUpdateRule': 'objects',
+    'ReferencedEvent': 'objects',
+    'ReferencedSubject': 'unions',
+    'RegenerateEnterpriseIdentityProviderRecoveryCodesInput': 'inputs',
+    'RegenerateEnterpriseIdentityProviderRecoveryCodesPayload': 'objects',
+    'RegenerateVerifiableDomainTokenInput': 'inputs',
+    'RegenerateVerifiableDomainTokenPayload': 'objects',
+    'RejectDeploymentsInput': 'inputs',
+    'RejectDeploymentsPayload': 'objects',
+    'Release': 'objects',
+    'ReleaseAsset': 'objects',
+    'ReleaseAssetConnection': 'connections',
+    'ReleaseAssetEdge': 'objects',
+    'ReleaseConnection': 'connections',
+    'ReleaseEdge': 'objects',
+    'ReleaseOrder': 'inputs',
+    'ReleaseOrderField': 'enums',
+    'RemoveAssigneesFromAssignableInput': 'inputs',
+    'RemoveAssigneesFromAssignablePayload': 'objects',
+    'RemoveEnterpriseAdminInput': 'inputs',
+    'RemoveEnterpriseAdminPayload': 'objects',
+    'RemoveEnterpriseIdentityProviderInput': 'inputs',
+    'RemoveEnterpriseIdentityProviderPayload': 'objects',
+    'RemoveEnterpriseMemberInput': 'inputs',
+    'RemoveEnterpriseMemberPayload': 'objects',
+    'RemoveEnterpriseOrganizationInput': 'inputs',
+    'RemoveEnterpriseOrganizationPayload': 'objects',
+    'RemoveEnterpriseSupportEntitlementInput': 'inputs',
+    'RemoveEnterpriseSupportEntitlementPayload': 'objects',
+    'RemoveLabelsFromLabelableInput': 'inputs',
+    'RemoveLabelsFromLabelablePayload': 'objects',
+    'RemoveOutsideCollaboratorInput': 'inputs',
+    'RemoveOutsideCollaboratorPayload': 'objects',
+    'RemoveReactionInput': 'inputs',
+    'RemoveReactionPayload': 'objects',
+    'RemoveStarInput': 'inputs',
+    'RemoveStarPayload': 'objects',
+    'RemoveUpvoteInput': 'inputs',
+    'RemoveUpvotePayload': 'objects',
+    'RemovedFromMergeQueueEvent': 'objects',
+    'RemovedFromProjectEvent': 'objects',
+    'RenamedTitleEvent': 'objects',
+    'RenamedTitleSubject': 'unions',
+    'ReopenDiscussionInput': 'inputs',
+    'ReopenDiscussionPayload': 'objects',
+    'ReopenIssueInput': 'inputs',
+    'ReopenIssuePayload': 'objects',
+    'ReopenPullRequestInput': 'inputs',
+    'ReopenPullRequestPayload': 'objects',
+    'ReopenedEvent': 'objects',
+    'RepoAccessAuditEntry': 'objects',
+    'RepoAccessAuditEntryVisibility': 'enums',
+    'RepoAddMemberAuditEntry': 'objects',
+    'RepoAddMemberAuditEntryVisibility': 'enums',
+    'RepoAddTopicAuditEntry': 'objects',
+    'RepoArchivedAuditEntry': 'objects',
+    'RepoArchivedAuditEntryVisibility': 'enums',
+    'RepoChangeMergeSettingAuditEntry': 'objects',
+    'RepoChangeMergeSettingAuditEntryMergeType': 'enums',
+    'RepoConfigDisableAnonymousGitAccessAuditEntry': 'objects',
+    'RepoConfigDisableCollaboratorsOnlyAuditEntry': 'objects',
+    'RepoConfigDisableContributorsOnlyAuditEntry': 'objects',
+    'RepoConfigDisableSockpuppetDisallowedAuditEntry': 'objects',
+    'RepoConfigEnableAnonymousGitAccessAuditEntry': 'objects',
+    'RepoConfigEnableCollaboratorsOnlyAuditEntry': 'objects',
+    'RepoConfigEnableContributorsOnlyAuditEntry': 'objects',
+    'RepoConfigEnableSockpuppetDisallowedAuditEntry': 'objects',
+    'RepoConfigLockAnonymousGitAccessAuditEntry': 'objects',
+    'RepoConfigUnlockAnonymousGitAccessAuditEntry': 'objects',
+    'RepoCreateAuditEntry': 'objects',
+    'RepoCreateAuditEntryVisibility': 'enums',
+    'RepoDestroyAuditEntry': 'objects',
+    'RepoDestroyAuditEntryVisibility': 'enums',
+    'RepoRemoveMemberAuditEntry': 'objects',
+    'RepoRemoveMemberAuditEntryVisibility': 'enums',
+    'RepoRemoveTopicAuditEntry': 'objects',
+    'ReportedContentClassifiers': 'enums',
+    'Repository': 'objects',
+    'RepositoryAffiliation': 'enums',
+    'RepositoryAuditEntryData': 'interfaces',
+    'RepositoryCodeowners': 'objects',
+    'RepositoryCodeownersError': 'objects',
+    'RepositoryCollaboratorConnection': 'connections',
+    'RepositoryCollaboratorEdge': 'objects',
+    'RepositoryConnection': 'connections',
+    'RepositoryContactLink': 'objects',
+    'RepositoryContributionType': 'enums',
+    'RepositoryDiscussionAuthor': 'interfaces',
+    'RepositoryDiscussionCommentAuthor': 'interfaces',
+    'RepositoryEdge': 'objects',
+    'RepositoryInfo': 'interfaces',
+    'RepositoryInteractionAbility': 'objects',
+    'RepositoryInteractionLimit': 'enums',
+    'RepositoryInteractionLimitExpiry': 'enums',
+    'RepositoryInteractionLimitOrigin': 'enums',
+    'RepositoryInvitation': 'objects',
+    'RepositoryInvitationConnection': 'connections',
+    'RepositoryInvitationEdge': 'objects',
+    'RepositoryInvitationOrder': 'inputs',
+    'RepositoryInvitationOrderField': 'enums',
+    'RepositoryLockReason': 'enums',
+    'RepositoryMigration': 'objects',
+    'RepositoryMigrationConnection': 'connections',
+    'RepositoryMigrationEdge': 'objects',
+    'RepositoryMigrationOrder': 'inputs',
+    'RepositoryMigrationOrderDirection': 'enums',
+    'RepositoryMigrationOrderField': 'enums',
+    'RepositoryNameConditionTarget': 'objects',
+    'RepositoryNameConditionTargetInput': 'inputs',
+    'RepositoryNode': 'interfaces',
+    'RepositoryOrder': 'inputs',
+    'RepositoryOrderField': 'enums',
+    'RepositoryOwner': 'interfaces',
+    'RepositoryPermission': 'enums',
+    'RepositoryPrivacy': 'enums',
+    'RepositoryRule': 'objects',
+    'RepositoryRuleConditions': 'objects',
+    'RepositoryRuleConditionsInput': 'inputs',
+    'RepositoryRuleConnection': 'connections',
+    'RepositoryRuleEdge': 'objects',
+    'RepositoryRuleInput': 'inputs',
+    'RepositoryRuleType': 'enums',
+    'RepositoryRuleset': 'objects',
+    'RepositoryRulesetBypassActor': 'objects',
+    'RepositoryRulesetBypassActorConnection': 'connections',
+    'RepositoryRulesetBypassActorEdge': 'objects',
+    'RepositoryRulesetConnection': 'connections',
+    'RepositoryRulesetEdge': 'objects',
+    'RepositoryRulesetTarget': 'enums',
+    'RepositoryTopic': 'objects',
+    'RepositoryTopicConnection': 'connections',
+    'RepositoryTopicEdge': 'objects',
+    'RepositoryVisibility': 'enums',
+    'RepositoryVisibilityChangeDisableAuditEntry': 'objects',
+    'RepositoryVisibilityChangeEnableAuditEntry': 'objects',
+    'RepositoryVulnerabilityAlert': 'objects',
+    'RepositoryVulnerabilityAlertConnection': 'connections',
+    'RepositoryVulnerabilityAlertDependencyScope': 'enums',
+    'RepositoryVulnerabilityAlertEdge': 'objects',
+    'RepositoryVulnerabilityAlertState': 'enums',
+    'RequestReviewsInput': 'inputs',
+    'RequestReviewsPayload': 'objects',
+    'RequestableCheckStatusState': 'enums',
+    'RequestedReviewer': 'unions',
+    'RequestedReviewerConnection': 'connections',
+    'RequestedReviewerEdge': 'objects',
+    'RequirableByPullRequest': 'interfaces',
+    'RequiredDeploymentsParameters': 'objects',
+    'RequiredDeploymentsParametersInput': 'inputs',
+    'RequiredStatusCheckDescription': 'objects',
+    'RequiredStatusCheckInput': 'inputs',
+    'RequiredStatusChecksParameters': 'objects',
+    'RequiredStatusChecksParametersInput': 'inputs',
+    'RerequestCheckSuiteInput': 'inputs',
+    'RerequestCheckSuitePayload': 'objects',
+    'ResolveReviewThreadInput': 'inputs',
+    'ResolveReviewThreadPayload': 'objects',
+    'RestrictedContribution': 'objects',
+    'RetireSponsorsTierInput': 'inputs',
+    'RetireSponsorsTierPayload': 'objects',
+    'RevertPullRequestInput': 'inputs',
+    'RevertPullRequestPayload': 'objects',
+    'ReviewDismissalAllowance': 'objects',
+    'ReviewDismissalAllowanceActor': 'unions',
+    'ReviewDismissalAllowanceConnection': 'connections',
+    'ReviewDismissalAllowanceEdge': 'objects',
+    'ReviewDismissedEvent': 'objects',
+    'ReviewRequest': 'objects',
+    'ReviewRequestConnection': 'connections',
+    'ReviewRequestEdge': 'objects',
+    'ReviewRequestRemovedEvent': 'objects',
+    'ReviewRequestedEvent': 'objects',
+    'ReviewStatusHovercardContext': 'objects',
+    'RevokeEnterpriseOrganizationsMigratorRoleInput': 'inputs',
+    'RevokeEnterpriseOrganizationsMigratorRolePayload': 'objects',
+    'RevokeMigratorRoleInput': 'inputs',
+    'RevokeMigratorRolePayload': 'objects',
+    'RoleInOrganization': 'enums',
+    'RuleBypassMode': 'enums',
+    'RuleEnforcement': 'enums',
+    'RuleParameters': 'unions',
+    'RuleParametersInput': 'inputs',
+    'RuleSource': 'unions',
+    'SamlDigestAlgorithm': 'enums',
+    'SamlSignatureAlgorithm': 'enums',
+    'SavedReply': 'objects',
+    'SavedReplyConnection': 'connections',
+    'SavedReplyEdge': 'objects',
+    'SavedReplyOrder': 'inputs',
+    'SavedReplyOrderField': 'enums',
+    'SearchResultItem': 'unions',
+    'SearchResultItemConnection': 'connections',
+    'SearchResultItemEdge': 'objects',
+    'SearchType': 'enums',
+    'SecurityAdvisory': 'objects',
+    'SecurityAdvisoryClassification': 'enums',
+    'SecurityAdvisoryConnection': 'connections',
+    'SecurityAdvisoryEcosystem': 'enums',
+    'SecurityAdvisoryEdge': 'objects',
+    'SecurityAdvisoryIdentifier': 'objects',
+    'SecurityAdvisoryIdentifierFilter': 'inputs',
+    'SecurityAdvisoryIdentifierType': 'enums',
+    'SecurityAdvisoryOrder': 'inputs',
+    'SecurityAdvisoryOrderField': 'enums',
+    'SecurityAdvisoryPackage': 'objects',
+    'SecurityAdvisoryPackageVersion': 'objects',
+    'SecurityAdvisoryReference': 'objects',
+    'SecurityAdvisorySeverity': 'enums',
+    'SecurityVulnerability': 'objects',
+    'SecurityVulnerabilityConnection': 'connections',
+    'SecurityVulnerabilityEdge': 'objects',
+    'SecurityVulnerabilityOrder': 'inputs',
+    'SecurityVulnerabilityOrderField': 'enums',
+    'SetEnterpriseIdentityProviderInput': 'inputs',
+    'SetEnterpriseIdentityProviderPayload': 'objects',
+    'SetOrganizationInteractionLimitInput': 'inputs',
+    'SetOrganizationInteractionLimitPayload': 'objects',
+    'SetRepositoryInteractionLimitInput': 'inputs',
+    'SetRepositoryInteractionLimitPayload': 'objects',
+    'SetUserInteractionLimitInput': 'inputs',
+    'SetUserInteractionLimitPayload': 'objects',
+    'SmimeSignature': 'objects',
+    'SocialAccount': 'objects',
+    'SocialAccountConnection': 'connections',
+    'SocialAccountEdge': 'objects',
+    'SocialAccountProvider': 'enums',
+    'Sponsor': 'unions',
+    'SponsorConnection': 'connections',
+    'SponsorEdge': 'objects',
+    'SponsorOrder': 'inputs',
+    'SponsorOrderField': 'enums',
+    'Sponsorable': 'interfaces',
+    'SponsorableItem': 'unions',
+    'SponsorableItemConnection': 'connections',
+    'SponsorableItemEdge': 'objects',
+    'SponsorableOrder': 'inputs',
+    'SponsorableOrderField': 'enums',
+    'SponsorsActivity': 'objects',
+    'SponsorsActivityAction': 'enums',
+    'SponsorsActivityConnection': 'connections',
+    'SponsorsActivityEdge': 'objects',
+    'SponsorsActivityOrder': 'inputs',
+    'SponsorsActivityOrderField': 'enums',
+    'SponsorsActivityPeriod': 'enums',
+    'SponsorsCountryOrRegionCode': 'enums',
+    'SponsorsGoal': 'objects',
+    'SponsorsGoalKind': 'enums',
+    'SponsorsListing': 'objects',
+    'SponsorsListingFeatureableItem': 'unions',
+    'SponsorsListingFeaturedItem': 'objects',
+    'SponsorsListingFeaturedItemFeatureableType': 'enums',
+    'SponsorsTier': 'objects',
+    'SponsorsTierAdminInfo': 'objects',
+    'SponsorsTierConnection': 'connections',
+    'SponsorsTierEdge': 'objects',
+    'SponsorsTierOrder': 'inputs',
+    'SponsorsTierOrderField': 'enums',
+    'Sponsorship': 'objects',
+    'SponsorshipConnection': 'connections',
+    'SponsorshipEdge': 'objects',
+    'SponsorshipNewsletter': 'objects',
+    'SponsorshipNewsletterConnection': 'connections',
+    'SponsorshipNewsletterEdge': 'objects',
+    'SponsorshipNewsletterOrder': 'inputs',
+    'SponsorshipNewsletterOrderField': 'enums',
+    'SponsorshipOrder': 'inputs',
+    'SponsorshipOrderField': 'enums',
+    'SponsorshipPrivacy': 'enums',
+    'SquashMergeCommitMessage': 'enums',
+    'SquashMergeCommitTitle': 'enums',
+    'SshSignature': 'objects',
+    'StarOrder': 'inputs',
+    'StarOrderField': 'enums',
+    'StargazerConnection': 'connections',
+    'StargazerEdge': 'objects',
+    'Starrable': 'interfaces',
+    'StarredRepositoryConnection': 'connections',
+    'StarredRepositoryEdge': 'objects',
+    'StartOrganizationMigrationInput': 'inputs',
+    'StartOrganizationMigrationPayload': 'objects',
+    'StartRepositoryMigrationInput': 'inputs',
+    'StartRepositoryMigrationPayload': 'objects',
+    'Status': 'objects',
+    'StatusCheckConfiguration': 'objects',
+    'StatusCheckConfigurationInput': 'inputs',
+    'StatusCheckRollup': 'objects',
+    'StatusCheckRollupContext': 'unions',
+    'StatusCheckRollupContextConnection': 'connections',
+    'StatusCheckRollupContextEdge': 'objects',
+    'StatusContext': 'objects',
+    'StatusContextStateCount': 'objects',
+    'StatusState': 'enums',
+    'StripeConnectAccount': 'objects',
+    'SubmitPullRequestReviewInput': 'inputs',
+    'SubmitPullRequestReviewPayload': 'objects',
+    'Submodule': 'objects',
+    'SubmoduleConnection': 'connections',
+    'SubmoduleEdge': 'objects',
+    'Subscribable': 'interfaces',
+    'SubscribedEvent': 'objects',
+    'SubscriptionState': 'enums',
+    'SuggestedReviewer': 'objects',
+    'Tag': 'objects',
+    'TagNamePatternParameters': 'objects',
+    'TagNamePatternParametersInput': 'inputs',
+    'Team': 'objects',
+    'TeamAddMemberAuditEntry': 'objects',
+    'TeamAddRepositoryAuditEntry': 'objects',
+    'TeamAuditEntryData': 'interfaces',
+    'TeamChangeParentTeamAuditEntry': 'objects',
+    'TeamConnection': 'connections',
+    'TeamDiscussion': 'objects',
+    'TeamDiscussionComment': 'objects',
+    'TeamDiscussionCommentConnection': 'connections',
+    'TeamDiscussionCommentEdge': 'objects',
+    'TeamDiscussionCommentOrder': 'inputs',
+    'TeamDiscussionCommentOrderField': 'enums',
+    'TeamDiscussionConnection': 'connections',
+    'TeamDiscussionEdge': 'objects',
+    'TeamDiscussionOrder': 'inputs',
+    'TeamDiscussionOrderField': 'enums',
+    'TeamEdge': 'objects',
+    'TeamMemberConnection': 'connections',
+    'TeamMemberEdge': 'objects',
+    'TeamMemberOrder': 'inputs',
+    'TeamMemberOrderField': 'enums',
+    'TeamMemberRole': 'enums',
+    'TeamMembershipType': 'enums',
+    'TeamNotificationSetting': 'enums',
+    'TeamOrder': 'inputs',
+    'TeamOrderField': 'enums',
+    'TeamPrivacy': 'enums',
+    'TeamRemoveMemberAuditEntry': 'objects',
+    'TeamRemoveRepositoryAuditEntry': 'objects',
+    'TeamRepositoryConnection': 'connections',
+    'TeamRepositoryEdge': 'objects',
+    'TeamRepositoryOrder': 'inputs',
+    'TeamRepositoryOrderField': 'enums',
+    'TeamRole': 'enums',
+    'TextMatch': 'objects',
+    'TextMatchHighlight': 'objects',
+    'Topic': 'objects',
+    'TopicAuditEntryData': 'interfaces',
+    'TopicSuggestionDeclineReason': 'enums',
+    'TrackedIssueStates': 'enums',
+    'TransferEnterpriseOrganizationInput': 'inputs',
+    'TransferEnterpriseOrganizationPayload': 'objects',
+    'TransferIssueInput': 'inputs',
+    'TransferIssuePayload': 'objects',
+    'TransferredEvent': 'objects',
+    'Tree': 'objects',
+    'TreeEntry': 'objects',
+    'URI': 'scalars',
+    'UnarchiveProjectV2ItemInput': 'inputs',
+    'UnarchiveProjectV2ItemPayload': 'objects',
+    'UnarchiveRepositoryInput': 'inputs',
+    'UnarchiveRepositoryPayload': 'objects',
+    'UnassignedEvent': 'objects',
+    'UnfollowOrganizationInput': 'inputs',
+    'UnfollowOrganizationPayload': 'objects',
+    'UnfollowUserInput': 'inputs',
+    'UnfollowUserPayload': 'objects',
+    'UniformResourceLocatable': 'interfaces',
+    'UnknownSignature': 'objects',
+    'UnlabeledEvent': 'objects',
+    'UnlinkProjectV2FromRepositoryInput': 'inputs',
+    'UnlinkProjectV2FromRepositoryPayload': 'objects',
+    'UnlinkProjectV2FromTeamInput': 'inputs',
+    'UnlinkProjectV2FromTeamPayload': 'objects',
+    'UnlinkRepositoryFromProjectInput': 'inputs',
+    'UnlinkRepositoryFromProjectPayload': 'objects',
+    'UnlockLockableInput': 'inputs',
+    'UnlockLockablePayload': 'objects',
+    'UnlockedEvent': 'objects',
+    'UnmarkDiscussionCommentAsAnswerInput': 'inputs',
+    'UnmarkDiscussionCommentAsAnswerPayload': 'objects',
+    'UnmarkFileAsViewedInput': 'inputs',
+    'UnmarkFileAsViewedPayload': 'objects',
+    'UnmarkIssueAsDuplicateInput': 'inputs',
+    'UnmarkIssueAsDuplicatePayload': 'objects',
+    'UnmarkProjectV2AsTemplateInput': 'inputs',
+    'UnmarkProjectV2AsTemplatePayload': 'objects',
+    'UnmarkedAsDuplicateEvent': 'objects',
+    'UnminimizeCommentInput': 'inputs',
+    'UnminimizeCommentPayload': 'objects',
+    'UnpinIssueInput': 'inputs',
+    'UnpinIssuePayload': 'objects',
+    'UnpinnedEvent': 'objects',
+    'UnresolveReviewThreadInput': 'inputs',
+    'UnresolveReviewThreadPayload': 'objects',
+    'UnsubscribedEvent': 'objects',
+    'Updatable': 'interfaces',
+    'UpdatableComment': 'interfaces',
+    'UpdateBranchProtectionRuleInput': 'inputs',
+    'UpdateBranchProtectionRulePayload': 'objects',
+    'UpdateCheckRunInput': 'inputs',
+    'UpdateCheckRunPayload': 'objects',
+    'UpdateCheckSuitePreferencesInput': 'inputs',
+    'UpdateCheckSuitePreferencesPayload': 'objects',
+    'UpdateDiscussionCommentInput': 'inputs',
+    'UpdateDiscussionCommentPayload': 'objects',
+    'UpdateDiscussionInput': 'inputs',
+    'UpdateDiscussionPayload': 'objects',
+    'UpdateEnterpriseAdministratorRoleInput': 'inputs',
+    'UpdateEnterpriseAdministratorRolePayload': 'objects',
+    'UpdateEnterpriseAllowPrivateRepositoryForkingSettingInput': 'inputs',
+    'UpdateEnterpriseAllowPrivateRepositoryForkingSettingPayload': 'objects',
+    'UpdateEnterpriseDefaultRepositoryPermissionSettingInput': 'inputs',
+    'UpdateEnterpriseDefaultRepositoryPermissionSettingPayload': 'objects',
+    'UpdateEnterpriseMembersCanChangeRepositoryVisibilitySettingInput': 'inputs',
+    'UpdateEnterpriseMembersCanChangeRepositoryVisibilitySettingPayload': 'objects',
+    'UpdateEnterpriseMembersCanCreateRepositoriesSettingInput': 'inputs',
+    'UpdateEnterpriseMembersCanCreateRepositoriesSettingPayload': 'objects',
+    'UpdateEnterpriseMembersCanDeleteIssuesSettingInput': 'inputs',
+    'UpdateEnterpriseMembersCanDeleteIssuesSettingPayload': 'objects',
+    'UpdateEnterpriseMembersCanDeleteRepositoriesSettingInput': 'inputs',
+    'UpdateEnterpriseMembersCanDeleteRepositoriesSettingPayload': 'objects',
+    'UpdateEnterpriseMembersCanInviteCollaboratorsSettingInput': 'inputs',
+    'UpdateEnterpriseMembersCanInviteCollaboratorsSettingPayload': 'objects',
+    'UpdateEnterpriseMembersCanMakePurchasesSettingInput': 'inputs',
+    'UpdateEnterpriseMembersCanMakePurchasesSettingPayload': 'objects',
+    'UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingInput': 'inputs',
+    'UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingPayload': 'objects',
+    'UpdateEnterpriseMembersCanViewDependencyInsightsSettingInput': 'inputs',
+    'UpdateEnterpriseMembersCanViewDependencyInsightsSettingPayload': 'objects',
+    'UpdateEnterpriseOrganizationProjectsSettingInput': 'inputs',
+    'UpdateEnterpriseOrganizationProjectsSettingPayload': 'objects',
+    'UpdateEnterpriseOwnerOrganizationRoleInput': 'inputs',
+    'UpdateEnterpriseOwnerOrganizationRolePayload': 'objects',
+    'UpdateEnterpriseProfileInput': 'inputs',
+    'UpdateEnterpriseProfilePayload': 'objects',
+    'UpdateEnterpriseRepositoryProjectsSettingInput': 'inputs',
+    'UpdateEnterpriseRepositoryProjectsSettingPayload': 'objects',
+    'UpdateEnterpriseTeamDiscussionsSettingInput': 'inputs',
+    'UpdateEnterpriseTeamDiscussionsSettingPayload': 'objects',
+    'UpdateEnterpriseTwoFactorAuthenticationRequiredSettingInput': 'inputs',
+    'UpdateEnterpriseTwoFactorAuthenticationRequiredSettingPayload': 'objects',
+    'UpdateEnvironmentInput': 'inputs',
+    'UpdateEnvironmentPayload': 'objects',
+    'UpdateIpAllowListEnabledSettingInput': 'inputs',
+    'UpdateIpAllowListEnabledSettingPayload': 'objects',
+    'UpdateIpAllowListEntryInput': 'inputs',
+    'UpdateIpAllowListEntryPayload': 'objects',
+    'UpdateIpAllowListForInstalledAppsEnabledSettingInput': 'inputs',
+    'UpdateIpAllowListForInstalledAppsEnabledSettingPayload': 'objects',
+    'UpdateIssueCommentInput': 'inputs',
+    'UpdateIssueCommentPayload': 'objects',
+    'UpdateIssueInput': 'inputs',
+    'UpdateIssuePayload': 'objects',
+    'UpdateNotificationRestrictionSettingInput': 'inputs',
+    'UpdateNotificationRestrictionSettingPayload': 'objects',
+    'UpdateOrganizationAllowPrivateRepositoryForkingSettingInput': 'inputs',
+    'UpdateOrganizationAllowPrivateRepositoryForkingSettingPayload': 'objects',
+    'UpdateOrganizationWebCommitSignoffSettingInput': 'inputs',
+    'UpdateOrganizationWebCommitSignoffSettingPayload': 'objects',
+    'UpdateParameters': 'objects',
+    'UpdateParametersInput': 'inputs',
+    'UpdateProjectCardInput': 'inputs',
+    'UpdateProjectCardPayload': 'objects',
+    'UpdateProjectColumnInput': 'inputs',
+    'UpdateProjectColumnPayload': 'objects',
+    'UpdateProjectInput': 'inputs',
+    'UpdateProjectPayload': 'objects',
+    'UpdateProjectV2CollaboratorsInput': 'inputs',
+    'UpdateProjectV2CollaboratorsPayload': 'objects',
+    'UpdateProjectV2DraftIssueInput': 'inputs',
+    'UpdateProjectV2DraftIssuePayload': 'objects',
+    'UpdateProjectV2Input': 'inputs',
+    'UpdateProjectV2ItemFieldValueInput': 'inputs',
+    'UpdateProjectV2ItemFieldValuePayload': 'objects',
+    'UpdateProjectV2ItemPositionInput': 'inputs',
+    'UpdateProjectV2ItemPositionPayload': 'objects',
+    'UpdateProjectV2Payload': 'objects',
+    'UpdatePullRequestBranchInput': 'inputs',
+    'UpdatePullRequestBranchPayload': 'objects',
+    'UpdatePullRequestInput': 'inputs',
+    'UpdatePullRequestPayload': 'objects',
+    'UpdatePullRequestReviewCommentInput': 'inputs',
+    'UpdatePullRequestReviewCommentPayload': 'objects',
+    'UpdatePullRequestReviewInput': 'inputs',
+    'UpdatePullRequestReviewPayload': 'objects',
+    'UpdateRefInput': 'inputs',
+    'UpdateRefPayload': 'objects',
+    'UpdateRepositoryInput': 'inputs',
+    'UpdateRepositoryPayload': 'objects',
+    'UpdateRepositoryRulesetInput': 'inputs',
+    'UpdateRepositoryRulesetPayload': 'objects',
+    'UpdateRepositoryWebCommitSignoffSettingInput': 'inputs',
+    'UpdateRepositoryWebCommitSignoffSettingPayload': 'objects',
+    'UpdateSponsorshipPreferencesInput': 'inputs',
+    'UpdateSponsorshipPreferencesPayload': 'objects',
+    'UpdateSubscriptionInput': 'inputs',
+    'UpdateSubscriptionPayload': 'objects',
+    'UpdateTeamDiscussionCommentInput': 'inputs',
+    'UpdateTeamDiscussionCommentPayload': 'objects',
+    'UpdateTeamDiscussionInput': 'inputs',
+    'UpdateTeamDiscussionPayload': 'objects',
+    'UpdateTeamsRepositoryInput': 'inputs',
+    'UpdateTeamsRepositoryPayload': 'objects',
+    'UpdateTopicsInput': 'inputs',
+    'UpdateTopicsPayload': 'objects',
+    'User': 'objects',
+    'UserBlockDuration': 'enums',
+    'UserBlockedEvent': 'objects',
+    'UserConnection': 'connections',
+    'UserContentEdit': 'objects',
+    'UserContentEditConnection': 'connections',
+    'UserContentEditEdge': 'objects',
+    'UserEdge': 'objects',
+    'UserEmailMetadata': 'objects',
+    'UserStatus': 'objects',
+    'UserStatusConnection': 'connections',
+    'UserStatusEdge': 'objects',
+    'UserStatusOrder': 'inputs',
+    'UserStatusOrderField': 'enums',
+    'VerifiableDomain': 'objects',
+    'VerifiableDomainConnection': 'connections',
+    'VerifiableDomainEdge': 'objects',
+    'VerifiableDomainOrder': 'inputs',
+    'VerifiableDomainOrderField': 'enums',
+    'VerifiableDomainOwner': 'unions',
+    'VerifyVerifiableDomainInput': 'inputs',
+    'VerifyVerifiableDomainPayload': 'objects',
+    'ViewerHovercardContext': 'objects',
+    'Votable': 'interfaces',
+    'Workflow': 'objects',
+    'WorkflowRun': 'objects',
+    'WorkflowRunConnection': 'connections',
+    'WorkflowRunEdge': 'objects',
+    'WorkflowRunFile': 'objects',
+    'WorkflowRunOrder': 'inputs',
+    'WorkflowRunOrderField': 'enums',
+    'WorkflowState': 'enums',
+    'X509Certificate': 'scalars',
+})
+github_schema -= sgqlc.types.relay.Node
+github_schema -= sgqlc.types.relay.PageInfo
+
+Boolean = sgqlc.types.Boolean
+Date = sgqlc.types.datetime.Date
+DateTime = sgqlc.types.datetime.DateTime
+Float = sgqlc.types.Float
+ID = sgqlc.types.ID
+Int = sgqlc.types.Int
+String = sgqlc.types.String
+
+github_schema.query_type = 'Query'
+github_schema.mutation_type = 'Mutation'
+github_schema.subscription_type = None
+
+
+def __getattr__(name):
+    try:
+        return github_schema[name]
+    except KeyError:
+        raise AttributeError(name) from None
@@ -0,0 +1,1550 @@
+# Generated by tools/sgqlc_fast_schema.py
+# Source: github_schema.py
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+from . import github_schema
+
+
+def BranchProtectionRuleConflictConnection():
+    class BranchProtectionRuleConflictConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('BranchProtectionRuleConflictEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('BranchProtectionRuleConflict'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return BranchProtectionRuleConflictConnection
+
+
+def BranchProtectionRuleConnection():
+    class BranchProtectionRuleConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('BranchProtectionRuleEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('BranchProtectionRule'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return BranchProtectionRuleConnection
+
+
+def BypassForcePushAllowanceConnection():
+    class BypassForcePushAllowanceConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('BypassForcePushAllowanceEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('BypassForcePushAllowance'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return BypassForcePushAllowanceConnection
+
+
+def BypassPullRequestAllowanceConnection():
+    class BypassPullRequestAllowanceConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('BypassPullRequestAllowanceEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('BypassPullRequestAllowance'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return BypassPullRequestAllowanceConnection
+
+
+def CWEConnection():
+    class CWEConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('CWEEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('CWE'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CWEConnection
+
+
+def CheckAnnotationConnection():
+    class CheckAnnotationConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('CheckAnnotationEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('CheckAnnotation'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CheckAnnotationConnection
+
+
+def CheckRunConnection():
+    class CheckRunConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('CheckRunEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('CheckRun'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CheckRunConnection
+
+
+def CheckStepConnection():
+    class CheckStepConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('CheckStepEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('CheckStep'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CheckStepConnection
+
+
+def CheckSuiteConnection():
+    class CheckSuiteConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('CheckSuiteEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('CheckSuite'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CheckSuiteConnection
+
+
+def CommitCommentConnection():
+    class CommitCommentConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('CommitCommentEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('CommitComment'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CommitCommentConnection
+
+
+def CommitConnection():
+    class CommitConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('CommitEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Commit'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CommitConnection
+
+
+def CommitHistoryConnection():
+    class CommitHistoryConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('CommitEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Commit'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CommitHistoryConnection
+
+
+def ComparisonCommitConnection():
+    class ComparisonCommitConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('author_count', 'edges', 'nodes', 'page_info', 'total_count')
+        author_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='authorCount')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('CommitEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Commit'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ComparisonCommitConnection
+
+
+def CreatedCommitContributionConnection():
+    class CreatedCommitContributionConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('CreatedCommitContributionEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('CreatedCommitContribution'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CreatedCommitContributionConnection
+
+
+def CreatedIssueContributionConnection():
+    class CreatedIssueContributionConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('CreatedIssueContributionEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('CreatedIssueContribution'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CreatedIssueContributionConnection
+
+
+def CreatedPullRequestContributionConnection():
+    class CreatedPullRequestContributionConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('CreatedPullRequestContributionEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('CreatedPullRequestContribution'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CreatedPullRequestContributionConnection
+
+
+def CreatedPullRequestReviewContributionConnection():
+    class CreatedPullRequestReviewContributionConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('CreatedPullRequestReviewContributionEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('CreatedPullRequestReviewContribution'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CreatedPullRequestReviewContributionConnection
+
+
+def CreatedRepositoryContributionConnection():
+    class CreatedRepositoryContributionConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('CreatedRepositoryContributionEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('CreatedRepositoryContribution'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CreatedRepositoryContributionConnection
+
+
+def DeployKeyConnection():
+    class DeployKeyConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('DeployKeyEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('DeployKey'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DeployKeyConnection
+
+
+def DeploymentConnection():
+    class DeploymentConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('DeploymentEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Deployment'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DeploymentConnection
+
+
+def DeploymentProtectionRuleConnection():
+    class DeploymentProtectionRuleConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('DeploymentProtectionRuleEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('DeploymentProtectionRule'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DeploymentProtectionRuleConnection
+
+
+def DeploymentRequestConnection():
+    class DeploymentRequestConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('DeploymentRequestEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('DeploymentRequest'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DeploymentRequestConnection
+
+
+def DeploymentReviewConnection():
+    class DeploymentReviewConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('DeploymentReviewEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('DeploymentReview'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DeploymentReviewConnection
+
+
+def DeploymentReviewerConnection():
+    class DeploymentReviewerConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('DeploymentReviewerEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('DeploymentReviewer'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DeploymentReviewerConnection
+
+
+def DeploymentStatusConnection():
+    class DeploymentStatusConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('DeploymentStatusEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('DeploymentStatus'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DeploymentStatusConnection
+
+
+def DiscussionCategoryConnection():
+    class DiscussionCategoryConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('DiscussionCategoryEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('DiscussionCategory'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DiscussionCategoryConnection
+
+
+def DiscussionCommentConnection():
+    class DiscussionCommentConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('DiscussionCommentEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('DiscussionComment'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DiscussionCommentConnection
+
+
+def DiscussionConnection():
+    class DiscussionConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('DiscussionEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Discussion'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DiscussionConnection
+
+
+def DiscussionPollOptionConnection():
+    class DiscussionPollOptionConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('DiscussionPollOptionEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('DiscussionPollOption'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DiscussionPollOptionConnection
+
+
+def EnterpriseAdministratorConnection():
+    class EnterpriseAdministratorConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseAdministratorEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('User'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return EnterpriseAdministratorConnection
+
+
+def EnterpriseAdministratorInvitationConnection():
+    class EnterpriseAdministratorInvitationConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseAdministratorInvitationEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseAdministratorInvitation'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return EnterpriseAdministratorInvitationConnection
+
+
+def EnterpriseFailedInvitationConnection():
+    class EnterpriseFailedInvitationConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count', 'total_unique_user_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseFailedInvitationEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('OrganizationInvitation'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+        total_unique_user_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalUniqueUserCount')
+    return EnterpriseFailedInvitationConnection
+
+
+def EnterpriseMemberConnection():
+    class EnterpriseMemberConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseMemberEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseMember'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return EnterpriseMemberConnection
+
+
+def EnterpriseOrganizationMembershipConnection():
+    class EnterpriseOrganizationMembershipConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseOrganizationMembershipEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Organization'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return EnterpriseOrganizationMembershipConnection
+
+
+def EnterpriseOutsideCollaboratorConnection():
+    class EnterpriseOutsideCollaboratorConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseOutsideCollaboratorEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('User'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return EnterpriseOutsideCollaboratorConnection
+
+
+def EnterprisePendingMemberInvitationConnection():
+    class EnterprisePendingMemberInvitationConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count', 'total_unique_user_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('EnterprisePendingMemberInvitationEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('OrganizationInvitation'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+        total_unique_user_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalUniqueUserCount')
+    return EnterprisePendingMemberInvitationConnection
+
+
+def EnterpriseRepositoryInfoConnection():
+    class EnterpriseRepositoryInfoConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseRepositoryInfoEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseRepositoryInfo'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return EnterpriseRepositoryInfoConnection
+
+
+def EnterpriseServerInstallationConnection():
+    class EnterpriseServerInstallationConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseServerInstallationEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseServerInstallation'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return EnterpriseServerInstallationConnection
+
+
+def EnterpriseServerInstallationMembershipConnection():
+    class EnterpriseServerInstallationMembershipConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseServerInstallationMembershipEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseServerInstallation'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return EnterpriseServerInstallationMembershipConnection
+
+
+def EnterpriseServerUserAccountConnection():
+    class EnterpriseServerUserAccountConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseServerUserAccountEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseServerUserAccount'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return EnterpriseServerUserAccountConnection
+
+
+def EnterpriseServerUserAccountEmailConnection():
+    class EnterpriseServerUserAccountEmailConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseServerUserAccountEmailEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseServerUserAccountEmail'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return EnterpriseServerUserAccountEmailConnection
+
+
+def EnterpriseServerUserAccountsUploadConnection():
+    class EnterpriseServerUserAccountsUploadConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseServerUserAccountsUploadEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('EnterpriseServerUserAccountsUpload'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return EnterpriseServerUserAccountsUploadConnection
+
+
+def EnvironmentConnection():
+    class EnvironmentConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('EnvironmentEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Environment'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return EnvironmentConnection
+
+
+def ExternalIdentityConnection():
+    class ExternalIdentityConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ExternalIdentityEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ExternalIdentity'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ExternalIdentityConnection
+
+
+def FollowerConnection():
+    class FollowerConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('UserEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('User'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return FollowerConnection
+
+
+def FollowingConnection():
+    class FollowingConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('UserEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('User'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return FollowingConnection
+
+
+def GistCommentConnection():
+    class GistCommentConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('GistCommentEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('GistComment'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return GistCommentConnection
+
+
+def GistConnection():
+    class GistConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('GistEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Gist'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return GistConnection
+
+
+def GitActorConnection():
+    class GitActorConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('GitActorEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('GitActor'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return GitActorConnection
+
+
+def IpAllowListEntryConnection():
+    class IpAllowListEntryConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('IpAllowListEntryEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('IpAllowListEntry'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return IpAllowListEntryConnection
+
+
+def IssueCommentConnection():
+    class IssueCommentConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('IssueCommentEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('IssueComment'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return IssueCommentConnection
+
+
+def IssueConnection():
+    class IssueConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('IssueEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Issue'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return IssueConnection
+
+
+def IssueTimelineConnection():
+    class IssueTimelineConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('IssueTimelineItemEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('IssueTimelineItem'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return IssueTimelineConnection
+
+
+def IssueTimelineItemsConnection():
+    class IssueTimelineItemsConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'filtered_count', 'nodes', 'page_count', 'page_info', 'total_count', 'updated_at')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('IssueTimelineItemsEdge'), graphql_name='edges')
+        filtered_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='filteredCount')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('IssueTimelineItems'), graphql_name='nodes')
+        page_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='pageCount')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return IssueTimelineItemsConnection
+
+
+def LabelConnection():
+    class LabelConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('LabelEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Label'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return LabelConnection
+
+
+def LanguageConnection():
+    class LanguageConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count', 'total_size')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('LanguageEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Language'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+        total_size = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalSize')
+    return LanguageConnection
+
+
+def LinkedBranchConnection():
+    class LinkedBranchConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('LinkedBranchEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('LinkedBranch'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return LinkedBranchConnection
+
+
+def MannequinConnection():
+    class MannequinConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('MannequinEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Mannequin'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return MannequinConnection
+
+
+def MarketplaceListingConnection():
+    class MarketplaceListingConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('MarketplaceListingEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('MarketplaceListing'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return MarketplaceListingConnection
+
+
+def MergeQueueEntryConnection():
+    class MergeQueueEntryConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('MergeQueueEntryEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('MergeQueueEntry'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return MergeQueueEntryConnection
+
+
+def MilestoneConnection():
+    class MilestoneConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('MilestoneEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Milestone'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return MilestoneConnection
+
+
+def OrganizationAuditEntryConnection():
+    class OrganizationAuditEntryConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('OrganizationAuditEntryEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('OrganizationAuditEntry'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return OrganizationAuditEntryConnection
+
+
+def OrganizationConnection():
+    class OrganizationConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('OrganizationEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Organization'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return OrganizationConnection
+
+
+def OrganizationEnterpriseOwnerConnection():
+    class OrganizationEnterpriseOwnerConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('OrganizationEnterpriseOwnerEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('User'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return OrganizationEnterpriseOwnerConnection
+
+
+def OrganizationInvitationConnection():
+    class OrganizationInvitationConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('OrganizationInvitationEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('OrganizationInvitation'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return OrganizationInvitationConnection
+
+
+def OrganizationMemberConnection():
+    class OrganizationMemberConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('OrganizationMemberEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('User'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return OrganizationMemberConnection
+
+
+def PackageConnection():
+    class PackageConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PackageEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Package'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PackageConnection
+
+
+def PackageFileConnection():
+    class PackageFileConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PackageFileEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PackageFile'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PackageFileConnection
+
+
+def PackageVersionConnection():
+    class PackageVersionConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PackageVersionEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PackageVersion'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PackageVersionConnection
+
+
+def PinnableItemConnection():
+    class PinnableItemConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PinnableItemEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PinnableItem'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PinnableItemConnection
+
+
+def PinnedDiscussionConnection():
+    class PinnedDiscussionConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PinnedDiscussionEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PinnedDiscussion'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PinnedDiscussionConnection
+
+
+def PinnedIssueConnection():
+    class PinnedIssueConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PinnedIssueEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PinnedIssue'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PinnedIssueConnection
+
+
+def ProjectCardConnection():
+    class ProjectCardConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ProjectCardEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ProjectCard'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ProjectCardConnection
+
+
+def ProjectColumnConnection():
+    class ProjectColumnConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ProjectColumnEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ProjectColumn'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ProjectColumnConnection
+
+
+def ProjectConnection():
+    class ProjectConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ProjectEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Project'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ProjectConnection
+
+
+def ProjectV2ActorConnection():
+    class ProjectV2ActorConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2ActorEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2Actor'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ProjectV2ActorConnection
+
+
+def ProjectV2Connection():
+    class ProjectV2Connection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2Edge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ProjectV2Connection
+
+
+def ProjectV2FieldConfigurationConnection():
+    class ProjectV2FieldConfigurationConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2FieldConfigurationEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2FieldConfiguration'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ProjectV2FieldConfigurationConnection
+
+
+def ProjectV2FieldConnection():
+    class ProjectV2FieldConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2FieldEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2Field'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ProjectV2FieldConnection
+
+
+def ProjectV2ItemConnection():
+    class ProjectV2ItemConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2ItemEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2Item'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ProjectV2ItemConnection
+
+
+def ProjectV2ItemFieldValueConnection():
+    class ProjectV2ItemFieldValueConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2ItemFieldValueEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2ItemFieldValue'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ProjectV2ItemFieldValueConnection
+
+
+def ProjectV2SortByConnection():
+    class ProjectV2SortByConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2SortByEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2SortBy'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ProjectV2SortByConnection
+
+
+def ProjectV2SortByFieldConnection():
+    class ProjectV2SortByFieldConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2SortByFieldEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2SortByField'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ProjectV2SortByFieldConnection
+
+
+def ProjectV2ViewConnection():
+    class ProjectV2ViewConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2ViewEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2View'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ProjectV2ViewConnection
+
+
+def ProjectV2WorkflowConnection():
+    class ProjectV2WorkflowConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2WorkflowEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ProjectV2Workflow'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ProjectV2WorkflowConnection
+
+
+def PublicKeyConnection():
+    class PublicKeyConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PublicKeyEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PublicKey'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PublicKeyConnection
+
+
+def PullRequestChangedFileConnection():
+    class PullRequestChangedFileConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PullRequestChangedFileEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PullRequestChangedFile'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PullRequestChangedFileConnection
+
+
+def PullRequestCommitConnection():
+    class PullRequestCommitConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PullRequestCommitEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PullRequestCommit'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PullRequestCommitConnection
+
+
+def PullRequestConnection():
+    class PullRequestConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PullRequestEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PullRequest'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PullRequestConnection
+
+
+def PullRequestReviewCommentConnection():
+    class PullRequestReviewCommentConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PullRequestReviewCommentEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PullRequestReviewComment'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PullRequestReviewCommentConnection
+
+
+def PullRequestReviewConnection():
+    class PullRequestReviewConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PullRequestReviewEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PullRequestReview'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PullRequestReviewConnection
+
+
+def PullRequestReviewThreadConnection():
+    class PullRequestReviewThreadConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PullRequestReviewThreadEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PullRequestReviewThread'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PullRequestReviewThreadConnection
+
+
+def PullRequestTimelineConnection():
+    class PullRequestTimelineConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PullRequestTimelineItemEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PullRequestTimelineItem'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PullRequestTimelineConnection
+
+
+def PullRequestTimelineItemsConnection():
+    class PullRequestTimelineItemsConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'filtered_count', 'nodes', 'page_count', 'page_info', 'total_count', 'updated_at')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PullRequestTimelineItemsEdge'), graphql_name='edges')
+        filtered_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='filteredCount')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PullRequestTimelineItems'), graphql_name='nodes')
+        page_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='pageCount')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return PullRequestTimelineItemsConnection
+
+
+def PushAllowanceConnection():
+    class PushAllowanceConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('PushAllowanceEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('PushAllowance'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PushAllowanceConnection
+
+
+def ReactingUserConnection():
+    class ReactingUserConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ReactingUserEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('User'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ReactingUserConnection
+
+
+def ReactionConnection():
+    class ReactionConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count', 'viewer_has_reacted')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ReactionEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Reaction'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+        viewer_has_reacted = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerHasReacted')
+    return ReactionConnection
+
+
+def ReactorConnection():
+    class ReactorConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ReactorEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Reactor'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ReactorConnection
+
+
+def RefConnection():
+    class RefConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('RefEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Ref'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return RefConnection
+
+
+def ReleaseAssetConnection():
+    class ReleaseAssetConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ReleaseAssetEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ReleaseAsset'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ReleaseAssetConnection
+
+
+def ReleaseConnection():
+    class ReleaseConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ReleaseEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Release'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ReleaseConnection
+
+
+def RepositoryCollaboratorConnection():
+    class RepositoryCollaboratorConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('RepositoryCollaboratorEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('User'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return RepositoryCollaboratorConnection
+
+
+def RepositoryConnection():
+    class RepositoryConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count', 'total_disk_usage')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('RepositoryEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Repository'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+        total_disk_usage = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalDiskUsage')
+    return RepositoryConnection
+
+
+def RepositoryInvitationConnection():
+    class RepositoryInvitationConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('RepositoryInvitationEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('RepositoryInvitation'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return RepositoryInvitationConnection
+
+
+def RepositoryMigrationConnection():
+    class RepositoryMigrationConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('RepositoryMigrationEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('RepositoryMigration'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return RepositoryMigrationConnection
+
+
+def RepositoryRuleConnection():
+    class RepositoryRuleConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('RepositoryRuleEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('RepositoryRule'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return RepositoryRuleConnection
+
+
+def RepositoryRulesetBypassActorConnection():
+    class RepositoryRulesetBypassActorConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('RepositoryRulesetBypassActorEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('RepositoryRulesetBypassActor'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return RepositoryRulesetBypassActorConnection
+
+
+def RepositoryRulesetConnection():
+    class RepositoryRulesetConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('RepositoryRulesetEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('RepositoryRuleset'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return RepositoryRulesetConnection
+
+
+def RepositoryTopicConnection():
+    class RepositoryTopicConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('RepositoryTopicEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('RepositoryTopic'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return RepositoryTopicConnection
+
+
+def RepositoryVulnerabilityAlertConnection():
+    class RepositoryVulnerabilityAlertConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('RepositoryVulnerabilityAlertEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('RepositoryVulnerabilityAlert'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return RepositoryVulnerabilityAlertConnection
+
+
+def RequestedReviewerConnection():
+    class RequestedReviewerConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('RequestedReviewerEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('RequestedReviewer'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return RequestedReviewerConnection
+
+
+def ReviewDismissalAllowanceConnection():
+    class ReviewDismissalAllowanceConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ReviewDismissalAllowanceEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ReviewDismissalAllowance'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ReviewDismissalAllowanceConnection
+
+
+def ReviewRequestConnection():
+    class ReviewRequestConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('ReviewRequestEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('ReviewRequest'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ReviewRequestConnection
+
+
+def SavedReplyConnection():
+    class SavedReplyConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('SavedReplyEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('SavedReply'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return SavedReplyConnection
+
+
+def SearchResultItemConnection():
+    class SearchResultItemConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('code_count', 'discussion_count', 'edges', 'issue_count', 'nodes', 'page_info', 'repository_count', 'user_count', 'wiki_count')
+        code_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='codeCount')
+        discussion_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='discussionCount')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('SearchResultItemEdge'), graphql_name='edges')
+        issue_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='issueCount')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('SearchResultItem'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        repository_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='repositoryCount')
+        user_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='userCount')
+        wiki_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='wikiCount')
+    return SearchResultItemConnection
+
+
+def SecurityAdvisoryConnection():
+    class SecurityAdvisoryConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('SecurityAdvisoryEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('SecurityAdvisory'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return SecurityAdvisoryConnection
+
+
+def SecurityVulnerabilityConnection():
+    class SecurityVulnerabilityConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('SecurityVulnerabilityEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('SecurityVulnerability'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return SecurityVulnerabilityConnection
+
+
+def SocialAccountConnection():
+    class SocialAccountConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('SocialAccountEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('SocialAccount'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return SocialAccountConnection
+
+
+def SponsorConnection():
+    class SponsorConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('SponsorEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Sponsor'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return SponsorConnection
+
+
+def SponsorableItemConnection():
+    class SponsorableItemConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('SponsorableItemEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('SponsorableItem'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return SponsorableItemConnection
+
+
+def SponsorsActivityConnection():
+    class SponsorsActivityConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('SponsorsActivityEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('SponsorsActivity'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return SponsorsActivityConnection
+
+
+def SponsorsTierConnection():
+    class SponsorsTierConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('SponsorsTierEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('SponsorsTier'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return SponsorsTierConnection
+
+
+def SponsorshipConnection():
+    class SponsorshipConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count', 'total_recurring_monthly_price_in_cents', 'total_recurring_monthly_price_in_dollars')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('SponsorshipEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Sponsorship'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+        total_recurring_monthly_price_in_cents = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalRecurringMonthlyPriceInCents')
+        total_recurring_monthly_price_in_dollars = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalRecurringMonthlyPriceInDollars')
+    return SponsorshipConnection
+
+
+def SponsorshipNewsletterConnection():
+    class SponsorshipNewsletterConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('SponsorshipNewsletterEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('SponsorshipNewsletter'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return SponsorshipNewsletterConnection
+
+
+def StargazerConnection():
+    class StargazerConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('StargazerEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('User'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return StargazerConnection
+
+
+def StarredRepositoryConnection():
+    class StarredRepositoryConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'is_over_limit', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('StarredRepositoryEdge'), graphql_name='edges')
+        is_over_limit = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isOverLimit')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Repository'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return StarredRepositoryConnection
+
+
+def StatusCheckRollupContextConnection():
+    class StatusCheckRollupContextConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('check_run_count', 'check_run_counts_by_state', 'edges', 'nodes', 'page_info', 'status_context_count', 'status_context_counts_by_state', 'total_count')
+        check_run_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='checkRunCount')
+        check_run_counts_by_state = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('CheckRunStateCount')), graphql_name='checkRunCountsByState')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('StatusCheckRollupContextEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('StatusCheckRollupContext'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        status_context_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='statusContextCount')
+        status_context_counts_by_state = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('StatusContextStateCount')), graphql_name='statusContextCountsByState')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return StatusCheckRollupContextConnection
+
+
+def SubmoduleConnection():
+    class SubmoduleConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('SubmoduleEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Submodule'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return SubmoduleConnection
+
+
+def TeamConnection():
+    class TeamConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('TeamEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Team'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return TeamConnection
+
+
+def TeamDiscussionCommentConnection():
+    class TeamDiscussionCommentConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('TeamDiscussionCommentEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('TeamDiscussionComment'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return TeamDiscussionCommentConnection
+
+
+def TeamDiscussionConnection():
+    class TeamDiscussionConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('TeamDiscussionEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('TeamDiscussion'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return TeamDiscussionConnection
+
+
+def TeamMemberConnection():
+    class TeamMemberConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('TeamMemberEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('User'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return TeamMemberConnection
+
+
+def TeamRepositoryConnection():
+    class TeamRepositoryConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('TeamRepositoryEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('Repository'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return TeamRepositoryConnection
+
+
+def UserConnection():
+    class UserConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('UserEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('User'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return UserConnection
+
+
+def UserContentEditConnection():
+    class UserContentEditConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('UserContentEditEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('UserContentEdit'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return UserContentEditConnection
+
+
+def UserStatusConnection():
+    class UserStatusConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('UserStatusEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('UserStatus'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return UserStatusConnection
+
+
+def VerifiableDomainConnection():
+    class VerifiableDomainConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('VerifiableDomainEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('VerifiableDomain'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return VerifiableDomainConnection
+
+
+def WorkflowRunConnection():
+    class WorkflowRunConnection(sgqlc.types.relay.Connection):
+        __schema__ = github_schema
+        __field_names__ = ('edges', 'nodes', 'page_info', 'total_count')
+        edges = sgqlc.types.Field(sgqlc.types.list_of('WorkflowRunEdge'), graphql_name='edges')
+        nodes = sgqlc.types.Field(sgqlc.types.list_of('WorkflowRun'), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return WorkflowRunConnection
@@ -0,0 +1,1471 @@
+# Generated by tools/sgqlc_fast_schema.py
+# Source: github_schema.py
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+from . import github_schema
+
+
+def ActorType():
+    class ActorType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('TEAM', 'USER')
+    return ActorType
+
+
+def AuditLogOrderField():
+    class AuditLogOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT',)
+    return AuditLogOrderField
+
+
+def CheckAnnotationLevel():
+    class CheckAnnotationLevel(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('FAILURE', 'NOTICE', 'WARNING')
+    return CheckAnnotationLevel
+
+
+def CheckConclusionState():
+    class CheckConclusionState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ACTION_REQUIRED', 'CANCELLED', 'FAILURE', 'NEUTRAL', 'SKIPPED', 'STALE', 'STARTUP_FAILURE', 'SUCCESS', 'TIMED_OUT')
+    return CheckConclusionState
+
+
+def CheckRunState():
+    class CheckRunState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ACTION_REQUIRED', 'CANCELLED', 'COMPLETED', 'FAILURE', 'IN_PROGRESS', 'NEUTRAL', 'PENDING', 'QUEUED', 'SKIPPED', 'STALE', 'STARTUP_FAILURE', 'SUCCESS', 'TIMED_OUT', 'WAITING')
+    return CheckRunState
+
+
+def CheckRunType():
+    class CheckRunType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ALL', 'LATEST')
+    return CheckRunType
+
+
+def CheckStatusState():
+    class CheckStatusState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('COMPLETED', 'IN_PROGRESS', 'PENDING', 'QUEUED', 'REQUESTED', 'WAITING')
+    return CheckStatusState
+
+
+def CollaboratorAffiliation():
+    class CollaboratorAffiliation(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ALL', 'DIRECT', 'OUTSIDE')
+    return CollaboratorAffiliation
+
+
+def CommentAuthorAssociation():
+    class CommentAuthorAssociation(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('COLLABORATOR', 'CONTRIBUTOR', 'FIRST_TIMER', 'FIRST_TIME_CONTRIBUTOR', 'MANNEQUIN', 'MEMBER', 'NONE', 'OWNER')
+    return CommentAuthorAssociation
+
+
+def CommentCannotUpdateReason():
+    class CommentCannotUpdateReason(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ARCHIVED', 'DENIED', 'INSUFFICIENT_ACCESS', 'LOCKED', 'LOGIN_REQUIRED', 'MAINTENANCE', 'VERIFIED_EMAIL_REQUIRED')
+    return CommentCannotUpdateReason
+
+
+def CommitContributionOrderField():
+    class CommitContributionOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('COMMIT_COUNT', 'OCCURRED_AT')
+    return CommitContributionOrderField
+
+
+def ComparisonStatus():
+    class ComparisonStatus(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('AHEAD', 'BEHIND', 'DIVERGED', 'IDENTICAL')
+    return ComparisonStatus
+
+
+def ContributionLevel():
+    class ContributionLevel(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('FIRST_QUARTILE', 'FOURTH_QUARTILE', 'NONE', 'SECOND_QUARTILE', 'THIRD_QUARTILE')
+    return ContributionLevel
+
+
+def DefaultRepositoryPermissionField():
+    class DefaultRepositoryPermissionField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ADMIN', 'NONE', 'READ', 'WRITE')
+    return DefaultRepositoryPermissionField
+
+
+def DependencyGraphEcosystem():
+    class DependencyGraphEcosystem(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ACTIONS', 'COMPOSER', 'GO', 'MAVEN', 'NPM', 'NUGET', 'PIP', 'PUB', 'RUBYGEMS', 'RUST')
+    return DependencyGraphEcosystem
+
+
+def DeploymentOrderField():
+    class DeploymentOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT',)
+    return DeploymentOrderField
+
+
+def DeploymentProtectionRuleType():
+    class DeploymentProtectionRuleType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('REQUIRED_REVIEWERS', 'WAIT_TIMER')
+    return DeploymentProtectionRuleType
+
+
+def DeploymentReviewState():
+    class DeploymentReviewState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('APPROVED', 'REJECTED')
+    return DeploymentReviewState
+
+
+def DeploymentState():
+    class DeploymentState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ABANDONED', 'ACTIVE', 'DESTROYED', 'ERROR', 'FAILURE', 'INACTIVE', 'IN_PROGRESS', 'PENDING', 'QUEUED', 'SUCCESS', 'WAITING')
+    return DeploymentState
+
+
+def DeploymentStatusState():
+    class DeploymentStatusState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ERROR', 'FAILURE', 'INACTIVE', 'IN_PROGRESS', 'PENDING', 'QUEUED', 'SUCCESS', 'WAITING')
+    return DeploymentStatusState
+
+
+def DiffSide():
+    class DiffSide(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('LEFT', 'RIGHT')
+    return DiffSide
+
+
+def DiscussionCloseReason():
+    class DiscussionCloseReason(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DUPLICATE', 'OUTDATED', 'RESOLVED')
+    return DiscussionCloseReason
+
+
+def DiscussionOrderField():
+    class DiscussionOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'UPDATED_AT')
+    return DiscussionOrderField
+
+
+def DiscussionPollOptionOrderField():
+    class DiscussionPollOptionOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('AUTHORED_ORDER', 'VOTE_COUNT')
+    return DiscussionPollOptionOrderField
+
+
+def DiscussionState():
+    class DiscussionState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CLOSED', 'OPEN')
+    return DiscussionState
+
+
+def DiscussionStateReason():
+    class DiscussionStateReason(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DUPLICATE', 'OUTDATED', 'REOPENED', 'RESOLVED')
+    return DiscussionStateReason
+
+
+def DismissReason():
+    class DismissReason(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('FIX_STARTED', 'INACCURATE', 'NOT_USED', 'NO_BANDWIDTH', 'TOLERABLE_RISK')
+    return DismissReason
+
+
+def EnterpriseAdministratorInvitationOrderField():
+    class EnterpriseAdministratorInvitationOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT',)
+    return EnterpriseAdministratorInvitationOrderField
+
+
+def EnterpriseAdministratorRole():
+    class EnterpriseAdministratorRole(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('BILLING_MANAGER', 'OWNER')
+    return EnterpriseAdministratorRole
+
+
+def EnterpriseAllowPrivateRepositoryForkingPolicyValue():
+    class EnterpriseAllowPrivateRepositoryForkingPolicyValue(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ENTERPRISE_ORGANIZATIONS', 'ENTERPRISE_ORGANIZATIONS_USER_ACCOUNTS', 'EVERYWHERE', 'SAME_ORGANIZATION', 'SAME_ORGANIZATION_USER_ACCOUNTS', 'USER_ACCOUNTS')
+    return EnterpriseAllowPrivateRepositoryForkingPolicyValue
+
+
+def EnterpriseDefaultRepositoryPermissionSettingValue():
+    class EnterpriseDefaultRepositoryPermissionSettingValue(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ADMIN', 'NONE', 'NO_POLICY', 'READ', 'WRITE')
+    return EnterpriseDefaultRepositoryPermissionSettingValue
+
+
+def EnterpriseEnabledDisabledSettingValue():
+    class EnterpriseEnabledDisabledSettingValue(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DISABLED', 'ENABLED', 'NO_POLICY')
+    return EnterpriseEnabledDisabledSettingValue
+
+
+def EnterpriseEnabledSettingValue():
+    class EnterpriseEnabledSettingValue(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ENABLED', 'NO_POLICY')
+    return EnterpriseEnabledSettingValue
+
+
+def EnterpriseMemberOrderField():
+    class EnterpriseMemberOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'LOGIN')
+    return EnterpriseMemberOrderField
+
+
+def EnterpriseMembersCanCreateRepositoriesSettingValue():
+    class EnterpriseMembersCanCreateRepositoriesSettingValue(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ALL', 'DISABLED', 'NO_POLICY', 'PRIVATE', 'PUBLIC')
+    return EnterpriseMembersCanCreateRepositoriesSettingValue
+
+
+def EnterpriseMembersCanMakePurchasesSettingValue():
+    class EnterpriseMembersCanMakePurchasesSettingValue(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DISABLED', 'ENABLED')
+    return EnterpriseMembersCanMakePurchasesSettingValue
+
+
+def EnterpriseServerInstallationOrderField():
+    class EnterpriseServerInstallationOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'CUSTOMER_NAME', 'HOST_NAME')
+    return EnterpriseServerInstallationOrderField
+
+
+def EnterpriseServerUserAccountEmailOrderField():
+    class EnterpriseServerUserAccountEmailOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('EMAIL',)
+    return EnterpriseServerUserAccountEmailOrderField
+
+
+def EnterpriseServerUserAccountOrderField():
+    class EnterpriseServerUserAccountOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('LOGIN', 'REMOTE_CREATED_AT')
+    return EnterpriseServerUserAccountOrderField
+
+
+def EnterpriseServerUserAccountsUploadOrderField():
+    class EnterpriseServerUserAccountsUploadOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT',)
+    return EnterpriseServerUserAccountsUploadOrderField
+
+
+def EnterpriseServerUserAccountsUploadSyncState():
+    class EnterpriseServerUserAccountsUploadSyncState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('FAILURE', 'PENDING', 'SUCCESS')
+    return EnterpriseServerUserAccountsUploadSyncState
+
+
+def EnterpriseUserAccountMembershipRole():
+    class EnterpriseUserAccountMembershipRole(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('MEMBER', 'OWNER', 'UNAFFILIATED')
+    return EnterpriseUserAccountMembershipRole
+
+
+def EnterpriseUserDeployment():
+    class EnterpriseUserDeployment(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CLOUD', 'SERVER')
+    return EnterpriseUserDeployment
+
+
+def FileViewedState():
+    class FileViewedState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DISMISSED', 'UNVIEWED', 'VIEWED')
+    return FileViewedState
+
+
+def FundingPlatform():
+    class FundingPlatform(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('COMMUNITY_BRIDGE', 'CUSTOM', 'GITHUB', 'ISSUEHUNT', 'KO_FI', 'LFX_CROWDFUNDING', 'LIBERAPAY', 'OPEN_COLLECTIVE', 'OTECHIE', 'PATREON', 'TIDELIFT')
+    return FundingPlatform
+
+
+def GistOrderField():
+    class GistOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'PUSHED_AT', 'UPDATED_AT')
+    return GistOrderField
+
+
+def GistPrivacy():
+    class GistPrivacy(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ALL', 'PUBLIC', 'SECRET')
+    return GistPrivacy
+
+
+def GitSignatureState():
+    class GitSignatureState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('BAD_CERT', 'BAD_EMAIL', 'EXPIRED_KEY', 'GPGVERIFY_ERROR', 'GPGVERIFY_UNAVAILABLE', 'INVALID', 'MALFORMED_SIG', 'NOT_SIGNING_KEY', 'NO_USER', 'OCSP_ERROR', 'OCSP_PENDING', 'OCSP_REVOKED', 'UNKNOWN_KEY', 'UNKNOWN_SIG_TYPE', 'UNSIGNED', 'UNVERIFIED_EMAIL', 'VALID')
+    return GitSignatureState
+
+
+def IdentityProviderConfigurationState():
+    class IdentityProviderConfigurationState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CONFIGURED', 'ENFORCED', 'UNCONFIGURED')
+    return IdentityProviderConfigurationState
+
+
+def IpAllowListEnabledSettingValue():
+    class IpAllowListEnabledSettingValue(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DISABLED', 'ENABLED')
+    return IpAllowListEnabledSettingValue
+
+
+def IpAllowListEntryOrderField():
+    class IpAllowListEntryOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ALLOW_LIST_VALUE', 'CREATED_AT')
+    return IpAllowListEntryOrderField
+
+
+def IpAllowListForInstalledAppsEnabledSettingValue():
+    class IpAllowListForInstalledAppsEnabledSettingValue(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DISABLED', 'ENABLED')
+    return IpAllowListForInstalledAppsEnabledSettingValue
+
+
+def IssueClosedStateReason():
+    class IssueClosedStateReason(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('COMPLETED', 'NOT_PLANNED')
+    return IssueClosedStateReason
+
+
+def IssueCommentOrderField():
+    class IssueCommentOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('UPDATED_AT',)
+    return IssueCommentOrderField
+
+
+def IssueOrderField():
+    class IssueOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('COMMENTS', 'CREATED_AT', 'UPDATED_AT')
+    return IssueOrderField
+
+
+def IssueState():
+    class IssueState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CLOSED', 'OPEN')
+    return IssueState
+
+
+def IssueStateReason():
+    class IssueStateReason(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('COMPLETED', 'NOT_PLANNED', 'REOPENED')
+    return IssueStateReason
+
+
+def IssueTimelineItemsItemType():
+    class IssueTimelineItemsItemType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ADDED_TO_PROJECT_EVENT', 'ASSIGNED_EVENT', 'CLOSED_EVENT', 'COMMENT_DELETED_EVENT', 'CONNECTED_EVENT', 'CONVERTED_NOTE_TO_ISSUE_EVENT', 'CONVERTED_TO_DISCUSSION_EVENT', 'CROSS_REFERENCED_EVENT', 'DEMILESTONED_EVENT', 'DISCONNECTED_EVENT', 'ISSUE_COMMENT', 'LABELED_EVENT', 'LOCKED_EVENT', 'MARKED_AS_DUPLICATE_EVENT', 'MENTIONED_EVENT', 'MILESTONED_EVENT', 'MOVED_COLUMNS_IN_PROJECT_EVENT', 'PINNED_EVENT', 'REFERENCED_EVENT', 'REMOVED_FROM_PROJECT_EVENT', 'RENAMED_TITLE_EVENT', 'REOPENED_EVENT', 'SUBSCRIBED_EVENT', 'TRANSFERRED_EVENT', 'UNASSIGNED_EVENT', 'UNLABELED_EVENT', 'UNLOCKED_EVENT', 'UNMARKED_AS_DUPLICATE_EVENT', 'UNPINNED_EVENT', 'UNSUBSCRIBED_EVENT', 'USER_BLOCKED_EVENT')
+    return IssueTimelineItemsItemType
+
+
+def LabelOrderField():
+    class LabelOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'NAME')
+    return LabelOrderField
+
+
+def LanguageOrderField():
+    class LanguageOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('SIZE',)
+    return LanguageOrderField
+
+
+def LockReason():
+    class LockReason(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('OFF_TOPIC', 'RESOLVED', 'SPAM', 'TOO_HEATED')
+    return LockReason
+
+
+def MannequinOrderField():
+    class MannequinOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'LOGIN')
+    return MannequinOrderField
+
+
+def MergeCommitMessage():
+    class MergeCommitMessage(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('BLANK', 'PR_BODY', 'PR_TITLE')
+    return MergeCommitMessage
+
+
+def MergeCommitTitle():
+    class MergeCommitTitle(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('MERGE_MESSAGE', 'PR_TITLE')
+    return MergeCommitTitle
+
+
+def MergeQueueEntryState():
+    class MergeQueueEntryState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('AWAITING_CHECKS', 'LOCKED', 'MERGEABLE', 'QUEUED', 'UNMERGEABLE')
+    return MergeQueueEntryState
+
+
+def MergeQueueMergingStrategy():
+    class MergeQueueMergingStrategy(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ALLGREEN', 'HEADGREEN')
+    return MergeQueueMergingStrategy
+
+
+def MergeableState():
+    class MergeableState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CONFLICTING', 'MERGEABLE', 'UNKNOWN')
+    return MergeableState
+
+
+def MigrationSourceType():
+    class MigrationSourceType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('AZURE_DEVOPS', 'BITBUCKET_SERVER', 'GITHUB_ARCHIVE')
+    return MigrationSourceType
+
+
+def MigrationState():
+    class MigrationState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('FAILED', 'FAILED_VALIDATION', 'IN_PROGRESS', 'NOT_STARTED', 'PENDING_VALIDATION', 'QUEUED', 'SUCCEEDED')
+    return MigrationState
+
+
+def MilestoneOrderField():
+    class MilestoneOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'DUE_DATE', 'NUMBER', 'UPDATED_AT')
+    return MilestoneOrderField
+
+
+def MilestoneState():
+    class MilestoneState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CLOSED', 'OPEN')
+    return MilestoneState
+
+
+def NotificationRestrictionSettingValue():
+    class NotificationRestrictionSettingValue(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DISABLED', 'ENABLED')
+    return NotificationRestrictionSettingValue
+
+
+def OIDCProviderType():
+    class OIDCProviderType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('AAD',)
+    return OIDCProviderType
+
+
+def OauthApplicationCreateAuditEntryState():
+    class OauthApplicationCreateAuditEntryState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ACTIVE', 'PENDING_DELETION', 'SUSPENDED')
+    return OauthApplicationCreateAuditEntryState
+
+
+def OperationType():
+    class OperationType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ACCESS', 'AUTHENTICATION', 'CREATE', 'MODIFY', 'REMOVE', 'RESTORE', 'TRANSFER')
+    return OperationType
+
+
+def OrderDirection():
+    class OrderDirection(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ASC', 'DESC')
+    return OrderDirection
+
+
+def OrgAddMemberAuditEntryPermission():
+    class OrgAddMemberAuditEntryPermission(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ADMIN', 'READ')
+    return OrgAddMemberAuditEntryPermission
+
+
+def OrgCreateAuditEntryBillingPlan():
+    class OrgCreateAuditEntryBillingPlan(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('BUSINESS', 'BUSINESS_PLUS', 'FREE', 'TIERED_PER_SEAT', 'UNLIMITED')
+    return OrgCreateAuditEntryBillingPlan
+
+
+def OrgEnterpriseOwnerOrderField():
+    class OrgEnterpriseOwnerOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('LOGIN',)
+    return OrgEnterpriseOwnerOrderField
+
+
+def OrgRemoveBillingManagerAuditEntryReason():
+    class OrgRemoveBillingManagerAuditEntryReason(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('SAML_EXTERNAL_IDENTITY_MISSING', 'SAML_SSO_ENFORCEMENT_REQUIRES_EXTERNAL_IDENTITY', 'TWO_FACTOR_REQUIREMENT_NON_COMPLIANCE')
+    return OrgRemoveBillingManagerAuditEntryReason
+
+
+def OrgRemoveMemberAuditEntryMembershipType():
+    class OrgRemoveMemberAuditEntryMembershipType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ADMIN', 'BILLING_MANAGER', 'DIRECT_MEMBER', 'OUTSIDE_COLLABORATOR', 'SUSPENDED', 'UNAFFILIATED')
+    return OrgRemoveMemberAuditEntryMembershipType
+
+
+def OrgRemoveMemberAuditEntryReason():
+    class OrgRemoveMemberAuditEntryReason(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('SAML_EXTERNAL_IDENTITY_MISSING', 'SAML_SSO_ENFORCEMENT_REQUIRES_EXTERNAL_IDENTITY', 'TWO_FACTOR_ACCOUNT_RECOVERY', 'TWO_FACTOR_REQUIREMENT_NON_COMPLIANCE', 'USER_ACCOUNT_DELETED')
+    return OrgRemoveMemberAuditEntryReason
+
+
+def OrgRemoveOutsideCollaboratorAuditEntryMembershipType():
+    class OrgRemoveOutsideCollaboratorAuditEntryMembershipType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('BILLING_MANAGER', 'OUTSIDE_COLLABORATOR', 'UNAFFILIATED')
+    return OrgRemoveOutsideCollaboratorAuditEntryMembershipType
+
+
+def OrgRemoveOutsideCollaboratorAuditEntryReason():
+    class OrgRemoveOutsideCollaboratorAuditEntryReason(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('SAML_EXTERNAL_IDENTITY_MISSING', 'TWO_FACTOR_REQUIREMENT_NON_COMPLIANCE')
+    return OrgRemoveOutsideCollaboratorAuditEntryReason
+
+
+def OrgUpdateDefaultRepositoryPermissionAuditEntryPermission():
+    class OrgUpdateDefaultRepositoryPermissionAuditEntryPermission(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ADMIN', 'NONE', 'READ', 'WRITE')
+    return OrgUpdateDefaultRepositoryPermissionAuditEntryPermission
+
+
+def OrgUpdateMemberAuditEntryPermission():
+    class OrgUpdateMemberAuditEntryPermission(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ADMIN', 'READ')
+    return OrgUpdateMemberAuditEntryPermission
+
+
+def OrgUpdateMemberRepositoryCreationPermissionAuditEntryVisibility():
+    class OrgUpdateMemberRepositoryCreationPermissionAuditEntryVisibility(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ALL', 'INTERNAL', 'NONE', 'PRIVATE', 'PRIVATE_INTERNAL', 'PUBLIC', 'PUBLIC_INTERNAL', 'PUBLIC_PRIVATE')
+    return OrgUpdateMemberRepositoryCreationPermissionAuditEntryVisibility
+
+
+def OrganizationInvitationRole():
+    class OrganizationInvitationRole(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ADMIN', 'BILLING_MANAGER', 'DIRECT_MEMBER', 'REINSTATE')
+    return OrganizationInvitationRole
+
+
+def OrganizationInvitationSource():
+    class OrganizationInvitationSource(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('MEMBER', 'SCIM', 'UNKNOWN')
+    return OrganizationInvitationSource
+
+
+def OrganizationInvitationType():
+    class OrganizationInvitationType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('EMAIL', 'USER')
+    return OrganizationInvitationType
+
+
+def OrganizationMemberRole():
+    class OrganizationMemberRole(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ADMIN', 'MEMBER')
+    return OrganizationMemberRole
+
+
+def OrganizationMembersCanCreateRepositoriesSettingValue():
+    class OrganizationMembersCanCreateRepositoriesSettingValue(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ALL', 'DISABLED', 'INTERNAL', 'PRIVATE')
+    return OrganizationMembersCanCreateRepositoriesSettingValue
+
+
+def OrganizationMigrationState():
+    class OrganizationMigrationState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('FAILED', 'FAILED_VALIDATION', 'IN_PROGRESS', 'NOT_STARTED', 'PENDING_VALIDATION', 'POST_REPO_MIGRATION', 'PRE_REPO_MIGRATION', 'QUEUED', 'REPO_MIGRATION', 'SUCCEEDED')
+    return OrganizationMigrationState
+
+
+def OrganizationOrderField():
+    class OrganizationOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'LOGIN')
+    return OrganizationOrderField
+
+
+def PackageFileOrderField():
+    class PackageFileOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT',)
+    return PackageFileOrderField
+
+
+def PackageOrderField():
+    class PackageOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT',)
+    return PackageOrderField
+
+
+def PackageType():
+    class PackageType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DEBIAN', 'PYPI')
+    return PackageType
+
+
+def PackageVersionOrderField():
+    class PackageVersionOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT',)
+    return PackageVersionOrderField
+
+
+def PatchStatus():
+    class PatchStatus(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ADDED', 'CHANGED', 'COPIED', 'DELETED', 'MODIFIED', 'RENAMED')
+    return PatchStatus
+
+
+def PinnableItemType():
+    class PinnableItemType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('GIST', 'ISSUE', 'ORGANIZATION', 'PROJECT', 'PULL_REQUEST', 'REPOSITORY', 'TEAM', 'USER')
+    return PinnableItemType
+
+
+def PinnedDiscussionGradient():
+    class PinnedDiscussionGradient(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('BLUE_MINT', 'BLUE_PURPLE', 'PINK_BLUE', 'PURPLE_CORAL', 'RED_ORANGE')
+    return PinnedDiscussionGradient
+
+
+def PinnedDiscussionPattern():
+    class PinnedDiscussionPattern(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CHEVRON_UP', 'DOT', 'DOT_FILL', 'HEART_FILL', 'PLUS', 'ZAP')
+    return PinnedDiscussionPattern
+
+
+def ProjectCardArchivedState():
+    class ProjectCardArchivedState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ARCHIVED', 'NOT_ARCHIVED')
+    return ProjectCardArchivedState
+
+
+def ProjectCardState():
+    class ProjectCardState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CONTENT_ONLY', 'NOTE_ONLY', 'REDACTED')
+    return ProjectCardState
+
+
+def ProjectColumnPurpose():
+    class ProjectColumnPurpose(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DONE', 'IN_PROGRESS', 'TODO')
+    return ProjectColumnPurpose
+
+
+def ProjectOrderField():
+    class ProjectOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'NAME', 'UPDATED_AT')
+    return ProjectOrderField
+
+
+def ProjectState():
+    class ProjectState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CLOSED', 'OPEN')
+    return ProjectState
+
+
+def ProjectTemplate():
+    class ProjectTemplate(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('AUTOMATED_KANBAN_V2', 'AUTOMATED_REVIEWS_KANBAN', 'BASIC_KANBAN', 'BUG_TRIAGE')
+    return ProjectTemplate
+
+
+def ProjectV2CustomFieldType():
+    class ProjectV2CustomFieldType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DATE', 'NUMBER', 'SINGLE_SELECT', 'TEXT')
+    return ProjectV2CustomFieldType
+
+
+def ProjectV2FieldOrderField():
+    class ProjectV2FieldOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'NAME', 'POSITION')
+    return ProjectV2FieldOrderField
+
+
+def ProjectV2FieldType():
+    class ProjectV2FieldType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ASSIGNEES', 'DATE', 'ITERATION', 'LABELS', 'LINKED_PULL_REQUESTS', 'MILESTONE', 'NUMBER', 'REPOSITORY', 'REVIEWERS', 'SINGLE_SELECT', 'TEXT', 'TITLE', 'TRACKED_BY', 'TRACKS')
+    return ProjectV2FieldType
+
+
+def ProjectV2ItemFieldValueOrderField():
+    class ProjectV2ItemFieldValueOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('POSITION',)
+    return ProjectV2ItemFieldValueOrderField
+
+
+def ProjectV2ItemOrderField():
+    class ProjectV2ItemOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('POSITION',)
+    return ProjectV2ItemOrderField
+
+
+def ProjectV2ItemType():
+    class ProjectV2ItemType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DRAFT_ISSUE', 'ISSUE', 'PULL_REQUEST', 'REDACTED')
+    return ProjectV2ItemType
+
+
+def ProjectV2OrderField():
+    class ProjectV2OrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'NUMBER', 'TITLE', 'UPDATED_AT')
+    return ProjectV2OrderField
+
+
+def ProjectV2Roles():
+    class ProjectV2Roles(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ADMIN', 'NONE', 'READER', 'WRITER')
+    return ProjectV2Roles
+
+
+def ProjectV2SingleSelectFieldOptionColor():
+    class ProjectV2SingleSelectFieldOptionColor(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('BLUE', 'GRAY', 'GREEN', 'ORANGE', 'PINK', 'PURPLE', 'RED', 'YELLOW')
+    return ProjectV2SingleSelectFieldOptionColor
+
+
+def ProjectV2State():
+    class ProjectV2State(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CLOSED', 'OPEN')
+    return ProjectV2State
+
+
+def ProjectV2ViewLayout():
+    class ProjectV2ViewLayout(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('BOARD_LAYOUT', 'ROADMAP_LAYOUT', 'TABLE_LAYOUT')
+    return ProjectV2ViewLayout
+
+
+def ProjectV2ViewOrderField():
+    class ProjectV2ViewOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'NAME', 'POSITION')
+    return ProjectV2ViewOrderField
+
+
+def ProjectV2WorkflowsOrderField():
+    class ProjectV2WorkflowsOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'NAME', 'NUMBER', 'UPDATED_AT')
+    return ProjectV2WorkflowsOrderField
+
+
+def PullRequestMergeMethod():
+    class PullRequestMergeMethod(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('MERGE', 'REBASE', 'SQUASH')
+    return PullRequestMergeMethod
+
+
+def PullRequestOrderField():
+    class PullRequestOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'UPDATED_AT')
+    return PullRequestOrderField
+
+
+def PullRequestReviewCommentState():
+    class PullRequestReviewCommentState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('PENDING', 'SUBMITTED')
+    return PullRequestReviewCommentState
+
+
+def PullRequestReviewDecision():
+    class PullRequestReviewDecision(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('APPROVED', 'CHANGES_REQUESTED', 'REVIEW_REQUIRED')
+    return PullRequestReviewDecision
+
+
+def PullRequestReviewEvent():
+    class PullRequestReviewEvent(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('APPROVE', 'COMMENT', 'DISMISS', 'REQUEST_CHANGES')
+    return PullRequestReviewEvent
+
+
+def PullRequestReviewState():
+    class PullRequestReviewState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('APPROVED', 'CHANGES_REQUESTED', 'COMMENTED', 'DISMISSED', 'PENDING')
+    return PullRequestReviewState
+
+
+def PullRequestReviewThreadSubjectType():
+    class PullRequestReviewThreadSubjectType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('FILE', 'LINE')
+    return PullRequestReviewThreadSubjectType
+
+
+def PullRequestState():
+    class PullRequestState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CLOSED', 'MERGED', 'OPEN')
+    return PullRequestState
+
+
+def PullRequestTimelineItemsItemType():
+    class PullRequestTimelineItemsItemType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ADDED_TO_MERGE_QUEUE_EVENT', 'ADDED_TO_PROJECT_EVENT', 'ASSIGNED_EVENT', 'AUTOMATIC_BASE_CHANGE_FAILED_EVENT', 'AUTOMATIC_BASE_CHANGE_SUCCEEDED_EVENT', 'AUTO_MERGE_DISABLED_EVENT', 'AUTO_MERGE_ENABLED_EVENT', 'AUTO_REBASE_ENABLED_EVENT', 'AUTO_SQUASH_ENABLED_EVENT', 'BASE_REF_CHANGED_EVENT', 'BASE_REF_DELETED_EVENT', 'BASE_REF_FORCE_PUSHED_EVENT', 'CLOSED_EVENT', 'COMMENT_DELETED_EVENT', 'CONNECTED_EVENT', 'CONVERTED_NOTE_TO_ISSUE_EVENT', 'CONVERTED_TO_DISCUSSION_EVENT', 'CONVERT_TO_DRAFT_EVENT', 'CROSS_REFERENCED_EVENT', 'DEMILESTONED_EVENT', 'DEPLOYED_EVENT', 'DEPLOYMENT_ENVIRONMENT_CHANGED_EVENT', 'DISCONNECTED_EVENT', 'HEAD_REF_DELETED_EVENT', 'HEAD_REF_FORCE_PUSHED_EVENT', 'HEAD_REF_RESTORED_EVENT', 'ISSUE_COMMENT', 'LABELED_EVENT', 'LOCKED_EVENT', 'MARKED_AS_DUPLICATE_EVENT', 'MENTIONED_EVENT', 'MERGED_EVENT', 'MILESTONED_EVENT', 'MOVED_COLUMNS_IN_PROJECT_EVENT', 'PINNED_EVENT', 'PULL_REQUEST_COMMIT', 'PULL_REQUEST_COMMIT_COMMENT_THREAD', 'PULL_REQUEST_REVIEW', 'PULL_REQUEST_REVIEW_THREAD', 'PULL_REQUEST_REVISION_MARKER', 'READY_FOR_REVIEW_EVENT', 'REFERENCED_EVENT', 'REMOVED_FROM_MERGE_QUEUE_EVENT', 'REMOVED_FROM_PROJECT_EVENT', 'RENAMED_TITLE_EVENT', 'REOPENED_EVENT', 'REVIEW_DISMISSED_EVENT', 'REVIEW_REQUESTED_EVENT', 'REVIEW_REQUEST_REMOVED_EVENT', 'SUBSCRIBED_EVENT', 'TRANSFERRED_EVENT', 'UNASSIGNED_EVENT', 'UNLABELED_EVENT', 'UNLOCKED_EVENT', 'UNMARKED_AS_DUPLICATE_EVENT', 'UNPINNED_EVENT', 'UNSUBSCRIBED_EVENT', 'USER_BLOCKED_EVENT')
+    return PullRequestTimelineItemsItemType
+
+
+def PullRequestUpdateState():
+    class PullRequestUpdateState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CLOSED', 'OPEN')
+    return PullRequestUpdateState
+
+
+def ReactionContent():
+    class ReactionContent(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CONFUSED', 'EYES', 'HEART', 'HOORAY', 'LAUGH', 'ROCKET', 'THUMBS_DOWN', 'THUMBS_UP')
+    return ReactionContent
+
+
+def ReactionOrderField():
+    class ReactionOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT',)
+    return ReactionOrderField
+
+
+def RefOrderField():
+    class RefOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ALPHABETICAL', 'TAG_COMMIT_DATE')
+    return RefOrderField
+
+
+def ReleaseOrderField():
+    class ReleaseOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'NAME')
+    return ReleaseOrderField
+
+
+def RepoAccessAuditEntryVisibility():
+    class RepoAccessAuditEntryVisibility(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('INTERNAL', 'PRIVATE', 'PUBLIC')
+    return RepoAccessAuditEntryVisibility
+
+
+def RepoAddMemberAuditEntryVisibility():
+    class RepoAddMemberAuditEntryVisibility(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('INTERNAL', 'PRIVATE', 'PUBLIC')
+    return RepoAddMemberAuditEntryVisibility
+
+
+def RepoArchivedAuditEntryVisibility():
+    class RepoArchivedAuditEntryVisibility(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('INTERNAL', 'PRIVATE', 'PUBLIC')
+    return RepoArchivedAuditEntryVisibility
+
+
+def RepoChangeMergeSettingAuditEntryMergeType():
+    class RepoChangeMergeSettingAuditEntryMergeType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('MERGE', 'REBASE', 'SQUASH')
+    return RepoChangeMergeSettingAuditEntryMergeType
+
+
+def RepoCreateAuditEntryVisibility():
+    class RepoCreateAuditEntryVisibility(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('INTERNAL', 'PRIVATE', 'PUBLIC')
+    return RepoCreateAuditEntryVisibility
+
+
+def RepoDestroyAuditEntryVisibility():
+    class RepoDestroyAuditEntryVisibility(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('INTERNAL', 'PRIVATE', 'PUBLIC')
+    return RepoDestroyAuditEntryVisibility
+
+
+def RepoRemoveMemberAuditEntryVisibility():
+    class RepoRemoveMemberAuditEntryVisibility(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('INTERNAL', 'PRIVATE', 'PUBLIC')
+    return RepoRemoveMemberAuditEntryVisibility
+
+
+def ReportedContentClassifiers():
+    class ReportedContentClassifiers(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ABUSE', 'DUPLICATE', 'OFF_TOPIC', 'OUTDATED', 'RESOLVED', 'SPAM')
+    return ReportedContentClassifiers
+
+
+def RepositoryAffiliation():
+    class RepositoryAffiliation(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('COLLABORATOR', 'ORGANIZATION_MEMBER', 'OWNER')
+    return RepositoryAffiliation
+
+
+def RepositoryContributionType():
+    class RepositoryContributionType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('COMMIT', 'ISSUE', 'PULL_REQUEST', 'PULL_REQUEST_REVIEW', 'REPOSITORY')
+    return RepositoryContributionType
+
+
+def RepositoryInteractionLimit():
+    class RepositoryInteractionLimit(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('COLLABORATORS_ONLY', 'CONTRIBUTORS_ONLY', 'EXISTING_USERS', 'NO_LIMIT')
+    return RepositoryInteractionLimit
+
+
+def RepositoryInteractionLimitExpiry():
+    class RepositoryInteractionLimitExpiry(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ONE_DAY', 'ONE_MONTH', 'ONE_WEEK', 'SIX_MONTHS', 'THREE_DAYS')
+    return RepositoryInteractionLimitExpiry
+
+
+def RepositoryInteractionLimitOrigin():
+    class RepositoryInteractionLimitOrigin(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ORGANIZATION', 'REPOSITORY', 'USER')
+    return RepositoryInteractionLimitOrigin
+
+
+def RepositoryInvitationOrderField():
+    class RepositoryInvitationOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT',)
+    return RepositoryInvitationOrderField
+
+
+def RepositoryLockReason():
+    class RepositoryLockReason(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('BILLING', 'MIGRATING', 'MOVING', 'RENAME', 'TRADE_RESTRICTION')
+    return RepositoryLockReason
+
+
+def RepositoryMigrationOrderDirection():
+    class RepositoryMigrationOrderDirection(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ASC', 'DESC')
+    return RepositoryMigrationOrderDirection
+
+
+def RepositoryMigrationOrderField():
+    class RepositoryMigrationOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT',)
+    return RepositoryMigrationOrderField
+
+
+def RepositoryOrderField():
+    class RepositoryOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'NAME', 'PUSHED_AT', 'STARGAZERS', 'UPDATED_AT')
+    return RepositoryOrderField
+
+
+def RepositoryPermission():
+    class RepositoryPermission(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ADMIN', 'MAINTAIN', 'READ', 'TRIAGE', 'WRITE')
+    return RepositoryPermission
+
+
+def RepositoryPrivacy():
+    class RepositoryPrivacy(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('PRIVATE', 'PUBLIC')
+    return RepositoryPrivacy
+
+
+def RepositoryRuleType():
+    class RepositoryRuleType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('BRANCH_NAME_PATTERN', 'COMMITTER_EMAIL_PATTERN', 'COMMIT_AUTHOR_EMAIL_PATTERN', 'COMMIT_MESSAGE_PATTERN', 'CREATION', 'DELETION', 'NON_FAST_FORWARD', 'PULL_REQUEST', 'REQUIRED_DEPLOYMENTS', 'REQUIRED_LINEAR_HISTORY', 'REQUIRED_SIGNATURES', 'REQUIRED_STATUS_CHECKS', 'TAG_NAME_PATTERN', 'UPDATE')
+    return RepositoryRuleType
+
+
+def RepositoryRulesetTarget():
+    class RepositoryRulesetTarget(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('BRANCH', 'TAG')
+    return RepositoryRulesetTarget
+
+
+def RepositoryVisibility():
+    class RepositoryVisibility(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('INTERNAL', 'PRIVATE', 'PUBLIC')
+    return RepositoryVisibility
+
+
+def RepositoryVulnerabilityAlertDependencyScope():
+    class RepositoryVulnerabilityAlertDependencyScope(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DEVELOPMENT', 'RUNTIME')
+    return RepositoryVulnerabilityAlertDependencyScope
+
+
+def RepositoryVulnerabilityAlertState():
+    class RepositoryVulnerabilityAlertState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('AUTO_DISMISSED', 'DISMISSED', 'FIXED', 'OPEN')
+    return RepositoryVulnerabilityAlertState
+
+
+def RequestableCheckStatusState():
+    class RequestableCheckStatusState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('COMPLETED', 'IN_PROGRESS', 'PENDING', 'QUEUED', 'WAITING')
+    return RequestableCheckStatusState
+
+
+def RoleInOrganization():
+    class RoleInOrganization(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DIRECT_MEMBER', 'OWNER', 'UNAFFILIATED')
+    return RoleInOrganization
+
+
+def RuleBypassMode():
+    class RuleBypassMode(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('NONE', 'ORGANIZATION', 'ORGANIZATION_ALWAYS', 'ORGANIZATION_NONE', 'ORGANIZATION_PRS_ONLY', 'REPOSITORY')
+    return RuleBypassMode
+
+
+def RuleEnforcement():
+    class RuleEnforcement(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ACTIVE', 'DISABLED', 'EVALUATE')
+    return RuleEnforcement
+
+
+def SamlDigestAlgorithm():
+    class SamlDigestAlgorithm(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('SHA1', 'SHA256', 'SHA384', 'SHA512')
+    return SamlDigestAlgorithm
+
+
+def SamlSignatureAlgorithm():
+    class SamlSignatureAlgorithm(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('RSA_SHA1', 'RSA_SHA256', 'RSA_SHA384', 'RSA_SHA512')
+    return SamlSignatureAlgorithm
+
+
+def SavedReplyOrderField():
+    class SavedReplyOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('UPDATED_AT',)
+    return SavedReplyOrderField
+
+
+def SearchType():
+    class SearchType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('DISCUSSION', 'ISSUE', 'REPOSITORY', 'USER')
+    return SearchType
+
+
+def SecurityAdvisoryClassification():
+    class SecurityAdvisoryClassification(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('GENERAL', 'MALWARE')
+    return SecurityAdvisoryClassification
+
+
+def SecurityAdvisoryEcosystem():
+    class SecurityAdvisoryEcosystem(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ACTIONS', 'COMPOSER', 'ERLANG', 'GO', 'MAVEN', 'NPM', 'NUGET', 'PIP', 'PUB', 'RUBYGEMS', 'RUST', 'SWIFT')
+    return SecurityAdvisoryEcosystem
+
+
+def SecurityAdvisoryIdentifierType():
+    class SecurityAdvisoryIdentifierType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CVE', 'GHSA')
+    return SecurityAdvisoryIdentifierType
+
+
+def SecurityAdvisoryOrderField():
+    class SecurityAdvisoryOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('PUBLISHED_AT', 'UPDATED_AT')
+    return SecurityAdvisoryOrderField
+
+
+def SecurityAdvisorySeverity():
+    class SecurityAdvisorySeverity(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CRITICAL', 'HIGH', 'LOW', 'MODERATE')
+    return SecurityAdvisorySeverity
+
+
+def SecurityVulnerabilityOrderField():
+    class SecurityVulnerabilityOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('UPDATED_AT',)
+    return SecurityVulnerabilityOrderField
+
+
+def SocialAccountProvider():
+    class SocialAccountProvider(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('FACEBOOK', 'GENERIC', 'HOMETOWN', 'INSTAGRAM', 'LINKEDIN', 'MASTODON', 'REDDIT', 'TWITCH', 'TWITTER', 'YOUTUBE')
+    return SocialAccountProvider
+
+
+def SponsorOrderField():
+    class SponsorOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('LOGIN', 'RELEVANCE')
+    return SponsorOrderField
+
+
+def SponsorableOrderField():
+    class SponsorableOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('LOGIN',)
+    return SponsorableOrderField
+
+
+def SponsorsActivityAction():
+    class SponsorsActivityAction(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CANCELLED_SPONSORSHIP', 'NEW_SPONSORSHIP', 'PENDING_CHANGE', 'REFUND', 'SPONSOR_MATCH_DISABLED', 'TIER_CHANGE')
+    return SponsorsActivityAction
+
+
+def SponsorsActivityOrderField():
+    class SponsorsActivityOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('TIMESTAMP',)
+    return SponsorsActivityOrderField
+
+
+def SponsorsActivityPeriod():
+    class SponsorsActivityPeriod(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ALL', 'DAY', 'MONTH', 'WEEK')
+    return SponsorsActivityPeriod
+
+
+def SponsorsCountryOrRegionCode():
+    class SponsorsCountryOrRegionCode(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('AD', 'AE', 'AF', 'AG', 'AI', 'AL', 'AM', 'AO', 'AQ', 'AR', 'AS', 'AT', 'AU', 'AW', 'AX', 'AZ', 'BA', 'BB', 'BD', 'BE', 'BF', 'BG', 'BH', 'BI', 'BJ', 'BL', 'BM', 'BN', 'BO', 'BQ', 'BR', 'BS', 'BT', 'BV', 'BW', 'BY', 'BZ', 'CA', 'CC', 'CD', 'CF', 'CG', 'CH', 'CI', 'CK', 'CL', 'CM', 'CN', 'CO', 'CR', 'CV', 'CW', 'CX', 'CY', 'CZ', 'DE', 'DJ', 'DK', 'DM', 'DO', 'DZ', 'EC', 'EE', 'EG', 'EH', 'ER', 'ES', 'ET', 'FI', 'FJ', 'FK', 'FM', 'FO', 'FR', 'GA', 'GB', 'GD', 'GE', 'GF', 'GG', 'GH', 'GI', 'GL', 'GM', 'GN', 'GP', 'GQ', 'GR', 'GS', 'GT', 'GU', 'GW', 'GY', 'HK', 'HM', 'HN', 'HR', 'HT', 'HU', 'ID', 'IE', 'IL', 'IM', 'IN', 'IO', 'IQ', 'IR', 'IS', 'IT', 'JE', 'JM', 'JO', 'JP', 'KE', 'KG', 'KH', 'KI', 'KM', 'KN', 'KR', 'KW', 'KY', 'KZ', 'LA', 'LB', 'LC', 'LI', 'LK', 'LR', 'LS', 'LT', 'LU', 'LV', 'LY', 'MA', 'MC', 'MD', 'ME', 'MF', 'MG', 'MH', 'MK', 'ML', 'MM', 'MN', 'MO', 'MP', 'MQ', 'MR', 'MS', 'MT', 'MU', 'MV', 'MW', 'MX', 'MY', 'MZ', 'NA', 'NC', 'NE', 'NF', 'NG', 'NI', 'NL', 'NO', 'NP', 'NR', 'NU', 'NZ', 'OM', 'PA', 'PE', 'PF', 'PG', 'PH', 'PK', 'PL', 'PM', 'PN', 'PR', 'PS', 'PT', 'PW', 'PY', 'QA', 'RE', 'RO', 'RS', 'RU', 'RW', 'SA', 'SB', 'SC', 'SD', 'SE', 'SG', 'SH', 'SI', 'SJ', 'SK', 'SL', 'SM', 'SN', 'SO', 'SR', 'SS', 'ST', 'SV', 'SX', 'SZ', 'TC', 'TD', 'TF', 'TG', 'TH', 'TJ', 'TK', 'TL', 'TM', 'TN', 'TO', 'TR', 'TT', 'TV', 'TW', 'TZ', 'UA', 'UG', 'UM', 'US', 'UY', 'UZ', 'VA', 'VC', 'VE', 'VG', 'VI', 'VN', 'VU', 'WF', 'WS', 'YE', 'YT', 'ZA', 'ZM', 'ZW')
+    return SponsorsCountryOrRegionCode
+
+
+def SponsorsGoalKind():
+    class SponsorsGoalKind(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('MONTHLY_SPONSORSHIP_AMOUNT', 'TOTAL_SPONSORS_COUNT')
+    return SponsorsGoalKind
+
+
+def SponsorsListingFeaturedItemFeatureableType():
+    class SponsorsListingFeaturedItemFeatureableType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('REPOSITORY', 'USER')
+    return SponsorsListingFeaturedItemFeatureableType
+
+
+def SponsorsTierOrderField():
+    class SponsorsTierOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'MONTHLY_PRICE_IN_CENTS')
+    return SponsorsTierOrderField
+
+
+def SponsorshipNewsletterOrderField():
+    class SponsorshipNewsletterOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT',)
+    return SponsorshipNewsletterOrderField
+
+
+def SponsorshipOrderField():
+    class SponsorshipOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT',)
+    return SponsorshipOrderField
+
+
+def SponsorshipPrivacy():
+    class SponsorshipPrivacy(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('PRIVATE', 'PUBLIC')
+    return SponsorshipPrivacy
+
+
+def SquashMergeCommitMessage():
+    class SquashMergeCommitMessage(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('BLANK', 'COMMIT_MESSAGES', 'PR_BODY')
+    return SquashMergeCommitMessage
+
+
+def SquashMergeCommitTitle():
+    class SquashMergeCommitTitle(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('COMMIT_OR_PR_TITLE', 'PR_TITLE')
+    return SquashMergeCommitTitle
+
+
+def StarOrderField():
+    class StarOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('STARRED_AT',)
+    return StarOrderField
+
+
+def StatusState():
+    class StatusState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ERROR', 'EXPECTED', 'FAILURE', 'PENDING', 'SUCCESS')
+    return StatusState
+
+
+def SubscriptionState():
+    class SubscriptionState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('IGNORED', 'SUBSCRIBED', 'UNSUBSCRIBED')
+    return SubscriptionState
+
+
+def TeamDiscussionCommentOrderField():
+    class TeamDiscussionCommentOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('NUMBER',)
+    return TeamDiscussionCommentOrderField
+
+
+def TeamDiscussionOrderField():
+    class TeamDiscussionOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT',)
+    return TeamDiscussionOrderField
+
+
+def TeamMemberOrderField():
+    class TeamMemberOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'LOGIN')
+    return TeamMemberOrderField
+
+
+def TeamMemberRole():
+    class TeamMemberRole(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('MAINTAINER', 'MEMBER')
+    return TeamMemberRole
+
+
+def TeamMembershipType():
+    class TeamMembershipType(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ALL', 'CHILD_TEAM', 'IMMEDIATE')
+    return TeamMembershipType
+
+
+def TeamNotificationSetting():
+    class TeamNotificationSetting(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('NOTIFICATIONS_DISABLED', 'NOTIFICATIONS_ENABLED')
+    return TeamNotificationSetting
+
+
+def TeamOrderField():
+    class TeamOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('NAME',)
+    return TeamOrderField
+
+
+def TeamPrivacy():
+    class TeamPrivacy(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('SECRET', 'VISIBLE')
+    return TeamPrivacy
+
+
+def TeamRepositoryOrderField():
+    class TeamRepositoryOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'NAME', 'PERMISSION', 'PUSHED_AT', 'STARGAZERS', 'UPDATED_AT')
+    return TeamRepositoryOrderField
+
+
+def TeamRole():
+    class TeamRole(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ADMIN', 'MEMBER')
+    return TeamRole
+
+
+def TopicSuggestionDeclineReason():
+    class TopicSuggestionDeclineReason(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('NOT_RELEVANT', 'PERSONAL_PREFERENCE', 'TOO_GENERAL', 'TOO_SPECIFIC')
+    return TopicSuggestionDeclineReason
+
+
+def TrackedIssueStates():
+    class TrackedIssueStates(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CLOSED', 'OPEN')
+    return TrackedIssueStates
+
+
+def UserBlockDuration():
+    class UserBlockDuration(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ONE_DAY', 'ONE_MONTH', 'ONE_WEEK', 'PERMANENT', 'THREE_DAYS')
+    return UserBlockDuration
+
+
+def UserStatusOrderField():
+    class UserStatusOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('UPDATED_AT',)
+    return UserStatusOrderField
+
+
+def VerifiableDomainOrderField():
+    class VerifiableDomainOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT', 'DOMAIN')
+    return VerifiableDomainOrderField
+
+
+def WorkflowRunOrderField():
+    class WorkflowRunOrderField(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('CREATED_AT',)
+    return WorkflowRunOrderField
+
+
+def WorkflowState():
+    class WorkflowState(sgqlc.types.Enum):
+        __schema__ = github_schema
+        __choices__ = ('ACTIVE', 'DELETED', 'DISABLED_FORK', 'DISABLED_INACTIVITY', 'DISABLED_MANUALLY')
+    return WorkflowState
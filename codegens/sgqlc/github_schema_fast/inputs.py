@@ -0,0 +1,3305 @@
+# Generated by tools/sgqlc_fast_schema.py
+# Source: github_schema.py
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+from . import github_schema
+
+
+def AbortQueuedMigrationsInput():
+    class AbortQueuedMigrationsInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('owner_id', 'client_mutation_id')
+        owner_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ownerId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AbortQueuedMigrationsInput
+
+
+def AcceptEnterpriseAdministratorInvitationInput():
+    class AcceptEnterpriseAdministratorInvitationInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('invitation_id', 'client_mutation_id')
+        invitation_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='invitationId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AcceptEnterpriseAdministratorInvitationInput
+
+
+def AcceptTopicSuggestionInput():
+    class AcceptTopicSuggestionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'name', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AcceptTopicSuggestionInput
+
+
+def AddAssigneesToAssignableInput():
+    class AddAssigneesToAssignableInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('assignable_id', 'assignee_ids', 'client_mutation_id')
+        assignable_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='assignableId')
+        assignee_ids = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ID'))), graphql_name='assigneeIds')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddAssigneesToAssignableInput
+
+
+def AddCommentInput():
+    class AddCommentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('subject_id', 'body', 'client_mutation_id')
+        subject_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='subjectId')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddCommentInput
+
+
+def AddDiscussionCommentInput():
+    class AddDiscussionCommentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('discussion_id', 'reply_to_id', 'body', 'client_mutation_id')
+        discussion_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='discussionId')
+        reply_to_id = sgqlc.types.Field('ID', graphql_name='replyToId')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddDiscussionCommentInput
+
+
+def AddDiscussionPollVoteInput():
+    class AddDiscussionPollVoteInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('poll_option_id', 'client_mutation_id')
+        poll_option_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pollOptionId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddDiscussionPollVoteInput
+
+
+def AddEnterpriseOrganizationMemberInput():
+    class AddEnterpriseOrganizationMemberInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'organization_id', 'user_ids', 'role', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        organization_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='organizationId')
+        user_ids = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ID'))), graphql_name='userIds')
+        role = sgqlc.types.Field('OrganizationMemberRole', graphql_name='role')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddEnterpriseOrganizationMemberInput
+
+
+def AddEnterpriseSupportEntitlementInput():
+    class AddEnterpriseSupportEntitlementInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'login', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        login = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='login')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddEnterpriseSupportEntitlementInput
+
+
+def AddLabelsToLabelableInput():
+    class AddLabelsToLabelableInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('labelable_id', 'label_ids', 'client_mutation_id')
+        labelable_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='labelableId')
+        label_ids = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ID'))), graphql_name='labelIds')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddLabelsToLabelableInput
+
+
+def AddProjectCardInput():
+    class AddProjectCardInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_column_id', 'content_id', 'note', 'client_mutation_id')
+        project_column_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectColumnId')
+        content_id = sgqlc.types.Field('ID', graphql_name='contentId')
+        note = sgqlc.types.Field('String', graphql_name='note')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddProjectCardInput
+
+
+def AddProjectColumnInput():
+    class AddProjectColumnInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'name', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddProjectColumnInput
+
+
+def AddProjectV2DraftIssueInput():
+    class AddProjectV2DraftIssueInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'title', 'body', 'assignee_ids', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        assignee_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='assigneeIds')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddProjectV2DraftIssueInput
+
+
+def AddProjectV2ItemByIdInput():
+    class AddProjectV2ItemByIdInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'content_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        content_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='contentId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddProjectV2ItemByIdInput
+
+
+def AddPullRequestReviewCommentInput():
+    class AddPullRequestReviewCommentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'pull_request_review_id', 'commit_oid', 'body', 'path', 'position', 'in_reply_to', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field('ID', graphql_name='pullRequestId')
+        pull_request_review_id = sgqlc.types.Field('ID', graphql_name='pullRequestReviewId')
+        commit_oid = sgqlc.types.Field('GitObjectID', graphql_name='commitOID')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        path = sgqlc.types.Field('String', graphql_name='path')
+        position = sgqlc.types.Field('Int', graphql_name='position')
+        in_reply_to = sgqlc.types.Field('ID', graphql_name='inReplyTo')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddPullRequestReviewCommentInput
+
+
+def AddPullRequestReviewInput():
+    class AddPullRequestReviewInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'commit_oid', 'body', 'event', 'comments', 'threads', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        commit_oid = sgqlc.types.Field('GitObjectID', graphql_name='commitOID')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        event = sgqlc.types.Field('PullRequestReviewEvent', graphql_name='event')
+        comments = sgqlc.types.Field(sgqlc.types.list_of('DraftPullRequestReviewComment'), graphql_name='comments')
+        threads = sgqlc.types.Field(sgqlc.types.list_of('DraftPullRequestReviewThread'), graphql_name='threads')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddPullRequestReviewInput
+
+
+def AddPullRequestReviewThreadInput():
+    class AddPullRequestReviewThreadInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('path', 'body', 'pull_request_id', 'pull_request_review_id', 'line', 'side', 'start_line', 'start_side', 'subject_type', 'client_mutation_id')
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        pull_request_id = sgqlc.types.Field('ID', graphql_name='pullRequestId')
+        pull_request_review_id = sgqlc.types.Field('ID', graphql_name='pullRequestReviewId')
+        line = sgqlc.types.Field('Int', graphql_name='line')
+        side = sgqlc.types.Field('DiffSide', graphql_name='side')
+        start_line = sgqlc.types.Field('Int', graphql_name='startLine')
+        start_side = sgqlc.types.Field('DiffSide', graphql_name='startSide')
+        subject_type = sgqlc.types.Field('PullRequestReviewThreadSubjectType', graphql_name='subjectType')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddPullRequestReviewThreadInput
+
+
+def AddReactionInput():
+    class AddReactionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('subject_id', 'content', 'client_mutation_id')
+        subject_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='subjectId')
+        content = sgqlc.types.Field(sgqlc.types.non_null('ReactionContent'), graphql_name='content')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddReactionInput
+
+
+def AddStarInput():
+    class AddStarInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('starrable_id', 'client_mutation_id')
+        starrable_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='starrableId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddStarInput
+
+
+def AddUpvoteInput():
+    class AddUpvoteInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('subject_id', 'client_mutation_id')
+        subject_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='subjectId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddUpvoteInput
+
+
+def AddVerifiableDomainInput():
+    class AddVerifiableDomainInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('owner_id', 'domain', 'client_mutation_id')
+        owner_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ownerId')
+        domain = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='domain')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddVerifiableDomainInput
+
+
+def ApproveDeploymentsInput():
+    class ApproveDeploymentsInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('workflow_run_id', 'environment_ids', 'comment', 'client_mutation_id')
+        workflow_run_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='workflowRunId')
+        environment_ids = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ID'))), graphql_name='environmentIds')
+        comment = sgqlc.types.Field('String', graphql_name='comment')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return ApproveDeploymentsInput
+
+
+def ApproveVerifiableDomainInput():
+    class ApproveVerifiableDomainInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return ApproveVerifiableDomainInput
+
+
+def ArchiveProjectV2ItemInput():
+    class ArchiveProjectV2ItemInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'item_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        item_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='itemId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return ArchiveProjectV2ItemInput
+
+
+def ArchiveRepositoryInput():
+    class ArchiveRepositoryInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return ArchiveRepositoryInput
+
+
+def AuditLogOrder():
+    class AuditLogOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field('AuditLogOrderField', graphql_name='field')
+        direction = sgqlc.types.Field('OrderDirection', graphql_name='direction')
+    return AuditLogOrder
+
+
+def BranchNamePatternParametersInput():
+    class BranchNamePatternParametersInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'negate', 'operator', 'pattern')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        negate = sgqlc.types.Field('Boolean', graphql_name='negate')
+        operator = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='operator')
+        pattern = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='pattern')
+    return BranchNamePatternParametersInput
+
+
+def BulkSponsorship():
+    class BulkSponsorship(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('sponsorable_id', 'sponsorable_login', 'amount')
+        sponsorable_id = sgqlc.types.Field('ID', graphql_name='sponsorableId')
+        sponsorable_login = sgqlc.types.Field('String', graphql_name='sponsorableLogin')
+        amount = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='amount')
+    return BulkSponsorship
+
+
+def CancelEnterpriseAdminInvitationInput():
+    class CancelEnterpriseAdminInvitationInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('invitation_id', 'client_mutation_id')
+        invitation_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='invitationId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CancelEnterpriseAdminInvitationInput
+
+
+def CancelSponsorshipInput():
+    class CancelSponsorshipInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('sponsor_id', 'sponsor_login', 'sponsorable_id', 'sponsorable_login', 'client_mutation_id')
+        sponsor_id = sgqlc.types.Field('ID', graphql_name='sponsorId')
+        sponsor_login = sgqlc.types.Field('String', graphql_name='sponsorLogin')
+        sponsorable_id = sgqlc.types.Field('ID', graphql_name='sponsorableId')
+        sponsorable_login = sgqlc.types.Field('String', graphql_name='sponsorableLogin')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CancelSponsorshipInput
+
+
+def ChangeUserStatusInput():
+    class ChangeUserStatusInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('emoji', 'message', 'organization_id', 'limited_availability', 'expires_at', 'client_mutation_id')
+        emoji = sgqlc.types.Field('String', graphql_name='emoji')
+        message = sgqlc.types.Field('String', graphql_name='message')
+        organization_id = sgqlc.types.Field('ID', graphql_name='organizationId')
+        limited_availability = sgqlc.types.Field('Boolean', graphql_name='limitedAvailability')
+        expires_at = sgqlc.types.Field('DateTime', graphql_name='expiresAt')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return ChangeUserStatusInput
+
+
+def CheckAnnotationData():
+    class CheckAnnotationData(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('path', 'location', 'annotation_level', 'message', 'title', 'raw_details')
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+        location = sgqlc.types.Field(sgqlc.types.non_null('CheckAnnotationRange'), graphql_name='location')
+        annotation_level = sgqlc.types.Field(sgqlc.types.non_null('CheckAnnotationLevel'), graphql_name='annotationLevel')
+        message = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='message')
+        title = sgqlc.types.Field('String', graphql_name='title')
+        raw_details = sgqlc.types.Field('String', graphql_name='rawDetails')
+    return CheckAnnotationData
+
+
+def CheckAnnotationRange():
+    class CheckAnnotationRange(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('start_line', 'start_column', 'end_line', 'end_column')
+        start_line = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='startLine')
+        start_column = sgqlc.types.Field('Int', graphql_name='startColumn')
+        end_line = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='endLine')
+        end_column = sgqlc.types.Field('Int', graphql_name='endColumn')
+    return CheckAnnotationRange
+
+
+def CheckRunAction():
+    class CheckRunAction(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('label', 'description', 'identifier')
+        label = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='label')
+        description = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='description')
+        identifier = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='identifier')
+    return CheckRunAction
+
+
+def CheckRunFilter():
+    class CheckRunFilter(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('check_type', 'app_id', 'check_name', 'status', 'statuses', 'conclusions')
+        check_type = sgqlc.types.Field('CheckRunType', graphql_name='checkType')
+        app_id = sgqlc.types.Field('Int', graphql_name='appId')
+        check_name = sgqlc.types.Field('String', graphql_name='checkName')
+        status = sgqlc.types.Field('CheckStatusState', graphql_name='status')
+        statuses = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('CheckStatusState')), graphql_name='statuses')
+        conclusions = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('CheckConclusionState')), graphql_name='conclusions')
+    return CheckRunFilter
+
+
+def CheckRunOutput():
+    class CheckRunOutput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('title', 'summary', 'text', 'annotations', 'images')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        summary = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='summary')
+        text = sgqlc.types.Field('String', graphql_name='text')
+        annotations = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('CheckAnnotationData')), graphql_name='annotations')
+        images = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('CheckRunOutputImage')), graphql_name='images')
+    return CheckRunOutput
+
+
+def CheckRunOutputImage():
+    class CheckRunOutputImage(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('alt', 'image_url', 'caption')
+        alt = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='alt')
+        image_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='imageUrl')
+        caption = sgqlc.types.Field('String', graphql_name='caption')
+    return CheckRunOutputImage
+
+
+def CheckSuiteAutoTriggerPreference():
+    class CheckSuiteAutoTriggerPreference(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('app_id', 'setting')
+        app_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='appId')
+        setting = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='setting')
+    return CheckSuiteAutoTriggerPreference
+
+
+def CheckSuiteFilter():
+    class CheckSuiteFilter(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('app_id', 'check_name')
+        app_id = sgqlc.types.Field('Int', graphql_name='appId')
+        check_name = sgqlc.types.Field('String', graphql_name='checkName')
+    return CheckSuiteFilter
+
+
+def ClearLabelsFromLabelableInput():
+    class ClearLabelsFromLabelableInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('labelable_id', 'client_mutation_id')
+        labelable_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='labelableId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return ClearLabelsFromLabelableInput
+
+
+def ClearProjectV2ItemFieldValueInput():
+    class ClearProjectV2ItemFieldValueInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'item_id', 'field_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        item_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='itemId')
+        field_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='fieldId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return ClearProjectV2ItemFieldValueInput
+
+
+def CloneProjectInput():
+    class CloneProjectInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('target_owner_id', 'source_id', 'include_workflows', 'name', 'body', 'public', 'client_mutation_id')
+        target_owner_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='targetOwnerId')
+        source_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='sourceId')
+        include_workflows = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='includeWorkflows')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        public = sgqlc.types.Field('Boolean', graphql_name='public')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CloneProjectInput
+
+
+def CloneTemplateRepositoryInput():
+    class CloneTemplateRepositoryInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'name', 'owner_id', 'description', 'visibility', 'include_all_branches', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        owner_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ownerId')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        visibility = sgqlc.types.Field(sgqlc.types.non_null('RepositoryVisibility'), graphql_name='visibility')
+        include_all_branches = sgqlc.types.Field('Boolean', graphql_name='includeAllBranches')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CloneTemplateRepositoryInput
+
+
+def CloseDiscussionInput():
+    class CloseDiscussionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('discussion_id', 'reason', 'client_mutation_id')
+        discussion_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='discussionId')
+        reason = sgqlc.types.Field('DiscussionCloseReason', graphql_name='reason')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CloseDiscussionInput
+
+
+def CloseIssueInput():
+    class CloseIssueInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('issue_id', 'state_reason', 'client_mutation_id')
+        issue_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='issueId')
+        state_reason = sgqlc.types.Field('IssueClosedStateReason', graphql_name='stateReason')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CloseIssueInput
+
+
+def ClosePullRequestInput():
+    class ClosePullRequestInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return ClosePullRequestInput
+
+
+def CommitAuthor():
+    class CommitAuthor(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'emails')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        emails = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='emails')
+    return CommitAuthor
+
+
+def CommitAuthorEmailPatternParametersInput():
+    class CommitAuthorEmailPatternParametersInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'negate', 'operator', 'pattern')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        negate = sgqlc.types.Field('Boolean', graphql_name='negate')
+        operator = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='operator')
+        pattern = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='pattern')
+    return CommitAuthorEmailPatternParametersInput
+
+
+def CommitContributionOrder():
+    class CommitContributionOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('CommitContributionOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return CommitContributionOrder
+
+
+def CommitMessage():
+    class CommitMessage(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('headline', 'body')
+        headline = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='headline')
+        body = sgqlc.types.Field('String', graphql_name='body')
+    return CommitMessage
+
+
+def CommitMessagePatternParametersInput():
+    class CommitMessagePatternParametersInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'negate', 'operator', 'pattern')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        negate = sgqlc.types.Field('Boolean', graphql_name='negate')
+        operator = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='operator')
+        pattern = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='pattern')
+    return CommitMessagePatternParametersInput
+
+
+def CommittableBranch():
+    class CommittableBranch(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'repository_name_with_owner', 'branch_name')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        repository_name_with_owner = sgqlc.types.Field('String', graphql_name='repositoryNameWithOwner')
+        branch_name = sgqlc.types.Field('String', graphql_name='branchName')
+    return CommittableBranch
+
+
+def CommitterEmailPatternParametersInput():
+    class CommitterEmailPatternParametersInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'negate', 'operator', 'pattern')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        negate = sgqlc.types.Field('Boolean', graphql_name='negate')
+        operator = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='operator')
+        pattern = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='pattern')
+    return CommitterEmailPatternParametersInput
+
+
+def ContributionOrder():
+    class ContributionOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('direction',)
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return ContributionOrder
+
+
+def ConvertProjectCardNoteToIssueInput():
+    class ConvertProjectCardNoteToIssueInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_card_id', 'repository_id', 'title', 'body', 'client_mutation_id')
+        project_card_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectCardId')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        title = sgqlc.types.Field('String', graphql_name='title')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return ConvertProjectCardNoteToIssueInput
+
+
+def ConvertPullRequestToDraftInput():
+    class ConvertPullRequestToDraftInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return ConvertPullRequestToDraftInput
+
+
+def CopyProjectV2Input():
+    class CopyProjectV2Input(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'owner_id', 'title', 'include_draft_issues', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        owner_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ownerId')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        include_draft_issues = sgqlc.types.Field('Boolean', graphql_name='includeDraftIssues')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CopyProjectV2Input
+
+
+def CreateAttributionInvitationInput():
+    class CreateAttributionInvitationInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('owner_id', 'source_id', 'target_id', 'client_mutation_id')
+        owner_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ownerId')
+        source_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='sourceId')
+        target_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='targetId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateAttributionInvitationInput
+
+
+def CreateBranchProtectionRuleInput():
+    class CreateBranchProtectionRuleInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'pattern', 'requires_approving_reviews', 'required_approving_review_count', 'requires_commit_signatures', 'requires_linear_history', 'blocks_creations', 'allows_force_pushes', 'allows_deletions', 'is_admin_enforced', 'requires_status_checks', 'requires_strict_status_checks', 'requires_code_owner_reviews', 'dismisses_stale_reviews', 'restricts_review_dismissals', 'review_dismissal_actor_ids', 'bypass_pull_request_actor_ids', 'bypass_force_push_actor_ids', 'restricts_pushes', 'push_actor_ids', 'required_status_check_contexts', 'required_status_checks', 'requires_deployments', 'required_deployment_environments', 'requires_conversation_resolution', 'require_last_push_approval', 'lock_branch', 'lock_allows_fetch_and_merge', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        pattern = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='pattern')
+        requires_approving_reviews = sgqlc.types.Field('Boolean', graphql_name='requiresApprovingReviews')
+        required_approving_review_count = sgqlc.types.Field('Int', graphql_name='requiredApprovingReviewCount')
+        requires_commit_signatures = sgqlc.types.Field('Boolean', graphql_name='requiresCommitSignatures')
+        requires_linear_history = sgqlc.types.Field('Boolean', graphql_name='requiresLinearHistory')
+        blocks_creations = sgqlc.types.Field('Boolean', graphql_name='blocksCreations')
+        allows_force_pushes = sgqlc.types.Field('Boolean', graphql_name='allowsForcePushes')
+        allows_deletions = sgqlc.types.Field('Boolean', graphql_name='allowsDeletions')
+        is_admin_enforced = sgqlc.types.Field('Boolean', graphql_name='isAdminEnforced')
+        requires_status_checks = sgqlc.types.Field('Boolean', graphql_name='requiresStatusChecks')
+        requires_strict_status_checks = sgqlc.types.Field('Boolean', graphql_name='requiresStrictStatusChecks')
+        requires_code_owner_reviews = sgqlc.types.Field('Boolean', graphql_name='requiresCodeOwnerReviews')
+        dismisses_stale_reviews = sgqlc.types.Field('Boolean', graphql_name='dismissesStaleReviews')
+        restricts_review_dismissals = sgqlc.types.Field('Boolean', graphql_name='restrictsReviewDismissals')
+        review_dismissal_actor_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='reviewDismissalActorIds')
+        bypass_pull_request_actor_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='bypassPullRequestActorIds')
+        bypass_force_push_actor_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='bypassForcePushActorIds')
+        restricts_pushes = sgqlc.types.Field('Boolean', graphql_name='restrictsPushes')
+        push_actor_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='pushActorIds')
+        required_status_check_contexts = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='requiredStatusCheckContexts')
+        required_status_checks = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('RequiredStatusCheckInput')), graphql_name='requiredStatusChecks')
+        requires_deployments = sgqlc.types.Field('Boolean', graphql_name='requiresDeployments')
+        required_deployment_environments = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='requiredDeploymentEnvironments')
+        requires_conversation_resolution = sgqlc.types.Field('Boolean', graphql_name='requiresConversationResolution')
+        require_last_push_approval = sgqlc.types.Field('Boolean', graphql_name='requireLastPushApproval')
+        lock_branch = sgqlc.types.Field('Boolean', graphql_name='lockBranch')
+        lock_allows_fetch_and_merge = sgqlc.types.Field('Boolean', graphql_name='lockAllowsFetchAndMerge')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateBranchProtectionRuleInput
+
+
+def CreateCheckRunInput():
+    class CreateCheckRunInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'name', 'head_sha', 'details_url', 'external_id', 'status', 'started_at', 'conclusion', 'completed_at', 'output', 'actions', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        head_sha = sgqlc.types.Field(sgqlc.types.non_null('GitObjectID'), graphql_name='headSha')
+        details_url = sgqlc.types.Field('URI', graphql_name='detailsUrl')
+        external_id = sgqlc.types.Field('String', graphql_name='externalId')
+        status = sgqlc.types.Field('RequestableCheckStatusState', graphql_name='status')
+        started_at = sgqlc.types.Field('DateTime', graphql_name='startedAt')
+        conclusion = sgqlc.types.Field('CheckConclusionState', graphql_name='conclusion')
+        completed_at = sgqlc.types.Field('DateTime', graphql_name='completedAt')
+        output = sgqlc.types.Field('CheckRunOutput', graphql_name='output')
+        actions = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('CheckRunAction')), graphql_name='actions')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateCheckRunInput
+
+
+def CreateCheckSuiteInput():
+    class CreateCheckSuiteInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'head_sha', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        head_sha = sgqlc.types.Field(sgqlc.types.non_null('GitObjectID'), graphql_name='headSha')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateCheckSuiteInput
+
+
+def CreateCommitOnBranchInput():
+    class CreateCommitOnBranchInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('branch', 'file_changes', 'message', 'expected_head_oid', 'client_mutation_id')
+        branch = sgqlc.types.Field(sgqlc.types.non_null('CommittableBranch'), graphql_name='branch')
+        file_changes = sgqlc.types.Field('FileChanges', graphql_name='fileChanges')
+        message = sgqlc.types.Field(sgqlc.types.non_null('CommitMessage'), graphql_name='message')
+        expected_head_oid = sgqlc.types.Field(sgqlc.types.non_null('GitObjectID'), graphql_name='expectedHeadOid')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateCommitOnBranchInput
+
+
+def CreateDiscussionInput():
+    class CreateDiscussionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'title', 'body', 'category_id', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        category_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='categoryId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateDiscussionInput
+
+
+def CreateEnterpriseOrganizationInput():
+    class CreateEnterpriseOrganizationInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'login', 'profile_name', 'billing_email', 'admin_logins', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        login = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='login')
+        profile_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='profileName')
+        billing_email = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='billingEmail')
+        admin_logins = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='adminLogins')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateEnterpriseOrganizationInput
+
+
+def CreateEnvironmentInput():
+    class CreateEnvironmentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'name', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateEnvironmentInput
+
+
+def CreateIpAllowListEntryInput():
+    class CreateIpAllowListEntryInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('owner_id', 'allow_list_value', 'name', 'is_active', 'client_mutation_id')
+        owner_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ownerId')
+        allow_list_value = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='allowListValue')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        is_active = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isActive')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateIpAllowListEntryInput
+
+
+def CreateIssueInput():
+    class CreateIssueInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'title', 'body', 'assignee_ids', 'milestone_id', 'label_ids', 'project_ids', 'issue_template', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        assignee_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='assigneeIds')
+        milestone_id = sgqlc.types.Field('ID', graphql_name='milestoneId')
+        label_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='labelIds')
+        project_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='projectIds')
+        issue_template = sgqlc.types.Field('String', graphql_name='issueTemplate')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateIssueInput
+
+
+def CreateLinkedBranchInput():
+    class CreateLinkedBranchInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('issue_id', 'oid', 'name', 'repository_id', 'client_mutation_id')
+        issue_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='issueId')
+        oid = sgqlc.types.Field(sgqlc.types.non_null('GitObjectID'), graphql_name='oid')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        repository_id = sgqlc.types.Field('ID', graphql_name='repositoryId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateLinkedBranchInput
+
+
+def CreateMigrationSourceInput():
+    class CreateMigrationSourceInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'url', 'access_token', 'type', 'owner_id', 'github_pat', 'client_mutation_id')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        url = sgqlc.types.Field('String', graphql_name='url')
+        access_token = sgqlc.types.Field('String', graphql_name='accessToken')
+        type = sgqlc.types.Field(sgqlc.types.non_null('MigrationSourceType'), graphql_name='type')
+        owner_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ownerId')
+        github_pat = sgqlc.types.Field('String', graphql_name='githubPat')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateMigrationSourceInput
+
+
+def CreateProjectInput():
+    class CreateProjectInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('owner_id', 'name', 'body', 'template', 'repository_ids', 'client_mutation_id')
+        owner_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ownerId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        template = sgqlc.types.Field('ProjectTemplate', graphql_name='template')
+        repository_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='repositoryIds')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateProjectInput
+
+
+def CreateProjectV2FieldInput():
+    class CreateProjectV2FieldInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'data_type', 'name', 'single_select_options', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        data_type = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2CustomFieldType'), graphql_name='dataType')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        single_select_options = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ProjectV2SingleSelectFieldOptionInput')), graphql_name='singleSelectOptions')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateProjectV2FieldInput
+
+
+def CreateProjectV2Input():
+    class CreateProjectV2Input(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('owner_id', 'title', 'repository_id', 'team_id', 'client_mutation_id')
+        owner_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ownerId')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        repository_id = sgqlc.types.Field('ID', graphql_name='repositoryId')
+        team_id = sgqlc.types.Field('ID', graphql_name='teamId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateProjectV2Input
+
+
+def CreatePullRequestInput():
+    class CreatePullRequestInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'base_ref_name', 'head_ref_name', 'head_repository_id', 'title', 'body', 'maintainer_can_modify', 'draft', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        base_ref_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='baseRefName')
+        head_ref_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='headRefName')
+        head_repository_id = sgqlc.types.Field('ID', graphql_name='headRepositoryId')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        maintainer_can_modify = sgqlc.types.Field('Boolean', graphql_name='maintainerCanModify')
+        draft = sgqlc.types.Field('Boolean', graphql_name='draft')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreatePullRequestInput
+
+
+def CreateRefInput():
+    class CreateRefInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'name', 'oid', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        oid = sgqlc.types.Field(sgqlc.types.non_null('GitObjectID'), graphql_name='oid')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateRefInput
+
+
+def CreateRepositoryInput():
+    class CreateRepositoryInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'owner_id', 'description', 'visibility', 'template', 'homepage_url', 'has_wiki_enabled', 'has_issues_enabled', 'team_id', 'client_mutation_id')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        owner_id = sgqlc.types.Field('ID', graphql_name='ownerId')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        visibility = sgqlc.types.Field(sgqlc.types.non_null('RepositoryVisibility'), graphql_name='visibility')
+        template = sgqlc.types.Field('Boolean', graphql_name='template')
+        homepage_url = sgqlc.types.Field('URI', graphql_name='homepageUrl')
+        has_wiki_enabled = sgqlc.types.Field('Boolean', graphql_name='hasWikiEnabled')
+        has_issues_enabled = sgqlc.types.Field('Boolean', graphql_name='hasIssuesEnabled')
+        team_id = sgqlc.types.Field('ID', graphql_name='teamId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateRepositoryInput
+
+
+def CreateRepositoryRulesetInput():
+    class CreateRepositoryRulesetInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('source_id', 'name', 'target', 'rules', 'conditions', 'enforcement', 'bypass_mode', 'bypass_actor_ids', 'client_mutation_id')
+        source_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='sourceId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        target = sgqlc.types.Field('RepositoryRulesetTarget', graphql_name='target')
+        rules = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('RepositoryRuleInput')), graphql_name='rules')
+        conditions = sgqlc.types.Field(sgqlc.types.non_null('RepositoryRuleConditionsInput'), graphql_name='conditions')
+        enforcement = sgqlc.types.Field(sgqlc.types.non_null('RuleEnforcement'), graphql_name='enforcement')
+        bypass_mode = sgqlc.types.Field('RuleBypassMode', graphql_name='bypassMode')
+        bypass_actor_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='bypassActorIds')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateRepositoryRulesetInput
+
+
+def CreateSponsorsListingInput():
+    class CreateSponsorsListingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('sponsorable_login', 'fiscal_host_login', 'fiscally_hosted_project_profile_url', 'billing_country_or_region_code', 'residence_country_or_region_code', 'contact_email', 'full_description', 'client_mutation_id')
+        sponsorable_login = sgqlc.types.Field('String', graphql_name='sponsorableLogin')
+        fiscal_host_login = sgqlc.types.Field('String', graphql_name='fiscalHostLogin')
+        fiscally_hosted_project_profile_url = sgqlc.types.Field('String', graphql_name='fiscallyHostedProjectProfileUrl')
+        billing_country_or_region_code = sgqlc.types.Field('SponsorsCountryOrRegionCode', graphql_name='billingCountryOrRegionCode')
+        residence_country_or_region_code = sgqlc.types.Field('SponsorsCountryOrRegionCode', graphql_name='residenceCountryOrRegionCode')
+        contact_email = sgqlc.types.Field('String', graphql_name='contactEmail')
+        full_description = sgqlc.types.Field('String', graphql_name='fullDescription')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateSponsorsListingInput
+
+
+def CreateSponsorsTierInput():
+    class CreateSponsorsTierInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('sponsorable_id', 'sponsorable_login', 'amount', 'is_recurring', 'repository_id', 'repository_owner_login', 'repository_name', 'welcome_message', 'description', 'publish', 'client_mutation_id')
+        sponsorable_id = sgqlc.types.Field('ID', graphql_name='sponsorableId')
+        sponsorable_login = sgqlc.types.Field('String', graphql_name='sponsorableLogin')
+        amount = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='amount')
+        is_recurring = sgqlc.types.Field('Boolean', graphql_name='isRecurring')
+        repository_id = sgqlc.types.Field('ID', graphql_name='repositoryId')
+        repository_owner_login = sgqlc.types.Field('String', graphql_name='repositoryOwnerLogin')
+        repository_name = sgqlc.types.Field('String', graphql_name='repositoryName')
+        welcome_message = sgqlc.types.Field('String', graphql_name='welcomeMessage')
+        description = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='description')
+        publish = sgqlc.types.Field('Boolean', graphql_name='publish')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateSponsorsTierInput
+
+
+def CreateSponsorshipInput():
+    class CreateSponsorshipInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('sponsor_id', 'sponsor_login', 'sponsorable_id', 'sponsorable_login', 'tier_id', 'amount', 'is_recurring', 'receive_emails', 'privacy_level', 'client_mutation_id')
+        sponsor_id = sgqlc.types.Field('ID', graphql_name='sponsorId')
+        sponsor_login = sgqlc.types.Field('String', graphql_name='sponsorLogin')
+        sponsorable_id = sgqlc.types.Field('ID', graphql_name='sponsorableId')
+        sponsorable_login = sgqlc.types.Field('String', graphql_name='sponsorableLogin')
+        tier_id = sgqlc.types.Field('ID', graphql_name='tierId')
+        amount = sgqlc.types.Field('Int', graphql_name='amount')
+        is_recurring = sgqlc.types.Field('Boolean', graphql_name='isRecurring')
+        receive_emails = sgqlc.types.Field('Boolean', graphql_name='receiveEmails')
+        privacy_level = sgqlc.types.Field('SponsorshipPrivacy', graphql_name='privacyLevel')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateSponsorshipInput
+
+
+def CreateSponsorshipsInput():
+    class CreateSponsorshipsInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('sponsor_login', 'sponsorships', 'receive_emails', 'privacy_level', 'client_mutation_id')
+        sponsor_login = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='sponsorLogin')
+        sponsorships = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('BulkSponsorship'))), graphql_name='sponsorships')
+        receive_emails = sgqlc.types.Field('Boolean', graphql_name='receiveEmails')
+        privacy_level = sgqlc.types.Field('SponsorshipPrivacy', graphql_name='privacyLevel')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateSponsorshipsInput
+
+
+def CreateTeamDiscussionCommentInput():
+    class CreateTeamDiscussionCommentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('discussion_id', 'body', 'client_mutation_id')
+        discussion_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='discussionId')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateTeamDiscussionCommentInput
+
+
+def CreateTeamDiscussionInput():
+    class CreateTeamDiscussionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('team_id', 'title', 'body', 'private', 'client_mutation_id')
+        team_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='teamId')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        private = sgqlc.types.Field('Boolean', graphql_name='private')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateTeamDiscussionInput
+
+
+def DeclineTopicSuggestionInput():
+    class DeclineTopicSuggestionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'name', 'reason', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        reason = sgqlc.types.Field(sgqlc.types.non_null('TopicSuggestionDeclineReason'), graphql_name='reason')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeclineTopicSuggestionInput
+
+
+def DeleteBranchProtectionRuleInput():
+    class DeleteBranchProtectionRuleInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('branch_protection_rule_id', 'client_mutation_id')
+        branch_protection_rule_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='branchProtectionRuleId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteBranchProtectionRuleInput
+
+
+def DeleteDeploymentInput():
+    class DeleteDeploymentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteDeploymentInput
+
+
+def DeleteDiscussionCommentInput():
+    class DeleteDiscussionCommentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteDiscussionCommentInput
+
+
+def DeleteDiscussionInput():
+    class DeleteDiscussionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteDiscussionInput
+
+
+def DeleteEnvironmentInput():
+    class DeleteEnvironmentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteEnvironmentInput
+
+
+def DeleteIpAllowListEntryInput():
+    class DeleteIpAllowListEntryInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('ip_allow_list_entry_id', 'client_mutation_id')
+        ip_allow_list_entry_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ipAllowListEntryId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteIpAllowListEntryInput
+
+
+def DeleteIssueCommentInput():
+    class DeleteIssueCommentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteIssueCommentInput
+
+
+def DeleteIssueInput():
+    class DeleteIssueInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('issue_id', 'client_mutation_id')
+        issue_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='issueId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteIssueInput
+
+
+def DeleteLinkedBranchInput():
+    class DeleteLinkedBranchInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('linked_branch_id', 'client_mutation_id')
+        linked_branch_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='linkedBranchId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteLinkedBranchInput
+
+
+def DeleteProjectCardInput():
+    class DeleteProjectCardInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('card_id', 'client_mutation_id')
+        card_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='cardId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteProjectCardInput
+
+
+def DeleteProjectColumnInput():
+    class DeleteProjectColumnInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('column_id', 'client_mutation_id')
+        column_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='columnId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteProjectColumnInput
+
+
+def DeleteProjectInput():
+    class DeleteProjectInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteProjectInput
+
+
+def DeleteProjectV2FieldInput():
+    class DeleteProjectV2FieldInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field_id', 'client_mutation_id')
+        field_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='fieldId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteProjectV2FieldInput
+
+
+def DeleteProjectV2Input():
+    class DeleteProjectV2Input(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteProjectV2Input
+
+
+def DeleteProjectV2ItemInput():
+    class DeleteProjectV2ItemInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'item_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        item_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='itemId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteProjectV2ItemInput
+
+
+def DeleteProjectV2WorkflowInput():
+    class DeleteProjectV2WorkflowInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('workflow_id', 'client_mutation_id')
+        workflow_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='workflowId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteProjectV2WorkflowInput
+
+
+def DeletePullRequestReviewCommentInput():
+    class DeletePullRequestReviewCommentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeletePullRequestReviewCommentInput
+
+
+def DeletePullRequestReviewInput():
+    class DeletePullRequestReviewInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_review_id', 'client_mutation_id')
+        pull_request_review_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestReviewId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeletePullRequestReviewInput
+
+
+def DeleteRefInput():
+    class DeleteRefInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('ref_id', 'client_mutation_id')
+        ref_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='refId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteRefInput
+
+
+def DeleteRepositoryRulesetInput():
+    class DeleteRepositoryRulesetInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_ruleset_id', 'client_mutation_id')
+        repository_ruleset_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryRulesetId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteRepositoryRulesetInput
+
+
+def DeleteTeamDiscussionCommentInput():
+    class DeleteTeamDiscussionCommentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteTeamDiscussionCommentInput
+
+
+def DeleteTeamDiscussionInput():
+    class DeleteTeamDiscussionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteTeamDiscussionInput
+
+
+def DeleteVerifiableDomainInput():
+    class DeleteVerifiableDomainInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteVerifiableDomainInput
+
+
+def DeploymentOrder():
+    class DeploymentOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('DeploymentOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return DeploymentOrder
+
+
+def DequeuePullRequestInput():
+    class DequeuePullRequestInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DequeuePullRequestInput
+
+
+def DisablePullRequestAutoMergeInput():
+    class DisablePullRequestAutoMergeInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DisablePullRequestAutoMergeInput
+
+
+def DiscussionOrder():
+    class DiscussionOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('DiscussionOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return DiscussionOrder
+
+
+def DiscussionPollOptionOrder():
+    class DiscussionPollOptionOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('DiscussionPollOptionOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return DiscussionPollOptionOrder
+
+
+def DismissPullRequestReviewInput():
+    class DismissPullRequestReviewInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_review_id', 'message', 'client_mutation_id')
+        pull_request_review_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestReviewId')
+        message = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DismissPullRequestReviewInput
+
+
+def DismissRepositoryVulnerabilityAlertInput():
+    class DismissRepositoryVulnerabilityAlertInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_vulnerability_alert_id', 'dismiss_reason', 'client_mutation_id')
+        repository_vulnerability_alert_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryVulnerabilityAlertId')
+        dismiss_reason = sgqlc.types.Field(sgqlc.types.non_null('DismissReason'), graphql_name='dismissReason')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DismissRepositoryVulnerabilityAlertInput
+
+
+def DraftPullRequestReviewComment():
+    class DraftPullRequestReviewComment(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('path', 'position', 'body')
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+        position = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='position')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+    return DraftPullRequestReviewComment
+
+
+def DraftPullRequestReviewThread():
+    class DraftPullRequestReviewThread(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('path', 'line', 'side', 'start_line', 'start_side', 'body')
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+        line = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='line')
+        side = sgqlc.types.Field('DiffSide', graphql_name='side')
+        start_line = sgqlc.types.Field('Int', graphql_name='startLine')
+        start_side = sgqlc.types.Field('DiffSide', graphql_name='startSide')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+    return DraftPullRequestReviewThread
+
+
+def EnablePullRequestAutoMergeInput():
+    class EnablePullRequestAutoMergeInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'commit_headline', 'commit_body', 'merge_method', 'author_email', 'expected_head_oid', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        commit_headline = sgqlc.types.Field('String', graphql_name='commitHeadline')
+        commit_body = sgqlc.types.Field('String', graphql_name='commitBody')
+        merge_method = sgqlc.types.Field('PullRequestMergeMethod', graphql_name='mergeMethod')
+        author_email = sgqlc.types.Field('String', graphql_name='authorEmail')
+        expected_head_oid = sgqlc.types.Field('GitObjectID', graphql_name='expectedHeadOid')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return EnablePullRequestAutoMergeInput
+
+
+def EnqueuePullRequestInput():
+    class EnqueuePullRequestInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'jump', 'expected_head_oid', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        jump = sgqlc.types.Field('Boolean', graphql_name='jump')
+        expected_head_oid = sgqlc.types.Field('GitObjectID', graphql_name='expectedHeadOid')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return EnqueuePullRequestInput
+
+
+def EnterpriseAdministratorInvitationOrder():
+    class EnterpriseAdministratorInvitationOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseAdministratorInvitationOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return EnterpriseAdministratorInvitationOrder
+
+
+def EnterpriseMemberOrder():
+    class EnterpriseMemberOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseMemberOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return EnterpriseMemberOrder
+
+
+def EnterpriseServerInstallationOrder():
+    class EnterpriseServerInstallationOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseServerInstallationOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return EnterpriseServerInstallationOrder
+
+
+def EnterpriseServerUserAccountEmailOrder():
+    class EnterpriseServerUserAccountEmailOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseServerUserAccountEmailOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return EnterpriseServerUserAccountEmailOrder
+
+
+def EnterpriseServerUserAccountOrder():
+    class EnterpriseServerUserAccountOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseServerUserAccountOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return EnterpriseServerUserAccountOrder
+
+
+def EnterpriseServerUserAccountsUploadOrder():
+    class EnterpriseServerUserAccountsUploadOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseServerUserAccountsUploadOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return EnterpriseServerUserAccountsUploadOrder
+
+
+def FileAddition():
+    class FileAddition(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('path', 'contents')
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+        contents = sgqlc.types.Field(sgqlc.types.non_null('Base64String'), graphql_name='contents')
+    return FileAddition
+
+
+def FileChanges():
+    class FileChanges(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('deletions', 'additions')
+        deletions = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('FileDeletion')), graphql_name='deletions')
+        additions = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('FileAddition')), graphql_name='additions')
+    return FileChanges
+
+
+def FileDeletion():
+    class FileDeletion(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('path',)
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+    return FileDeletion
+
+
+def FollowOrganizationInput():
+    class FollowOrganizationInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('organization_id', 'client_mutation_id')
+        organization_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='organizationId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return FollowOrganizationInput
+
+
+def FollowUserInput():
+    class FollowUserInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('user_id', 'client_mutation_id')
+        user_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='userId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return FollowUserInput
+
+
+def GistOrder():
+    class GistOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('GistOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return GistOrder
+
+
+def GrantEnterpriseOrganizationsMigratorRoleInput():
+    class GrantEnterpriseOrganizationsMigratorRoleInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'login', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        login = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='login')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return GrantEnterpriseOrganizationsMigratorRoleInput
+
+
+def GrantMigratorRoleInput():
+    class GrantMigratorRoleInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('organization_id', 'actor', 'actor_type', 'client_mutation_id')
+        organization_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='organizationId')
+        actor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='actor')
+        actor_type = sgqlc.types.Field(sgqlc.types.non_null('ActorType'), graphql_name='actorType')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return GrantMigratorRoleInput
+
+
+def InviteEnterpriseAdminInput():
+    class InviteEnterpriseAdminInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'invitee', 'email', 'role', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        invitee = sgqlc.types.Field('String', graphql_name='invitee')
+        email = sgqlc.types.Field('String', graphql_name='email')
+        role = sgqlc.types.Field('EnterpriseAdministratorRole', graphql_name='role')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return InviteEnterpriseAdminInput
+
+
+def IpAllowListEntryOrder():
+    class IpAllowListEntryOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('IpAllowListEntryOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return IpAllowListEntryOrder
+
+
+def IssueCommentOrder():
+    class IssueCommentOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('IssueCommentOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return IssueCommentOrder
+
+
+def IssueFilters():
+    class IssueFilters(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('assignee', 'created_by', 'labels', 'mentioned', 'milestone', 'milestone_number', 'since', 'states', 'viewer_subscribed')
+        assignee = sgqlc.types.Field('String', graphql_name='assignee')
+        created_by = sgqlc.types.Field('String', graphql_name='createdBy')
+        labels = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='labels')
+        mentioned = sgqlc.types.Field('String', graphql_name='mentioned')
+        milestone = sgqlc.types.Field('String', graphql_name='milestone')
+        milestone_number = sgqlc.types.Field('String', graphql_name='milestoneNumber')
+        since = sgqlc.types.Field('DateTime', graphql_name='since')
+        states = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('IssueState')), graphql_name='states')
+        viewer_subscribed = sgqlc.types.Field('Boolean', graphql_name='viewerSubscribed')
+    return IssueFilters
+
+
+def IssueOrder():
+    class IssueOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('IssueOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return IssueOrder
+
+
+def LabelOrder():
+    class LabelOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('LabelOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return LabelOrder
+
+
+def LanguageOrder():
+    class LanguageOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('LanguageOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return LanguageOrder
+
+
+def LinkProjectV2ToRepositoryInput():
+    class LinkProjectV2ToRepositoryInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'repository_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return LinkProjectV2ToRepositoryInput
+
+
+def LinkProjectV2ToTeamInput():
+    class LinkProjectV2ToTeamInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'team_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        team_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='teamId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return LinkProjectV2ToTeamInput
+
+
+def LinkRepositoryToProjectInput():
+    class LinkRepositoryToProjectInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'repository_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return LinkRepositoryToProjectInput
+
+
+def LockLockableInput():
+    class LockLockableInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('lockable_id', 'lock_reason', 'client_mutation_id')
+        lockable_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='lockableId')
+        lock_reason = sgqlc.types.Field('LockReason', graphql_name='lockReason')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return LockLockableInput
+
+
+def MannequinOrder():
+    class MannequinOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('MannequinOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return MannequinOrder
+
+
+def MarkDiscussionCommentAsAnswerInput():
+    class MarkDiscussionCommentAsAnswerInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return MarkDiscussionCommentAsAnswerInput
+
+
+def MarkFileAsViewedInput():
+    class MarkFileAsViewedInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'path', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return MarkFileAsViewedInput
+
+
+def MarkProjectV2AsTemplateInput():
+    class MarkProjectV2AsTemplateInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return MarkProjectV2AsTemplateInput
+
+
+def MarkPullRequestReadyForReviewInput():
+    class MarkPullRequestReadyForReviewInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return MarkPullRequestReadyForReviewInput
+
+
+def MergeBranchInput():
+    class MergeBranchInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'base', 'head', 'commit_message', 'author_email', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        base = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='base')
+        head = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='head')
+        commit_message = sgqlc.types.Field('String', graphql_name='commitMessage')
+        author_email = sgqlc.types.Field('String', graphql_name='authorEmail')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return MergeBranchInput
+
+
+def MergePullRequestInput():
+    class MergePullRequestInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'commit_headline', 'commit_body', 'expected_head_oid', 'merge_method', 'author_email', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        commit_headline = sgqlc.types.Field('String', graphql_name='commitHeadline')
+        commit_body = sgqlc.types.Field('String', graphql_name='commitBody')
+        expected_head_oid = sgqlc.types.Field('GitObjectID', graphql_name='expectedHeadOid')
+        merge_method = sgqlc.types.Field('PullRequestMergeMethod', graphql_name='mergeMethod')
+        author_email = sgqlc.types.Field('String', graphql_name='authorEmail')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return MergePullRequestInput
+
+
+def MilestoneOrder():
+    class MilestoneOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('MilestoneOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return MilestoneOrder
+
+
+def MinimizeCommentInput():
+    class MinimizeCommentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('subject_id', 'classifier', 'client_mutation_id')
+        subject_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='subjectId')
+        classifier = sgqlc.types.Field(sgqlc.types.non_null('ReportedContentClassifiers'), graphql_name='classifier')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return MinimizeCommentInput
+
+
+def MoveProjectCardInput():
+    class MoveProjectCardInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('card_id', 'column_id', 'after_card_id', 'client_mutation_id')
+        card_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='cardId')
+        column_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='columnId')
+        after_card_id = sgqlc.types.Field('ID', graphql_name='afterCardId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return MoveProjectCardInput
+
+
+def MoveProjectColumnInput():
+    class MoveProjectColumnInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('column_id', 'after_column_id', 'client_mutation_id')
+        column_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='columnId')
+        after_column_id = sgqlc.types.Field('ID', graphql_name='afterColumnId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return MoveProjectColumnInput
+
+
+def OrgEnterpriseOwnerOrder():
+    class OrgEnterpriseOwnerOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('OrgEnterpriseOwnerOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return OrgEnterpriseOwnerOrder
+
+
+def OrganizationOrder():
+    class OrganizationOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('OrganizationOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return OrganizationOrder
+
+
+def PackageFileOrder():
+    class PackageFileOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field('PackageFileOrderField', graphql_name='field')
+        direction = sgqlc.types.Field('OrderDirection', graphql_name='direction')
+    return PackageFileOrder
+
+
+def PackageOrder():
+    class PackageOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field('PackageOrderField', graphql_name='field')
+        direction = sgqlc.types.Field('OrderDirection', graphql_name='direction')
+    return PackageOrder
+
+
+def PackageVersionOrder():
+    class PackageVersionOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field('PackageVersionOrderField', graphql_name='field')
+        direction = sgqlc.types.Field('OrderDirection', graphql_name='direction')
+    return PackageVersionOrder
+
+
+def PinIssueInput():
+    class PinIssueInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('issue_id', 'client_mutation_id')
+        issue_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='issueId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return PinIssueInput
+
+
+def ProjectOrder():
+    class ProjectOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return ProjectOrder
+
+
+def ProjectV2Collaborator():
+    class ProjectV2Collaborator(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('user_id', 'team_id', 'role')
+        user_id = sgqlc.types.Field('ID', graphql_name='userId')
+        team_id = sgqlc.types.Field('ID', graphql_name='teamId')
+        role = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2Roles'), graphql_name='role')
+    return ProjectV2Collaborator
+
+
+def ProjectV2FieldOrder():
+    class ProjectV2FieldOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2FieldOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return ProjectV2FieldOrder
+
+
+def ProjectV2FieldValue():
+    class ProjectV2FieldValue(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('text', 'number', 'date', 'single_select_option_id', 'iteration_id')
+        text = sgqlc.types.Field('String', graphql_name='text')
+        number = sgqlc.types.Field('Float', graphql_name='number')
+        date = sgqlc.types.Field('Date', graphql_name='date')
+        single_select_option_id = sgqlc.types.Field('String', graphql_name='singleSelectOptionId')
+        iteration_id = sgqlc.types.Field('String', graphql_name='iterationId')
+    return ProjectV2FieldValue
+
+
+def ProjectV2Filters():
+    class ProjectV2Filters(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('state',)
+        state = sgqlc.types.Field('ProjectV2State', graphql_name='state')
+    return ProjectV2Filters
+
+
+def ProjectV2ItemFieldValueOrder():
+    class ProjectV2ItemFieldValueOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2ItemFieldValueOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return ProjectV2ItemFieldValueOrder
+
+
+def ProjectV2ItemOrder():
+    class ProjectV2ItemOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2ItemOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return ProjectV2ItemOrder
+
+
+def ProjectV2Order():
+    class ProjectV2Order(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2OrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return ProjectV2Order
+
+
+def ProjectV2SingleSelectFieldOptionInput():
+    class ProjectV2SingleSelectFieldOptionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'color', 'description')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        color = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2SingleSelectFieldOptionColor'), graphql_name='color')
+        description = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='description')
+    return ProjectV2SingleSelectFieldOptionInput
+
+
+def ProjectV2ViewOrder():
+    class ProjectV2ViewOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2ViewOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return ProjectV2ViewOrder
+
+
+def ProjectV2WorkflowOrder():
+    class ProjectV2WorkflowOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2WorkflowsOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return ProjectV2WorkflowOrder
+
+
+def PublishSponsorsTierInput():
+    class PublishSponsorsTierInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('tier_id', 'client_mutation_id')
+        tier_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='tierId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return PublishSponsorsTierInput
+
+
+def PullRequestOrder():
+    class PullRequestOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('PullRequestOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return PullRequestOrder
+
+
+def PullRequestParametersInput():
+    class PullRequestParametersInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('dismiss_stale_reviews_on_push', 'require_code_owner_review', 'require_last_push_approval', 'required_approving_review_count', 'required_review_thread_resolution')
+        dismiss_stale_reviews_on_push = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='dismissStaleReviewsOnPush')
+        require_code_owner_review = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requireCodeOwnerReview')
+        require_last_push_approval = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requireLastPushApproval')
+        required_approving_review_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='requiredApprovingReviewCount')
+        required_review_thread_resolution = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requiredReviewThreadResolution')
+    return PullRequestParametersInput
+
+
+def ReactionOrder():
+    class ReactionOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ReactionOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return ReactionOrder
+
+
+def RefNameConditionTargetInput():
+    class RefNameConditionTargetInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('exclude', 'include')
+        exclude = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='exclude')
+        include = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='include')
+    return RefNameConditionTargetInput
+
+
+def RefOrder():
+    class RefOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('RefOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return RefOrder
+
+
+def RegenerateEnterpriseIdentityProviderRecoveryCodesInput():
+    class RegenerateEnterpriseIdentityProviderRecoveryCodesInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RegenerateEnterpriseIdentityProviderRecoveryCodesInput
+
+
+def RegenerateVerifiableDomainTokenInput():
+    class RegenerateVerifiableDomainTokenInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RegenerateVerifiableDomainTokenInput
+
+
+def RejectDeploymentsInput():
+    class RejectDeploymentsInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('workflow_run_id', 'environment_ids', 'comment', 'client_mutation_id')
+        workflow_run_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='workflowRunId')
+        environment_ids = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ID'))), graphql_name='environmentIds')
+        comment = sgqlc.types.Field('String', graphql_name='comment')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RejectDeploymentsInput
+
+
+def ReleaseOrder():
+    class ReleaseOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ReleaseOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return ReleaseOrder
+
+
+def RemoveAssigneesFromAssignableInput():
+    class RemoveAssigneesFromAssignableInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('assignable_id', 'assignee_ids', 'client_mutation_id')
+        assignable_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='assignableId')
+        assignee_ids = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ID'))), graphql_name='assigneeIds')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RemoveAssigneesFromAssignableInput
+
+
+def RemoveEnterpriseAdminInput():
+    class RemoveEnterpriseAdminInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'login', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        login = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='login')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RemoveEnterpriseAdminInput
+
+
+def RemoveEnterpriseIdentityProviderInput():
+    class RemoveEnterpriseIdentityProviderInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RemoveEnterpriseIdentityProviderInput
+
+
+def RemoveEnterpriseMemberInput():
+    class RemoveEnterpriseMemberInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'user_id', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        user_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='userId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RemoveEnterpriseMemberInput
+
+
+def RemoveEnterpriseOrganizationInput():
+    class RemoveEnterpriseOrganizationInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'organization_id', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        organization_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='organizationId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RemoveEnterpriseOrganizationInput
+
+
+def RemoveEnterpriseSupportEntitlementInput():
+    class RemoveEnterpriseSupportEntitlementInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'login', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        login = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='login')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RemoveEnterpriseSupportEntitlementInput
+
+
+def RemoveLabelsFromLabelableInput():
+    class RemoveLabelsFromLabelableInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('labelable_id', 'label_ids', 'client_mutation_id')
+        labelable_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='labelableId')
+        label_ids = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ID'))), graphql_name='labelIds')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RemoveLabelsFromLabelableInput
+
+
+def RemoveOutsideCollaboratorInput():
+    class RemoveOutsideCollaboratorInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('user_id', 'organization_id', 'client_mutation_id')
+        user_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='userId')
+        organization_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='organizationId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RemoveOutsideCollaboratorInput
+
+
+def RemoveReactionInput():
+    class RemoveReactionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('subject_id', 'content', 'client_mutation_id')
+        subject_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='subjectId')
+        content = sgqlc.types.Field(sgqlc.types.non_null('ReactionContent'), graphql_name='content')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RemoveReactionInput
+
+
+def RemoveStarInput():
+    class RemoveStarInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('starrable_id', 'client_mutation_id')
+        starrable_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='starrableId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RemoveStarInput
+
+
+def RemoveUpvoteInput():
+    class RemoveUpvoteInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('subject_id', 'client_mutation_id')
+        subject_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='subjectId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RemoveUpvoteInput
+
+
+def ReopenDiscussionInput():
+    class ReopenDiscussionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('discussion_id', 'client_mutation_id')
+        discussion_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='discussionId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return ReopenDiscussionInput
+
+
+def ReopenIssueInput():
+    class ReopenIssueInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('issue_id', 'client_mutation_id')
+        issue_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='issueId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return ReopenIssueInput
+
+
+def ReopenPullRequestInput():
+    class ReopenPullRequestInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return ReopenPullRequestInput
+
+
+def RepositoryInvitationOrder():
+    class RepositoryInvitationOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('RepositoryInvitationOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return RepositoryInvitationOrder
+
+
+def RepositoryMigrationOrder():
+    class RepositoryMigrationOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('RepositoryMigrationOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('RepositoryMigrationOrderDirection'), graphql_name='direction')
+    return RepositoryMigrationOrder
+
+
+def RepositoryNameConditionTargetInput():
+    class RepositoryNameConditionTargetInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('exclude', 'include', 'protected')
+        exclude = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='exclude')
+        include = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='include')
+        protected = sgqlc.types.Field('Boolean', graphql_name='protected')
+    return RepositoryNameConditionTargetInput
+
+
+def RepositoryOrder():
+    class RepositoryOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('RepositoryOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return RepositoryOrder
+
+
+def RepositoryRuleConditionsInput():
+    class RepositoryRuleConditionsInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('ref_name', 'repository_name')
+        ref_name = sgqlc.types.Field('RefNameConditionTargetInput', graphql_name='refName')
+        repository_name = sgqlc.types.Field('RepositoryNameConditionTargetInput', graphql_name='repositoryName')
+    return RepositoryRuleConditionsInput
+
+
+def RepositoryRuleInput():
+    class RepositoryRuleInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'type', 'parameters')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        type = sgqlc.types.Field(sgqlc.types.non_null('RepositoryRuleType'), graphql_name='type')
+        parameters = sgqlc.types.Field('RuleParametersInput', graphql_name='parameters')
+    return RepositoryRuleInput
+
+
+def RequestReviewsInput():
+    class RequestReviewsInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'user_ids', 'team_ids', 'union', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        user_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='userIds')
+        team_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='teamIds')
+        union = sgqlc.types.Field('Boolean', graphql_name='union')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RequestReviewsInput
+
+
+def RequiredDeploymentsParametersInput():
+    class RequiredDeploymentsParametersInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('required_deployment_environments',)
+        required_deployment_environments = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='requiredDeploymentEnvironments')
+    return RequiredDeploymentsParametersInput
+
+
+def RequiredStatusCheckInput():
+    class RequiredStatusCheckInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('context', 'app_id')
+        context = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='context')
+        app_id = sgqlc.types.Field('ID', graphql_name='appId')
+    return RequiredStatusCheckInput
+
+
+def RequiredStatusChecksParametersInput():
+    class RequiredStatusChecksParametersInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('required_status_checks', 'strict_required_status_checks_policy')
+        required_status_checks = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('StatusCheckConfigurationInput'))), graphql_name='requiredStatusChecks')
+        strict_required_status_checks_policy = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='strictRequiredStatusChecksPolicy')
+    return RequiredStatusChecksParametersInput
+
+
+def RerequestCheckSuiteInput():
+    class RerequestCheckSuiteInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'check_suite_id', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        check_suite_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='checkSuiteId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RerequestCheckSuiteInput
+
+
+def ResolveReviewThreadInput():
+    class ResolveReviewThreadInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('thread_id', 'client_mutation_id')
+        thread_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='threadId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return ResolveReviewThreadInput
+
+
+def RetireSponsorsTierInput():
+    class RetireSponsorsTierInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('tier_id', 'client_mutation_id')
+        tier_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='tierId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RetireSponsorsTierInput
+
+
+def RevertPullRequestInput():
+    class RevertPullRequestInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'title', 'body', 'draft', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        title = sgqlc.types.Field('String', graphql_name='title')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        draft = sgqlc.types.Field('Boolean', graphql_name='draft')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RevertPullRequestInput
+
+
+def RevokeEnterpriseOrganizationsMigratorRoleInput():
+    class RevokeEnterpriseOrganizationsMigratorRoleInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'login', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        login = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='login')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RevokeEnterpriseOrganizationsMigratorRoleInput
+
+
+def RevokeMigratorRoleInput():
+    class RevokeMigratorRoleInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('organization_id', 'actor', 'actor_type', 'client_mutation_id')
+        organization_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='organizationId')
+        actor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='actor')
+        actor_type = sgqlc.types.Field(sgqlc.types.non_null('ActorType'), graphql_name='actorType')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RevokeMigratorRoleInput
+
+
+def RuleParametersInput():
+    class RuleParametersInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('update', 'required_deployments', 'pull_request', 'required_status_checks', 'commit_message_pattern', 'commit_author_email_pattern', 'committer_email_pattern', 'branch_name_pattern', 'tag_name_pattern')
+        update = sgqlc.types.Field('UpdateParametersInput', graphql_name='update')
+        required_deployments = sgqlc.types.Field('RequiredDeploymentsParametersInput', graphql_name='requiredDeployments')
+        pull_request = sgqlc.types.Field('PullRequestParametersInput', graphql_name='pullRequest')
+        required_status_checks = sgqlc.types.Field('RequiredStatusChecksParametersInput', graphql_name='requiredStatusChecks')
+        commit_message_pattern = sgqlc.types.Field('CommitMessagePatternParametersInput', graphql_name='commitMessagePattern')
+        commit_author_email_pattern = sgqlc.types.Field('CommitAuthorEmailPatternParametersInput', graphql_name='commitAuthorEmailPattern')
+        committer_email_pattern = sgqlc.types.Field('CommitterEmailPatternParametersInput', graphql_name='committerEmailPattern')
+        branch_name_pattern = sgqlc.types.Field('BranchNamePatternParametersInput', graphql_name='branchNamePattern')
+        tag_name_pattern = sgqlc.types.Field('TagNamePatternParametersInput', graphql_name='tagNamePattern')
+    return RuleParametersInput
+
+
+def SavedReplyOrder():
+    class SavedReplyOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('SavedReplyOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return SavedReplyOrder
+
+
+def SecurityAdvisoryIdentifierFilter():
+    class SecurityAdvisoryIdentifierFilter(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('type', 'value')
+        type = sgqlc.types.Field(sgqlc.types.non_null('SecurityAdvisoryIdentifierType'), graphql_name='type')
+        value = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='value')
+    return SecurityAdvisoryIdentifierFilter
+
+
+def SecurityAdvisoryOrder():
+    class SecurityAdvisoryOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('SecurityAdvisoryOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return SecurityAdvisoryOrder
+
+
+def SecurityVulnerabilityOrder():
+    class SecurityVulnerabilityOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('SecurityVulnerabilityOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return SecurityVulnerabilityOrder
+
+
+def SetEnterpriseIdentityProviderInput():
+    class SetEnterpriseIdentityProviderInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'sso_url', 'issuer', 'idp_certificate', 'signature_method', 'digest_method', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        sso_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='ssoUrl')
+        issuer = sgqlc.types.Field('String', graphql_name='issuer')
+        idp_certificate = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='idpCertificate')
+        signature_method = sgqlc.types.Field(sgqlc.types.non_null('SamlSignatureAlgorithm'), graphql_name='signatureMethod')
+        digest_method = sgqlc.types.Field(sgqlc.types.non_null('SamlDigestAlgorithm'), graphql_name='digestMethod')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return SetEnterpriseIdentityProviderInput
+
+
+def SetOrganizationInteractionLimitInput():
+    class SetOrganizationInteractionLimitInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('organization_id', 'limit', 'expiry', 'client_mutation_id')
+        organization_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='organizationId')
+        limit = sgqlc.types.Field(sgqlc.types.non_null('RepositoryInteractionLimit'), graphql_name='limit')
+        expiry = sgqlc.types.Field('RepositoryInteractionLimitExpiry', graphql_name='expiry')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return SetOrganizationInteractionLimitInput
+
+
+def SetRepositoryInteractionLimitInput():
+    class SetRepositoryInteractionLimitInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'limit', 'expiry', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        limit = sgqlc.types.Field(sgqlc.types.non_null('RepositoryInteractionLimit'), graphql_name='limit')
+        expiry = sgqlc.types.Field('RepositoryInteractionLimitExpiry', graphql_name='expiry')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return SetRepositoryInteractionLimitInput
+
+
+def SetUserInteractionLimitInput():
+    class SetUserInteractionLimitInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('user_id', 'limit', 'expiry', 'client_mutation_id')
+        user_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='userId')
+        limit = sgqlc.types.Field(sgqlc.types.non_null('RepositoryInteractionLimit'), graphql_name='limit')
+        expiry = sgqlc.types.Field('RepositoryInteractionLimitExpiry', graphql_name='expiry')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return SetUserInteractionLimitInput
+
+
+def SponsorOrder():
+    class SponsorOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('SponsorOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return SponsorOrder
+
+
+def SponsorableOrder():
+    class SponsorableOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('SponsorableOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return SponsorableOrder
+
+
+def SponsorsActivityOrder():
+    class SponsorsActivityOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('SponsorsActivityOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return SponsorsActivityOrder
+
+
+def SponsorsTierOrder():
+    class SponsorsTierOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('SponsorsTierOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return SponsorsTierOrder
+
+
+def SponsorshipNewsletterOrder():
+    class SponsorshipNewsletterOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('SponsorshipNewsletterOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return SponsorshipNewsletterOrder
+
+
+def SponsorshipOrder():
+    class SponsorshipOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('SponsorshipOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return SponsorshipOrder
+
+
+def StarOrder():
+    class StarOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('StarOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return StarOrder
+
+
+def StartOrganizationMigrationInput():
+    class StartOrganizationMigrationInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('source_org_url', 'target_org_name', 'target_enterprise_id', 'source_access_token', 'client_mutation_id')
+        source_org_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='sourceOrgUrl')
+        target_org_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='targetOrgName')
+        target_enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='targetEnterpriseId')
+        source_access_token = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='sourceAccessToken')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return StartOrganizationMigrationInput
+
+
+def StartRepositoryMigrationInput():
+    class StartRepositoryMigrationInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('source_id', 'owner_id', 'source_repository_url', 'repository_name', 'continue_on_error', 'git_archive_url', 'metadata_archive_url', 'access_token', 'github_pat', 'skip_releases', 'target_repo_visibility', 'lock_source', 'client_mutation_id')
+        source_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='sourceId')
+        owner_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ownerId')
+        source_repository_url = sgqlc.types.Field('URI', graphql_name='sourceRepositoryUrl')
+        repository_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='repositoryName')
+        continue_on_error = sgqlc.types.Field('Boolean', graphql_name='continueOnError')
+        git_archive_url = sgqlc.types.Field('String', graphql_name='gitArchiveUrl')
+        metadata_archive_url = sgqlc.types.Field('String', graphql_name='metadataArchiveUrl')
+        access_token = sgqlc.types.Field('String', graphql_name='accessToken')
+        github_pat = sgqlc.types.Field('String', graphql_name='githubPat')
+        skip_releases = sgqlc.types.Field('Boolean', graphql_name='skipReleases')
+        target_repo_visibility = sgqlc.types.Field('String', graphql_name='targetRepoVisibility')
+        lock_source = sgqlc.types.Field('Boolean', graphql_name='lockSource')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return StartRepositoryMigrationInput
+
+
+def StatusCheckConfigurationInput():
+    class StatusCheckConfigurationInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('context', 'integration_id')
+        context = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='context')
+        integration_id = sgqlc.types.Field('Int', graphql_name='integrationId')
+    return StatusCheckConfigurationInput
+
+
+def SubmitPullRequestReviewInput():
+    class SubmitPullRequestReviewInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'pull_request_review_id', 'event', 'body', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field('ID', graphql_name='pullRequestId')
+        pull_request_review_id = sgqlc.types.Field('ID', graphql_name='pullRequestReviewId')
+        event = sgqlc.types.Field(sgqlc.types.non_null('PullRequestReviewEvent'), graphql_name='event')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return SubmitPullRequestReviewInput
+
+
+def TagNamePatternParametersInput():
+    class TagNamePatternParametersInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'negate', 'operator', 'pattern')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        negate = sgqlc.types.Field('Boolean', graphql_name='negate')
+        operator = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='operator')
+        pattern = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='pattern')
+    return TagNamePatternParametersInput
+
+
+def TeamDiscussionCommentOrder():
+    class TeamDiscussionCommentOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('TeamDiscussionCommentOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return TeamDiscussionCommentOrder
+
+
+def TeamDiscussionOrder():
+    class TeamDiscussionOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('TeamDiscussionOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return TeamDiscussionOrder
+
+
+def TeamMemberOrder():
+    class TeamMemberOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('TeamMemberOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return TeamMemberOrder
+
+
+def TeamOrder():
+    class TeamOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('TeamOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return TeamOrder
+
+
+def TeamRepositoryOrder():
+    class TeamRepositoryOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('TeamRepositoryOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return TeamRepositoryOrder
+
+
+def TransferEnterpriseOrganizationInput():
+    class TransferEnterpriseOrganizationInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('organization_id', 'destination_enterprise_id', 'client_mutation_id')
+        organization_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='organizationId')
+        destination_enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='destinationEnterpriseId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return TransferEnterpriseOrganizationInput
+
+
+def TransferIssueInput():
+    class TransferIssueInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('issue_id', 'repository_id', 'create_labels_if_missing', 'client_mutation_id')
+        issue_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='issueId')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        create_labels_if_missing = sgqlc.types.Field('Boolean', graphql_name='createLabelsIfMissing')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return TransferIssueInput
+
+
+def UnarchiveProjectV2ItemInput():
+    class UnarchiveProjectV2ItemInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'item_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        item_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='itemId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnarchiveProjectV2ItemInput
+
+
+def UnarchiveRepositoryInput():
+    class UnarchiveRepositoryInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnarchiveRepositoryInput
+
+
+def UnfollowOrganizationInput():
+    class UnfollowOrganizationInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('organization_id', 'client_mutation_id')
+        organization_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='organizationId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnfollowOrganizationInput
+
+
+def UnfollowUserInput():
+    class UnfollowUserInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('user_id', 'client_mutation_id')
+        user_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='userId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnfollowUserInput
+
+
+def UnlinkProjectV2FromRepositoryInput():
+    class UnlinkProjectV2FromRepositoryInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'repository_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnlinkProjectV2FromRepositoryInput
+
+
+def UnlinkProjectV2FromTeamInput():
+    class UnlinkProjectV2FromTeamInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'team_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        team_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='teamId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnlinkProjectV2FromTeamInput
+
+
+def UnlinkRepositoryFromProjectInput():
+    class UnlinkRepositoryFromProjectInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'repository_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnlinkRepositoryFromProjectInput
+
+
+def UnlockLockableInput():
+    class UnlockLockableInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('lockable_id', 'client_mutation_id')
+        lockable_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='lockableId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnlockLockableInput
+
+
+def UnmarkDiscussionCommentAsAnswerInput():
+    class UnmarkDiscussionCommentAsAnswerInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnmarkDiscussionCommentAsAnswerInput
+
+
+def UnmarkFileAsViewedInput():
+    class UnmarkFileAsViewedInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'path', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnmarkFileAsViewedInput
+
+
+def UnmarkIssueAsDuplicateInput():
+    class UnmarkIssueAsDuplicateInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('duplicate_id', 'canonical_id', 'client_mutation_id')
+        duplicate_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='duplicateId')
+        canonical_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='canonicalId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnmarkIssueAsDuplicateInput
+
+
+def UnmarkProjectV2AsTemplateInput():
+    class UnmarkProjectV2AsTemplateInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnmarkProjectV2AsTemplateInput
+
+
+def UnminimizeCommentInput():
+    class UnminimizeCommentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('subject_id', 'client_mutation_id')
+        subject_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='subjectId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnminimizeCommentInput
+
+
+def UnpinIssueInput():
+    class UnpinIssueInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('issue_id', 'client_mutation_id')
+        issue_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='issueId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnpinIssueInput
+
+
+def UnresolveReviewThreadInput():
+    class UnresolveReviewThreadInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('thread_id', 'client_mutation_id')
+        thread_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='threadId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UnresolveReviewThreadInput
+
+
+def UpdateBranchProtectionRuleInput():
+    class UpdateBranchProtectionRuleInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('branch_protection_rule_id', 'pattern', 'requires_approving_reviews', 'required_approving_review_count', 'requires_commit_signatures', 'requires_linear_history', 'blocks_creations', 'allows_force_pushes', 'allows_deletions', 'is_admin_enforced', 'requires_status_checks', 'requires_strict_status_checks', 'requires_code_owner_reviews', 'dismisses_stale_reviews', 'restricts_review_dismissals', 'review_dismissal_actor_ids', 'bypass_pull_request_actor_ids', 'bypass_force_push_actor_ids', 'restricts_pushes', 'push_actor_ids', 'required_status_check_contexts', 'required_status_checks', 'requires_deployments', 'required_deployment_environments', 'requires_conversation_resolution', 'require_last_push_approval', 'lock_branch', 'lock_allows_fetch_and_merge', 'client_mutation_id')
+        branch_protection_rule_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='branchProtectionRuleId')
+        pattern = sgqlc.types.Field('String', graphql_name='pattern')
+        requires_approving_reviews = sgqlc.types.Field('Boolean', graphql_name='requiresApprovingReviews')
+        required_approving_review_count = sgqlc.types.Field('Int', graphql_name='requiredApprovingReviewCount')
+        requires_commit_signatures = sgqlc.types.Field('Boolean', graphql_name='requiresCommitSignatures')
+        requires_linear_history = sgqlc.types.Field('Boolean', graphql_name='requiresLinearHistory')
+        blocks_creations = sgqlc.types.Field('Boolean', graphql_name='blocksCreations')
+        allows_force_pushes = sgqlc.types.Field('Boolean', graphql_name='allowsForcePushes')
+        allows_deletions = sgqlc.types.Field('Boolean', graphql_name='allowsDeletions')
+        is_admin_enforced = sgqlc.types.Field('Boolean', graphql_name='isAdminEnforced')
+        requires_status_checks = sgqlc.types.Field('Boolean', graphql_name='requiresStatusChecks')
+        requires_strict_status_checks = sgqlc.types.Field('Boolean', graphql_name='requiresStrictStatusChecks')
+        requires_code_owner_reviews = sgqlc.types.Field('Boolean', graphql_name='requiresCodeOwnerReviews')
+        dismisses_stale_reviews = sgqlc.types.Field('Boolean', graphql_name='dismissesStaleReviews')
+        restricts_review_dismissals = sgqlc.types.Field('Boolean', graphql_name='restrictsReviewDismissals')
+        review_dismissal_actor_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='reviewDismissalActorIds')
+        bypass_pull_request_actor_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='bypassPullRequestActorIds')
+        bypass_force_push_actor_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='bypassForcePushActorIds')
+        restricts_pushes = sgqlc.types.Field('Boolean', graphql_name='restrictsPushes')
+        push_actor_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='pushActorIds')
+        required_status_check_contexts = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='requiredStatusCheckContexts')
+        required_status_checks = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('RequiredStatusCheckInput')), graphql_name='requiredStatusChecks')
+        requires_deployments = sgqlc.types.Field('Boolean', graphql_name='requiresDeployments')
+        required_deployment_environments = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='requiredDeploymentEnvironments')
+        requires_conversation_resolution = sgqlc.types.Field('Boolean', graphql_name='requiresConversationResolution')
+        require_last_push_approval = sgqlc.types.Field('Boolean', graphql_name='requireLastPushApproval')
+        lock_branch = sgqlc.types.Field('Boolean', graphql_name='lockBranch')
+        lock_allows_fetch_and_merge = sgqlc.types.Field('Boolean', graphql_name='lockAllowsFetchAndMerge')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateBranchProtectionRuleInput
+
+
+def UpdateCheckRunInput():
+    class UpdateCheckRunInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'check_run_id', 'name', 'details_url', 'external_id', 'status', 'started_at', 'conclusion', 'completed_at', 'output', 'actions', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        check_run_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='checkRunId')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        details_url = sgqlc.types.Field('URI', graphql_name='detailsUrl')
+        external_id = sgqlc.types.Field('String', graphql_name='externalId')
+        status = sgqlc.types.Field('RequestableCheckStatusState', graphql_name='status')
+        started_at = sgqlc.types.Field('DateTime', graphql_name='startedAt')
+        conclusion = sgqlc.types.Field('CheckConclusionState', graphql_name='conclusion')
+        completed_at = sgqlc.types.Field('DateTime', graphql_name='completedAt')
+        output = sgqlc.types.Field('CheckRunOutput', graphql_name='output')
+        actions = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('CheckRunAction')), graphql_name='actions')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateCheckRunInput
+
+
+def UpdateCheckSuitePreferencesInput():
+    class UpdateCheckSuitePreferencesInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'auto_trigger_preferences', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        auto_trigger_preferences = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('CheckSuiteAutoTriggerPreference'))), graphql_name='autoTriggerPreferences')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateCheckSuitePreferencesInput
+
+
+def UpdateDiscussionCommentInput():
+    class UpdateDiscussionCommentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('comment_id', 'body', 'client_mutation_id')
+        comment_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='commentId')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateDiscussionCommentInput
+
+
+def UpdateDiscussionInput():
+    class UpdateDiscussionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('discussion_id', 'title', 'body', 'category_id', 'client_mutation_id')
+        discussion_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='discussionId')
+        title = sgqlc.types.Field('String', graphql_name='title')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        category_id = sgqlc.types.Field('ID', graphql_name='categoryId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateDiscussionInput
+
+
+def UpdateEnterpriseAdministratorRoleInput():
+    class UpdateEnterpriseAdministratorRoleInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'login', 'role', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        login = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='login')
+        role = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseAdministratorRole'), graphql_name='role')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseAdministratorRoleInput
+
+
+def UpdateEnterpriseAllowPrivateRepositoryForkingSettingInput():
+    class UpdateEnterpriseAllowPrivateRepositoryForkingSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'setting_value', 'policy_value', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='settingValue')
+        policy_value = sgqlc.types.Field('EnterpriseAllowPrivateRepositoryForkingPolicyValue', graphql_name='policyValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseAllowPrivateRepositoryForkingSettingInput
+
+
+def UpdateEnterpriseDefaultRepositoryPermissionSettingInput():
+    class UpdateEnterpriseDefaultRepositoryPermissionSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'setting_value', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseDefaultRepositoryPermissionSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseDefaultRepositoryPermissionSettingInput
+
+
+def UpdateEnterpriseMembersCanChangeRepositoryVisibilitySettingInput():
+    class UpdateEnterpriseMembersCanChangeRepositoryVisibilitySettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'setting_value', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseMembersCanChangeRepositoryVisibilitySettingInput
+
+
+def UpdateEnterpriseMembersCanCreateRepositoriesSettingInput():
+    class UpdateEnterpriseMembersCanCreateRepositoriesSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'setting_value', 'members_can_create_repositories_policy_enabled', 'members_can_create_public_repositories', 'members_can_create_private_repositories', 'members_can_create_internal_repositories', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        setting_value = sgqlc.types.Field('EnterpriseMembersCanCreateRepositoriesSettingValue', graphql_name='settingValue')
+        members_can_create_repositories_policy_enabled = sgqlc.types.Field('Boolean', graphql_name='membersCanCreateRepositoriesPolicyEnabled')
+        members_can_create_public_repositories = sgqlc.types.Field('Boolean', graphql_name='membersCanCreatePublicRepositories')
+        members_can_create_private_repositories = sgqlc.types.Field('Boolean', graphql_name='membersCanCreatePrivateRepositories')
+        members_can_create_internal_repositories = sgqlc.types.Field('Boolean', graphql_name='membersCanCreateInternalRepositories')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseMembersCanCreateRepositoriesSettingInput
+
+
+def UpdateEnterpriseMembersCanDeleteIssuesSettingInput():
+    class UpdateEnterpriseMembersCanDeleteIssuesSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'setting_value', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseMembersCanDeleteIssuesSettingInput
+
+
+def UpdateEnterpriseMembersCanDeleteRepositoriesSettingInput():
+    class UpdateEnterpriseMembersCanDeleteRepositoriesSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'setting_value', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseMembersCanDeleteRepositoriesSettingInput
+
+
+def UpdateEnterpriseMembersCanInviteCollaboratorsSettingInput():
+    class UpdateEnterpriseMembersCanInviteCollaboratorsSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'setting_value', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseMembersCanInviteCollaboratorsSettingInput
+
+
+def UpdateEnterpriseMembersCanMakePurchasesSettingInput():
+    class UpdateEnterpriseMembersCanMakePurchasesSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'setting_value', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseMembersCanMakePurchasesSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseMembersCanMakePurchasesSettingInput
+
+
+def UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingInput():
+    class UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'setting_value', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingInput
+
+
+def UpdateEnterpriseMembersCanViewDependencyInsightsSettingInput():
+    class UpdateEnterpriseMembersCanViewDependencyInsightsSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'setting_value', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseMembersCanViewDependencyInsightsSettingInput
+
+
+def UpdateEnterpriseOrganizationProjectsSettingInput():
+    class UpdateEnterpriseOrganizationProjectsSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'setting_value', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseOrganizationProjectsSettingInput
+
+
+def UpdateEnterpriseOwnerOrganizationRoleInput():
+    class UpdateEnterpriseOwnerOrganizationRoleInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'organization_id', 'organization_role', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        organization_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='organizationId')
+        organization_role = sgqlc.types.Field(sgqlc.types.non_null('RoleInOrganization'), graphql_name='organizationRole')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseOwnerOrganizationRoleInput
+
+
+def UpdateEnterpriseProfileInput():
+    class UpdateEnterpriseProfileInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'name', 'description', 'website_url', 'location', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        website_url = sgqlc.types.Field('String', graphql_name='websiteUrl')
+        location = sgqlc.types.Field('String', graphql_name='location')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseProfileInput
+
+
+def UpdateEnterpriseRepositoryProjectsSettingInput():
+    class UpdateEnterpriseRepositoryProjectsSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'setting_value', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseRepositoryProjectsSettingInput
+
+
+def UpdateEnterpriseTeamDiscussionsSettingInput():
+    class UpdateEnterpriseTeamDiscussionsSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'setting_value', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseTeamDiscussionsSettingInput
+
+
+def UpdateEnterpriseTwoFactorAuthenticationRequiredSettingInput():
+    class UpdateEnterpriseTwoFactorAuthenticationRequiredSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_id', 'setting_value', 'client_mutation_id')
+        enterprise_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='enterpriseId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnterpriseTwoFactorAuthenticationRequiredSettingInput
+
+
+def UpdateEnvironmentInput():
+    class UpdateEnvironmentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('environment_id', 'wait_timer', 'reviewers', 'client_mutation_id')
+        environment_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='environmentId')
+        wait_timer = sgqlc.types.Field('Int', graphql_name='waitTimer')
+        reviewers = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='reviewers')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateEnvironmentInput
+
+
+def UpdateIpAllowListEnabledSettingInput():
+    class UpdateIpAllowListEnabledSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('owner_id', 'setting_value', 'client_mutation_id')
+        owner_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ownerId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('IpAllowListEnabledSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateIpAllowListEnabledSettingInput
+
+
+def UpdateIpAllowListEntryInput():
+    class UpdateIpAllowListEntryInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('ip_allow_list_entry_id', 'allow_list_value', 'name', 'is_active', 'client_mutation_id')
+        ip_allow_list_entry_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ipAllowListEntryId')
+        allow_list_value = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='allowListValue')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        is_active = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isActive')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateIpAllowListEntryInput
+
+
+def UpdateIpAllowListForInstalledAppsEnabledSettingInput():
+    class UpdateIpAllowListForInstalledAppsEnabledSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('owner_id', 'setting_value', 'client_mutation_id')
+        owner_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ownerId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('IpAllowListForInstalledAppsEnabledSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateIpAllowListForInstalledAppsEnabledSettingInput
+
+
+def UpdateIssueCommentInput():
+    class UpdateIssueCommentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'body', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateIssueCommentInput
+
+
+def UpdateIssueInput():
+    class UpdateIssueInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'title', 'body', 'assignee_ids', 'milestone_id', 'label_ids', 'state', 'project_ids', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        title = sgqlc.types.Field('String', graphql_name='title')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        assignee_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='assigneeIds')
+        milestone_id = sgqlc.types.Field('ID', graphql_name='milestoneId')
+        label_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='labelIds')
+        state = sgqlc.types.Field('IssueState', graphql_name='state')
+        project_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='projectIds')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateIssueInput
+
+
+def UpdateNotificationRestrictionSettingInput():
+    class UpdateNotificationRestrictionSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('owner_id', 'setting_value', 'client_mutation_id')
+        owner_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='ownerId')
+        setting_value = sgqlc.types.Field(sgqlc.types.non_null('NotificationRestrictionSettingValue'), graphql_name='settingValue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateNotificationRestrictionSettingInput
+
+
+def UpdateOrganizationAllowPrivateRepositoryForkingSettingInput():
+    class UpdateOrganizationAllowPrivateRepositoryForkingSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('organization_id', 'forking_enabled', 'client_mutation_id')
+        organization_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='organizationId')
+        forking_enabled = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='forkingEnabled')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateOrganizationAllowPrivateRepositoryForkingSettingInput
+
+
+def UpdateOrganizationWebCommitSignoffSettingInput():
+    class UpdateOrganizationWebCommitSignoffSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('organization_id', 'web_commit_signoff_required', 'client_mutation_id')
+        organization_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='organizationId')
+        web_commit_signoff_required = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='webCommitSignoffRequired')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateOrganizationWebCommitSignoffSettingInput
+
+
+def UpdateParametersInput():
+    class UpdateParametersInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('update_allows_fetch_and_merge',)
+        update_allows_fetch_and_merge = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='updateAllowsFetchAndMerge')
+    return UpdateParametersInput
+
+
+def UpdateProjectCardInput():
+    class UpdateProjectCardInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_card_id', 'is_archived', 'note', 'client_mutation_id')
+        project_card_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectCardId')
+        is_archived = sgqlc.types.Field('Boolean', graphql_name='isArchived')
+        note = sgqlc.types.Field('String', graphql_name='note')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateProjectCardInput
+
+
+def UpdateProjectColumnInput():
+    class UpdateProjectColumnInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_column_id', 'name', 'client_mutation_id')
+        project_column_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectColumnId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateProjectColumnInput
+
+
+def UpdateProjectInput():
+    class UpdateProjectInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'name', 'body', 'state', 'public', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        state = sgqlc.types.Field('ProjectState', graphql_name='state')
+        public = sgqlc.types.Field('Boolean', graphql_name='public')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateProjectInput
+
+
+def UpdateProjectV2CollaboratorsInput():
+    class UpdateProjectV2CollaboratorsInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'collaborators', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        collaborators = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ProjectV2Collaborator'))), graphql_name='collaborators')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateProjectV2CollaboratorsInput
+
+
+def UpdateProjectV2DraftIssueInput():
+    class UpdateProjectV2DraftIssueInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('draft_issue_id', 'title', 'body', 'assignee_ids', 'client_mutation_id')
+        draft_issue_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='draftIssueId')
+        title = sgqlc.types.Field('String', graphql_name='title')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        assignee_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='assigneeIds')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateProjectV2DraftIssueInput
+
+
+def UpdateProjectV2Input():
+    class UpdateProjectV2Input(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'title', 'short_description', 'readme', 'closed', 'public', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        title = sgqlc.types.Field('String', graphql_name='title')
+        short_description = sgqlc.types.Field('String', graphql_name='shortDescription')
+        readme = sgqlc.types.Field('String', graphql_name='readme')
+        closed = sgqlc.types.Field('Boolean', graphql_name='closed')
+        public = sgqlc.types.Field('Boolean', graphql_name='public')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateProjectV2Input
+
+
+def UpdateProjectV2ItemFieldValueInput():
+    class UpdateProjectV2ItemFieldValueInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'item_id', 'field_id', 'value', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        item_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='itemId')
+        field_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='fieldId')
+        value = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2FieldValue'), graphql_name='value')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateProjectV2ItemFieldValueInput
+
+
+def UpdateProjectV2ItemPositionInput():
+    class UpdateProjectV2ItemPositionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('project_id', 'item_id', 'after_id', 'client_mutation_id')
+        project_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='projectId')
+        item_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='itemId')
+        after_id = sgqlc.types.Field('ID', graphql_name='afterId')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateProjectV2ItemPositionInput
+
+
+def UpdatePullRequestBranchInput():
+    class UpdatePullRequestBranchInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'expected_head_oid', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        expected_head_oid = sgqlc.types.Field('GitObjectID', graphql_name='expectedHeadOid')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdatePullRequestBranchInput
+
+
+def UpdatePullRequestInput():
+    class UpdatePullRequestInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_id', 'base_ref_name', 'title', 'body', 'state', 'maintainer_can_modify', 'assignee_ids', 'milestone_id', 'label_ids', 'project_ids', 'client_mutation_id')
+        pull_request_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestId')
+        base_ref_name = sgqlc.types.Field('String', graphql_name='baseRefName')
+        title = sgqlc.types.Field('String', graphql_name='title')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        state = sgqlc.types.Field('PullRequestUpdateState', graphql_name='state')
+        maintainer_can_modify = sgqlc.types.Field('Boolean', graphql_name='maintainerCanModify')
+        assignee_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='assigneeIds')
+        milestone_id = sgqlc.types.Field('ID', graphql_name='milestoneId')
+        label_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='labelIds')
+        project_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='projectIds')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdatePullRequestInput
+
+
+def UpdatePullRequestReviewCommentInput():
+    class UpdatePullRequestReviewCommentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_review_comment_id', 'body', 'client_mutation_id')
+        pull_request_review_comment_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestReviewCommentId')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdatePullRequestReviewCommentInput
+
+
+def UpdatePullRequestReviewInput():
+    class UpdatePullRequestReviewInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request_review_id', 'body', 'client_mutation_id')
+        pull_request_review_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='pullRequestReviewId')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdatePullRequestReviewInput
+
+
+def UpdateRefInput():
+    class UpdateRefInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('ref_id', 'oid', 'force', 'client_mutation_id')
+        ref_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='refId')
+        oid = sgqlc.types.Field(sgqlc.types.non_null('GitObjectID'), graphql_name='oid')
+        force = sgqlc.types.Field('Boolean', graphql_name='force')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateRefInput
+
+
+def UpdateRepositoryInput():
+    class UpdateRepositoryInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'name', 'description', 'template', 'homepage_url', 'has_wiki_enabled', 'has_issues_enabled', 'has_projects_enabled', 'has_discussions_enabled', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        template = sgqlc.types.Field('Boolean', graphql_name='template')
+        homepage_url = sgqlc.types.Field('URI', graphql_name='homepageUrl')
+        has_wiki_enabled = sgqlc.types.Field('Boolean', graphql_name='hasWikiEnabled')
+        has_issues_enabled = sgqlc.types.Field('Boolean', graphql_name='hasIssuesEnabled')
+        has_projects_enabled = sgqlc.types.Field('Boolean', graphql_name='hasProjectsEnabled')
+        has_discussions_enabled = sgqlc.types.Field('Boolean', graphql_name='hasDiscussionsEnabled')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateRepositoryInput
+
+
+def UpdateRepositoryRulesetInput():
+    class UpdateRepositoryRulesetInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_ruleset_id', 'name', 'target', 'rules', 'conditions', 'enforcement', 'bypass_mode', 'bypass_actor_ids', 'client_mutation_id')
+        repository_ruleset_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryRulesetId')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        target = sgqlc.types.Field('RepositoryRulesetTarget', graphql_name='target')
+        rules = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('RepositoryRuleInput')), graphql_name='rules')
+        conditions = sgqlc.types.Field('RepositoryRuleConditionsInput', graphql_name='conditions')
+        enforcement = sgqlc.types.Field('RuleEnforcement', graphql_name='enforcement')
+        bypass_mode = sgqlc.types.Field('RuleBypassMode', graphql_name='bypassMode')
+        bypass_actor_ids = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ID')), graphql_name='bypassActorIds')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateRepositoryRulesetInput
+
+
+def UpdateRepositoryWebCommitSignoffSettingInput():
+    class UpdateRepositoryWebCommitSignoffSettingInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'web_commit_signoff_required', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        web_commit_signoff_required = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='webCommitSignoffRequired')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateRepositoryWebCommitSignoffSettingInput
+
+
+def UpdateSponsorshipPreferencesInput():
+    class UpdateSponsorshipPreferencesInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('sponsor_id', 'sponsor_login', 'sponsorable_id', 'sponsorable_login', 'receive_emails', 'privacy_level', 'client_mutation_id')
+        sponsor_id = sgqlc.types.Field('ID', graphql_name='sponsorId')
+        sponsor_login = sgqlc.types.Field('String', graphql_name='sponsorLogin')
+        sponsorable_id = sgqlc.types.Field('ID', graphql_name='sponsorableId')
+        sponsorable_login = sgqlc.types.Field('String', graphql_name='sponsorableLogin')
+        receive_emails = sgqlc.types.Field('Boolean', graphql_name='receiveEmails')
+        privacy_level = sgqlc.types.Field('SponsorshipPrivacy', graphql_name='privacyLevel')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateSponsorshipPreferencesInput
+
+
+def UpdateSubscriptionInput():
+    class UpdateSubscriptionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('subscribable_id', 'state', 'client_mutation_id')
+        subscribable_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='subscribableId')
+        state = sgqlc.types.Field(sgqlc.types.non_null('SubscriptionState'), graphql_name='state')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateSubscriptionInput
+
+
+def UpdateTeamDiscussionCommentInput():
+    class UpdateTeamDiscussionCommentInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'body', 'body_version', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        body_version = sgqlc.types.Field('String', graphql_name='bodyVersion')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateTeamDiscussionCommentInput
+
+
+def UpdateTeamDiscussionInput():
+    class UpdateTeamDiscussionInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'title', 'body', 'body_version', 'pinned', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        title = sgqlc.types.Field('String', graphql_name='title')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        body_version = sgqlc.types.Field('String', graphql_name='bodyVersion')
+        pinned = sgqlc.types.Field('Boolean', graphql_name='pinned')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateTeamDiscussionInput
+
+
+def UpdateTeamsRepositoryInput():
+    class UpdateTeamsRepositoryInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'team_ids', 'permission', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        team_ids = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ID'))), graphql_name='teamIds')
+        permission = sgqlc.types.Field(sgqlc.types.non_null('RepositoryPermission'), graphql_name='permission')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateTeamsRepositoryInput
+
+
+def UpdateTopicsInput():
+    class UpdateTopicsInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('repository_id', 'topic_names', 'client_mutation_id')
+        repository_id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='repositoryId')
+        topic_names = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='topicNames')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateTopicsInput
+
+
+def UserStatusOrder():
+    class UserStatusOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('UserStatusOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return UserStatusOrder
+
+
+def VerifiableDomainOrder():
+    class VerifiableDomainOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('VerifiableDomainOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return VerifiableDomainOrder
+
+
+def VerifyVerifiableDomainInput():
+    class VerifyVerifiableDomainInput(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'client_mutation_id')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return VerifyVerifiableDomainInput
+
+
+def WorkflowRunOrder():
+    class WorkflowRunOrder(sgqlc.types.Input):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('WorkflowRunOrderField'), graphql_name='field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+    return WorkflowRunOrder
@@ -0,0 +1,532 @@
+# Generated by tools/sgqlc_fast_schema.py
+# Source: github_schema.py
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+from . import github_schema
+
+
+def Actor():
+    class Actor(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('avatar_url', 'login', 'resource_path', 'url')
+        avatar_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='avatarUrl', args=sgqlc.types.ArgDict((('size', sgqlc.types.Arg('Int', graphql_name='size', default=None)),)))
+        login = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='login')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return Actor
+
+
+def AnnouncementBanner():
+    class AnnouncementBanner(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('announcement', 'announcement_expires_at', 'announcement_user_dismissible')
+        announcement = sgqlc.types.Field('String', graphql_name='announcement')
+        announcement_expires_at = sgqlc.types.Field('DateTime', graphql_name='announcementExpiresAt')
+        announcement_user_dismissible = sgqlc.types.Field('Boolean', graphql_name='announcementUserDismissible')
+    return AnnouncementBanner
+
+
+def Assignable():
+    class Assignable(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('assignees',)
+        assignees = sgqlc.types.Field(sgqlc.types.non_null('UserConnection'), graphql_name='assignees', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return Assignable
+
+
+def AuditEntry():
+    class AuditEntry(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('action', 'actor', 'actor_ip', 'actor_location', 'actor_login', 'actor_resource_path', 'actor_url', 'created_at', 'operation_type', 'user', 'user_login', 'user_resource_path', 'user_url')
+        action = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='action')
+        actor = sgqlc.types.Field('AuditEntryActor', graphql_name='actor')
+        actor_ip = sgqlc.types.Field('String', graphql_name='actorIp')
+        actor_location = sgqlc.types.Field('ActorLocation', graphql_name='actorLocation')
+        actor_login = sgqlc.types.Field('String', graphql_name='actorLogin')
+        actor_resource_path = sgqlc.types.Field('URI', graphql_name='actorResourcePath')
+        actor_url = sgqlc.types.Field('URI', graphql_name='actorUrl')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('PreciseDateTime'), graphql_name='createdAt')
+        operation_type = sgqlc.types.Field('OperationType', graphql_name='operationType')
+        user = sgqlc.types.Field('User', graphql_name='user')
+        user_login = sgqlc.types.Field('String', graphql_name='userLogin')
+        user_resource_path = sgqlc.types.Field('URI', graphql_name='userResourcePath')
+        user_url = sgqlc.types.Field('URI', graphql_name='userUrl')
+    return AuditEntry
+
+
+def Closable():
+    class Closable(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('closed', 'closed_at', 'viewer_can_close', 'viewer_can_reopen')
+        closed = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='closed')
+        closed_at = sgqlc.types.Field('DateTime', graphql_name='closedAt')
+        viewer_can_close = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanClose')
+        viewer_can_reopen = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanReopen')
+    return Closable
+
+
+def Comment():
+    class Comment(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('author', 'author_association', 'body', 'body_html', 'body_text', 'created_at', 'created_via_email', 'editor', 'id', 'includes_created_edit', 'last_edited_at', 'published_at', 'updated_at', 'user_content_edits', 'viewer_did_author')
+        author = sgqlc.types.Field('Actor', graphql_name='author')
+        author_association = sgqlc.types.Field(sgqlc.types.non_null('CommentAuthorAssociation'), graphql_name='authorAssociation')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        body_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='bodyHTML')
+        body_text = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='bodyText')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        created_via_email = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='createdViaEmail')
+        editor = sgqlc.types.Field('Actor', graphql_name='editor')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        includes_created_edit = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='includesCreatedEdit')
+        last_edited_at = sgqlc.types.Field('DateTime', graphql_name='lastEditedAt')
+        published_at = sgqlc.types.Field('DateTime', graphql_name='publishedAt')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        user_content_edits = sgqlc.types.Field('UserContentEditConnection', graphql_name='userContentEdits', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        viewer_did_author = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerDidAuthor')
+    return Comment
+
+
+def Contribution():
+    class Contribution(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('is_restricted', 'occurred_at', 'resource_path', 'url', 'user')
+        is_restricted = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isRestricted')
+        occurred_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='occurredAt')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+        user = sgqlc.types.Field(sgqlc.types.non_null('User'), graphql_name='user')
+    return Contribution
+
+
+def Deletable():
+    class Deletable(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('viewer_can_delete',)
+        viewer_can_delete = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanDelete')
+    return Deletable
+
+
+def EnterpriseAuditEntryData():
+    class EnterpriseAuditEntryData(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise_resource_path', 'enterprise_slug', 'enterprise_url')
+        enterprise_resource_path = sgqlc.types.Field('URI', graphql_name='enterpriseResourcePath')
+        enterprise_slug = sgqlc.types.Field('String', graphql_name='enterpriseSlug')
+        enterprise_url = sgqlc.types.Field('URI', graphql_name='enterpriseUrl')
+    return EnterpriseAuditEntryData
+
+
+def GitObject():
+    class GitObject(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('abbreviated_oid', 'commit_resource_path', 'commit_url', 'id', 'oid', 'repository')
+        abbreviated_oid = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='abbreviatedOid')
+        commit_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='commitResourcePath')
+        commit_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='commitUrl')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        oid = sgqlc.types.Field(sgqlc.types.non_null('GitObjectID'), graphql_name='oid')
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+    return GitObject
+
+
+def GitSignature():
+    class GitSignature(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('email', 'is_valid', 'payload', 'signature', 'signer', 'state', 'was_signed_by_git_hub')
+        email = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='email')
+        is_valid = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isValid')
+        payload = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='payload')
+        signature = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='signature')
+        signer = sgqlc.types.Field('User', graphql_name='signer')
+        state = sgqlc.types.Field(sgqlc.types.non_null('GitSignatureState'), graphql_name='state')
+        was_signed_by_git_hub = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='wasSignedByGitHub')
+    return GitSignature
+
+
+def HovercardContext():
+    class HovercardContext(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('message', 'octicon')
+        message = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='message')
+        octicon = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='octicon')
+    return HovercardContext
+
+
+def Labelable():
+    class Labelable(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('labels',)
+        labels = sgqlc.types.Field('LabelConnection', graphql_name='labels', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg(github_schema.LabelOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'ASC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return Labelable
+
+
+def Lockable():
+    class Lockable(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('active_lock_reason', 'locked')
+        active_lock_reason = sgqlc.types.Field('LockReason', graphql_name='activeLockReason')
+        locked = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='locked')
+    return Lockable
+
+
+def MemberStatusable():
+    class MemberStatusable(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('member_statuses',)
+        member_statuses = sgqlc.types.Field(sgqlc.types.non_null('UserStatusConnection'), graphql_name='memberStatuses', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.UserStatusOrder, graphql_name='orderBy', default={'field': 'UPDATED_AT', 'direction': 'DESC'})))))
+    return MemberStatusable
+
+
+def Migration():
+    class Migration(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('continue_on_error', 'created_at', 'database_id', 'failure_reason', 'id', 'migration_log_url', 'migration_source', 'repository_name', 'source_url', 'state', 'warnings_count')
+        continue_on_error = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='continueOnError')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('String', graphql_name='databaseId')
+        failure_reason = sgqlc.types.Field('String', graphql_name='failureReason')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        migration_log_url = sgqlc.types.Field('URI', graphql_name='migrationLogUrl')
+        migration_source = sgqlc.types.Field(sgqlc.types.non_null('MigrationSource'), graphql_name='migrationSource')
+        repository_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='repositoryName')
+        source_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='sourceUrl')
+        state = sgqlc.types.Field(sgqlc.types.non_null('MigrationState'), graphql_name='state')
+        warnings_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='warningsCount')
+    return Migration
+
+
+def Minimizable():
+    class Minimizable(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('is_minimized', 'minimized_reason', 'viewer_can_minimize')
+        is_minimized = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isMinimized')
+        minimized_reason = sgqlc.types.Field('String', graphql_name='minimizedReason')
+        viewer_can_minimize = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanMinimize')
+    return Minimizable
+
+
+def Node():
+    class Node(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('id',)
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+    return Node
+
+
+def OauthApplicationAuditEntryData():
+    class OauthApplicationAuditEntryData(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('oauth_application_name', 'oauth_application_resource_path', 'oauth_application_url')
+        oauth_application_name = sgqlc.types.Field('String', graphql_name='oauthApplicationName')
+        oauth_application_resource_path = sgqlc.types.Field('URI', graphql_name='oauthApplicationResourcePath')
+        oauth_application_url = sgqlc.types.Field('URI', graphql_name='oauthApplicationUrl')
+    return OauthApplicationAuditEntryData
+
+
+def OrganizationAuditEntryData():
+    class OrganizationAuditEntryData(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('organization', 'organization_name', 'organization_resource_path', 'organization_url')
+        organization = sgqlc.types.Field('Organization', graphql_name='organization')
+        organization_name = sgqlc.types.Field('String', graphql_name='organizationName')
+        organization_resource_path = sgqlc.types.Field('URI', graphql_name='organizationResourcePath')
+        organization_url = sgqlc.types.Field('URI', graphql_name='organizationUrl')
+    return OrganizationAuditEntryData
+
+
+def PackageOwner():
+    class PackageOwner(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'packages')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        packages = sgqlc.types.Field(sgqlc.types.non_null('PackageConnection'), graphql_name='packages', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('names', sgqlc.types.Arg(sgqlc.types.list_of('String'), graphql_name='names', default=None)), ('repository_id', sgqlc.types.Arg('ID', graphql_name='repositoryId', default=None)), ('package_type', sgqlc.types.Arg('PackageType', graphql_name='packageType', default=None)), ('order_by', sgqlc.types.Arg(github_schema.PackageOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'DESC'})))))
+    return PackageOwner
+
+
+def ProfileOwner():
+    class ProfileOwner(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('any_pinnable_items', 'email', 'id', 'item_showcase', 'location', 'login', 'name', 'pinnable_items', 'pinned_items', 'pinned_items_remaining', 'viewer_can_change_pinned_items', 'website_url')
+        any_pinnable_items = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='anyPinnableItems', args=sgqlc.types.ArgDict((('type', sgqlc.types.Arg('PinnableItemType', graphql_name='type', default=None)),)))
+        email = sgqlc.types.Field('String', graphql_name='email')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        item_showcase = sgqlc.types.Field(sgqlc.types.non_null('ProfileItemShowcase'), graphql_name='itemShowcase')
+        location = sgqlc.types.Field('String', graphql_name='location')
+        login = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='login')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        pinnable_items = sgqlc.types.Field(sgqlc.types.non_null('PinnableItemConnection'), graphql_name='pinnableItems', args=sgqlc.types.ArgDict((('types', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('PinnableItemType')), graphql_name='types', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        pinned_items = sgqlc.types.Field(sgqlc.types.non_null('PinnableItemConnection'), graphql_name='pinnedItems', args=sgqlc.types.ArgDict((('types', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('PinnableItemType')), graphql_name='types', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        pinned_items_remaining = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='pinnedItemsRemaining')
+        viewer_can_change_pinned_items = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanChangePinnedItems')
+        website_url = sgqlc.types.Field('URI', graphql_name='websiteUrl')
+    return ProfileOwner
+
+
+def ProjectOwner():
+    class ProjectOwner(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'project', 'projects', 'projects_resource_path', 'projects_url', 'viewer_can_create_projects')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        project = sgqlc.types.Field('Project', graphql_name='project', args=sgqlc.types.ArgDict((('number', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='number', default=None)),)))
+        projects = sgqlc.types.Field(sgqlc.types.non_null('ProjectConnection'), graphql_name='projects', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg('ProjectOrder', graphql_name='orderBy', default=None)), ('search', sgqlc.types.Arg('String', graphql_name='search', default=None)), ('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('ProjectState')), graphql_name='states', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        projects_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='projectsResourcePath')
+        projects_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='projectsUrl')
+        viewer_can_create_projects = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanCreateProjects')
+    return ProjectOwner
+
+
+def ProjectV2FieldCommon():
+    class ProjectV2FieldCommon(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'data_type', 'database_id', 'id', 'name', 'project', 'updated_at')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        data_type = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2FieldType'), graphql_name='dataType')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        project = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2'), graphql_name='project')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return ProjectV2FieldCommon
+
+
+def ProjectV2ItemFieldValueCommon():
+    class ProjectV2ItemFieldValueCommon(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'creator', 'database_id', 'field', 'id', 'item', 'updated_at')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        creator = sgqlc.types.Field('Actor', graphql_name='creator')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2FieldConfiguration'), graphql_name='field')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        item = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2Item'), graphql_name='item')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return ProjectV2ItemFieldValueCommon
+
+
+def ProjectV2Owner():
+    class ProjectV2Owner(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'project_v2', 'projects_v2')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        project_v2 = sgqlc.types.Field('ProjectV2', graphql_name='projectV2', args=sgqlc.types.ArgDict((('number', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='number', default=None)),)))
+        projects_v2 = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2Connection'), graphql_name='projectsV2', args=sgqlc.types.ArgDict((('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ProjectV2Order, graphql_name='orderBy', default={'field': 'NUMBER', 'direction': 'DESC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return ProjectV2Owner
+
+
+def ProjectV2Recent():
+    class ProjectV2Recent(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('recent_projects',)
+        recent_projects = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2Connection'), graphql_name='recentProjects', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return ProjectV2Recent
+
+
+def Reactable():
+    class Reactable(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('database_id', 'id', 'reaction_groups', 'reactions', 'viewer_can_react')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        reaction_groups = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ReactionGroup')), graphql_name='reactionGroups')
+        reactions = sgqlc.types.Field(sgqlc.types.non_null('ReactionConnection'), graphql_name='reactions', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('content', sgqlc.types.Arg('ReactionContent', graphql_name='content', default=None)), ('order_by', sgqlc.types.Arg('ReactionOrder', graphql_name='orderBy', default=None)))))
+        viewer_can_react = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanReact')
+    return Reactable
+
+
+def RepositoryAuditEntryData():
+    class RepositoryAuditEntryData(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('repository', 'repository_name', 'repository_resource_path', 'repository_url')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+        repository_name = sgqlc.types.Field('String', graphql_name='repositoryName')
+        repository_resource_path = sgqlc.types.Field('URI', graphql_name='repositoryResourcePath')
+        repository_url = sgqlc.types.Field('URI', graphql_name='repositoryUrl')
+    return RepositoryAuditEntryData
+
+
+def RepositoryDiscussionAuthor():
+    class RepositoryDiscussionAuthor(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('repository_discussions',)
+        repository_discussions = sgqlc.types.Field(sgqlc.types.non_null('DiscussionConnection'), graphql_name='repositoryDiscussions', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.DiscussionOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'DESC'})), ('repository_id', sgqlc.types.Arg('ID', graphql_name='repositoryId', default=None)), ('answered', sgqlc.types.Arg('Boolean', graphql_name='answered', default=None)), ('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null(github_schema.DiscussionState)), graphql_name='states', default=())))))
+    return RepositoryDiscussionAuthor
+
+
+def RepositoryDiscussionCommentAuthor():
+    class RepositoryDiscussionCommentAuthor(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('repository_discussion_comments',)
+        repository_discussion_comments = sgqlc.types.Field(sgqlc.types.non_null('DiscussionCommentConnection'), graphql_name='repositoryDiscussionComments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('repository_id', sgqlc.types.Arg('ID', graphql_name='repositoryId', default=None)), ('only_answers', sgqlc.types.Arg(github_schema.Boolean, graphql_name='onlyAnswers', default=False)))))
+    return RepositoryDiscussionCommentAuthor
+
+
+def RepositoryInfo():
+    class RepositoryInfo(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('archived_at', 'created_at', 'description', 'description_html', 'fork_count', 'has_discussions_enabled', 'has_issues_enabled', 'has_projects_enabled', 'has_wiki_enabled', 'homepage_url', 'is_archived', 'is_fork', 'is_in_organization', 'is_locked', 'is_mirror', 'is_private', 'is_template', 'license_info', 'lock_reason', 'mirror_url', 'name', 'name_with_owner', 'open_graph_image_url', 'owner', 'pushed_at', 'resource_path', 'short_description_html', 'updated_at', 'url', 'uses_custom_open_graph_image', 'visibility')
+        archived_at = sgqlc.types.Field('DateTime', graphql_name='archivedAt')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        description_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='descriptionHTML')
+        fork_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='forkCount')
+        has_discussions_enabled = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasDiscussionsEnabled')
+        has_issues_enabled = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasIssuesEnabled')
+        has_projects_enabled = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasProjectsEnabled')
+        has_wiki_enabled = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasWikiEnabled')
+        homepage_url = sgqlc.types.Field('URI', graphql_name='homepageUrl')
+        is_archived = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isArchived')
+        is_fork = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isFork')
+        is_in_organization = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isInOrganization')
+        is_locked = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isLocked')
+        is_mirror = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isMirror')
+        is_private = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isPrivate')
+        is_template = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isTemplate')
+        license_info = sgqlc.types.Field('License', graphql_name='licenseInfo')
+        lock_reason = sgqlc.types.Field('RepositoryLockReason', graphql_name='lockReason')
+        mirror_url = sgqlc.types.Field('URI', graphql_name='mirrorUrl')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        name_with_owner = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='nameWithOwner')
+        open_graph_image_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='openGraphImageUrl')
+        owner = sgqlc.types.Field(sgqlc.types.non_null('RepositoryOwner'), graphql_name='owner')
+        pushed_at = sgqlc.types.Field('DateTime', graphql_name='pushedAt')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        short_description_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='shortDescriptionHTML', args=sgqlc.types.ArgDict((('limit', sgqlc.types.Arg(github_schema.Int, graphql_name='limit', default=200)),)))
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+        uses_custom_open_graph_image = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='usesCustomOpenGraphImage')
+        visibility = sgqlc.types.Field(sgqlc.types.non_null('RepositoryVisibility'), graphql_name='visibility')
+    return RepositoryInfo
+
+
+def RepositoryNode():
+    class RepositoryNode(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('repository',)
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+    return RepositoryNode
+
+
+def RepositoryOwner():
+    class RepositoryOwner(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('avatar_url', 'id', 'login', 'repositories', 'repository', 'resource_path', 'url')
+        avatar_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='avatarUrl', args=sgqlc.types.ArgDict((('size', sgqlc.types.Arg('Int', graphql_name='size', default=None)),)))
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        login = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='login')
+        repositories = sgqlc.types.Field(sgqlc.types.non_null('RepositoryConnection'), graphql_name='repositories', args=sgqlc.types.ArgDict((('privacy', sgqlc.types.Arg('RepositoryPrivacy', graphql_name='privacy', default=None)), ('order_by', sgqlc.types.Arg('RepositoryOrder', graphql_name='orderBy', default=None)), ('affiliations', sgqlc.types.Arg(sgqlc.types.list_of('RepositoryAffiliation'), graphql_name='affiliations', default=None)), ('owner_affiliations', sgqlc.types.Arg(sgqlc.types.list_of(github_schema.RepositoryAffiliation), graphql_name='ownerAffiliations', default=('OWNER', 'COLLABORATOR'))), ('is_locked', sgqlc.types.Arg('Boolean', graphql_name='isLocked', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('is_fork', sgqlc.types.Arg('Boolean', graphql_name='isFork', default=None)))))
+        repository = sgqlc.types.Field('Repository', graphql_name='repository', args=sgqlc.types.ArgDict((('name', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='name', default=None)), ('follow_renames', sgqlc.types.Arg(github_schema.Boolean, graphql_name='followRenames', default=True)))))
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return RepositoryOwner
+
+
+def RequirableByPullRequest():
+    class RequirableByPullRequest(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('is_required',)
+        is_required = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isRequired', args=sgqlc.types.ArgDict((('pull_request_id', sgqlc.types.Arg('ID', graphql_name='pullRequestId', default=None)), ('pull_request_number', sgqlc.types.Arg('Int', graphql_name='pullRequestNumber', default=None)))))
+    return RequirableByPullRequest
+
+
+def Sponsorable():
+    class Sponsorable(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('estimated_next_sponsors_payout_in_cents', 'has_sponsors_listing', 'is_sponsored_by', 'is_sponsoring_viewer', 'monthly_estimated_sponsors_income_in_cents', 'sponsoring', 'sponsors', 'sponsors_activities', 'sponsors_listing', 'sponsorship_for_viewer_as_sponsor', 'sponsorship_for_viewer_as_sponsorable', 'sponsorship_newsletters', 'sponsorships_as_maintainer', 'sponsorships_as_sponsor', 'total_sponsorship_amount_as_sponsor_in_cents', 'viewer_can_sponsor', 'viewer_is_sponsoring')
+        estimated_next_sponsors_payout_in_cents = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='estimatedNextSponsorsPayoutInCents')
+        has_sponsors_listing = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasSponsorsListing')
+        is_sponsored_by = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isSponsoredBy', args=sgqlc.types.ArgDict((('account_login', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='accountLogin', default=None)),)))
+        is_sponsoring_viewer = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isSponsoringViewer')
+        monthly_estimated_sponsors_income_in_cents = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='monthlyEstimatedSponsorsIncomeInCents')
+        sponsoring = sgqlc.types.Field(sgqlc.types.non_null('SponsorConnection'), graphql_name='sponsoring', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.SponsorOrder, graphql_name='orderBy', default={'field': 'RELEVANCE', 'direction': 'DESC'})))))
+        sponsors = sgqlc.types.Field(sgqlc.types.non_null('SponsorConnection'), graphql_name='sponsors', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('tier_id', sgqlc.types.Arg('ID', graphql_name='tierId', default=None)), ('order_by', sgqlc.types.Arg(github_schema.SponsorOrder, graphql_name='orderBy', default={'field': 'RELEVANCE', 'direction': 'DESC'})))))
+        sponsors_activities = sgqlc.types.Field(sgqlc.types.non_null('SponsorsActivityConnection'), graphql_name='sponsorsActivities', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('period', sgqlc.types.Arg(github_schema.SponsorsActivityPeriod, graphql_name='period', default='MONTH')), ('since', sgqlc.types.Arg('DateTime', graphql_name='since', default=None)), ('until', sgqlc.types.Arg('DateTime', graphql_name='until', default=None)), ('order_by', sgqlc.types.Arg(github_schema.SponsorsActivityOrder, graphql_name='orderBy', default={'field': 'TIMESTAMP', 'direction': 'DESC'})), ('actions', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null(github_schema.SponsorsActivityAction)), graphql_name='actions', default=())), ('include_as_sponsor', sgqlc.types.Arg(github_schema.Boolean, graphql_name='includeAsSponsor', default=False)))))
+        sponsors_listing = sgqlc.types.Field('SponsorsListing', graphql_name='sponsorsListing')
+        sponsorship_for_viewer_as_sponsor = sgqlc.types.Field('Sponsorship', graphql_name='sponsorshipForViewerAsSponsor', args=sgqlc.types.ArgDict((('active_only', sgqlc.types.Arg(github_schema.Boolean, graphql_name='activeOnly', default=True)),)))
+        sponsorship_for_viewer_as_sponsorable = sgqlc.types.Field('Sponsorship', graphql_name='sponsorshipForViewerAsSponsorable', args=sgqlc.types.ArgDict((('active_only', sgqlc.types.Arg(github_schema.Boolean, graphql_name='activeOnly', default=True)),)))
+        sponsorship_newsletters = sgqlc.types.Field(sgqlc.types.non_null('SponsorshipNewsletterConnection'), graphql_name='sponsorshipNewsletters', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.SponsorshipNewsletterOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'DESC'})))))
+        sponsorships_as_maintainer = sgqlc.types.Field(sgqlc.types.non_null('SponsorshipConnection'), graphql_name='sponsorshipsAsMaintainer', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('include_private', sgqlc.types.Arg(github_schema.Boolean, graphql_name='includePrivate', default=False)), ('order_by', sgqlc.types.Arg('SponsorshipOrder', graphql_name='orderBy', default=None)), ('active_only', sgqlc.types.Arg(github_schema.Boolean, graphql_name='activeOnly', default=True)))))
+        sponsorships_as_sponsor = sgqlc.types.Field(sgqlc.types.non_null('SponsorshipConnection'), graphql_name='sponsorshipsAsSponsor', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg('SponsorshipOrder', graphql_name='orderBy', default=None)), ('maintainer_logins', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='maintainerLogins', default=None)), ('active_only', sgqlc.types.Arg(github_schema.Boolean, graphql_name='activeOnly', default=True)))))
+        total_sponsorship_amount_as_sponsor_in_cents = sgqlc.types.Field('Int', graphql_name='totalSponsorshipAmountAsSponsorInCents', args=sgqlc.types.ArgDict((('since', sgqlc.types.Arg('DateTime', graphql_name='since', default=None)), ('until', sgqlc.types.Arg('DateTime', graphql_name='until', default=None)), ('sponsorable_logins', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null(github_schema.String)), graphql_name='sponsorableLogins', default=())))))
+        viewer_can_sponsor = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanSponsor')
+        viewer_is_sponsoring = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerIsSponsoring')
+    return Sponsorable
+
+
+def Starrable():
+    class Starrable(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'stargazer_count', 'stargazers', 'viewer_has_starred')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        stargazer_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='stargazerCount')
+        stargazers = sgqlc.types.Field(sgqlc.types.non_null('StargazerConnection'), graphql_name='stargazers', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg('StarOrder', graphql_name='orderBy', default=None)))))
+        viewer_has_starred = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerHasStarred')
+    return Starrable
+
+
+def Subscribable():
+    class Subscribable(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'viewer_can_subscribe', 'viewer_subscription')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        viewer_can_subscribe = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanSubscribe')
+        viewer_subscription = sgqlc.types.Field('SubscriptionState', graphql_name='viewerSubscription')
+    return Subscribable
+
+
+def TeamAuditEntryData():
+    class TeamAuditEntryData(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('team', 'team_name', 'team_resource_path', 'team_url')
+        team = sgqlc.types.Field('Team', graphql_name='team')
+        team_name = sgqlc.types.Field('String', graphql_name='teamName')
+        team_resource_path = sgqlc.types.Field('URI', graphql_name='teamResourcePath')
+        team_url = sgqlc.types.Field('URI', graphql_name='teamUrl')
+    return TeamAuditEntryData
+
+
+def TopicAuditEntryData():
+    class TopicAuditEntryData(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('topic', 'topic_name')
+        topic = sgqlc.types.Field('Topic', graphql_name='topic')
+        topic_name = sgqlc.types.Field('String', graphql_name='topicName')
+    return TopicAuditEntryData
+
+
+def UniformResourceLocatable():
+    class UniformResourceLocatable(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('resource_path', 'url')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return UniformResourceLocatable
+
+
+def Updatable():
+    class Updatable(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('viewer_can_update',)
+        viewer_can_update = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanUpdate')
+    return Updatable
+
+
+def UpdatableComment():
+    class UpdatableComment(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('viewer_cannot_update_reasons',)
+        viewer_cannot_update_reasons = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('CommentCannotUpdateReason'))), graphql_name='viewerCannotUpdateReasons')
+    return UpdatableComment
+
+
+def Votable():
+    class Votable(sgqlc.types.Interface):
+        __schema__ = github_schema
+        __field_names__ = ('upvote_count', 'viewer_can_upvote', 'viewer_has_upvoted')
+        upvote_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='upvoteCount')
+        viewer_can_upvote = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanUpvote')
+        viewer_has_upvoted = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerHasUpvoted')
+    return Votable
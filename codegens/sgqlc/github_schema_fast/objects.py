@@ -0,0 +1,7902 @@
+# Generated by tools/sgqlc_fast_schema.py
+# Source: github_schema.py
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+from . import github_schema
+
+
+def AbortQueuedMigrationsPayload():
+    class AbortQueuedMigrationsPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'success')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        success = sgqlc.types.Field('Boolean', graphql_name='success')
+    return AbortQueuedMigrationsPayload
+
+
+def AcceptEnterpriseAdministratorInvitationPayload():
+    class AcceptEnterpriseAdministratorInvitationPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'invitation', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        invitation = sgqlc.types.Field('EnterpriseAdministratorInvitation', graphql_name='invitation')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return AcceptEnterpriseAdministratorInvitationPayload
+
+
+def AcceptTopicSuggestionPayload():
+    class AcceptTopicSuggestionPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'topic')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        topic = sgqlc.types.Field('Topic', graphql_name='topic')
+    return AcceptTopicSuggestionPayload
+
+
+def ActorLocation():
+    class ActorLocation(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('city', 'country', 'country_code', 'region', 'region_code')
+        city = sgqlc.types.Field('String', graphql_name='city')
+        country = sgqlc.types.Field('String', graphql_name='country')
+        country_code = sgqlc.types.Field('String', graphql_name='countryCode')
+        region = sgqlc.types.Field('String', graphql_name='region')
+        region_code = sgqlc.types.Field('String', graphql_name='regionCode')
+    return ActorLocation
+
+
+def AddAssigneesToAssignablePayload():
+    class AddAssigneesToAssignablePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('assignable', 'client_mutation_id')
+        assignable = sgqlc.types.Field('Assignable', graphql_name='assignable')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return AddAssigneesToAssignablePayload
+
+
+def AddCommentPayload():
+    class AddCommentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'comment_edge', 'subject', 'timeline_edge')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        comment_edge = sgqlc.types.Field('IssueCommentEdge', graphql_name='commentEdge')
+        subject = sgqlc.types.Field('Node', graphql_name='subject')
+        timeline_edge = sgqlc.types.Field('IssueTimelineItemEdge', graphql_name='timelineEdge')
+    return AddCommentPayload
+
+
+def AddDiscussionCommentPayload():
+    class AddDiscussionCommentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'comment')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        comment = sgqlc.types.Field('DiscussionComment', graphql_name='comment')
+    return AddDiscussionCommentPayload
+
+
+def AddDiscussionPollVotePayload():
+    class AddDiscussionPollVotePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'poll_option')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        poll_option = sgqlc.types.Field('DiscussionPollOption', graphql_name='pollOption')
+    return AddDiscussionPollVotePayload
+
+
+def AddEnterpriseOrganizationMemberPayload():
+    class AddEnterpriseOrganizationMemberPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'users')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        users = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('User')), graphql_name='users')
+    return AddEnterpriseOrganizationMemberPayload
+
+
+def AddEnterpriseSupportEntitlementPayload():
+    class AddEnterpriseSupportEntitlementPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return AddEnterpriseSupportEntitlementPayload
+
+
+def AddLabelsToLabelablePayload():
+    class AddLabelsToLabelablePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'labelable')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        labelable = sgqlc.types.Field('Labelable', graphql_name='labelable')
+    return AddLabelsToLabelablePayload
+
+
+def AddProjectCardPayload():
+    class AddProjectCardPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('card_edge', 'client_mutation_id', 'project_column')
+        card_edge = sgqlc.types.Field('ProjectCardEdge', graphql_name='cardEdge')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_column = sgqlc.types.Field('ProjectColumn', graphql_name='projectColumn')
+    return AddProjectCardPayload
+
+
+def AddProjectColumnPayload():
+    class AddProjectColumnPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'column_edge', 'project')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        column_edge = sgqlc.types.Field('ProjectColumnEdge', graphql_name='columnEdge')
+        project = sgqlc.types.Field('Project', graphql_name='project')
+    return AddProjectColumnPayload
+
+
+def AddProjectV2DraftIssuePayload():
+    class AddProjectV2DraftIssuePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project_item')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_item = sgqlc.types.Field('ProjectV2Item', graphql_name='projectItem')
+    return AddProjectV2DraftIssuePayload
+
+
+def AddProjectV2ItemByIdPayload():
+    class AddProjectV2ItemByIdPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'item')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        item = sgqlc.types.Field('ProjectV2Item', graphql_name='item')
+    return AddProjectV2ItemByIdPayload
+
+
+def AddPullRequestReviewCommentPayload():
+    class AddPullRequestReviewCommentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'comment', 'comment_edge')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        comment = sgqlc.types.Field('PullRequestReviewComment', graphql_name='comment')
+        comment_edge = sgqlc.types.Field('PullRequestReviewCommentEdge', graphql_name='commentEdge')
+    return AddPullRequestReviewCommentPayload
+
+
+def AddPullRequestReviewPayload():
+    class AddPullRequestReviewPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request_review', 'review_edge')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request_review = sgqlc.types.Field('PullRequestReview', graphql_name='pullRequestReview')
+        review_edge = sgqlc.types.Field('PullRequestReviewEdge', graphql_name='reviewEdge')
+    return AddPullRequestReviewPayload
+
+
+def AddPullRequestReviewThreadPayload():
+    class AddPullRequestReviewThreadPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'thread')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        thread = sgqlc.types.Field('PullRequestReviewThread', graphql_name='thread')
+    return AddPullRequestReviewThreadPayload
+
+
+def AddReactionPayload():
+    class AddReactionPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'reaction', 'reaction_groups', 'subject')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        reaction = sgqlc.types.Field('Reaction', graphql_name='reaction')
+        reaction_groups = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ReactionGroup')), graphql_name='reactionGroups')
+        subject = sgqlc.types.Field('Reactable', graphql_name='subject')
+    return AddReactionPayload
+
+
+def AddStarPayload():
+    class AddStarPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'starrable')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        starrable = sgqlc.types.Field('Starrable', graphql_name='starrable')
+    return AddStarPayload
+
+
+def AddUpvotePayload():
+    class AddUpvotePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'subject')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        subject = sgqlc.types.Field('Votable', graphql_name='subject')
+    return AddUpvotePayload
+
+
+def AddVerifiableDomainPayload():
+    class AddVerifiableDomainPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'domain')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        domain = sgqlc.types.Field('VerifiableDomain', graphql_name='domain')
+    return AddVerifiableDomainPayload
+
+
+def ApproveDeploymentsPayload():
+    class ApproveDeploymentsPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'deployments')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        deployments = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('Deployment')), graphql_name='deployments')
+    return ApproveDeploymentsPayload
+
+
+def ApproveVerifiableDomainPayload():
+    class ApproveVerifiableDomainPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'domain')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        domain = sgqlc.types.Field('VerifiableDomain', graphql_name='domain')
+    return ApproveVerifiableDomainPayload
+
+
+def ArchiveProjectV2ItemPayload():
+    class ArchiveProjectV2ItemPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'item')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        item = sgqlc.types.Field('ProjectV2Item', graphql_name='item')
+    return ArchiveProjectV2ItemPayload
+
+
+def ArchiveRepositoryPayload():
+    class ArchiveRepositoryPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'repository')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return ArchiveRepositoryPayload
+
+
+def AutoMergeRequest():
+    class AutoMergeRequest(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('author_email', 'commit_body', 'commit_headline', 'enabled_at', 'enabled_by', 'merge_method', 'pull_request')
+        author_email = sgqlc.types.Field('String', graphql_name='authorEmail')
+        commit_body = sgqlc.types.Field('String', graphql_name='commitBody')
+        commit_headline = sgqlc.types.Field('String', graphql_name='commitHeadline')
+        enabled_at = sgqlc.types.Field('DateTime', graphql_name='enabledAt')
+        enabled_by = sgqlc.types.Field('Actor', graphql_name='enabledBy')
+        merge_method = sgqlc.types.Field(sgqlc.types.non_null('PullRequestMergeMethod'), graphql_name='mergeMethod')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+    return AutoMergeRequest
+
+
+def Blame():
+    class Blame(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('ranges',)
+        ranges = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('BlameRange'))), graphql_name='ranges')
+    return Blame
+
+
+def BlameRange():
+    class BlameRange(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('age', 'commit', 'ending_line', 'starting_line')
+        age = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='age')
+        commit = sgqlc.types.Field(sgqlc.types.non_null('Commit'), graphql_name='commit')
+        ending_line = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='endingLine')
+        starting_line = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='startingLine')
+    return BlameRange
+
+
+def BranchNamePatternParameters():
+    class BranchNamePatternParameters(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'negate', 'operator', 'pattern')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        negate = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='negate')
+        operator = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='operator')
+        pattern = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='pattern')
+    return BranchNamePatternParameters
+
+
+def BranchProtectionRuleConflict():
+    class BranchProtectionRuleConflict(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('branch_protection_rule', 'conflicting_branch_protection_rule', 'ref')
+        branch_protection_rule = sgqlc.types.Field('BranchProtectionRule', graphql_name='branchProtectionRule')
+        conflicting_branch_protection_rule = sgqlc.types.Field('BranchProtectionRule', graphql_name='conflictingBranchProtectionRule')
+        ref = sgqlc.types.Field('Ref', graphql_name='ref')
+    return BranchProtectionRuleConflict
+
+
+def BranchProtectionRuleConflictEdge():
+    class BranchProtectionRuleConflictEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('BranchProtectionRuleConflict', graphql_name='node')
+    return BranchProtectionRuleConflictEdge
+
+
+def BranchProtectionRuleEdge():
+    class BranchProtectionRuleEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('BranchProtectionRule', graphql_name='node')
+    return BranchProtectionRuleEdge
+
+
+def BypassForcePushAllowanceEdge():
+    class BypassForcePushAllowanceEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('BypassForcePushAllowance', graphql_name='node')
+    return BypassForcePushAllowanceEdge
+
+
+def BypassPullRequestAllowanceEdge():
+    class BypassPullRequestAllowanceEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('BypassPullRequestAllowance', graphql_name='node')
+    return BypassPullRequestAllowanceEdge
+
+
+def CVSS():
+    class CVSS(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('score', 'vector_string')
+        score = sgqlc.types.Field(sgqlc.types.non_null('Float'), graphql_name='score')
+        vector_string = sgqlc.types.Field('String', graphql_name='vectorString')
+    return CVSS
+
+
+def CWEEdge():
+    class CWEEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('CWE', graphql_name='node')
+    return CWEEdge
+
+
+def CancelEnterpriseAdminInvitationPayload():
+    class CancelEnterpriseAdminInvitationPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'invitation', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        invitation = sgqlc.types.Field('EnterpriseAdministratorInvitation', graphql_name='invitation')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return CancelEnterpriseAdminInvitationPayload
+
+
+def CancelSponsorshipPayload():
+    class CancelSponsorshipPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'sponsors_tier')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        sponsors_tier = sgqlc.types.Field('SponsorsTier', graphql_name='sponsorsTier')
+    return CancelSponsorshipPayload
+
+
+def ChangeUserStatusPayload():
+    class ChangeUserStatusPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'status')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        status = sgqlc.types.Field('UserStatus', graphql_name='status')
+    return ChangeUserStatusPayload
+
+
+def CheckAnnotation():
+    class CheckAnnotation(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('annotation_level', 'blob_url', 'database_id', 'location', 'message', 'path', 'raw_details', 'title')
+        annotation_level = sgqlc.types.Field('CheckAnnotationLevel', graphql_name='annotationLevel')
+        blob_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='blobUrl')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        location = sgqlc.types.Field(sgqlc.types.non_null('CheckAnnotationSpan'), graphql_name='location')
+        message = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='message')
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+        raw_details = sgqlc.types.Field('String', graphql_name='rawDetails')
+        title = sgqlc.types.Field('String', graphql_name='title')
+    return CheckAnnotation
+
+
+def CheckAnnotationEdge():
+    class CheckAnnotationEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('CheckAnnotation', graphql_name='node')
+    return CheckAnnotationEdge
+
+
+def CheckAnnotationPosition():
+    class CheckAnnotationPosition(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('column', 'line')
+        column = sgqlc.types.Field('Int', graphql_name='column')
+        line = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='line')
+    return CheckAnnotationPosition
+
+
+def CheckAnnotationSpan():
+    class CheckAnnotationSpan(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('end', 'start')
+        end = sgqlc.types.Field(sgqlc.types.non_null('CheckAnnotationPosition'), graphql_name='end')
+        start = sgqlc.types.Field(sgqlc.types.non_null('CheckAnnotationPosition'), graphql_name='start')
+    return CheckAnnotationSpan
+
+
+def CheckRunEdge():
+    class CheckRunEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('CheckRun', graphql_name='node')
+    return CheckRunEdge
+
+
+def CheckRunStateCount():
+    class CheckRunStateCount(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('count', 'state')
+        count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='count')
+        state = sgqlc.types.Field(sgqlc.types.non_null('CheckRunState'), graphql_name='state')
+    return CheckRunStateCount
+
+
+def CheckStep():
+    class CheckStep(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('completed_at', 'conclusion', 'external_id', 'name', 'number', 'seconds_to_completion', 'started_at', 'status')
+        completed_at = sgqlc.types.Field('DateTime', graphql_name='completedAt')
+        conclusion = sgqlc.types.Field('CheckConclusionState', graphql_name='conclusion')
+        external_id = sgqlc.types.Field('String', graphql_name='externalId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        number = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='number')
+        seconds_to_completion = sgqlc.types.Field('Int', graphql_name='secondsToCompletion')
+        started_at = sgqlc.types.Field('DateTime', graphql_name='startedAt')
+        status = sgqlc.types.Field(sgqlc.types.non_null('CheckStatusState'), graphql_name='status')
+    return CheckStep
+
+
+def CheckStepEdge():
+    class CheckStepEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('CheckStep', graphql_name='node')
+    return CheckStepEdge
+
+
+def CheckSuiteEdge():
+    class CheckSuiteEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('CheckSuite', graphql_name='node')
+    return CheckSuiteEdge
+
+
+def ClearLabelsFromLabelablePayload():
+    class ClearLabelsFromLabelablePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'labelable')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        labelable = sgqlc.types.Field('Labelable', graphql_name='labelable')
+    return ClearLabelsFromLabelablePayload
+
+
+def ClearProjectV2ItemFieldValuePayload():
+    class ClearProjectV2ItemFieldValuePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project_v2_item')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_v2_item = sgqlc.types.Field('ProjectV2Item', graphql_name='projectV2Item')
+    return ClearProjectV2ItemFieldValuePayload
+
+
+def CloneProjectPayload():
+    class CloneProjectPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'job_status_id', 'project')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        job_status_id = sgqlc.types.Field('String', graphql_name='jobStatusId')
+        project = sgqlc.types.Field('Project', graphql_name='project')
+    return CloneProjectPayload
+
+
+def CloneTemplateRepositoryPayload():
+    class CloneTemplateRepositoryPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'repository')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return CloneTemplateRepositoryPayload
+
+
+def CloseDiscussionPayload():
+    class CloseDiscussionPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'discussion')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        discussion = sgqlc.types.Field('Discussion', graphql_name='discussion')
+    return CloseDiscussionPayload
+
+
+def CloseIssuePayload():
+    class CloseIssuePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'issue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        issue = sgqlc.types.Field('Issue', graphql_name='issue')
+    return CloseIssuePayload
+
+
+def ClosePullRequestPayload():
+    class ClosePullRequestPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return ClosePullRequestPayload
+
+
+def CommitAuthorEmailPatternParameters():
+    class CommitAuthorEmailPatternParameters(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'negate', 'operator', 'pattern')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        negate = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='negate')
+        operator = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='operator')
+        pattern = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='pattern')
+    return CommitAuthorEmailPatternParameters
+
+
+def CommitCommentEdge():
+    class CommitCommentEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('CommitComment', graphql_name='node')
+    return CommitCommentEdge
+
+
+def CommitContributionsByRepository():
+    class CommitContributionsByRepository(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('contributions', 'repository', 'resource_path', 'url')
+        contributions = sgqlc.types.Field(sgqlc.types.non_null('CreatedCommitContributionConnection'), graphql_name='contributions', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.CommitContributionOrder, graphql_name='orderBy', default={'field': 'OCCURRED_AT', 'direction': 'DESC'})))))
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return CommitContributionsByRepository
+
+
+def CommitEdge():
+    class CommitEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Commit', graphql_name='node')
+    return CommitEdge
+
+
+def CommitMessagePatternParameters():
+    class CommitMessagePatternParameters(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'negate', 'operator', 'pattern')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        negate = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='negate')
+        operator = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='operator')
+        pattern = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='pattern')
+    return CommitMessagePatternParameters
+
+
+def CommitterEmailPatternParameters():
+    class CommitterEmailPatternParameters(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'negate', 'operator', 'pattern')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        negate = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='negate')
+        operator = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='operator')
+        pattern = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='pattern')
+    return CommitterEmailPatternParameters
+
+
+def ContributionCalendar():
+    class ContributionCalendar(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('colors', 'is_halloween', 'months', 'total_contributions', 'weeks')
+        colors = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='colors')
+        is_halloween = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isHalloween')
+        months = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ContributionCalendarMonth'))), graphql_name='months')
+        total_contributions = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalContributions')
+        weeks = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ContributionCalendarWeek'))), graphql_name='weeks')
+    return ContributionCalendar
+
+
+def ContributionCalendarDay():
+    class ContributionCalendarDay(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('color', 'contribution_count', 'contribution_level', 'date', 'weekday')
+        color = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='color')
+        contribution_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='contributionCount')
+        contribution_level = sgqlc.types.Field(sgqlc.types.non_null('ContributionLevel'), graphql_name='contributionLevel')
+        date = sgqlc.types.Field(sgqlc.types.non_null('Date'), graphql_name='date')
+        weekday = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='weekday')
+    return ContributionCalendarDay
+
+
+def ContributionCalendarMonth():
+    class ContributionCalendarMonth(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('first_day', 'name', 'total_weeks', 'year')
+        first_day = sgqlc.types.Field(sgqlc.types.non_null('Date'), graphql_name='firstDay')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        total_weeks = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalWeeks')
+        year = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='year')
+    return ContributionCalendarMonth
+
+
+def ContributionCalendarWeek():
+    class ContributionCalendarWeek(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('contribution_days', 'first_day')
+        contribution_days = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ContributionCalendarDay'))), graphql_name='contributionDays')
+        first_day = sgqlc.types.Field(sgqlc.types.non_null('Date'), graphql_name='firstDay')
+    return ContributionCalendarWeek
+
+
+def ContributionsCollection():
+    class ContributionsCollection(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('commit_contributions_by_repository', 'contribution_calendar', 'contribution_years', 'does_end_in_current_month', 'earliest_restricted_contribution_date', 'ended_at', 'first_issue_contribution', 'first_pull_request_contribution', 'first_repository_contribution', 'has_activity_in_the_past', 'has_any_contributions', 'has_any_restricted_contributions', 'is_single_day', 'issue_contributions', 'issue_contributions_by_repository', 'joined_git_hub_contribution', 'latest_restricted_contribution_date', 'most_recent_collection_with_activity', 'most_recent_collection_without_activity', 'popular_issue_contribution', 'popular_pull_request_contribution', 'pull_request_contributions', 'pull_request_contributions_by_repository', 'pull_request_review_contributions', 'pull_request_review_contributions_by_repository', 'repository_contributions', 'restricted_contributions_count', 'started_at', 'total_commit_contributions', 'total_issue_contributions', 'total_pull_request_contributions', 'total_pull_request_review_contributions', 'total_repositories_with_contributed_commits', 'total_repositories_with_contributed_issues', 'total_repositories_with_contributed_pull_request_reviews', 'total_repositories_with_contributed_pull_requests', 'total_repository_contributions', 'user')
+        commit_contributions_by_repository = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('CommitContributionsByRepository'))), graphql_name='commitContributionsByRepository', args=sgqlc.types.ArgDict((('max_repositories', sgqlc.types.Arg(github_schema.Int, graphql_name='maxRepositories', default=25)),)))
+        contribution_calendar = sgqlc.types.Field(sgqlc.types.non_null('ContributionCalendar'), graphql_name='contributionCalendar')
+        contribution_years = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Int'))), graphql_name='contributionYears')
+        does_end_in_current_month = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='doesEndInCurrentMonth')
+        earliest_restricted_contribution_date = sgqlc.types.Field('Date', graphql_name='earliestRestrictedContributionDate')
+        ended_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='endedAt')
+        first_issue_contribution = sgqlc.types.Field('CreatedIssueOrRestrictedContribution', graphql_name='firstIssueContribution')
+        first_pull_request_contribution = sgqlc.types.Field('CreatedPullRequestOrRestrictedContribution', graphql_name='firstPullRequestContribution')
+        first_repository_contribution = sgqlc.types.Field('CreatedRepositoryOrRestrictedContribution', graphql_name='firstRepositoryContribution')
+        has_activity_in_the_past = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasActivityInThePast')
+        has_any_contributions = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasAnyContributions')
+        has_any_restricted_contributions = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasAnyRestrictedContributions')
+        is_single_day = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isSingleDay')
+        issue_contributions = sgqlc.types.Field(sgqlc.types.non_null('CreatedIssueContributionConnection'), graphql_name='issueContributions', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('exclude_first', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludeFirst', default=False)), ('exclude_popular', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludePopular', default=False)), ('order_by', sgqlc.types.Arg(github_schema.ContributionOrder, graphql_name='orderBy', default={'direction': 'DESC'})))))
+        issue_contributions_by_repository = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('IssueContributionsByRepository'))), graphql_name='issueContributionsByRepository', args=sgqlc.types.ArgDict((('max_repositories', sgqlc.types.Arg(github_schema.Int, graphql_name='maxRepositories', default=25)), ('exclude_first', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludeFirst', default=False)), ('exclude_popular', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludePopular', default=False)))))
+        joined_git_hub_contribution = sgqlc.types.Field('JoinedGitHubContribution', graphql_name='joinedGitHubContribution')
+        latest_restricted_contribution_date = sgqlc.types.Field('Date', graphql_name='latestRestrictedContributionDate')
+        most_recent_collection_with_activity = sgqlc.types.Field('ContributionsCollection', graphql_name='mostRecentCollectionWithActivity')
+        most_recent_collection_without_activity = sgqlc.types.Field('ContributionsCollection', graphql_name='mostRecentCollectionWithoutActivity')
+        popular_issue_contribution = sgqlc.types.Field('CreatedIssueContribution', graphql_name='popularIssueContribution')
+        popular_pull_request_contribution = sgqlc.types.Field('CreatedPullRequestContribution', graphql_name='popularPullRequestContribution')
+        pull_request_contributions = sgqlc.types.Field(sgqlc.types.non_null('CreatedPullRequestContributionConnection'), graphql_name='pullRequestContributions', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('exclude_first', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludeFirst', default=False)), ('exclude_popular', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludePopular', default=False)), ('order_by', sgqlc.types.Arg(github_schema.ContributionOrder, graphql_name='orderBy', default={'direction': 'DESC'})))))
+        pull_request_contributions_by_repository = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PullRequestContributionsByRepository'))), graphql_name='pullRequestContributionsByRepository', args=sgqlc.types.ArgDict((('max_repositories', sgqlc.types.Arg(github_schema.Int, graphql_name='maxRepositories', default=25)), ('exclude_first', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludeFirst', default=False)), ('exclude_popular', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludePopular', default=False)))))
+        pull_request_review_contributions = sgqlc.types.Field(sgqlc.types.non_null('CreatedPullRequestReviewContributionConnection'), graphql_name='pullRequestReviewContributions', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ContributionOrder, graphql_name='orderBy', default={'direction': 'DESC'})))))
+        pull_request_review_contributions_by_repository = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PullRequestReviewContributionsByRepository'))), graphql_name='pullRequestReviewContributionsByRepository', args=sgqlc.types.ArgDict((('max_repositories', sgqlc.types.Arg(github_schema.Int, graphql_name='maxRepositories', default=25)),)))
+        repository_contributions = sgqlc.types.Field(sgqlc.types.non_null('CreatedRepositoryContributionConnection'), graphql_name='repositoryContributions', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('exclude_first', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludeFirst', default=False)), ('order_by', sgqlc.types.Arg(github_schema.ContributionOrder, graphql_name='orderBy', default={'direction': 'DESC'})))))
+        restricted_contributions_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='restrictedContributionsCount')
+        started_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='startedAt')
+        total_commit_contributions = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCommitContributions')
+        total_issue_contributions = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalIssueContributions', args=sgqlc.types.ArgDict((('exclude_first', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludeFirst', default=False)), ('exclude_popular', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludePopular', default=False)))))
+        total_pull_request_contributions = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalPullRequestContributions', args=sgqlc.types.ArgDict((('exclude_first', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludeFirst', default=False)), ('exclude_popular', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludePopular', default=False)))))
+        total_pull_request_review_contributions = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalPullRequestReviewContributions')
+        total_repositories_with_contributed_commits = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalRepositoriesWithContributedCommits')
+        total_repositories_with_contributed_issues = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalRepositoriesWithContributedIssues', args=sgqlc.types.ArgDict((('exclude_first', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludeFirst', default=False)), ('exclude_popular', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludePopular', default=False)))))
+        total_repositories_with_contributed_pull_request_reviews = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalRepositoriesWithContributedPullRequestReviews')
+        total_repositories_with_contributed_pull_requests = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalRepositoriesWithContributedPullRequests', args=sgqlc.types.ArgDict((('exclude_first', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludeFirst', default=False)), ('exclude_popular', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludePopular', default=False)))))
+        total_repository_contributions = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalRepositoryContributions', args=sgqlc.types.ArgDict((('exclude_first', sgqlc.types.Arg(github_schema.Boolean, graphql_name='excludeFirst', default=False)),)))
+        user = sgqlc.types.Field(sgqlc.types.non_null('User'), graphql_name='user')
+    return ContributionsCollection
+
+
+def ConvertProjectCardNoteToIssuePayload():
+    class ConvertProjectCardNoteToIssuePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project_card')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_card = sgqlc.types.Field('ProjectCard', graphql_name='projectCard')
+    return ConvertProjectCardNoteToIssuePayload
+
+
+def ConvertPullRequestToDraftPayload():
+    class ConvertPullRequestToDraftPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return ConvertPullRequestToDraftPayload
+
+
+def CopyProjectV2Payload():
+    class CopyProjectV2Payload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project_v2')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_v2 = sgqlc.types.Field('ProjectV2', graphql_name='projectV2')
+    return CopyProjectV2Payload
+
+
+def CreateAttributionInvitationPayload():
+    class CreateAttributionInvitationPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'owner', 'source', 'target')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        owner = sgqlc.types.Field('Organization', graphql_name='owner')
+        source = sgqlc.types.Field('Claimable', graphql_name='source')
+        target = sgqlc.types.Field('Claimable', graphql_name='target')
+    return CreateAttributionInvitationPayload
+
+
+def CreateBranchProtectionRulePayload():
+    class CreateBranchProtectionRulePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('branch_protection_rule', 'client_mutation_id')
+        branch_protection_rule = sgqlc.types.Field('BranchProtectionRule', graphql_name='branchProtectionRule')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateBranchProtectionRulePayload
+
+
+def CreateCheckRunPayload():
+    class CreateCheckRunPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('check_run', 'client_mutation_id')
+        check_run = sgqlc.types.Field('CheckRun', graphql_name='checkRun')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateCheckRunPayload
+
+
+def CreateCheckSuitePayload():
+    class CreateCheckSuitePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('check_suite', 'client_mutation_id')
+        check_suite = sgqlc.types.Field('CheckSuite', graphql_name='checkSuite')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return CreateCheckSuitePayload
+
+
+def CreateCommitOnBranchPayload():
+    class CreateCommitOnBranchPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'commit', 'ref')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        commit = sgqlc.types.Field('Commit', graphql_name='commit')
+        ref = sgqlc.types.Field('Ref', graphql_name='ref')
+    return CreateCommitOnBranchPayload
+
+
+def CreateDiscussionPayload():
+    class CreateDiscussionPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'discussion')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        discussion = sgqlc.types.Field('Discussion', graphql_name='discussion')
+    return CreateDiscussionPayload
+
+
+def CreateEnterpriseOrganizationPayload():
+    class CreateEnterpriseOrganizationPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'organization')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        organization = sgqlc.types.Field('Organization', graphql_name='organization')
+    return CreateEnterpriseOrganizationPayload
+
+
+def CreateEnvironmentPayload():
+    class CreateEnvironmentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'environment')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        environment = sgqlc.types.Field('Environment', graphql_name='environment')
+    return CreateEnvironmentPayload
+
+
+def CreateIpAllowListEntryPayload():
+    class CreateIpAllowListEntryPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'ip_allow_list_entry')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        ip_allow_list_entry = sgqlc.types.Field('IpAllowListEntry', graphql_name='ipAllowListEntry')
+    return CreateIpAllowListEntryPayload
+
+
+def CreateIssuePayload():
+    class CreateIssuePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'issue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        issue = sgqlc.types.Field('Issue', graphql_name='issue')
+    return CreateIssuePayload
+
+
+def CreateLinkedBranchPayload():
+    class CreateLinkedBranchPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'linked_branch')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        linked_branch = sgqlc.types.Field('LinkedBranch', graphql_name='linkedBranch')
+    return CreateLinkedBranchPayload
+
+
+def CreateMigrationSourcePayload():
+    class CreateMigrationSourcePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'migration_source')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        migration_source = sgqlc.types.Field('MigrationSource', graphql_name='migrationSource')
+    return CreateMigrationSourcePayload
+
+
+def CreateProjectPayload():
+    class CreateProjectPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project = sgqlc.types.Field('Project', graphql_name='project')
+    return CreateProjectPayload
+
+
+def CreateProjectV2FieldPayload():
+    class CreateProjectV2FieldPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project_v2_field')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_v2_field = sgqlc.types.Field('ProjectV2FieldConfiguration', graphql_name='projectV2Field')
+    return CreateProjectV2FieldPayload
+
+
+def CreateProjectV2Payload():
+    class CreateProjectV2Payload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project_v2')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_v2 = sgqlc.types.Field('ProjectV2', graphql_name='projectV2')
+    return CreateProjectV2Payload
+
+
+def CreatePullRequestPayload():
+    class CreatePullRequestPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return CreatePullRequestPayload
+
+
+def CreateRefPayload():
+    class CreateRefPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'ref')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        ref = sgqlc.types.Field('Ref', graphql_name='ref')
+    return CreateRefPayload
+
+
+def CreateRepositoryPayload():
+    class CreateRepositoryPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'repository')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return CreateRepositoryPayload
+
+
+def CreateRepositoryRulesetPayload():
+    class CreateRepositoryRulesetPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'ruleset')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        ruleset = sgqlc.types.Field('RepositoryRuleset', graphql_name='ruleset')
+    return CreateRepositoryRulesetPayload
+
+
+def CreateSponsorsListingPayload():
+    class CreateSponsorsListingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'sponsors_listing')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        sponsors_listing = sgqlc.types.Field('SponsorsListing', graphql_name='sponsorsListing')
+    return CreateSponsorsListingPayload
+
+
+def CreateSponsorsTierPayload():
+    class CreateSponsorsTierPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'sponsors_tier')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        sponsors_tier = sgqlc.types.Field('SponsorsTier', graphql_name='sponsorsTier')
+    return CreateSponsorsTierPayload
+
+
+def CreateSponsorshipPayload():
+    class CreateSponsorshipPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'sponsorship')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        sponsorship = sgqlc.types.Field('Sponsorship', graphql_name='sponsorship')
+    return CreateSponsorshipPayload
+
+
+def CreateSponsorshipsPayload():
+    class CreateSponsorshipsPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'sponsorables')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        sponsorables = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('Sponsorable')), graphql_name='sponsorables')
+    return CreateSponsorshipsPayload
+
+
+def CreateTeamDiscussionCommentPayload():
+    class CreateTeamDiscussionCommentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'team_discussion_comment')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        team_discussion_comment = sgqlc.types.Field('TeamDiscussionComment', graphql_name='teamDiscussionComment')
+    return CreateTeamDiscussionCommentPayload
+
+
+def CreateTeamDiscussionPayload():
+    class CreateTeamDiscussionPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'team_discussion')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        team_discussion = sgqlc.types.Field('TeamDiscussion', graphql_name='teamDiscussion')
+    return CreateTeamDiscussionPayload
+
+
+def CreatedCommitContributionEdge():
+    class CreatedCommitContributionEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('CreatedCommitContribution', graphql_name='node')
+    return CreatedCommitContributionEdge
+
+
+def CreatedIssueContributionEdge():
+    class CreatedIssueContributionEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('CreatedIssueContribution', graphql_name='node')
+    return CreatedIssueContributionEdge
+
+
+def CreatedPullRequestContributionEdge():
+    class CreatedPullRequestContributionEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('CreatedPullRequestContribution', graphql_name='node')
+    return CreatedPullRequestContributionEdge
+
+
+def CreatedPullRequestReviewContributionEdge():
+    class CreatedPullRequestReviewContributionEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('CreatedPullRequestReviewContribution', graphql_name='node')
+    return CreatedPullRequestReviewContributionEdge
+
+
+def CreatedRepositoryContributionEdge():
+    class CreatedRepositoryContributionEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('CreatedRepositoryContribution', graphql_name='node')
+    return CreatedRepositoryContributionEdge
+
+
+def DeclineTopicSuggestionPayload():
+    class DeclineTopicSuggestionPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'topic')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        topic = sgqlc.types.Field('Topic', graphql_name='topic')
+    return DeclineTopicSuggestionPayload
+
+
+def DeleteBranchProtectionRulePayload():
+    class DeleteBranchProtectionRulePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id',)
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteBranchProtectionRulePayload
+
+
+def DeleteDeploymentPayload():
+    class DeleteDeploymentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id',)
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteDeploymentPayload
+
+
+def DeleteDiscussionCommentPayload():
+    class DeleteDiscussionCommentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'comment')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        comment = sgqlc.types.Field('DiscussionComment', graphql_name='comment')
+    return DeleteDiscussionCommentPayload
+
+
+def DeleteDiscussionPayload():
+    class DeleteDiscussionPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'discussion')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        discussion = sgqlc.types.Field('Discussion', graphql_name='discussion')
+    return DeleteDiscussionPayload
+
+
+def DeleteEnvironmentPayload():
+    class DeleteEnvironmentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id',)
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteEnvironmentPayload
+
+
+def DeleteIpAllowListEntryPayload():
+    class DeleteIpAllowListEntryPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'ip_allow_list_entry')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        ip_allow_list_entry = sgqlc.types.Field('IpAllowListEntry', graphql_name='ipAllowListEntry')
+    return DeleteIpAllowListEntryPayload
+
+
+def DeleteIssueCommentPayload():
+    class DeleteIssueCommentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id',)
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteIssueCommentPayload
+
+
+def DeleteIssuePayload():
+    class DeleteIssuePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'repository')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return DeleteIssuePayload
+
+
+def DeleteLinkedBranchPayload():
+    class DeleteLinkedBranchPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'issue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        issue = sgqlc.types.Field('Issue', graphql_name='issue')
+    return DeleteLinkedBranchPayload
+
+
+def DeleteProjectCardPayload():
+    class DeleteProjectCardPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'column', 'deleted_card_id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        column = sgqlc.types.Field('ProjectColumn', graphql_name='column')
+        deleted_card_id = sgqlc.types.Field('ID', graphql_name='deletedCardId')
+    return DeleteProjectCardPayload
+
+
+def DeleteProjectColumnPayload():
+    class DeleteProjectColumnPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'deleted_column_id', 'project')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        deleted_column_id = sgqlc.types.Field('ID', graphql_name='deletedColumnId')
+        project = sgqlc.types.Field('Project', graphql_name='project')
+    return DeleteProjectColumnPayload
+
+
+def DeleteProjectPayload():
+    class DeleteProjectPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'owner')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        owner = sgqlc.types.Field('ProjectOwner', graphql_name='owner')
+    return DeleteProjectPayload
+
+
+def DeleteProjectV2FieldPayload():
+    class DeleteProjectV2FieldPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project_v2_field')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_v2_field = sgqlc.types.Field('ProjectV2FieldConfiguration', graphql_name='projectV2Field')
+    return DeleteProjectV2FieldPayload
+
+
+def DeleteProjectV2ItemPayload():
+    class DeleteProjectV2ItemPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'deleted_item_id')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        deleted_item_id = sgqlc.types.Field('ID', graphql_name='deletedItemId')
+    return DeleteProjectV2ItemPayload
+
+
+def DeleteProjectV2Payload():
+    class DeleteProjectV2Payload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project_v2')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_v2 = sgqlc.types.Field('ProjectV2', graphql_name='projectV2')
+    return DeleteProjectV2Payload
+
+
+def DeleteProjectV2WorkflowPayload():
+    class DeleteProjectV2WorkflowPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'deleted_workflow_id', 'project_v2')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        deleted_workflow_id = sgqlc.types.Field('ID', graphql_name='deletedWorkflowId')
+        project_v2 = sgqlc.types.Field('ProjectV2', graphql_name='projectV2')
+    return DeleteProjectV2WorkflowPayload
+
+
+def DeletePullRequestReviewCommentPayload():
+    class DeletePullRequestReviewCommentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request_review', 'pull_request_review_comment')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request_review = sgqlc.types.Field('PullRequestReview', graphql_name='pullRequestReview')
+        pull_request_review_comment = sgqlc.types.Field('PullRequestReviewComment', graphql_name='pullRequestReviewComment')
+    return DeletePullRequestReviewCommentPayload
+
+
+def DeletePullRequestReviewPayload():
+    class DeletePullRequestReviewPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request_review')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request_review = sgqlc.types.Field('PullRequestReview', graphql_name='pullRequestReview')
+    return DeletePullRequestReviewPayload
+
+
+def DeleteRefPayload():
+    class DeleteRefPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id',)
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteRefPayload
+
+
+def DeleteRepositoryRulesetPayload():
+    class DeleteRepositoryRulesetPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id',)
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteRepositoryRulesetPayload
+
+
+def DeleteTeamDiscussionCommentPayload():
+    class DeleteTeamDiscussionCommentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id',)
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteTeamDiscussionCommentPayload
+
+
+def DeleteTeamDiscussionPayload():
+    class DeleteTeamDiscussionPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id',)
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return DeleteTeamDiscussionPayload
+
+
+def DeleteVerifiableDomainPayload():
+    class DeleteVerifiableDomainPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'owner')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        owner = sgqlc.types.Field('VerifiableDomainOwner', graphql_name='owner')
+    return DeleteVerifiableDomainPayload
+
+
+def DependabotUpdateError():
+    class DependabotUpdateError(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('body', 'error_type', 'title')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        error_type = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='errorType')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+    return DependabotUpdateError
+
+
+def DeployKeyEdge():
+    class DeployKeyEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('DeployKey', graphql_name='node')
+    return DeployKeyEdge
+
+
+def DeploymentEdge():
+    class DeploymentEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Deployment', graphql_name='node')
+    return DeploymentEdge
+
+
+def DeploymentProtectionRule():
+    class DeploymentProtectionRule(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('database_id', 'reviewers', 'timeout', 'type')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        reviewers = sgqlc.types.Field(sgqlc.types.non_null('DeploymentReviewerConnection'), graphql_name='reviewers', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        timeout = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='timeout')
+        type = sgqlc.types.Field(sgqlc.types.non_null('DeploymentProtectionRuleType'), graphql_name='type')
+    return DeploymentProtectionRule
+
+
+def DeploymentProtectionRuleEdge():
+    class DeploymentProtectionRuleEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('DeploymentProtectionRule', graphql_name='node')
+    return DeploymentProtectionRuleEdge
+
+
+def DeploymentRequest():
+    class DeploymentRequest(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('current_user_can_approve', 'environment', 'reviewers', 'wait_timer', 'wait_timer_started_at')
+        current_user_can_approve = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='currentUserCanApprove')
+        environment = sgqlc.types.Field(sgqlc.types.non_null('Environment'), graphql_name='environment')
+        reviewers = sgqlc.types.Field(sgqlc.types.non_null('DeploymentReviewerConnection'), graphql_name='reviewers', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        wait_timer = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='waitTimer')
+        wait_timer_started_at = sgqlc.types.Field('DateTime', graphql_name='waitTimerStartedAt')
+    return DeploymentRequest
+
+
+def DeploymentRequestEdge():
+    class DeploymentRequestEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('DeploymentRequest', graphql_name='node')
+    return DeploymentRequestEdge
+
+
+def DeploymentReviewEdge():
+    class DeploymentReviewEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('DeploymentReview', graphql_name='node')
+    return DeploymentReviewEdge
+
+
+def DeploymentReviewerEdge():
+    class DeploymentReviewerEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('DeploymentReviewer', graphql_name='node')
+    return DeploymentReviewerEdge
+
+
+def DeploymentStatusEdge():
+    class DeploymentStatusEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('DeploymentStatus', graphql_name='node')
+    return DeploymentStatusEdge
+
+
+def DequeuePullRequestPayload():
+    class DequeuePullRequestPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'merge_queue_entry')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        merge_queue_entry = sgqlc.types.Field('MergeQueueEntry', graphql_name='mergeQueueEntry')
+    return DequeuePullRequestPayload
+
+
+def DisablePullRequestAutoMergePayload():
+    class DisablePullRequestAutoMergePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'client_mutation_id', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return DisablePullRequestAutoMergePayload
+
+
+def DiscussionCategoryEdge():
+    class DiscussionCategoryEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('DiscussionCategory', graphql_name='node')
+    return DiscussionCategoryEdge
+
+
+def DiscussionCommentEdge():
+    class DiscussionCommentEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('DiscussionComment', graphql_name='node')
+    return DiscussionCommentEdge
+
+
+def DiscussionEdge():
+    class DiscussionEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Discussion', graphql_name='node')
+    return DiscussionEdge
+
+
+def DiscussionPollOptionEdge():
+    class DiscussionPollOptionEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('DiscussionPollOption', graphql_name='node')
+    return DiscussionPollOptionEdge
+
+
+def DismissPullRequestReviewPayload():
+    class DismissPullRequestReviewPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request_review')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request_review = sgqlc.types.Field('PullRequestReview', graphql_name='pullRequestReview')
+    return DismissPullRequestReviewPayload
+
+
+def DismissRepositoryVulnerabilityAlertPayload():
+    class DismissRepositoryVulnerabilityAlertPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'repository_vulnerability_alert')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        repository_vulnerability_alert = sgqlc.types.Field('RepositoryVulnerabilityAlert', graphql_name='repositoryVulnerabilityAlert')
+    return DismissRepositoryVulnerabilityAlertPayload
+
+
+def EnablePullRequestAutoMergePayload():
+    class EnablePullRequestAutoMergePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'client_mutation_id', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return EnablePullRequestAutoMergePayload
+
+
+def EnqueuePullRequestPayload():
+    class EnqueuePullRequestPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'merge_queue_entry')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        merge_queue_entry = sgqlc.types.Field('MergeQueueEntry', graphql_name='mergeQueueEntry')
+    return EnqueuePullRequestPayload
+
+
+def EnterpriseAdministratorEdge():
+    class EnterpriseAdministratorEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node', 'role')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('User', graphql_name='node')
+        role = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseAdministratorRole'), graphql_name='role')
+    return EnterpriseAdministratorEdge
+
+
+def EnterpriseAdministratorInvitationEdge():
+    class EnterpriseAdministratorInvitationEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('EnterpriseAdministratorInvitation', graphql_name='node')
+    return EnterpriseAdministratorInvitationEdge
+
+
+def EnterpriseBillingInfo():
+    class EnterpriseBillingInfo(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('all_licensable_users_count', 'asset_packs', 'bandwidth_quota', 'bandwidth_usage', 'bandwidth_usage_percentage', 'storage_quota', 'storage_usage', 'storage_usage_percentage', 'total_available_licenses', 'total_licenses')
+        all_licensable_users_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='allLicensableUsersCount')
+        asset_packs = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='assetPacks')
+        bandwidth_quota = sgqlc.types.Field(sgqlc.types.non_null('Float'), graphql_name='bandwidthQuota')
+        bandwidth_usage = sgqlc.types.Field(sgqlc.types.non_null('Float'), graphql_name='bandwidthUsage')
+        bandwidth_usage_percentage = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='bandwidthUsagePercentage')
+        storage_quota = sgqlc.types.Field(sgqlc.types.non_null('Float'), graphql_name='storageQuota')
+        storage_usage = sgqlc.types.Field(sgqlc.types.non_null('Float'), graphql_name='storageUsage')
+        storage_usage_percentage = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='storageUsagePercentage')
+        total_available_licenses = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalAvailableLicenses')
+        total_licenses = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalLicenses')
+    return EnterpriseBillingInfo
+
+
+def EnterpriseFailedInvitationEdge():
+    class EnterpriseFailedInvitationEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('OrganizationInvitation', graphql_name='node')
+    return EnterpriseFailedInvitationEdge
+
+
+def EnterpriseMemberEdge():
+    class EnterpriseMemberEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('EnterpriseMember', graphql_name='node')
+    return EnterpriseMemberEdge
+
+
+def EnterpriseOrganizationMembershipEdge():
+    class EnterpriseOrganizationMembershipEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node', 'role')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Organization', graphql_name='node')
+        role = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseUserAccountMembershipRole'), graphql_name='role')
+    return EnterpriseOrganizationMembershipEdge
+
+
+def EnterpriseOutsideCollaboratorEdge():
+    class EnterpriseOutsideCollaboratorEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node', 'repositories')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('User', graphql_name='node')
+        repositories = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseRepositoryInfoConnection'), graphql_name='repositories', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.RepositoryOrder, graphql_name='orderBy', default={'field': 'NAME', 'direction': 'ASC'})))))
+    return EnterpriseOutsideCollaboratorEdge
+
+
+def EnterpriseOwnerInfo():
+    class EnterpriseOwnerInfo(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('admins', 'affiliated_users_with_two_factor_disabled', 'affiliated_users_with_two_factor_disabled_exist', 'allow_private_repository_forking_setting', 'allow_private_repository_forking_setting_organizations', 'allow_private_repository_forking_setting_policy_value', 'default_repository_permission_setting', 'default_repository_permission_setting_organizations', 'domains', 'enterprise_server_installations', 'failed_invitations', 'ip_allow_list_enabled_setting', 'ip_allow_list_entries', 'ip_allow_list_for_installed_apps_enabled_setting', 'is_updating_default_repository_permission', 'is_updating_two_factor_requirement', 'members_can_change_repository_visibility_setting', 'members_can_change_repository_visibility_setting_organizations', 'members_can_create_internal_repositories_setting', 'members_can_create_private_repositories_setting', 'members_can_create_public_repositories_setting', 'members_can_create_repositories_setting', 'members_can_create_repositories_setting_organizations', 'members_can_delete_issues_setting', 'members_can_delete_issues_setting_organizations', 'members_can_delete_repositories_setting', 'members_can_delete_repositories_setting_organizations', 'members_can_invite_collaborators_setting', 'members_can_invite_collaborators_setting_organizations', 'members_can_make_purchases_setting', 'members_can_update_protected_branches_setting', 'members_can_update_protected_branches_setting_organizations', 'members_can_view_dependency_insights_setting', 'members_can_view_dependency_insights_setting_organizations', 'notification_delivery_restriction_enabled_setting', 'oidc_provider', 'organization_projects_setting', 'organization_projects_setting_organizations', 'outside_collaborators', 'pending_admin_invitations', 'pending_collaborator_invitations', 'pending_member_invitations', 'repository_projects_setting', 'repository_projects_setting_organizations', 'saml_identity_provider', 'saml_identity_provider_setting_organizations', 'support_entitlements', 'team_discussions_setting', 'team_discussions_setting_organizations', 'two_factor_required_setting', 'two_factor_required_setting_organizations')
+        admins = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseAdministratorConnection'), graphql_name='admins', args=sgqlc.types.ArgDict((('organization_logins', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='organizationLogins', default=None)), ('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('role', sgqlc.types.Arg('EnterpriseAdministratorRole', graphql_name='role', default=None)), ('order_by', sgqlc.types.Arg(github_schema.EnterpriseMemberOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})), ('has_two_factor_enabled', sgqlc.types.Arg('Boolean', graphql_name='hasTwoFactorEnabled', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        affiliated_users_with_two_factor_disabled = sgqlc.types.Field(sgqlc.types.non_null('UserConnection'), graphql_name='affiliatedUsersWithTwoFactorDisabled', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        affiliated_users_with_two_factor_disabled_exist = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='affiliatedUsersWithTwoFactorDisabledExist')
+        allow_private_repository_forking_setting = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='allowPrivateRepositoryForkingSetting')
+        allow_private_repository_forking_setting_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='allowPrivateRepositoryForkingSettingOrganizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('value', sgqlc.types.Arg(sgqlc.types.non_null('Boolean'), graphql_name='value', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})))))
+        allow_private_repository_forking_setting_policy_value = sgqlc.types.Field('EnterpriseAllowPrivateRepositoryForkingPolicyValue', graphql_name='allowPrivateRepositoryForkingSettingPolicyValue')
+        default_repository_permission_setting = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseDefaultRepositoryPermissionSettingValue'), graphql_name='defaultRepositoryPermissionSetting')
+        default_repository_permission_setting_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='defaultRepositoryPermissionSettingOrganizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('value', sgqlc.types.Arg(sgqlc.types.non_null('DefaultRepositoryPermissionField'), graphql_name='value', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})))))
+        domains = sgqlc.types.Field(sgqlc.types.non_null('VerifiableDomainConnection'), graphql_name='domains', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('is_verified', sgqlc.types.Arg('Boolean', graphql_name='isVerified', default=None)), ('is_approved', sgqlc.types.Arg('Boolean', graphql_name='isApproved', default=None)), ('order_by', sgqlc.types.Arg(github_schema.VerifiableDomainOrder, graphql_name='orderBy', default={'field': 'DOMAIN', 'direction': 'ASC'})))))
+        enterprise_server_installations = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseServerInstallationConnection'), graphql_name='enterpriseServerInstallations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('connected_only', sgqlc.types.Arg(github_schema.Boolean, graphql_name='connectedOnly', default=False)), ('order_by', sgqlc.types.Arg(github_schema.EnterpriseServerInstallationOrder, graphql_name='orderBy', default={'field': 'HOST_NAME', 'direction': 'ASC'})))))
+        failed_invitations = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseFailedInvitationConnection'), graphql_name='failedInvitations', args=sgqlc.types.ArgDict((('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        ip_allow_list_enabled_setting = sgqlc.types.Field(sgqlc.types.non_null('IpAllowListEnabledSettingValue'), graphql_name='ipAllowListEnabledSetting')
+        ip_allow_list_entries = sgqlc.types.Field(sgqlc.types.non_null('IpAllowListEntryConnection'), graphql_name='ipAllowListEntries', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.IpAllowListEntryOrder, graphql_name='orderBy', default={'field': 'ALLOW_LIST_VALUE', 'direction': 'ASC'})))))
+        ip_allow_list_for_installed_apps_enabled_setting = sgqlc.types.Field(sgqlc.types.non_null('IpAllowListForInstalledAppsEnabledSettingValue'), graphql_name='ipAllowListForInstalledAppsEnabledSetting')
+        is_updating_default_repository_permission = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isUpdatingDefaultRepositoryPermission')
+        is_updating_two_factor_requirement = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isUpdatingTwoFactorRequirement')
+        members_can_change_repository_visibility_setting = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='membersCanChangeRepositoryVisibilitySetting')
+        members_can_change_repository_visibility_setting_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='membersCanChangeRepositoryVisibilitySettingOrganizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('value', sgqlc.types.Arg(sgqlc.types.non_null('Boolean'), graphql_name='value', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})))))
+        members_can_create_internal_repositories_setting = sgqlc.types.Field('Boolean', graphql_name='membersCanCreateInternalRepositoriesSetting')
+        members_can_create_private_repositories_setting = sgqlc.types.Field('Boolean', graphql_name='membersCanCreatePrivateRepositoriesSetting')
+        members_can_create_public_repositories_setting = sgqlc.types.Field('Boolean', graphql_name='membersCanCreatePublicRepositoriesSetting')
+        members_can_create_repositories_setting = sgqlc.types.Field('EnterpriseMembersCanCreateRepositoriesSettingValue', graphql_name='membersCanCreateRepositoriesSetting')
+        members_can_create_repositories_setting_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='membersCanCreateRepositoriesSettingOrganizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('value', sgqlc.types.Arg(sgqlc.types.non_null('OrganizationMembersCanCreateRepositoriesSettingValue'), graphql_name='value', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})))))
+        members_can_delete_issues_setting = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='membersCanDeleteIssuesSetting')
+        members_can_delete_issues_setting_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='membersCanDeleteIssuesSettingOrganizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('value', sgqlc.types.Arg(sgqlc.types.non_null('Boolean'), graphql_name='value', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})))))
+        members_can_delete_repositories_setting = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='membersCanDeleteRepositoriesSetting')
+        members_can_delete_repositories_setting_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='membersCanDeleteRepositoriesSettingOrganizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('value', sgqlc.types.Arg(sgqlc.types.non_null('Boolean'), graphql_name='value', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})))))
+        members_can_invite_collaborators_setting = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='membersCanInviteCollaboratorsSetting')
+        members_can_invite_collaborators_setting_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='membersCanInviteCollaboratorsSettingOrganizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('value', sgqlc.types.Arg(sgqlc.types.non_null('Boolean'), graphql_name='value', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})))))
+        members_can_make_purchases_setting = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseMembersCanMakePurchasesSettingValue'), graphql_name='membersCanMakePurchasesSetting')
+        members_can_update_protected_branches_setting = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='membersCanUpdateProtectedBranchesSetting')
+        members_can_update_protected_branches_setting_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='membersCanUpdateProtectedBranchesSettingOrganizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('value', sgqlc.types.Arg(sgqlc.types.non_null('Boolean'), graphql_name='value', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})))))
+        members_can_view_dependency_insights_setting = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='membersCanViewDependencyInsightsSetting')
+        members_can_view_dependency_insights_setting_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='membersCanViewDependencyInsightsSettingOrganizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('value', sgqlc.types.Arg(sgqlc.types.non_null('Boolean'), graphql_name='value', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})))))
+        notification_delivery_restriction_enabled_setting = sgqlc.types.Field(sgqlc.types.non_null('NotificationRestrictionSettingValue'), graphql_name='notificationDeliveryRestrictionEnabledSetting')
+        oidc_provider = sgqlc.types.Field('OIDCProvider', graphql_name='oidcProvider')
+        organization_projects_setting = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='organizationProjectsSetting')
+        organization_projects_setting_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='organizationProjectsSettingOrganizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('value', sgqlc.types.Arg(sgqlc.types.non_null('Boolean'), graphql_name='value', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})))))
+        outside_collaborators = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseOutsideCollaboratorConnection'), graphql_name='outsideCollaborators', args=sgqlc.types.ArgDict((('login', sgqlc.types.Arg('String', graphql_name='login', default=None)), ('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('order_by', sgqlc.types.Arg(github_schema.EnterpriseMemberOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})), ('visibility', sgqlc.types.Arg('RepositoryVisibility', graphql_name='visibility', default=None)), ('has_two_factor_enabled', sgqlc.types.Arg('Boolean', graphql_name='hasTwoFactorEnabled', default=None)), ('organization_logins', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='organizationLogins', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        pending_admin_invitations = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseAdministratorInvitationConnection'), graphql_name='pendingAdminInvitations', args=sgqlc.types.ArgDict((('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('order_by', sgqlc.types.Arg(github_schema.EnterpriseAdministratorInvitationOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'DESC'})), ('role', sgqlc.types.Arg('EnterpriseAdministratorRole', graphql_name='role', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        pending_collaborator_invitations = sgqlc.types.Field(sgqlc.types.non_null('RepositoryInvitationConnection'), graphql_name='pendingCollaboratorInvitations', args=sgqlc.types.ArgDict((('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('order_by', sgqlc.types.Arg(github_schema.RepositoryInvitationOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'DESC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        pending_member_invitations = sgqlc.types.Field(sgqlc.types.non_null('EnterprisePendingMemberInvitationConnection'), graphql_name='pendingMemberInvitations', args=sgqlc.types.ArgDict((('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('organization_logins', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='organizationLogins', default=None)), ('invitation_source', sgqlc.types.Arg('OrganizationInvitationSource', graphql_name='invitationSource', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        repository_projects_setting = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='repositoryProjectsSetting')
+        repository_projects_setting_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='repositoryProjectsSettingOrganizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('value', sgqlc.types.Arg(sgqlc.types.non_null('Boolean'), graphql_name='value', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})))))
+        saml_identity_provider = sgqlc.types.Field('EnterpriseIdentityProvider', graphql_name='samlIdentityProvider')
+        saml_identity_provider_setting_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='samlIdentityProviderSettingOrganizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('value', sgqlc.types.Arg(sgqlc.types.non_null('IdentityProviderConfigurationState'), graphql_name='value', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})))))
+        support_entitlements = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseMemberConnection'), graphql_name='supportEntitlements', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg(github_schema.EnterpriseMemberOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        team_discussions_setting = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledDisabledSettingValue'), graphql_name='teamDiscussionsSetting')
+        team_discussions_setting_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='teamDiscussionsSettingOrganizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('value', sgqlc.types.Arg(sgqlc.types.non_null('Boolean'), graphql_name='value', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})))))
+        two_factor_required_setting = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseEnabledSettingValue'), graphql_name='twoFactorRequiredSetting')
+        two_factor_required_setting_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='twoFactorRequiredSettingOrganizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('value', sgqlc.types.Arg(sgqlc.types.non_null('Boolean'), graphql_name='value', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})))))
+    return EnterpriseOwnerInfo
+
+
+def EnterprisePendingMemberInvitationEdge():
+    class EnterprisePendingMemberInvitationEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('OrganizationInvitation', graphql_name='node')
+    return EnterprisePendingMemberInvitationEdge
+
+
+def EnterpriseRepositoryInfoEdge():
+    class EnterpriseRepositoryInfoEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('EnterpriseRepositoryInfo', graphql_name='node')
+    return EnterpriseRepositoryInfoEdge
+
+
+def EnterpriseServerInstallationEdge():
+    class EnterpriseServerInstallationEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('EnterpriseServerInstallation', graphql_name='node')
+    return EnterpriseServerInstallationEdge
+
+
+def EnterpriseServerInstallationMembershipEdge():
+    class EnterpriseServerInstallationMembershipEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node', 'role')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('EnterpriseServerInstallation', graphql_name='node')
+        role = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseUserAccountMembershipRole'), graphql_name='role')
+    return EnterpriseServerInstallationMembershipEdge
+
+
+def EnterpriseServerUserAccountEdge():
+    class EnterpriseServerUserAccountEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('EnterpriseServerUserAccount', graphql_name='node')
+    return EnterpriseServerUserAccountEdge
+
+
+def EnterpriseServerUserAccountEmailEdge():
+    class EnterpriseServerUserAccountEmailEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('EnterpriseServerUserAccountEmail', graphql_name='node')
+    return EnterpriseServerUserAccountEmailEdge
+
+
+def EnterpriseServerUserAccountsUploadEdge():
+    class EnterpriseServerUserAccountsUploadEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('EnterpriseServerUserAccountsUpload', graphql_name='node')
+    return EnterpriseServerUserAccountsUploadEdge
+
+
+def EnvironmentEdge():
+    class EnvironmentEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Environment', graphql_name='node')
+    return EnvironmentEdge
+
+
+def ExternalIdentityAttribute():
+    class ExternalIdentityAttribute(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('metadata', 'name', 'value')
+        metadata = sgqlc.types.Field('String', graphql_name='metadata')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        value = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='value')
+    return ExternalIdentityAttribute
+
+
+def ExternalIdentityEdge():
+    class ExternalIdentityEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ExternalIdentity', graphql_name='node')
+    return ExternalIdentityEdge
+
+
+def ExternalIdentitySamlAttributes():
+    class ExternalIdentitySamlAttributes(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('attributes', 'emails', 'family_name', 'given_name', 'groups', 'name_id', 'username')
+        attributes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ExternalIdentityAttribute'))), graphql_name='attributes')
+        emails = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('UserEmailMetadata')), graphql_name='emails')
+        family_name = sgqlc.types.Field('String', graphql_name='familyName')
+        given_name = sgqlc.types.Field('String', graphql_name='givenName')
+        groups = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='groups')
+        name_id = sgqlc.types.Field('String', graphql_name='nameId')
+        username = sgqlc.types.Field('String', graphql_name='username')
+    return ExternalIdentitySamlAttributes
+
+
+def ExternalIdentityScimAttributes():
+    class ExternalIdentityScimAttributes(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('emails', 'family_name', 'given_name', 'groups', 'username')
+        emails = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('UserEmailMetadata')), graphql_name='emails')
+        family_name = sgqlc.types.Field('String', graphql_name='familyName')
+        given_name = sgqlc.types.Field('String', graphql_name='givenName')
+        groups = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='groups')
+        username = sgqlc.types.Field('String', graphql_name='username')
+    return ExternalIdentityScimAttributes
+
+
+def FollowOrganizationPayload():
+    class FollowOrganizationPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'organization')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        organization = sgqlc.types.Field('Organization', graphql_name='organization')
+    return FollowOrganizationPayload
+
+
+def FollowUserPayload():
+    class FollowUserPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'user')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        user = sgqlc.types.Field('User', graphql_name='user')
+    return FollowUserPayload
+
+
+def FundingLink():
+    class FundingLink(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('platform', 'url')
+        platform = sgqlc.types.Field(sgqlc.types.non_null('FundingPlatform'), graphql_name='platform')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return FundingLink
+
+
+def GistCommentEdge():
+    class GistCommentEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('GistComment', graphql_name='node')
+    return GistCommentEdge
+
+
+def GistEdge():
+    class GistEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Gist', graphql_name='node')
+    return GistEdge
+
+
+def GistFile():
+    class GistFile(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('encoded_name', 'encoding', 'extension', 'is_image', 'is_truncated', 'language', 'name', 'size', 'text')
+        encoded_name = sgqlc.types.Field('String', graphql_name='encodedName')
+        encoding = sgqlc.types.Field('String', graphql_name='encoding')
+        extension = sgqlc.types.Field('String', graphql_name='extension')
+        is_image = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isImage')
+        is_truncated = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isTruncated')
+        language = sgqlc.types.Field('Language', graphql_name='language')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        size = sgqlc.types.Field('Int', graphql_name='size')
+        text = sgqlc.types.Field('String', graphql_name='text', args=sgqlc.types.ArgDict((('truncate', sgqlc.types.Arg('Int', graphql_name='truncate', default=None)),)))
+    return GistFile
+
+
+def GitActor():
+    class GitActor(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('avatar_url', 'date', 'email', 'name', 'user')
+        avatar_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='avatarUrl', args=sgqlc.types.ArgDict((('size', sgqlc.types.Arg('Int', graphql_name='size', default=None)),)))
+        date = sgqlc.types.Field('GitTimestamp', graphql_name='date')
+        email = sgqlc.types.Field('String', graphql_name='email')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        user = sgqlc.types.Field('User', graphql_name='user')
+    return GitActor
+
+
+def GitActorEdge():
+    class GitActorEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('GitActor', graphql_name='node')
+    return GitActorEdge
+
+
+def GitHubMetadata():
+    class GitHubMetadata(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('git_hub_services_sha', 'git_ip_addresses', 'hook_ip_addresses', 'importer_ip_addresses', 'is_password_authentication_verifiable', 'pages_ip_addresses')
+        git_hub_services_sha = sgqlc.types.Field(sgqlc.types.non_null('GitObjectID'), graphql_name='gitHubServicesSha')
+        git_ip_addresses = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='gitIpAddresses')
+        hook_ip_addresses = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='hookIpAddresses')
+        importer_ip_addresses = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='importerIpAddresses')
+        is_password_authentication_verifiable = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isPasswordAuthenticationVerifiable')
+        pages_ip_addresses = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='pagesIpAddresses')
+    return GitHubMetadata
+
+
+def GrantEnterpriseOrganizationsMigratorRolePayload():
+    class GrantEnterpriseOrganizationsMigratorRolePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'organizations')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        organizations = sgqlc.types.Field('OrganizationConnection', graphql_name='organizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return GrantEnterpriseOrganizationsMigratorRolePayload
+
+
+def GrantMigratorRolePayload():
+    class GrantMigratorRolePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'success')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        success = sgqlc.types.Field('Boolean', graphql_name='success')
+    return GrantMigratorRolePayload
+
+
+def Hovercard():
+    class Hovercard(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('contexts',)
+        contexts = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('HovercardContext'))), graphql_name='contexts')
+    return Hovercard
+
+
+def InviteEnterpriseAdminPayload():
+    class InviteEnterpriseAdminPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'invitation')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        invitation = sgqlc.types.Field('EnterpriseAdministratorInvitation', graphql_name='invitation')
+    return InviteEnterpriseAdminPayload
+
+
+def IpAllowListEntryEdge():
+    class IpAllowListEntryEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('IpAllowListEntry', graphql_name='node')
+    return IpAllowListEntryEdge
+
+
+def IssueCommentEdge():
+    class IssueCommentEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('IssueComment', graphql_name='node')
+    return IssueCommentEdge
+
+
+def IssueContributionsByRepository():
+    class IssueContributionsByRepository(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('contributions', 'repository')
+        contributions = sgqlc.types.Field(sgqlc.types.non_null('CreatedIssueContributionConnection'), graphql_name='contributions', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ContributionOrder, graphql_name='orderBy', default={'direction': 'DESC'})))))
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+    return IssueContributionsByRepository
+
+
+def IssueEdge():
+    class IssueEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Issue', graphql_name='node')
+    return IssueEdge
+
+
+def IssueTemplate():
+    class IssueTemplate(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('about', 'assignees', 'body', 'filename', 'labels', 'name', 'title')
+        about = sgqlc.types.Field('String', graphql_name='about')
+        assignees = sgqlc.types.Field(sgqlc.types.non_null('UserConnection'), graphql_name='assignees', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        body = sgqlc.types.Field('String', graphql_name='body')
+        filename = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='filename')
+        labels = sgqlc.types.Field('LabelConnection', graphql_name='labels', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg(github_schema.LabelOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'ASC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        title = sgqlc.types.Field('String', graphql_name='title')
+    return IssueTemplate
+
+
+def IssueTimelineItemEdge():
+    class IssueTimelineItemEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('IssueTimelineItem', graphql_name='node')
+    return IssueTimelineItemEdge
+
+
+def IssueTimelineItemsEdge():
+    class IssueTimelineItemsEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('IssueTimelineItems', graphql_name='node')
+    return IssueTimelineItemsEdge
+
+
+def LabelEdge():
+    class LabelEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Label', graphql_name='node')
+    return LabelEdge
+
+
+def LanguageEdge():
+    class LanguageEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node', 'size')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field(sgqlc.types.non_null('Language'), graphql_name='node')
+        size = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='size')
+    return LanguageEdge
+
+
+def LicenseRule():
+    class LicenseRule(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('description', 'key', 'label')
+        description = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='description')
+        key = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='key')
+        label = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='label')
+    return LicenseRule
+
+
+def LinkProjectV2ToRepositoryPayload():
+    class LinkProjectV2ToRepositoryPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'repository')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return LinkProjectV2ToRepositoryPayload
+
+
+def LinkProjectV2ToTeamPayload():
+    class LinkProjectV2ToTeamPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'team')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        team = sgqlc.types.Field('Team', graphql_name='team')
+    return LinkProjectV2ToTeamPayload
+
+
+def LinkRepositoryToProjectPayload():
+    class LinkRepositoryToProjectPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project', 'repository')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project = sgqlc.types.Field('Project', graphql_name='project')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return LinkRepositoryToProjectPayload
+
+
+def LinkedBranchEdge():
+    class LinkedBranchEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('LinkedBranch', graphql_name='node')
+    return LinkedBranchEdge
+
+
+def LockLockablePayload():
+    class LockLockablePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'client_mutation_id', 'locked_record')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        locked_record = sgqlc.types.Field('Lockable', graphql_name='lockedRecord')
+    return LockLockablePayload
+
+
+def MannequinEdge():
+    class MannequinEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Mannequin', graphql_name='node')
+    return MannequinEdge
+
+
+def MarkDiscussionCommentAsAnswerPayload():
+    class MarkDiscussionCommentAsAnswerPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'discussion')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        discussion = sgqlc.types.Field('Discussion', graphql_name='discussion')
+    return MarkDiscussionCommentAsAnswerPayload
+
+
+def MarkFileAsViewedPayload():
+    class MarkFileAsViewedPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return MarkFileAsViewedPayload
+
+
+def MarkProjectV2AsTemplatePayload():
+    class MarkProjectV2AsTemplatePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project_v2')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_v2 = sgqlc.types.Field('ProjectV2', graphql_name='projectV2')
+    return MarkProjectV2AsTemplatePayload
+
+
+def MarkPullRequestReadyForReviewPayload():
+    class MarkPullRequestReadyForReviewPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return MarkPullRequestReadyForReviewPayload
+
+
+def MarketplaceListingEdge():
+    class MarketplaceListingEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('MarketplaceListing', graphql_name='node')
+    return MarketplaceListingEdge
+
+
+def MergeBranchPayload():
+    class MergeBranchPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'merge_commit')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        merge_commit = sgqlc.types.Field('Commit', graphql_name='mergeCommit')
+    return MergeBranchPayload
+
+
+def MergePullRequestPayload():
+    class MergePullRequestPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'client_mutation_id', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return MergePullRequestPayload
+
+
+def MergeQueueConfiguration():
+    class MergeQueueConfiguration(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('check_response_timeout', 'maximum_entries_to_build', 'maximum_entries_to_merge', 'merge_method', 'merging_strategy', 'minimum_entries_to_merge', 'minimum_entries_to_merge_wait_time')
+        check_response_timeout = sgqlc.types.Field('Int', graphql_name='checkResponseTimeout')
+        maximum_entries_to_build = sgqlc.types.Field('Int', graphql_name='maximumEntriesToBuild')
+        maximum_entries_to_merge = sgqlc.types.Field('Int', graphql_name='maximumEntriesToMerge')
+        merge_method = sgqlc.types.Field('PullRequestMergeMethod', graphql_name='mergeMethod')
+        merging_strategy = sgqlc.types.Field('MergeQueueMergingStrategy', graphql_name='mergingStrategy')
+        minimum_entries_to_merge = sgqlc.types.Field('Int', graphql_name='minimumEntriesToMerge')
+        minimum_entries_to_merge_wait_time = sgqlc.types.Field('Int', graphql_name='minimumEntriesToMergeWaitTime')
+    return MergeQueueConfiguration
+
+
+def MergeQueueEntryEdge():
+    class MergeQueueEntryEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('MergeQueueEntry', graphql_name='node')
+    return MergeQueueEntryEdge
+
+
+def MilestoneEdge():
+    class MilestoneEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Milestone', graphql_name='node')
+    return MilestoneEdge
+
+
+def MinimizeCommentPayload():
+    class MinimizeCommentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'minimized_comment')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        minimized_comment = sgqlc.types.Field('Minimizable', graphql_name='minimizedComment')
+    return MinimizeCommentPayload
+
+
+def MoveProjectCardPayload():
+    class MoveProjectCardPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('card_edge', 'client_mutation_id')
+        card_edge = sgqlc.types.Field('ProjectCardEdge', graphql_name='cardEdge')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return MoveProjectCardPayload
+
+
+def MoveProjectColumnPayload():
+    class MoveProjectColumnPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'column_edge')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        column_edge = sgqlc.types.Field('ProjectColumnEdge', graphql_name='columnEdge')
+    return MoveProjectColumnPayload
+
+
+def Mutation():
+    class Mutation(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('abort_queued_migrations', 'accept_enterprise_administrator_invitation', 'accept_topic_suggestion', 'add_assignees_to_assignable', 'add_comment', 'add_discussion_comment', 'add_discussion_poll_vote', 'add_enterprise_organization_member', 'add_enterprise_support_entitlement', 'add_labels_to_labelable', 'add_project_card', 'add_project_column', 'add_project_v2_draft_issue', 'add_project_v2_item_by_id', 'add_pull_request_review', 'add_pull_request_review_comment', 'add_pull_request_review_thread', 'add_reaction', 'add_star', 'add_upvote', 'add_verifiable_domain', 'approve_deployments', 'approve_verifiable_domain', 'archive_project_v2_item', 'archive_repository', 'cancel_enterprise_admin_invitation', 'cancel_sponsorship', 'change_user_status', 'clear_labels_from_labelable', 'clear_project_v2_item_field_value', 'clone_project', 'clone_template_repository', 'close_discussion', 'close_issue', 'close_pull_request', 'convert_project_card_note_to_issue', 'convert_pull_request_to_draft', 'copy_project_v2', 'create_attribution_invitation', 'create_branch_protection_rule', 'create_check_run', 'create_check_suite', 'create_commit_on_branch', 'create_discussion', 'create_enterprise_organization', 'create_environment', 'create_ip_allow_list_entry', 'create_issue', 'create_linked_branch', 'create_migration_source', 'create_project', 'create_project_v2', 'create_project_v2_field', 'create_pull_request', 'create_ref', 'create_repository', 'create_repository_ruleset', 'create_sponsors_listing', 'create_sponsors_tier', 'create_sponsorship', 'create_sponsorships', 'create_team_discussion', 'create_team_discussion_comment', 'decline_topic_suggestion', 'delete_branch_protection_rule', 'delete_deployment', 'delete_discussion', 'delete_discussion_comment', 'delete_environment', 'delete_ip_allow_list_entry', 'delete_issue', 'delete_issue_comment', 'delete_linked_branch', 'delete_project', 'delete_project_card', 'delete_project_column', 'delete_project_v2', 'delete_project_v2_field', 'delete_project_v2_item', 'delete_project_v2_workflow', 'delete_pull_request_review', 'delete_pull_request_review_comment', 'delete_ref', 'delete_repository_ruleset', 'delete_team_discussion', 'delete_team_discussion_comment', 'delete_verifiable_domain', 'dequeue_pull_request', 'disable_pull_request_auto_merge', 'dismiss_pull_request_review', 'dismiss_repository_vulnerability_alert', 'enable_pull_request_auto_merge', 'enqueue_pull_request', 'follow_organization', 'follow_user', 'grant_enterprise_organizations_migrator_role', 'grant_migrator_role', 'invite_enterprise_admin', 'link_project_v2_to_repository', 'link_project_v2_to_team', 'link_repository_to_project', 'lock_lockable', 'mark_discussion_comment_as_answer', 'mark_file_as_viewed', 'mark_project_v2_as_template', 'mark_pull_request_ready_for_review', 'merge_branch', 'merge_pull_request', 'minimize_comment', 'move_project_card', 'move_project_column', 'pin_issue', 'publish_sponsors_tier', 'regenerate_enterprise_identity_provider_recovery_codes', 'regenerate_verifiable_domain_token', 'reject_deployments', 'remove_assignees_from_assignable', 'remove_enterprise_admin', 'remove_enterprise_identity_provider', 'remove_enterprise_member', 'remove_enterprise_organization', 'remove_enterprise_support_entitlement', 'remove_labels_from_labelable', 'remove_outside_collaborator', 'remove_reaction', 'remove_star', 'remove_upvote', 'reopen_discussion', 'reopen_issue', 'reopen_pull_request', 'request_reviews', 'rerequest_check_suite', 'resolve_review_thread', 'retire_sponsors_tier', 'revert_pull_request', 'revoke_enterprise_organizations_migrator_role', 'revoke_migrator_role', 'set_enterprise_identity_provider', 'set_organization_interaction_limit', 'set_repository_interaction_limit', 'set_user_interaction_limit', 'start_organization_migration', 'start_repository_migration', 'submit_pull_request_review', 'transfer_enterprise_organization', 'transfer_issue', 'unarchive_project_v2_item', 'unarchive_repository', 'unfollow_organization', 'unfollow_user', 'unlink_project_v2_from_repository', 'unlink_project_v2_from_team', 'unlink_repository_from_project', 'unlock_lockable', 'unmark_discussion_comment_as_answer', 'unmark_file_as_viewed', 'unmark_issue_as_duplicate', 'unmark_project_v2_as_template', 'unminimize_comment', 'unpin_issue', 'unresolve_review_thread', 'update_branch_protection_rule', 'update_check_run', 'update_check_suite_preferences', 'update_discussion', 'update_discussion_comment', 'update_enterprise_administrator_role', 'update_enterprise_allow_private_repository_forking_setting', 'update_enterprise_default_repository_permission_setting', 'update_enterprise_members_can_change_repository_visibility_setting', 'update_enterprise_members_can_create_repositories_setting', 'update_enterprise_members_can_delete_issues_setting', 'update_enterprise_members_can_delete_repositories_setting', 'update_enterprise_members_can_invite_collaborators_setting', 'update_enterprise_members_can_make_purchases_setting', 'update_enterprise_members_can_update_protected_branches_setting', 'update_enterprise_members_can_view_dependency_insights_setting', 'update_enterprise_organization_projects_setting', 'update_enterprise_owner_organization_role', 'update_enterprise_profile', 'update_enterprise_repository_projects_setting', 'update_enterprise_team_discussions_setting', 'update_enterprise_two_factor_authentication_required_setting', 'update_environment', 'update_ip_allow_list_enabled_setting', 'update_ip_allow_list_entry', 'update_ip_allow_list_for_installed_apps_enabled_setting', 'update_issue', 'update_issue_comment', 'update_notification_restriction_setting', 'update_organization_allow_private_repository_forking_setting', 'update_organization_web_commit_signoff_setting', 'update_project', 'update_project_card', 'update_project_column', 'update_project_v2', 'update_project_v2_collaborators', 'update_project_v2_draft_issue', 'update_project_v2_item_field_value', 'update_project_v2_item_position', 'update_pull_request', 'update_pull_request_branch', 'update_pull_request_review', 'update_pull_request_review_comment', 'update_ref', 'update_repository', 'update_repository_ruleset', 'update_repository_web_commit_signoff_setting', 'update_sponsorship_preferences', 'update_subscription', 'update_team_discussion', 'update_team_discussion_comment', 'update_teams_repository', 'update_topics', 'verify_verifiable_domain')
+        abort_queued_migrations = sgqlc.types.Field('AbortQueuedMigrationsPayload', graphql_name='abortQueuedMigrations', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AbortQueuedMigrationsInput'), graphql_name='input', default=None)),)))
+        accept_enterprise_administrator_invitation = sgqlc.types.Field('AcceptEnterpriseAdministratorInvitationPayload', graphql_name='acceptEnterpriseAdministratorInvitation', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AcceptEnterpriseAdministratorInvitationInput'), graphql_name='input', default=None)),)))
+        accept_topic_suggestion = sgqlc.types.Field('AcceptTopicSuggestionPayload', graphql_name='acceptTopicSuggestion', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AcceptTopicSuggestionInput'), graphql_name='input', default=None)),)))
+        add_assignees_to_assignable = sgqlc.types.Field('AddAssigneesToAssignablePayload', graphql_name='addAssigneesToAssignable', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddAssigneesToAssignableInput'), graphql_name='input', default=None)),)))
+        add_comment = sgqlc.types.Field('AddCommentPayload', graphql_name='addComment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddCommentInput'), graphql_name='input', default=None)),)))
+        add_discussion_comment = sgqlc.types.Field('AddDiscussionCommentPayload', graphql_name='addDiscussionComment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddDiscussionCommentInput'), graphql_name='input', default=None)),)))
+        add_discussion_poll_vote = sgqlc.types.Field('AddDiscussionPollVotePayload', graphql_name='addDiscussionPollVote', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddDiscussionPollVoteInput'), graphql_name='input', default=None)),)))
+        add_enterprise_organization_member = sgqlc.types.Field('AddEnterpriseOrganizationMemberPayload', graphql_name='addEnterpriseOrganizationMember', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddEnterpriseOrganizationMemberInput'), graphql_name='input', default=None)),)))
+        add_enterprise_support_entitlement = sgqlc.types.Field('AddEnterpriseSupportEntitlementPayload', graphql_name='addEnterpriseSupportEntitlement', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddEnterpriseSupportEntitlementInput'), graphql_name='input', default=None)),)))
+        add_labels_to_labelable = sgqlc.types.Field('AddLabelsToLabelablePayload', graphql_name='addLabelsToLabelable', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddLabelsToLabelableInput'), graphql_name='input', default=None)),)))
+        add_project_card = sgqlc.types.Field('AddProjectCardPayload', graphql_name='addProjectCard', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddProjectCardInput'), graphql_name='input', default=None)),)))
+        add_project_column = sgqlc.types.Field('AddProjectColumnPayload', graphql_name='addProjectColumn', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddProjectColumnInput'), graphql_name='input', default=None)),)))
+        add_project_v2_draft_issue = sgqlc.types.Field('AddProjectV2DraftIssuePayload', graphql_name='addProjectV2DraftIssue', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddProjectV2DraftIssueInput'), graphql_name='input', default=None)),)))
+        add_project_v2_item_by_id = sgqlc.types.Field('AddProjectV2ItemByIdPayload', graphql_name='addProjectV2ItemById', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddProjectV2ItemByIdInput'), graphql_name='input', default=None)),)))
+        add_pull_request_review = sgqlc.types.Field('AddPullRequestReviewPayload', graphql_name='addPullRequestReview', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddPullRequestReviewInput'), graphql_name='input', default=None)),)))
+        add_pull_request_review_comment = sgqlc.types.Field('AddPullRequestReviewCommentPayload', graphql_name='addPullRequestReviewComment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddPullRequestReviewCommentInput'), graphql_name='input', default=None)),)))
+        add_pull_request_review_thread = sgqlc.types.Field('AddPullRequestReviewThreadPayload', graphql_name='addPullRequestReviewThread', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddPullRequestReviewThreadInput'), graphql_name='input', default=None)),)))
+        add_reaction = sgqlc.types.Field('AddReactionPayload', graphql_name='addReaction', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddReactionInput'), graphql_name='input', default=None)),)))
+        add_star = sgqlc.types.Field('AddStarPayload', graphql_name='addStar', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddStarInput'), graphql_name='input', default=None)),)))
+        add_upvote = sgqlc.types.Field('AddUpvotePayload', graphql_name='addUpvote', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddUpvoteInput'), graphql_name='input', default=None)),)))
+        add_verifiable_domain = sgqlc.types.Field('AddVerifiableDomainPayload', graphql_name='addVerifiableDomain', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('AddVerifiableDomainInput'), graphql_name='input', default=None)),)))
+        approve_deployments = sgqlc.types.Field('ApproveDeploymentsPayload', graphql_name='approveDeployments', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('ApproveDeploymentsInput'), graphql_name='input', default=None)),)))
+        approve_verifiable_domain = sgqlc.types.Field('ApproveVerifiableDomainPayload', graphql_name='approveVerifiableDomain', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('ApproveVerifiableDomainInput'), graphql_name='input', default=None)),)))
+        archive_project_v2_item = sgqlc.types.Field('ArchiveProjectV2ItemPayload', graphql_name='archiveProjectV2Item', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('ArchiveProjectV2ItemInput'), graphql_name='input', default=None)),)))
+        archive_repository = sgqlc.types.Field('ArchiveRepositoryPayload', graphql_name='archiveRepository', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('ArchiveRepositoryInput'), graphql_name='input', default=None)),)))
+        cancel_enterprise_admin_invitation = sgqlc.types.Field('CancelEnterpriseAdminInvitationPayload', graphql_name='cancelEnterpriseAdminInvitation', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CancelEnterpriseAdminInvitationInput'), graphql_name='input', default=None)),)))
+        cancel_sponsorship = sgqlc.types.Field('CancelSponsorshipPayload', graphql_name='cancelSponsorship', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CancelSponsorshipInput'), graphql_name='input', default=None)),)))
+        change_user_status = sgqlc.types.Field('ChangeUserStatusPayload', graphql_name='changeUserStatus', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('ChangeUserStatusInput'), graphql_name='input', default=None)),)))
+        clear_labels_from_labelable = sgqlc.types.Field('ClearLabelsFromLabelablePayload', graphql_name='clearLabelsFromLabelable', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('ClearLabelsFromLabelableInput'), graphql_name='input', default=None)),)))
+        clear_project_v2_item_field_value = sgqlc.types.Field('ClearProjectV2ItemFieldValuePayload', graphql_name='clearProjectV2ItemFieldValue', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('ClearProjectV2ItemFieldValueInput'), graphql_name='input', default=None)),)))
+        clone_project = sgqlc.types.Field('CloneProjectPayload', graphql_name='cloneProject', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CloneProjectInput'), graphql_name='input', default=None)),)))
+        clone_template_repository = sgqlc.types.Field('CloneTemplateRepositoryPayload', graphql_name='cloneTemplateRepository', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CloneTemplateRepositoryInput'), graphql_name='input', default=None)),)))
+        close_discussion = sgqlc.types.Field('CloseDiscussionPayload', graphql_name='closeDiscussion', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CloseDiscussionInput'), graphql_name='input', default=None)),)))
+        close_issue = sgqlc.types.Field('CloseIssuePayload', graphql_name='closeIssue', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CloseIssueInput'), graphql_name='input', default=None)),)))
+        close_pull_request = sgqlc.types.Field('ClosePullRequestPayload', graphql_name='closePullRequest', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('ClosePullRequestInput'), graphql_name='input', default=None)),)))
+        convert_project_card_note_to_issue = sgqlc.types.Field('ConvertProjectCardNoteToIssuePayload', graphql_name='convertProjectCardNoteToIssue', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('ConvertProjectCardNoteToIssueInput'), graphql_name='input', default=None)),)))
+        convert_pull_request_to_draft = sgqlc.types.Field('ConvertPullRequestToDraftPayload', graphql_name='convertPullRequestToDraft', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('ConvertPullRequestToDraftInput'), graphql_name='input', default=None)),)))
+        copy_project_v2 = sgqlc.types.Field('CopyProjectV2Payload', graphql_name='copyProjectV2', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CopyProjectV2Input'), graphql_name='input', default=None)),)))
+        create_attribution_invitation = sgqlc.types.Field('CreateAttributionInvitationPayload', graphql_name='createAttributionInvitation', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateAttributionInvitationInput'), graphql_name='input', default=None)),)))
+        create_branch_protection_rule = sgqlc.types.Field('CreateBranchProtectionRulePayload', graphql_name='createBranchProtectionRule', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateBranchProtectionRuleInput'), graphql_name='input', default=None)),)))
+        create_check_run = sgqlc.types.Field('CreateCheckRunPayload', graphql_name='createCheckRun', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateCheckRunInput'), graphql_name='input', default=None)),)))
+        create_check_suite = sgqlc.types.Field('CreateCheckSuitePayload', graphql_name='createCheckSuite', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateCheckSuiteInput'), graphql_name='input', default=None)),)))
+        create_commit_on_branch = sgqlc.types.Field('CreateCommitOnBranchPayload', graphql_name='createCommitOnBranch', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateCommitOnBranchInput'), graphql_name='input', default=None)),)))
+        create_discussion = sgqlc.types.Field('CreateDiscussionPayload', graphql_name='createDiscussion', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateDiscussionInput'), graphql_name='input', default=None)),)))
+        create_enterprise_organization = sgqlc.types.Field('CreateEnterpriseOrganizationPayload', graphql_name='createEnterpriseOrganization', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateEnterpriseOrganizationInput'), graphql_name='input', default=None)),)))
+        create_environment = sgqlc.types.Field('CreateEnvironmentPayload', graphql_name='createEnvironment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateEnvironmentInput'), graphql_name='input', default=None)),)))
+        create_ip_allow_list_entry = sgqlc.types.Field('CreateIpAllowListEntryPayload', graphql_name='createIpAllowListEntry', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateIpAllowListEntryInput'), graphql_name='input', default=None)),)))
+        create_issue = sgqlc.types.Field('CreateIssuePayload', graphql_name='createIssue', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateIssueInput'), graphql_name='input', default=None)),)))
+        create_linked_branch = sgqlc.types.Field('CreateLinkedBranchPayload', graphql_name='createLinkedBranch', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateLinkedBranchInput'), graphql_name='input', default=None)),)))
+        create_migration_source = sgqlc.types.Field('CreateMigrationSourcePayload', graphql_name='createMigrationSource', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateMigrationSourceInput'), graphql_name='input', default=None)),)))
+        create_project = sgqlc.types.Field('CreateProjectPayload', graphql_name='createProject', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateProjectInput'), graphql_name='input', default=None)),)))
+        create_project_v2 = sgqlc.types.Field('CreateProjectV2Payload', graphql_name='createProjectV2', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateProjectV2Input'), graphql_name='input', default=None)),)))
+        create_project_v2_field = sgqlc.types.Field('CreateProjectV2FieldPayload', graphql_name='createProjectV2Field', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateProjectV2FieldInput'), graphql_name='input', default=None)),)))
+        create_pull_request = sgqlc.types.Field('CreatePullRequestPayload', graphql_name='createPullRequest', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreatePullRequestInput'), graphql_name='input', default=None)),)))
+        create_ref = sgqlc.types.Field('CreateRefPayload', graphql_name='createRef', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateRefInput'), graphql_name='input', default=None)),)))
+        create_repository = sgqlc.types.Field('CreateRepositoryPayload', graphql_name='createRepository', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateRepositoryInput'), graphql_name='input', default=None)),)))
+        create_repository_ruleset = sgqlc.types.Field('CreateRepositoryRulesetPayload', graphql_name='createRepositoryRuleset', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateRepositoryRulesetInput'), graphql_name='input', default=None)),)))
+        create_sponsors_listing = sgqlc.types.Field('CreateSponsorsListingPayload', graphql_name='createSponsorsListing', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateSponsorsListingInput'), graphql_name='input', default=None)),)))
+        create_sponsors_tier = sgqlc.types.Field('CreateSponsorsTierPayload', graphql_name='createSponsorsTier', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateSponsorsTierInput'), graphql_name='input', default=None)),)))
+        create_sponsorship = sgqlc.types.Field('CreateSponsorshipPayload', graphql_name='createSponsorship', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateSponsorshipInput'), graphql_name='input', default=None)),)))
+        create_sponsorships = sgqlc.types.Field('CreateSponsorshipsPayload', graphql_name='createSponsorships', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateSponsorshipsInput'), graphql_name='input', default=None)),)))
+        create_team_discussion = sgqlc.types.Field('CreateTeamDiscussionPayload', graphql_name='createTeamDiscussion', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateTeamDiscussionInput'), graphql_name='input', default=None)),)))
+        create_team_discussion_comment = sgqlc.types.Field('CreateTeamDiscussionCommentPayload', graphql_name='createTeamDiscussionComment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('CreateTeamDiscussionCommentInput'), graphql_name='input', default=None)),)))
+        decline_topic_suggestion = sgqlc.types.Field('DeclineTopicSuggestionPayload', graphql_name='declineTopicSuggestion', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeclineTopicSuggestionInput'), graphql_name='input', default=None)),)))
+        delete_branch_protection_rule = sgqlc.types.Field('DeleteBranchProtectionRulePayload', graphql_name='deleteBranchProtectionRule', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteBranchProtectionRuleInput'), graphql_name='input', default=None)),)))
+        delete_deployment = sgqlc.types.Field('DeleteDeploymentPayload', graphql_name='deleteDeployment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteDeploymentInput'), graphql_name='input', default=None)),)))
+        delete_discussion = sgqlc.types.Field('DeleteDiscussionPayload', graphql_name='deleteDiscussion', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteDiscussionInput'), graphql_name='input', default=None)),)))
+        delete_discussion_comment = sgqlc.types.Field('DeleteDiscussionCommentPayload', graphql_name='deleteDiscussionComment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteDiscussionCommentInput'), graphql_name='input', default=None)),)))
+        delete_environment = sgqlc.types.Field('DeleteEnvironmentPayload', graphql_name='deleteEnvironment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteEnvironmentInput'), graphql_name='input', default=None)),)))
+        delete_ip_allow_list_entry = sgqlc.types.Field('DeleteIpAllowListEntryPayload', graphql_name='deleteIpAllowListEntry', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteIpAllowListEntryInput'), graphql_name='input', default=None)),)))
+        delete_issue = sgqlc.types.Field('DeleteIssuePayload', graphql_name='deleteIssue', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteIssueInput'), graphql_name='input', default=None)),)))
+        delete_issue_comment = sgqlc.types.Field('DeleteIssueCommentPayload', graphql_name='deleteIssueComment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteIssueCommentInput'), graphql_name='input', default=None)),)))
+        delete_linked_branch = sgqlc.types.Field('DeleteLinkedBranchPayload', graphql_name='deleteLinkedBranch', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteLinkedBranchInput'), graphql_name='input', default=None)),)))
+        delete_project = sgqlc.types.Field('DeleteProjectPayload', graphql_name='deleteProject', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteProjectInput'), graphql_name='input', default=None)),)))
+        delete_project_card = sgqlc.types.Field('DeleteProjectCardPayload', graphql_name='deleteProjectCard', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteProjectCardInput'), graphql_name='input', default=None)),)))
+        delete_project_column = sgqlc.types.Field('DeleteProjectColumnPayload', graphql_name='deleteProjectColumn', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteProjectColumnInput'), graphql_name='input', default=None)),)))
+        delete_project_v2 = sgqlc.types.Field('DeleteProjectV2Payload', graphql_name='deleteProjectV2', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteProjectV2Input'), graphql_name='input', default=None)),)))
+        delete_project_v2_field = sgqlc.types.Field('DeleteProjectV2FieldPayload', graphql_name='deleteProjectV2Field', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteProjectV2FieldInput'), graphql_name='input', default=None)),)))
+        delete_project_v2_item = sgqlc.types.Field('DeleteProjectV2ItemPayload', graphql_name='deleteProjectV2Item', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteProjectV2ItemInput'), graphql_name='input', default=None)),)))
+        delete_project_v2_workflow = sgqlc.types.Field('DeleteProjectV2WorkflowPayload', graphql_name='deleteProjectV2Workflow', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteProjectV2WorkflowInput'), graphql_name='input', default=None)),)))
+        delete_pull_request_review = sgqlc.types.Field('DeletePullRequestReviewPayload', graphql_name='deletePullRequestReview', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeletePullRequestReviewInput'), graphql_name='input', default=None)),)))
+        delete_pull_request_review_comment = sgqlc.types.Field('DeletePullRequestReviewCommentPayload', graphql_name='deletePullRequestReviewComment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeletePullRequestReviewCommentInput'), graphql_name='input', default=None)),)))
+        delete_ref = sgqlc.types.Field('DeleteRefPayload', graphql_name='deleteRef', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteRefInput'), graphql_name='input', default=None)),)))
+        delete_repository_ruleset = sgqlc.types.Field('DeleteRepositoryRulesetPayload', graphql_name='deleteRepositoryRuleset', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteRepositoryRulesetInput'), graphql_name='input', default=None)),)))
+        delete_team_discussion = sgqlc.types.Field('DeleteTeamDiscussionPayload', graphql_name='deleteTeamDiscussion', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteTeamDiscussionInput'), graphql_name='input', default=None)),)))
+        delete_team_discussion_comment = sgqlc.types.Field('DeleteTeamDiscussionCommentPayload', graphql_name='deleteTeamDiscussionComment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteTeamDiscussionCommentInput'), graphql_name='input', default=None)),)))
+        delete_verifiable_domain = sgqlc.types.Field('DeleteVerifiableDomainPayload', graphql_name='deleteVerifiableDomain', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DeleteVerifiableDomainInput'), graphql_name='input', default=None)),)))
+        dequeue_pull_request = sgqlc.types.Field('DequeuePullRequestPayload', graphql_name='dequeuePullRequest', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DequeuePullRequestInput'), graphql_name='input', default=None)),)))
+        disable_pull_request_auto_merge = sgqlc.types.Field('DisablePullRequestAutoMergePayload', graphql_name='disablePullRequestAutoMerge', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DisablePullRequestAutoMergeInput'), graphql_name='input', default=None)),)))
+        dismiss_pull_request_review = sgqlc.types.Field('DismissPullRequestReviewPayload', graphql_name='dismissPullRequestReview', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DismissPullRequestReviewInput'), graphql_name='input', default=None)),)))
+        dismiss_repository_vulnerability_alert = sgqlc.types.Field('DismissRepositoryVulnerabilityAlertPayload', graphql_name='dismissRepositoryVulnerabilityAlert', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('DismissRepositoryVulnerabilityAlertInput'), graphql_name='input', default=None)),)))
+        enable_pull_request_auto_merge = sgqlc.types.Field('EnablePullRequestAutoMergePayload', graphql_name='enablePullRequestAutoMerge', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('EnablePullRequestAutoMergeInput'), graphql_name='input', default=None)),)))
+        enqueue_pull_request = sgqlc.types.Field('EnqueuePullRequestPayload', graphql_name='enqueuePullRequest', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('EnqueuePullRequestInput'), graphql_name='input', default=None)),)))
+        follow_organization = sgqlc.types.Field('FollowOrganizationPayload', graphql_name='followOrganization', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('FollowOrganizationInput'), graphql_name='input', default=None)),)))
+        follow_user = sgqlc.types.Field('FollowUserPayload', graphql_name='followUser', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('FollowUserInput'), graphql_name='input', default=None)),)))
+        grant_enterprise_organizations_migrator_role = sgqlc.types.Field('GrantEnterpriseOrganizationsMigratorRolePayload', graphql_name='grantEnterpriseOrganizationsMigratorRole', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('GrantEnterpriseOrganizationsMigratorRoleInput'), graphql_name='input', default=None)),)))
+        grant_migrator_role = sgqlc.types.Field('GrantMigratorRolePayload', graphql_name='grantMigratorRole', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('GrantMigratorRoleInput'), graphql_name='input', default=None)),)))
+        invite_enterprise_admin = sgqlc.types.Field('InviteEnterpriseAdminPayload', graphql_name='inviteEnterpriseAdmin', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('InviteEnterpriseAdminInput'), graphql_name='input', default=None)),)))
+        link_project_v2_to_repository = sgqlc.types.Field('LinkProjectV2ToRepositoryPayload', graphql_name='linkProjectV2ToRepository', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('LinkProjectV2ToRepositoryInput'), graphql_name='input', default=None)),)))
+        link_project_v2_to_team = sgqlc.types.Field('LinkProjectV2ToTeamPayload', graphql_name='linkProjectV2ToTeam', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('LinkProjectV2ToTeamInput'), graphql_name='input', default=None)),)))
+        link_repository_to_project = sgqlc.types.Field('LinkRepositoryToProjectPayload', graphql_name='linkRepositoryToProject', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('LinkRepositoryToProjectInput'), graphql_name='input', default=None)),)))
+        lock_lockable = sgqlc.types.Field('LockLockablePayload', graphql_name='lockLockable', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('LockLockableInput'), graphql_name='input', default=None)),)))
+        mark_discussion_comment_as_answer = sgqlc.types.Field('MarkDiscussionCommentAsAnswerPayload', graphql_name='markDiscussionCommentAsAnswer', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('MarkDiscussionCommentAsAnswerInput'), graphql_name='input', default=None)),)))
+        mark_file_as_viewed = sgqlc.types.Field('MarkFileAsViewedPayload', graphql_name='markFileAsViewed', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('MarkFileAsViewedInput'), graphql_name='input', default=None)),)))
+        mark_project_v2_as_template = sgqlc.types.Field('MarkProjectV2AsTemplatePayload', graphql_name='markProjectV2AsTemplate', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('MarkProjectV2AsTemplateInput'), graphql_name='input', default=None)),)))
+        mark_pull_request_ready_for_review = sgqlc.types.Field('MarkPullRequestReadyForReviewPayload', graphql_name='markPullRequestReadyForReview', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('MarkPullRequestReadyForReviewInput'), graphql_name='input', default=None)),)))
+        merge_branch = sgqlc.types.Field('MergeBranchPayload', graphql_name='mergeBranch', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('MergeBranchInput'), graphql_name='input', default=None)),)))
+        merge_pull_request = sgqlc.types.Field('MergePullRequestPayload', graphql_name='mergePullRequest', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('MergePullRequestInput'), graphql_name='input', default=None)),)))
+        minimize_comment = sgqlc.types.Field('MinimizeCommentPayload', graphql_name='minimizeComment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('MinimizeCommentInput'), graphql_name='input', default=None)),)))
+        move_project_card = sgqlc.types.Field('MoveProjectCardPayload', graphql_name='moveProjectCard', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('MoveProjectCardInput'), graphql_name='input', default=None)),)))
+        move_project_column = sgqlc.types.Field('MoveProjectColumnPayload', graphql_name='moveProjectColumn', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('MoveProjectColumnInput'), graphql_name='input', default=None)),)))
+        pin_issue = sgqlc.types.Field('PinIssuePayload', graphql_name='pinIssue', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('PinIssueInput'), graphql_name='input', default=None)),)))
+        publish_sponsors_tier = sgqlc.types.Field('PublishSponsorsTierPayload', graphql_name='publishSponsorsTier', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('PublishSponsorsTierInput'), graphql_name='input', default=None)),)))
+        regenerate_enterprise_identity_provider_recovery_codes = sgqlc.types.Field('RegenerateEnterpriseIdentityProviderRecoveryCodesPayload', graphql_name='regenerateEnterpriseIdentityProviderRecoveryCodes', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RegenerateEnterpriseIdentityProviderRecoveryCodesInput'), graphql_name='input', default=None)),)))
+        regenerate_verifiable_domain_token = sgqlc.types.Field('RegenerateVerifiableDomainTokenPayload', graphql_name='regenerateVerifiableDomainToken', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RegenerateVerifiableDomainTokenInput'), graphql_name='input', default=None)),)))
+        reject_deployments = sgqlc.types.Field('RejectDeploymentsPayload', graphql_name='rejectDeployments', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RejectDeploymentsInput'), graphql_name='input', default=None)),)))
+        remove_assignees_from_assignable = sgqlc.types.Field('RemoveAssigneesFromAssignablePayload', graphql_name='removeAssigneesFromAssignable', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RemoveAssigneesFromAssignableInput'), graphql_name='input', default=None)),)))
+        remove_enterprise_admin = sgqlc.types.Field('RemoveEnterpriseAdminPayload', graphql_name='removeEnterpriseAdmin', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RemoveEnterpriseAdminInput'), graphql_name='input', default=None)),)))
+        remove_enterprise_identity_provider = sgqlc.types.Field('RemoveEnterpriseIdentityProviderPayload', graphql_name='removeEnterpriseIdentityProvider', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RemoveEnterpriseIdentityProviderInput'), graphql_name='input', default=None)),)))
+        remove_enterprise_member = sgqlc.types.Field('RemoveEnterpriseMemberPayload', graphql_name='removeEnterpriseMember', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RemoveEnterpriseMemberInput'), graphql_name='input', default=None)),)))
+        remove_enterprise_organization = sgqlc.types.Field('RemoveEnterpriseOrganizationPayload', graphql_name='removeEnterpriseOrganization', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RemoveEnterpriseOrganizationInput'), graphql_name='input', default=None)),)))
+        remove_enterprise_support_entitlement = sgqlc.types.Field('RemoveEnterpriseSupportEntitlementPayload', graphql_name='removeEnterpriseSupportEntitlement', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RemoveEnterpriseSupportEntitlementInput'), graphql_name='input', default=None)),)))
+        remove_labels_from_labelable = sgqlc.types.Field('RemoveLabelsFromLabelablePayload', graphql_name='removeLabelsFromLabelable', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RemoveLabelsFromLabelableInput'), graphql_name='input', default=None)),)))
+        remove_outside_collaborator = sgqlc.types.Field('RemoveOutsideCollaboratorPayload', graphql_name='removeOutsideCollaborator', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RemoveOutsideCollaboratorInput'), graphql_name='input', default=None)),)))
+        remove_reaction = sgqlc.types.Field('RemoveReactionPayload', graphql_name='removeReaction', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RemoveReactionInput'), graphql_name='input', default=None)),)))
+        remove_star = sgqlc.types.Field('RemoveStarPayload', graphql_name='removeStar', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RemoveStarInput'), graphql_name='input', default=None)),)))
+        remove_upvote = sgqlc.types.Field('RemoveUpvotePayload', graphql_name='removeUpvote', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RemoveUpvoteInput'), graphql_name='input', default=None)),)))
+        reopen_discussion = sgqlc.types.Field('ReopenDiscussionPayload', graphql_name='reopenDiscussion', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('ReopenDiscussionInput'), graphql_name='input', default=None)),)))
+        reopen_issue = sgqlc.types.Field('ReopenIssuePayload', graphql_name='reopenIssue', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('ReopenIssueInput'), graphql_name='input', default=None)),)))
+        reopen_pull_request = sgqlc.types.Field('ReopenPullRequestPayload', graphql_name='reopenPullRequest', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('ReopenPullRequestInput'), graphql_name='input', default=None)),)))
+        request_reviews = sgqlc.types.Field('RequestReviewsPayload', graphql_name='requestReviews', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RequestReviewsInput'), graphql_name='input', default=None)),)))
+        rerequest_check_suite = sgqlc.types.Field('RerequestCheckSuitePayload', graphql_name='rerequestCheckSuite', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RerequestCheckSuiteInput'), graphql_name='input', default=None)),)))
+        resolve_review_thread = sgqlc.types.Field('ResolveReviewThreadPayload', graphql_name='resolveReviewThread', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('ResolveReviewThreadInput'), graphql_name='input', default=None)),)))
+        retire_sponsors_tier = sgqlc.types.Field('RetireSponsorsTierPayload', graphql_name='retireSponsorsTier', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RetireSponsorsTierInput'), graphql_name='input', default=None)),)))
+        revert_pull_request = sgqlc.types.Field('RevertPullRequestPayload', graphql_name='revertPullRequest', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RevertPullRequestInput'), graphql_name='input', default=None)),)))
+        revoke_enterprise_organizations_migrator_role = sgqlc.types.Field('RevokeEnterpriseOrganizationsMigratorRolePayload', graphql_name='revokeEnterpriseOrganizationsMigratorRole', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RevokeEnterpriseOrganizationsMigratorRoleInput'), graphql_name='input', default=None)),)))
+        revoke_migrator_role = sgqlc.types.Field('RevokeMigratorRolePayload', graphql_name='revokeMigratorRole', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('RevokeMigratorRoleInput'), graphql_name='input', default=None)),)))
+        set_enterprise_identity_provider = sgqlc.types.Field('SetEnterpriseIdentityProviderPayload', graphql_name='setEnterpriseIdentityProvider', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('SetEnterpriseIdentityProviderInput'), graphql_name='input', default=None)),)))
+        set_organization_interaction_limit = sgqlc.types.Field('SetOrganizationInteractionLimitPayload', graphql_name='setOrganizationInteractionLimit', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('SetOrganizationInteractionLimitInput'), graphql_name='input', default=None)),)))
+        set_repository_interaction_limit = sgqlc.types.Field('SetRepositoryInteractionLimitPayload', graphql_name='setRepositoryInteractionLimit', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('SetRepositoryInteractionLimitInput'), graphql_name='input', default=None)),)))
+        set_user_interaction_limit = sgqlc.types.Field('SetUserInteractionLimitPayload', graphql_name='setUserInteractionLimit', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('SetUserInteractionLimitInput'), graphql_name='input', default=None)),)))
+        start_organization_migration = sgqlc.types.Field('StartOrganizationMigrationPayload', graphql_name='startOrganizationMigration', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('StartOrganizationMigrationInput'), graphql_name='input', default=None)),)))
+        start_repository_migration = sgqlc.types.Field('StartRepositoryMigrationPayload', graphql_name='startRepositoryMigration', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('StartRepositoryMigrationInput'), graphql_name='input', default=None)),)))
+        submit_pull_request_review = sgqlc.types.Field('SubmitPullRequestReviewPayload', graphql_name='submitPullRequestReview', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('SubmitPullRequestReviewInput'), graphql_name='input', default=None)),)))
+        transfer_enterprise_organization = sgqlc.types.Field('TransferEnterpriseOrganizationPayload', graphql_name='transferEnterpriseOrganization', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('TransferEnterpriseOrganizationInput'), graphql_name='input', default=None)),)))
+        transfer_issue = sgqlc.types.Field('TransferIssuePayload', graphql_name='transferIssue', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('TransferIssueInput'), graphql_name='input', default=None)),)))
+        unarchive_project_v2_item = sgqlc.types.Field('UnarchiveProjectV2ItemPayload', graphql_name='unarchiveProjectV2Item', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnarchiveProjectV2ItemInput'), graphql_name='input', default=None)),)))
+        unarchive_repository = sgqlc.types.Field('UnarchiveRepositoryPayload', graphql_name='unarchiveRepository', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnarchiveRepositoryInput'), graphql_name='input', default=None)),)))
+        unfollow_organization = sgqlc.types.Field('UnfollowOrganizationPayload', graphql_name='unfollowOrganization', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnfollowOrganizationInput'), graphql_name='input', default=None)),)))
+        unfollow_user = sgqlc.types.Field('UnfollowUserPayload', graphql_name='unfollowUser', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnfollowUserInput'), graphql_name='input', default=None)),)))
+        unlink_project_v2_from_repository = sgqlc.types.Field('UnlinkProjectV2FromRepositoryPayload', graphql_name='unlinkProjectV2FromRepository', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnlinkProjectV2FromRepositoryInput'), graphql_name='input', default=None)),)))
+        unlink_project_v2_from_team = sgqlc.types.Field('UnlinkProjectV2FromTeamPayload', graphql_name='unlinkProjectV2FromTeam', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnlinkProjectV2FromTeamInput'), graphql_name='input', default=None)),)))
+        unlink_repository_from_project = sgqlc.types.Field('UnlinkRepositoryFromProjectPayload', graphql_name='unlinkRepositoryFromProject', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnlinkRepositoryFromProjectInput'), graphql_name='input', default=None)),)))
+        unlock_lockable = sgqlc.types.Field('UnlockLockablePayload', graphql_name='unlockLockable', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnlockLockableInput'), graphql_name='input', default=None)),)))
+        unmark_discussion_comment_as_answer = sgqlc.types.Field('UnmarkDiscussionCommentAsAnswerPayload', graphql_name='unmarkDiscussionCommentAsAnswer', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnmarkDiscussionCommentAsAnswerInput'), graphql_name='input', default=None)),)))
+        unmark_file_as_viewed = sgqlc.types.Field('UnmarkFileAsViewedPayload', graphql_name='unmarkFileAsViewed', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnmarkFileAsViewedInput'), graphql_name='input', default=None)),)))
+        unmark_issue_as_duplicate = sgqlc.types.Field('UnmarkIssueAsDuplicatePayload', graphql_name='unmarkIssueAsDuplicate', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnmarkIssueAsDuplicateInput'), graphql_name='input', default=None)),)))
+        unmark_project_v2_as_template = sgqlc.types.Field('UnmarkProjectV2AsTemplatePayload', graphql_name='unmarkProjectV2AsTemplate', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnmarkProjectV2AsTemplateInput'), graphql_name='input', default=None)),)))
+        unminimize_comment = sgqlc.types.Field('UnminimizeCommentPayload', graphql_name='unminimizeComment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnminimizeCommentInput'), graphql_name='input', default=None)),)))
+        unpin_issue = sgqlc.types.Field('UnpinIssuePayload', graphql_name='unpinIssue', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnpinIssueInput'), graphql_name='input', default=None)),)))
+        unresolve_review_thread = sgqlc.types.Field('UnresolveReviewThreadPayload', graphql_name='unresolveReviewThread', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UnresolveReviewThreadInput'), graphql_name='input', default=None)),)))
+        update_branch_protection_rule = sgqlc.types.Field('UpdateBranchProtectionRulePayload', graphql_name='updateBranchProtectionRule', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateBranchProtectionRuleInput'), graphql_name='input', default=None)),)))
+        update_check_run = sgqlc.types.Field('UpdateCheckRunPayload', graphql_name='updateCheckRun', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateCheckRunInput'), graphql_name='input', default=None)),)))
+        update_check_suite_preferences = sgqlc.types.Field('UpdateCheckSuitePreferencesPayload', graphql_name='updateCheckSuitePreferences', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateCheckSuitePreferencesInput'), graphql_name='input', default=None)),)))
+        update_discussion = sgqlc.types.Field('UpdateDiscussionPayload', graphql_name='updateDiscussion', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateDiscussionInput'), graphql_name='input', default=None)),)))
+        update_discussion_comment = sgqlc.types.Field('UpdateDiscussionCommentPayload', graphql_name='updateDiscussionComment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateDiscussionCommentInput'), graphql_name='input', default=None)),)))
+        update_enterprise_administrator_role = sgqlc.types.Field('UpdateEnterpriseAdministratorRolePayload', graphql_name='updateEnterpriseAdministratorRole', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseAdministratorRoleInput'), graphql_name='input', default=None)),)))
+        update_enterprise_allow_private_repository_forking_setting = sgqlc.types.Field('UpdateEnterpriseAllowPrivateRepositoryForkingSettingPayload', graphql_name='updateEnterpriseAllowPrivateRepositoryForkingSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseAllowPrivateRepositoryForkingSettingInput'), graphql_name='input', default=None)),)))
+        update_enterprise_default_repository_permission_setting = sgqlc.types.Field('UpdateEnterpriseDefaultRepositoryPermissionSettingPayload', graphql_name='updateEnterpriseDefaultRepositoryPermissionSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseDefaultRepositoryPermissionSettingInput'), graphql_name='input', default=None)),)))
+        update_enterprise_members_can_change_repository_visibility_setting = sgqlc.types.Field('UpdateEnterpriseMembersCanChangeRepositoryVisibilitySettingPayload', graphql_name='updateEnterpriseMembersCanChangeRepositoryVisibilitySetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseMembersCanChangeRepositoryVisibilitySettingInput'), graphql_name='input', default=None)),)))
+        update_enterprise_members_can_create_repositories_setting = sgqlc.types.Field('UpdateEnterpriseMembersCanCreateRepositoriesSettingPayload', graphql_name='updateEnterpriseMembersCanCreateRepositoriesSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseMembersCanCreateRepositoriesSettingInput'), graphql_name='input', default=None)),)))
+        update_enterprise_members_can_delete_issues_setting = sgqlc.types.Field('UpdateEnterpriseMembersCanDeleteIssuesSettingPayload', graphql_name='updateEnterpriseMembersCanDeleteIssuesSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseMembersCanDeleteIssuesSettingInput'), graphql_name='input', default=None)),)))
+        update_enterprise_members_can_delete_repositories_setting = sgqlc.types.Field('UpdateEnterpriseMembersCanDeleteRepositoriesSettingPayload', graphql_name='updateEnterpriseMembersCanDeleteRepositoriesSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseMembersCanDeleteRepositoriesSettingInput'), graphql_name='input', default=None)),)))
+        update_enterprise_members_can_invite_collaborators_setting = sgqlc.types.Field('UpdateEnterpriseMembersCanInviteCollaboratorsSettingPayload', graphql_name='updateEnterpriseMembersCanInviteCollaboratorsSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseMembersCanInviteCollaboratorsSettingInput'), graphql_name='input', default=None)),)))
+        update_enterprise_members_can_make_purchases_setting = sgqlc.types.Field('UpdateEnterpriseMembersCanMakePurchasesSettingPayload', graphql_name='updateEnterpriseMembersCanMakePurchasesSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseMembersCanMakePurchasesSettingInput'), graphql_name='input', default=None)),)))
+        update_enterprise_members_can_update_protected_branches_setting = sgqlc.types.Field('UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingPayload', graphql_name='updateEnterpriseMembersCanUpdateProtectedBranchesSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingInput'), graphql_name='input', default=None)),)))
+        update_enterprise_members_can_view_dependency_insights_setting = sgqlc.types.Field('UpdateEnterpriseMembersCanViewDependencyInsightsSettingPayload', graphql_name='updateEnterpriseMembersCanViewDependencyInsightsSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseMembersCanViewDependencyInsightsSettingInput'), graphql_name='input', default=None)),)))
+        update_enterprise_organization_projects_setting = sgqlc.types.Field('UpdateEnterpriseOrganizationProjectsSettingPayload', graphql_name='updateEnterpriseOrganizationProjectsSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseOrganizationProjectsSettingInput'), graphql_name='input', default=None)),)))
+        update_enterprise_owner_organization_role = sgqlc.types.Field('UpdateEnterpriseOwnerOrganizationRolePayload', graphql_name='updateEnterpriseOwnerOrganizationRole', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseOwnerOrganizationRoleInput'), graphql_name='input', default=None)),)))
+        update_enterprise_profile = sgqlc.types.Field('UpdateEnterpriseProfilePayload', graphql_name='updateEnterpriseProfile', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseProfileInput'), graphql_name='input', default=None)),)))
+        update_enterprise_repository_projects_setting = sgqlc.types.Field('UpdateEnterpriseRepositoryProjectsSettingPayload', graphql_name='updateEnterpriseRepositoryProjectsSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseRepositoryProjectsSettingInput'), graphql_name='input', default=None)),)))
+        update_enterprise_team_discussions_setting = sgqlc.types.Field('UpdateEnterpriseTeamDiscussionsSettingPayload', graphql_name='updateEnterpriseTeamDiscussionsSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseTeamDiscussionsSettingInput'), graphql_name='input', default=None)),)))
+        update_enterprise_two_factor_authentication_required_setting = sgqlc.types.Field('UpdateEnterpriseTwoFactorAuthenticationRequiredSettingPayload', graphql_name='updateEnterpriseTwoFactorAuthenticationRequiredSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnterpriseTwoFactorAuthenticationRequiredSettingInput'), graphql_name='input', default=None)),)))
+        update_environment = sgqlc.types.Field('UpdateEnvironmentPayload', graphql_name='updateEnvironment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateEnvironmentInput'), graphql_name='input', default=None)),)))
+        update_ip_allow_list_enabled_setting = sgqlc.types.Field('UpdateIpAllowListEnabledSettingPayload', graphql_name='updateIpAllowListEnabledSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateIpAllowListEnabledSettingInput'), graphql_name='input', default=None)),)))
+        update_ip_allow_list_entry = sgqlc.types.Field('UpdateIpAllowListEntryPayload', graphql_name='updateIpAllowListEntry', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateIpAllowListEntryInput'), graphql_name='input', default=None)),)))
+        update_ip_allow_list_for_installed_apps_enabled_setting = sgqlc.types.Field('UpdateIpAllowListForInstalledAppsEnabledSettingPayload', graphql_name='updateIpAllowListForInstalledAppsEnabledSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateIpAllowListForInstalledAppsEnabledSettingInput'), graphql_name='input', default=None)),)))
+        update_issue = sgqlc.types.Field('UpdateIssuePayload', graphql_name='updateIssue', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateIssueInput'), graphql_name='input', default=None)),)))
+        update_issue_comment = sgqlc.types.Field('UpdateIssueCommentPayload', graphql_name='updateIssueComment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateIssueCommentInput'), graphql_name='input', default=None)),)))
+        update_notification_restriction_setting = sgqlc.types.Field('UpdateNotificationRestrictionSettingPayload', graphql_name='updateNotificationRestrictionSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateNotificationRestrictionSettingInput'), graphql_name='input', default=None)),)))
+        update_organization_allow_private_repository_forking_setting = sgqlc.types.Field('UpdateOrganizationAllowPrivateRepositoryForkingSettingPayload', graphql_name='updateOrganizationAllowPrivateRepositoryForkingSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateOrganizationAllowPrivateRepositoryForkingSettingInput'), graphql_name='input', default=None)),)))
+        update_organization_web_commit_signoff_setting = sgqlc.types.Field('UpdateOrganizationWebCommitSignoffSettingPayload', graphql_name='updateOrganizationWebCommitSignoffSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateOrganizationWebCommitSignoffSettingInput'), graphql_name='input', default=None)),)))
+        update_project = sgqlc.types.Field('UpdateProjectPayload', graphql_name='updateProject', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateProjectInput'), graphql_name='input', default=None)),)))
+        update_project_card = sgqlc.types.Field('UpdateProjectCardPayload', graphql_name='updateProjectCard', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateProjectCardInput'), graphql_name='input', default=None)),)))
+        update_project_column = sgqlc.types.Field('UpdateProjectColumnPayload', graphql_name='updateProjectColumn', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateProjectColumnInput'), graphql_name='input', default=None)),)))
+        update_project_v2 = sgqlc.types.Field('UpdateProjectV2Payload', graphql_name='updateProjectV2', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateProjectV2Input'), graphql_name='input', default=None)),)))
+        update_project_v2_collaborators = sgqlc.types.Field('UpdateProjectV2CollaboratorsPayload', graphql_name='updateProjectV2Collaborators', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateProjectV2CollaboratorsInput'), graphql_name='input', default=None)),)))
+        update_project_v2_draft_issue = sgqlc.types.Field('UpdateProjectV2DraftIssuePayload', graphql_name='updateProjectV2DraftIssue', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateProjectV2DraftIssueInput'), graphql_name='input', default=None)),)))
+        update_project_v2_item_field_value = sgqlc.types.Field('UpdateProjectV2ItemFieldValuePayload', graphql_name='updateProjectV2ItemFieldValue', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateProjectV2ItemFieldValueInput'), graphql_name='input', default=None)),)))
+        update_project_v2_item_position = sgqlc.types.Field('UpdateProjectV2ItemPositionPayload', graphql_name='updateProjectV2ItemPosition', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateProjectV2ItemPositionInput'), graphql_name='input', default=None)),)))
+        update_pull_request = sgqlc.types.Field('UpdatePullRequestPayload', graphql_name='updatePullRequest', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdatePullRequestInput'), graphql_name='input', default=None)),)))
+        update_pull_request_branch = sgqlc.types.Field('UpdatePullRequestBranchPayload', graphql_name='updatePullRequestBranch', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdatePullRequestBranchInput'), graphql_name='input', default=None)),)))
+        update_pull_request_review = sgqlc.types.Field('UpdatePullRequestReviewPayload', graphql_name='updatePullRequestReview', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdatePullRequestReviewInput'), graphql_name='input', default=None)),)))
+        update_pull_request_review_comment = sgqlc.types.Field('UpdatePullRequestReviewCommentPayload', graphql_name='updatePullRequestReviewComment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdatePullRequestReviewCommentInput'), graphql_name='input', default=None)),)))
+        update_ref = sgqlc.types.Field('UpdateRefPayload', graphql_name='updateRef', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateRefInput'), graphql_name='input', default=None)),)))
+        update_repository = sgqlc.types.Field('UpdateRepositoryPayload', graphql_name='updateRepository', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateRepositoryInput'), graphql_name='input', default=None)),)))
+        update_repository_ruleset = sgqlc.types.Field('UpdateRepositoryRulesetPayload', graphql_name='updateRepositoryRuleset', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateRepositoryRulesetInput'), graphql_name='input', default=None)),)))
+        update_repository_web_commit_signoff_setting = sgqlc.types.Field('UpdateRepositoryWebCommitSignoffSettingPayload', graphql_name='updateRepositoryWebCommitSignoffSetting', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateRepositoryWebCommitSignoffSettingInput'), graphql_name='input', default=None)),)))
+        update_sponsorship_preferences = sgqlc.types.Field('UpdateSponsorshipPreferencesPayload', graphql_name='updateSponsorshipPreferences', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateSponsorshipPreferencesInput'), graphql_name='input', default=None)),)))
+        update_subscription = sgqlc.types.Field('UpdateSubscriptionPayload', graphql_name='updateSubscription', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateSubscriptionInput'), graphql_name='input', default=None)),)))
+        update_team_discussion = sgqlc.types.Field('UpdateTeamDiscussionPayload', graphql_name='updateTeamDiscussion', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateTeamDiscussionInput'), graphql_name='input', default=None)),)))
+        update_team_discussion_comment = sgqlc.types.Field('UpdateTeamDiscussionCommentPayload', graphql_name='updateTeamDiscussionComment', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateTeamDiscussionCommentInput'), graphql_name='input', default=None)),)))
+        update_teams_repository = sgqlc.types.Field('UpdateTeamsRepositoryPayload', graphql_name='updateTeamsRepository', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateTeamsRepositoryInput'), graphql_name='input', default=None)),)))
+        update_topics = sgqlc.types.Field('UpdateTopicsPayload', graphql_name='updateTopics', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('UpdateTopicsInput'), graphql_name='input', default=None)),)))
+        verify_verifiable_domain = sgqlc.types.Field('VerifyVerifiableDomainPayload', graphql_name='verifyVerifiableDomain', args=sgqlc.types.ArgDict((('input', sgqlc.types.Arg(sgqlc.types.non_null('VerifyVerifiableDomainInput'), graphql_name='input', default=None)),)))
+    return Mutation
+
+
+def OrganizationAuditEntryEdge():
+    class OrganizationAuditEntryEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('OrganizationAuditEntry', graphql_name='node')
+    return OrganizationAuditEntryEdge
+
+
+def OrganizationEdge():
+    class OrganizationEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Organization', graphql_name='node')
+    return OrganizationEdge
+
+
+def OrganizationEnterpriseOwnerEdge():
+    class OrganizationEnterpriseOwnerEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node', 'organization_role')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('User', graphql_name='node')
+        organization_role = sgqlc.types.Field(sgqlc.types.non_null('RoleInOrganization'), graphql_name='organizationRole')
+    return OrganizationEnterpriseOwnerEdge
+
+
+def OrganizationInvitationEdge():
+    class OrganizationInvitationEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('OrganizationInvitation', graphql_name='node')
+    return OrganizationInvitationEdge
+
+
+def OrganizationMemberEdge():
+    class OrganizationMemberEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'has_two_factor_enabled', 'node', 'role')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        has_two_factor_enabled = sgqlc.types.Field('Boolean', graphql_name='hasTwoFactorEnabled')
+        node = sgqlc.types.Field('User', graphql_name='node')
+        role = sgqlc.types.Field('OrganizationMemberRole', graphql_name='role')
+    return OrganizationMemberEdge
+
+
+def PackageEdge():
+    class PackageEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Package', graphql_name='node')
+    return PackageEdge
+
+
+def PackageFileEdge():
+    class PackageFileEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PackageFile', graphql_name='node')
+    return PackageFileEdge
+
+
+def PackageStatistics():
+    class PackageStatistics(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('downloads_total_count',)
+        downloads_total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='downloadsTotalCount')
+    return PackageStatistics
+
+
+def PackageVersionEdge():
+    class PackageVersionEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PackageVersion', graphql_name='node')
+    return PackageVersionEdge
+
+
+def PackageVersionStatistics():
+    class PackageVersionStatistics(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('downloads_total_count',)
+        downloads_total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='downloadsTotalCount')
+    return PackageVersionStatistics
+
+
+def PageInfo():
+    class PageInfo(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('end_cursor', 'has_next_page', 'has_previous_page', 'start_cursor')
+        end_cursor = sgqlc.types.Field('String', graphql_name='endCursor')
+        has_next_page = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasNextPage')
+        has_previous_page = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasPreviousPage')
+        start_cursor = sgqlc.types.Field('String', graphql_name='startCursor')
+    return PageInfo
+
+
+def PermissionSource():
+    class PermissionSource(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('organization', 'permission', 'source')
+        organization = sgqlc.types.Field(sgqlc.types.non_null('Organization'), graphql_name='organization')
+        permission = sgqlc.types.Field(sgqlc.types.non_null('DefaultRepositoryPermissionField'), graphql_name='permission')
+        source = sgqlc.types.Field(sgqlc.types.non_null('PermissionGranter'), graphql_name='source')
+    return PermissionSource
+
+
+def PinIssuePayload():
+    class PinIssuePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'issue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        issue = sgqlc.types.Field('Issue', graphql_name='issue')
+    return PinIssuePayload
+
+
+def PinnableItemEdge():
+    class PinnableItemEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PinnableItem', graphql_name='node')
+    return PinnableItemEdge
+
+
+def PinnedDiscussionEdge():
+    class PinnedDiscussionEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PinnedDiscussion', graphql_name='node')
+    return PinnedDiscussionEdge
+
+
+def PinnedIssueEdge():
+    class PinnedIssueEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PinnedIssue', graphql_name='node')
+    return PinnedIssueEdge
+
+
+def ProfileItemShowcase():
+    class ProfileItemShowcase(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('has_pinned_items', 'items')
+        has_pinned_items = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasPinnedItems')
+        items = sgqlc.types.Field(sgqlc.types.non_null('PinnableItemConnection'), graphql_name='items', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return ProfileItemShowcase
+
+
+def ProjectCardEdge():
+    class ProjectCardEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ProjectCard', graphql_name='node')
+    return ProjectCardEdge
+
+
+def ProjectColumnEdge():
+    class ProjectColumnEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ProjectColumn', graphql_name='node')
+    return ProjectColumnEdge
+
+
+def ProjectEdge():
+    class ProjectEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Project', graphql_name='node')
+    return ProjectEdge
+
+
+def ProjectProgress():
+    class ProjectProgress(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('done_count', 'done_percentage', 'enabled', 'in_progress_count', 'in_progress_percentage', 'todo_count', 'todo_percentage')
+        done_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='doneCount')
+        done_percentage = sgqlc.types.Field(sgqlc.types.non_null('Float'), graphql_name='donePercentage')
+        enabled = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='enabled')
+        in_progress_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='inProgressCount')
+        in_progress_percentage = sgqlc.types.Field(sgqlc.types.non_null('Float'), graphql_name='inProgressPercentage')
+        todo_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='todoCount')
+        todo_percentage = sgqlc.types.Field(sgqlc.types.non_null('Float'), graphql_name='todoPercentage')
+    return ProjectProgress
+
+
+def ProjectV2ActorEdge():
+    class ProjectV2ActorEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ProjectV2Actor', graphql_name='node')
+    return ProjectV2ActorEdge
+
+
+def ProjectV2Edge():
+    class ProjectV2Edge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ProjectV2', graphql_name='node')
+    return ProjectV2Edge
+
+
+def ProjectV2FieldConfigurationEdge():
+    class ProjectV2FieldConfigurationEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ProjectV2FieldConfiguration', graphql_name='node')
+    return ProjectV2FieldConfigurationEdge
+
+
+def ProjectV2FieldEdge():
+    class ProjectV2FieldEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ProjectV2Field', graphql_name='node')
+    return ProjectV2FieldEdge
+
+
+def ProjectV2ItemEdge():
+    class ProjectV2ItemEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ProjectV2Item', graphql_name='node')
+    return ProjectV2ItemEdge
+
+
+def ProjectV2ItemFieldLabelValue():
+    class ProjectV2ItemFieldLabelValue(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'labels')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2FieldConfiguration'), graphql_name='field')
+        labels = sgqlc.types.Field('LabelConnection', graphql_name='labels', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return ProjectV2ItemFieldLabelValue
+
+
+def ProjectV2ItemFieldMilestoneValue():
+    class ProjectV2ItemFieldMilestoneValue(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'milestone')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2FieldConfiguration'), graphql_name='field')
+        milestone = sgqlc.types.Field('Milestone', graphql_name='milestone')
+    return ProjectV2ItemFieldMilestoneValue
+
+
+def ProjectV2ItemFieldPullRequestValue():
+    class ProjectV2ItemFieldPullRequestValue(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'pull_requests')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2FieldConfiguration'), graphql_name='field')
+        pull_requests = sgqlc.types.Field('PullRequestConnection', graphql_name='pullRequests', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.PullRequestOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'ASC'})))))
+    return ProjectV2ItemFieldPullRequestValue
+
+
+def ProjectV2ItemFieldRepositoryValue():
+    class ProjectV2ItemFieldRepositoryValue(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'repository')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2FieldConfiguration'), graphql_name='field')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return ProjectV2ItemFieldRepositoryValue
+
+
+def ProjectV2ItemFieldReviewerValue():
+    class ProjectV2ItemFieldReviewerValue(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'reviewers')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2FieldConfiguration'), graphql_name='field')
+        reviewers = sgqlc.types.Field('RequestedReviewerConnection', graphql_name='reviewers', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return ProjectV2ItemFieldReviewerValue
+
+
+def ProjectV2ItemFieldUserValue():
+    class ProjectV2ItemFieldUserValue(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('field', 'users')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2FieldConfiguration'), graphql_name='field')
+        users = sgqlc.types.Field('UserConnection', graphql_name='users', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return ProjectV2ItemFieldUserValue
+
+
+def ProjectV2ItemFieldValueEdge():
+    class ProjectV2ItemFieldValueEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ProjectV2ItemFieldValue', graphql_name='node')
+    return ProjectV2ItemFieldValueEdge
+
+
+def ProjectV2IterationFieldConfiguration():
+    class ProjectV2IterationFieldConfiguration(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('completed_iterations', 'duration', 'iterations', 'start_day')
+        completed_iterations = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ProjectV2IterationFieldIteration'))), graphql_name='completedIterations')
+        duration = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='duration')
+        iterations = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ProjectV2IterationFieldIteration'))), graphql_name='iterations')
+        start_day = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='startDay')
+    return ProjectV2IterationFieldConfiguration
+
+
+def ProjectV2IterationFieldIteration():
+    class ProjectV2IterationFieldIteration(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('duration', 'id', 'start_date', 'title', 'title_html')
+        duration = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='duration')
+        id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='id')
+        start_date = sgqlc.types.Field(sgqlc.types.non_null('Date'), graphql_name='startDate')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        title_html = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='titleHTML')
+    return ProjectV2IterationFieldIteration
+
+
+def ProjectV2SingleSelectFieldOption():
+    class ProjectV2SingleSelectFieldOption(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('id', 'name', 'name_html')
+        id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='id')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        name_html = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='nameHTML')
+    return ProjectV2SingleSelectFieldOption
+
+
+def ProjectV2SortBy():
+    class ProjectV2SortBy(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2Field'), graphql_name='field')
+    return ProjectV2SortBy
+
+
+def ProjectV2SortByEdge():
+    class ProjectV2SortByEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ProjectV2SortBy', graphql_name='node')
+    return ProjectV2SortByEdge
+
+
+def ProjectV2SortByField():
+    class ProjectV2SortByField(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2FieldConfiguration'), graphql_name='field')
+    return ProjectV2SortByField
+
+
+def ProjectV2SortByFieldEdge():
+    class ProjectV2SortByFieldEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ProjectV2SortByField', graphql_name='node')
+    return ProjectV2SortByFieldEdge
+
+
+def ProjectV2ViewEdge():
+    class ProjectV2ViewEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ProjectV2View', graphql_name='node')
+    return ProjectV2ViewEdge
+
+
+def ProjectV2WorkflowEdge():
+    class ProjectV2WorkflowEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ProjectV2Workflow', graphql_name='node')
+    return ProjectV2WorkflowEdge
+
+
+def PublicKeyEdge():
+    class PublicKeyEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PublicKey', graphql_name='node')
+    return PublicKeyEdge
+
+
+def PublishSponsorsTierPayload():
+    class PublishSponsorsTierPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'sponsors_tier')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        sponsors_tier = sgqlc.types.Field('SponsorsTier', graphql_name='sponsorsTier')
+    return PublishSponsorsTierPayload
+
+
+def PullRequestChangedFile():
+    class PullRequestChangedFile(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('additions', 'change_type', 'deletions', 'path', 'viewer_viewed_state')
+        additions = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='additions')
+        change_type = sgqlc.types.Field(sgqlc.types.non_null('PatchStatus'), graphql_name='changeType')
+        deletions = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='deletions')
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+        viewer_viewed_state = sgqlc.types.Field(sgqlc.types.non_null('FileViewedState'), graphql_name='viewerViewedState')
+    return PullRequestChangedFile
+
+
+def PullRequestChangedFileEdge():
+    class PullRequestChangedFileEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PullRequestChangedFile', graphql_name='node')
+    return PullRequestChangedFileEdge
+
+
+def PullRequestCommitEdge():
+    class PullRequestCommitEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PullRequestCommit', graphql_name='node')
+    return PullRequestCommitEdge
+
+
+def PullRequestContributionsByRepository():
+    class PullRequestContributionsByRepository(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('contributions', 'repository')
+        contributions = sgqlc.types.Field(sgqlc.types.non_null('CreatedPullRequestContributionConnection'), graphql_name='contributions', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ContributionOrder, graphql_name='orderBy', default={'direction': 'DESC'})))))
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+    return PullRequestContributionsByRepository
+
+
+def PullRequestEdge():
+    class PullRequestEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PullRequest', graphql_name='node')
+    return PullRequestEdge
+
+
+def PullRequestParameters():
+    class PullRequestParameters(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('dismiss_stale_reviews_on_push', 'require_code_owner_review', 'require_last_push_approval', 'required_approving_review_count', 'required_review_thread_resolution')
+        dismiss_stale_reviews_on_push = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='dismissStaleReviewsOnPush')
+        require_code_owner_review = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requireCodeOwnerReview')
+        require_last_push_approval = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requireLastPushApproval')
+        required_approving_review_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='requiredApprovingReviewCount')
+        required_review_thread_resolution = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requiredReviewThreadResolution')
+    return PullRequestParameters
+
+
+def PullRequestReviewCommentEdge():
+    class PullRequestReviewCommentEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PullRequestReviewComment', graphql_name='node')
+    return PullRequestReviewCommentEdge
+
+
+def PullRequestReviewContributionsByRepository():
+    class PullRequestReviewContributionsByRepository(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('contributions', 'repository')
+        contributions = sgqlc.types.Field(sgqlc.types.non_null('CreatedPullRequestReviewContributionConnection'), graphql_name='contributions', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ContributionOrder, graphql_name='orderBy', default={'direction': 'DESC'})))))
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+    return PullRequestReviewContributionsByRepository
+
+
+def PullRequestReviewEdge():
+    class PullRequestReviewEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PullRequestReview', graphql_name='node')
+    return PullRequestReviewEdge
+
+
+def PullRequestReviewThreadEdge():
+    class PullRequestReviewThreadEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PullRequestReviewThread', graphql_name='node')
+    return PullRequestReviewThreadEdge
+
+
+def PullRequestRevisionMarker():
+    class PullRequestRevisionMarker(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'last_seen_commit', 'pull_request')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        last_seen_commit = sgqlc.types.Field(sgqlc.types.non_null('Commit'), graphql_name='lastSeenCommit')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+    return PullRequestRevisionMarker
+
+
+def PullRequestTemplate():
+    class PullRequestTemplate(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('body', 'filename', 'repository')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        filename = sgqlc.types.Field('String', graphql_name='filename')
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+    return PullRequestTemplate
+
+
+def PullRequestTimelineItemEdge():
+    class PullRequestTimelineItemEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PullRequestTimelineItem', graphql_name='node')
+    return PullRequestTimelineItemEdge
+
+
+def PullRequestTimelineItemsEdge():
+    class PullRequestTimelineItemsEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PullRequestTimelineItems', graphql_name='node')
+    return PullRequestTimelineItemsEdge
+
+
+def PushAllowanceEdge():
+    class PushAllowanceEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('PushAllowance', graphql_name='node')
+    return PushAllowanceEdge
+
+
+def Query():
+    class Query(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('code_of_conduct', 'codes_of_conduct', 'enterprise', 'enterprise_administrator_invitation', 'enterprise_administrator_invitation_by_token', 'license', 'licenses', 'marketplace_categories', 'marketplace_category', 'marketplace_listing', 'marketplace_listings', 'meta', 'node', 'nodes', 'organization', 'rate_limit', 'relay', 'repository', 'repository_owner', 'resource', 'search', 'security_advisories', 'security_advisory', 'security_vulnerabilities', 'sponsorables', 'topic', 'user', 'viewer')
+        code_of_conduct = sgqlc.types.Field('CodeOfConduct', graphql_name='codeOfConduct', args=sgqlc.types.ArgDict((('key', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='key', default=None)),)))
+        codes_of_conduct = sgqlc.types.Field(sgqlc.types.list_of('CodeOfConduct'), graphql_name='codesOfConduct')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise', args=sgqlc.types.ArgDict((('slug', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='slug', default=None)), ('invitation_token', sgqlc.types.Arg('String', graphql_name='invitationToken', default=None)))))
+        enterprise_administrator_invitation = sgqlc.types.Field('EnterpriseAdministratorInvitation', graphql_name='enterpriseAdministratorInvitation', args=sgqlc.types.ArgDict((('user_login', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='userLogin', default=None)), ('enterprise_slug', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='enterpriseSlug', default=None)), ('role', sgqlc.types.Arg(sgqlc.types.non_null('EnterpriseAdministratorRole'), graphql_name='role', default=None)))))
+        enterprise_administrator_invitation_by_token = sgqlc.types.Field('EnterpriseAdministratorInvitation', graphql_name='enterpriseAdministratorInvitationByToken', args=sgqlc.types.ArgDict((('invitation_token', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='invitationToken', default=None)),)))
+        license = sgqlc.types.Field('License', graphql_name='license', args=sgqlc.types.ArgDict((('key', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='key', default=None)),)))
+        licenses = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('License')), graphql_name='licenses')
+        marketplace_categories = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('MarketplaceCategory'))), graphql_name='marketplaceCategories', args=sgqlc.types.ArgDict((('include_categories', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='includeCategories', default=None)), ('exclude_empty', sgqlc.types.Arg('Boolean', graphql_name='excludeEmpty', default=None)), ('exclude_subcategories', sgqlc.types.Arg('Boolean', graphql_name='excludeSubcategories', default=None)))))
+        marketplace_category = sgqlc.types.Field('MarketplaceCategory', graphql_name='marketplaceCategory', args=sgqlc.types.ArgDict((('slug', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='slug', default=None)), ('use_topic_aliases', sgqlc.types.Arg('Boolean', graphql_name='useTopicAliases', default=None)))))
+        marketplace_listing = sgqlc.types.Field('MarketplaceListing', graphql_name='marketplaceListing', args=sgqlc.types.ArgDict((('slug', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='slug', default=None)),)))
+        marketplace_listings = sgqlc.types.Field(sgqlc.types.non_null('MarketplaceListingConnection'), graphql_name='marketplaceListings', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('category_slug', sgqlc.types.Arg('String', graphql_name='categorySlug', default=None)), ('use_topic_aliases', sgqlc.types.Arg('Boolean', graphql_name='useTopicAliases', default=None)), ('viewer_can_admin', sgqlc.types.Arg('Boolean', graphql_name='viewerCanAdmin', default=None)), ('admin_id', sgqlc.types.Arg('ID', graphql_name='adminId', default=None)), ('organization_id', sgqlc.types.Arg('ID', graphql_name='organizationId', default=None)), ('all_states', sgqlc.types.Arg('Boolean', graphql_name='allStates', default=None)), ('slugs', sgqlc.types.Arg(sgqlc.types.list_of('String'), graphql_name='slugs', default=None)), ('primary_category_only', sgqlc.types.Arg(github_schema.Boolean, graphql_name='primaryCategoryOnly', default=False)), ('with_free_trials_only', sgqlc.types.Arg(github_schema.Boolean, graphql_name='withFreeTrialsOnly', default=False)))))
+        meta = sgqlc.types.Field(sgqlc.types.non_null('GitHubMetadata'), graphql_name='meta')
+        node = sgqlc.types.Field('Node', graphql_name='node', args=sgqlc.types.ArgDict((('id', sgqlc.types.Arg(sgqlc.types.non_null('ID'), graphql_name='id', default=None)),)))
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('Node')), graphql_name='nodes', args=sgqlc.types.ArgDict((('ids', sgqlc.types.Arg(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ID'))), graphql_name='ids', default=None)),)))
+        organization = sgqlc.types.Field('Organization', graphql_name='organization', args=sgqlc.types.ArgDict((('login', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='login', default=None)),)))
+        rate_limit = sgqlc.types.Field('RateLimit', graphql_name='rateLimit', args=sgqlc.types.ArgDict((('dry_run', sgqlc.types.Arg(github_schema.Boolean, graphql_name='dryRun', default=False)),)))
+        relay = sgqlc.types.Field(sgqlc.types.non_null('Query'), graphql_name='relay')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository', args=sgqlc.types.ArgDict((('owner', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='owner', default=None)), ('name', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='name', default=None)), ('follow_renames', sgqlc.types.Arg(github_schema.Boolean, graphql_name='followRenames', default=True)))))
+        repository_owner = sgqlc.types.Field('RepositoryOwner', graphql_name='repositoryOwner', args=sgqlc.types.ArgDict((('login', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='login', default=None)),)))
+        resource = sgqlc.types.Field('UniformResourceLocatable', graphql_name='resource', args=sgqlc.types.ArgDict((('url', sgqlc.types.Arg(sgqlc.types.non_null('URI'), graphql_name='url', default=None)),)))
+        search = sgqlc.types.Field(sgqlc.types.non_null('SearchResultItemConnection'), graphql_name='search', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('query', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='query', default=None)), ('type', sgqlc.types.Arg(sgqlc.types.non_null('SearchType'), graphql_name='type', default=None)))))
+        security_advisories = sgqlc.types.Field(sgqlc.types.non_null('SecurityAdvisoryConnection'), graphql_name='securityAdvisories', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg(github_schema.SecurityAdvisoryOrder, graphql_name='orderBy', default={'field': 'UPDATED_AT', 'direction': 'DESC'})), ('identifier', sgqlc.types.Arg('SecurityAdvisoryIdentifierFilter', graphql_name='identifier', default=None)), ('published_since', sgqlc.types.Arg('DateTime', graphql_name='publishedSince', default=None)), ('updated_since', sgqlc.types.Arg('DateTime', graphql_name='updatedSince', default=None)), ('classifications', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('SecurityAdvisoryClassification')), graphql_name='classifications', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        security_advisory = sgqlc.types.Field('SecurityAdvisory', graphql_name='securityAdvisory', args=sgqlc.types.ArgDict((('ghsa_id', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='ghsaId', default=None)),)))
+        security_vulnerabilities = sgqlc.types.Field(sgqlc.types.non_null('SecurityVulnerabilityConnection'), graphql_name='securityVulnerabilities', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg(github_schema.SecurityVulnerabilityOrder, graphql_name='orderBy', default={'field': 'UPDATED_AT', 'direction': 'DESC'})), ('ecosystem', sgqlc.types.Arg('SecurityAdvisoryEcosystem', graphql_name='ecosystem', default=None)), ('package', sgqlc.types.Arg('String', graphql_name='package', default=None)), ('severities', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('SecurityAdvisorySeverity')), graphql_name='severities', default=None)), ('classifications', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('SecurityAdvisoryClassification')), graphql_name='classifications', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        sponsorables = sgqlc.types.Field(sgqlc.types.non_null('SponsorableItemConnection'), graphql_name='sponsorables', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.SponsorableOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})), ('only_dependencies', sgqlc.types.Arg(github_schema.Boolean, graphql_name='onlyDependencies', default=False)), ('org_login_for_dependencies', sgqlc.types.Arg('String', graphql_name='orgLoginForDependencies', default=None)), ('dependency_ecosystem', sgqlc.types.Arg('SecurityAdvisoryEcosystem', graphql_name='dependencyEcosystem', default=None)), ('ecosystem', sgqlc.types.Arg('DependencyGraphEcosystem', graphql_name='ecosystem', default=None)))))
+        topic = sgqlc.types.Field('Topic', graphql_name='topic', args=sgqlc.types.ArgDict((('name', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='name', default=None)),)))
+        user = sgqlc.types.Field('User', graphql_name='user', args=sgqlc.types.ArgDict((('login', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='login', default=None)),)))
+        viewer = sgqlc.types.Field(sgqlc.types.non_null('User'), graphql_name='viewer')
+    return Query
+
+
+def RateLimit():
+    class RateLimit(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cost', 'limit', 'node_count', 'remaining', 'reset_at', 'used')
+        cost = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='cost')
+        limit = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='limit')
+        node_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='nodeCount')
+        remaining = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='remaining')
+        reset_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='resetAt')
+        used = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='used')
+    return RateLimit
+
+
+def ReactingUserEdge():
+    class ReactingUserEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node', 'reacted_at')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field(sgqlc.types.non_null('User'), graphql_name='node')
+        reacted_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='reactedAt')
+    return ReactingUserEdge
+
+
+def ReactionEdge():
+    class ReactionEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Reaction', graphql_name='node')
+    return ReactionEdge
+
+
+def ReactionGroup():
+    class ReactionGroup(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('content', 'created_at', 'reactors', 'subject', 'viewer_has_reacted')
+        content = sgqlc.types.Field(sgqlc.types.non_null('ReactionContent'), graphql_name='content')
+        created_at = sgqlc.types.Field('DateTime', graphql_name='createdAt')
+        reactors = sgqlc.types.Field(sgqlc.types.non_null('ReactorConnection'), graphql_name='reactors', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        subject = sgqlc.types.Field(sgqlc.types.non_null('Reactable'), graphql_name='subject')
+        viewer_has_reacted = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerHasReacted')
+    return ReactionGroup
+
+
+def ReactorEdge():
+    class ReactorEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node', 'reacted_at')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field(sgqlc.types.non_null('Reactor'), graphql_name='node')
+        reacted_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='reactedAt')
+    return ReactorEdge
+
+
+def RefEdge():
+    class RefEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Ref', graphql_name='node')
+    return RefEdge
+
+
+def RefNameConditionTarget():
+    class RefNameConditionTarget(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('exclude', 'include')
+        exclude = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='exclude')
+        include = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='include')
+    return RefNameConditionTarget
+
+
+def RefUpdateRule():
+    class RefUpdateRule(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('allows_deletions', 'allows_force_pushes', 'blocks_creations', 'pattern', 'required_approving_review_count', 'required_status_check_contexts', 'requires_code_owner_reviews', 'requires_conversation_resolution', 'requires_linear_history', 'requires_signatures', 'viewer_allowed_to_dismiss_reviews', 'viewer_can_push')
+        allows_deletions = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='allowsDeletions')
+        allows_force_pushes = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='allowsForcePushes')
+        blocks_creations = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='blocksCreations')
+        pattern = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='pattern')
+        required_approving_review_count = sgqlc.types.Field('Int', graphql_name='requiredApprovingReviewCount')
+        required_status_check_contexts = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='requiredStatusCheckContexts')
+        requires_code_owner_reviews = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requiresCodeOwnerReviews')
+        requires_conversation_resolution = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requiresConversationResolution')
+        requires_linear_history = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requiresLinearHistory')
+        requires_signatures = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requiresSignatures')
+        viewer_allowed_to_dismiss_reviews = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerAllowedToDismissReviews')
+        viewer_can_push = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanPush')
+    return RefUpdateRule
+
+
+def RegenerateEnterpriseIdentityProviderRecoveryCodesPayload():
+    class RegenerateEnterpriseIdentityProviderRecoveryCodesPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'identity_provider')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        identity_provider = sgqlc.types.Field('EnterpriseIdentityProvider', graphql_name='identityProvider')
+    return RegenerateEnterpriseIdentityProviderRecoveryCodesPayload
+
+
+def RegenerateVerifiableDomainTokenPayload():
+    class RegenerateVerifiableDomainTokenPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'verification_token')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        verification_token = sgqlc.types.Field('String', graphql_name='verificationToken')
+    return RegenerateVerifiableDomainTokenPayload
+
+
+def RejectDeploymentsPayload():
+    class RejectDeploymentsPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'deployments')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        deployments = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('Deployment')), graphql_name='deployments')
+    return RejectDeploymentsPayload
+
+
+def ReleaseAssetEdge():
+    class ReleaseAssetEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ReleaseAsset', graphql_name='node')
+    return ReleaseAssetEdge
+
+
+def ReleaseEdge():
+    class ReleaseEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Release', graphql_name='node')
+    return ReleaseEdge
+
+
+def RemoveAssigneesFromAssignablePayload():
+    class RemoveAssigneesFromAssignablePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('assignable', 'client_mutation_id')
+        assignable = sgqlc.types.Field('Assignable', graphql_name='assignable')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RemoveAssigneesFromAssignablePayload
+
+
+def RemoveEnterpriseAdminPayload():
+    class RemoveEnterpriseAdminPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('admin', 'client_mutation_id', 'enterprise', 'message', 'viewer')
+        admin = sgqlc.types.Field('User', graphql_name='admin')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+        viewer = sgqlc.types.Field('User', graphql_name='viewer')
+    return RemoveEnterpriseAdminPayload
+
+
+def RemoveEnterpriseIdentityProviderPayload():
+    class RemoveEnterpriseIdentityProviderPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'identity_provider')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        identity_provider = sgqlc.types.Field('EnterpriseIdentityProvider', graphql_name='identityProvider')
+    return RemoveEnterpriseIdentityProviderPayload
+
+
+def RemoveEnterpriseMemberPayload():
+    class RemoveEnterpriseMemberPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'user', 'viewer')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        user = sgqlc.types.Field('User', graphql_name='user')
+        viewer = sgqlc.types.Field('User', graphql_name='viewer')
+    return RemoveEnterpriseMemberPayload
+
+
+def RemoveEnterpriseOrganizationPayload():
+    class RemoveEnterpriseOrganizationPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'organization', 'viewer')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        organization = sgqlc.types.Field('Organization', graphql_name='organization')
+        viewer = sgqlc.types.Field('User', graphql_name='viewer')
+    return RemoveEnterpriseOrganizationPayload
+
+
+def RemoveEnterpriseSupportEntitlementPayload():
+    class RemoveEnterpriseSupportEntitlementPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return RemoveEnterpriseSupportEntitlementPayload
+
+
+def RemoveLabelsFromLabelablePayload():
+    class RemoveLabelsFromLabelablePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'labelable')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        labelable = sgqlc.types.Field('Labelable', graphql_name='labelable')
+    return RemoveLabelsFromLabelablePayload
+
+
+def RemoveOutsideCollaboratorPayload():
+    class RemoveOutsideCollaboratorPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'removed_user')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        removed_user = sgqlc.types.Field('User', graphql_name='removedUser')
+    return RemoveOutsideCollaboratorPayload
+
+
+def RemoveReactionPayload():
+    class RemoveReactionPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'reaction', 'reaction_groups', 'subject')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        reaction = sgqlc.types.Field('Reaction', graphql_name='reaction')
+        reaction_groups = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('ReactionGroup')), graphql_name='reactionGroups')
+        subject = sgqlc.types.Field('Reactable', graphql_name='subject')
+    return RemoveReactionPayload
+
+
+def RemoveStarPayload():
+    class RemoveStarPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'starrable')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        starrable = sgqlc.types.Field('Starrable', graphql_name='starrable')
+    return RemoveStarPayload
+
+
+def RemoveUpvotePayload():
+    class RemoveUpvotePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'subject')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        subject = sgqlc.types.Field('Votable', graphql_name='subject')
+    return RemoveUpvotePayload
+
+
+def ReopenDiscussionPayload():
+    class ReopenDiscussionPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'discussion')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        discussion = sgqlc.types.Field('Discussion', graphql_name='discussion')
+    return ReopenDiscussionPayload
+
+
+def ReopenIssuePayload():
+    class ReopenIssuePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'issue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        issue = sgqlc.types.Field('Issue', graphql_name='issue')
+    return ReopenIssuePayload
+
+
+def ReopenPullRequestPayload():
+    class ReopenPullRequestPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return ReopenPullRequestPayload
+
+
+def RepositoryCodeowners():
+    class RepositoryCodeowners(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('errors',)
+        errors = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('RepositoryCodeownersError'))), graphql_name='errors')
+    return RepositoryCodeowners
+
+
+def RepositoryCodeownersError():
+    class RepositoryCodeownersError(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('column', 'kind', 'line', 'message', 'path', 'source', 'suggestion')
+        column = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='column')
+        kind = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='kind')
+        line = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='line')
+        message = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='message')
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+        source = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='source')
+        suggestion = sgqlc.types.Field('String', graphql_name='suggestion')
+    return RepositoryCodeownersError
+
+
+def RepositoryCollaboratorEdge():
+    class RepositoryCollaboratorEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node', 'permission', 'permission_sources')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field(sgqlc.types.non_null('User'), graphql_name='node')
+        permission = sgqlc.types.Field(sgqlc.types.non_null('RepositoryPermission'), graphql_name='permission')
+        permission_sources = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('PermissionSource')), graphql_name='permissionSources')
+    return RepositoryCollaboratorEdge
+
+
+def RepositoryContactLink():
+    class RepositoryContactLink(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('about', 'name', 'url')
+        about = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='about')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return RepositoryContactLink
+
+
+def RepositoryEdge():
+    class RepositoryEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Repository', graphql_name='node')
+    return RepositoryEdge
+
+
+def RepositoryInteractionAbility():
+    class RepositoryInteractionAbility(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('expires_at', 'limit', 'origin')
+        expires_at = sgqlc.types.Field('DateTime', graphql_name='expiresAt')
+        limit = sgqlc.types.Field(sgqlc.types.non_null('RepositoryInteractionLimit'), graphql_name='limit')
+        origin = sgqlc.types.Field(sgqlc.types.non_null('RepositoryInteractionLimitOrigin'), graphql_name='origin')
+    return RepositoryInteractionAbility
+
+
+def RepositoryInvitationEdge():
+    class RepositoryInvitationEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('RepositoryInvitation', graphql_name='node')
+    return RepositoryInvitationEdge
+
+
+def RepositoryMigrationEdge():
+    class RepositoryMigrationEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('RepositoryMigration', graphql_name='node')
+    return RepositoryMigrationEdge
+
+
+def RepositoryNameConditionTarget():
+    class RepositoryNameConditionTarget(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('exclude', 'include', 'protected')
+        exclude = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='exclude')
+        include = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='include')
+        protected = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='protected')
+    return RepositoryNameConditionTarget
+
+
+def RepositoryRuleConditions():
+    class RepositoryRuleConditions(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('ref_name', 'repository_name')
+        ref_name = sgqlc.types.Field('RefNameConditionTarget', graphql_name='refName')
+        repository_name = sgqlc.types.Field('RepositoryNameConditionTarget', graphql_name='repositoryName')
+    return RepositoryRuleConditions
+
+
+def RepositoryRuleEdge():
+    class RepositoryRuleEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('RepositoryRule', graphql_name='node')
+    return RepositoryRuleEdge
+
+
+def RepositoryRulesetBypassActorEdge():
+    class RepositoryRulesetBypassActorEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('RepositoryRulesetBypassActor', graphql_name='node')
+    return RepositoryRulesetBypassActorEdge
+
+
+def RepositoryRulesetEdge():
+    class RepositoryRulesetEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('RepositoryRuleset', graphql_name='node')
+    return RepositoryRulesetEdge
+
+
+def RepositoryTopicEdge():
+    class RepositoryTopicEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('RepositoryTopic', graphql_name='node')
+    return RepositoryTopicEdge
+
+
+def RepositoryVulnerabilityAlertEdge():
+    class RepositoryVulnerabilityAlertEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('RepositoryVulnerabilityAlert', graphql_name='node')
+    return RepositoryVulnerabilityAlertEdge
+
+
+def RequestReviewsPayload():
+    class RequestReviewsPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'client_mutation_id', 'pull_request', 'requested_reviewers_edge')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+        requested_reviewers_edge = sgqlc.types.Field('UserEdge', graphql_name='requestedReviewersEdge')
+    return RequestReviewsPayload
+
+
+def RequestedReviewerEdge():
+    class RequestedReviewerEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('RequestedReviewer', graphql_name='node')
+    return RequestedReviewerEdge
+
+
+def RequiredDeploymentsParameters():
+    class RequiredDeploymentsParameters(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('required_deployment_environments',)
+        required_deployment_environments = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='requiredDeploymentEnvironments')
+    return RequiredDeploymentsParameters
+
+
+def RequiredStatusCheckDescription():
+    class RequiredStatusCheckDescription(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('app', 'context')
+        app = sgqlc.types.Field('App', graphql_name='app')
+        context = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='context')
+    return RequiredStatusCheckDescription
+
+
+def RequiredStatusChecksParameters():
+    class RequiredStatusChecksParameters(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('required_status_checks', 'strict_required_status_checks_policy')
+        required_status_checks = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('StatusCheckConfiguration'))), graphql_name='requiredStatusChecks')
+        strict_required_status_checks_policy = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='strictRequiredStatusChecksPolicy')
+    return RequiredStatusChecksParameters
+
+
+def RerequestCheckSuitePayload():
+    class RerequestCheckSuitePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('check_suite', 'client_mutation_id')
+        check_suite = sgqlc.types.Field('CheckSuite', graphql_name='checkSuite')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return RerequestCheckSuitePayload
+
+
+def ResolveReviewThreadPayload():
+    class ResolveReviewThreadPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'thread')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        thread = sgqlc.types.Field('PullRequestReviewThread', graphql_name='thread')
+    return ResolveReviewThreadPayload
+
+
+def RetireSponsorsTierPayload():
+    class RetireSponsorsTierPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'sponsors_tier')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        sponsors_tier = sgqlc.types.Field('SponsorsTier', graphql_name='sponsorsTier')
+    return RetireSponsorsTierPayload
+
+
+def RevertPullRequestPayload():
+    class RevertPullRequestPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request', 'revert_pull_request')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+        revert_pull_request = sgqlc.types.Field('PullRequest', graphql_name='revertPullRequest')
+    return RevertPullRequestPayload
+
+
+def ReviewDismissalAllowanceEdge():
+    class ReviewDismissalAllowanceEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ReviewDismissalAllowance', graphql_name='node')
+    return ReviewDismissalAllowanceEdge
+
+
+def ReviewRequestEdge():
+    class ReviewRequestEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('ReviewRequest', graphql_name='node')
+    return ReviewRequestEdge
+
+
+def RevokeEnterpriseOrganizationsMigratorRolePayload():
+    class RevokeEnterpriseOrganizationsMigratorRolePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'organizations')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        organizations = sgqlc.types.Field('OrganizationConnection', graphql_name='organizations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return RevokeEnterpriseOrganizationsMigratorRolePayload
+
+
+def RevokeMigratorRolePayload():
+    class RevokeMigratorRolePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'success')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        success = sgqlc.types.Field('Boolean', graphql_name='success')
+    return RevokeMigratorRolePayload
+
+
+def SavedReplyEdge():
+    class SavedReplyEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('SavedReply', graphql_name='node')
+    return SavedReplyEdge
+
+
+def SearchResultItemEdge():
+    class SearchResultItemEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node', 'text_matches')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('SearchResultItem', graphql_name='node')
+        text_matches = sgqlc.types.Field(sgqlc.types.list_of('TextMatch'), graphql_name='textMatches')
+    return SearchResultItemEdge
+
+
+def SecurityAdvisoryEdge():
+    class SecurityAdvisoryEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('SecurityAdvisory', graphql_name='node')
+    return SecurityAdvisoryEdge
+
+
+def SecurityAdvisoryIdentifier():
+    class SecurityAdvisoryIdentifier(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('type', 'value')
+        type = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='type')
+        value = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='value')
+    return SecurityAdvisoryIdentifier
+
+
+def SecurityAdvisoryPackage():
+    class SecurityAdvisoryPackage(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('ecosystem', 'name')
+        ecosystem = sgqlc.types.Field(sgqlc.types.non_null('SecurityAdvisoryEcosystem'), graphql_name='ecosystem')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+    return SecurityAdvisoryPackage
+
+
+def SecurityAdvisoryPackageVersion():
+    class SecurityAdvisoryPackageVersion(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('identifier',)
+        identifier = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='identifier')
+    return SecurityAdvisoryPackageVersion
+
+
+def SecurityAdvisoryReference():
+    class SecurityAdvisoryReference(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('url',)
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return SecurityAdvisoryReference
+
+
+def SecurityVulnerability():
+    class SecurityVulnerability(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('advisory', 'first_patched_version', 'package', 'severity', 'updated_at', 'vulnerable_version_range')
+        advisory = sgqlc.types.Field(sgqlc.types.non_null('SecurityAdvisory'), graphql_name='advisory')
+        first_patched_version = sgqlc.types.Field('SecurityAdvisoryPackageVersion', graphql_name='firstPatchedVersion')
+        package = sgqlc.types.Field(sgqlc.types.non_null('SecurityAdvisoryPackage'), graphql_name='package')
+        severity = sgqlc.types.Field(sgqlc.types.non_null('SecurityAdvisorySeverity'), graphql_name='severity')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        vulnerable_version_range = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vulnerableVersionRange')
+    return SecurityVulnerability
+
+
+def SecurityVulnerabilityEdge():
+    class SecurityVulnerabilityEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('SecurityVulnerability', graphql_name='node')
+    return SecurityVulnerabilityEdge
+
+
+def SetEnterpriseIdentityProviderPayload():
+    class SetEnterpriseIdentityProviderPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'identity_provider')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        identity_provider = sgqlc.types.Field('EnterpriseIdentityProvider', graphql_name='identityProvider')
+    return SetEnterpriseIdentityProviderPayload
+
+
+def SetOrganizationInteractionLimitPayload():
+    class SetOrganizationInteractionLimitPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'organization')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        organization = sgqlc.types.Field('Organization', graphql_name='organization')
+    return SetOrganizationInteractionLimitPayload
+
+
+def SetRepositoryInteractionLimitPayload():
+    class SetRepositoryInteractionLimitPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'repository')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return SetRepositoryInteractionLimitPayload
+
+
+def SetUserInteractionLimitPayload():
+    class SetUserInteractionLimitPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'user')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        user = sgqlc.types.Field('User', graphql_name='user')
+    return SetUserInteractionLimitPayload
+
+
+def SocialAccount():
+    class SocialAccount(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('display_name', 'provider', 'url')
+        display_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='displayName')
+        provider = sgqlc.types.Field(sgqlc.types.non_null('SocialAccountProvider'), graphql_name='provider')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return SocialAccount
+
+
+def SocialAccountEdge():
+    class SocialAccountEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('SocialAccount', graphql_name='node')
+    return SocialAccountEdge
+
+
+def SponsorEdge():
+    class SponsorEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Sponsor', graphql_name='node')
+    return SponsorEdge
+
+
+def SponsorableItemEdge():
+    class SponsorableItemEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('SponsorableItem', graphql_name='node')
+    return SponsorableItemEdge
+
+
+def SponsorsActivityEdge():
+    class SponsorsActivityEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('SponsorsActivity', graphql_name='node')
+    return SponsorsActivityEdge
+
+
+def SponsorsGoal():
+    class SponsorsGoal(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('description', 'kind', 'percent_complete', 'target_value', 'title')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        kind = sgqlc.types.Field(sgqlc.types.non_null('SponsorsGoalKind'), graphql_name='kind')
+        percent_complete = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='percentComplete')
+        target_value = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='targetValue')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+    return SponsorsGoal
+
+
+def SponsorsTierAdminInfo():
+    class SponsorsTierAdminInfo(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('is_draft', 'is_published', 'is_retired', 'sponsorships')
+        is_draft = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isDraft')
+        is_published = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isPublished')
+        is_retired = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isRetired')
+        sponsorships = sgqlc.types.Field(sgqlc.types.non_null('SponsorshipConnection'), graphql_name='sponsorships', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('include_private', sgqlc.types.Arg(github_schema.Boolean, graphql_name='includePrivate', default=False)), ('order_by', sgqlc.types.Arg('SponsorshipOrder', graphql_name='orderBy', default=None)))))
+    return SponsorsTierAdminInfo
+
+
+def SponsorsTierEdge():
+    class SponsorsTierEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('SponsorsTier', graphql_name='node')
+    return SponsorsTierEdge
+
+
+def SponsorshipEdge():
+    class SponsorshipEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Sponsorship', graphql_name='node')
+    return SponsorshipEdge
+
+
+def SponsorshipNewsletterEdge():
+    class SponsorshipNewsletterEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('SponsorshipNewsletter', graphql_name='node')
+    return SponsorshipNewsletterEdge
+
+
+def StargazerEdge():
+    class StargazerEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node', 'starred_at')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field(sgqlc.types.non_null('User'), graphql_name='node')
+        starred_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='starredAt')
+    return StargazerEdge
+
+
+def StarredRepositoryEdge():
+    class StarredRepositoryEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node', 'starred_at')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='node')
+        starred_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='starredAt')
+    return StarredRepositoryEdge
+
+
+def StartOrganizationMigrationPayload():
+    class StartOrganizationMigrationPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'org_migration')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        org_migration = sgqlc.types.Field('OrganizationMigration', graphql_name='orgMigration')
+    return StartOrganizationMigrationPayload
+
+
+def StartRepositoryMigrationPayload():
+    class StartRepositoryMigrationPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'repository_migration')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        repository_migration = sgqlc.types.Field('RepositoryMigration', graphql_name='repositoryMigration')
+    return StartRepositoryMigrationPayload
+
+
+def StatusCheckConfiguration():
+    class StatusCheckConfiguration(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('context', 'integration_id')
+        context = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='context')
+        integration_id = sgqlc.types.Field('Int', graphql_name='integrationId')
+    return StatusCheckConfiguration
+
+
+def StatusCheckRollupContextEdge():
+    class StatusCheckRollupContextEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('StatusCheckRollupContext', graphql_name='node')
+    return StatusCheckRollupContextEdge
+
+
+def StatusContextStateCount():
+    class StatusContextStateCount(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('count', 'state')
+        count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='count')
+        state = sgqlc.types.Field(sgqlc.types.non_null('StatusState'), graphql_name='state')
+    return StatusContextStateCount
+
+
+def StripeConnectAccount():
+    class StripeConnectAccount(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('account_id', 'billing_country_or_region', 'country_or_region', 'is_active', 'sponsors_listing', 'stripe_dashboard_url')
+        account_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='accountId')
+        billing_country_or_region = sgqlc.types.Field('String', graphql_name='billingCountryOrRegion')
+        country_or_region = sgqlc.types.Field('String', graphql_name='countryOrRegion')
+        is_active = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isActive')
+        sponsors_listing = sgqlc.types.Field(sgqlc.types.non_null('SponsorsListing'), graphql_name='sponsorsListing')
+        stripe_dashboard_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='stripeDashboardUrl')
+    return StripeConnectAccount
+
+
+def SubmitPullRequestReviewPayload():
+    class SubmitPullRequestReviewPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request_review')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request_review = sgqlc.types.Field('PullRequestReview', graphql_name='pullRequestReview')
+    return SubmitPullRequestReviewPayload
+
+
+def Submodule():
+    class Submodule(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('branch', 'git_url', 'name', 'name_raw', 'path', 'path_raw', 'subproject_commit_oid')
+        branch = sgqlc.types.Field('String', graphql_name='branch')
+        git_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='gitUrl')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        name_raw = sgqlc.types.Field(sgqlc.types.non_null('Base64String'), graphql_name='nameRaw')
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+        path_raw = sgqlc.types.Field(sgqlc.types.non_null('Base64String'), graphql_name='pathRaw')
+        subproject_commit_oid = sgqlc.types.Field('GitObjectID', graphql_name='subprojectCommitOid')
+    return Submodule
+
+
+def SubmoduleEdge():
+    class SubmoduleEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Submodule', graphql_name='node')
+    return SubmoduleEdge
+
+
+def SuggestedReviewer():
+    class SuggestedReviewer(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('is_author', 'is_commenter', 'reviewer')
+        is_author = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isAuthor')
+        is_commenter = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isCommenter')
+        reviewer = sgqlc.types.Field(sgqlc.types.non_null('User'), graphql_name='reviewer')
+    return SuggestedReviewer
+
+
+def TagNamePatternParameters():
+    class TagNamePatternParameters(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'negate', 'operator', 'pattern')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        negate = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='negate')
+        operator = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='operator')
+        pattern = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='pattern')
+    return TagNamePatternParameters
+
+
+def TeamDiscussionCommentEdge():
+    class TeamDiscussionCommentEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('TeamDiscussionComment', graphql_name='node')
+    return TeamDiscussionCommentEdge
+
+
+def TeamDiscussionEdge():
+    class TeamDiscussionEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('TeamDiscussion', graphql_name='node')
+    return TeamDiscussionEdge
+
+
+def TeamEdge():
+    class TeamEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('Team', graphql_name='node')
+    return TeamEdge
+
+
+def TeamMemberEdge():
+    class TeamMemberEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'member_access_resource_path', 'member_access_url', 'node', 'role')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        member_access_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='memberAccessResourcePath')
+        member_access_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='memberAccessUrl')
+        node = sgqlc.types.Field(sgqlc.types.non_null('User'), graphql_name='node')
+        role = sgqlc.types.Field(sgqlc.types.non_null('TeamMemberRole'), graphql_name='role')
+    return TeamMemberEdge
+
+
+def TeamRepositoryEdge():
+    class TeamRepositoryEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node', 'permission')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='node')
+        permission = sgqlc.types.Field(sgqlc.types.non_null('RepositoryPermission'), graphql_name='permission')
+    return TeamRepositoryEdge
+
+
+def TextMatch():
+    class TextMatch(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('fragment', 'highlights', 'property')
+        fragment = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='fragment')
+        highlights = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TextMatchHighlight'))), graphql_name='highlights')
+        property = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='property')
+    return TextMatch
+
+
+def TextMatchHighlight():
+    class TextMatchHighlight(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('begin_indice', 'end_indice', 'text')
+        begin_indice = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='beginIndice')
+        end_indice = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='endIndice')
+        text = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='text')
+    return TextMatchHighlight
+
+
+def TransferEnterpriseOrganizationPayload():
+    class TransferEnterpriseOrganizationPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'organization')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        organization = sgqlc.types.Field('Organization', graphql_name='organization')
+    return TransferEnterpriseOrganizationPayload
+
+
+def TransferIssuePayload():
+    class TransferIssuePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'issue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        issue = sgqlc.types.Field('Issue', graphql_name='issue')
+    return TransferIssuePayload
+
+
+def TreeEntry():
+    class TreeEntry(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('extension', 'is_generated', 'language', 'line_count', 'mode', 'name', 'name_raw', 'object', 'oid', 'path', 'path_raw', 'repository', 'size', 'submodule', 'type')
+        extension = sgqlc.types.Field('String', graphql_name='extension')
+        is_generated = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isGenerated')
+        language = sgqlc.types.Field('Language', graphql_name='language')
+        line_count = sgqlc.types.Field('Int', graphql_name='lineCount')
+        mode = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='mode')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        name_raw = sgqlc.types.Field(sgqlc.types.non_null('Base64String'), graphql_name='nameRaw')
+        object = sgqlc.types.Field('GitObject', graphql_name='object')
+        oid = sgqlc.types.Field(sgqlc.types.non_null('GitObjectID'), graphql_name='oid')
+        path = sgqlc.types.Field('String', graphql_name='path')
+        path_raw = sgqlc.types.Field('Base64String', graphql_name='pathRaw')
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+        size = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='size')
+        submodule = sgqlc.types.Field('Submodule', graphql_name='submodule')
+        type = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='type')
+    return TreeEntry
+
+
+def UnarchiveProjectV2ItemPayload():
+    class UnarchiveProjectV2ItemPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'item')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        item = sgqlc.types.Field('ProjectV2Item', graphql_name='item')
+    return UnarchiveProjectV2ItemPayload
+
+
+def UnarchiveRepositoryPayload():
+    class UnarchiveRepositoryPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'repository')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return UnarchiveRepositoryPayload
+
+
+def UnfollowOrganizationPayload():
+    class UnfollowOrganizationPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'organization')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        organization = sgqlc.types.Field('Organization', graphql_name='organization')
+    return UnfollowOrganizationPayload
+
+
+def UnfollowUserPayload():
+    class UnfollowUserPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'user')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        user = sgqlc.types.Field('User', graphql_name='user')
+    return UnfollowUserPayload
+
+
+def UnlinkProjectV2FromRepositoryPayload():
+    class UnlinkProjectV2FromRepositoryPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'repository')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return UnlinkProjectV2FromRepositoryPayload
+
+
+def UnlinkProjectV2FromTeamPayload():
+    class UnlinkProjectV2FromTeamPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'team')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        team = sgqlc.types.Field('Team', graphql_name='team')
+    return UnlinkProjectV2FromTeamPayload
+
+
+def UnlinkRepositoryFromProjectPayload():
+    class UnlinkRepositoryFromProjectPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project', 'repository')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project = sgqlc.types.Field('Project', graphql_name='project')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return UnlinkRepositoryFromProjectPayload
+
+
+def UnlockLockablePayload():
+    class UnlockLockablePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'client_mutation_id', 'unlocked_record')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        unlocked_record = sgqlc.types.Field('Lockable', graphql_name='unlockedRecord')
+    return UnlockLockablePayload
+
+
+def UnmarkDiscussionCommentAsAnswerPayload():
+    class UnmarkDiscussionCommentAsAnswerPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'discussion')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        discussion = sgqlc.types.Field('Discussion', graphql_name='discussion')
+    return UnmarkDiscussionCommentAsAnswerPayload
+
+
+def UnmarkFileAsViewedPayload():
+    class UnmarkFileAsViewedPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return UnmarkFileAsViewedPayload
+
+
+def UnmarkIssueAsDuplicatePayload():
+    class UnmarkIssueAsDuplicatePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'duplicate')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        duplicate = sgqlc.types.Field('IssueOrPullRequest', graphql_name='duplicate')
+    return UnmarkIssueAsDuplicatePayload
+
+
+def UnmarkProjectV2AsTemplatePayload():
+    class UnmarkProjectV2AsTemplatePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project_v2')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_v2 = sgqlc.types.Field('ProjectV2', graphql_name='projectV2')
+    return UnmarkProjectV2AsTemplatePayload
+
+
+def UnminimizeCommentPayload():
+    class UnminimizeCommentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'unminimized_comment')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        unminimized_comment = sgqlc.types.Field('Minimizable', graphql_name='unminimizedComment')
+    return UnminimizeCommentPayload
+
+
+def UnpinIssuePayload():
+    class UnpinIssuePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'issue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        issue = sgqlc.types.Field('Issue', graphql_name='issue')
+    return UnpinIssuePayload
+
+
+def UnresolveReviewThreadPayload():
+    class UnresolveReviewThreadPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'thread')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        thread = sgqlc.types.Field('PullRequestReviewThread', graphql_name='thread')
+    return UnresolveReviewThreadPayload
+
+
+def UpdateBranchProtectionRulePayload():
+    class UpdateBranchProtectionRulePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('branch_protection_rule', 'client_mutation_id')
+        branch_protection_rule = sgqlc.types.Field('BranchProtectionRule', graphql_name='branchProtectionRule')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateBranchProtectionRulePayload
+
+
+def UpdateCheckRunPayload():
+    class UpdateCheckRunPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('check_run', 'client_mutation_id')
+        check_run = sgqlc.types.Field('CheckRun', graphql_name='checkRun')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+    return UpdateCheckRunPayload
+
+
+def UpdateCheckSuitePreferencesPayload():
+    class UpdateCheckSuitePreferencesPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'repository')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return UpdateCheckSuitePreferencesPayload
+
+
+def UpdateDiscussionCommentPayload():
+    class UpdateDiscussionCommentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'comment')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        comment = sgqlc.types.Field('DiscussionComment', graphql_name='comment')
+    return UpdateDiscussionCommentPayload
+
+
+def UpdateDiscussionPayload():
+    class UpdateDiscussionPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'discussion')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        discussion = sgqlc.types.Field('Discussion', graphql_name='discussion')
+    return UpdateDiscussionPayload
+
+
+def UpdateEnterpriseAdministratorRolePayload():
+    class UpdateEnterpriseAdministratorRolePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseAdministratorRolePayload
+
+
+def UpdateEnterpriseAllowPrivateRepositoryForkingSettingPayload():
+    class UpdateEnterpriseAllowPrivateRepositoryForkingSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseAllowPrivateRepositoryForkingSettingPayload
+
+
+def UpdateEnterpriseDefaultRepositoryPermissionSettingPayload():
+    class UpdateEnterpriseDefaultRepositoryPermissionSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseDefaultRepositoryPermissionSettingPayload
+
+
+def UpdateEnterpriseMembersCanChangeRepositoryVisibilitySettingPayload():
+    class UpdateEnterpriseMembersCanChangeRepositoryVisibilitySettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseMembersCanChangeRepositoryVisibilitySettingPayload
+
+
+def UpdateEnterpriseMembersCanCreateRepositoriesSettingPayload():
+    class UpdateEnterpriseMembersCanCreateRepositoriesSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseMembersCanCreateRepositoriesSettingPayload
+
+
+def UpdateEnterpriseMembersCanDeleteIssuesSettingPayload():
+    class UpdateEnterpriseMembersCanDeleteIssuesSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseMembersCanDeleteIssuesSettingPayload
+
+
+def UpdateEnterpriseMembersCanDeleteRepositoriesSettingPayload():
+    class UpdateEnterpriseMembersCanDeleteRepositoriesSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseMembersCanDeleteRepositoriesSettingPayload
+
+
+def UpdateEnterpriseMembersCanInviteCollaboratorsSettingPayload():
+    class UpdateEnterpriseMembersCanInviteCollaboratorsSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseMembersCanInviteCollaboratorsSettingPayload
+
+
+def UpdateEnterpriseMembersCanMakePurchasesSettingPayload():
+    class UpdateEnterpriseMembersCanMakePurchasesSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseMembersCanMakePurchasesSettingPayload
+
+
+def UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingPayload():
+    class UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingPayload
+
+
+def UpdateEnterpriseMembersCanViewDependencyInsightsSettingPayload():
+    class UpdateEnterpriseMembersCanViewDependencyInsightsSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseMembersCanViewDependencyInsightsSettingPayload
+
+
+def UpdateEnterpriseOrganizationProjectsSettingPayload():
+    class UpdateEnterpriseOrganizationProjectsSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseOrganizationProjectsSettingPayload
+
+
+def UpdateEnterpriseOwnerOrganizationRolePayload():
+    class UpdateEnterpriseOwnerOrganizationRolePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseOwnerOrganizationRolePayload
+
+
+def UpdateEnterpriseProfilePayload():
+    class UpdateEnterpriseProfilePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+    return UpdateEnterpriseProfilePayload
+
+
+def UpdateEnterpriseRepositoryProjectsSettingPayload():
+    class UpdateEnterpriseRepositoryProjectsSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseRepositoryProjectsSettingPayload
+
+
+def UpdateEnterpriseTeamDiscussionsSettingPayload():
+    class UpdateEnterpriseTeamDiscussionsSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseTeamDiscussionsSettingPayload
+
+
+def UpdateEnterpriseTwoFactorAuthenticationRequiredSettingPayload():
+    class UpdateEnterpriseTwoFactorAuthenticationRequiredSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'enterprise', 'message')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        message = sgqlc.types.Field('String', graphql_name='message')
+    return UpdateEnterpriseTwoFactorAuthenticationRequiredSettingPayload
+
+
+def UpdateEnvironmentPayload():
+    class UpdateEnvironmentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'environment')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        environment = sgqlc.types.Field('Environment', graphql_name='environment')
+    return UpdateEnvironmentPayload
+
+
+def UpdateIpAllowListEnabledSettingPayload():
+    class UpdateIpAllowListEnabledSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'owner')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        owner = sgqlc.types.Field('IpAllowListOwner', graphql_name='owner')
+    return UpdateIpAllowListEnabledSettingPayload
+
+
+def UpdateIpAllowListEntryPayload():
+    class UpdateIpAllowListEntryPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'ip_allow_list_entry')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        ip_allow_list_entry = sgqlc.types.Field('IpAllowListEntry', graphql_name='ipAllowListEntry')
+    return UpdateIpAllowListEntryPayload
+
+
+def UpdateIpAllowListForInstalledAppsEnabledSettingPayload():
+    class UpdateIpAllowListForInstalledAppsEnabledSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'owner')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        owner = sgqlc.types.Field('IpAllowListOwner', graphql_name='owner')
+    return UpdateIpAllowListForInstalledAppsEnabledSettingPayload
+
+
+def UpdateIssueCommentPayload():
+    class UpdateIssueCommentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'issue_comment')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        issue_comment = sgqlc.types.Field('IssueComment', graphql_name='issueComment')
+    return UpdateIssueCommentPayload
+
+
+def UpdateIssuePayload():
+    class UpdateIssuePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'client_mutation_id', 'issue')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        issue = sgqlc.types.Field('Issue', graphql_name='issue')
+    return UpdateIssuePayload
+
+
+def UpdateNotificationRestrictionSettingPayload():
+    class UpdateNotificationRestrictionSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'owner')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        owner = sgqlc.types.Field('VerifiableDomainOwner', graphql_name='owner')
+    return UpdateNotificationRestrictionSettingPayload
+
+
+def UpdateOrganizationAllowPrivateRepositoryForkingSettingPayload():
+    class UpdateOrganizationAllowPrivateRepositoryForkingSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'message', 'organization')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        message = sgqlc.types.Field('String', graphql_name='message')
+        organization = sgqlc.types.Field('Organization', graphql_name='organization')
+    return UpdateOrganizationAllowPrivateRepositoryForkingSettingPayload
+
+
+def UpdateOrganizationWebCommitSignoffSettingPayload():
+    class UpdateOrganizationWebCommitSignoffSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'message', 'organization')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        message = sgqlc.types.Field('String', graphql_name='message')
+        organization = sgqlc.types.Field('Organization', graphql_name='organization')
+    return UpdateOrganizationWebCommitSignoffSettingPayload
+
+
+def UpdateParameters():
+    class UpdateParameters(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('update_allows_fetch_and_merge',)
+        update_allows_fetch_and_merge = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='updateAllowsFetchAndMerge')
+    return UpdateParameters
+
+
+def UpdateProjectCardPayload():
+    class UpdateProjectCardPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project_card')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_card = sgqlc.types.Field('ProjectCard', graphql_name='projectCard')
+    return UpdateProjectCardPayload
+
+
+def UpdateProjectColumnPayload():
+    class UpdateProjectColumnPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project_column')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_column = sgqlc.types.Field('ProjectColumn', graphql_name='projectColumn')
+    return UpdateProjectColumnPayload
+
+
+def UpdateProjectPayload():
+    class UpdateProjectPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project = sgqlc.types.Field('Project', graphql_name='project')
+    return UpdateProjectPayload
+
+
+def UpdateProjectV2CollaboratorsPayload():
+    class UpdateProjectV2CollaboratorsPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'collaborators')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        collaborators = sgqlc.types.Field('ProjectV2ActorConnection', graphql_name='collaborators', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return UpdateProjectV2CollaboratorsPayload
+
+
+def UpdateProjectV2DraftIssuePayload():
+    class UpdateProjectV2DraftIssuePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'draft_issue')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        draft_issue = sgqlc.types.Field('DraftIssue', graphql_name='draftIssue')
+    return UpdateProjectV2DraftIssuePayload
+
+
+def UpdateProjectV2ItemFieldValuePayload():
+    class UpdateProjectV2ItemFieldValuePayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project_v2_item')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_v2_item = sgqlc.types.Field('ProjectV2Item', graphql_name='projectV2Item')
+    return UpdateProjectV2ItemFieldValuePayload
+
+
+def UpdateProjectV2ItemPositionPayload():
+    class UpdateProjectV2ItemPositionPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'items')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        items = sgqlc.types.Field('ProjectV2ItemConnection', graphql_name='items', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return UpdateProjectV2ItemPositionPayload
+
+
+def UpdateProjectV2Payload():
+    class UpdateProjectV2Payload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'project_v2')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        project_v2 = sgqlc.types.Field('ProjectV2', graphql_name='projectV2')
+    return UpdateProjectV2Payload
+
+
+def UpdatePullRequestBranchPayload():
+    class UpdatePullRequestBranchPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return UpdatePullRequestBranchPayload
+
+
+def UpdatePullRequestPayload():
+    class UpdatePullRequestPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'client_mutation_id', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return UpdatePullRequestPayload
+
+
+def UpdatePullRequestReviewCommentPayload():
+    class UpdatePullRequestReviewCommentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request_review_comment')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request_review_comment = sgqlc.types.Field('PullRequestReviewComment', graphql_name='pullRequestReviewComment')
+    return UpdatePullRequestReviewCommentPayload
+
+
+def UpdatePullRequestReviewPayload():
+    class UpdatePullRequestReviewPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'pull_request_review')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        pull_request_review = sgqlc.types.Field('PullRequestReview', graphql_name='pullRequestReview')
+    return UpdatePullRequestReviewPayload
+
+
+def UpdateRefPayload():
+    class UpdateRefPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'ref')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        ref = sgqlc.types.Field('Ref', graphql_name='ref')
+    return UpdateRefPayload
+
+
+def UpdateRepositoryPayload():
+    class UpdateRepositoryPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'repository')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return UpdateRepositoryPayload
+
+
+def UpdateRepositoryRulesetPayload():
+    class UpdateRepositoryRulesetPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'ruleset')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        ruleset = sgqlc.types.Field('RepositoryRuleset', graphql_name='ruleset')
+    return UpdateRepositoryRulesetPayload
+
+
+def UpdateRepositoryWebCommitSignoffSettingPayload():
+    class UpdateRepositoryWebCommitSignoffSettingPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'message', 'repository')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        message = sgqlc.types.Field('String', graphql_name='message')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return UpdateRepositoryWebCommitSignoffSettingPayload
+
+
+def UpdateSponsorshipPreferencesPayload():
+    class UpdateSponsorshipPreferencesPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'sponsorship')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        sponsorship = sgqlc.types.Field('Sponsorship', graphql_name='sponsorship')
+    return UpdateSponsorshipPreferencesPayload
+
+
+def UpdateSubscriptionPayload():
+    class UpdateSubscriptionPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'subscribable')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        subscribable = sgqlc.types.Field('Subscribable', graphql_name='subscribable')
+    return UpdateSubscriptionPayload
+
+
+def UpdateTeamDiscussionCommentPayload():
+    class UpdateTeamDiscussionCommentPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'team_discussion_comment')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        team_discussion_comment = sgqlc.types.Field('TeamDiscussionComment', graphql_name='teamDiscussionComment')
+    return UpdateTeamDiscussionCommentPayload
+
+
+def UpdateTeamDiscussionPayload():
+    class UpdateTeamDiscussionPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'team_discussion')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        team_discussion = sgqlc.types.Field('TeamDiscussion', graphql_name='teamDiscussion')
+    return UpdateTeamDiscussionPayload
+
+
+def UpdateTeamsRepositoryPayload():
+    class UpdateTeamsRepositoryPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'repository', 'teams')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+        teams = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('Team')), graphql_name='teams')
+    return UpdateTeamsRepositoryPayload
+
+
+def UpdateTopicsPayload():
+    class UpdateTopicsPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'invalid_topic_names', 'repository')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        invalid_topic_names = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='invalidTopicNames')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+    return UpdateTopicsPayload
+
+
+def UserContentEditEdge():
+    class UserContentEditEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('UserContentEdit', graphql_name='node')
+    return UserContentEditEdge
+
+
+def UserEdge():
+    class UserEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('User', graphql_name='node')
+    return UserEdge
+
+
+def UserEmailMetadata():
+    class UserEmailMetadata(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('primary', 'type', 'value')
+        primary = sgqlc.types.Field('Boolean', graphql_name='primary')
+        type = sgqlc.types.Field('String', graphql_name='type')
+        value = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='value')
+    return UserEmailMetadata
+
+
+def UserStatusEdge():
+    class UserStatusEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('UserStatus', graphql_name='node')
+    return UserStatusEdge
+
+
+def VerifiableDomainEdge():
+    class VerifiableDomainEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('VerifiableDomain', graphql_name='node')
+    return VerifiableDomainEdge
+
+
+def VerifyVerifiableDomainPayload():
+    class VerifyVerifiableDomainPayload(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('client_mutation_id', 'domain')
+        client_mutation_id = sgqlc.types.Field('String', graphql_name='clientMutationId')
+        domain = sgqlc.types.Field('VerifiableDomain', graphql_name='domain')
+    return VerifyVerifiableDomainPayload
+
+
+def WorkflowRunEdge():
+    class WorkflowRunEdge(sgqlc.types.Type):
+        __schema__ = github_schema
+        __field_names__ = ('cursor', 'node')
+        cursor = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cursor')
+        node = sgqlc.types.Field('WorkflowRun', graphql_name='node')
+    return WorkflowRunEdge
+
+
+def AddedToMergeQueueEvent():
+    class AddedToMergeQueueEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'enqueuer', 'merge_queue', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        enqueuer = sgqlc.types.Field('User', graphql_name='enqueuer')
+        merge_queue = sgqlc.types.Field('MergeQueue', graphql_name='mergeQueue')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return AddedToMergeQueueEvent
+
+
+def AddedToProjectEvent():
+    class AddedToProjectEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'database_id')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+    return AddedToProjectEvent
+
+
+def App():
+    class App(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'database_id', 'description', 'ip_allow_list_entries', 'logo_background_color', 'logo_url', 'name', 'slug', 'updated_at', 'url')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        ip_allow_list_entries = sgqlc.types.Field(sgqlc.types.non_null('IpAllowListEntryConnection'), graphql_name='ipAllowListEntries', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.IpAllowListEntryOrder, graphql_name='orderBy', default={'field': 'ALLOW_LIST_VALUE', 'direction': 'ASC'})))))
+        logo_background_color = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='logoBackgroundColor')
+        logo_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='logoUrl', args=sgqlc.types.ArgDict((('size', sgqlc.types.Arg('Int', graphql_name='size', default=None)),)))
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        slug = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='slug')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return App
+
+
+def AssignedEvent():
+    class AssignedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'assignable', 'assignee', 'created_at')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        assignable = sgqlc.types.Field(sgqlc.types.non_null('Assignable'), graphql_name='assignable')
+        assignee = sgqlc.types.Field('Assignee', graphql_name='assignee')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+    return AssignedEvent
+
+
+def AutoMergeDisabledEvent():
+    class AutoMergeDisabledEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'disabler', 'pull_request', 'reason', 'reason_code')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        disabler = sgqlc.types.Field('User', graphql_name='disabler')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+        reason = sgqlc.types.Field('String', graphql_name='reason')
+        reason_code = sgqlc.types.Field('String', graphql_name='reasonCode')
+    return AutoMergeDisabledEvent
+
+
+def AutoMergeEnabledEvent():
+    class AutoMergeEnabledEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'enabler', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        enabler = sgqlc.types.Field('User', graphql_name='enabler')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return AutoMergeEnabledEvent
+
+
+def AutoRebaseEnabledEvent():
+    class AutoRebaseEnabledEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'enabler', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        enabler = sgqlc.types.Field('User', graphql_name='enabler')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return AutoRebaseEnabledEvent
+
+
+def AutoSquashEnabledEvent():
+    class AutoSquashEnabledEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'enabler', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        enabler = sgqlc.types.Field('User', graphql_name='enabler')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return AutoSquashEnabledEvent
+
+
+def AutomaticBaseChangeFailedEvent():
+    class AutomaticBaseChangeFailedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'new_base', 'old_base', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        new_base = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='newBase')
+        old_base = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='oldBase')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+    return AutomaticBaseChangeFailedEvent
+
+
+def AutomaticBaseChangeSucceededEvent():
+    class AutomaticBaseChangeSucceededEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'new_base', 'old_base', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        new_base = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='newBase')
+        old_base = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='oldBase')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+    return AutomaticBaseChangeSucceededEvent
+
+
+def BaseRefChangedEvent():
+    class BaseRefChangedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'current_ref_name', 'database_id', 'previous_ref_name', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        current_ref_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='currentRefName')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        previous_ref_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='previousRefName')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+    return BaseRefChangedEvent
+
+
+def BaseRefDeletedEvent():
+    class BaseRefDeletedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'base_ref_name', 'created_at', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        base_ref_name = sgqlc.types.Field('String', graphql_name='baseRefName')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return BaseRefDeletedEvent
+
+
+def BaseRefForcePushedEvent():
+    class BaseRefForcePushedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'after_commit', 'before_commit', 'created_at', 'pull_request', 'ref')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        after_commit = sgqlc.types.Field('Commit', graphql_name='afterCommit')
+        before_commit = sgqlc.types.Field('Commit', graphql_name='beforeCommit')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+        ref = sgqlc.types.Field('Ref', graphql_name='ref')
+    return BaseRefForcePushedEvent
+
+
+def Blob():
+    class Blob(sgqlc.types.Type, github_schema.GitObject, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('byte_size', 'is_binary', 'is_truncated', 'text')
+        byte_size = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='byteSize')
+        is_binary = sgqlc.types.Field('Boolean', graphql_name='isBinary')
+        is_truncated = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isTruncated')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return Blob
+
+
+def Bot():
+    class Bot(sgqlc.types.Type, github_schema.Node, github_schema.Actor, github_schema.UniformResourceLocatable):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'database_id', 'updated_at')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return Bot
+
+
+def BranchProtectionRule():
+    class BranchProtectionRule(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('allows_deletions', 'allows_force_pushes', 'blocks_creations', 'branch_protection_rule_conflicts', 'bypass_force_push_allowances', 'bypass_pull_request_allowances', 'creator', 'database_id', 'dismisses_stale_reviews', 'is_admin_enforced', 'lock_allows_fetch_and_merge', 'lock_branch', 'matching_refs', 'pattern', 'push_allowances', 'repository', 'require_last_push_approval', 'required_approving_review_count', 'required_deployment_environments', 'required_status_check_contexts', 'required_status_checks', 'requires_approving_reviews', 'requires_code_owner_reviews', 'requires_commit_signatures', 'requires_conversation_resolution', 'requires_deployments', 'requires_linear_history', 'requires_status_checks', 'requires_strict_status_checks', 'restricts_pushes', 'restricts_review_dismissals', 'review_dismissal_allowances')
+        allows_deletions = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='allowsDeletions')
+        allows_force_pushes = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='allowsForcePushes')
+        blocks_creations = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='blocksCreations')
+        branch_protection_rule_conflicts = sgqlc.types.Field(sgqlc.types.non_null('BranchProtectionRuleConflictConnection'), graphql_name='branchProtectionRuleConflicts', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        bypass_force_push_allowances = sgqlc.types.Field(sgqlc.types.non_null('BypassForcePushAllowanceConnection'), graphql_name='bypassForcePushAllowances', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        bypass_pull_request_allowances = sgqlc.types.Field(sgqlc.types.non_null('BypassPullRequestAllowanceConnection'), graphql_name='bypassPullRequestAllowances', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        creator = sgqlc.types.Field('Actor', graphql_name='creator')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        dismisses_stale_reviews = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='dismissesStaleReviews')
+        is_admin_enforced = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isAdminEnforced')
+        lock_allows_fetch_and_merge = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='lockAllowsFetchAndMerge')
+        lock_branch = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='lockBranch')
+        matching_refs = sgqlc.types.Field(sgqlc.types.non_null('RefConnection'), graphql_name='matchingRefs', args=sgqlc.types.ArgDict((('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        pattern = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='pattern')
+        push_allowances = sgqlc.types.Field(sgqlc.types.non_null('PushAllowanceConnection'), graphql_name='pushAllowances', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+        require_last_push_approval = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requireLastPushApproval')
+        required_approving_review_count = sgqlc.types.Field('Int', graphql_name='requiredApprovingReviewCount')
+        required_deployment_environments = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='requiredDeploymentEnvironments')
+        required_status_check_contexts = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='requiredStatusCheckContexts')
+        required_status_checks = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('RequiredStatusCheckDescription')), graphql_name='requiredStatusChecks')
+        requires_approving_reviews = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requiresApprovingReviews')
+        requires_code_owner_reviews = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requiresCodeOwnerReviews')
+        requires_commit_signatures = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requiresCommitSignatures')
+        requires_conversation_resolution = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requiresConversationResolution')
+        requires_deployments = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requiresDeployments')
+        requires_linear_history = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requiresLinearHistory')
+        requires_status_checks = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requiresStatusChecks')
+        requires_strict_status_checks = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='requiresStrictStatusChecks')
+        restricts_pushes = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='restrictsPushes')
+        restricts_review_dismissals = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='restrictsReviewDismissals')
+        review_dismissal_allowances = sgqlc.types.Field(sgqlc.types.non_null('ReviewDismissalAllowanceConnection'), graphql_name='reviewDismissalAllowances', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return BranchProtectionRule
+
+
+def BypassForcePushAllowance():
+    class BypassForcePushAllowance(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'branch_protection_rule')
+        actor = sgqlc.types.Field('BranchActorAllowanceActor', graphql_name='actor')
+        branch_protection_rule = sgqlc.types.Field('BranchProtectionRule', graphql_name='branchProtectionRule')
+    return BypassForcePushAllowance
+
+
+def BypassPullRequestAllowance():
+    class BypassPullRequestAllowance(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'branch_protection_rule')
+        actor = sgqlc.types.Field('BranchActorAllowanceActor', graphql_name='actor')
+        branch_protection_rule = sgqlc.types.Field('BranchProtectionRule', graphql_name='branchProtectionRule')
+    return BypassPullRequestAllowance
+
+
+def CWE():
+    class CWE(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('cwe_id', 'description', 'name')
+        cwe_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='cweId')
+        description = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='description')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+    return CWE
+
+
+def CheckRun():
+    class CheckRun(sgqlc.types.Type, github_schema.Node, github_schema.UniformResourceLocatable, github_schema.RequirableByPullRequest):
+        __schema__ = github_schema
+        __field_names__ = ('annotations', 'check_suite', 'completed_at', 'conclusion', 'database_id', 'deployment', 'details_url', 'external_id', 'name', 'pending_deployment_request', 'permalink', 'repository', 'started_at', 'status', 'steps', 'summary', 'text', 'title')
+        annotations = sgqlc.types.Field('CheckAnnotationConnection', graphql_name='annotations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        check_suite = sgqlc.types.Field(sgqlc.types.non_null('CheckSuite'), graphql_name='checkSuite')
+        completed_at = sgqlc.types.Field('DateTime', graphql_name='completedAt')
+        conclusion = sgqlc.types.Field('CheckConclusionState', graphql_name='conclusion')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        deployment = sgqlc.types.Field('Deployment', graphql_name='deployment')
+        details_url = sgqlc.types.Field('URI', graphql_name='detailsUrl')
+        external_id = sgqlc.types.Field('String', graphql_name='externalId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        pending_deployment_request = sgqlc.types.Field('DeploymentRequest', graphql_name='pendingDeploymentRequest')
+        permalink = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='permalink')
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+        started_at = sgqlc.types.Field('DateTime', graphql_name='startedAt')
+        status = sgqlc.types.Field(sgqlc.types.non_null('CheckStatusState'), graphql_name='status')
+        steps = sgqlc.types.Field('CheckStepConnection', graphql_name='steps', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('number', sgqlc.types.Arg('Int', graphql_name='number', default=None)))))
+        summary = sgqlc.types.Field('String', graphql_name='summary')
+        text = sgqlc.types.Field('String', graphql_name='text')
+        title = sgqlc.types.Field('String', graphql_name='title')
+    return CheckRun
+
+
+def CheckSuite():
+    class CheckSuite(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('app', 'branch', 'check_runs', 'commit', 'conclusion', 'created_at', 'creator', 'database_id', 'matching_pull_requests', 'push', 'repository', 'resource_path', 'status', 'updated_at', 'url', 'workflow_run')
+        app = sgqlc.types.Field('App', graphql_name='app')
+        branch = sgqlc.types.Field('Ref', graphql_name='branch')
+        check_runs = sgqlc.types.Field('CheckRunConnection', graphql_name='checkRuns', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('filter_by', sgqlc.types.Arg('CheckRunFilter', graphql_name='filterBy', default=None)))))
+        commit = sgqlc.types.Field(sgqlc.types.non_null('Commit'), graphql_name='commit')
+        conclusion = sgqlc.types.Field('CheckConclusionState', graphql_name='conclusion')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        creator = sgqlc.types.Field('User', graphql_name='creator')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        matching_pull_requests = sgqlc.types.Field('PullRequestConnection', graphql_name='matchingPullRequests', args=sgqlc.types.ArgDict((('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('PullRequestState')), graphql_name='states', default=None)), ('labels', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='labels', default=None)), ('head_ref_name', sgqlc.types.Arg('String', graphql_name='headRefName', default=None)), ('base_ref_name', sgqlc.types.Arg('String', graphql_name='baseRefName', default=None)), ('order_by', sgqlc.types.Arg('IssueOrder', graphql_name='orderBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        push = sgqlc.types.Field('Push', graphql_name='push')
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        status = sgqlc.types.Field(sgqlc.types.non_null('CheckStatusState'), graphql_name='status')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+        workflow_run = sgqlc.types.Field('WorkflowRun', graphql_name='workflowRun')
+    return CheckSuite
+
+
+def ClosedEvent():
+    class ClosedEvent(sgqlc.types.Type, github_schema.Node, github_schema.UniformResourceLocatable):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'closable', 'closer', 'created_at', 'state_reason')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        closable = sgqlc.types.Field(sgqlc.types.non_null('Closable'), graphql_name='closable')
+        closer = sgqlc.types.Field('Closer', graphql_name='closer')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        state_reason = sgqlc.types.Field('IssueStateReason', graphql_name='stateReason')
+    return ClosedEvent
+
+
+def CodeOfConduct():
+    class CodeOfConduct(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('body', 'key', 'name', 'resource_path', 'url')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        key = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='key')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        resource_path = sgqlc.types.Field('URI', graphql_name='resourcePath')
+        url = sgqlc.types.Field('URI', graphql_name='url')
+    return CodeOfConduct
+
+
+def CommentDeletedEvent():
+    class CommentDeletedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'database_id', 'deleted_comment_author')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        deleted_comment_author = sgqlc.types.Field('Actor', graphql_name='deletedCommentAuthor')
+    return CommentDeletedEvent
+
+
+def Commit():
+    class Commit(sgqlc.types.Type, github_schema.Node, github_schema.GitObject, github_schema.Subscribable, github_schema.UniformResourceLocatable):
+        __schema__ = github_schema
+        __field_names__ = ('additions', 'associated_pull_requests', 'author', 'authored_by_committer', 'authored_date', 'authors', 'blame', 'changed_files_if_available', 'check_suites', 'comments', 'committed_date', 'committed_via_web', 'committer', 'deletions', 'deployments', 'file', 'history', 'message', 'message_body', 'message_body_html', 'message_headline', 'message_headline_html', 'on_behalf_of', 'parents', 'signature', 'status', 'status_check_rollup', 'submodules', 'tarball_url', 'tree', 'tree_resource_path', 'tree_url', 'zipball_url')
+        additions = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='additions')
+        associated_pull_requests = sgqlc.types.Field('PullRequestConnection', graphql_name='associatedPullRequests', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.PullRequestOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'ASC'})))))
+        author = sgqlc.types.Field('GitActor', graphql_name='author')
+        authored_by_committer = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='authoredByCommitter')
+        authored_date = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='authoredDate')
+        authors = sgqlc.types.Field(sgqlc.types.non_null('GitActorConnection'), graphql_name='authors', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        blame = sgqlc.types.Field(sgqlc.types.non_null('Blame'), graphql_name='blame', args=sgqlc.types.ArgDict((('path', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='path', default=None)),)))
+        changed_files_if_available = sgqlc.types.Field('Int', graphql_name='changedFilesIfAvailable')
+        check_suites = sgqlc.types.Field('CheckSuiteConnection', graphql_name='checkSuites', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('filter_by', sgqlc.types.Arg('CheckSuiteFilter', graphql_name='filterBy', default=None)))))
+        comments = sgqlc.types.Field(sgqlc.types.non_null('CommitCommentConnection'), graphql_name='comments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        committed_date = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='committedDate')
+        committed_via_web = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='committedViaWeb')
+        committer = sgqlc.types.Field('GitActor', graphql_name='committer')
+        deletions = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='deletions')
+        deployments = sgqlc.types.Field('DeploymentConnection', graphql_name='deployments', args=sgqlc.types.ArgDict((('environments', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='environments', default=None)), ('order_by', sgqlc.types.Arg(github_schema.DeploymentOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'ASC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        file = sgqlc.types.Field('TreeEntry', graphql_name='file', args=sgqlc.types.ArgDict((('path', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='path', default=None)),)))
+        history = sgqlc.types.Field(sgqlc.types.non_null('CommitHistoryConnection'), graphql_name='history', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('path', sgqlc.types.Arg('String', graphql_name='path', default=None)), ('author', sgqlc.types.Arg('CommitAuthor', graphql_name='author', default=None)), ('since', sgqlc.types.Arg('GitTimestamp', graphql_name='since', default=None)), ('until', sgqlc.types.Arg('GitTimestamp', graphql_name='until', default=None)))))
+        message = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='message')
+        message_body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='messageBody')
+        message_body_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='messageBodyHTML')
+        message_headline = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='messageHeadline')
+        message_headline_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='messageHeadlineHTML')
+        on_behalf_of = sgqlc.types.Field('Organization', graphql_name='onBehalfOf')
+        parents = sgqlc.types.Field(sgqlc.types.non_null('CommitConnection'), graphql_name='parents', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        signature = sgqlc.types.Field('GitSignature', graphql_name='signature')
+        status = sgqlc.types.Field('Status', graphql_name='status')
+        status_check_rollup = sgqlc.types.Field('StatusCheckRollup', graphql_name='statusCheckRollup')
+        submodules = sgqlc.types.Field(sgqlc.types.non_null('SubmoduleConnection'), graphql_name='submodules', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        tarball_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='tarballUrl')
+        tree = sgqlc.types.Field(sgqlc.types.non_null('Tree'), graphql_name='tree')
+        tree_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='treeResourcePath')
+        tree_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='treeUrl')
+        zipball_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='zipballUrl')
+    return Commit
+
+
+def CommitComment():
+    class CommitComment(sgqlc.types.Type, github_schema.Node, github_schema.Comment, github_schema.Deletable, github_schema.Minimizable, github_schema.Updatable, github_schema.UpdatableComment, github_schema.Reactable, github_schema.RepositoryNode):
+        __schema__ = github_schema
+        __field_names__ = ('commit', 'path', 'position', 'resource_path', 'url')
+        commit = sgqlc.types.Field('Commit', graphql_name='commit')
+        path = sgqlc.types.Field('String', graphql_name='path')
+        position = sgqlc.types.Field('Int', graphql_name='position')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return CommitComment
+
+
+def CommitCommentThread():
+    class CommitCommentThread(sgqlc.types.Type, github_schema.Node, github_schema.RepositoryNode):
+        __schema__ = github_schema
+        __field_names__ = ('comments', 'commit', 'path', 'position')
+        comments = sgqlc.types.Field(sgqlc.types.non_null('CommitCommentConnection'), graphql_name='comments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        commit = sgqlc.types.Field('Commit', graphql_name='commit')
+        path = sgqlc.types.Field('String', graphql_name='path')
+        position = sgqlc.types.Field('Int', graphql_name='position')
+    return CommitCommentThread
+
+
+def Comparison():
+    class Comparison(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('ahead_by', 'base_target', 'behind_by', 'commits', 'head_target', 'status')
+        ahead_by = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='aheadBy')
+        base_target = sgqlc.types.Field(sgqlc.types.non_null('GitObject'), graphql_name='baseTarget')
+        behind_by = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='behindBy')
+        commits = sgqlc.types.Field(sgqlc.types.non_null('ComparisonCommitConnection'), graphql_name='commits', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        head_target = sgqlc.types.Field(sgqlc.types.non_null('GitObject'), graphql_name='headTarget')
+        status = sgqlc.types.Field(sgqlc.types.non_null('ComparisonStatus'), graphql_name='status')
+    return Comparison
+
+
+def ConnectedEvent():
+    class ConnectedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'is_cross_repository', 'source', 'subject')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        is_cross_repository = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isCrossRepository')
+        source = sgqlc.types.Field(sgqlc.types.non_null('ReferencedSubject'), graphql_name='source')
+        subject = sgqlc.types.Field(sgqlc.types.non_null('ReferencedSubject'), graphql_name='subject')
+    return ConnectedEvent
+
+
+def ConvertToDraftEvent():
+    class ConvertToDraftEvent(sgqlc.types.Type, github_schema.Node, github_schema.UniformResourceLocatable):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+    return ConvertToDraftEvent
+
+
+def ConvertedNoteToIssueEvent():
+    class ConvertedNoteToIssueEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'database_id')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+    return ConvertedNoteToIssueEvent
+
+
+def ConvertedToDiscussionEvent():
+    class ConvertedToDiscussionEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'discussion')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        discussion = sgqlc.types.Field('Discussion', graphql_name='discussion')
+    return ConvertedToDiscussionEvent
+
+
+def CreatedCommitContribution():
+    class CreatedCommitContribution(sgqlc.types.Type, github_schema.Contribution):
+        __schema__ = github_schema
+        __field_names__ = ('commit_count', 'repository')
+        commit_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='commitCount')
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+    return CreatedCommitContribution
+
+
+def CreatedIssueContribution():
+    class CreatedIssueContribution(sgqlc.types.Type, github_schema.Contribution):
+        __schema__ = github_schema
+        __field_names__ = ('issue',)
+        issue = sgqlc.types.Field(sgqlc.types.non_null('Issue'), graphql_name='issue')
+    return CreatedIssueContribution
+
+
+def CreatedPullRequestContribution():
+    class CreatedPullRequestContribution(sgqlc.types.Type, github_schema.Contribution):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request',)
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+    return CreatedPullRequestContribution
+
+
+def CreatedPullRequestReviewContribution():
+    class CreatedPullRequestReviewContribution(sgqlc.types.Type, github_schema.Contribution):
+        __schema__ = github_schema
+        __field_names__ = ('pull_request', 'pull_request_review', 'repository')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+        pull_request_review = sgqlc.types.Field(sgqlc.types.non_null('PullRequestReview'), graphql_name='pullRequestReview')
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+    return CreatedPullRequestReviewContribution
+
+
+def CreatedRepositoryContribution():
+    class CreatedRepositoryContribution(sgqlc.types.Type, github_schema.Contribution):
+        __schema__ = github_schema
+        __field_names__ = ('repository',)
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+    return CreatedRepositoryContribution
+
+
+def CrossReferencedEvent():
+    class CrossReferencedEvent(sgqlc.types.Type, github_schema.UniformResourceLocatable, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'is_cross_repository', 'referenced_at', 'source', 'target', 'will_close_target')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        is_cross_repository = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isCrossRepository')
+        referenced_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='referencedAt')
+        source = sgqlc.types.Field(sgqlc.types.non_null('ReferencedSubject'), graphql_name='source')
+        target = sgqlc.types.Field(sgqlc.types.non_null('ReferencedSubject'), graphql_name='target')
+        will_close_target = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='willCloseTarget')
+    return CrossReferencedEvent
+
+
+def DemilestonedEvent():
+    class DemilestonedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'milestone_title', 'subject')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        milestone_title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='milestoneTitle')
+        subject = sgqlc.types.Field(sgqlc.types.non_null('MilestoneItem'), graphql_name='subject')
+    return DemilestonedEvent
+
+
+def DependabotUpdate():
+    class DependabotUpdate(sgqlc.types.Type, github_schema.RepositoryNode):
+        __schema__ = github_schema
+        __field_names__ = ('error', 'pull_request')
+        error = sgqlc.types.Field('DependabotUpdateError', graphql_name='error')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+    return DependabotUpdate
+
+
+def DeployKey():
+    class DeployKey(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'key', 'read_only', 'title', 'verified')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        key = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='key')
+        read_only = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='readOnly')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        verified = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='verified')
+    return DeployKey
+
+
+def DeployedEvent():
+    class DeployedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'database_id', 'deployment', 'pull_request', 'ref')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        deployment = sgqlc.types.Field(sgqlc.types.non_null('Deployment'), graphql_name='deployment')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+        ref = sgqlc.types.Field('Ref', graphql_name='ref')
+    return DeployedEvent
+
+
+def Deployment():
+    class Deployment(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('commit', 'commit_oid', 'created_at', 'creator', 'database_id', 'description', 'environment', 'latest_environment', 'latest_status', 'original_environment', 'payload', 'ref', 'repository', 'state', 'statuses', 'task', 'updated_at')
+        commit = sgqlc.types.Field('Commit', graphql_name='commit')
+        commit_oid = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='commitOid')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        creator = sgqlc.types.Field(sgqlc.types.non_null('Actor'), graphql_name='creator')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        environment = sgqlc.types.Field('String', graphql_name='environment')
+        latest_environment = sgqlc.types.Field('String', graphql_name='latestEnvironment')
+        latest_status = sgqlc.types.Field('DeploymentStatus', graphql_name='latestStatus')
+        original_environment = sgqlc.types.Field('String', graphql_name='originalEnvironment')
+        payload = sgqlc.types.Field('String', graphql_name='payload')
+        ref = sgqlc.types.Field('Ref', graphql_name='ref')
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+        state = sgqlc.types.Field('DeploymentState', graphql_name='state')
+        statuses = sgqlc.types.Field('DeploymentStatusConnection', graphql_name='statuses', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        task = sgqlc.types.Field('String', graphql_name='task')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return Deployment
+
+
+def DeploymentEnvironmentChangedEvent():
+    class DeploymentEnvironmentChangedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'deployment_status', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        deployment_status = sgqlc.types.Field(sgqlc.types.non_null('DeploymentStatus'), graphql_name='deploymentStatus')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+    return DeploymentEnvironmentChangedEvent
+
+
+def DeploymentReview():
+    class DeploymentReview(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('comment', 'database_id', 'environments', 'state', 'user')
+        comment = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='comment')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        environments = sgqlc.types.Field(sgqlc.types.non_null('EnvironmentConnection'), graphql_name='environments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        state = sgqlc.types.Field(sgqlc.types.non_null('DeploymentReviewState'), graphql_name='state')
+        user = sgqlc.types.Field(sgqlc.types.non_null('User'), graphql_name='user')
+    return DeploymentReview
+
+
+def DeploymentStatus():
+    class DeploymentStatus(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'creator', 'deployment', 'description', 'environment_url', 'log_url', 'state', 'updated_at')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        creator = sgqlc.types.Field(sgqlc.types.non_null('Actor'), graphql_name='creator')
+        deployment = sgqlc.types.Field(sgqlc.types.non_null('Deployment'), graphql_name='deployment')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        environment_url = sgqlc.types.Field('URI', graphql_name='environmentUrl')
+        log_url = sgqlc.types.Field('URI', graphql_name='logUrl')
+        state = sgqlc.types.Field(sgqlc.types.non_null('DeploymentStatusState'), graphql_name='state')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return DeploymentStatus
+
+
+def DisconnectedEvent():
+    class DisconnectedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'is_cross_repository', 'source', 'subject')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        is_cross_repository = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isCrossRepository')
+        source = sgqlc.types.Field(sgqlc.types.non_null('ReferencedSubject'), graphql_name='source')
+        subject = sgqlc.types.Field(sgqlc.types.non_null('ReferencedSubject'), graphql_name='subject')
+    return DisconnectedEvent
+
+
+def Discussion():
+    class Discussion(sgqlc.types.Type, github_schema.Closable, github_schema.Comment, github_schema.Updatable, github_schema.Deletable, github_schema.Labelable, github_schema.Lockable, github_schema.RepositoryNode, github_schema.Subscribable, github_schema.Reactable, github_schema.Votable, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('answer', 'answer_chosen_at', 'answer_chosen_by', 'category', 'comments', 'number', 'poll', 'resource_path', 'state_reason', 'title', 'url')
+        answer = sgqlc.types.Field('DiscussionComment', graphql_name='answer')
+        answer_chosen_at = sgqlc.types.Field('DateTime', graphql_name='answerChosenAt')
+        answer_chosen_by = sgqlc.types.Field('Actor', graphql_name='answerChosenBy')
+        category = sgqlc.types.Field(sgqlc.types.non_null('DiscussionCategory'), graphql_name='category')
+        comments = sgqlc.types.Field(sgqlc.types.non_null('DiscussionCommentConnection'), graphql_name='comments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        number = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='number')
+        poll = sgqlc.types.Field('DiscussionPoll', graphql_name='poll')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        state_reason = sgqlc.types.Field('DiscussionStateReason', graphql_name='stateReason')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return Discussion
+
+
+def DiscussionCategory():
+    class DiscussionCategory(sgqlc.types.Type, github_schema.Node, github_schema.RepositoryNode):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'description', 'emoji', 'emoji_html', 'is_answerable', 'name', 'slug', 'updated_at')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        emoji = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='emoji')
+        emoji_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='emojiHTML')
+        is_answerable = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isAnswerable')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        slug = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='slug')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return DiscussionCategory
+
+
+def DiscussionComment():
+    class DiscussionComment(sgqlc.types.Type, github_schema.Comment, github_schema.Deletable, github_schema.Minimizable, github_schema.Updatable, github_schema.UpdatableComment, github_schema.Reactable, github_schema.Votable, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('deleted_at', 'discussion', 'is_answer', 'replies', 'reply_to', 'resource_path', 'url', 'viewer_can_mark_as_answer', 'viewer_can_unmark_as_answer')
+        deleted_at = sgqlc.types.Field('DateTime', graphql_name='deletedAt')
+        discussion = sgqlc.types.Field('Discussion', graphql_name='discussion')
+        is_answer = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isAnswer')
+        replies = sgqlc.types.Field(sgqlc.types.non_null('DiscussionCommentConnection'), graphql_name='replies', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        reply_to = sgqlc.types.Field('DiscussionComment', graphql_name='replyTo')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+        viewer_can_mark_as_answer = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanMarkAsAnswer')
+        viewer_can_unmark_as_answer = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanUnmarkAsAnswer')
+    return DiscussionComment
+
+
+def DiscussionPoll():
+    class DiscussionPoll(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('discussion', 'options', 'question', 'total_vote_count', 'viewer_can_vote', 'viewer_has_voted')
+        discussion = sgqlc.types.Field('Discussion', graphql_name='discussion')
+        options = sgqlc.types.Field('DiscussionPollOptionConnection', graphql_name='options', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.DiscussionPollOptionOrder, graphql_name='orderBy', default={'field': 'AUTHORED_ORDER', 'direction': 'ASC'})))))
+        question = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='question')
+        total_vote_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalVoteCount')
+        viewer_can_vote = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanVote')
+        viewer_has_voted = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerHasVoted')
+    return DiscussionPoll
+
+
+def DiscussionPollOption():
+    class DiscussionPollOption(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('option', 'poll', 'total_vote_count', 'viewer_has_voted')
+        option = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='option')
+        poll = sgqlc.types.Field('DiscussionPoll', graphql_name='poll')
+        total_vote_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalVoteCount')
+        viewer_has_voted = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerHasVoted')
+    return DiscussionPollOption
+
+
+def DraftIssue():
+    class DraftIssue(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('assignees', 'body', 'body_html', 'body_text', 'created_at', 'creator', 'project_v2_items', 'projects_v2', 'title', 'updated_at')
+        assignees = sgqlc.types.Field(sgqlc.types.non_null('UserConnection'), graphql_name='assignees', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        body_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='bodyHTML')
+        body_text = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='bodyText')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        creator = sgqlc.types.Field('Actor', graphql_name='creator')
+        project_v2_items = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2ItemConnection'), graphql_name='projectV2Items', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        projects_v2 = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2Connection'), graphql_name='projectsV2', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return DraftIssue
+
+
+def Enterprise():
+    class Enterprise(sgqlc.types.Type, github_schema.Node, github_schema.AnnouncementBanner):
+        __schema__ = github_schema
+        __field_names__ = ('avatar_url', 'billing_info', 'created_at', 'database_id', 'description', 'description_html', 'location', 'members', 'name', 'organizations', 'owner_info', 'resource_path', 'slug', 'url', 'viewer_is_admin', 'website_url')
+        avatar_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='avatarUrl', args=sgqlc.types.ArgDict((('size', sgqlc.types.Arg('Int', graphql_name='size', default=None)),)))
+        billing_info = sgqlc.types.Field('EnterpriseBillingInfo', graphql_name='billingInfo')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        description_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='descriptionHTML')
+        location = sgqlc.types.Field('String', graphql_name='location')
+        members = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseMemberConnection'), graphql_name='members', args=sgqlc.types.ArgDict((('organization_logins', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='organizationLogins', default=None)), ('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('order_by', sgqlc.types.Arg(github_schema.EnterpriseMemberOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})), ('role', sgqlc.types.Arg('EnterpriseUserAccountMembershipRole', graphql_name='role', default=None)), ('deployment', sgqlc.types.Arg('EnterpriseUserDeployment', graphql_name='deployment', default=None)), ('has_two_factor_enabled', sgqlc.types.Arg('Boolean', graphql_name='hasTwoFactorEnabled', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='organizations', args=sgqlc.types.ArgDict((('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('viewer_organization_role', sgqlc.types.Arg('RoleInOrganization', graphql_name='viewerOrganizationRole', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        owner_info = sgqlc.types.Field('EnterpriseOwnerInfo', graphql_name='ownerInfo')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        slug = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='slug')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+        viewer_is_admin = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerIsAdmin')
+        website_url = sgqlc.types.Field('URI', graphql_name='websiteUrl')
+    return Enterprise
+
+
+def EnterpriseAdministratorInvitation():
+    class EnterpriseAdministratorInvitation(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'email', 'enterprise', 'invitee', 'inviter', 'role')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        email = sgqlc.types.Field('String', graphql_name='email')
+        enterprise = sgqlc.types.Field(sgqlc.types.non_null('Enterprise'), graphql_name='enterprise')
+        invitee = sgqlc.types.Field('User', graphql_name='invitee')
+        inviter = sgqlc.types.Field('User', graphql_name='inviter')
+        role = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseAdministratorRole'), graphql_name='role')
+    return EnterpriseAdministratorInvitation
+
+
+def EnterpriseIdentityProvider():
+    class EnterpriseIdentityProvider(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('digest_method', 'enterprise', 'external_identities', 'idp_certificate', 'issuer', 'recovery_codes', 'signature_method', 'sso_url')
+        digest_method = sgqlc.types.Field('SamlDigestAlgorithm', graphql_name='digestMethod')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        external_identities = sgqlc.types.Field(sgqlc.types.non_null('ExternalIdentityConnection'), graphql_name='externalIdentities', args=sgqlc.types.ArgDict((('members_only', sgqlc.types.Arg('Boolean', graphql_name='membersOnly', default=None)), ('login', sgqlc.types.Arg('String', graphql_name='login', default=None)), ('user_name', sgqlc.types.Arg('String', graphql_name='userName', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        idp_certificate = sgqlc.types.Field('X509Certificate', graphql_name='idpCertificate')
+        issuer = sgqlc.types.Field('String', graphql_name='issuer')
+        recovery_codes = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='recoveryCodes')
+        signature_method = sgqlc.types.Field('SamlSignatureAlgorithm', graphql_name='signatureMethod')
+        sso_url = sgqlc.types.Field('URI', graphql_name='ssoUrl')
+    return EnterpriseIdentityProvider
+
+
+def EnterpriseRepositoryInfo():
+    class EnterpriseRepositoryInfo(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('is_private', 'name', 'name_with_owner')
+        is_private = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isPrivate')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        name_with_owner = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='nameWithOwner')
+    return EnterpriseRepositoryInfo
+
+
+def EnterpriseServerInstallation():
+    class EnterpriseServerInstallation(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'customer_name', 'host_name', 'is_connected', 'updated_at', 'user_accounts', 'user_accounts_uploads')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        customer_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='customerName')
+        host_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='hostName')
+        is_connected = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isConnected')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        user_accounts = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseServerUserAccountConnection'), graphql_name='userAccounts', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg(github_schema.EnterpriseServerUserAccountOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        user_accounts_uploads = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseServerUserAccountsUploadConnection'), graphql_name='userAccountsUploads', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg(github_schema.EnterpriseServerUserAccountsUploadOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'DESC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return EnterpriseServerInstallation
+
+
+def EnterpriseServerUserAccount():
+    class EnterpriseServerUserAccount(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'emails', 'enterprise_server_installation', 'is_site_admin', 'login', 'profile_name', 'remote_created_at', 'remote_user_id', 'updated_at')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        emails = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseServerUserAccountEmailConnection'), graphql_name='emails', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg(github_schema.EnterpriseServerUserAccountEmailOrder, graphql_name='orderBy', default={'field': 'EMAIL', 'direction': 'ASC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        enterprise_server_installation = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseServerInstallation'), graphql_name='enterpriseServerInstallation')
+        is_site_admin = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isSiteAdmin')
+        login = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='login')
+        profile_name = sgqlc.types.Field('String', graphql_name='profileName')
+        remote_created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='remoteCreatedAt')
+        remote_user_id = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='remoteUserId')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return EnterpriseServerUserAccount
+
+
+def EnterpriseServerUserAccountEmail():
+    class EnterpriseServerUserAccountEmail(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'email', 'is_primary', 'updated_at', 'user_account')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        email = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='email')
+        is_primary = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isPrimary')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        user_account = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseServerUserAccount'), graphql_name='userAccount')
+    return EnterpriseServerUserAccountEmail
+
+
+def EnterpriseServerUserAccountsUpload():
+    class EnterpriseServerUserAccountsUpload(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'enterprise', 'enterprise_server_installation', 'name', 'sync_state', 'updated_at')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        enterprise = sgqlc.types.Field(sgqlc.types.non_null('Enterprise'), graphql_name='enterprise')
+        enterprise_server_installation = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseServerInstallation'), graphql_name='enterpriseServerInstallation')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        sync_state = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseServerUserAccountsUploadSyncState'), graphql_name='syncState')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return EnterpriseServerUserAccountsUpload
+
+
+def EnterpriseUserAccount():
+    class EnterpriseUserAccount(sgqlc.types.Type, github_schema.Actor, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'enterprise', 'enterprise_installations', 'name', 'organizations', 'updated_at', 'user')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        enterprise = sgqlc.types.Field(sgqlc.types.non_null('Enterprise'), graphql_name='enterprise')
+        enterprise_installations = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseServerInstallationMembershipConnection'), graphql_name='enterpriseInstallations', args=sgqlc.types.ArgDict((('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('order_by', sgqlc.types.Arg(github_schema.EnterpriseServerInstallationOrder, graphql_name='orderBy', default={'field': 'HOST_NAME', 'direction': 'ASC'})), ('role', sgqlc.types.Arg('EnterpriseUserAccountMembershipRole', graphql_name='role', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        name = sgqlc.types.Field('String', graphql_name='name')
+        organizations = sgqlc.types.Field(sgqlc.types.non_null('EnterpriseOrganizationMembershipConnection'), graphql_name='organizations', args=sgqlc.types.ArgDict((('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrganizationOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})), ('role', sgqlc.types.Arg('EnterpriseUserAccountMembershipRole', graphql_name='role', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        user = sgqlc.types.Field('User', graphql_name='user')
+    return EnterpriseUserAccount
+
+
+def Environment():
+    class Environment(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('database_id', 'name', 'protection_rules')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        protection_rules = sgqlc.types.Field(sgqlc.types.non_null('DeploymentProtectionRuleConnection'), graphql_name='protectionRules', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return Environment
+
+
+def ExternalIdentity():
+    class ExternalIdentity(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('guid', 'organization_invitation', 'saml_identity', 'scim_identity', 'user')
+        guid = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='guid')
+        organization_invitation = sgqlc.types.Field('OrganizationInvitation', graphql_name='organizationInvitation')
+        saml_identity = sgqlc.types.Field('ExternalIdentitySamlAttributes', graphql_name='samlIdentity')
+        scim_identity = sgqlc.types.Field('ExternalIdentityScimAttributes', graphql_name='scimIdentity')
+        user = sgqlc.types.Field('User', graphql_name='user')
+    return ExternalIdentity
+
+
+def GenericHovercardContext():
+    class GenericHovercardContext(sgqlc.types.Type, github_schema.HovercardContext):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return GenericHovercardContext
+
+
+def Gist():
+    class Gist(sgqlc.types.Type, github_schema.Node, github_schema.Starrable, github_schema.UniformResourceLocatable):
+        __schema__ = github_schema
+        __field_names__ = ('comments', 'created_at', 'description', 'files', 'forks', 'is_fork', 'is_public', 'name', 'owner', 'pushed_at', 'updated_at')
+        comments = sgqlc.types.Field(sgqlc.types.non_null('GistCommentConnection'), graphql_name='comments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        files = sgqlc.types.Field(sgqlc.types.list_of('GistFile'), graphql_name='files', args=sgqlc.types.ArgDict((('limit', sgqlc.types.Arg(github_schema.Int, graphql_name='limit', default=10)), ('oid', sgqlc.types.Arg('GitObjectID', graphql_name='oid', default=None)))))
+        forks = sgqlc.types.Field(sgqlc.types.non_null('GistConnection'), graphql_name='forks', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg('GistOrder', graphql_name='orderBy', default=None)))))
+        is_fork = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isFork')
+        is_public = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isPublic')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        owner = sgqlc.types.Field('RepositoryOwner', graphql_name='owner')
+        pushed_at = sgqlc.types.Field('DateTime', graphql_name='pushedAt')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return Gist
+
+
+def GistComment():
+    class GistComment(sgqlc.types.Type, github_schema.Node, github_schema.Comment, github_schema.Deletable, github_schema.Minimizable, github_schema.Updatable, github_schema.UpdatableComment):
+        __schema__ = github_schema
+        __field_names__ = ('database_id', 'gist')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        gist = sgqlc.types.Field(sgqlc.types.non_null('Gist'), graphql_name='gist')
+    return GistComment
+
+
+def GpgSignature():
+    class GpgSignature(sgqlc.types.Type, github_schema.GitSignature):
+        __schema__ = github_schema
+        __field_names__ = ('key_id',)
+        key_id = sgqlc.types.Field('String', graphql_name='keyId')
+    return GpgSignature
+
+
+def HeadRefDeletedEvent():
+    class HeadRefDeletedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'head_ref', 'head_ref_name', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        head_ref = sgqlc.types.Field('Ref', graphql_name='headRef')
+        head_ref_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='headRefName')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+    return HeadRefDeletedEvent
+
+
+def HeadRefForcePushedEvent():
+    class HeadRefForcePushedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'after_commit', 'before_commit', 'created_at', 'pull_request', 'ref')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        after_commit = sgqlc.types.Field('Commit', graphql_name='afterCommit')
+        before_commit = sgqlc.types.Field('Commit', graphql_name='beforeCommit')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+        ref = sgqlc.types.Field('Ref', graphql_name='ref')
+    return HeadRefForcePushedEvent
+
+
+def HeadRefRestoredEvent():
+    class HeadRefRestoredEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+    return HeadRefRestoredEvent
+
+
+def IpAllowListEntry():
+    class IpAllowListEntry(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('allow_list_value', 'created_at', 'is_active', 'name', 'owner', 'updated_at')
+        allow_list_value = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='allowListValue')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        is_active = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isActive')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        owner = sgqlc.types.Field(sgqlc.types.non_null('IpAllowListOwner'), graphql_name='owner')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return IpAllowListEntry
+
+
+def Issue():
+    class Issue(sgqlc.types.Type, github_schema.Node, github_schema.Assignable, github_schema.Closable, github_schema.Comment, github_schema.Deletable, github_schema.Updatable, github_schema.UpdatableComment, github_schema.Labelable, github_schema.Lockable, github_schema.Reactable, github_schema.RepositoryNode, github_schema.Subscribable, github_schema.UniformResourceLocatable, github_schema.ProjectV2Owner):
+        __schema__ = github_schema
+        __field_names__ = ('body_resource_path', 'body_url', 'comments', 'full_database_id', 'hovercard', 'is_pinned', 'is_read_by_viewer', 'linked_branches', 'milestone', 'number', 'participants', 'project_cards', 'project_items', 'state', 'state_reason', 'timeline_items', 'title', 'title_html', 'tracked_in_issues', 'tracked_issues', 'tracked_issues_count')
+        body_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='bodyResourcePath')
+        body_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='bodyUrl')
+        comments = sgqlc.types.Field(sgqlc.types.non_null('IssueCommentConnection'), graphql_name='comments', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg('IssueCommentOrder', graphql_name='orderBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        full_database_id = sgqlc.types.Field('BigInt', graphql_name='fullDatabaseId')
+        hovercard = sgqlc.types.Field(sgqlc.types.non_null('Hovercard'), graphql_name='hovercard', args=sgqlc.types.ArgDict((('include_notification_contexts', sgqlc.types.Arg(github_schema.Boolean, graphql_name='includeNotificationContexts', default=True)),)))
+        is_pinned = sgqlc.types.Field('Boolean', graphql_name='isPinned')
+        is_read_by_viewer = sgqlc.types.Field('Boolean', graphql_name='isReadByViewer')
+        linked_branches = sgqlc.types.Field(sgqlc.types.non_null('LinkedBranchConnection'), graphql_name='linkedBranches', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        milestone = sgqlc.types.Field('Milestone', graphql_name='milestone')
+        number = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='number')
+        participants = sgqlc.types.Field(sgqlc.types.non_null('UserConnection'), graphql_name='participants', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        project_cards = sgqlc.types.Field(sgqlc.types.non_null('ProjectCardConnection'), graphql_name='projectCards', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('archived_states', sgqlc.types.Arg(sgqlc.types.list_of(github_schema.ProjectCardArchivedState), graphql_name='archivedStates', default=('ARCHIVED', 'NOT_ARCHIVED'))))))
+        project_items = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2ItemConnection'), graphql_name='projectItems', args=sgqlc.types.ArgDict((('include_archived', sgqlc.types.Arg(github_schema.Boolean, graphql_name='includeArchived', default=True)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        state = sgqlc.types.Field(sgqlc.types.non_null('IssueState'), graphql_name='state')
+        state_reason = sgqlc.types.Field('IssueStateReason', graphql_name='stateReason')
+        timeline_items = sgqlc.types.Field(sgqlc.types.non_null('IssueTimelineItemsConnection'), graphql_name='timelineItems', args=sgqlc.types.ArgDict((('since', sgqlc.types.Arg('DateTime', graphql_name='since', default=None)), ('skip', sgqlc.types.Arg('Int', graphql_name='skip', default=None)), ('item_types', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('IssueTimelineItemsItemType')), graphql_name='itemTypes', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        title_html = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='titleHTML')
+        tracked_in_issues = sgqlc.types.Field(sgqlc.types.non_null('IssueConnection'), graphql_name='trackedInIssues', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        tracked_issues = sgqlc.types.Field(sgqlc.types.non_null('IssueConnection'), graphql_name='trackedIssues', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        tracked_issues_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='trackedIssuesCount', args=sgqlc.types.ArgDict((('states', sgqlc.types.Arg(sgqlc.types.list_of('TrackedIssueStates'), graphql_name='states', default=None)),)))
+    return Issue
+
+
+def IssueComment():
+    class IssueComment(sgqlc.types.Type, github_schema.Node, github_schema.Comment, github_schema.Deletable, github_schema.Minimizable, github_schema.Updatable, github_schema.UpdatableComment, github_schema.Reactable, github_schema.RepositoryNode):
+        __schema__ = github_schema
+        __field_names__ = ('full_database_id', 'issue', 'pull_request', 'resource_path', 'url')
+        full_database_id = sgqlc.types.Field('BigInt', graphql_name='fullDatabaseId')
+        issue = sgqlc.types.Field(sgqlc.types.non_null('Issue'), graphql_name='issue')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return IssueComment
+
+
+def JoinedGitHubContribution():
+    class JoinedGitHubContribution(sgqlc.types.Type, github_schema.Contribution):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return JoinedGitHubContribution
+
+
+def Label():
+    class Label(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('color', 'created_at', 'description', 'is_default', 'issues', 'name', 'pull_requests', 'repository', 'resource_path', 'updated_at', 'url')
+        color = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='color')
+        created_at = sgqlc.types.Field('DateTime', graphql_name='createdAt')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        is_default = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isDefault')
+        issues = sgqlc.types.Field(sgqlc.types.non_null('IssueConnection'), graphql_name='issues', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg('IssueOrder', graphql_name='orderBy', default=None)), ('labels', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='labels', default=None)), ('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('IssueState')), graphql_name='states', default=None)), ('filter_by', sgqlc.types.Arg('IssueFilters', graphql_name='filterBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        pull_requests = sgqlc.types.Field(sgqlc.types.non_null('PullRequestConnection'), graphql_name='pullRequests', args=sgqlc.types.ArgDict((('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('PullRequestState')), graphql_name='states', default=None)), ('labels', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='labels', default=None)), ('head_ref_name', sgqlc.types.Arg('String', graphql_name='headRefName', default=None)), ('base_ref_name', sgqlc.types.Arg('String', graphql_name='baseRefName', default=None)), ('order_by', sgqlc.types.Arg('IssueOrder', graphql_name='orderBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        updated_at = sgqlc.types.Field('DateTime', graphql_name='updatedAt')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return Label
+
+
+def LabeledEvent():
+    class LabeledEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'label', 'labelable')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        label = sgqlc.types.Field(sgqlc.types.non_null('Label'), graphql_name='label')
+        labelable = sgqlc.types.Field(sgqlc.types.non_null('Labelable'), graphql_name='labelable')
+    return LabeledEvent
+
+
+def Language():
+    class Language(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('color', 'name')
+        color = sgqlc.types.Field('String', graphql_name='color')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+    return Language
+
+
+def License():
+    class License(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('body', 'conditions', 'description', 'featured', 'hidden', 'implementation', 'key', 'limitations', 'name', 'nickname', 'permissions', 'pseudo_license', 'spdx_id', 'url')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        conditions = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('LicenseRule')), graphql_name='conditions')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        featured = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='featured')
+        hidden = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hidden')
+        implementation = sgqlc.types.Field('String', graphql_name='implementation')
+        key = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='key')
+        limitations = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('LicenseRule')), graphql_name='limitations')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        nickname = sgqlc.types.Field('String', graphql_name='nickname')
+        permissions = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('LicenseRule')), graphql_name='permissions')
+        pseudo_license = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='pseudoLicense')
+        spdx_id = sgqlc.types.Field('String', graphql_name='spdxId')
+        url = sgqlc.types.Field('URI', graphql_name='url')
+    return License
+
+
+def LinkedBranch():
+    class LinkedBranch(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('ref',)
+        ref = sgqlc.types.Field('Ref', graphql_name='ref')
+    return LinkedBranch
+
+
+def LockedEvent():
+    class LockedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'lock_reason', 'lockable')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        lock_reason = sgqlc.types.Field('LockReason', graphql_name='lockReason')
+        lockable = sgqlc.types.Field(sgqlc.types.non_null('Lockable'), graphql_name='lockable')
+    return LockedEvent
+
+
+def Mannequin():
+    class Mannequin(sgqlc.types.Type, github_schema.Node, github_schema.Actor, github_schema.UniformResourceLocatable):
+        __schema__ = github_schema
+        __field_names__ = ('claimant', 'created_at', 'database_id', 'email', 'updated_at')
+        claimant = sgqlc.types.Field('User', graphql_name='claimant')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        email = sgqlc.types.Field('String', graphql_name='email')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return Mannequin
+
+
+def MarkedAsDuplicateEvent():
+    class MarkedAsDuplicateEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'canonical', 'created_at', 'duplicate', 'is_cross_repository')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        canonical = sgqlc.types.Field('IssueOrPullRequest', graphql_name='canonical')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        duplicate = sgqlc.types.Field('IssueOrPullRequest', graphql_name='duplicate')
+        is_cross_repository = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isCrossRepository')
+    return MarkedAsDuplicateEvent
+
+
+def MarketplaceCategory():
+    class MarketplaceCategory(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('description', 'how_it_works', 'name', 'primary_listing_count', 'resource_path', 'secondary_listing_count', 'slug', 'url')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        how_it_works = sgqlc.types.Field('String', graphql_name='howItWorks')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        primary_listing_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='primaryListingCount')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        secondary_listing_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='secondaryListingCount')
+        slug = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='slug')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return MarketplaceCategory
+
+
+def MarketplaceListing():
+    class MarketplaceListing(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('app', 'company_url', 'configuration_resource_path', 'configuration_url', 'documentation_url', 'extended_description', 'extended_description_html', 'full_description', 'full_description_html', 'has_published_free_trial_plans', 'has_terms_of_service', 'has_verified_owner', 'how_it_works', 'how_it_works_html', 'installation_url', 'installed_for_viewer', 'is_archived', 'is_draft', 'is_paid', 'is_public', 'is_rejected', 'is_unverified', 'is_unverified_pending', 'is_verification_pending_from_draft', 'is_verification_pending_from_unverified', 'is_verified', 'logo_background_color', 'logo_url', 'name', 'normalized_short_description', 'pricing_url', 'primary_category', 'privacy_policy_url', 'resource_path', 'screenshot_urls', 'secondary_category', 'short_description', 'slug', 'status_url', 'support_email', 'support_url', 'terms_of_service_url', 'url', 'viewer_can_add_plans', 'viewer_can_approve', 'viewer_can_delist', 'viewer_can_edit', 'viewer_can_edit_categories', 'viewer_can_edit_plans', 'viewer_can_redraft', 'viewer_can_reject', 'viewer_can_request_approval', 'viewer_has_purchased', 'viewer_has_purchased_for_all_organizations', 'viewer_is_listing_admin')
+        app = sgqlc.types.Field('App', graphql_name='app')
+        company_url = sgqlc.types.Field('URI', graphql_name='companyUrl')
+        configuration_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='configurationResourcePath')
+        configuration_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='configurationUrl')
+        documentation_url = sgqlc.types.Field('URI', graphql_name='documentationUrl')
+        extended_description = sgqlc.types.Field('String', graphql_name='extendedDescription')
+        extended_description_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='extendedDescriptionHTML')
+        full_description = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='fullDescription')
+        full_description_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='fullDescriptionHTML')
+        has_published_free_trial_plans = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasPublishedFreeTrialPlans')
+        has_terms_of_service = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasTermsOfService')
+        has_verified_owner = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasVerifiedOwner')
+        how_it_works = sgqlc.types.Field('String', graphql_name='howItWorks')
+        how_it_works_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='howItWorksHTML')
+        installation_url = sgqlc.types.Field('URI', graphql_name='installationUrl')
+        installed_for_viewer = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='installedForViewer')
+        is_archived = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isArchived')
+        is_draft = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isDraft')
+        is_paid = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isPaid')
+        is_public = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isPublic')
+        is_rejected = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isRejected')
+        is_unverified = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isUnverified')
+        is_unverified_pending = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isUnverifiedPending')
+        is_verification_pending_from_draft = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isVerificationPendingFromDraft')
+        is_verification_pending_from_unverified = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isVerificationPendingFromUnverified')
+        is_verified = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isVerified')
+        logo_background_color = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='logoBackgroundColor')
+        logo_url = sgqlc.types.Field('URI', graphql_name='logoUrl', args=sgqlc.types.ArgDict((('size', sgqlc.types.Arg(github_schema.Int, graphql_name='size', default=400)),)))
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        normalized_short_description = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='normalizedShortDescription')
+        pricing_url = sgqlc.types.Field('URI', graphql_name='pricingUrl')
+        primary_category = sgqlc.types.Field(sgqlc.types.non_null('MarketplaceCategory'), graphql_name='primaryCategory')
+        privacy_policy_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='privacyPolicyUrl')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        screenshot_urls = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('String')), graphql_name='screenshotUrls')
+        secondary_category = sgqlc.types.Field('MarketplaceCategory', graphql_name='secondaryCategory')
+        short_description = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='shortDescription')
+        slug = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='slug')
+        status_url = sgqlc.types.Field('URI', graphql_name='statusUrl')
+        support_email = sgqlc.types.Field('String', graphql_name='supportEmail')
+        support_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='supportUrl')
+        terms_of_service_url = sgqlc.types.Field('URI', graphql_name='termsOfServiceUrl')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+        viewer_can_add_plans = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanAddPlans')
+        viewer_can_approve = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanApprove')
+        viewer_can_delist = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanDelist')
+        viewer_can_edit = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanEdit')
+        viewer_can_edit_categories = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanEditCategories')
+        viewer_can_edit_plans = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanEditPlans')
+        viewer_can_redraft = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanRedraft')
+        viewer_can_reject = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanReject')
+        viewer_can_request_approval = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanRequestApproval')
+        viewer_has_purchased = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerHasPurchased')
+        viewer_has_purchased_for_all_organizations = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerHasPurchasedForAllOrganizations')
+        viewer_is_listing_admin = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerIsListingAdmin')
+    return MarketplaceListing
+
+
+def MembersCanDeleteReposClearAuditEntry():
+    class MembersCanDeleteReposClearAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.EnterpriseAuditEntryData, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return MembersCanDeleteReposClearAuditEntry
+
+
+def MembersCanDeleteReposDisableAuditEntry():
+    class MembersCanDeleteReposDisableAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.EnterpriseAuditEntryData, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return MembersCanDeleteReposDisableAuditEntry
+
+
+def MembersCanDeleteReposEnableAuditEntry():
+    class MembersCanDeleteReposEnableAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.EnterpriseAuditEntryData, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return MembersCanDeleteReposEnableAuditEntry
+
+
+def MentionedEvent():
+    class MentionedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'database_id')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+    return MentionedEvent
+
+
+def MergeQueue():
+    class MergeQueue(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('configuration', 'entries', 'next_entry_estimated_time_to_merge', 'repository', 'resource_path', 'url')
+        configuration = sgqlc.types.Field('MergeQueueConfiguration', graphql_name='configuration')
+        entries = sgqlc.types.Field('MergeQueueEntryConnection', graphql_name='entries', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        next_entry_estimated_time_to_merge = sgqlc.types.Field('Int', graphql_name='nextEntryEstimatedTimeToMerge')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return MergeQueue
+
+
+def MergeQueueEntry():
+    class MergeQueueEntry(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('base_commit', 'enqueued_at', 'enqueuer', 'estimated_time_to_merge', 'head_commit', 'jump', 'merge_queue', 'position', 'pull_request', 'solo', 'state')
+        base_commit = sgqlc.types.Field('Commit', graphql_name='baseCommit')
+        enqueued_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='enqueuedAt')
+        enqueuer = sgqlc.types.Field(sgqlc.types.non_null('Actor'), graphql_name='enqueuer')
+        estimated_time_to_merge = sgqlc.types.Field('Int', graphql_name='estimatedTimeToMerge')
+        head_commit = sgqlc.types.Field('Commit', graphql_name='headCommit')
+        jump = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='jump')
+        merge_queue = sgqlc.types.Field('MergeQueue', graphql_name='mergeQueue')
+        position = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='position')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+        solo = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='solo')
+        state = sgqlc.types.Field(sgqlc.types.non_null('MergeQueueEntryState'), graphql_name='state')
+    return MergeQueueEntry
+
+
+def MergedEvent():
+    class MergedEvent(sgqlc.types.Type, github_schema.Node, github_schema.UniformResourceLocatable):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'commit', 'created_at', 'merge_ref', 'merge_ref_name', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        commit = sgqlc.types.Field('Commit', graphql_name='commit')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        merge_ref = sgqlc.types.Field('Ref', graphql_name='mergeRef')
+        merge_ref_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='mergeRefName')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+    return MergedEvent
+
+
+def MigrationSource():
+    class MigrationSource(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'type', 'url')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        type = sgqlc.types.Field(sgqlc.types.non_null('MigrationSourceType'), graphql_name='type')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return MigrationSource
+
+
+def Milestone():
+    class Milestone(sgqlc.types.Type, github_schema.Node, github_schema.Closable, github_schema.UniformResourceLocatable):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'creator', 'description', 'due_on', 'issues', 'number', 'progress_percentage', 'pull_requests', 'repository', 'state', 'title', 'updated_at')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        creator = sgqlc.types.Field('Actor', graphql_name='creator')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        due_on = sgqlc.types.Field('DateTime', graphql_name='dueOn')
+        issues = sgqlc.types.Field(sgqlc.types.non_null('IssueConnection'), graphql_name='issues', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg('IssueOrder', graphql_name='orderBy', default=None)), ('labels', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='labels', default=None)), ('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('IssueState')), graphql_name='states', default=None)), ('filter_by', sgqlc.types.Arg('IssueFilters', graphql_name='filterBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        number = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='number')
+        progress_percentage = sgqlc.types.Field(sgqlc.types.non_null('Float'), graphql_name='progressPercentage')
+        pull_requests = sgqlc.types.Field(sgqlc.types.non_null('PullRequestConnection'), graphql_name='pullRequests', args=sgqlc.types.ArgDict((('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('PullRequestState')), graphql_name='states', default=None)), ('labels', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='labels', default=None)), ('head_ref_name', sgqlc.types.Arg('String', graphql_name='headRefName', default=None)), ('base_ref_name', sgqlc.types.Arg('String', graphql_name='baseRefName', default=None)), ('order_by', sgqlc.types.Arg('IssueOrder', graphql_name='orderBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+        state = sgqlc.types.Field(sgqlc.types.non_null('MilestoneState'), graphql_name='state')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return Milestone
+
+
+def MilestonedEvent():
+    class MilestonedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'milestone_title', 'subject')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        milestone_title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='milestoneTitle')
+        subject = sgqlc.types.Field(sgqlc.types.non_null('MilestoneItem'), graphql_name='subject')
+    return MilestonedEvent
+
+
+def MovedColumnsInProjectEvent():
+    class MovedColumnsInProjectEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'database_id')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+    return MovedColumnsInProjectEvent
+
+
+def OIDCProvider():
+    class OIDCProvider(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('enterprise', 'external_identities', 'provider_type', 'tenant_id')
+        enterprise = sgqlc.types.Field('Enterprise', graphql_name='enterprise')
+        external_identities = sgqlc.types.Field(sgqlc.types.non_null('ExternalIdentityConnection'), graphql_name='externalIdentities', args=sgqlc.types.ArgDict((('members_only', sgqlc.types.Arg('Boolean', graphql_name='membersOnly', default=None)), ('login', sgqlc.types.Arg('String', graphql_name='login', default=None)), ('user_name', sgqlc.types.Arg('String', graphql_name='userName', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        provider_type = sgqlc.types.Field(sgqlc.types.non_null('OIDCProviderType'), graphql_name='providerType')
+        tenant_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='tenantId')
+    return OIDCProvider
+
+
+def OauthApplicationCreateAuditEntry():
+    class OauthApplicationCreateAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OauthApplicationAuditEntryData, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('application_url', 'callback_url', 'rate_limit', 'state')
+        application_url = sgqlc.types.Field('URI', graphql_name='applicationUrl')
+        callback_url = sgqlc.types.Field('URI', graphql_name='callbackUrl')
+        rate_limit = sgqlc.types.Field('Int', graphql_name='rateLimit')
+        state = sgqlc.types.Field('OauthApplicationCreateAuditEntryState', graphql_name='state')
+    return OauthApplicationCreateAuditEntry
+
+
+def OrgAddBillingManagerAuditEntry():
+    class OrgAddBillingManagerAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('invitation_email',)
+        invitation_email = sgqlc.types.Field('String', graphql_name='invitationEmail')
+    return OrgAddBillingManagerAuditEntry
+
+
+def OrgAddMemberAuditEntry():
+    class OrgAddMemberAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('permission',)
+        permission = sgqlc.types.Field('OrgAddMemberAuditEntryPermission', graphql_name='permission')
+    return OrgAddMemberAuditEntry
+
+
+def OrgBlockUserAuditEntry():
+    class OrgBlockUserAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('blocked_user', 'blocked_user_name', 'blocked_user_resource_path', 'blocked_user_url')
+        blocked_user = sgqlc.types.Field('User', graphql_name='blockedUser')
+        blocked_user_name = sgqlc.types.Field('String', graphql_name='blockedUserName')
+        blocked_user_resource_path = sgqlc.types.Field('URI', graphql_name='blockedUserResourcePath')
+        blocked_user_url = sgqlc.types.Field('URI', graphql_name='blockedUserUrl')
+    return OrgBlockUserAuditEntry
+
+
+def OrgConfigDisableCollaboratorsOnlyAuditEntry():
+    class OrgConfigDisableCollaboratorsOnlyAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return OrgConfigDisableCollaboratorsOnlyAuditEntry
+
+
+def OrgConfigEnableCollaboratorsOnlyAuditEntry():
+    class OrgConfigEnableCollaboratorsOnlyAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return OrgConfigEnableCollaboratorsOnlyAuditEntry
+
+
+def OrgCreateAuditEntry():
+    class OrgCreateAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('billing_plan',)
+        billing_plan = sgqlc.types.Field('OrgCreateAuditEntryBillingPlan', graphql_name='billingPlan')
+    return OrgCreateAuditEntry
+
+
+def OrgDisableOauthAppRestrictionsAuditEntry():
+    class OrgDisableOauthAppRestrictionsAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return OrgDisableOauthAppRestrictionsAuditEntry
+
+
+def OrgDisableSamlAuditEntry():
+    class OrgDisableSamlAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('digest_method_url', 'issuer_url', 'signature_method_url', 'single_sign_on_url')
+        digest_method_url = sgqlc.types.Field('URI', graphql_name='digestMethodUrl')
+        issuer_url = sgqlc.types.Field('URI', graphql_name='issuerUrl')
+        signature_method_url = sgqlc.types.Field('URI', graphql_name='signatureMethodUrl')
+        single_sign_on_url = sgqlc.types.Field('URI', graphql_name='singleSignOnUrl')
+    return OrgDisableSamlAuditEntry
+
+
+def OrgDisableTwoFactorRequirementAuditEntry():
+    class OrgDisableTwoFactorRequirementAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return OrgDisableTwoFactorRequirementAuditEntry
+
+
+def OrgEnableOauthAppRestrictionsAuditEntry():
+    class OrgEnableOauthAppRestrictionsAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return OrgEnableOauthAppRestrictionsAuditEntry
+
+
+def OrgEnableSamlAuditEntry():
+    class OrgEnableSamlAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('digest_method_url', 'issuer_url', 'signature_method_url', 'single_sign_on_url')
+        digest_method_url = sgqlc.types.Field('URI', graphql_name='digestMethodUrl')
+        issuer_url = sgqlc.types.Field('URI', graphql_name='issuerUrl')
+        signature_method_url = sgqlc.types.Field('URI', graphql_name='signatureMethodUrl')
+        single_sign_on_url = sgqlc.types.Field('URI', graphql_name='singleSignOnUrl')
+    return OrgEnableSamlAuditEntry
+
+
+def OrgEnableTwoFactorRequirementAuditEntry():
+    class OrgEnableTwoFactorRequirementAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return OrgEnableTwoFactorRequirementAuditEntry
+
+
+def OrgInviteMemberAuditEntry():
+    class OrgInviteMemberAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('email', 'organization_invitation')
+        email = sgqlc.types.Field('String', graphql_name='email')
+        organization_invitation = sgqlc.types.Field('OrganizationInvitation', graphql_name='organizationInvitation')
+    return OrgInviteMemberAuditEntry
+
+
+def OrgInviteToBusinessAuditEntry():
+    class OrgInviteToBusinessAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.EnterpriseAuditEntryData, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return OrgInviteToBusinessAuditEntry
+
+
+def OrgOauthAppAccessApprovedAuditEntry():
+    class OrgOauthAppAccessApprovedAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OauthApplicationAuditEntryData, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return OrgOauthAppAccessApprovedAuditEntry
+
+
+def OrgOauthAppAccessDeniedAuditEntry():
+    class OrgOauthAppAccessDeniedAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OauthApplicationAuditEntryData, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return OrgOauthAppAccessDeniedAuditEntry
+
+
+def OrgOauthAppAccessRequestedAuditEntry():
+    class OrgOauthAppAccessRequestedAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OauthApplicationAuditEntryData, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return OrgOauthAppAccessRequestedAuditEntry
+
+
+def OrgRemoveBillingManagerAuditEntry():
+    class OrgRemoveBillingManagerAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('reason',)
+        reason = sgqlc.types.Field('OrgRemoveBillingManagerAuditEntryReason', graphql_name='reason')
+    return OrgRemoveBillingManagerAuditEntry
+
+
+def OrgRemoveMemberAuditEntry():
+    class OrgRemoveMemberAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('membership_types', 'reason')
+        membership_types = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('OrgRemoveMemberAuditEntryMembershipType')), graphql_name='membershipTypes')
+        reason = sgqlc.types.Field('OrgRemoveMemberAuditEntryReason', graphql_name='reason')
+    return OrgRemoveMemberAuditEntry
+
+
+def OrgRemoveOutsideCollaboratorAuditEntry():
+    class OrgRemoveOutsideCollaboratorAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('membership_types', 'reason')
+        membership_types = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('OrgRemoveOutsideCollaboratorAuditEntryMembershipType')), graphql_name='membershipTypes')
+        reason = sgqlc.types.Field('OrgRemoveOutsideCollaboratorAuditEntryReason', graphql_name='reason')
+    return OrgRemoveOutsideCollaboratorAuditEntry
+
+
+def OrgRestoreMemberAuditEntry():
+    class OrgRestoreMemberAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('restored_custom_email_routings_count', 'restored_issue_assignments_count', 'restored_memberships', 'restored_memberships_count', 'restored_repositories_count', 'restored_repository_stars_count', 'restored_repository_watches_count')
+        restored_custom_email_routings_count = sgqlc.types.Field('Int', graphql_name='restoredCustomEmailRoutingsCount')
+        restored_issue_assignments_count = sgqlc.types.Field('Int', graphql_name='restoredIssueAssignmentsCount')
+        restored_memberships = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('OrgRestoreMemberAuditEntryMembership')), graphql_name='restoredMemberships')
+        restored_memberships_count = sgqlc.types.Field('Int', graphql_name='restoredMembershipsCount')
+        restored_repositories_count = sgqlc.types.Field('Int', graphql_name='restoredRepositoriesCount')
+        restored_repository_stars_count = sgqlc.types.Field('Int', graphql_name='restoredRepositoryStarsCount')
+        restored_repository_watches_count = sgqlc.types.Field('Int', graphql_name='restoredRepositoryWatchesCount')
+    return OrgRestoreMemberAuditEntry
+
+
+def OrgRestoreMemberMembershipOrganizationAuditEntryData():
+    class OrgRestoreMemberMembershipOrganizationAuditEntryData(sgqlc.types.Type, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return OrgRestoreMemberMembershipOrganizationAuditEntryData
+
+
+def OrgRestoreMemberMembershipRepositoryAuditEntryData():
+    class OrgRestoreMemberMembershipRepositoryAuditEntryData(sgqlc.types.Type, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return OrgRestoreMemberMembershipRepositoryAuditEntryData
+
+
+def OrgRestoreMemberMembershipTeamAuditEntryData():
+    class OrgRestoreMemberMembershipTeamAuditEntryData(sgqlc.types.Type, github_schema.TeamAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return OrgRestoreMemberMembershipTeamAuditEntryData
+
+
+def OrgUnblockUserAuditEntry():
+    class OrgUnblockUserAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('blocked_user', 'blocked_user_name', 'blocked_user_resource_path', 'blocked_user_url')
+        blocked_user = sgqlc.types.Field('User', graphql_name='blockedUser')
+        blocked_user_name = sgqlc.types.Field('String', graphql_name='blockedUserName')
+        blocked_user_resource_path = sgqlc.types.Field('URI', graphql_name='blockedUserResourcePath')
+        blocked_user_url = sgqlc.types.Field('URI', graphql_name='blockedUserUrl')
+    return OrgUnblockUserAuditEntry
+
+
+def OrgUpdateDefaultRepositoryPermissionAuditEntry():
+    class OrgUpdateDefaultRepositoryPermissionAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('permission', 'permission_was')
+        permission = sgqlc.types.Field('OrgUpdateDefaultRepositoryPermissionAuditEntryPermission', graphql_name='permission')
+        permission_was = sgqlc.types.Field('OrgUpdateDefaultRepositoryPermissionAuditEntryPermission', graphql_name='permissionWas')
+    return OrgUpdateDefaultRepositoryPermissionAuditEntry
+
+
+def OrgUpdateMemberAuditEntry():
+    class OrgUpdateMemberAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('permission', 'permission_was')
+        permission = sgqlc.types.Field('OrgUpdateMemberAuditEntryPermission', graphql_name='permission')
+        permission_was = sgqlc.types.Field('OrgUpdateMemberAuditEntryPermission', graphql_name='permissionWas')
+    return OrgUpdateMemberAuditEntry
+
+
+def OrgUpdateMemberRepositoryCreationPermissionAuditEntry():
+    class OrgUpdateMemberRepositoryCreationPermissionAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('can_create_repositories', 'visibility')
+        can_create_repositories = sgqlc.types.Field('Boolean', graphql_name='canCreateRepositories')
+        visibility = sgqlc.types.Field('OrgUpdateMemberRepositoryCreationPermissionAuditEntryVisibility', graphql_name='visibility')
+    return OrgUpdateMemberRepositoryCreationPermissionAuditEntry
+
+
+def OrgUpdateMemberRepositoryInvitationPermissionAuditEntry():
+    class OrgUpdateMemberRepositoryInvitationPermissionAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('can_invite_outside_collaborators_to_repositories',)
+        can_invite_outside_collaborators_to_repositories = sgqlc.types.Field('Boolean', graphql_name='canInviteOutsideCollaboratorsToRepositories')
+    return OrgUpdateMemberRepositoryInvitationPermissionAuditEntry
+
+
+def Organization():
+    class Organization(sgqlc.types.Type, github_schema.Node, github_schema.Actor, github_schema.PackageOwner, github_schema.ProjectOwner, github_schema.ProjectV2Owner, github_schema.ProjectV2Recent, github_schema.RepositoryDiscussionAuthor, github_schema.RepositoryDiscussionCommentAuthor, github_schema.RepositoryOwner, github_schema.UniformResourceLocatable, github_schema.MemberStatusable, github_schema.ProfileOwner, github_schema.Sponsorable, github_schema.AnnouncementBanner):
+        __schema__ = github_schema
+        __field_names__ = ('audit_log', 'created_at', 'database_id', 'description', 'description_html', 'domains', 'enterprise_owners', 'interaction_ability', 'ip_allow_list_enabled_setting', 'ip_allow_list_entries', 'ip_allow_list_for_installed_apps_enabled_setting', 'is_verified', 'mannequins', 'members_can_fork_private_repositories', 'members_with_role', 'new_team_resource_path', 'new_team_url', 'notification_delivery_restriction_enabled_setting', 'organization_billing_email', 'pending_members', 'repository_migrations', 'requires_two_factor_authentication', 'ruleset', 'rulesets', 'saml_identity_provider', 'team', 'teams', 'teams_resource_path', 'teams_url', 'twitter_username', 'updated_at', 'viewer_can_administer', 'viewer_can_create_repositories', 'viewer_can_create_teams', 'viewer_is_amember', 'viewer_is_following', 'web_commit_signoff_required')
+        audit_log = sgqlc.types.Field(sgqlc.types.non_null('OrganizationAuditEntryConnection'), graphql_name='auditLog', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('order_by', sgqlc.types.Arg(github_schema.AuditLogOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'DESC'})))))
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        description_html = sgqlc.types.Field('String', graphql_name='descriptionHTML')
+        domains = sgqlc.types.Field('VerifiableDomainConnection', graphql_name='domains', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('is_verified', sgqlc.types.Arg('Boolean', graphql_name='isVerified', default=None)), ('is_approved', sgqlc.types.Arg('Boolean', graphql_name='isApproved', default=None)), ('order_by', sgqlc.types.Arg(github_schema.VerifiableDomainOrder, graphql_name='orderBy', default={'field': 'DOMAIN', 'direction': 'ASC'})))))
+        enterprise_owners = sgqlc.types.Field(sgqlc.types.non_null('OrganizationEnterpriseOwnerConnection'), graphql_name='enterpriseOwners', args=sgqlc.types.ArgDict((('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('organization_role', sgqlc.types.Arg('RoleInOrganization', graphql_name='organizationRole', default=None)), ('order_by', sgqlc.types.Arg(github_schema.OrgEnterpriseOwnerOrder, graphql_name='orderBy', default={'field': 'LOGIN', 'direction': 'ASC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        interaction_ability = sgqlc.types.Field('RepositoryInteractionAbility', graphql_name='interactionAbility')
+        ip_allow_list_enabled_setting = sgqlc.types.Field(sgqlc.types.non_null('IpAllowListEnabledSettingValue'), graphql_name='ipAllowListEnabledSetting')
+        ip_allow_list_entries = sgqlc.types.Field(sgqlc.types.non_null('IpAllowListEntryConnection'), graphql_name='ipAllowListEntries', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.IpAllowListEntryOrder, graphql_name='orderBy', default={'field': 'ALLOW_LIST_VALUE', 'direction': 'ASC'})))))
+        ip_allow_list_for_installed_apps_enabled_setting = sgqlc.types.Field(sgqlc.types.non_null('IpAllowListForInstalledAppsEnabledSettingValue'), graphql_name='ipAllowListForInstalledAppsEnabledSetting')
+        is_verified = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isVerified')
+        mannequins = sgqlc.types.Field(sgqlc.types.non_null('MannequinConnection'), graphql_name='mannequins', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.MannequinOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'ASC'})))))
+        members_can_fork_private_repositories = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='membersCanForkPrivateRepositories')
+        members_with_role = sgqlc.types.Field(sgqlc.types.non_null('OrganizationMemberConnection'), graphql_name='membersWithRole', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        new_team_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='newTeamResourcePath')
+        new_team_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='newTeamUrl')
+        notification_delivery_restriction_enabled_setting = sgqlc.types.Field(sgqlc.types.non_null('NotificationRestrictionSettingValue'), graphql_name='notificationDeliveryRestrictionEnabledSetting')
+        organization_billing_email = sgqlc.types.Field('String', graphql_name='organizationBillingEmail')
+        pending_members = sgqlc.types.Field(sgqlc.types.non_null('UserConnection'), graphql_name='pendingMembers', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        repository_migrations = sgqlc.types.Field(sgqlc.types.non_null('RepositoryMigrationConnection'), graphql_name='repositoryMigrations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('state', sgqlc.types.Arg('MigrationState', graphql_name='state', default=None)), ('repository_name', sgqlc.types.Arg('String', graphql_name='repositoryName', default=None)), ('order_by', sgqlc.types.Arg(github_schema.RepositoryMigrationOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'ASC'})))))
+        requires_two_factor_authentication = sgqlc.types.Field('Boolean', graphql_name='requiresTwoFactorAuthentication')
+        ruleset = sgqlc.types.Field('RepositoryRuleset', graphql_name='ruleset', args=sgqlc.types.ArgDict((('database_id', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='databaseId', default=None)),)))
+        rulesets = sgqlc.types.Field('RepositoryRulesetConnection', graphql_name='rulesets', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('include_parents', sgqlc.types.Arg(github_schema.Boolean, graphql_name='includeParents', default=False)))))
+        saml_identity_provider = sgqlc.types.Field('OrganizationIdentityProvider', graphql_name='samlIdentityProvider')
+        team = sgqlc.types.Field('Team', graphql_name='team', args=sgqlc.types.ArgDict((('slug', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='slug', default=None)),)))
+        teams = sgqlc.types.Field(sgqlc.types.non_null('TeamConnection'), graphql_name='teams', args=sgqlc.types.ArgDict((('privacy', sgqlc.types.Arg('TeamPrivacy', graphql_name='privacy', default=None)), ('notification_setting', sgqlc.types.Arg('TeamNotificationSetting', graphql_name='notificationSetting', default=None)), ('role', sgqlc.types.Arg('TeamRole', graphql_name='role', default=None)), ('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('user_logins', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='userLogins', default=None)), ('order_by', sgqlc.types.Arg('TeamOrder', graphql_name='orderBy', default=None)), ('ldap_mapped', sgqlc.types.Arg('Boolean', graphql_name='ldapMapped', default=None)), ('root_teams_only', sgqlc.types.Arg(github_schema.Boolean, graphql_name='rootTeamsOnly', default=False)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        teams_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='teamsResourcePath')
+        teams_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='teamsUrl')
+        twitter_username = sgqlc.types.Field('String', graphql_name='twitterUsername')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        viewer_can_administer = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanAdminister')
+        viewer_can_create_repositories = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanCreateRepositories')
+        viewer_can_create_teams = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanCreateTeams')
+        viewer_is_amember = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerIsAMember')
+        viewer_is_following = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerIsFollowing')
+        web_commit_signoff_required = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='webCommitSignoffRequired')
+    return Organization
+
+
+def OrganizationIdentityProvider():
+    class OrganizationIdentityProvider(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('digest_method', 'external_identities', 'idp_certificate', 'issuer', 'organization', 'signature_method', 'sso_url')
+        digest_method = sgqlc.types.Field('URI', graphql_name='digestMethod')
+        external_identities = sgqlc.types.Field(sgqlc.types.non_null('ExternalIdentityConnection'), graphql_name='externalIdentities', args=sgqlc.types.ArgDict((('members_only', sgqlc.types.Arg('Boolean', graphql_name='membersOnly', default=None)), ('login', sgqlc.types.Arg('String', graphql_name='login', default=None)), ('user_name', sgqlc.types.Arg('String', graphql_name='userName', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        idp_certificate = sgqlc.types.Field('X509Certificate', graphql_name='idpCertificate')
+        issuer = sgqlc.types.Field('String', graphql_name='issuer')
+        organization = sgqlc.types.Field('Organization', graphql_name='organization')
+        signature_method = sgqlc.types.Field('URI', graphql_name='signatureMethod')
+        sso_url = sgqlc.types.Field('URI', graphql_name='ssoUrl')
+    return OrganizationIdentityProvider
+
+
+def OrganizationInvitation():
+    class OrganizationInvitation(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'email', 'invitation_source', 'invitation_type', 'invitee', 'inviter', 'organization', 'role')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        email = sgqlc.types.Field('String', graphql_name='email')
+        invitation_source = sgqlc.types.Field(sgqlc.types.non_null('OrganizationInvitationSource'), graphql_name='invitationSource')
+        invitation_type = sgqlc.types.Field(sgqlc.types.non_null('OrganizationInvitationType'), graphql_name='invitationType')
+        invitee = sgqlc.types.Field('User', graphql_name='invitee')
+        inviter = sgqlc.types.Field(sgqlc.types.non_null('User'), graphql_name='inviter')
+        organization = sgqlc.types.Field(sgqlc.types.non_null('Organization'), graphql_name='organization')
+        role = sgqlc.types.Field(sgqlc.types.non_null('OrganizationInvitationRole'), graphql_name='role')
+    return OrganizationInvitation
+
+
+def OrganizationMigration():
+    class OrganizationMigration(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'database_id', 'failure_reason', 'remaining_repositories_count', 'source_org_name', 'source_org_url', 'state', 'target_org_name', 'total_repositories_count')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('String', graphql_name='databaseId')
+        failure_reason = sgqlc.types.Field('String', graphql_name='failureReason')
+        remaining_repositories_count = sgqlc.types.Field('Int', graphql_name='remainingRepositoriesCount')
+        source_org_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='sourceOrgName')
+        source_org_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='sourceOrgUrl')
+        state = sgqlc.types.Field(sgqlc.types.non_null('OrganizationMigrationState'), graphql_name='state')
+        target_org_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='targetOrgName')
+        total_repositories_count = sgqlc.types.Field('Int', graphql_name='totalRepositoriesCount')
+    return OrganizationMigration
+
+
+def OrganizationTeamsHovercardContext():
+    class OrganizationTeamsHovercardContext(sgqlc.types.Type, github_schema.HovercardContext):
+        __schema__ = github_schema
+        __field_names__ = ('relevant_teams', 'teams_resource_path', 'teams_url', 'total_team_count')
+        relevant_teams = sgqlc.types.Field(sgqlc.types.non_null('TeamConnection'), graphql_name='relevantTeams', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        teams_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='teamsResourcePath')
+        teams_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='teamsUrl')
+        total_team_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalTeamCount')
+    return OrganizationTeamsHovercardContext
+
+
+def OrganizationsHovercardContext():
+    class OrganizationsHovercardContext(sgqlc.types.Type, github_schema.HovercardContext):
+        __schema__ = github_schema
+        __field_names__ = ('relevant_organizations', 'total_organization_count')
+        relevant_organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='relevantOrganizations', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg('OrganizationOrder', graphql_name='orderBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        total_organization_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalOrganizationCount')
+    return OrganizationsHovercardContext
+
+
+def Package():
+    class Package(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('latest_version', 'name', 'package_type', 'repository', 'statistics', 'version', 'versions')
+        latest_version = sgqlc.types.Field('PackageVersion', graphql_name='latestVersion')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        package_type = sgqlc.types.Field(sgqlc.types.non_null('PackageType'), graphql_name='packageType')
+        repository = sgqlc.types.Field('Repository', graphql_name='repository')
+        statistics = sgqlc.types.Field('PackageStatistics', graphql_name='statistics')
+        version = sgqlc.types.Field('PackageVersion', graphql_name='version', args=sgqlc.types.ArgDict((('version', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='version', default=None)),)))
+        versions = sgqlc.types.Field(sgqlc.types.non_null('PackageVersionConnection'), graphql_name='versions', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg(github_schema.PackageVersionOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'DESC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return Package
+
+
+def PackageFile():
+    class PackageFile(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('md5', 'name', 'package_version', 'sha1', 'sha256', 'size', 'updated_at', 'url')
+        md5 = sgqlc.types.Field('String', graphql_name='md5')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        package_version = sgqlc.types.Field('PackageVersion', graphql_name='packageVersion')
+        sha1 = sgqlc.types.Field('String', graphql_name='sha1')
+        sha256 = sgqlc.types.Field('String', graphql_name='sha256')
+        size = sgqlc.types.Field('Int', graphql_name='size')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        url = sgqlc.types.Field('URI', graphql_name='url')
+    return PackageFile
+
+
+def PackageTag():
+    class PackageTag(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'version')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        version = sgqlc.types.Field('PackageVersion', graphql_name='version')
+    return PackageTag
+
+
+def PackageVersion():
+    class PackageVersion(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('files', 'package', 'platform', 'pre_release', 'readme', 'release', 'statistics', 'summary', 'version')
+        files = sgqlc.types.Field(sgqlc.types.non_null('PackageFileConnection'), graphql_name='files', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg(github_schema.PackageFileOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'ASC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        package = sgqlc.types.Field('Package', graphql_name='package')
+        platform = sgqlc.types.Field('String', graphql_name='platform')
+        pre_release = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='preRelease')
+        readme = sgqlc.types.Field('String', graphql_name='readme')
+        release = sgqlc.types.Field('Release', graphql_name='release')
+        statistics = sgqlc.types.Field('PackageVersionStatistics', graphql_name='statistics')
+        summary = sgqlc.types.Field('String', graphql_name='summary')
+        version = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='version')
+    return PackageVersion
+
+
+def PinnedDiscussion():
+    class PinnedDiscussion(sgqlc.types.Type, github_schema.Node, github_schema.RepositoryNode):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'database_id', 'discussion', 'gradient_stop_colors', 'pattern', 'pinned_by', 'preconfigured_gradient', 'updated_at')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        discussion = sgqlc.types.Field(sgqlc.types.non_null('Discussion'), graphql_name='discussion')
+        gradient_stop_colors = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='gradientStopColors')
+        pattern = sgqlc.types.Field(sgqlc.types.non_null('PinnedDiscussionPattern'), graphql_name='pattern')
+        pinned_by = sgqlc.types.Field(sgqlc.types.non_null('Actor'), graphql_name='pinnedBy')
+        preconfigured_gradient = sgqlc.types.Field('PinnedDiscussionGradient', graphql_name='preconfiguredGradient')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return PinnedDiscussion
+
+
+def PinnedEvent():
+    class PinnedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'issue')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        issue = sgqlc.types.Field(sgqlc.types.non_null('Issue'), graphql_name='issue')
+    return PinnedEvent
+
+
+def PinnedIssue():
+    class PinnedIssue(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('database_id', 'full_database_id', 'issue', 'pinned_by', 'repository')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        full_database_id = sgqlc.types.Field('BigInt', graphql_name='fullDatabaseId')
+        issue = sgqlc.types.Field(sgqlc.types.non_null('Issue'), graphql_name='issue')
+        pinned_by = sgqlc.types.Field(sgqlc.types.non_null('Actor'), graphql_name='pinnedBy')
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+    return PinnedIssue
+
+
+def PrivateRepositoryForkingDisableAuditEntry():
+    class PrivateRepositoryForkingDisableAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.EnterpriseAuditEntryData, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return PrivateRepositoryForkingDisableAuditEntry
+
+
+def PrivateRepositoryForkingEnableAuditEntry():
+    class PrivateRepositoryForkingEnableAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.EnterpriseAuditEntryData, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return PrivateRepositoryForkingEnableAuditEntry
+
+
+def Project():
+    class Project(sgqlc.types.Type, github_schema.Node, github_schema.Closable, github_schema.Updatable):
+        __schema__ = github_schema
+        __field_names__ = ('body', 'body_html', 'columns', 'created_at', 'creator', 'database_id', 'name', 'number', 'owner', 'pending_cards', 'progress', 'resource_path', 'state', 'updated_at', 'url')
+        body = sgqlc.types.Field('String', graphql_name='body')
+        body_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='bodyHTML')
+        columns = sgqlc.types.Field(sgqlc.types.non_null('ProjectColumnConnection'), graphql_name='columns', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        creator = sgqlc.types.Field('Actor', graphql_name='creator')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        number = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='number')
+        owner = sgqlc.types.Field(sgqlc.types.non_null('ProjectOwner'), graphql_name='owner')
+        pending_cards = sgqlc.types.Field(sgqlc.types.non_null('ProjectCardConnection'), graphql_name='pendingCards', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('archived_states', sgqlc.types.Arg(sgqlc.types.list_of(github_schema.ProjectCardArchivedState), graphql_name='archivedStates', default=('ARCHIVED', 'NOT_ARCHIVED'))))))
+        progress = sgqlc.types.Field(sgqlc.types.non_null('ProjectProgress'), graphql_name='progress')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        state = sgqlc.types.Field(sgqlc.types.non_null('ProjectState'), graphql_name='state')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return Project
+
+
+def ProjectCard():
+    class ProjectCard(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('column', 'content', 'created_at', 'creator', 'database_id', 'is_archived', 'note', 'project', 'resource_path', 'state', 'updated_at', 'url')
+        column = sgqlc.types.Field('ProjectColumn', graphql_name='column')
+        content = sgqlc.types.Field('ProjectCardItem', graphql_name='content')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        creator = sgqlc.types.Field('Actor', graphql_name='creator')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        is_archived = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isArchived')
+        note = sgqlc.types.Field('String', graphql_name='note')
+        project = sgqlc.types.Field(sgqlc.types.non_null('Project'), graphql_name='project')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        state = sgqlc.types.Field('ProjectCardState', graphql_name='state')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return ProjectCard
+
+
+def ProjectColumn():
+    class ProjectColumn(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('cards', 'created_at', 'database_id', 'name', 'project', 'purpose', 'resource_path', 'updated_at', 'url')
+        cards = sgqlc.types.Field(sgqlc.types.non_null('ProjectCardConnection'), graphql_name='cards', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('archived_states', sgqlc.types.Arg(sgqlc.types.list_of(github_schema.ProjectCardArchivedState), graphql_name='archivedStates', default=('ARCHIVED', 'NOT_ARCHIVED'))))))
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        project = sgqlc.types.Field(sgqlc.types.non_null('Project'), graphql_name='project')
+        purpose = sgqlc.types.Field('ProjectColumnPurpose', graphql_name='purpose')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return ProjectColumn
+
+
+def ProjectV2():
+    class ProjectV2(sgqlc.types.Type, github_schema.Closable, github_schema.Updatable, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'creator', 'database_id', 'field', 'fields', 'items', 'number', 'owner', 'public', 'readme', 'repositories', 'resource_path', 'short_description', 'teams', 'template', 'title', 'updated_at', 'url', 'view', 'views', 'workflow', 'workflows')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        creator = sgqlc.types.Field('Actor', graphql_name='creator')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        field = sgqlc.types.Field('ProjectV2FieldConfiguration', graphql_name='field', args=sgqlc.types.ArgDict((('name', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='name', default=None)),)))
+        fields = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2FieldConfigurationConnection'), graphql_name='fields', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ProjectV2FieldOrder, graphql_name='orderBy', default={'field': 'POSITION', 'direction': 'ASC'})))))
+        items = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2ItemConnection'), graphql_name='items', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ProjectV2ItemOrder, graphql_name='orderBy', default={'field': 'POSITION', 'direction': 'ASC'})))))
+        number = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='number')
+        owner = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2Owner'), graphql_name='owner')
+        public = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='public')
+        readme = sgqlc.types.Field('String', graphql_name='readme')
+        repositories = sgqlc.types.Field(sgqlc.types.non_null('RepositoryConnection'), graphql_name='repositories', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.RepositoryOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'DESC'})))))
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        short_description = sgqlc.types.Field('String', graphql_name='shortDescription')
+        teams = sgqlc.types.Field(sgqlc.types.non_null('TeamConnection'), graphql_name='teams', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.TeamOrder, graphql_name='orderBy', default={'field': 'NAME', 'direction': 'ASC'})))))
+        template = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='template')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+        view = sgqlc.types.Field('ProjectV2View', graphql_name='view', args=sgqlc.types.ArgDict((('number', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='number', default=None)),)))
+        views = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2ViewConnection'), graphql_name='views', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ProjectV2ViewOrder, graphql_name='orderBy', default={'field': 'POSITION', 'direction': 'ASC'})))))
+        workflow = sgqlc.types.Field('ProjectV2Workflow', graphql_name='workflow', args=sgqlc.types.ArgDict((('number', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='number', default=None)),)))
+        workflows = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2WorkflowConnection'), graphql_name='workflows', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ProjectV2WorkflowOrder, graphql_name='orderBy', default={'field': 'NAME', 'direction': 'ASC'})))))
+    return ProjectV2
+
+
+def ProjectV2Field():
+    class ProjectV2Field(sgqlc.types.Type, github_schema.ProjectV2FieldCommon, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return ProjectV2Field
+
+
+def ProjectV2Item():
+    class ProjectV2Item(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('content', 'created_at', 'creator', 'database_id', 'field_value_by_name', 'field_values', 'is_archived', 'project', 'type', 'updated_at')
+        content = sgqlc.types.Field('ProjectV2ItemContent', graphql_name='content')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        creator = sgqlc.types.Field('Actor', graphql_name='creator')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        field_value_by_name = sgqlc.types.Field('ProjectV2ItemFieldValue', graphql_name='fieldValueByName', args=sgqlc.types.ArgDict((('name', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='name', default=None)),)))
+        field_values = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2ItemFieldValueConnection'), graphql_name='fieldValues', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ProjectV2ItemFieldValueOrder, graphql_name='orderBy', default={'field': 'POSITION', 'direction': 'ASC'})))))
+        is_archived = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isArchived')
+        project = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2'), graphql_name='project')
+        type = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2ItemType'), graphql_name='type')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return ProjectV2Item
+
+
+def ProjectV2ItemFieldDateValue():
+    class ProjectV2ItemFieldDateValue(sgqlc.types.Type, github_schema.ProjectV2ItemFieldValueCommon, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('date',)
+        date = sgqlc.types.Field('Date', graphql_name='date')
+    return ProjectV2ItemFieldDateValue
+
+
+def ProjectV2ItemFieldIterationValue():
+    class ProjectV2ItemFieldIterationValue(sgqlc.types.Type, github_schema.ProjectV2ItemFieldValueCommon, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('duration', 'iteration_id', 'start_date', 'title', 'title_html')
+        duration = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='duration')
+        iteration_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='iterationId')
+        start_date = sgqlc.types.Field(sgqlc.types.non_null('Date'), graphql_name='startDate')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        title_html = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='titleHTML')
+    return ProjectV2ItemFieldIterationValue
+
+
+def ProjectV2ItemFieldNumberValue():
+    class ProjectV2ItemFieldNumberValue(sgqlc.types.Type, github_schema.ProjectV2ItemFieldValueCommon, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('number',)
+        number = sgqlc.types.Field('Float', graphql_name='number')
+    return ProjectV2ItemFieldNumberValue
+
+
+def ProjectV2ItemFieldSingleSelectValue():
+    class ProjectV2ItemFieldSingleSelectValue(sgqlc.types.Type, github_schema.ProjectV2ItemFieldValueCommon, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'name_html', 'option_id')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_html = sgqlc.types.Field('String', graphql_name='nameHTML')
+        option_id = sgqlc.types.Field('String', graphql_name='optionId')
+    return ProjectV2ItemFieldSingleSelectValue
+
+
+def ProjectV2ItemFieldTextValue():
+    class ProjectV2ItemFieldTextValue(sgqlc.types.Type, github_schema.ProjectV2ItemFieldValueCommon, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('text',)
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return ProjectV2ItemFieldTextValue
+
+
+def ProjectV2IterationField():
+    class ProjectV2IterationField(sgqlc.types.Type, github_schema.ProjectV2FieldCommon, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('configuration',)
+        configuration = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2IterationFieldConfiguration'), graphql_name='configuration')
+    return ProjectV2IterationField
+
+
+def ProjectV2SingleSelectField():
+    class ProjectV2SingleSelectField(sgqlc.types.Type, github_schema.ProjectV2FieldCommon, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('options',)
+        options = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ProjectV2SingleSelectFieldOption'))), graphql_name='options', args=sgqlc.types.ArgDict((('names', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='names', default=None)),)))
+    return ProjectV2SingleSelectField
+
+
+def ProjectV2View():
+    class ProjectV2View(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'database_id', 'fields', 'filter', 'group_by_fields', 'layout', 'name', 'number', 'project', 'sort_by_fields', 'updated_at', 'vertical_group_by_fields')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        fields = sgqlc.types.Field('ProjectV2FieldConfigurationConnection', graphql_name='fields', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ProjectV2FieldOrder, graphql_name='orderBy', default={'field': 'POSITION', 'direction': 'ASC'})))))
+        filter = sgqlc.types.Field('String', graphql_name='filter')
+        group_by_fields = sgqlc.types.Field('ProjectV2FieldConfigurationConnection', graphql_name='groupByFields', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ProjectV2FieldOrder, graphql_name='orderBy', default={'field': 'POSITION', 'direction': 'ASC'})))))
+        layout = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2ViewLayout'), graphql_name='layout')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        number = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='number')
+        project = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2'), graphql_name='project')
+        sort_by_fields = sgqlc.types.Field('ProjectV2SortByFieldConnection', graphql_name='sortByFields', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        vertical_group_by_fields = sgqlc.types.Field('ProjectV2FieldConfigurationConnection', graphql_name='verticalGroupByFields', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ProjectV2FieldOrder, graphql_name='orderBy', default={'field': 'POSITION', 'direction': 'ASC'})))))
+    return ProjectV2View
+
+
+def ProjectV2Workflow():
+    class ProjectV2Workflow(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'database_id', 'enabled', 'name', 'number', 'project', 'updated_at')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        enabled = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='enabled')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        number = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='number')
+        project = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2'), graphql_name='project')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return ProjectV2Workflow
+
+
+def PublicKey():
+    class PublicKey(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('accessed_at', 'created_at', 'fingerprint', 'is_read_only', 'key', 'updated_at')
+        accessed_at = sgqlc.types.Field('DateTime', graphql_name='accessedAt')
+        created_at = sgqlc.types.Field('DateTime', graphql_name='createdAt')
+        fingerprint = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='fingerprint')
+        is_read_only = sgqlc.types.Field('Boolean', graphql_name='isReadOnly')
+        key = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='key')
+        updated_at = sgqlc.types.Field('DateTime', graphql_name='updatedAt')
+    return PublicKey
+
+
+def PullRequest():
+    class PullRequest(sgqlc.types.Type, github_schema.Node, github_schema.Assignable, github_schema.Closable, github_schema.Comment, github_schema.Updatable, github_schema.UpdatableComment, github_schema.Labelable, github_schema.Lockable, github_schema.Reactable, github_schema.RepositoryNode, github_schema.Subscribable, github_schema.UniformResourceLocatable, github_schema.ProjectV2Owner):
+        __schema__ = github_schema
+        __field_names__ = ('additions', 'auto_merge_request', 'base_ref', 'base_ref_name', 'base_ref_oid', 'base_repository', 'changed_files', 'checks_resource_path', 'checks_url', 'closing_issues_references', 'comments', 'commits', 'deletions', 'files', 'head_ref', 'head_ref_name', 'head_ref_oid', 'head_repository', 'head_repository_owner', 'hovercard', 'is_cross_repository', 'is_draft', 'is_read_by_viewer', 'latest_opinionated_reviews', 'latest_reviews', 'maintainer_can_modify', 'merge_commit', 'merge_queue_entry', 'mergeable', 'merged', 'merged_at', 'merged_by', 'milestone', 'number', 'participants', 'permalink', 'potential_merge_commit', 'project_cards', 'project_items', 'revert_resource_path', 'revert_url', 'review_decision', 'review_requests', 'review_threads', 'reviews', 'state', 'suggested_reviewers', 'timeline_items', 'title', 'title_html', 'total_comments_count', 'viewer_can_apply_suggestion', 'viewer_can_delete_head_ref', 'viewer_can_disable_auto_merge', 'viewer_can_edit_files', 'viewer_can_enable_auto_merge', 'viewer_can_merge_as_admin', 'viewer_can_update_branch', 'viewer_latest_review', 'viewer_latest_review_request', 'viewer_merge_body_text', 'viewer_merge_headline_text')
+        additions = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='additions')
+        auto_merge_request = sgqlc.types.Field('AutoMergeRequest', graphql_name='autoMergeRequest')
+        base_ref = sgqlc.types.Field('Ref', graphql_name='baseRef')
+        base_ref_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='baseRefName')
+        base_ref_oid = sgqlc.types.Field(sgqlc.types.non_null('GitObjectID'), graphql_name='baseRefOid')
+        base_repository = sgqlc.types.Field('Repository', graphql_name='baseRepository')
+        changed_files = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='changedFiles')
+        checks_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='checksResourcePath')
+        checks_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='checksUrl')
+        closing_issues_references = sgqlc.types.Field('IssueConnection', graphql_name='closingIssuesReferences', args=sgqlc.types.ArgDict((('user_linked_only', sgqlc.types.Arg(github_schema.Boolean, graphql_name='userLinkedOnly', default=False)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg('IssueOrder', graphql_name='orderBy', default=None)))))
+        comments = sgqlc.types.Field(sgqlc.types.non_null('IssueCommentConnection'), graphql_name='comments', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg('IssueCommentOrder', graphql_name='orderBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        commits = sgqlc.types.Field(sgqlc.types.non_null('PullRequestCommitConnection'), graphql_name='commits', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        deletions = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='deletions')
+        files = sgqlc.types.Field('PullRequestChangedFileConnection', graphql_name='files', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        head_ref = sgqlc.types.Field('Ref', graphql_name='headRef')
+        head_ref_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='headRefName')
+        head_ref_oid = sgqlc.types.Field(sgqlc.types.non_null('GitObjectID'), graphql_name='headRefOid')
+        head_repository = sgqlc.types.Field('Repository', graphql_name='headRepository')
+        head_repository_owner = sgqlc.types.Field('RepositoryOwner', graphql_name='headRepositoryOwner')
+        hovercard = sgqlc.types.Field(sgqlc.types.non_null('Hovercard'), graphql_name='hovercard', args=sgqlc.types.ArgDict((('include_notification_contexts', sgqlc.types.Arg(github_schema.Boolean, graphql_name='includeNotificationContexts', default=True)),)))
+        is_cross_repository = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isCrossRepository')
+        is_draft = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isDraft')
+        is_read_by_viewer = sgqlc.types.Field('Boolean', graphql_name='isReadByViewer')
+        latest_opinionated_reviews = sgqlc.types.Field('PullRequestReviewConnection', graphql_name='latestOpinionatedReviews', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('writers_only', sgqlc.types.Arg(github_schema.Boolean, graphql_name='writersOnly', default=False)))))
+        latest_reviews = sgqlc.types.Field('PullRequestReviewConnection', graphql_name='latestReviews', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        maintainer_can_modify = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='maintainerCanModify')
+        merge_commit = sgqlc.types.Field('Commit', graphql_name='mergeCommit')
+        merge_queue_entry = sgqlc.types.Field('MergeQueueEntry', graphql_name='mergeQueueEntry')
+        mergeable = sgqlc.types.Field(sgqlc.types.non_null('MergeableState'), graphql_name='mergeable')
+        merged = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='merged')
+        merged_at = sgqlc.types.Field('DateTime', graphql_name='mergedAt')
+        merged_by = sgqlc.types.Field('Actor', graphql_name='mergedBy')
+        milestone = sgqlc.types.Field('Milestone', graphql_name='milestone')
+        number = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='number')
+        participants = sgqlc.types.Field(sgqlc.types.non_null('UserConnection'), graphql_name='participants', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        permalink = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='permalink')
+        potential_merge_commit = sgqlc.types.Field('Commit', graphql_name='potentialMergeCommit')
+        project_cards = sgqlc.types.Field(sgqlc.types.non_null('ProjectCardConnection'), graphql_name='projectCards', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('archived_states', sgqlc.types.Arg(sgqlc.types.list_of(github_schema.ProjectCardArchivedState), graphql_name='archivedStates', default=('ARCHIVED', 'NOT_ARCHIVED'))))))
+        project_items = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2ItemConnection'), graphql_name='projectItems', args=sgqlc.types.ArgDict((('include_archived', sgqlc.types.Arg(github_schema.Boolean, graphql_name='includeArchived', default=True)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        revert_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='revertResourcePath')
+        revert_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='revertUrl')
+        review_decision = sgqlc.types.Field('PullRequestReviewDecision', graphql_name='reviewDecision')
+        review_requests = sgqlc.types.Field('ReviewRequestConnection', graphql_name='reviewRequests', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        review_threads = sgqlc.types.Field(sgqlc.types.non_null('PullRequestReviewThreadConnection'), graphql_name='reviewThreads', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        reviews = sgqlc.types.Field('PullRequestReviewConnection', graphql_name='reviews', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('PullRequestReviewState')), graphql_name='states', default=None)), ('author', sgqlc.types.Arg('String', graphql_name='author', default=None)))))
+        state = sgqlc.types.Field(sgqlc.types.non_null('PullRequestState'), graphql_name='state')
+        suggested_reviewers = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('SuggestedReviewer')), graphql_name='suggestedReviewers')
+        timeline_items = sgqlc.types.Field(sgqlc.types.non_null('PullRequestTimelineItemsConnection'), graphql_name='timelineItems', args=sgqlc.types.ArgDict((('since', sgqlc.types.Arg('DateTime', graphql_name='since', default=None)), ('skip', sgqlc.types.Arg('Int', graphql_name='skip', default=None)), ('item_types', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('PullRequestTimelineItemsItemType')), graphql_name='itemTypes', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        title_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='titleHTML')
+        total_comments_count = sgqlc.types.Field('Int', graphql_name='totalCommentsCount')
+        viewer_can_apply_suggestion = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanApplySuggestion')
+        viewer_can_delete_head_ref = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanDeleteHeadRef')
+        viewer_can_disable_auto_merge = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanDisableAutoMerge')
+        viewer_can_edit_files = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanEditFiles')
+        viewer_can_enable_auto_merge = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanEnableAutoMerge')
+        viewer_can_merge_as_admin = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanMergeAsAdmin')
+        viewer_can_update_branch = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanUpdateBranch')
+        viewer_latest_review = sgqlc.types.Field('PullRequestReview', graphql_name='viewerLatestReview')
+        viewer_latest_review_request = sgqlc.types.Field('ReviewRequest', graphql_name='viewerLatestReviewRequest')
+        viewer_merge_body_text = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='viewerMergeBodyText', args=sgqlc.types.ArgDict((('merge_type', sgqlc.types.Arg('PullRequestMergeMethod', graphql_name='mergeType', default=None)),)))
+        viewer_merge_headline_text = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='viewerMergeHeadlineText', args=sgqlc.types.ArgDict((('merge_type', sgqlc.types.Arg('PullRequestMergeMethod', graphql_name='mergeType', default=None)),)))
+    return PullRequest
+
+
+def PullRequestCommit():
+    class PullRequestCommit(sgqlc.types.Type, github_schema.Node, github_schema.UniformResourceLocatable):
+        __schema__ = github_schema
+        __field_names__ = ('commit', 'pull_request')
+        commit = sgqlc.types.Field(sgqlc.types.non_null('Commit'), graphql_name='commit')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+    return PullRequestCommit
+
+
+def PullRequestCommitCommentThread():
+    class PullRequestCommitCommentThread(sgqlc.types.Type, github_schema.RepositoryNode, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('comments', 'commit', 'path', 'position', 'pull_request')
+        comments = sgqlc.types.Field(sgqlc.types.non_null('CommitCommentConnection'), graphql_name='comments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        commit = sgqlc.types.Field(sgqlc.types.non_null('Commit'), graphql_name='commit')
+        path = sgqlc.types.Field('String', graphql_name='path')
+        position = sgqlc.types.Field('Int', graphql_name='position')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+    return PullRequestCommitCommentThread
+
+
+def PullRequestReview():
+    class PullRequestReview(sgqlc.types.Type, github_schema.Node, github_schema.Comment, github_schema.Deletable, github_schema.Updatable, github_schema.UpdatableComment, github_schema.Reactable, github_schema.RepositoryNode):
+        __schema__ = github_schema
+        __field_names__ = ('author_can_push_to_repository', 'comments', 'commit', 'on_behalf_of', 'pull_request', 'resource_path', 'state', 'submitted_at', 'url')
+        author_can_push_to_repository = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='authorCanPushToRepository')
+        comments = sgqlc.types.Field(sgqlc.types.non_null('PullRequestReviewCommentConnection'), graphql_name='comments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        commit = sgqlc.types.Field('Commit', graphql_name='commit')
+        on_behalf_of = sgqlc.types.Field(sgqlc.types.non_null('TeamConnection'), graphql_name='onBehalfOf', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        state = sgqlc.types.Field(sgqlc.types.non_null('PullRequestReviewState'), graphql_name='state')
+        submitted_at = sgqlc.types.Field('DateTime', graphql_name='submittedAt')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return PullRequestReview
+
+
+def PullRequestReviewComment():
+    class PullRequestReviewComment(sgqlc.types.Type, github_schema.Node, github_schema.Comment, github_schema.Deletable, github_schema.Minimizable, github_schema.Updatable, github_schema.UpdatableComment, github_schema.Reactable, github_schema.RepositoryNode):
+        __schema__ = github_schema
+        __field_names__ = ('commit', 'diff_hunk', 'drafted_at', 'line', 'original_commit', 'original_line', 'original_start_line', 'outdated', 'path', 'pull_request', 'pull_request_review', 'reply_to', 'resource_path', 'start_line', 'state', 'subject_type', 'url')
+        commit = sgqlc.types.Field('Commit', graphql_name='commit')
+        diff_hunk = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='diffHunk')
+        drafted_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='draftedAt')
+        line = sgqlc.types.Field('Int', graphql_name='line')
+        original_commit = sgqlc.types.Field('Commit', graphql_name='originalCommit')
+        original_line = sgqlc.types.Field('Int', graphql_name='originalLine')
+        original_start_line = sgqlc.types.Field('Int', graphql_name='originalStartLine')
+        outdated = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='outdated')
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+        pull_request_review = sgqlc.types.Field('PullRequestReview', graphql_name='pullRequestReview')
+        reply_to = sgqlc.types.Field('PullRequestReviewComment', graphql_name='replyTo')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        start_line = sgqlc.types.Field('Int', graphql_name='startLine')
+        state = sgqlc.types.Field(sgqlc.types.non_null('PullRequestReviewCommentState'), graphql_name='state')
+        subject_type = sgqlc.types.Field(sgqlc.types.non_null('PullRequestReviewThreadSubjectType'), graphql_name='subjectType')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return PullRequestReviewComment
+
+
+def PullRequestReviewThread():
+    class PullRequestReviewThread(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('comments', 'diff_side', 'is_collapsed', 'is_outdated', 'is_resolved', 'line', 'original_line', 'original_start_line', 'path', 'pull_request', 'repository', 'resolved_by', 'start_diff_side', 'start_line', 'subject_type', 'viewer_can_reply', 'viewer_can_resolve', 'viewer_can_unresolve')
+        comments = sgqlc.types.Field(sgqlc.types.non_null('PullRequestReviewCommentConnection'), graphql_name='comments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('skip', sgqlc.types.Arg('Int', graphql_name='skip', default=None)))))
+        diff_side = sgqlc.types.Field(sgqlc.types.non_null('DiffSide'), graphql_name='diffSide')
+        is_collapsed = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isCollapsed')
+        is_outdated = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isOutdated')
+        is_resolved = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isResolved')
+        line = sgqlc.types.Field('Int', graphql_name='line')
+        original_line = sgqlc.types.Field('Int', graphql_name='originalLine')
+        original_start_line = sgqlc.types.Field('Int', graphql_name='originalStartLine')
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+        resolved_by = sgqlc.types.Field('User', graphql_name='resolvedBy')
+        start_diff_side = sgqlc.types.Field('DiffSide', graphql_name='startDiffSide')
+        start_line = sgqlc.types.Field('Int', graphql_name='startLine')
+        subject_type = sgqlc.types.Field(sgqlc.types.non_null('PullRequestReviewThreadSubjectType'), graphql_name='subjectType')
+        viewer_can_reply = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanReply')
+        viewer_can_resolve = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanResolve')
+        viewer_can_unresolve = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanUnresolve')
+    return PullRequestReviewThread
+
+
+def PullRequestThread():
+    class PullRequestThread(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('comments', 'diff_side', 'is_collapsed', 'is_outdated', 'is_resolved', 'line', 'pull_request', 'repository', 'resolved_by', 'start_diff_side', 'start_line', 'viewer_can_reply', 'viewer_can_resolve', 'viewer_can_unresolve')
+        comments = sgqlc.types.Field(sgqlc.types.non_null('PullRequestReviewCommentConnection'), graphql_name='comments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('skip', sgqlc.types.Arg('Int', graphql_name='skip', default=None)))))
+        diff_side = sgqlc.types.Field(sgqlc.types.non_null('DiffSide'), graphql_name='diffSide')
+        is_collapsed = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isCollapsed')
+        is_outdated = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isOutdated')
+        is_resolved = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isResolved')
+        line = sgqlc.types.Field('Int', graphql_name='line')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+        resolved_by = sgqlc.types.Field('User', graphql_name='resolvedBy')
+        start_diff_side = sgqlc.types.Field('DiffSide', graphql_name='startDiffSide')
+        start_line = sgqlc.types.Field('Int', graphql_name='startLine')
+        viewer_can_reply = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanReply')
+        viewer_can_resolve = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanResolve')
+        viewer_can_unresolve = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanUnresolve')
+    return PullRequestThread
+
+
+def Push():
+    class Push(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('next_sha', 'permalink', 'previous_sha', 'pusher', 'repository')
+        next_sha = sgqlc.types.Field('GitObjectID', graphql_name='nextSha')
+        permalink = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='permalink')
+        previous_sha = sgqlc.types.Field('GitObjectID', graphql_name='previousSha')
+        pusher = sgqlc.types.Field(sgqlc.types.non_null('Actor'), graphql_name='pusher')
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+    return Push
+
+
+def PushAllowance():
+    class PushAllowance(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'branch_protection_rule')
+        actor = sgqlc.types.Field('PushAllowanceActor', graphql_name='actor')
+        branch_protection_rule = sgqlc.types.Field('BranchProtectionRule', graphql_name='branchProtectionRule')
+    return PushAllowance
+
+
+def Reaction():
+    class Reaction(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('content', 'created_at', 'database_id', 'reactable', 'user')
+        content = sgqlc.types.Field(sgqlc.types.non_null('ReactionContent'), graphql_name='content')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        reactable = sgqlc.types.Field(sgqlc.types.non_null('Reactable'), graphql_name='reactable')
+        user = sgqlc.types.Field('User', graphql_name='user')
+    return Reaction
+
+
+def ReadyForReviewEvent():
+    class ReadyForReviewEvent(sgqlc.types.Type, github_schema.Node, github_schema.UniformResourceLocatable):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'pull_request')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+    return ReadyForReviewEvent
+
+
+def Ref():
+    class Ref(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('associated_pull_requests', 'branch_protection_rule', 'compare', 'name', 'prefix', 'ref_update_rule', 'repository', 'target')
+        associated_pull_requests = sgqlc.types.Field(sgqlc.types.non_null('PullRequestConnection'), graphql_name='associatedPullRequests', args=sgqlc.types.ArgDict((('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('PullRequestState')), graphql_name='states', default=None)), ('labels', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='labels', default=None)), ('head_ref_name', sgqlc.types.Arg('String', graphql_name='headRefName', default=None)), ('base_ref_name', sgqlc.types.Arg('String', graphql_name='baseRefName', default=None)), ('order_by', sgqlc.types.Arg('IssueOrder', graphql_name='orderBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        branch_protection_rule = sgqlc.types.Field('BranchProtectionRule', graphql_name='branchProtectionRule')
+        compare = sgqlc.types.Field('Comparison', graphql_name='compare', args=sgqlc.types.ArgDict((('head_ref', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='headRef', default=None)),)))
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        prefix = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='prefix')
+        ref_update_rule = sgqlc.types.Field('RefUpdateRule', graphql_name='refUpdateRule')
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+        target = sgqlc.types.Field('GitObject', graphql_name='target')
+    return Ref
+
+
+def ReferencedEvent():
+    class ReferencedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'commit', 'commit_repository', 'created_at', 'is_cross_repository', 'is_direct_reference', 'subject')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        commit = sgqlc.types.Field('Commit', graphql_name='commit')
+        commit_repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='commitRepository')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        is_cross_repository = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isCrossRepository')
+        is_direct_reference = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isDirectReference')
+        subject = sgqlc.types.Field(sgqlc.types.non_null('ReferencedSubject'), graphql_name='subject')
+    return ReferencedEvent
+
+
+def Release():
+    class Release(sgqlc.types.Type, github_schema.Node, github_schema.UniformResourceLocatable, github_schema.Reactable):
+        __schema__ = github_schema
+        __field_names__ = ('author', 'created_at', 'description', 'description_html', 'is_draft', 'is_latest', 'is_prerelease', 'mentions', 'name', 'published_at', 'release_assets', 'repository', 'short_description_html', 'tag', 'tag_commit', 'tag_name', 'updated_at')
+        author = sgqlc.types.Field('User', graphql_name='author')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        description_html = sgqlc.types.Field('HTML', graphql_name='descriptionHTML')
+        is_draft = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isDraft')
+        is_latest = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isLatest')
+        is_prerelease = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isPrerelease')
+        mentions = sgqlc.types.Field('UserConnection', graphql_name='mentions', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        name = sgqlc.types.Field('String', graphql_name='name')
+        published_at = sgqlc.types.Field('DateTime', graphql_name='publishedAt')
+        release_assets = sgqlc.types.Field(sgqlc.types.non_null('ReleaseAssetConnection'), graphql_name='releaseAssets', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('name', sgqlc.types.Arg('String', graphql_name='name', default=None)))))
+        repository = sgqlc.types.Field(sgqlc.types.non_null('Repository'), graphql_name='repository')
+        short_description_html = sgqlc.types.Field('HTML', graphql_name='shortDescriptionHTML', args=sgqlc.types.ArgDict((('limit', sgqlc.types.Arg(github_schema.Int, graphql_name='limit', default=200)),)))
+        tag = sgqlc.types.Field('Ref', graphql_name='tag')
+        tag_commit = sgqlc.types.Field('Commit', graphql_name='tagCommit')
+        tag_name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='tagName')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return Release
+
+
+def ReleaseAsset():
+    class ReleaseAsset(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('content_type', 'created_at', 'download_count', 'download_url', 'name', 'release', 'size', 'updated_at', 'uploaded_by', 'url')
+        content_type = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='contentType')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        download_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='downloadCount')
+        download_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='downloadUrl')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        release = sgqlc.types.Field('Release', graphql_name='release')
+        size = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='size')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        uploaded_by = sgqlc.types.Field(sgqlc.types.non_null('User'), graphql_name='uploadedBy')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return ReleaseAsset
+
+
+def RemovedFromMergeQueueEvent():
+    class RemovedFromMergeQueueEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'before_commit', 'created_at', 'enqueuer', 'merge_queue', 'pull_request', 'reason')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        before_commit = sgqlc.types.Field('Commit', graphql_name='beforeCommit')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        enqueuer = sgqlc.types.Field('User', graphql_name='enqueuer')
+        merge_queue = sgqlc.types.Field('MergeQueue', graphql_name='mergeQueue')
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest')
+        reason = sgqlc.types.Field('String', graphql_name='reason')
+    return RemovedFromMergeQueueEvent
+
+
+def RemovedFromProjectEvent():
+    class RemovedFromProjectEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'database_id')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+    return RemovedFromProjectEvent
+
+
+def RenamedTitleEvent():
+    class RenamedTitleEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'current_title', 'previous_title', 'subject')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        current_title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='currentTitle')
+        previous_title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='previousTitle')
+        subject = sgqlc.types.Field(sgqlc.types.non_null('RenamedTitleSubject'), graphql_name='subject')
+    return RenamedTitleEvent
+
+
+def ReopenedEvent():
+    class ReopenedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'closable', 'created_at', 'state_reason')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        closable = sgqlc.types.Field(sgqlc.types.non_null('Closable'), graphql_name='closable')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        state_reason = sgqlc.types.Field('IssueStateReason', graphql_name='stateReason')
+    return ReopenedEvent
+
+
+def RepoAccessAuditEntry():
+    class RepoAccessAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('visibility',)
+        visibility = sgqlc.types.Field('RepoAccessAuditEntryVisibility', graphql_name='visibility')
+    return RepoAccessAuditEntry
+
+
+def RepoAddMemberAuditEntry():
+    class RepoAddMemberAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('visibility',)
+        visibility = sgqlc.types.Field('RepoAddMemberAuditEntryVisibility', graphql_name='visibility')
+    return RepoAddMemberAuditEntry
+
+
+def RepoAddTopicAuditEntry():
+    class RepoAddTopicAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.RepositoryAuditEntryData, github_schema.OrganizationAuditEntryData, github_schema.TopicAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepoAddTopicAuditEntry
+
+
+def RepoArchivedAuditEntry():
+    class RepoArchivedAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.RepositoryAuditEntryData, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('visibility',)
+        visibility = sgqlc.types.Field('RepoArchivedAuditEntryVisibility', graphql_name='visibility')
+    return RepoArchivedAuditEntry
+
+
+def RepoChangeMergeSettingAuditEntry():
+    class RepoChangeMergeSettingAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.RepositoryAuditEntryData, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('is_enabled', 'merge_type')
+        is_enabled = sgqlc.types.Field('Boolean', graphql_name='isEnabled')
+        merge_type = sgqlc.types.Field('RepoChangeMergeSettingAuditEntryMergeType', graphql_name='mergeType')
+    return RepoChangeMergeSettingAuditEntry
+
+
+def RepoConfigDisableAnonymousGitAccessAuditEntry():
+    class RepoConfigDisableAnonymousGitAccessAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepoConfigDisableAnonymousGitAccessAuditEntry
+
+
+def RepoConfigDisableCollaboratorsOnlyAuditEntry():
+    class RepoConfigDisableCollaboratorsOnlyAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepoConfigDisableCollaboratorsOnlyAuditEntry
+
+
+def RepoConfigDisableContributorsOnlyAuditEntry():
+    class RepoConfigDisableContributorsOnlyAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepoConfigDisableContributorsOnlyAuditEntry
+
+
+def RepoConfigDisableSockpuppetDisallowedAuditEntry():
+    class RepoConfigDisableSockpuppetDisallowedAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepoConfigDisableSockpuppetDisallowedAuditEntry
+
+
+def RepoConfigEnableAnonymousGitAccessAuditEntry():
+    class RepoConfigEnableAnonymousGitAccessAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepoConfigEnableAnonymousGitAccessAuditEntry
+
+
+def RepoConfigEnableCollaboratorsOnlyAuditEntry():
+    class RepoConfigEnableCollaboratorsOnlyAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepoConfigEnableCollaboratorsOnlyAuditEntry
+
+
+def RepoConfigEnableContributorsOnlyAuditEntry():
+    class RepoConfigEnableContributorsOnlyAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepoConfigEnableContributorsOnlyAuditEntry
+
+
+def RepoConfigEnableSockpuppetDisallowedAuditEntry():
+    class RepoConfigEnableSockpuppetDisallowedAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepoConfigEnableSockpuppetDisallowedAuditEntry
+
+
+def RepoConfigLockAnonymousGitAccessAuditEntry():
+    class RepoConfigLockAnonymousGitAccessAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepoConfigLockAnonymousGitAccessAuditEntry
+
+
+def RepoConfigUnlockAnonymousGitAccessAuditEntry():
+    class RepoConfigUnlockAnonymousGitAccessAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepoConfigUnlockAnonymousGitAccessAuditEntry
+
+
+def RepoCreateAuditEntry():
+    class RepoCreateAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.RepositoryAuditEntryData, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('fork_parent_name', 'fork_source_name', 'visibility')
+        fork_parent_name = sgqlc.types.Field('String', graphql_name='forkParentName')
+        fork_source_name = sgqlc.types.Field('String', graphql_name='forkSourceName')
+        visibility = sgqlc.types.Field('RepoCreateAuditEntryVisibility', graphql_name='visibility')
+    return RepoCreateAuditEntry
+
+
+def RepoDestroyAuditEntry():
+    class RepoDestroyAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.RepositoryAuditEntryData, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('visibility',)
+        visibility = sgqlc.types.Field('RepoDestroyAuditEntryVisibility', graphql_name='visibility')
+    return RepoDestroyAuditEntry
+
+
+def RepoRemoveMemberAuditEntry():
+    class RepoRemoveMemberAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('visibility',)
+        visibility = sgqlc.types.Field('RepoRemoveMemberAuditEntryVisibility', graphql_name='visibility')
+    return RepoRemoveMemberAuditEntry
+
+
+def RepoRemoveTopicAuditEntry():
+    class RepoRemoveTopicAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.RepositoryAuditEntryData, github_schema.OrganizationAuditEntryData, github_schema.TopicAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepoRemoveTopicAuditEntry
+
+
+def Repository():
+    class Repository(sgqlc.types.Type, github_schema.Node, github_schema.ProjectV2Recent, github_schema.ProjectOwner, github_schema.PackageOwner, github_schema.Subscribable, github_schema.Starrable, github_schema.UniformResourceLocatable, github_schema.RepositoryInfo):
+        __schema__ = github_schema
+        __field_names__ = ('allow_update_branch', 'assignable_users', 'auto_merge_allowed', 'branch_protection_rules', 'code_of_conduct', 'codeowners', 'collaborators', 'commit_comments', 'contact_links', 'database_id', 'default_branch_ref', 'delete_branch_on_merge', 'deploy_keys', 'deployments', 'discussion', 'discussion_categories', 'discussion_category', 'discussions', 'disk_usage', 'environment', 'environments', 'forking_allowed', 'forks', 'funding_links', 'has_vulnerability_alerts_enabled', 'interaction_ability', 'is_blank_issues_enabled', 'is_disabled', 'is_empty', 'is_security_policy_enabled', 'is_user_configuration_repository', 'issue', 'issue_or_pull_request', 'issue_templates', 'issues', 'label', 'labels', 'languages', 'latest_release', 'mentionable_users', 'merge_commit_allowed', 'merge_commit_message', 'merge_commit_title', 'merge_queue', 'milestone', 'milestones', 'object', 'parent', 'pinned_discussions', 'pinned_issues', 'primary_language', 'project_v2', 'projects_v2', 'pull_request', 'pull_request_templates', 'pull_requests', 'rebase_merge_allowed', 'ref', 'refs', 'release', 'releases', 'repository_topics', 'ruleset', 'rulesets', 'security_policy_url', 'squash_merge_allowed', 'squash_merge_commit_message', 'squash_merge_commit_title', 'ssh_url', 'submodules', 'temp_clone_token', 'template_repository', 'viewer_can_administer', 'viewer_can_update_topics', 'viewer_default_commit_email', 'viewer_default_merge_method', 'viewer_permission', 'viewer_possible_commit_emails', 'vulnerability_alert', 'vulnerability_alerts', 'watchers', 'web_commit_signoff_required')
+        allow_update_branch = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='allowUpdateBranch')
+        assignable_users = sgqlc.types.Field(sgqlc.types.non_null('UserConnection'), graphql_name='assignableUsers', args=sgqlc.types.ArgDict((('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        auto_merge_allowed = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='autoMergeAllowed')
+        branch_protection_rules = sgqlc.types.Field(sgqlc.types.non_null('BranchProtectionRuleConnection'), graphql_name='branchProtectionRules', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        code_of_conduct = sgqlc.types.Field('CodeOfConduct', graphql_name='codeOfConduct')
+        codeowners = sgqlc.types.Field('RepositoryCodeowners', graphql_name='codeowners', args=sgqlc.types.ArgDict((('ref_name', sgqlc.types.Arg('String', graphql_name='refName', default=None)),)))
+        collaborators = sgqlc.types.Field('RepositoryCollaboratorConnection', graphql_name='collaborators', args=sgqlc.types.ArgDict((('affiliation', sgqlc.types.Arg('CollaboratorAffiliation', graphql_name='affiliation', default=None)), ('login', sgqlc.types.Arg('String', graphql_name='login', default=None)), ('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        commit_comments = sgqlc.types.Field(sgqlc.types.non_null('CommitCommentConnection'), graphql_name='commitComments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        contact_links = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('RepositoryContactLink')), graphql_name='contactLinks')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        default_branch_ref = sgqlc.types.Field('Ref', graphql_name='defaultBranchRef')
+        delete_branch_on_merge = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='deleteBranchOnMerge')
+        deploy_keys = sgqlc.types.Field(sgqlc.types.non_null('DeployKeyConnection'), graphql_name='deployKeys', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        deployments = sgqlc.types.Field(sgqlc.types.non_null('DeploymentConnection'), graphql_name='deployments', args=sgqlc.types.ArgDict((('environments', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='environments', default=None)), ('order_by', sgqlc.types.Arg(github_schema.DeploymentOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'ASC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        discussion = sgqlc.types.Field('Discussion', graphql_name='discussion', args=sgqlc.types.ArgDict((('number', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='number', default=None)),)))
+        discussion_categories = sgqlc.types.Field(sgqlc.types.non_null('DiscussionCategoryConnection'), graphql_name='discussionCategories', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('filter_by_assignable', sgqlc.types.Arg(github_schema.Boolean, graphql_name='filterByAssignable', default=False)))))
+        discussion_category = sgqlc.types.Field('DiscussionCategory', graphql_name='discussionCategory', args=sgqlc.types.ArgDict((('slug', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='slug', default=None)),)))
+        discussions = sgqlc.types.Field(sgqlc.types.non_null('DiscussionConnection'), graphql_name='discussions', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('category_id', sgqlc.types.Arg('ID', graphql_name='categoryId', default=None)), ('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null(github_schema.DiscussionState)), graphql_name='states', default=())), ('order_by', sgqlc.types.Arg(github_schema.DiscussionOrder, graphql_name='orderBy', default={'field': 'UPDATED_AT', 'direction': 'DESC'})))))
+        disk_usage = sgqlc.types.Field('Int', graphql_name='diskUsage')
+        environment = sgqlc.types.Field('Environment', graphql_name='environment', args=sgqlc.types.ArgDict((('name', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='name', default=None)),)))
+        environments = sgqlc.types.Field(sgqlc.types.non_null('EnvironmentConnection'), graphql_name='environments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        forking_allowed = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='forkingAllowed')
+        forks = sgqlc.types.Field(sgqlc.types.non_null('RepositoryConnection'), graphql_name='forks', args=sgqlc.types.ArgDict((('privacy', sgqlc.types.Arg('RepositoryPrivacy', graphql_name='privacy', default=None)), ('order_by', sgqlc.types.Arg('RepositoryOrder', graphql_name='orderBy', default=None)), ('affiliations', sgqlc.types.Arg(sgqlc.types.list_of('RepositoryAffiliation'), graphql_name='affiliations', default=None)), ('owner_affiliations', sgqlc.types.Arg(sgqlc.types.list_of(github_schema.RepositoryAffiliation), graphql_name='ownerAffiliations', default=('OWNER', 'COLLABORATOR'))), ('is_locked', sgqlc.types.Arg('Boolean', graphql_name='isLocked', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        funding_links = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FundingLink'))), graphql_name='fundingLinks')
+        has_vulnerability_alerts_enabled = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasVulnerabilityAlertsEnabled')
+        interaction_ability = sgqlc.types.Field('RepositoryInteractionAbility', graphql_name='interactionAbility')
+        is_blank_issues_enabled = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isBlankIssuesEnabled')
+        is_disabled = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isDisabled')
+        is_empty = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isEmpty')
+        is_security_policy_enabled = sgqlc.types.Field('Boolean', graphql_name='isSecurityPolicyEnabled')
+        is_user_configuration_repository = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isUserConfigurationRepository')
+        issue = sgqlc.types.Field('Issue', graphql_name='issue', args=sgqlc.types.ArgDict((('number', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='number', default=None)),)))
+        issue_or_pull_request = sgqlc.types.Field('IssueOrPullRequest', graphql_name='issueOrPullRequest', args=sgqlc.types.ArgDict((('number', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='number', default=None)),)))
+        issue_templates = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('IssueTemplate')), graphql_name='issueTemplates')
+        issues = sgqlc.types.Field(sgqlc.types.non_null('IssueConnection'), graphql_name='issues', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg('IssueOrder', graphql_name='orderBy', default=None)), ('labels', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='labels', default=None)), ('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('IssueState')), graphql_name='states', default=None)), ('filter_by', sgqlc.types.Arg('IssueFilters', graphql_name='filterBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        label = sgqlc.types.Field('Label', graphql_name='label', args=sgqlc.types.ArgDict((('name', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='name', default=None)),)))
+        labels = sgqlc.types.Field('LabelConnection', graphql_name='labels', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg(github_schema.LabelOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'ASC'})), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('query', sgqlc.types.Arg('String', graphql_name='query', default=None)))))
+        languages = sgqlc.types.Field('LanguageConnection', graphql_name='languages', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg('LanguageOrder', graphql_name='orderBy', default=None)))))
+        latest_release = sgqlc.types.Field('Release', graphql_name='latestRelease')
+        mentionable_users = sgqlc.types.Field(sgqlc.types.non_null('UserConnection'), graphql_name='mentionableUsers', args=sgqlc.types.ArgDict((('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        merge_commit_allowed = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='mergeCommitAllowed')
+        merge_commit_message = sgqlc.types.Field(sgqlc.types.non_null('MergeCommitMessage'), graphql_name='mergeCommitMessage')
+        merge_commit_title = sgqlc.types.Field(sgqlc.types.non_null('MergeCommitTitle'), graphql_name='mergeCommitTitle')
+        merge_queue = sgqlc.types.Field('MergeQueue', graphql_name='mergeQueue', args=sgqlc.types.ArgDict((('branch', sgqlc.types.Arg('String', graphql_name='branch', default=None)),)))
+        milestone = sgqlc.types.Field('Milestone', graphql_name='milestone', args=sgqlc.types.ArgDict((('number', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='number', default=None)),)))
+        milestones = sgqlc.types.Field('MilestoneConnection', graphql_name='milestones', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('MilestoneState')), graphql_name='states', default=None)), ('order_by', sgqlc.types.Arg('MilestoneOrder', graphql_name='orderBy', default=None)), ('query', sgqlc.types.Arg('String', graphql_name='query', default=None)))))
+        object = sgqlc.types.Field('GitObject', graphql_name='object', args=sgqlc.types.ArgDict((('oid', sgqlc.types.Arg('GitObjectID', graphql_name='oid', default=None)), ('expression', sgqlc.types.Arg('String', graphql_name='expression', default=None)))))
+        parent = sgqlc.types.Field('Repository', graphql_name='parent')
+        pinned_discussions = sgqlc.types.Field(sgqlc.types.non_null('PinnedDiscussionConnection'), graphql_name='pinnedDiscussions', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        pinned_issues = sgqlc.types.Field('PinnedIssueConnection', graphql_name='pinnedIssues', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        primary_language = sgqlc.types.Field('Language', graphql_name='primaryLanguage')
+        project_v2 = sgqlc.types.Field('ProjectV2', graphql_name='projectV2', args=sgqlc.types.ArgDict((('number', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='number', default=None)),)))
+        projects_v2 = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2Connection'), graphql_name='projectsV2', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ProjectV2Order, graphql_name='orderBy', default={'field': 'NUMBER', 'direction': 'DESC'})))))
+        pull_request = sgqlc.types.Field('PullRequest', graphql_name='pullRequest', args=sgqlc.types.ArgDict((('number', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='number', default=None)),)))
+        pull_request_templates = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('PullRequestTemplate')), graphql_name='pullRequestTemplates')
+        pull_requests = sgqlc.types.Field(sgqlc.types.non_null('PullRequestConnection'), graphql_name='pullRequests', args=sgqlc.types.ArgDict((('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('PullRequestState')), graphql_name='states', default=None)), ('labels', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='labels', default=None)), ('head_ref_name', sgqlc.types.Arg('String', graphql_name='headRefName', default=None)), ('base_ref_name', sgqlc.types.Arg('String', graphql_name='baseRefName', default=None)), ('order_by', sgqlc.types.Arg('IssueOrder', graphql_name='orderBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        rebase_merge_allowed = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='rebaseMergeAllowed')
+        ref = sgqlc.types.Field('Ref', graphql_name='ref', args=sgqlc.types.ArgDict((('qualified_name', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='qualifiedName', default=None)),)))
+        refs = sgqlc.types.Field('RefConnection', graphql_name='refs', args=sgqlc.types.ArgDict((('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('ref_prefix', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='refPrefix', default=None)), ('direction', sgqlc.types.Arg('OrderDirection', graphql_name='direction', default=None)), ('order_by', sgqlc.types.Arg('RefOrder', graphql_name='orderBy', default=None)))))
+        release = sgqlc.types.Field('Release', graphql_name='release', args=sgqlc.types.ArgDict((('tag_name', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='tagName', default=None)),)))
+        releases = sgqlc.types.Field(sgqlc.types.non_null('ReleaseConnection'), graphql_name='releases', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg('ReleaseOrder', graphql_name='orderBy', default=None)))))
+        repository_topics = sgqlc.types.Field(sgqlc.types.non_null('RepositoryTopicConnection'), graphql_name='repositoryTopics', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        ruleset = sgqlc.types.Field('RepositoryRuleset', graphql_name='ruleset', args=sgqlc.types.ArgDict((('database_id', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='databaseId', default=None)),)))
+        rulesets = sgqlc.types.Field('RepositoryRulesetConnection', graphql_name='rulesets', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('include_parents', sgqlc.types.Arg(github_schema.Boolean, graphql_name='includeParents', default=False)))))
+        security_policy_url = sgqlc.types.Field('URI', graphql_name='securityPolicyUrl')
+        squash_merge_allowed = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='squashMergeAllowed')
+        squash_merge_commit_message = sgqlc.types.Field(sgqlc.types.non_null('SquashMergeCommitMessage'), graphql_name='squashMergeCommitMessage')
+        squash_merge_commit_title = sgqlc.types.Field(sgqlc.types.non_null('SquashMergeCommitTitle'), graphql_name='squashMergeCommitTitle')
+        ssh_url = sgqlc.types.Field(sgqlc.types.non_null('GitSSHRemote'), graphql_name='sshUrl')
+        submodules = sgqlc.types.Field(sgqlc.types.non_null('SubmoduleConnection'), graphql_name='submodules', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        temp_clone_token = sgqlc.types.Field('String', graphql_name='tempCloneToken')
+        template_repository = sgqlc.types.Field('Repository', graphql_name='templateRepository')
+        viewer_can_administer = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanAdminister')
+        viewer_can_update_topics = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanUpdateTopics')
+        viewer_default_commit_email = sgqlc.types.Field('String', graphql_name='viewerDefaultCommitEmail')
+        viewer_default_merge_method = sgqlc.types.Field(sgqlc.types.non_null('PullRequestMergeMethod'), graphql_name='viewerDefaultMergeMethod')
+        viewer_permission = sgqlc.types.Field('RepositoryPermission', graphql_name='viewerPermission')
+        viewer_possible_commit_emails = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='viewerPossibleCommitEmails')
+        vulnerability_alert = sgqlc.types.Field('RepositoryVulnerabilityAlert', graphql_name='vulnerabilityAlert', args=sgqlc.types.ArgDict((('number', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='number', default=None)),)))
+        vulnerability_alerts = sgqlc.types.Field('RepositoryVulnerabilityAlertConnection', graphql_name='vulnerabilityAlerts', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('RepositoryVulnerabilityAlertState')), graphql_name='states', default=None)), ('dependency_scopes', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('RepositoryVulnerabilityAlertDependencyScope')), graphql_name='dependencyScopes', default=None)))))
+        watchers = sgqlc.types.Field(sgqlc.types.non_null('UserConnection'), graphql_name='watchers', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        web_commit_signoff_required = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='webCommitSignoffRequired')
+    return Repository
+
+
+def RepositoryInvitation():
+    class RepositoryInvitation(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('email', 'invitee', 'inviter', 'permalink', 'permission', 'repository')
+        email = sgqlc.types.Field('String', graphql_name='email')
+        invitee = sgqlc.types.Field('User', graphql_name='invitee')
+        inviter = sgqlc.types.Field(sgqlc.types.non_null('User'), graphql_name='inviter')
+        permalink = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='permalink')
+        permission = sgqlc.types.Field(sgqlc.types.non_null('RepositoryPermission'), graphql_name='permission')
+        repository = sgqlc.types.Field('RepositoryInfo', graphql_name='repository')
+    return RepositoryInvitation
+
+
+def RepositoryMigration():
+    class RepositoryMigration(sgqlc.types.Type, github_schema.Node, github_schema.Migration):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepositoryMigration
+
+
+def RepositoryRule():
+    class RepositoryRule(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('parameters', 'type')
+        parameters = sgqlc.types.Field('RuleParameters', graphql_name='parameters')
+        type = sgqlc.types.Field(sgqlc.types.non_null('RepositoryRuleType'), graphql_name='type')
+    return RepositoryRule
+
+
+def RepositoryRuleset():
+    class RepositoryRuleset(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('bypass_actors', 'bypass_mode', 'conditions', 'created_at', 'database_id', 'enforcement', 'name', 'rules', 'source', 'target', 'updated_at')
+        bypass_actors = sgqlc.types.Field('RepositoryRulesetBypassActorConnection', graphql_name='bypassActors', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        bypass_mode = sgqlc.types.Field(sgqlc.types.non_null('RuleBypassMode'), graphql_name='bypassMode')
+        conditions = sgqlc.types.Field(sgqlc.types.non_null('RepositoryRuleConditions'), graphql_name='conditions')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        enforcement = sgqlc.types.Field(sgqlc.types.non_null('RuleEnforcement'), graphql_name='enforcement')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        rules = sgqlc.types.Field('RepositoryRuleConnection', graphql_name='rules', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('type', sgqlc.types.Arg('RepositoryRuleType', graphql_name='type', default=None)))))
+        source = sgqlc.types.Field(sgqlc.types.non_null('RuleSource'), graphql_name='source')
+        target = sgqlc.types.Field('RepositoryRulesetTarget', graphql_name='target')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return RepositoryRuleset
+
+
+def RepositoryRulesetBypassActor():
+    class RepositoryRulesetBypassActor(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'repository_ruleset')
+        actor = sgqlc.types.Field('BypassActor', graphql_name='actor')
+        repository_ruleset = sgqlc.types.Field('RepositoryRuleset', graphql_name='repositoryRuleset')
+    return RepositoryRulesetBypassActor
+
+
+def RepositoryTopic():
+    class RepositoryTopic(sgqlc.types.Type, github_schema.Node, github_schema.UniformResourceLocatable):
+        __schema__ = github_schema
+        __field_names__ = ('topic',)
+        topic = sgqlc.types.Field(sgqlc.types.non_null('Topic'), graphql_name='topic')
+    return RepositoryTopic
+
+
+def RepositoryVisibilityChangeDisableAuditEntry():
+    class RepositoryVisibilityChangeDisableAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.EnterpriseAuditEntryData, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepositoryVisibilityChangeDisableAuditEntry
+
+
+def RepositoryVisibilityChangeEnableAuditEntry():
+    class RepositoryVisibilityChangeEnableAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.EnterpriseAuditEntryData, github_schema.OrganizationAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RepositoryVisibilityChangeEnableAuditEntry
+
+
+def RepositoryVulnerabilityAlert():
+    class RepositoryVulnerabilityAlert(sgqlc.types.Type, github_schema.Node, github_schema.RepositoryNode):
+        __schema__ = github_schema
+        __field_names__ = ('auto_dismissed_at', 'created_at', 'dependabot_update', 'dependency_scope', 'dismiss_comment', 'dismiss_reason', 'dismissed_at', 'dismisser', 'fixed_at', 'number', 'security_advisory', 'security_vulnerability', 'state', 'vulnerable_manifest_filename', 'vulnerable_manifest_path', 'vulnerable_requirements')
+        auto_dismissed_at = sgqlc.types.Field('DateTime', graphql_name='autoDismissedAt')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        dependabot_update = sgqlc.types.Field('DependabotUpdate', graphql_name='dependabotUpdate')
+        dependency_scope = sgqlc.types.Field('RepositoryVulnerabilityAlertDependencyScope', graphql_name='dependencyScope')
+        dismiss_comment = sgqlc.types.Field('String', graphql_name='dismissComment')
+        dismiss_reason = sgqlc.types.Field('String', graphql_name='dismissReason')
+        dismissed_at = sgqlc.types.Field('DateTime', graphql_name='dismissedAt')
+        dismisser = sgqlc.types.Field('User', graphql_name='dismisser')
+        fixed_at = sgqlc.types.Field('DateTime', graphql_name='fixedAt')
+        number = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='number')
+        security_advisory = sgqlc.types.Field('SecurityAdvisory', graphql_name='securityAdvisory')
+        security_vulnerability = sgqlc.types.Field('SecurityVulnerability', graphql_name='securityVulnerability')
+        state = sgqlc.types.Field(sgqlc.types.non_null('RepositoryVulnerabilityAlertState'), graphql_name='state')
+        vulnerable_manifest_filename = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vulnerableManifestFilename')
+        vulnerable_manifest_path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vulnerableManifestPath')
+        vulnerable_requirements = sgqlc.types.Field('String', graphql_name='vulnerableRequirements')
+    return RepositoryVulnerabilityAlert
+
+
+def RestrictedContribution():
+    class RestrictedContribution(sgqlc.types.Type, github_schema.Contribution):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return RestrictedContribution
+
+
+def ReviewDismissalAllowance():
+    class ReviewDismissalAllowance(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'branch_protection_rule')
+        actor = sgqlc.types.Field('ReviewDismissalAllowanceActor', graphql_name='actor')
+        branch_protection_rule = sgqlc.types.Field('BranchProtectionRule', graphql_name='branchProtectionRule')
+    return ReviewDismissalAllowance
+
+
+def ReviewDismissedEvent():
+    class ReviewDismissedEvent(sgqlc.types.Type, github_schema.Node, github_schema.UniformResourceLocatable):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'database_id', 'dismissal_message', 'dismissal_message_html', 'previous_review_state', 'pull_request', 'pull_request_commit', 'review')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        dismissal_message = sgqlc.types.Field('String', graphql_name='dismissalMessage')
+        dismissal_message_html = sgqlc.types.Field('String', graphql_name='dismissalMessageHTML')
+        previous_review_state = sgqlc.types.Field(sgqlc.types.non_null('PullRequestReviewState'), graphql_name='previousReviewState')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+        pull_request_commit = sgqlc.types.Field('PullRequestCommit', graphql_name='pullRequestCommit')
+        review = sgqlc.types.Field('PullRequestReview', graphql_name='review')
+    return ReviewDismissedEvent
+
+
+def ReviewRequest():
+    class ReviewRequest(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('as_code_owner', 'database_id', 'pull_request', 'requested_reviewer')
+        as_code_owner = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='asCodeOwner')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+        requested_reviewer = sgqlc.types.Field('RequestedReviewer', graphql_name='requestedReviewer')
+    return ReviewRequest
+
+
+def ReviewRequestRemovedEvent():
+    class ReviewRequestRemovedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'pull_request', 'requested_reviewer')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+        requested_reviewer = sgqlc.types.Field('RequestedReviewer', graphql_name='requestedReviewer')
+    return ReviewRequestRemovedEvent
+
+
+def ReviewRequestedEvent():
+    class ReviewRequestedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'pull_request', 'requested_reviewer')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        pull_request = sgqlc.types.Field(sgqlc.types.non_null('PullRequest'), graphql_name='pullRequest')
+        requested_reviewer = sgqlc.types.Field('RequestedReviewer', graphql_name='requestedReviewer')
+    return ReviewRequestedEvent
+
+
+def ReviewStatusHovercardContext():
+    class ReviewStatusHovercardContext(sgqlc.types.Type, github_schema.HovercardContext):
+        __schema__ = github_schema
+        __field_names__ = ('review_decision',)
+        review_decision = sgqlc.types.Field('PullRequestReviewDecision', graphql_name='reviewDecision')
+    return ReviewStatusHovercardContext
+
+
+def SavedReply():
+    class SavedReply(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('body', 'body_html', 'database_id', 'title', 'user')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        body_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='bodyHTML')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        user = sgqlc.types.Field('Actor', graphql_name='user')
+    return SavedReply
+
+
+def SecurityAdvisory():
+    class SecurityAdvisory(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('classification', 'cvss', 'cwes', 'database_id', 'description', 'ghsa_id', 'identifiers', 'notifications_permalink', 'origin', 'permalink', 'published_at', 'references', 'severity', 'summary', 'updated_at', 'vulnerabilities', 'withdrawn_at')
+        classification = sgqlc.types.Field(sgqlc.types.non_null('SecurityAdvisoryClassification'), graphql_name='classification')
+        cvss = sgqlc.types.Field(sgqlc.types.non_null('CVSS'), graphql_name='cvss')
+        cwes = sgqlc.types.Field(sgqlc.types.non_null('CWEConnection'), graphql_name='cwes', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        description = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='description')
+        ghsa_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='ghsaId')
+        identifiers = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('SecurityAdvisoryIdentifier'))), graphql_name='identifiers')
+        notifications_permalink = sgqlc.types.Field('URI', graphql_name='notificationsPermalink')
+        origin = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='origin')
+        permalink = sgqlc.types.Field('URI', graphql_name='permalink')
+        published_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='publishedAt')
+        references = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('SecurityAdvisoryReference'))), graphql_name='references')
+        severity = sgqlc.types.Field(sgqlc.types.non_null('SecurityAdvisorySeverity'), graphql_name='severity')
+        summary = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='summary')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        vulnerabilities = sgqlc.types.Field(sgqlc.types.non_null('SecurityVulnerabilityConnection'), graphql_name='vulnerabilities', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg(github_schema.SecurityVulnerabilityOrder, graphql_name='orderBy', default={'field': 'UPDATED_AT', 'direction': 'DESC'})), ('ecosystem', sgqlc.types.Arg('SecurityAdvisoryEcosystem', graphql_name='ecosystem', default=None)), ('package', sgqlc.types.Arg('String', graphql_name='package', default=None)), ('severities', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('SecurityAdvisorySeverity')), graphql_name='severities', default=None)), ('classifications', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('SecurityAdvisoryClassification')), graphql_name='classifications', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        withdrawn_at = sgqlc.types.Field('DateTime', graphql_name='withdrawnAt')
+    return SecurityAdvisory
+
+
+def SmimeSignature():
+    class SmimeSignature(sgqlc.types.Type, github_schema.GitSignature):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return SmimeSignature
+
+
+def SponsorsActivity():
+    class SponsorsActivity(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('action', 'previous_sponsors_tier', 'sponsor', 'sponsorable', 'sponsors_tier', 'timestamp', 'via_bulk_sponsorship')
+        action = sgqlc.types.Field(sgqlc.types.non_null('SponsorsActivityAction'), graphql_name='action')
+        previous_sponsors_tier = sgqlc.types.Field('SponsorsTier', graphql_name='previousSponsorsTier')
+        sponsor = sgqlc.types.Field('Sponsor', graphql_name='sponsor')
+        sponsorable = sgqlc.types.Field(sgqlc.types.non_null('Sponsorable'), graphql_name='sponsorable')
+        sponsors_tier = sgqlc.types.Field('SponsorsTier', graphql_name='sponsorsTier')
+        timestamp = sgqlc.types.Field('DateTime', graphql_name='timestamp')
+        via_bulk_sponsorship = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viaBulkSponsorship')
+    return SponsorsActivity
+
+
+def SponsorsListing():
+    class SponsorsListing(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('active_goal', 'active_stripe_connect_account', 'billing_country_or_region', 'contact_email_address', 'created_at', 'dashboard_resource_path', 'dashboard_url', 'featured_items', 'fiscal_host', 'full_description', 'full_description_html', 'is_public', 'name', 'next_payout_date', 'residence_country_or_region', 'resource_path', 'short_description', 'slug', 'sponsorable', 'tiers', 'url')
+        active_goal = sgqlc.types.Field('SponsorsGoal', graphql_name='activeGoal')
+        active_stripe_connect_account = sgqlc.types.Field('StripeConnectAccount', graphql_name='activeStripeConnectAccount')
+        billing_country_or_region = sgqlc.types.Field('String', graphql_name='billingCountryOrRegion')
+        contact_email_address = sgqlc.types.Field('String', graphql_name='contactEmailAddress')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        dashboard_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='dashboardResourcePath')
+        dashboard_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='dashboardUrl')
+        featured_items = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('SponsorsListingFeaturedItem'))), graphql_name='featuredItems', args=sgqlc.types.ArgDict((('featureable_types', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null(github_schema.SponsorsListingFeaturedItemFeatureableType)), graphql_name='featureableTypes', default=('REPOSITORY', 'USER'))),)))
+        fiscal_host = sgqlc.types.Field('Organization', graphql_name='fiscalHost')
+        full_description = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='fullDescription')
+        full_description_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='fullDescriptionHTML')
+        is_public = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isPublic')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        next_payout_date = sgqlc.types.Field('Date', graphql_name='nextPayoutDate')
+        residence_country_or_region = sgqlc.types.Field('String', graphql_name='residenceCountryOrRegion')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        short_description = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='shortDescription')
+        slug = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='slug')
+        sponsorable = sgqlc.types.Field(sgqlc.types.non_null('Sponsorable'), graphql_name='sponsorable')
+        tiers = sgqlc.types.Field('SponsorsTierConnection', graphql_name='tiers', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.SponsorsTierOrder, graphql_name='orderBy', default={'field': 'MONTHLY_PRICE_IN_CENTS', 'direction': 'ASC'})), ('include_unpublished', sgqlc.types.Arg(github_schema.Boolean, graphql_name='includeUnpublished', default=False)))))
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+    return SponsorsListing
+
+
+def SponsorsListingFeaturedItem():
+    class SponsorsListingFeaturedItem(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'description', 'featureable', 'position', 'sponsors_listing', 'updated_at')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        featureable = sgqlc.types.Field(sgqlc.types.non_null('SponsorsListingFeatureableItem'), graphql_name='featureable')
+        position = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='position')
+        sponsors_listing = sgqlc.types.Field(sgqlc.types.non_null('SponsorsListing'), graphql_name='sponsorsListing')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return SponsorsListingFeaturedItem
+
+
+def SponsorsTier():
+    class SponsorsTier(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('admin_info', 'closest_lesser_value_tier', 'created_at', 'description', 'description_html', 'is_custom_amount', 'is_one_time', 'monthly_price_in_cents', 'monthly_price_in_dollars', 'name', 'sponsors_listing', 'updated_at')
+        admin_info = sgqlc.types.Field('SponsorsTierAdminInfo', graphql_name='adminInfo')
+        closest_lesser_value_tier = sgqlc.types.Field('SponsorsTier', graphql_name='closestLesserValueTier')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        description = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='description')
+        description_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='descriptionHTML')
+        is_custom_amount = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isCustomAmount')
+        is_one_time = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isOneTime')
+        monthly_price_in_cents = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='monthlyPriceInCents')
+        monthly_price_in_dollars = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='monthlyPriceInDollars')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        sponsors_listing = sgqlc.types.Field(sgqlc.types.non_null('SponsorsListing'), graphql_name='sponsorsListing')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return SponsorsTier
+
+
+def Sponsorship():
+    class Sponsorship(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'is_active', 'is_one_time_payment', 'is_sponsor_opted_into_email', 'privacy_level', 'sponsor_entity', 'sponsorable', 'tier', 'tier_selected_at')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        is_active = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isActive')
+        is_one_time_payment = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isOneTimePayment')
+        is_sponsor_opted_into_email = sgqlc.types.Field('Boolean', graphql_name='isSponsorOptedIntoEmail')
+        privacy_level = sgqlc.types.Field(sgqlc.types.non_null('SponsorshipPrivacy'), graphql_name='privacyLevel')
+        sponsor_entity = sgqlc.types.Field('Sponsor', graphql_name='sponsorEntity')
+        sponsorable = sgqlc.types.Field(sgqlc.types.non_null('Sponsorable'), graphql_name='sponsorable')
+        tier = sgqlc.types.Field('SponsorsTier', graphql_name='tier')
+        tier_selected_at = sgqlc.types.Field('DateTime', graphql_name='tierSelectedAt')
+    return Sponsorship
+
+
+def SponsorshipNewsletter():
+    class SponsorshipNewsletter(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('author', 'body', 'created_at', 'is_published', 'sponsorable', 'subject', 'updated_at')
+        author = sgqlc.types.Field('User', graphql_name='author')
+        body = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='body')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        is_published = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isPublished')
+        sponsorable = sgqlc.types.Field(sgqlc.types.non_null('Sponsorable'), graphql_name='sponsorable')
+        subject = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='subject')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return SponsorshipNewsletter
+
+
+def SshSignature():
+    class SshSignature(sgqlc.types.Type, github_schema.GitSignature):
+        __schema__ = github_schema
+        __field_names__ = ('key_fingerprint',)
+        key_fingerprint = sgqlc.types.Field('String', graphql_name='keyFingerprint')
+    return SshSignature
+
+
+def Status():
+    class Status(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('combined_contexts', 'commit', 'context', 'contexts', 'state')
+        combined_contexts = sgqlc.types.Field(sgqlc.types.non_null('StatusCheckRollupContextConnection'), graphql_name='combinedContexts', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        commit = sgqlc.types.Field('Commit', graphql_name='commit')
+        context = sgqlc.types.Field('StatusContext', graphql_name='context', args=sgqlc.types.ArgDict((('name', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='name', default=None)),)))
+        contexts = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('StatusContext'))), graphql_name='contexts')
+        state = sgqlc.types.Field(sgqlc.types.non_null('StatusState'), graphql_name='state')
+    return Status
+
+
+def StatusCheckRollup():
+    class StatusCheckRollup(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('commit', 'contexts', 'state')
+        commit = sgqlc.types.Field('Commit', graphql_name='commit')
+        contexts = sgqlc.types.Field(sgqlc.types.non_null('StatusCheckRollupContextConnection'), graphql_name='contexts', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        state = sgqlc.types.Field(sgqlc.types.non_null('StatusState'), graphql_name='state')
+    return StatusCheckRollup
+
+
+def StatusContext():
+    class StatusContext(sgqlc.types.Type, github_schema.RequirableByPullRequest, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('avatar_url', 'commit', 'context', 'created_at', 'creator', 'description', 'state', 'target_url')
+        avatar_url = sgqlc.types.Field('URI', graphql_name='avatarUrl', args=sgqlc.types.ArgDict((('size', sgqlc.types.Arg(github_schema.Int, graphql_name='size', default=40)),)))
+        commit = sgqlc.types.Field('Commit', graphql_name='commit')
+        context = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='context')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        creator = sgqlc.types.Field('Actor', graphql_name='creator')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        state = sgqlc.types.Field(sgqlc.types.non_null('StatusState'), graphql_name='state')
+        target_url = sgqlc.types.Field('URI', graphql_name='targetUrl')
+    return StatusContext
+
+
+def SubscribedEvent():
+    class SubscribedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'subscribable')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        subscribable = sgqlc.types.Field(sgqlc.types.non_null('Subscribable'), graphql_name='subscribable')
+    return SubscribedEvent
+
+
+def Tag():
+    class Tag(sgqlc.types.Type, github_schema.Node, github_schema.GitObject):
+        __schema__ = github_schema
+        __field_names__ = ('message', 'name', 'tagger', 'target')
+        message = sgqlc.types.Field('String', graphql_name='message')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        tagger = sgqlc.types.Field('GitActor', graphql_name='tagger')
+        target = sgqlc.types.Field(sgqlc.types.non_null('GitObject'), graphql_name='target')
+    return Tag
+
+
+def Team():
+    class Team(sgqlc.types.Type, github_schema.Node, github_schema.Subscribable, github_schema.MemberStatusable):
+        __schema__ = github_schema
+        __field_names__ = ('ancestors', 'avatar_url', 'child_teams', 'combined_slug', 'created_at', 'database_id', 'description', 'discussion', 'discussions', 'discussions_resource_path', 'discussions_url', 'edit_team_resource_path', 'edit_team_url', 'invitations', 'members', 'members_resource_path', 'members_url', 'name', 'new_team_resource_path', 'new_team_url', 'notification_setting', 'organization', 'parent_team', 'privacy', 'project_v2', 'projects_v2', 'repositories', 'repositories_resource_path', 'repositories_url', 'resource_path', 'slug', 'teams_resource_path', 'teams_url', 'updated_at', 'url', 'viewer_can_administer')
+        ancestors = sgqlc.types.Field(sgqlc.types.non_null('TeamConnection'), graphql_name='ancestors', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        avatar_url = sgqlc.types.Field('URI', graphql_name='avatarUrl', args=sgqlc.types.ArgDict((('size', sgqlc.types.Arg(github_schema.Int, graphql_name='size', default=400)),)))
+        child_teams = sgqlc.types.Field(sgqlc.types.non_null('TeamConnection'), graphql_name='childTeams', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg('TeamOrder', graphql_name='orderBy', default=None)), ('user_logins', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='userLogins', default=None)), ('immediate_only', sgqlc.types.Arg(github_schema.Boolean, graphql_name='immediateOnly', default=True)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        combined_slug = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='combinedSlug')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        discussion = sgqlc.types.Field('TeamDiscussion', graphql_name='discussion', args=sgqlc.types.ArgDict((('number', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='number', default=None)),)))
+        discussions = sgqlc.types.Field(sgqlc.types.non_null('TeamDiscussionConnection'), graphql_name='discussions', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('is_pinned', sgqlc.types.Arg('Boolean', graphql_name='isPinned', default=None)), ('order_by', sgqlc.types.Arg('TeamDiscussionOrder', graphql_name='orderBy', default=None)))))
+        discussions_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='discussionsResourcePath')
+        discussions_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='discussionsUrl')
+        edit_team_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='editTeamResourcePath')
+        edit_team_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='editTeamUrl')
+        invitations = sgqlc.types.Field('OrganizationInvitationConnection', graphql_name='invitations', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        members = sgqlc.types.Field(sgqlc.types.non_null('TeamMemberConnection'), graphql_name='members', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('membership', sgqlc.types.Arg(github_schema.TeamMembershipType, graphql_name='membership', default='ALL')), ('role', sgqlc.types.Arg('TeamMemberRole', graphql_name='role', default=None)), ('order_by', sgqlc.types.Arg('TeamMemberOrder', graphql_name='orderBy', default=None)))))
+        members_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='membersResourcePath')
+        members_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='membersUrl')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        new_team_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='newTeamResourcePath')
+        new_team_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='newTeamUrl')
+        notification_setting = sgqlc.types.Field(sgqlc.types.non_null('TeamNotificationSetting'), graphql_name='notificationSetting')
+        organization = sgqlc.types.Field(sgqlc.types.non_null('Organization'), graphql_name='organization')
+        parent_team = sgqlc.types.Field('Team', graphql_name='parentTeam')
+        privacy = sgqlc.types.Field(sgqlc.types.non_null('TeamPrivacy'), graphql_name='privacy')
+        project_v2 = sgqlc.types.Field('ProjectV2', graphql_name='projectV2', args=sgqlc.types.ArgDict((('number', sgqlc.types.Arg(sgqlc.types.non_null('Int'), graphql_name='number', default=None)),)))
+        projects_v2 = sgqlc.types.Field(sgqlc.types.non_null('ProjectV2Connection'), graphql_name='projectsV2', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.ProjectV2Order, graphql_name='orderBy', default={'field': 'NUMBER', 'direction': 'DESC'})), ('filter_by', sgqlc.types.Arg(github_schema.ProjectV2Filters, graphql_name='filterBy', default={})), ('query', sgqlc.types.Arg(github_schema.String, graphql_name='query', default='')))))
+        repositories = sgqlc.types.Field(sgqlc.types.non_null('TeamRepositoryConnection'), graphql_name='repositories', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('query', sgqlc.types.Arg('String', graphql_name='query', default=None)), ('order_by', sgqlc.types.Arg('TeamRepositoryOrder', graphql_name='orderBy', default=None)))))
+        repositories_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='repositoriesResourcePath')
+        repositories_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='repositoriesUrl')
+        resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='resourcePath')
+        slug = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='slug')
+        teams_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='teamsResourcePath')
+        teams_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='teamsUrl')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='url')
+        viewer_can_administer = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanAdminister')
+    return Team
+
+
+def TeamAddMemberAuditEntry():
+    class TeamAddMemberAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.TeamAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('is_ldap_mapped',)
+        is_ldap_mapped = sgqlc.types.Field('Boolean', graphql_name='isLdapMapped')
+    return TeamAddMemberAuditEntry
+
+
+def TeamAddRepositoryAuditEntry():
+    class TeamAddRepositoryAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData, github_schema.TeamAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('is_ldap_mapped',)
+        is_ldap_mapped = sgqlc.types.Field('Boolean', graphql_name='isLdapMapped')
+    return TeamAddRepositoryAuditEntry
+
+
+def TeamChangeParentTeamAuditEntry():
+    class TeamChangeParentTeamAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.TeamAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('is_ldap_mapped', 'parent_team', 'parent_team_name', 'parent_team_name_was', 'parent_team_resource_path', 'parent_team_url', 'parent_team_was', 'parent_team_was_resource_path', 'parent_team_was_url')
+        is_ldap_mapped = sgqlc.types.Field('Boolean', graphql_name='isLdapMapped')
+        parent_team = sgqlc.types.Field('Team', graphql_name='parentTeam')
+        parent_team_name = sgqlc.types.Field('String', graphql_name='parentTeamName')
+        parent_team_name_was = sgqlc.types.Field('String', graphql_name='parentTeamNameWas')
+        parent_team_resource_path = sgqlc.types.Field('URI', graphql_name='parentTeamResourcePath')
+        parent_team_url = sgqlc.types.Field('URI', graphql_name='parentTeamUrl')
+        parent_team_was = sgqlc.types.Field('Team', graphql_name='parentTeamWas')
+        parent_team_was_resource_path = sgqlc.types.Field('URI', graphql_name='parentTeamWasResourcePath')
+        parent_team_was_url = sgqlc.types.Field('URI', graphql_name='parentTeamWasUrl')
+    return TeamChangeParentTeamAuditEntry
+
+
+def TeamDiscussion():
+    class TeamDiscussion(sgqlc.types.Type, github_schema.Node, github_schema.Comment, github_schema.Deletable, github_schema.Reactable, github_schema.Subscribable, github_schema.UniformResourceLocatable, github_schema.Updatable, github_schema.UpdatableComment):
+        __schema__ = github_schema
+        __field_names__ = ('body_version', 'comments', 'comments_resource_path', 'comments_url', 'is_pinned', 'is_private', 'number', 'team', 'title', 'viewer_can_pin')
+        body_version = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='bodyVersion')
+        comments = sgqlc.types.Field(sgqlc.types.non_null('TeamDiscussionCommentConnection'), graphql_name='comments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg('TeamDiscussionCommentOrder', graphql_name='orderBy', default=None)), ('from_comment', sgqlc.types.Arg('Int', graphql_name='fromComment', default=None)))))
+        comments_resource_path = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='commentsResourcePath')
+        comments_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='commentsUrl')
+        is_pinned = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isPinned')
+        is_private = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isPrivate')
+        number = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='number')
+        team = sgqlc.types.Field(sgqlc.types.non_null('Team'), graphql_name='team')
+        title = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='title')
+        viewer_can_pin = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanPin')
+    return TeamDiscussion
+
+
+def TeamDiscussionComment():
+    class TeamDiscussionComment(sgqlc.types.Type, github_schema.Node, github_schema.Comment, github_schema.Deletable, github_schema.Reactable, github_schema.UniformResourceLocatable, github_schema.Updatable, github_schema.UpdatableComment):
+        __schema__ = github_schema
+        __field_names__ = ('body_version', 'discussion', 'number')
+        body_version = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='bodyVersion')
+        discussion = sgqlc.types.Field(sgqlc.types.non_null('TeamDiscussion'), graphql_name='discussion')
+        number = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='number')
+    return TeamDiscussionComment
+
+
+def TeamRemoveMemberAuditEntry():
+    class TeamRemoveMemberAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.TeamAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('is_ldap_mapped',)
+        is_ldap_mapped = sgqlc.types.Field('Boolean', graphql_name='isLdapMapped')
+    return TeamRemoveMemberAuditEntry
+
+
+def TeamRemoveRepositoryAuditEntry():
+    class TeamRemoveRepositoryAuditEntry(sgqlc.types.Type, github_schema.Node, github_schema.AuditEntry, github_schema.OrganizationAuditEntryData, github_schema.RepositoryAuditEntryData, github_schema.TeamAuditEntryData):
+        __schema__ = github_schema
+        __field_names__ = ('is_ldap_mapped',)
+        is_ldap_mapped = sgqlc.types.Field('Boolean', graphql_name='isLdapMapped')
+    return TeamRemoveRepositoryAuditEntry
+
+
+def Topic():
+    class Topic(sgqlc.types.Type, github_schema.Node, github_schema.Starrable):
+        __schema__ = github_schema
+        __field_names__ = ('name', 'related_topics', 'repositories')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        related_topics = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Topic'))), graphql_name='relatedTopics', args=sgqlc.types.ArgDict((('first', sgqlc.types.Arg(github_schema.Int, graphql_name='first', default=3)),)))
+        repositories = sgqlc.types.Field(sgqlc.types.non_null('RepositoryConnection'), graphql_name='repositories', args=sgqlc.types.ArgDict((('privacy', sgqlc.types.Arg('RepositoryPrivacy', graphql_name='privacy', default=None)), ('order_by', sgqlc.types.Arg('RepositoryOrder', graphql_name='orderBy', default=None)), ('affiliations', sgqlc.types.Arg(sgqlc.types.list_of('RepositoryAffiliation'), graphql_name='affiliations', default=None)), ('owner_affiliations', sgqlc.types.Arg(sgqlc.types.list_of(github_schema.RepositoryAffiliation), graphql_name='ownerAffiliations', default=('OWNER', 'COLLABORATOR'))), ('is_locked', sgqlc.types.Arg('Boolean', graphql_name='isLocked', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('sponsorable_only', sgqlc.types.Arg(github_schema.Boolean, graphql_name='sponsorableOnly', default=False)))))
+    return Topic
+
+
+def TransferredEvent():
+    class TransferredEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'from_repository', 'issue')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        from_repository = sgqlc.types.Field('Repository', graphql_name='fromRepository')
+        issue = sgqlc.types.Field(sgqlc.types.non_null('Issue'), graphql_name='issue')
+    return TransferredEvent
+
+
+def Tree():
+    class Tree(sgqlc.types.Type, github_schema.Node, github_schema.GitObject):
+        __schema__ = github_schema
+        __field_names__ = ('entries',)
+        entries = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('TreeEntry')), graphql_name='entries')
+    return Tree
+
+
+def UnassignedEvent():
+    class UnassignedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'assignable', 'assignee', 'created_at')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        assignable = sgqlc.types.Field(sgqlc.types.non_null('Assignable'), graphql_name='assignable')
+        assignee = sgqlc.types.Field('Assignee', graphql_name='assignee')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+    return UnassignedEvent
+
+
+def UnknownSignature():
+    class UnknownSignature(sgqlc.types.Type, github_schema.GitSignature):
+        __schema__ = github_schema
+        __field_names__ = ()
+    return UnknownSignature
+
+
+def UnlabeledEvent():
+    class UnlabeledEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'label', 'labelable')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        label = sgqlc.types.Field(sgqlc.types.non_null('Label'), graphql_name='label')
+        labelable = sgqlc.types.Field(sgqlc.types.non_null('Labelable'), graphql_name='labelable')
+    return UnlabeledEvent
+
+
+def UnlockedEvent():
+    class UnlockedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'lockable')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        lockable = sgqlc.types.Field(sgqlc.types.non_null('Lockable'), graphql_name='lockable')
+    return UnlockedEvent
+
+
+def UnmarkedAsDuplicateEvent():
+    class UnmarkedAsDuplicateEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'canonical', 'created_at', 'duplicate', 'is_cross_repository')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        canonical = sgqlc.types.Field('IssueOrPullRequest', graphql_name='canonical')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        duplicate = sgqlc.types.Field('IssueOrPullRequest', graphql_name='duplicate')
+        is_cross_repository = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isCrossRepository')
+    return UnmarkedAsDuplicateEvent
+
+
+def UnpinnedEvent():
+    class UnpinnedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'issue')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        issue = sgqlc.types.Field(sgqlc.types.non_null('Issue'), graphql_name='issue')
+    return UnpinnedEvent
+
+
+def UnsubscribedEvent():
+    class UnsubscribedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'created_at', 'subscribable')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        subscribable = sgqlc.types.Field(sgqlc.types.non_null('Subscribable'), graphql_name='subscribable')
+    return UnsubscribedEvent
+
+
+def User():
+    class User(sgqlc.types.Type, github_schema.Node, github_schema.Actor, github_schema.PackageOwner, github_schema.ProjectOwner, github_schema.ProjectV2Owner, github_schema.ProjectV2Recent, github_schema.RepositoryDiscussionAuthor, github_schema.RepositoryDiscussionCommentAuthor, github_schema.RepositoryOwner, github_schema.UniformResourceLocatable, github_schema.ProfileOwner, github_schema.Sponsorable):
+        __schema__ = github_schema
+        __field_names__ = ('bio', 'bio_html', 'can_receive_organization_emails_when_notifications_restricted', 'commit_comments', 'company', 'company_html', 'contributions_collection', 'created_at', 'database_id', 'followers', 'following', 'gist', 'gist_comments', 'gists', 'hovercard', 'interaction_ability', 'is_bounty_hunter', 'is_campus_expert', 'is_developer_program_member', 'is_employee', 'is_following_viewer', 'is_git_hub_star', 'is_hireable', 'is_site_admin', 'is_viewer', 'issue_comments', 'issues', 'organization', 'organization_verified_domain_emails', 'organizations', 'pronouns', 'public_keys', 'pull_requests', 'repositories_contributed_to', 'saved_replies', 'social_accounts', 'starred_repositories', 'status', 'top_repositories', 'twitter_username', 'updated_at', 'viewer_can_follow', 'viewer_is_following', 'watching')
+        bio = sgqlc.types.Field('String', graphql_name='bio')
+        bio_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='bioHTML')
+        can_receive_organization_emails_when_notifications_restricted = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='canReceiveOrganizationEmailsWhenNotificationsRestricted', args=sgqlc.types.ArgDict((('login', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='login', default=None)),)))
+        commit_comments = sgqlc.types.Field(sgqlc.types.non_null('CommitCommentConnection'), graphql_name='commitComments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        company = sgqlc.types.Field('String', graphql_name='company')
+        company_html = sgqlc.types.Field(sgqlc.types.non_null('HTML'), graphql_name='companyHTML')
+        contributions_collection = sgqlc.types.Field(sgqlc.types.non_null('ContributionsCollection'), graphql_name='contributionsCollection', args=sgqlc.types.ArgDict((('organization_id', sgqlc.types.Arg('ID', graphql_name='organizationID', default=None)), ('from_', sgqlc.types.Arg('DateTime', graphql_name='from', default=None)), ('to', sgqlc.types.Arg('DateTime', graphql_name='to', default=None)))))
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        followers = sgqlc.types.Field(sgqlc.types.non_null('FollowerConnection'), graphql_name='followers', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        following = sgqlc.types.Field(sgqlc.types.non_null('FollowingConnection'), graphql_name='following', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        gist = sgqlc.types.Field('Gist', graphql_name='gist', args=sgqlc.types.ArgDict((('name', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='name', default=None)),)))
+        gist_comments = sgqlc.types.Field(sgqlc.types.non_null('GistCommentConnection'), graphql_name='gistComments', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        gists = sgqlc.types.Field(sgqlc.types.non_null('GistConnection'), graphql_name='gists', args=sgqlc.types.ArgDict((('privacy', sgqlc.types.Arg('GistPrivacy', graphql_name='privacy', default=None)), ('order_by', sgqlc.types.Arg('GistOrder', graphql_name='orderBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        hovercard = sgqlc.types.Field(sgqlc.types.non_null('Hovercard'), graphql_name='hovercard', args=sgqlc.types.ArgDict((('primary_subject_id', sgqlc.types.Arg('ID', graphql_name='primarySubjectId', default=None)),)))
+        interaction_ability = sgqlc.types.Field('RepositoryInteractionAbility', graphql_name='interactionAbility')
+        is_bounty_hunter = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isBountyHunter')
+        is_campus_expert = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isCampusExpert')
+        is_developer_program_member = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isDeveloperProgramMember')
+        is_employee = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isEmployee')
+        is_following_viewer = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isFollowingViewer')
+        is_git_hub_star = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isGitHubStar')
+        is_hireable = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isHireable')
+        is_site_admin = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isSiteAdmin')
+        is_viewer = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isViewer')
+        issue_comments = sgqlc.types.Field(sgqlc.types.non_null('IssueCommentConnection'), graphql_name='issueComments', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg('IssueCommentOrder', graphql_name='orderBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        issues = sgqlc.types.Field(sgqlc.types.non_null('IssueConnection'), graphql_name='issues', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg('IssueOrder', graphql_name='orderBy', default=None)), ('labels', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='labels', default=None)), ('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('IssueState')), graphql_name='states', default=None)), ('filter_by', sgqlc.types.Arg('IssueFilters', graphql_name='filterBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        organization = sgqlc.types.Field('Organization', graphql_name='organization', args=sgqlc.types.ArgDict((('login', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='login', default=None)),)))
+        organization_verified_domain_emails = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('String'))), graphql_name='organizationVerifiedDomainEmails', args=sgqlc.types.ArgDict((('login', sgqlc.types.Arg(sgqlc.types.non_null('String'), graphql_name='login', default=None)),)))
+        organizations = sgqlc.types.Field(sgqlc.types.non_null('OrganizationConnection'), graphql_name='organizations', args=sgqlc.types.ArgDict((('order_by', sgqlc.types.Arg('OrganizationOrder', graphql_name='orderBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        pronouns = sgqlc.types.Field('String', graphql_name='pronouns')
+        public_keys = sgqlc.types.Field(sgqlc.types.non_null('PublicKeyConnection'), graphql_name='publicKeys', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        pull_requests = sgqlc.types.Field(sgqlc.types.non_null('PullRequestConnection'), graphql_name='pullRequests', args=sgqlc.types.ArgDict((('states', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('PullRequestState')), graphql_name='states', default=None)), ('labels', sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='labels', default=None)), ('head_ref_name', sgqlc.types.Arg('String', graphql_name='headRefName', default=None)), ('base_ref_name', sgqlc.types.Arg('String', graphql_name='baseRefName', default=None)), ('order_by', sgqlc.types.Arg('IssueOrder', graphql_name='orderBy', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        repositories_contributed_to = sgqlc.types.Field(sgqlc.types.non_null('RepositoryConnection'), graphql_name='repositoriesContributedTo', args=sgqlc.types.ArgDict((('privacy', sgqlc.types.Arg('RepositoryPrivacy', graphql_name='privacy', default=None)), ('order_by', sgqlc.types.Arg('RepositoryOrder', graphql_name='orderBy', default=None)), ('is_locked', sgqlc.types.Arg('Boolean', graphql_name='isLocked', default=None)), ('include_user_repositories', sgqlc.types.Arg('Boolean', graphql_name='includeUserRepositories', default=None)), ('contribution_types', sgqlc.types.Arg(sgqlc.types.list_of('RepositoryContributionType'), graphql_name='contributionTypes', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        saved_replies = sgqlc.types.Field('SavedReplyConnection', graphql_name='savedReplies', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.SavedReplyOrder, graphql_name='orderBy', default={'field': 'UPDATED_AT', 'direction': 'DESC'})))))
+        social_accounts = sgqlc.types.Field(sgqlc.types.non_null('SocialAccountConnection'), graphql_name='socialAccounts', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        starred_repositories = sgqlc.types.Field(sgqlc.types.non_null('StarredRepositoryConnection'), graphql_name='starredRepositories', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('owned_by_viewer', sgqlc.types.Arg('Boolean', graphql_name='ownedByViewer', default=None)), ('order_by', sgqlc.types.Arg('StarOrder', graphql_name='orderBy', default=None)))))
+        status = sgqlc.types.Field('UserStatus', graphql_name='status')
+        top_repositories = sgqlc.types.Field(sgqlc.types.non_null('RepositoryConnection'), graphql_name='topRepositories', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(sgqlc.types.non_null('RepositoryOrder'), graphql_name='orderBy', default=None)), ('since', sgqlc.types.Arg('DateTime', graphql_name='since', default=None)))))
+        twitter_username = sgqlc.types.Field('String', graphql_name='twitterUsername')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        viewer_can_follow = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanFollow')
+        viewer_is_following = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerIsFollowing')
+        watching = sgqlc.types.Field(sgqlc.types.non_null('RepositoryConnection'), graphql_name='watching', args=sgqlc.types.ArgDict((('privacy', sgqlc.types.Arg('RepositoryPrivacy', graphql_name='privacy', default=None)), ('order_by', sgqlc.types.Arg('RepositoryOrder', graphql_name='orderBy', default=None)), ('affiliations', sgqlc.types.Arg(sgqlc.types.list_of('RepositoryAffiliation'), graphql_name='affiliations', default=None)), ('owner_affiliations', sgqlc.types.Arg(sgqlc.types.list_of(github_schema.RepositoryAffiliation), graphql_name='ownerAffiliations', default=('OWNER', 'COLLABORATOR'))), ('is_locked', sgqlc.types.Arg('Boolean', graphql_name='isLocked', default=None)), ('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+    return User
+
+
+def UserBlockedEvent():
+    class UserBlockedEvent(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('actor', 'block_duration', 'created_at', 'subject')
+        actor = sgqlc.types.Field('Actor', graphql_name='actor')
+        block_duration = sgqlc.types.Field(sgqlc.types.non_null('UserBlockDuration'), graphql_name='blockDuration')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        subject = sgqlc.types.Field('User', graphql_name='subject')
+    return UserBlockedEvent
+
+
+def UserContentEdit():
+    class UserContentEdit(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'deleted_at', 'deleted_by', 'diff', 'edited_at', 'editor', 'updated_at')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        deleted_at = sgqlc.types.Field('DateTime', graphql_name='deletedAt')
+        deleted_by = sgqlc.types.Field('Actor', graphql_name='deletedBy')
+        diff = sgqlc.types.Field('String', graphql_name='diff')
+        edited_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='editedAt')
+        editor = sgqlc.types.Field('Actor', graphql_name='editor')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return UserContentEdit
+
+
+def UserStatus():
+    class UserStatus(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'emoji', 'emoji_html', 'expires_at', 'indicates_limited_availability', 'message', 'organization', 'updated_at', 'user')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        emoji = sgqlc.types.Field('String', graphql_name='emoji')
+        emoji_html = sgqlc.types.Field('HTML', graphql_name='emojiHTML')
+        expires_at = sgqlc.types.Field('DateTime', graphql_name='expiresAt')
+        indicates_limited_availability = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='indicatesLimitedAvailability')
+        message = sgqlc.types.Field('String', graphql_name='message')
+        organization = sgqlc.types.Field('Organization', graphql_name='organization')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        user = sgqlc.types.Field(sgqlc.types.non_null('User'), graphql_name='user')
+    return UserStatus
+
+
+def VerifiableDomain():
+    class VerifiableDomain(sgqlc.types.Type, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'database_id', 'dns_host_name', 'domain', 'has_found_host_name', 'has_found_verification_token', 'is_approved', 'is_required_for_policy_enforcement', 'is_verified', 'owner', 'punycode_encoded_domain', 'token_expiration_time', 'updated_at', 'verification_token')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        dns_host_name = sgqlc.types.Field('URI', graphql_name='dnsHostName')
+        domain = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='domain')
+        has_found_host_name = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasFoundHostName')
+        has_found_verification_token = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasFoundVerificationToken')
+        is_approved = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isApproved')
+        is_required_for_policy_enforcement = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isRequiredForPolicyEnforcement')
+        is_verified = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isVerified')
+        owner = sgqlc.types.Field(sgqlc.types.non_null('VerifiableDomainOwner'), graphql_name='owner')
+        punycode_encoded_domain = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='punycodeEncodedDomain')
+        token_expiration_time = sgqlc.types.Field('DateTime', graphql_name='tokenExpirationTime')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        verification_token = sgqlc.types.Field('String', graphql_name='verificationToken')
+    return VerifiableDomain
+
+
+def ViewerHovercardContext():
+    class ViewerHovercardContext(sgqlc.types.Type, github_schema.HovercardContext):
+        __schema__ = github_schema
+        __field_names__ = ('viewer',)
+        viewer = sgqlc.types.Field(sgqlc.types.non_null('User'), graphql_name='viewer')
+    return ViewerHovercardContext
+
+
+def Workflow():
+    class Workflow(sgqlc.types.Type, github_schema.Node, github_schema.UniformResourceLocatable):
+        __schema__ = github_schema
+        __field_names__ = ('created_at', 'database_id', 'name', 'runs', 'state', 'updated_at')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        runs = sgqlc.types.Field(sgqlc.types.non_null('WorkflowRunConnection'), graphql_name='runs', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)), ('order_by', sgqlc.types.Arg(github_schema.WorkflowRunOrder, graphql_name='orderBy', default={'field': 'CREATED_AT', 'direction': 'DESC'})))))
+        state = sgqlc.types.Field(sgqlc.types.non_null('WorkflowState'), graphql_name='state')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+    return Workflow
+
+
+def WorkflowRun():
+    class WorkflowRun(sgqlc.types.Type, github_schema.Node, github_schema.UniformResourceLocatable):
+        __schema__ = github_schema
+        __field_names__ = ('check_suite', 'created_at', 'database_id', 'deployment_reviews', 'event', 'file', 'pending_deployment_requests', 'run_number', 'updated_at', 'workflow')
+        check_suite = sgqlc.types.Field(sgqlc.types.non_null('CheckSuite'), graphql_name='checkSuite')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        database_id = sgqlc.types.Field('Int', graphql_name='databaseId')
+        deployment_reviews = sgqlc.types.Field(sgqlc.types.non_null('DeploymentReviewConnection'), graphql_name='deploymentReviews', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        event = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='event')
+        file = sgqlc.types.Field('WorkflowRunFile', graphql_name='file')
+        pending_deployment_requests = sgqlc.types.Field(sgqlc.types.non_null('DeploymentRequestConnection'), graphql_name='pendingDeploymentRequests', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('before', sgqlc.types.Arg('String', graphql_name='before', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('last', sgqlc.types.Arg('Int', graphql_name='last', default=None)))))
+        run_number = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='runNumber')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        workflow = sgqlc.types.Field(sgqlc.types.non_null('Workflow'), graphql_name='workflow')
+    return WorkflowRun
+
+
+def WorkflowRunFile():
+    class WorkflowRunFile(sgqlc.types.Type, github_schema.UniformResourceLocatable, github_schema.Node):
+        __schema__ = github_schema
+        __field_names__ = ('path', 'repository_file_url', 'repository_name', 'run', 'viewer_can_push_repository', 'viewer_can_read_repository')
+        path = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='path')
+        repository_file_url = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='repositoryFileUrl')
+        repository_name = sgqlc.types.Field(sgqlc.types.non_null('URI'), graphql_name='repositoryName')
+        run = sgqlc.types.Field(sgqlc.types.non_null('WorkflowRun'), graphql_name='run')
+        viewer_can_push_repository = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanPushRepository')
+        viewer_can_read_repository = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='viewerCanReadRepository')
+    return WorkflowRunFile
@@ -0,0 +1,62 @@
+# Generated by tools/sgqlc_fast_schema.py
+# Source: github_schema.py
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+from . import github_schema
+
+
+def Base64String():
+    class Base64String(sgqlc.types.Scalar):
+        __schema__ = github_schema
+    return Base64String
+
+
+def BigInt():
+    class BigInt(sgqlc.types.Scalar):
+        __schema__ = github_schema
+    return BigInt
+
+
+def GitObjectID():
+    class GitObjectID(sgqlc.types.Scalar):
+        __schema__ = github_schema
+    return GitObjectID
+
+
+def GitSSHRemote():
+    class GitSSHRemote(sgqlc.types.Scalar):
+        __schema__ = github_schema
+    return GitSSHRemote
+
+
+def GitTimestamp():
+    class GitTimestamp(sgqlc.types.Scalar):
+        __schema__ = github_schema
+    return GitTimestamp
+
+
+def HTML():
+    class HTML(sgqlc.types.Scalar):
+        __schema__ = github_schema
+    return HTML
+
+
+def PreciseDateTime():
+    class PreciseDateTime(sgqlc.types.Scalar):
+        __schema__ = github_schema
+    return PreciseDateTime
+
+
+def URI():
+    class URI(sgqlc.types.Scalar):
+        __schema__ = github_schema
+    return URI
+
+
+def X509Certificate():
+    class X509Certificate(sgqlc.types.Scalar):
+        __schema__ = github_schema
+    return X509Certificate
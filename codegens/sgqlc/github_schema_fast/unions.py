@@ -0,0 +1,302 @@
+# Generated by tools/sgqlc_fast_schema.py
+# Source: github_schema.py
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+from . import github_schema
+
+
+def Assignee():
+    class Assignee(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Bot, github_schema.Mannequin, github_schema.Organization, github_schema.User)
+    return Assignee
+
+
+def AuditEntryActor():
+    class AuditEntryActor(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Bot, github_schema.Organization, github_schema.User)
+    return AuditEntryActor
+
+
+def BranchActorAllowanceActor():
+    class BranchActorAllowanceActor(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.App, github_schema.Team, github_schema.User)
+    return BranchActorAllowanceActor
+
+
+def BypassActor():
+    class BypassActor(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.App, github_schema.Team)
+    return BypassActor
+
+
+def Claimable():
+    class Claimable(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Mannequin, github_schema.User)
+    return Claimable
+
+
+def Closer():
+    class Closer(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Commit, github_schema.PullRequest)
+    return Closer
+
+
+def CreatedIssueOrRestrictedContribution():
+    class CreatedIssueOrRestrictedContribution(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.CreatedIssueContribution, github_schema.RestrictedContribution)
+    return CreatedIssueOrRestrictedContribution
+
+
+def CreatedPullRequestOrRestrictedContribution():
+    class CreatedPullRequestOrRestrictedContribution(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.CreatedPullRequestContribution, github_schema.RestrictedContribution)
+    return CreatedPullRequestOrRestrictedContribution
+
+
+def CreatedRepositoryOrRestrictedContribution():
+    class CreatedRepositoryOrRestrictedContribution(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.CreatedRepositoryContribution, github_schema.RestrictedContribution)
+    return CreatedRepositoryOrRestrictedContribution
+
+
+def DeploymentReviewer():
+    class DeploymentReviewer(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Team, github_schema.User)
+    return DeploymentReviewer
+
+
+def EnterpriseMember():
+    class EnterpriseMember(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.EnterpriseUserAccount, github_schema.User)
+    return EnterpriseMember
+
+
+def IpAllowListOwner():
+    class IpAllowListOwner(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.App, github_schema.Enterprise, github_schema.Organization)
+    return IpAllowListOwner
+
+
+def IssueOrPullRequest():
+    class IssueOrPullRequest(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Issue, github_schema.PullRequest)
+    return IssueOrPullRequest
+
+
+def IssueTimelineItem():
+    class IssueTimelineItem(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.AssignedEvent, github_schema.ClosedEvent, github_schema.Commit, github_schema.CrossReferencedEvent, github_schema.DemilestonedEvent, github_schema.IssueComment, github_schema.LabeledEvent, github_schema.LockedEvent, github_schema.MilestonedEvent, github_schema.ReferencedEvent, github_schema.RenamedTitleEvent, github_schema.ReopenedEvent, github_schema.SubscribedEvent, github_schema.TransferredEvent, github_schema.UnassignedEvent, github_schema.UnlabeledEvent, github_schema.UnlockedEvent, github_schema.UnsubscribedEvent, github_schema.UserBlockedEvent)
+    return IssueTimelineItem
+
+
+def IssueTimelineItems():
+    class IssueTimelineItems(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.AddedToProjectEvent, github_schema.AssignedEvent, github_schema.ClosedEvent, github_schema.CommentDeletedEvent, github_schema.ConnectedEvent, github_schema.ConvertedNoteToIssueEvent, github_schema.ConvertedToDiscussionEvent, github_schema.CrossReferencedEvent, github_schema.DemilestonedEvent, github_schema.DisconnectedEvent, github_schema.IssueComment, github_schema.LabeledEvent, github_schema.LockedEvent, github_schema.MarkedAsDuplicateEvent, github_schema.MentionedEvent, github_schema.MilestonedEvent, github_schema.MovedColumnsInProjectEvent, github_schema.PinnedEvent, github_schema.ReferencedEvent, github_schema.RemovedFromProjectEvent, github_schema.RenamedTitleEvent, github_schema.ReopenedEvent, github_schema.SubscribedEvent, github_schema.TransferredEvent, github_schema.UnassignedEvent, github_schema.UnlabeledEvent, github_schema.UnlockedEvent, github_schema.UnmarkedAsDuplicateEvent, github_schema.UnpinnedEvent, github_schema.UnsubscribedEvent, github_schema.UserBlockedEvent)
+    return IssueTimelineItems
+
+
+def MilestoneItem():
+    class MilestoneItem(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Issue, github_schema.PullRequest)
+    return MilestoneItem
+
+
+def OrgRestoreMemberAuditEntryMembership():
+    class OrgRestoreMemberAuditEntryMembership(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.OrgRestoreMemberMembershipOrganizationAuditEntryData, github_schema.OrgRestoreMemberMembershipRepositoryAuditEntryData, github_schema.OrgRestoreMemberMembershipTeamAuditEntryData)
+    return OrgRestoreMemberAuditEntryMembership
+
+
+def OrganizationAuditEntry():
+    class OrganizationAuditEntry(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.MembersCanDeleteReposClearAuditEntry, github_schema.MembersCanDeleteReposDisableAuditEntry, github_schema.MembersCanDeleteReposEnableAuditEntry, github_schema.OauthApplicationCreateAuditEntry, github_schema.OrgAddBillingManagerAuditEntry, github_schema.OrgAddMemberAuditEntry, github_schema.OrgBlockUserAuditEntry, github_schema.OrgConfigDisableCollaboratorsOnlyAuditEntry, github_schema.OrgConfigEnableCollaboratorsOnlyAuditEntry, github_schema.OrgCreateAuditEntry, github_schema.OrgDisableOauthAppRestrictionsAuditEntry, github_schema.OrgDisableSamlAuditEntry, github_schema.OrgDisableTwoFactorRequirementAuditEntry, github_schema.OrgEnableOauthAppRestrictionsAuditEntry, github_schema.OrgEnableSamlAuditEntry, github_schema.OrgEnableTwoFactorRequirementAuditEntry, github_schema.OrgInviteMemberAuditEntry, github_schema.OrgInviteToBusinessAuditEntry, github_schema.OrgOauthAppAccessApprovedAuditEntry, github_schema.OrgOauthAppAccessDeniedAuditEntry, github_schema.OrgOauthAppAccessRequestedAuditEntry, github_schema.OrgRemoveBillingManagerAuditEntry, github_schema.OrgRemoveMemberAuditEntry, github_schema.OrgRemoveOutsideCollaboratorAuditEntry, github_schema.OrgRestoreMemberAuditEntry, github_schema.OrgUnblockUserAuditEntry, github_schema.OrgUpdateDefaultRepositoryPermissionAuditEntry, github_schema.OrgUpdateMemberAuditEntry, github_schema.OrgUpdateMemberRepositoryCreationPermissionAuditEntry, github_schema.OrgUpdateMemberRepositoryInvitationPermissionAuditEntry, github_schema.PrivateRepositoryForkingDisableAuditEntry, github_schema.PrivateRepositoryForkingEnableAuditEntry, github_schema.RepoAccessAuditEntry, github_schema.RepoAddMemberAuditEntry, github_schema.RepoAddTopicAuditEntry, github_schema.RepoArchivedAuditEntry, github_schema.RepoChangeMergeSettingAuditEntry, github_schema.RepoConfigDisableAnonymousGitAccessAuditEntry, github_schema.RepoConfigDisableCollaboratorsOnlyAuditEntry, github_schema.RepoConfigDisableContributorsOnlyAuditEntry, github_schema.RepoConfigDisableSockpuppetDisallowedAuditEntry, github_schema.RepoConfigEnableAnonymousGitAccessAuditEntry, github_schema.RepoConfigEnableCollaboratorsOnlyAuditEntry, github_schema.RepoConfigEnableContributorsOnlyAuditEntry, github_schema.RepoConfigEnableSockpuppetDisallowedAuditEntry, github_schema.RepoConfigLockAnonymousGitAccessAuditEntry, github_schema.RepoConfigUnlockAnonymousGitAccessAuditEntry, github_schema.RepoCreateAuditEntry, github_schema.RepoDestroyAuditEntry, github_schema.RepoRemoveMemberAuditEntry, github_schema.RepoRemoveTopicAuditEntry, github_schema.RepositoryVisibilityChangeDisableAuditEntry, github_schema.RepositoryVisibilityChangeEnableAuditEntry, github_schema.TeamAddMemberAuditEntry, github_schema.TeamAddRepositoryAuditEntry, github_schema.TeamChangeParentTeamAuditEntry, github_schema.TeamRemoveMemberAuditEntry, github_schema.TeamRemoveRepositoryAuditEntry)
+    return OrganizationAuditEntry
+
+
+def OrganizationOrUser():
+    class OrganizationOrUser(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Organization, github_schema.User)
+    return OrganizationOrUser
+
+
+def PermissionGranter():
+    class PermissionGranter(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Organization, github_schema.Repository, github_schema.Team)
+    return PermissionGranter
+
+
+def PinnableItem():
+    class PinnableItem(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Gist, github_schema.Repository)
+    return PinnableItem
+
+
+def ProjectCardItem():
+    class ProjectCardItem(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Issue, github_schema.PullRequest)
+    return ProjectCardItem
+
+
+def ProjectV2Actor():
+    class ProjectV2Actor(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Team, github_schema.User)
+    return ProjectV2Actor
+
+
+def ProjectV2FieldConfiguration():
+    class ProjectV2FieldConfiguration(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.ProjectV2Field, github_schema.ProjectV2IterationField, github_schema.ProjectV2SingleSelectField)
+    return ProjectV2FieldConfiguration
+
+
+def ProjectV2ItemContent():
+    class ProjectV2ItemContent(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.DraftIssue, github_schema.Issue, github_schema.PullRequest)
+    return ProjectV2ItemContent
+
+
+def ProjectV2ItemFieldValue():
+    class ProjectV2ItemFieldValue(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.ProjectV2ItemFieldDateValue, github_schema.ProjectV2ItemFieldIterationValue, github_schema.ProjectV2ItemFieldLabelValue, github_schema.ProjectV2ItemFieldMilestoneValue, github_schema.ProjectV2ItemFieldNumberValue, github_schema.ProjectV2ItemFieldPullRequestValue, github_schema.ProjectV2ItemFieldRepositoryValue, github_schema.ProjectV2ItemFieldReviewerValue, github_schema.ProjectV2ItemFieldSingleSelectValue, github_schema.ProjectV2ItemFieldTextValue, github_schema.ProjectV2ItemFieldUserValue)
+    return ProjectV2ItemFieldValue
+
+
+def PullRequestTimelineItem():
+    class PullRequestTimelineItem(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.AssignedEvent, github_schema.BaseRefDeletedEvent, github_schema.BaseRefForcePushedEvent, github_schema.ClosedEvent, github_schema.Commit, github_schema.CommitCommentThread, github_schema.CrossReferencedEvent, github_schema.DemilestonedEvent, github_schema.DeployedEvent, github_schema.DeploymentEnvironmentChangedEvent, github_schema.HeadRefDeletedEvent, github_schema.HeadRefForcePushedEvent, github_schema.HeadRefRestoredEvent, github_schema.IssueComment, github_schema.LabeledEvent, github_schema.LockedEvent, github_schema.MergedEvent, github_schema.MilestonedEvent, github_schema.PullRequestReview, github_schema.PullRequestReviewComment, github_schema.PullRequestReviewThread, github_schema.ReferencedEvent, github_schema.RenamedTitleEvent, github_schema.ReopenedEvent, github_schema.ReviewDismissedEvent, github_schema.ReviewRequestRemovedEvent, github_schema.ReviewRequestedEvent, github_schema.SubscribedEvent, github_schema.UnassignedEvent, github_schema.UnlabeledEvent, github_schema.UnlockedEvent, github_schema.UnsubscribedEvent, github_schema.UserBlockedEvent)
+    return PullRequestTimelineItem
+
+
+def PullRequestTimelineItems():
+    class PullRequestTimelineItems(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.AddedToMergeQueueEvent, github_schema.AddedToProjectEvent, github_schema.AssignedEvent, github_schema.AutoMergeDisabledEvent, github_schema.AutoMergeEnabledEvent, github_schema.AutoRebaseEnabledEvent, github_schema.AutoSquashEnabledEvent, github_schema.AutomaticBaseChangeFailedEvent, github_schema.AutomaticBaseChangeSucceededEvent, github_schema.BaseRefChangedEvent, github_schema.BaseRefDeletedEvent, github_schema.BaseRefForcePushedEvent, github_schema.ClosedEvent, github_schema.CommentDeletedEvent, github_schema.ConnectedEvent, github_schema.ConvertToDraftEvent, github_schema.ConvertedNoteToIssueEvent, github_schema.ConvertedToDiscussionEvent, github_schema.CrossReferencedEvent, github_schema.DemilestonedEvent, github_schema.DeployedEvent, github_schema.DeploymentEnvironmentChangedEvent, github_schema.DisconnectedEvent, github_schema.HeadRefDeletedEvent, github_schema.HeadRefForcePushedEvent, github_schema.HeadRefRestoredEvent, github_schema.IssueComment, github_schema.LabeledEvent, github_schema.LockedEvent, github_schema.MarkedAsDuplicateEvent, github_schema.MentionedEvent, github_schema.MergedEvent, github_schema.MilestonedEvent, github_schema.MovedColumnsInProjectEvent, github_schema.PinnedEvent, github_schema.PullRequestCommit, github_schema.PullRequestCommitCommentThread, github_schema.PullRequestReview, github_schema.PullRequestReviewThread, github_schema.PullRequestRevisionMarker, github_schema.ReadyForReviewEvent, github_schema.ReferencedEvent, github_schema.RemovedFromMergeQueueEvent, github_schema.RemovedFromProjectEvent, github_schema.RenamedTitleEvent, github_schema.ReopenedEvent, github_schema.ReviewDismissedEvent, github_schema.ReviewRequestRemovedEvent, github_schema.ReviewRequestedEvent, github_schema.SubscribedEvent, github_schema.TransferredEvent, github_schema.UnassignedEvent, github_schema.UnlabeledEvent, github_schema.UnlockedEvent, github_schema.UnmarkedAsDuplicateEvent, github_schema.UnpinnedEvent, github_schema.UnsubscribedEvent, github_schema.UserBlockedEvent)
+    return PullRequestTimelineItems
+
+
+def PushAllowanceActor():
+    class PushAllowanceActor(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.App, github_schema.Team, github_schema.User)
+    return PushAllowanceActor
+
+
+def Reactor():
+    class Reactor(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Bot, github_schema.Mannequin, github_schema.Organization, github_schema.User)
+    return Reactor
+
+
+def ReferencedSubject():
+    class ReferencedSubject(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Issue, github_schema.PullRequest)
+    return ReferencedSubject
+
+
+def RenamedTitleSubject():
+    class RenamedTitleSubject(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Issue, github_schema.PullRequest)
+    return RenamedTitleSubject
+
+
+def RequestedReviewer():
+    class RequestedReviewer(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Mannequin, github_schema.Team, github_schema.User)
+    return RequestedReviewer
+
+
+def ReviewDismissalAllowanceActor():
+    class ReviewDismissalAllowanceActor(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.App, github_schema.Team, github_schema.User)
+    return ReviewDismissalAllowanceActor
+
+
+def RuleParameters():
+    class RuleParameters(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.BranchNamePatternParameters, github_schema.CommitAuthorEmailPatternParameters, github_schema.CommitMessagePatternParameters, github_schema.CommitterEmailPatternParameters, github_schema.PullRequestParameters, github_schema.RequiredDeploymentsParameters, github_schema.RequiredStatusChecksParameters, github_schema.TagNamePatternParameters, github_schema.UpdateParameters)
+    return RuleParameters
+
+
+def RuleSource():
+    class RuleSource(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Organization, github_schema.Repository)
+    return RuleSource
+
+
+def SearchResultItem():
+    class SearchResultItem(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.App, github_schema.Discussion, github_schema.Issue, github_schema.MarketplaceListing, github_schema.Organization, github_schema.PullRequest, github_schema.Repository, github_schema.User)
+    return SearchResultItem
+
+
+def Sponsor():
+    class Sponsor(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Organization, github_schema.User)
+    return Sponsor
+
+
+def SponsorableItem():
+    class SponsorableItem(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Organization, github_schema.User)
+    return SponsorableItem
+
+
+def SponsorsListingFeatureableItem():
+    class SponsorsListingFeatureableItem(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Repository, github_schema.User)
+    return SponsorsListingFeatureableItem
+
+
+def StatusCheckRollupContext():
+    class StatusCheckRollupContext(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.CheckRun, github_schema.StatusContext)
+    return StatusCheckRollupContext
+
+
+def VerifiableDomainOwner():
+    class VerifiableDomainOwner(sgqlc.types.Union):
+        __schema__ = github_schema
+        __types__ = (github_schema.Enterprise, github_schema.Organization)
+    return VerifiableDomainOwner
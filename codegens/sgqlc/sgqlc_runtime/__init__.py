@@ -0,0 +1,22 @@
+from .endpoint import AsyncEndpoint
+from .github import IssuePaginator, RateLimitBudget
+from .pagination import (
+    get_connection,
+    page_info_path,
+    paginate,
+    paginate_data,
+    paginate_responses,
+    variable_names,
+)
+
+__all__ = [
+    "AsyncEndpoint",
+    "IssuePaginator",
+    "RateLimitBudget",
+    "get_connection",
+    "page_info_path",
+    "paginate",
+    "paginate_data",
+    "paginate_responses",
+    "variable_names",
+]
@@ -0,0 +1,79 @@
+import asyncio
+import operator
+from typing import Any, Callable, Dict, Optional, Union
+
+import httpx
+from sgqlc.endpoint.httpx import HTTPXEndpoint
+from sgqlc.operation import Operation
+
+Interpret = Callable[[Operation, Dict[str, Any]], Any]
+
+
+class AsyncEndpoint(HTTPXEndpoint):
+    """
+    sgqlc endpoint sending requests through a pooled `httpx.AsyncClient`.
+
+    Calling it is a coroutine returning the response JSON, like awaiting
+    an `HTTPXEndpoint` built with an async client. The client keeps up to
+    `max_connections` connections alive, and at most `max_concurrency`
+    requests (default: `max_connections`) are in flight at once; the
+    others wait for their turn instead of failing with a pool timeout.
+
+    `execute()` returns the response interpreted by `interpret`, which is
+    `operation + response` by default; the compiled interpreter of
+    `tools/sgqlc_interpreter.py` has the same signature.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        base_headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_connections: int = 10,
+        max_concurrency: Optional[int] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        interpret: Interpret = operator.add,
+    ) -> None:
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                )
+            )
+        super().__init__(url, base_headers, timeout, client=client)
+        self.max_concurrency = max_concurrency or max_connections
+        self.interpret = interpret
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+
+    async def __call__(  # type: ignore[override]
+        self,
+        query: Union[bytes, str, Operation],
+        variables: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        async with self._slots:
+            return await super().__call__(
+                query, variables, operation_name, extra_headers, timeout
+            )
+
+    async def execute(
+        self,
+        operation: Operation,
+        variables: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Sends `operation` and returns the interpreted response."""
+        response = await self(operation, variables, **kwargs)
+        return self.interpret(operation, response)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncEndpoint":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
@@ -0,0 +1,247 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Tuple
+
+from sgqlc.operation import GraphQLErrors, Operation
+
+from .endpoint import AsyncEndpoint
+from .pagination import get_connection, page_info_path
+
+Repository = Tuple[str, str]
+
+# GitHub asks to wait at least a minute after a secondary rate limit
+# that comes without `retry-after`.
+SECONDARY_RATE_LIMIT_WAIT = 60
+
+
+def _timestamp(value: str) -> float:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+class RateLimitBudget:
+    """
+    The GraphQL points left to a token, shared by every request made with it.
+
+    Requests reserve their expected cost before they are sent, and the
+    `rateLimit { cost remaining resetAt }` of each response updates the
+    budget. A request that would leave fewer than `reserve` points waits
+    until `resetAt` (plus `skew` seconds for clock differences). Until a
+    response has reported the budget, requests are sent one at a time.
+    """
+
+    def __init__(
+        self,
+        reserve: int = 0,
+        skew: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.reserve = reserve
+        self.skew = skew
+        self.clock = clock
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.waits = 0
+        self._pending = 0
+        self._changed = asyncio.Condition()
+
+    async def acquire(self, cost: int) -> None:
+        """Waits until `cost` points can be spent, and reserves them."""
+        async with self._changed:
+            while True:
+                now = self.clock()
+                if self.remaining is not None and now >= self.reset_at + self.skew:
+                    # A new window: the next response reports its budget.
+                    self.remaining = None
+                if self.remaining is None:
+                    if not self._pending:
+                        break
+                    timeout = None
+                elif self.remaining - self._pending - cost >= self.reserve:
+                    break
+                else:
+                    self.waits += 1
+                    timeout = self.reset_at + self.skew - now
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            self._pending += cost
+
+    async def release(
+        self, cost: int, rate_limit: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Returns a reservation, with the `rateLimit` its response reported."""
+        async with self._changed:
+            self._pending -= cost
+            if rate_limit:
+                reset_at = _timestamp(rate_limit["resetAt"])
+                remaining = rate_limit["remaining"]
+                if self.remaining is None or reset_at > self.reset_at:
+                    self.remaining, self.reset_at = remaining, reset_at
+                elif reset_at == self.reset_at:
+                    # Responses of one window arrive in any order.
+                    self.remaining = min(self.remaining, remaining)
+            self._changed.notify_all()
+
+    async def exhaust(self, reset_at: Optional[float] = None) -> None:
+        """Records that the server refused a request for lack of points."""
+        async with self._changed:
+            if reset_at is not None:
+                self.reset_at = reset_at
+            elif self.reset_at <= self.clock():
+                self.reset_at = self.clock() + SECONDARY_RATE_LIMIT_WAIT
+            self.remaining = 0
+            self._changed.notify_all()
+
+
+def _http_error(response: Dict[str, Any]) -> Tuple[Optional[int], Dict[str, str]]:
+    # HTTPXEndpoint reports HTTP errors in the response or in its error.
+    for source in (response, *(response.get("errors") or ())):
+        if source.get("status"):
+            headers = {k.lower(): v for k, v in (source.get("headers") or {}).items()}
+            return source["status"], headers
+    return None, {}
+
+
+class IssuePaginator:
+    """
+    Walks the issues of repositories with `Operations.query.list_issues`,
+    keeping within the GitHub rate limit.
+
+    Every request goes through the `budget`, which may be shared by the
+    paginators of one token. The cost of the next page is estimated as
+    the cost of the last one. A `RATE_LIMITED` error waits for the budget
+    to refill and a secondary rate limit (403 or 429) for `retry-after`,
+    then the page is requested again, up to `max_retries` times.
+    """
+
+    def __init__(
+        self,
+        endpoint: AsyncEndpoint,
+        budget: Optional[RateLimitBudget] = None,
+        operation: Optional[Operation] = None,
+        max_retries: int = 5,
+    ) -> None:
+        self.endpoint = endpoint
+        self.budget = budget or RateLimitBudget()
+        if operation is None:
+            # Imported here so the Tableau side does not load GitHub's schema.
+            from github_operations import Operations
+
+            operation = Operations.query.list_issues
+        self.operation = operation
+        self.max_retries = max_retries
+        self.cost = 1
+        self.path = page_info_path(self.operation)
+
+    async def responses(
+        self,
+        owner: str,
+        name: str,
+        variables: Optional[Dict[str, Any]] = None,
+        after: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yields the response of every page of issues of `owner/name`."""
+        variables = {**(variables or {}), "owner": owner, "name": name}
+        while True:
+            response = await self._send({**variables, "after": after})
+            yield response
+
+            page_info = get_connection(response["data"], self.path)["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return
+            after = page_info["endCursor"]
+
+    async def pages(
+        self,
+        owner: str,
+        name: str,
+        variables: Optional[Dict[str, Any]] = None,
+        after: Optional[str] = None,
+    ) -> AsyncIterator[Any]:
+        """Like `responses()`, but yields `endpoint.interpret()`ed pages."""
+        async for response in self.responses(owner, name, variables, after):
+            yield self.endpoint.interpret(self.operation, response)
+
+    async def issues(
+        self,
+        owner: str,
+        name: str,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yields the issue nodes of `owner/name`, as JSON."""
+        async for response in self.responses(owner, name, variables):
+            for node in get_connection(response["data"], self.path)["nodes"]:
+                yield node
+
+    async def crawl(
+        self,
+        repositories: Iterable[Repository],
+        concurrency: int = 4,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Tuple[Repository, Dict[str, Any]]]:
+        """
+        Yields `((owner, name), response)` for every page of every
+        repository, walking up to `concurrency` repositories at once.
+        """
+        pending = iter(repositories)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+        done = object()
+
+        async def walk() -> None:
+            try:
+                for repository in pending:
+                    async for response in self.responses(*repository, variables):
+                        await queue.put((repository, response))
+            except Exception as exc:
+                await queue.put(exc)
+            else:
+                await queue.put(done)
+
+        workers = [asyncio.create_task(walk()) for _ in range(concurrency)]
+        try:
+            finished = 0
+            while finished < len(workers):
+                item = await queue.get()
+                if item is done:
+                    finished += 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _send(self, variables: Dict[str, Any]) -> Dict[str, Any]:
+        for attempt in range(self.max_retries + 1):
+            cost = self.cost
+            await self.budget.acquire(cost)
+            rate_limit = None
+            try:
+                response = await self.endpoint(self.operation, variables)
+                rate_limit = (response.get("data") or {}).get("rateLimit")
+            finally:
+                await self.budget.release(cost, rate_limit)
+            if rate_limit:
+                self.cost = rate_limit["cost"]
+
+            errors = response.get("errors") or []
+            if any(error.get("type") == "RATE_LIMITED" for error in errors):
+                await self.budget.exhaust()
+                continue
+            status, headers = _http_error(response)
+            if status in (403, 429) and attempt < self.max_retries:
+                if "retry-after" in headers:
+                    delay = float(headers["retry-after"])
+                elif headers.get("x-ratelimit-remaining") == "0":
+                    delay = float(headers["x-ratelimit-reset"]) - time.time()
+                else:
+                    delay = SECONDARY_RATE_LIMIT_WAIT
+                await asyncio.sleep(max(delay, 0))
+                continue
+            if errors or not response.get("data"):
+                raise GraphQLErrors(errors)
+            return response
+        raise GraphQLErrors(response.get("errors") or [])
@@ -0,0 +1,113 @@
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from sgqlc.operation import GraphQLErrors, Operation
+from sgqlc.types import BaseTypeWithTypename
+
+from .endpoint import AsyncEndpoint
+
+
+def variable_names(operation: Operation) -> List[str]:
+    """The names of the variables the operation declares, without `$`."""
+    variables = operation._Operation__args  # type: ignore[attr-defined]
+    return [name.lstrip("$") for name in variables]
+
+
+def page_info_path(operation: Operation) -> Tuple[str, ...]:
+    """
+    JSON keys from `data` to the connection whose `pageInfo` is selected,
+    like `("sheetsConnection",)` or `("repository", "issues")`.
+    """
+
+    def search(selections: Any, path: Tuple[str, ...]) -> Optional[Tuple[str, ...]]:
+        nested = []
+        for selection in selections:
+            field = selection.__field__
+            if field.name == "page_info":
+                return path
+            if issubclass(field.type, BaseTypeWithTypename):
+                nested.append(selection)
+        for selection in nested:
+            key = selection.__alias__ or selection.__field__.graphql_name
+            found = search(selection, path + (key,))
+            if found is not None:
+                return found
+        return None
+
+    selections = operation._Operation__selection_list  # type: ignore[attr-defined]
+    path = search(selections, ())
+    if path is None:
+        raise ValueError(f"{operation._Operation__name} selects no pageInfo")  # type: ignore[attr-defined]
+    return path
+
+
+def get_connection(data: Dict[str, Any], path: Tuple[str, ...]) -> Dict[str, Any]:
+    """The connection at `path` in the response `data`."""
+    for key in path:
+        data = data[key]
+    return data
+
+
+async def paginate_responses(
+    endpoint: AsyncEndpoint,
+    operation: Operation,
+    variables: Optional[Dict[str, Any]] = None,
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yields the response of every page of `operation`, following
+    `pageInfo.endCursor` through the operation's `$after` variable.
+
+    `first`, when given, is sent as the operation's `$first` variable.
+    A response with errors raises `GraphQLErrors` instead of being
+    yielded, since the crawl cannot tell where to continue from.
+    """
+    names = variable_names(operation)
+    if "after" not in names or (first is not None and "first" not in names):
+        raise ValueError(
+            f"{operation._Operation__name} declares {names},"  # type: ignore[attr-defined]
+            " pagination needs $after (and $first to set it)"
+        )
+    variables = dict(variables or {})
+    if first is not None:
+        variables["first"] = first
+    path = page_info_path(operation)
+
+    while True:
+        response = await endpoint(operation, {**variables, "after": after})
+        if response.get("errors") or not response.get("data"):
+            raise GraphQLErrors(response.get("errors") or [])
+        yield response
+
+        page_info = get_connection(response["data"], path)["pageInfo"]
+        if not page_info["hasNextPage"]:
+            return
+        after = page_info["endCursor"]
+
+
+async def paginate(
+    endpoint: AsyncEndpoint,
+    operation: Operation,
+    variables: Optional[Dict[str, Any]] = None,
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+) -> AsyncIterator[Any]:
+    """Like `paginate_responses()`, but yields `endpoint.interpret()`ed pages."""
+    async for response in paginate_responses(
+        endpoint, operation, variables, first, after
+    ):
+        yield endpoint.interpret(operation, response)
+
+
+async def paginate_data(
+    endpoint: AsyncEndpoint,
+    operation: Operation,
+    variables: Optional[Dict[str, Any]] = None,
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Like `paginate_responses()`, but yields the `data` of every page."""
+    async for response in paginate_responses(
+        endpoint, operation, variables, first, after
+    ):
+        yield response["data"]
@@ -2,3 +2,7 @@
 sgqlc-codegen schema --docstrings ../../schemas/tableau/schema.json tableau_schema.py
 # this genrates the queries
 sgqlc-codegen operation --schema ../../schemas/tableau/schema.json tableau_schema tableau_operations.py tableau_operations.gql
+# this builds the operations lazily, on first access
+python ../../tools/sgqlc_lazy_operations.py tableau_operations.py
+# this generates the fast-importing schema package (no docstrings, types built on first use)
+python ../../tools/sgqlc_fast_schema.py tableau_schema.py tableau_schema_fast
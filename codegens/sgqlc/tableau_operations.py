@@ -1,3 +1,4 @@
+import functools
 import sgqlc.types
 import sgqlc.operation
 import tableau_schema
@@ -322,14 +323,30 @@ def query_get_items_workbooks_connection():
     return _op
 
 
+class _LazyOperation:
+    def __init__(self, build):
+        self.build = build
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        operation = self.build()
+        operation.__to_graphql__ = functools.lru_cache(maxsize=None)(
+            operation.__to_graphql__
+        )
+        setattr(owner, self.name, operation)
+        return operation
+
+
 class Query:
-    get_items_custom_sqltables_connection = query_get_items_custom_sqltables_connection()
-    get_items_database_tables_connection = query_get_items_database_tables_connection()
-    get_items_embedded_datasources_connection = query_get_items_embedded_datasources_connection()
-    get_items_fields_connection = query_get_items_fields_connection()
-    get_items_published_datasources_connection = query_get_items_published_datasources_connection()
-    get_items_sheets_connection = query_get_items_sheets_connection()
-    get_items_workbooks_connection = query_get_items_workbooks_connection()
+    get_items_custom_sqltables_connection = _LazyOperation(query_get_items_custom_sqltables_connection)
+    get_items_database_tables_connection = _LazyOperation(query_get_items_database_tables_connection)
+    get_items_embedded_datasources_connection = _LazyOperation(query_get_items_embedded_datasources_connection)
+    get_items_fields_connection = _LazyOperation(query_get_items_fields_connection)
+    get_items_published_datasources_connection = _LazyOperation(query_get_items_published_datasources_connection)
+    get_items_sheets_connection = _LazyOperation(query_get_items_sheets_connection)
+    get_items_workbooks_connection = _LazyOperation(query_get_items_workbooks_connection)
 
 
 class Operations:
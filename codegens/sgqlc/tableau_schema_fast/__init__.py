@@ -0,0 +1,435 @@
+# Generated by tools/sgqlc_fast_schema.py
+# Source: tableau_schema.py
+
+import importlib
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+
+class _LazySchema(sgqlc.types.Schema):
+    """A schema that builds each type the first time it is looked up."""
+
+    def __init__(self, modules):
+        self._modules = dict(modules)
+        self._roots = {}
+        super().__init__()
+
+    def _build(self, name):
+        module = self._modules.pop(name, None)
+        if module is None:
+            return False
+        getattr(importlib.import_module(f"{__name__}.{module}"), name)()
+        return True
+
+    def _build_all(self):
+        while self._modules:
+            self._build(next(iter(self._modules)))
+
+    def __getitem__(self, key):
+        try:
+            return super().__getitem__(key)
+        except KeyError:
+            if not self._build(key):
+                raise
+        return super().__getitem__(key)
+
+    def __getattr__(self, key):
+        if key.startswith("_"):
+            raise AttributeError(key)
+        try:
+            return super().__getattr__(key)
+        except AttributeError:
+            if not self._build(key):
+                raise
+        return super().__getattr__(key)
+
+    def __contains__(self, key):
+        return key in self._modules or super().__contains__(key)
+
+    def __iter__(self):
+        self._build_all()
+        return super().__iter__()
+
+    def __to_graphql__(self, *args, **kwargs):
+        self._build_all()
+        return super().__to_graphql__(*args, **kwargs)
+
+    def _root(kind):
+        def get(self):
+            root = self._roots.get(kind)
+            # Registering a type reads the root types, also while the
+            # root type itself is being built.
+            if isinstance(root, str) and root in self:
+                root = self._roots[kind] = self[root]
+            return root
+
+        def set(self, value):
+            self._roots[kind] = value
+
+        return property(get, set)
+
+    query_type = _root("query")
+    mutation_type = _root("mutation")
+    subscription_type = _root("subscription")
+    del _root
+
+
+tableau_schema = _LazySchema({
+    'AnalyticsField': 'interfaces',
+    'AnalyticsFieldOrderField': 'enums',
+    'AnalyticsFieldSortOrder': 'inputs',
+    'AnalyticsField_Filter': 'inputs',
+    'AnalyticsFieldsConnection': 'connections',
+    'AskDataExtension': 'objects',
+    'AskDataExtensionOrderField': 'enums',
+    'AskDataExtensionSortOrder': 'inputs',
+    'AskDataExtension_Filter': 'inputs',
+    'AskDataExtension_Required_Filter': 'inputs',
+    'AskDataExtensionsConnection': 'connections',
+    'BinField': 'objects',
+    'BinFieldOrderField': 'enums',
+    'BinFieldSortOrder': 'inputs',
+    'BinField_Filter': 'inputs',
+    'BinField_Required_Filter': 'inputs',
+    'BinFieldsConnection': 'connections',
+    'CalculatedField': 'objects',
+    'CalculatedFieldOrderField': 'enums',
+    'CalculatedFieldSortOrder': 'inputs',
+    'CalculatedField_Filter': 'inputs',
+    'CalculatedField_Required_Filter': 'inputs',
+    'CalculatedFieldsConnection': 'connections',
+    'CanHaveLabels': 'interfaces',
+    'CanHaveLabelsOrderField': 'enums',
+    'CanHaveLabelsSortOrder': 'inputs',
+    'CanHaveLabels_Filter': 'inputs',
+    'CanHaveLabelsesConnection': 'connections',
+    'Certifiable': 'interfaces',
+    'CertifiableOrderField': 'enums',
+    'CertifiableSortOrder': 'inputs',
+    'Certifiable_Filter': 'inputs',
+    'CertifiablesConnection': 'connections',
+    'CloudFile': 'objects',
+    'CloudFileOrderField': 'enums',
+    'CloudFileSortOrder': 'inputs',
+    'CloudFile_Filter': 'inputs',
+    'CloudFilesConnection': 'connections',
+    'Column': 'objects',
+    'ColumnField': 'objects',
+    'ColumnFieldOrderField': 'enums',
+    'ColumnFieldSortOrder': 'inputs',
+    'ColumnField_Filter': 'inputs',
+    'ColumnField_Required_Filter': 'inputs',
+    'ColumnFieldsConnection': 'connections',
+    'ColumnOrderField': 'enums',
+    'ColumnSortOrder': 'inputs',
+    'Column_Filter': 'inputs',
+    'Column_Required_Filter': 'inputs',
+    'ColumnsConnection': 'connections',
+    'CombinedField': 'objects',
+    'CombinedFieldOrderField': 'enums',
+    'CombinedFieldSortOrder': 'inputs',
+    'CombinedField_Filter': 'inputs',
+    'CombinedField_Required_Filter': 'inputs',
+    'CombinedFieldsConnection': 'connections',
+    'CombinedSetField': 'objects',
+    'CombinedSetFieldOrderField': 'enums',
+    'CombinedSetFieldSortOrder': 'inputs',
+    'CombinedSetField_Filter': 'inputs',
+    'CombinedSetField_Required_Filter': 'inputs',
+    'CombinedSetFieldsConnection': 'connections',
+    'CustomSQLTable': 'objects',
+    'CustomSQLTableOrderField': 'enums',
+    'CustomSQLTableSortOrder': 'inputs',
+    'CustomSQLTable_Filter': 'inputs',
+    'CustomSQLTablesConnection': 'connections',
+    'Dashboard': 'objects',
+    'DashboardOrderField': 'enums',
+    'DashboardSortOrder': 'inputs',
+    'Dashboard_Filter': 'inputs',
+    'DashboardsConnection': 'connections',
+    'DataCloud': 'objects',
+    'DataCloudOrderField': 'enums',
+    'DataCloudSortOrder': 'inputs',
+    'DataCloud_Filter': 'inputs',
+    'DataCloudsConnection': 'connections',
+    'DataField': 'interfaces',
+    'DataFieldOrderField': 'enums',
+    'DataFieldSortOrder': 'inputs',
+    'DataField_Filter': 'inputs',
+    'DataFieldsConnection': 'connections',
+    'DataQualityCertification': 'objects',
+    'DataQualityCertificationOrderField': 'enums',
+    'DataQualityCertificationSortOrder': 'inputs',
+    'DataQualityCertification_Filter': 'inputs',
+    'DataQualityCertificationsConnection': 'connections',
+    'DataQualityWarning': 'objects',
+    'DataQualityWarningOrderField': 'enums',
+    'DataQualityWarningSortOrder': 'inputs',
+    'DataQualityWarning_Filter': 'inputs',
+    'DataQualityWarningsConnection': 'connections',
+    'Database': 'interfaces',
+    'DatabaseOrderField': 'enums',
+    'DatabaseServer': 'objects',
+    'DatabaseServerOrderField': 'enums',
+    'DatabaseServerSortOrder': 'inputs',
+    'DatabaseServer_Filter': 'inputs',
+    'DatabaseServersConnection': 'connections',
+    'DatabaseSortOrder': 'inputs',
+    'DatabaseTable': 'objects',
+    'DatabaseTableOrderField': 'enums',
+    'DatabaseTableSortOrder': 'inputs',
+    'DatabaseTable_Filter': 'inputs',
+    'DatabaseTablesConnection': 'connections',
+    'Database_Filter': 'inputs',
+    'DatabasesConnection': 'connections',
+    'Datasource': 'interfaces',
+    'DatasourceField': 'objects',
+    'DatasourceFieldOrderField': 'enums',
+    'DatasourceFieldSortOrder': 'inputs',
+    'DatasourceField_Filter': 'inputs',
+    'DatasourceField_Required_Filter': 'inputs',
+    'DatasourceFieldsConnection': 'connections',
+    'DatasourceFilter': 'objects',
+    'DatasourceFilterOrderField': 'enums',
+    'DatasourceFilterSortOrder': 'inputs',
+    'DatasourceFilter_Filter': 'inputs',
+    'DatasourceFiltersConnection': 'connections',
+    'DatasourceOrderField': 'enums',
+    'DatasourceSortOrder': 'inputs',
+    'Datasource_Filter': 'inputs',
+    'DatasourcesConnection': 'connections',
+    'EmbeddedDatasource': 'objects',
+    'EmbeddedDatasourceOrderField': 'enums',
+    'EmbeddedDatasourceSortOrder': 'inputs',
+    'EmbeddedDatasource_Filter': 'inputs',
+    'EmbeddedDatasourcesConnection': 'connections',
+    'ExtractType': 'enums',
+    'ExtractType_Filter': 'inputs',
+    'Field': 'interfaces',
+    'FieldDataType': 'enums',
+    'FieldDataType_Filter': 'inputs',
+    'FieldOrderField': 'enums',
+    'FieldReferencingField': 'interfaces',
+    'FieldReferencingFieldOrderField': 'enums',
+    'FieldReferencingFieldSortOrder': 'inputs',
+    'FieldReferencingField_Filter': 'inputs',
+    'FieldReferencingFieldsConnection': 'connections',
+    'FieldRole': 'enums',
+    'FieldRoleCategory': 'enums',
+    'FieldRoleCategory_Filter': 'inputs',
+    'FieldRole_Filter': 'inputs',
+    'FieldSortOrder': 'inputs',
+    'Field_Filter': 'inputs',
+    'Field_Required_Filter': 'inputs',
+    'FieldsConnection': 'connections',
+    'File': 'objects',
+    'FileOrderField': 'enums',
+    'FileSortOrder': 'inputs',
+    'File_Filter': 'inputs',
+    'FilesConnection': 'connections',
+    'Flow': 'objects',
+    'FlowColumnInputField': 'objects',
+    'FlowColumnInputFieldOrderField': 'enums',
+    'FlowColumnInputFieldSortOrder': 'inputs',
+    'FlowColumnInputField_Filter': 'inputs',
+    'FlowColumnInputFieldsConnection': 'connections',
+    'FlowColumnOutputField': 'objects',
+    'FlowColumnOutputFieldOrderField': 'enums',
+    'FlowColumnOutputFieldSortOrder': 'inputs',
+    'FlowColumnOutputField_Filter': 'inputs',
+    'FlowColumnOutputFieldsConnection': 'connections',
+    'FlowFieldInputField': 'objects',
+    'FlowFieldInputFieldOrderField': 'enums',
+    'FlowFieldInputFieldSortOrder': 'inputs',
+    'FlowFieldInputField_Filter': 'inputs',
+    'FlowFieldInputFieldsConnection': 'connections',
+    'FlowFieldOutputField': 'objects',
+    'FlowFieldOutputFieldOrderField': 'enums',
+    'FlowFieldOutputFieldSortOrder': 'inputs',
+    'FlowFieldOutputField_Filter': 'inputs',
+    'FlowFieldOutputFieldsConnection': 'connections',
+    'FlowInputField': 'interfaces',
+    'FlowInputFieldOrderField': 'enums',
+    'FlowInputFieldSortOrder': 'inputs',
+    'FlowInputField_Filter': 'inputs',
+    'FlowInputFieldsConnection': 'connections',
+    'FlowOrderField': 'enums',
+    'FlowOutputField': 'interfaces',
+    'FlowOutputFieldOrderField': 'enums',
+    'FlowOutputFieldSortOrder': 'inputs',
+    'FlowOutputField_Filter': 'inputs',
+    'FlowOutputFieldsConnection': 'connections',
+    'FlowOutputStep': 'objects',
+    'FlowOutputStepOrderField': 'enums',
+    'FlowOutputStepSortOrder': 'inputs',
+    'FlowOutputStep_Filter': 'inputs',
+    'FlowOutputStepsConnection': 'connections',
+    'FlowSortOrder': 'inputs',
+    'Flow_Filter': 'inputs',
+    'FlowsConnection': 'connections',
+    'GenericLabel': 'objects',
+    'GenericLabelOrderField': 'enums',
+    'GenericLabelSortOrder': 'inputs',
+    'GenericLabel_Filter': 'inputs',
+    'GenericLabelsConnection': 'connections',
+    'GroupField': 'objects',
+    'GroupFieldOrderField': 'enums',
+    'GroupFieldSortOrder': 'inputs',
+    'GroupField_Filter': 'inputs',
+    'GroupField_Required_Filter': 'inputs',
+    'GroupFieldsConnection': 'connections',
+    'HierarchyField': 'objects',
+    'HierarchyFieldOrderField': 'enums',
+    'HierarchyFieldSortOrder': 'inputs',
+    'HierarchyField_Filter': 'inputs',
+    'HierarchyField_Required_Filter': 'inputs',
+    'HierarchyFieldsConnection': 'connections',
+    'InheritanceType': 'enums',
+    'InheritedStringResult': 'objects',
+    'Label': 'interfaces',
+    'LabelOrderField': 'enums',
+    'LabelSortOrder': 'inputs',
+    'Label_Filter': 'inputs',
+    'LabelsConnection': 'connections',
+    'Lens': 'objects',
+    'LensField': 'objects',
+    'LensFieldOrderField': 'enums',
+    'LensFieldSortOrder': 'inputs',
+    'LensField_Filter': 'inputs',
+    'LensField_Required_Filter': 'inputs',
+    'LensFieldsConnection': 'connections',
+    'LensOrderField': 'enums',
+    'LensSortOrder': 'inputs',
+    'Lens_Filter': 'inputs',
+    'LensesConnection': 'connections',
+    'LinkedFlow': 'objects',
+    'LinkedFlowOrderField': 'enums',
+    'LinkedFlowSortOrder': 'inputs',
+    'LinkedFlow_Filter': 'inputs',
+    'LinkedFlowsConnection': 'connections',
+    'Metric': 'objects',
+    'MetricDefinition': 'objects',
+    'MetricDefinitionOrderField': 'enums',
+    'MetricDefinitionSortOrder': 'inputs',
+    'MetricDefinition_Filter': 'inputs',
+    'MetricDefinitionsConnection': 'connections',
+    'MetricOrderField': 'enums',
+    'MetricSortOrder': 'inputs',
+    'Metric_Filter': 'inputs',
+    'MetricsConnection': 'connections',
+    'Node': 'interfaces',
+    'NodeOrderField': 'enums',
+    'NodeSortOrder': 'inputs',
+    'Node_Filter': 'inputs',
+    'NodesConnection': 'connections',
+    'OrderDirection': 'enums',
+    'PageInfo': 'objects',
+    'Parameter': 'objects',
+    'ParameterOrderField': 'enums',
+    'ParameterSortOrder': 'inputs',
+    'Parameter_Filter': 'inputs',
+    'ParametersConnection': 'connections',
+    'PermissionMode': 'enums',
+    'PublishedDatasource': 'objects',
+    'PublishedDatasourceOrderField': 'enums',
+    'PublishedDatasourceSortOrder': 'inputs',
+    'PublishedDatasource_Filter': 'inputs',
+    'PublishedDatasourcesConnection': 'connections',
+    'Query': 'objects',
+    'RemoteType': 'enums',
+    'RemoteType_Filter': 'inputs',
+    'SetField': 'objects',
+    'SetFieldOrderField': 'enums',
+    'SetFieldSortOrder': 'inputs',
+    'SetField_Filter': 'inputs',
+    'SetField_Required_Filter': 'inputs',
+    'SetFieldsConnection': 'connections',
+    'Sheet': 'objects',
+    'SheetOrderField': 'enums',
+    'SheetSortOrder': 'inputs',
+    'Sheet_Filter': 'inputs',
+    'SheetsConnection': 'connections',
+    'Table': 'interfaces',
+    'TableAdditionalDetails': 'objects',
+    'TableAdditionalDetailsOrderField': 'enums',
+    'TableAdditionalDetailsSortOrder': 'inputs',
+    'TableAdditionalDetails_Filter': 'inputs',
+    'TableAdditionalDetailsesConnection': 'connections',
+    'TableOrderField': 'enums',
+    'TableSortOrder': 'inputs',
+    'TableType': 'enums',
+    'TableType_Filter': 'inputs',
+    'Table_Filter': 'inputs',
+    'TableauSite': 'objects',
+    'TableauSiteOrderField': 'enums',
+    'TableauSiteSortOrder': 'inputs',
+    'TableauSite_Filter': 'inputs',
+    'TableauSitesConnection': 'connections',
+    'TableauUser': 'objects',
+    'TableauUserOrderField': 'enums',
+    'TableauUserSortOrder': 'inputs',
+    'TableauUser_Filter': 'inputs',
+    'TableauUsersConnection': 'connections',
+    'TablesConnection': 'connections',
+    'Tag': 'objects',
+    'TagOrderField': 'enums',
+    'TagSortOrder': 'inputs',
+    'Tag_Filter': 'inputs',
+    'Taggable': 'interfaces',
+    'TaggableOrderField': 'enums',
+    'TaggableSortOrder': 'inputs',
+    'Taggable_Filter': 'inputs',
+    'TaggablesConnection': 'connections',
+    'TagsConnection': 'connections',
+    'View': 'interfaces',
+    'ViewOrderField': 'enums',
+    'ViewSortOrder': 'inputs',
+    'View_Filter': 'inputs',
+    'ViewsConnection': 'connections',
+    'VirtualConnection': 'connections',
+    'VirtualConnectionOrderField': 'enums',
+    'VirtualConnectionSortOrder': 'inputs',
+    'VirtualConnectionTable': 'objects',
+    'VirtualConnectionTableOrderField': 'enums',
+    'VirtualConnectionTableSortOrder': 'inputs',
+    'VirtualConnectionTable_Filter': 'inputs',
+    'VirtualConnectionTablesConnection': 'connections',
+    'VirtualConnection_Filter': 'inputs',
+    'VirtualConnectionsConnection': 'connections',
+    'Warnable': 'interfaces',
+    'WarnableOrderField': 'enums',
+    'WarnableSortOrder': 'inputs',
+    'Warnable_Filter': 'inputs',
+    'WarnablesConnection': 'connections',
+    'WebDataConnector': 'objects',
+    'WebDataConnectorOrderField': 'enums',
+    'WebDataConnectorSortOrder': 'inputs',
+    'WebDataConnector_Filter': 'inputs',
+    'WebDataConnectorsConnection': 'connections',
+    'Workbook': 'objects',
+    'WorkbookOrderField': 'enums',
+    'WorkbookSortOrder': 'inputs',
+    'Workbook_Filter': 'inputs',
+    'WorkbooksConnection': 'connections',
+})
+tableau_schema -= sgqlc.types.relay.Node
+tableau_schema -= sgqlc.types.relay.PageInfo
+
+Boolean = sgqlc.types.Boolean
+DateTime = sgqlc.types.datetime.DateTime
+ID = sgqlc.types.ID
+Int = sgqlc.types.Int
+String = sgqlc.types.String
+
+tableau_schema.query_type = 'Query'
+tableau_schema.mutation_type = None
+tableau_schema.subscription_type = None
+
+
+def __getattr__(name):
+    try:
+        return tableau_schema[name]
+    except KeyError:
+        raise AttributeError(name) from None
@@ -0,0 +1,674 @@
+# Generated by tools/sgqlc_fast_schema.py
+# Source: tableau_schema.py
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+from . import tableau_schema
+
+
+def AnalyticsFieldsConnection():
+    class AnalyticsFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('AnalyticsField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return AnalyticsFieldsConnection
+
+
+def AskDataExtensionsConnection():
+    class AskDataExtensionsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('AskDataExtension'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return AskDataExtensionsConnection
+
+
+def BinFieldsConnection():
+    class BinFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('BinField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return BinFieldsConnection
+
+
+def CalculatedFieldsConnection():
+    class CalculatedFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('CalculatedField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CalculatedFieldsConnection
+
+
+def CanHaveLabelsesConnection():
+    class CanHaveLabelsesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('CanHaveLabels'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CanHaveLabelsesConnection
+
+
+def CertifiablesConnection():
+    class CertifiablesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Certifiable'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CertifiablesConnection
+
+
+def CloudFilesConnection():
+    class CloudFilesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('CloudFile'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CloudFilesConnection
+
+
+def ColumnFieldsConnection():
+    class ColumnFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ColumnField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ColumnFieldsConnection
+
+
+def ColumnsConnection():
+    class ColumnsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Column'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ColumnsConnection
+
+
+def CombinedFieldsConnection():
+    class CombinedFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('CombinedField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CombinedFieldsConnection
+
+
+def CombinedSetFieldsConnection():
+    class CombinedSetFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('CombinedSetField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CombinedSetFieldsConnection
+
+
+def CustomSQLTablesConnection():
+    class CustomSQLTablesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('CustomSQLTable'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return CustomSQLTablesConnection
+
+
+def DashboardsConnection():
+    class DashboardsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Dashboard'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DashboardsConnection
+
+
+def DataCloudsConnection():
+    class DataCloudsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataCloud'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DataCloudsConnection
+
+
+def DataFieldsConnection():
+    class DataFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DataFieldsConnection
+
+
+def DataQualityCertificationsConnection():
+    class DataQualityCertificationsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityCertification'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DataQualityCertificationsConnection
+
+
+def DataQualityWarningsConnection():
+    class DataQualityWarningsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityWarning'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DataQualityWarningsConnection
+
+
+def DatabaseServersConnection():
+    class DatabaseServersConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseServer'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DatabaseServersConnection
+
+
+def DatabaseTablesConnection():
+    class DatabaseTablesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DatabaseTablesConnection
+
+
+def DatabasesConnection():
+    class DatabasesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DatabasesConnection
+
+
+def DatasourceFieldsConnection():
+    class DatasourceFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatasourceField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DatasourceFieldsConnection
+
+
+def DatasourceFiltersConnection():
+    class DatasourceFiltersConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatasourceFilter'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DatasourceFiltersConnection
+
+
+def DatasourcesConnection():
+    class DatasourcesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Datasource'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return DatasourcesConnection
+
+
+def EmbeddedDatasourcesConnection():
+    class EmbeddedDatasourcesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('EmbeddedDatasource'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return EmbeddedDatasourcesConnection
+
+
+def FieldReferencingFieldsConnection():
+    class FieldReferencingFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FieldReferencingField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return FieldReferencingFieldsConnection
+
+
+def FieldsConnection():
+    class FieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Field'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return FieldsConnection
+
+
+def FilesConnection():
+    class FilesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('File'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return FilesConnection
+
+
+def FlowColumnInputFieldsConnection():
+    class FlowColumnInputFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowColumnInputField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return FlowColumnInputFieldsConnection
+
+
+def FlowColumnOutputFieldsConnection():
+    class FlowColumnOutputFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowColumnOutputField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return FlowColumnOutputFieldsConnection
+
+
+def FlowFieldInputFieldsConnection():
+    class FlowFieldInputFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowFieldInputField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return FlowFieldInputFieldsConnection
+
+
+def FlowFieldOutputFieldsConnection():
+    class FlowFieldOutputFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowFieldOutputField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return FlowFieldOutputFieldsConnection
+
+
+def FlowInputFieldsConnection():
+    class FlowInputFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowInputField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return FlowInputFieldsConnection
+
+
+def FlowOutputFieldsConnection():
+    class FlowOutputFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowOutputField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return FlowOutputFieldsConnection
+
+
+def FlowOutputStepsConnection():
+    class FlowOutputStepsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowOutputStep'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return FlowOutputStepsConnection
+
+
+def FlowsConnection():
+    class FlowsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return FlowsConnection
+
+
+def GenericLabelsConnection():
+    class GenericLabelsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('GenericLabel'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return GenericLabelsConnection
+
+
+def GroupFieldsConnection():
+    class GroupFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('GroupField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return GroupFieldsConnection
+
+
+def HierarchyFieldsConnection():
+    class HierarchyFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('HierarchyField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return HierarchyFieldsConnection
+
+
+def LabelsConnection():
+    class LabelsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Label'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return LabelsConnection
+
+
+def LensFieldsConnection():
+    class LensFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('LensField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return LensFieldsConnection
+
+
+def LensesConnection():
+    class LensesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Lens'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return LensesConnection
+
+
+def LinkedFlowsConnection():
+    class LinkedFlowsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('LinkedFlow'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return LinkedFlowsConnection
+
+
+def MetricDefinitionsConnection():
+    class MetricDefinitionsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('MetricDefinition'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return MetricDefinitionsConnection
+
+
+def MetricsConnection():
+    class MetricsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Metric'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return MetricsConnection
+
+
+def NodesConnection():
+    class NodesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Node'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return NodesConnection
+
+
+def ParametersConnection():
+    class ParametersConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Parameter'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ParametersConnection
+
+
+def PublishedDatasourcesConnection():
+    class PublishedDatasourcesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return PublishedDatasourcesConnection
+
+
+def SetFieldsConnection():
+    class SetFieldsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('SetField'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return SetFieldsConnection
+
+
+def SheetsConnection():
+    class SheetsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Sheet'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return SheetsConnection
+
+
+def TableAdditionalDetailsesConnection():
+    class TableAdditionalDetailsesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableAdditionalDetails'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return TableAdditionalDetailsesConnection
+
+
+def TableauSitesConnection():
+    class TableauSitesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableauSite'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return TableauSitesConnection
+
+
+def TableauUsersConnection():
+    class TableauUsersConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableauUser'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return TableauUsersConnection
+
+
+def TablesConnection():
+    class TablesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Table'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return TablesConnection
+
+
+def TaggablesConnection():
+    class TaggablesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Taggable'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return TaggablesConnection
+
+
+def TagsConnection():
+    class TagsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Tag'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return TagsConnection
+
+
+def ViewsConnection():
+    class ViewsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('View'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return ViewsConnection
+
+
+def VirtualConnectionTablesConnection():
+    class VirtualConnectionTablesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return VirtualConnectionTablesConnection
+
+
+def VirtualConnectionsConnection():
+    class VirtualConnectionsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return VirtualConnectionsConnection
+
+
+def WarnablesConnection():
+    class WarnablesConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Warnable'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return WarnablesConnection
+
+
+def WebDataConnectorsConnection():
+    class WebDataConnectorsConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('WebDataConnector'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return WebDataConnectorsConnection
+
+
+def WorkbooksConnection():
+    class WorkbooksConnection(sgqlc.types.relay.Connection):
+        __schema__ = tableau_schema
+        __field_names__ = ('nodes', 'page_info', 'total_count')
+        nodes = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Workbook'))), graphql_name='nodes')
+        page_info = sgqlc.types.Field(sgqlc.types.non_null('PageInfo'), graphql_name='pageInfo')
+        total_count = sgqlc.types.Field(sgqlc.types.non_null('Int'), graphql_name='totalCount')
+    return WorkbooksConnection
+
+
+def VirtualConnection():
+    class VirtualConnection(sgqlc.types.relay.Connection, tableau_schema.CanHaveLabels, tableau_schema.Certifiable, tableau_schema.Taggable, tableau_schema.Warnable):
+        __schema__ = tableau_schema
+        __field_names__ = ('connection_type', 'container_name', 'container_type', 'created_at', 'description', 'downstream_dashboards', 'downstream_dashboards_connection', 'downstream_datasources', 'downstream_datasources_connection', 'downstream_flows', 'downstream_flows_connection', 'downstream_lenses', 'downstream_lenses_connection', 'downstream_metric_definitions', 'downstream_metric_definitions_connection', 'downstream_metrics', 'downstream_metrics_connection', 'downstream_owners', 'downstream_owners_connection', 'downstream_sheets', 'downstream_sheets_connection', 'downstream_virtual_connection_tables', 'downstream_virtual_connection_tables_connection', 'downstream_workbooks', 'downstream_workbooks_connection', 'owner', 'project_name', 'project_vizportal_url_id', 'site', 'tables', 'tables_connection', 'updated_at', 'upstream_data_quality_warnings', 'upstream_data_quality_warnings_connection', 'upstream_databases', 'upstream_databases_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_labels', 'upstream_labels_connection', 'upstream_tables', 'upstream_tables_connection', 'upstream_virtual_connection_tables', 'upstream_virtual_connection_tables_connection', 'uri', 'vizportal_id', 'vizportal_url_id')
+        connection_type = sgqlc.types.Field('String', graphql_name='connectionType')
+        container_name = sgqlc.types.Field('String', graphql_name='containerName')
+        container_type = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='containerType')
+        created_at = sgqlc.types.Field('DateTime', graphql_name='createdAt')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        downstream_dashboards = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Dashboard'))), graphql_name='downstreamDashboards', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_dashboards_connection = sgqlc.types.Field('DashboardsConnection', graphql_name='downstreamDashboardsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='downstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='downstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='downstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='downstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Lens'))), graphql_name='downstreamLenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses_connection = sgqlc.types.Field('LensesConnection', graphql_name='downstreamLensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions = sgqlc.types.Field(sgqlc.types.list_of('MetricDefinition'), graphql_name='downstreamMetricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions_connection = sgqlc.types.Field('MetricDefinitionsConnection', graphql_name='downstreamMetricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Metric'))), graphql_name='downstreamMetrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics_connection = sgqlc.types.Field('MetricsConnection', graphql_name='downstreamMetricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_owners = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableauUser'))), graphql_name='downstreamOwners', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_owners_connection = sgqlc.types.Field('TableauUsersConnection', graphql_name='downstreamOwnersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_sheets = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Sheet'))), graphql_name='downstreamSheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='downstreamSheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='downstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='downstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Workbook'))), graphql_name='downstreamWorkbooks', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks_connection = sgqlc.types.Field('WorkbooksConnection', graphql_name='downstreamWorkbooksConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owner = sgqlc.types.Field(sgqlc.types.non_null('TableauUser'), graphql_name='owner')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_vizportal_url_id = sgqlc.types.Field('String', graphql_name='projectVizportalUrlId')
+        site = sgqlc.types.Field(sgqlc.types.non_null('TableauSite'), graphql_name='site')
+        tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='tables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='tablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        updated_at = sgqlc.types.Field('DateTime', graphql_name='updatedAt')
+        upstream_data_quality_warnings = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityWarning'))), graphql_name='upstreamDataQualityWarnings', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_data_quality_warnings_connection = sgqlc.types.Field('DataQualityWarningsConnection', graphql_name='upstreamDataQualityWarningsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Label'))), graphql_name='upstreamLabels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels_connection = sgqlc.types.Field('LabelsConnection', graphql_name='upstreamLabelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='upstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='upstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        uri = sgqlc.types.Field('String', graphql_name='uri')
+        vizportal_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vizportalId')
+        vizportal_url_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vizportalUrlId')
+    return VirtualConnection
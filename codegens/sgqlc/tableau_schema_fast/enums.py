@@ -0,0 +1,498 @@
+# Generated by tools/sgqlc_fast_schema.py
+# Source: tableau_schema.py
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+from . import tableau_schema
+
+
+def AnalyticsFieldOrderField():
+    class AnalyticsFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID',)
+    return AnalyticsFieldOrderField
+
+
+def AskDataExtensionOrderField():
+    class AskDataExtensionOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID',)
+    return AskDataExtensionOrderField
+
+
+def BinFieldOrderField():
+    class BinFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DATA_CATEGORY', 'DATA_TYPE', 'DOWNSTREAM_SHEETS_COUNT', 'FIELDS_COUNT', 'ID', 'IS_HIDDEN', 'NAME', 'ROLE')
+    return BinFieldOrderField
+
+
+def CalculatedFieldOrderField():
+    class CalculatedFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DATA_CATEGORY', 'DATA_TYPE', 'DOWNSTREAM_SHEETS_COUNT', 'FIELDS_COUNT', 'ID', 'IS_HIDDEN', 'NAME', 'ROLE')
+    return CalculatedFieldOrderField
+
+
+def CanHaveLabelsOrderField():
+    class CanHaveLabelsOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID', 'LUID')
+    return CanHaveLabelsOrderField
+
+
+def CertifiableOrderField():
+    class CertifiableOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID', 'IS_CERTIFIED', 'LUID')
+    return CertifiableOrderField
+
+
+def CloudFileOrderField():
+    class CloudFileOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CONNECTION_TYPE', 'DOWNSTREAM_DATASOURCES_COUNT', 'DOWNSTREAM_VIRTUAL_CONNECTIONS_COUNT', 'DOWNSTREAM_WORKBOOKS_COUNT', 'HAS_ACTIVE_WARNING', 'ID', 'IS_CERTIFIED', 'IS_EMBEDDED', 'LUID', 'NAME', 'PROJECT_NAME')
+    return CloudFileOrderField
+
+
+def ColumnFieldOrderField():
+    class ColumnFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DATA_CATEGORY', 'DATA_TYPE', 'DOWNSTREAM_SHEETS_COUNT', 'ID', 'IS_HIDDEN', 'NAME', 'ROLE')
+    return ColumnFieldOrderField
+
+
+def ColumnOrderField():
+    class ColumnOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DISPLAY_NAME', 'DOWNSTREAM_SHEETS_COUNT', 'HAS_ACTIVE_WARNING', 'ID', 'LUID', 'NAME')
+    return ColumnOrderField
+
+
+def CombinedFieldOrderField():
+    class CombinedFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DOWNSTREAM_SHEETS_COUNT', 'FIELDS_COUNT', 'ID', 'IS_HIDDEN', 'NAME')
+    return CombinedFieldOrderField
+
+
+def CombinedSetFieldOrderField():
+    class CombinedSetFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DOWNSTREAM_SHEETS_COUNT', 'FIELDS_COUNT', 'ID', 'IS_HIDDEN', 'NAME')
+    return CombinedSetFieldOrderField
+
+
+def CustomSQLTableOrderField():
+    class CustomSQLTableOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('COLUMNS_COUNT', 'DOWNSTREAM_DASHBOARDS_COUNT', 'DOWNSTREAM_DATASOURCES_COUNT', 'DOWNSTREAM_WORKBOOKS_COUNT', 'ID', 'IS_UNSUPPORTED_CUSTOM_SQL', 'NAME')
+    return CustomSQLTableOrderField
+
+
+def DashboardOrderField():
+    class DashboardOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DOCUMENT_VIEW_ID', 'ID', 'LUID', 'NAME', 'PATH')
+    return DashboardOrderField
+
+
+def DataCloudOrderField():
+    class DataCloudOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CONNECTION_TYPE', 'DOWNSTREAM_DATASOURCES_COUNT', 'DOWNSTREAM_VIRTUAL_CONNECTIONS_COUNT', 'DOWNSTREAM_WORKBOOKS_COUNT', 'HAS_ACTIVE_WARNING', 'ID', 'IS_CERTIFIED', 'IS_EMBEDDED', 'LUID', 'NAME', 'PROJECT_NAME')
+    return DataCloudOrderField
+
+
+def DataFieldOrderField():
+    class DataFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DATA_CATEGORY', 'DATA_TYPE', 'ID', 'ROLE')
+    return DataFieldOrderField
+
+
+def DataQualityCertificationOrderField():
+    class DataQualityCertificationOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CATEGORY', 'ID', 'IS_ACTIVE', 'IS_ELEVATED', 'LUID', 'VALUE')
+    return DataQualityCertificationOrderField
+
+
+def DataQualityWarningOrderField():
+    class DataQualityWarningOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CATEGORY', 'ID', 'IS_ACTIVE', 'IS_ELEVATED', 'IS_SEVERE', 'LUID', 'VALUE', 'WARNING_TYPE')
+    return DataQualityWarningOrderField
+
+
+def DatabaseOrderField():
+    class DatabaseOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CONNECTION_TYPE', 'DOWNSTREAM_DATASOURCES_COUNT', 'DOWNSTREAM_VIRTUAL_CONNECTIONS_COUNT', 'DOWNSTREAM_WORKBOOKS_COUNT', 'HAS_ACTIVE_WARNING', 'ID', 'IS_CERTIFIED', 'IS_EMBEDDED', 'LUID', 'NAME', 'PROJECT_NAME')
+    return DatabaseOrderField
+
+
+def DatabaseServerOrderField():
+    class DatabaseServerOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CONNECTION_TYPE', 'DOWNSTREAM_DATASOURCES_COUNT', 'DOWNSTREAM_VIRTUAL_CONNECTIONS_COUNT', 'DOWNSTREAM_WORKBOOKS_COUNT', 'HAS_ACTIVE_WARNING', 'HOST_NAME', 'ID', 'IS_CERTIFIED', 'IS_EMBEDDED', 'LUID', 'NAME', 'PROJECT_NAME')
+    return DatabaseServerOrderField
+
+
+def DatabaseTableOrderField():
+    class DatabaseTableOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('COLUMNS_COUNT', 'CONNECTION_TYPE', 'DOWNSTREAM_DASHBOARDS_COUNT', 'DOWNSTREAM_DATASOURCES_COUNT', 'DOWNSTREAM_VIRTUAL_CONNECTIONS_COUNT', 'DOWNSTREAM_WORKBOOKS_COUNT', 'FULL_NAME', 'HAS_ACTIVE_WARNING', 'ID', 'IS_CERTIFIED', 'IS_EMBEDDED', 'LUID', 'NAME', 'PROJECT_NAME', 'SCHEMA')
+    return DatabaseTableOrderField
+
+
+def DatasourceFieldOrderField():
+    class DatasourceFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DOWNSTREAM_SHEETS_COUNT', 'ID', 'IS_HIDDEN', 'NAME')
+    return DatasourceFieldOrderField
+
+
+def DatasourceFilterOrderField():
+    class DatasourceFilterOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID',)
+    return DatasourceFilterOrderField
+
+
+def DatasourceOrderField():
+    class DatasourceOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CONTAINS_UNSUPPORTED_CUSTOM_SQL', 'DOWNSTREAM_OWNERS_COUNT', 'DOWNSTREAM_WORKBOOKS_COUNT', 'FIELDS_COUNT', 'ID', 'NAME')
+    return DatasourceOrderField
+
+
+def EmbeddedDatasourceOrderField():
+    class EmbeddedDatasourceOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CONTAINS_UNSUPPORTED_CUSTOM_SQL', 'DOWNSTREAM_OWNERS_COUNT', 'DOWNSTREAM_WORKBOOKS_COUNT', 'FIELDS_COUNT', 'ID', 'NAME')
+    return EmbeddedDatasourceOrderField
+
+
+def ExtractType():
+    class ExtractType(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('FULL', 'INCREMENTAL')
+    return ExtractType
+
+
+def FieldDataType():
+    class FieldDataType(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('BOOLEAN', 'DATE', 'DATETIME', 'INTEGER', 'REAL', 'SPATIAL', 'STRING', 'TABLE', 'TUPLE', 'UNKNOWN')
+    return FieldDataType
+
+
+def FieldOrderField():
+    class FieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DOWNSTREAM_SHEETS_COUNT', 'ID', 'IS_HIDDEN', 'NAME')
+    return FieldOrderField
+
+
+def FieldReferencingFieldOrderField():
+    class FieldReferencingFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('FIELDS_COUNT', 'ID')
+    return FieldReferencingFieldOrderField
+
+
+def FieldRole():
+    class FieldRole(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DIMENSION', 'MEASURE', 'UNKNOWN')
+    return FieldRole
+
+
+def FieldRoleCategory():
+    class FieldRoleCategory(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('NOMINAL', 'ORDINAL', 'QUANTITATIVE', 'UNKNOWN')
+    return FieldRoleCategory
+
+
+def FileOrderField():
+    class FileOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CONNECTION_TYPE', 'DOWNSTREAM_DATASOURCES_COUNT', 'DOWNSTREAM_VIRTUAL_CONNECTIONS_COUNT', 'DOWNSTREAM_WORKBOOKS_COUNT', 'HAS_ACTIVE_WARNING', 'ID', 'IS_CERTIFIED', 'IS_EMBEDDED', 'LUID', 'NAME', 'PROJECT_NAME')
+    return FileOrderField
+
+
+def FlowColumnInputFieldOrderField():
+    class FlowColumnInputFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID', 'NAME')
+    return FlowColumnInputFieldOrderField
+
+
+def FlowColumnOutputFieldOrderField():
+    class FlowColumnOutputFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID', 'NAME')
+    return FlowColumnOutputFieldOrderField
+
+
+def FlowFieldInputFieldOrderField():
+    class FlowFieldInputFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID', 'NAME')
+    return FlowFieldInputFieldOrderField
+
+
+def FlowFieldOutputFieldOrderField():
+    class FlowFieldOutputFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID', 'NAME')
+    return FlowFieldOutputFieldOrderField
+
+
+def FlowInputFieldOrderField():
+    class FlowInputFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID', 'NAME')
+    return FlowInputFieldOrderField
+
+
+def FlowOrderField():
+    class FlowOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CONTAINER_NAME', 'CONTAINS_UNSUPPORTED_CUSTOM_SQL', 'HAS_ACTIVE_WARNING', 'ID', 'LUID', 'NAME', 'PROJECT_NAME', 'VIZPORTAL_URL_ID')
+    return FlowOrderField
+
+
+def FlowOutputFieldOrderField():
+    class FlowOutputFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID', 'NAME')
+    return FlowOutputFieldOrderField
+
+
+def FlowOutputStepOrderField():
+    class FlowOutputStepOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID', 'NAME')
+    return FlowOutputStepOrderField
+
+
+def GenericLabelOrderField():
+    class GenericLabelOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CATEGORY', 'ID', 'IS_ACTIVE', 'IS_ELEVATED', 'LUID', 'VALUE')
+    return GenericLabelOrderField
+
+
+def GroupFieldOrderField():
+    class GroupFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DATA_CATEGORY', 'DATA_TYPE', 'DOWNSTREAM_SHEETS_COUNT', 'FIELDS_COUNT', 'ID', 'IS_HIDDEN', 'NAME', 'ROLE')
+    return GroupFieldOrderField
+
+
+def HierarchyFieldOrderField():
+    class HierarchyFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DOWNSTREAM_SHEETS_COUNT', 'FIELDS_COUNT', 'ID', 'IS_HIDDEN', 'NAME')
+    return HierarchyFieldOrderField
+
+
+def InheritanceType():
+    class InheritanceType(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('FIRST',)
+    return InheritanceType
+
+
+def LabelOrderField():
+    class LabelOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CATEGORY', 'ID', 'IS_ACTIVE', 'IS_ELEVATED', 'LUID', 'VALUE')
+    return LabelOrderField
+
+
+def LensFieldOrderField():
+    class LensFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID', 'NAME')
+    return LensFieldOrderField
+
+
+def LensOrderField():
+    class LensOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('FIELDS_COUNT', 'ID', 'LUID', 'NAME', 'OWNER_COUNT', 'VIZPORTAL_URL_ID')
+    return LensOrderField
+
+
+def LinkedFlowOrderField():
+    class LinkedFlowOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID',)
+    return LinkedFlowOrderField
+
+
+def MetricDefinitionOrderField():
+    class MetricDefinitionOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('FIELDS_COUNT', 'ID', 'LUID', 'NAME')
+    return MetricDefinitionOrderField
+
+
+def MetricOrderField():
+    class MetricOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CONTAINER_NAME', 'ID', 'LUID', 'NAME', 'OWNER_COUNT', 'PROJECT_NAME', 'VIZPORTAL_URL_ID')
+    return MetricOrderField
+
+
+def NodeOrderField():
+    class NodeOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID',)
+    return NodeOrderField
+
+
+def OrderDirection():
+    class OrderDirection(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ASC', 'DESC')
+    return OrderDirection
+
+
+def ParameterOrderField():
+    class ParameterOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID', 'NAME', 'PARENT_NAME')
+    return ParameterOrderField
+
+
+def PermissionMode():
+    class PermissionMode(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('FILTER_RESULTS', 'OBFUSCATE_RESULTS')
+    return PermissionMode
+
+
+def PublishedDatasourceOrderField():
+    class PublishedDatasourceOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CONTAINER_NAME', 'CONTAINS_UNSUPPORTED_CUSTOM_SQL', 'DOWNSTREAM_OWNERS_COUNT', 'DOWNSTREAM_SHEETS_COUNT', 'DOWNSTREAM_WORKBOOKS_COUNT', 'FIELDS_COUNT', 'HAS_ACTIVE_WARNING', 'ID', 'IS_CERTIFIED', 'LUID', 'NAME', 'OWNER_COUNT', 'PROJECT_NAME', 'VIZPORTAL_URL_ID')
+    return PublishedDatasourceOrderField
+
+
+def RemoteType():
+    class RemoteType(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ARRAY', 'BOOL', 'BSTR', 'BYREF', 'BYTES', 'CY', 'DATE', 'DBDATE', 'DBTIME', 'DBTIMESTAMP', 'DECIMAL', 'EMPTY', 'ERROR', 'FILETIME', 'GUID', 'HCHAPTER', 'I1', 'I2', 'I4', 'I8', 'IDISPATCH', 'IUNKNOWN', 'NULL', 'NUMERIC', 'PROPVARIANT', 'R4', 'R8', 'RESERVED', 'STR', 'UDT', 'UI1', 'UI2', 'UI4', 'UI8', 'VARIANT', 'VARNUMERIC', 'VECTOR', 'WDC_BOOL', 'WDC_DATE', 'WDC_DATETIME', 'WDC_FLOAT', 'WDC_GEOMETRY', 'WDC_INT', 'WDC_STRING', 'WSTR')
+    return RemoteType
+
+
+def SetFieldOrderField():
+    class SetFieldOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DOWNSTREAM_SHEETS_COUNT', 'FIELDS_COUNT', 'ID', 'IS_HIDDEN', 'NAME')
+    return SetFieldOrderField
+
+
+def SheetOrderField():
+    class SheetOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DATASOURCE_FIELDS_COUNT', 'DOCUMENT_VIEW_ID', 'ID', 'LUID', 'NAME', 'PATH', 'SHEET_FIELD_INSTANCES_COUNT', 'WORKSHEET_FIELDS_COUNT')
+    return SheetOrderField
+
+
+def TableAdditionalDetailsOrderField():
+    class TableAdditionalDetailsOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID',)
+    return TableAdditionalDetailsOrderField
+
+
+def TableOrderField():
+    class TableOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('COLUMNS_COUNT', 'DOWNSTREAM_DASHBOARDS_COUNT', 'DOWNSTREAM_DATASOURCES_COUNT', 'DOWNSTREAM_WORKBOOKS_COUNT', 'ID', 'NAME')
+    return TableOrderField
+
+
+def TableType():
+    class TableType(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CALCULATEDINSIGHT', 'DATABASETABLE', 'DATALAKE', 'DATAMODEL')
+    return TableType
+
+
+def TableauSiteOrderField():
+    class TableauSiteOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID', 'LUID', 'NAME')
+    return TableauSiteOrderField
+
+
+def TableauUserOrderField():
+    class TableauUserOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DOMAIN', 'EMAIL', 'ID', 'LUID', 'NAME', 'USERNAME')
+    return TableauUserOrderField
+
+
+def TagOrderField():
+    class TagOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID', 'NAME')
+    return TagOrderField
+
+
+def TaggableOrderField():
+    class TaggableOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('ID', 'LUID')
+    return TaggableOrderField
+
+
+def ViewOrderField():
+    class ViewOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('DOCUMENT_VIEW_ID', 'ID', 'LUID', 'NAME', 'PATH')
+    return ViewOrderField
+
+
+def VirtualConnectionOrderField():
+    class VirtualConnectionOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CONNECTION_TYPE', 'CONTAINER_NAME', 'DOWNSTREAM_DATASOURCES_COUNT', 'DOWNSTREAM_WORKBOOKS_COUNT', 'HAS_ACTIVE_WARNING', 'ID', 'IS_CERTIFIED', 'LUID', 'NAME', 'OWNER_COUNT', 'PROJECT_NAME', 'VIZPORTAL_URL_ID')
+    return VirtualConnectionOrderField
+
+
+def VirtualConnectionTableOrderField():
+    class VirtualConnectionTableOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('COLUMNS_COUNT', 'CONTAINS_UNSUPPORTED_CUSTOM_SQL', 'DOWNSTREAM_DASHBOARDS_COUNT', 'DOWNSTREAM_DATASOURCES_COUNT', 'DOWNSTREAM_WORKBOOKS_COUNT', 'EXTRACT_LAST_REFRESHED_AT', 'EXTRACT_LAST_REFRESH_TYPE', 'HAS_ACTIVE_WARNING', 'ID', 'IS_CERTIFIED', 'IS_EXTRACTED', 'LUID', 'NAME', 'OWNER_COUNT', 'VIZPORTAL_URL_ID')
+    return VirtualConnectionTableOrderField
+
+
+def WarnableOrderField():
+    class WarnableOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('HAS_ACTIVE_WARNING', 'ID', 'LUID')
+    return WarnableOrderField
+
+
+def WebDataConnectorOrderField():
+    class WebDataConnectorOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CONNECTION_TYPE', 'DOWNSTREAM_DATASOURCES_COUNT', 'DOWNSTREAM_VIRTUAL_CONNECTIONS_COUNT', 'DOWNSTREAM_WORKBOOKS_COUNT', 'HAS_ACTIVE_WARNING', 'ID', 'IS_CERTIFIED', 'IS_EMBEDDED', 'LUID', 'NAME', 'PROJECT_NAME')
+    return WebDataConnectorOrderField
+
+
+def WorkbookOrderField():
+    class WorkbookOrderField(sgqlc.types.Enum):
+        __schema__ = tableau_schema
+        __choices__ = ('CONTAINER_NAME', 'CONTAINS_UNSUPPORTED_CUSTOM_SQL', 'DASHBOARDS_COUNT', 'EMBEDDED_DATASOURCES_COUNT', 'ID', 'LUID', 'NAME', 'OWNER_COUNT', 'PROJECT_LUID', 'PROJECT_NAME', 'SHEETS_COUNT', 'VIEWS_COUNT', 'VIZPORTAL_URL_ID')
+    return WorkbookOrderField
@@ -0,0 +1,1697 @@
+# Generated by tools/sgqlc_fast_schema.py
+# Source: tableau_schema.py
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+from . import tableau_schema
+
+
+def AnalyticsFieldSortOrder():
+    class AnalyticsFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('AnalyticsFieldOrderField'), graphql_name='field')
+    return AnalyticsFieldSortOrder
+
+
+def AnalyticsField_Filter():
+    class AnalyticsField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return AnalyticsField_Filter
+
+
+def AskDataExtensionSortOrder():
+    class AskDataExtensionSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('AskDataExtensionOrderField'), graphql_name='field')
+    return AskDataExtensionSortOrder
+
+
+def AskDataExtension_Filter():
+    class AskDataExtension_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return AskDataExtension_Filter
+
+
+def AskDataExtension_Required_Filter():
+    class AskDataExtension_Required_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return AskDataExtension_Required_Filter
+
+
+def BinFieldSortOrder():
+    class BinFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('BinFieldOrderField'), graphql_name='field')
+    return BinFieldSortOrder
+
+
+def BinField_Filter():
+    class BinField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'is_hidden', 'is_hidden_within', 'name', 'name_within', 'text')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_hidden = sgqlc.types.Field('Boolean', graphql_name='isHidden')
+        is_hidden_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isHiddenWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return BinField_Filter
+
+
+def BinField_Required_Filter():
+    class BinField_Required_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return BinField_Required_Filter
+
+
+def CalculatedFieldSortOrder():
+    class CalculatedFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('CalculatedFieldOrderField'), graphql_name='field')
+    return CalculatedFieldSortOrder
+
+
+def CalculatedField_Filter():
+    class CalculatedField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'is_hidden', 'is_hidden_within', 'name', 'name_within', 'text')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_hidden = sgqlc.types.Field('Boolean', graphql_name='isHidden')
+        is_hidden_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isHiddenWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return CalculatedField_Filter
+
+
+def CalculatedField_Required_Filter():
+    class CalculatedField_Required_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return CalculatedField_Required_Filter
+
+
+def CanHaveLabelsSortOrder():
+    class CanHaveLabelsSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('CanHaveLabelsOrderField'), graphql_name='field')
+    return CanHaveLabelsSortOrder
+
+
+def CanHaveLabels_Filter():
+    class CanHaveLabels_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'luid', 'luid_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+    return CanHaveLabels_Filter
+
+
+def CertifiableSortOrder():
+    class CertifiableSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('CertifiableOrderField'), graphql_name='field')
+    return CertifiableSortOrder
+
+
+def Certifiable_Filter():
+    class Certifiable_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'is_certified', 'is_certified_within', 'luid', 'luid_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_certified = sgqlc.types.Field('Boolean', graphql_name='isCertified')
+        is_certified_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isCertifiedWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+    return Certifiable_Filter
+
+
+def CloudFileSortOrder():
+    class CloudFileSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('CloudFileOrderField'), graphql_name='field')
+    return CloudFileSortOrder
+
+
+def CloudFile_Filter():
+    class CloudFile_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('connection_type', 'connection_type_within', 'has_active_warning', 'has_active_warning_within', 'id', 'id_within', 'is_certified', 'is_certified_within', 'is_embedded', 'is_embedded_within', 'luid', 'luid_within', 'name', 'name_within', 'project_name', 'project_name_within', 'text')
+        connection_type = sgqlc.types.Field('String', graphql_name='connectionType')
+        connection_type_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='connectionTypeWithin')
+        has_active_warning = sgqlc.types.Field('Boolean', graphql_name='hasActiveWarning')
+        has_active_warning_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='hasActiveWarningWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_certified = sgqlc.types.Field('Boolean', graphql_name='isCertified')
+        is_certified_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isCertifiedWithin')
+        is_embedded = sgqlc.types.Field('Boolean', graphql_name='isEmbedded')
+        is_embedded_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isEmbeddedWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='projectNameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return CloudFile_Filter
+
+
+def ColumnFieldSortOrder():
+    class ColumnFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ColumnFieldOrderField'), graphql_name='field')
+    return ColumnFieldSortOrder
+
+
+def ColumnField_Filter():
+    class ColumnField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'is_hidden', 'is_hidden_within', 'name', 'name_within', 'text')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_hidden = sgqlc.types.Field('Boolean', graphql_name='isHidden')
+        is_hidden_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isHiddenWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return ColumnField_Filter
+
+
+def ColumnField_Required_Filter():
+    class ColumnField_Required_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return ColumnField_Required_Filter
+
+
+def ColumnSortOrder():
+    class ColumnSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ColumnOrderField'), graphql_name='field')
+    return ColumnSortOrder
+
+
+def Column_Filter():
+    class Column_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('display_name', 'display_name_within', 'has_active_warning', 'has_active_warning_within', 'id', 'id_within', 'luid', 'luid_within', 'name', 'name_within')
+        display_name = sgqlc.types.Field('String', graphql_name='displayName')
+        display_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='displayNameWithin')
+        has_active_warning = sgqlc.types.Field('Boolean', graphql_name='hasActiveWarning')
+        has_active_warning_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='hasActiveWarningWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return Column_Filter
+
+
+def Column_Required_Filter():
+    class Column_Required_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return Column_Required_Filter
+
+
+def CombinedFieldSortOrder():
+    class CombinedFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('CombinedFieldOrderField'), graphql_name='field')
+    return CombinedFieldSortOrder
+
+
+def CombinedField_Filter():
+    class CombinedField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'is_hidden', 'is_hidden_within', 'name', 'name_within', 'text')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_hidden = sgqlc.types.Field('Boolean', graphql_name='isHidden')
+        is_hidden_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isHiddenWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return CombinedField_Filter
+
+
+def CombinedField_Required_Filter():
+    class CombinedField_Required_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return CombinedField_Required_Filter
+
+
+def CombinedSetFieldSortOrder():
+    class CombinedSetFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('CombinedSetFieldOrderField'), graphql_name='field')
+    return CombinedSetFieldSortOrder
+
+
+def CombinedSetField_Filter():
+    class CombinedSetField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'is_hidden', 'is_hidden_within', 'name', 'name_within', 'text')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_hidden = sgqlc.types.Field('Boolean', graphql_name='isHidden')
+        is_hidden_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isHiddenWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return CombinedSetField_Filter
+
+
+def CombinedSetField_Required_Filter():
+    class CombinedSetField_Required_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return CombinedSetField_Required_Filter
+
+
+def CustomSQLTableSortOrder():
+    class CustomSQLTableSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('CustomSQLTableOrderField'), graphql_name='field')
+    return CustomSQLTableSortOrder
+
+
+def CustomSQLTable_Filter():
+    class CustomSQLTable_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'is_unsupported_custom_sql', 'is_unsupported_custom_sql_within', 'name', 'name_within', 'text')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_unsupported_custom_sql = sgqlc.types.Field('Boolean', graphql_name='isUnsupportedCustomSql')
+        is_unsupported_custom_sql_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isUnsupportedCustomSqlWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return CustomSQLTable_Filter
+
+
+def DashboardSortOrder():
+    class DashboardSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('DashboardOrderField'), graphql_name='field')
+    return DashboardSortOrder
+
+
+def Dashboard_Filter():
+    class Dashboard_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('document_view_id', 'document_view_id_within', 'id', 'id_within', 'luid', 'luid_within', 'name', 'name_within', 'path', 'path_within')
+        document_view_id = sgqlc.types.Field('String', graphql_name='documentViewId')
+        document_view_id_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='documentViewIdWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        path = sgqlc.types.Field('String', graphql_name='path')
+        path_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='pathWithin')
+    return Dashboard_Filter
+
+
+def DataCloudSortOrder():
+    class DataCloudSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('DataCloudOrderField'), graphql_name='field')
+    return DataCloudSortOrder
+
+
+def DataCloud_Filter():
+    class DataCloud_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('connection_type', 'connection_type_within', 'has_active_warning', 'has_active_warning_within', 'id', 'id_within', 'is_certified', 'is_certified_within', 'is_embedded', 'is_embedded_within', 'luid', 'luid_within', 'name', 'name_within', 'project_name', 'project_name_within', 'text')
+        connection_type = sgqlc.types.Field('String', graphql_name='connectionType')
+        connection_type_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='connectionTypeWithin')
+        has_active_warning = sgqlc.types.Field('Boolean', graphql_name='hasActiveWarning')
+        has_active_warning_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='hasActiveWarningWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_certified = sgqlc.types.Field('Boolean', graphql_name='isCertified')
+        is_certified_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isCertifiedWithin')
+        is_embedded = sgqlc.types.Field('Boolean', graphql_name='isEmbedded')
+        is_embedded_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isEmbeddedWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='projectNameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return DataCloud_Filter
+
+
+def DataFieldSortOrder():
+    class DataFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('DataFieldOrderField'), graphql_name='field')
+    return DataFieldSortOrder
+
+
+def DataField_Filter():
+    class DataField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return DataField_Filter
+
+
+def DataQualityCertificationSortOrder():
+    class DataQualityCertificationSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('DataQualityCertificationOrderField'), graphql_name='field')
+    return DataQualityCertificationSortOrder
+
+
+def DataQualityCertification_Filter():
+    class DataQualityCertification_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('category', 'category_within', 'id', 'id_within', 'is_active', 'is_active_within', 'is_elevated', 'is_elevated_within', 'luid', 'luid_within', 'value', 'value_within')
+        category = sgqlc.types.Field('String', graphql_name='category')
+        category_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='categoryWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_active = sgqlc.types.Field('Boolean', graphql_name='isActive')
+        is_active_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isActiveWithin')
+        is_elevated = sgqlc.types.Field('Boolean', graphql_name='isElevated')
+        is_elevated_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isElevatedWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        value = sgqlc.types.Field('String', graphql_name='value')
+        value_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='valueWithin')
+    return DataQualityCertification_Filter
+
+
+def DataQualityWarningSortOrder():
+    class DataQualityWarningSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('DataQualityWarningOrderField'), graphql_name='field')
+    return DataQualityWarningSortOrder
+
+
+def DataQualityWarning_Filter():
+    class DataQualityWarning_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('category', 'category_within', 'id', 'id_within', 'is_active', 'is_active_within', 'is_elevated', 'is_elevated_within', 'is_severe', 'is_severe_within', 'luid', 'luid_within', 'value', 'value_within', 'warning_type', 'warning_type_within')
+        category = sgqlc.types.Field('String', graphql_name='category')
+        category_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='categoryWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_active = sgqlc.types.Field('Boolean', graphql_name='isActive')
+        is_active_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isActiveWithin')
+        is_elevated = sgqlc.types.Field('Boolean', graphql_name='isElevated')
+        is_elevated_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isElevatedWithin')
+        is_severe = sgqlc.types.Field('Boolean', graphql_name='isSevere')
+        is_severe_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isSevereWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        value = sgqlc.types.Field('String', graphql_name='value')
+        value_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='valueWithin')
+        warning_type = sgqlc.types.Field('String', graphql_name='warningType')
+        warning_type_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='warningTypeWithin')
+    return DataQualityWarning_Filter
+
+
+def DatabaseServerSortOrder():
+    class DatabaseServerSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('DatabaseServerOrderField'), graphql_name='field')
+    return DatabaseServerSortOrder
+
+
+def DatabaseServer_Filter():
+    class DatabaseServer_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('connection_type', 'connection_type_within', 'has_active_warning', 'has_active_warning_within', 'host_name', 'host_name_within', 'id', 'id_within', 'is_certified', 'is_certified_within', 'is_embedded', 'is_embedded_within', 'luid', 'luid_within', 'name', 'name_within', 'project_name', 'project_name_within', 'text')
+        connection_type = sgqlc.types.Field('String', graphql_name='connectionType')
+        connection_type_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='connectionTypeWithin')
+        has_active_warning = sgqlc.types.Field('Boolean', graphql_name='hasActiveWarning')
+        has_active_warning_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='hasActiveWarningWithin')
+        host_name = sgqlc.types.Field('String', graphql_name='hostName')
+        host_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='hostNameWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_certified = sgqlc.types.Field('Boolean', graphql_name='isCertified')
+        is_certified_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isCertifiedWithin')
+        is_embedded = sgqlc.types.Field('Boolean', graphql_name='isEmbedded')
+        is_embedded_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isEmbeddedWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='projectNameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return DatabaseServer_Filter
+
+
+def DatabaseSortOrder():
+    class DatabaseSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('DatabaseOrderField'), graphql_name='field')
+    return DatabaseSortOrder
+
+
+def DatabaseTableSortOrder():
+    class DatabaseTableSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('DatabaseTableOrderField'), graphql_name='field')
+    return DatabaseTableSortOrder
+
+
+def DatabaseTable_Filter():
+    class DatabaseTable_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('connection_type', 'connection_type_within', 'full_name', 'full_name_within', 'has_active_warning', 'has_active_warning_within', 'id', 'id_within', 'is_certified', 'is_certified_within', 'is_embedded', 'is_embedded_within', 'luid', 'luid_within', 'name', 'name_within', 'project_name', 'project_name_within', 'schema', 'schema_within', 'text')
+        connection_type = sgqlc.types.Field('String', graphql_name='connectionType')
+        connection_type_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='connectionTypeWithin')
+        full_name = sgqlc.types.Field('String', graphql_name='fullName')
+        full_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='fullNameWithin')
+        has_active_warning = sgqlc.types.Field('Boolean', graphql_name='hasActiveWarning')
+        has_active_warning_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='hasActiveWarningWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_certified = sgqlc.types.Field('Boolean', graphql_name='isCertified')
+        is_certified_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isCertifiedWithin')
+        is_embedded = sgqlc.types.Field('Boolean', graphql_name='isEmbedded')
+        is_embedded_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isEmbeddedWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='projectNameWithin')
+        schema = sgqlc.types.Field('String', graphql_name='schema')
+        schema_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='schemaWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return DatabaseTable_Filter
+
+
+def Database_Filter():
+    class Database_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('connection_type', 'connection_type_within', 'has_active_warning', 'has_active_warning_within', 'id', 'id_within', 'is_certified', 'is_certified_within', 'is_embedded', 'is_embedded_within', 'luid', 'luid_within', 'name', 'name_within', 'project_name', 'project_name_within', 'text')
+        connection_type = sgqlc.types.Field('String', graphql_name='connectionType')
+        connection_type_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='connectionTypeWithin')
+        has_active_warning = sgqlc.types.Field('Boolean', graphql_name='hasActiveWarning')
+        has_active_warning_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='hasActiveWarningWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_certified = sgqlc.types.Field('Boolean', graphql_name='isCertified')
+        is_certified_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isCertifiedWithin')
+        is_embedded = sgqlc.types.Field('Boolean', graphql_name='isEmbedded')
+        is_embedded_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isEmbeddedWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='projectNameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return Database_Filter
+
+
+def DatasourceFieldSortOrder():
+    class DatasourceFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('DatasourceFieldOrderField'), graphql_name='field')
+    return DatasourceFieldSortOrder
+
+
+def DatasourceField_Filter():
+    class DatasourceField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'is_hidden', 'is_hidden_within', 'name', 'name_within', 'text')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_hidden = sgqlc.types.Field('Boolean', graphql_name='isHidden')
+        is_hidden_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isHiddenWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return DatasourceField_Filter
+
+
+def DatasourceField_Required_Filter():
+    class DatasourceField_Required_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return DatasourceField_Required_Filter
+
+
+def DatasourceFilterSortOrder():
+    class DatasourceFilterSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('DatasourceFilterOrderField'), graphql_name='field')
+    return DatasourceFilterSortOrder
+
+
+def DatasourceFilter_Filter():
+    class DatasourceFilter_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return DatasourceFilter_Filter
+
+
+def DatasourceSortOrder():
+    class DatasourceSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('DatasourceOrderField'), graphql_name='field')
+    return DatasourceSortOrder
+
+
+def Datasource_Filter():
+    class Datasource_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('contains_unsupported_custom_sql', 'contains_unsupported_custom_sql_within', 'id', 'id_within', 'name', 'name_within')
+        contains_unsupported_custom_sql = sgqlc.types.Field('Boolean', graphql_name='containsUnsupportedCustomSql')
+        contains_unsupported_custom_sql_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='containsUnsupportedCustomSqlWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return Datasource_Filter
+
+
+def EmbeddedDatasourceSortOrder():
+    class EmbeddedDatasourceSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('EmbeddedDatasourceOrderField'), graphql_name='field')
+    return EmbeddedDatasourceSortOrder
+
+
+def EmbeddedDatasource_Filter():
+    class EmbeddedDatasource_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('contains_unsupported_custom_sql', 'contains_unsupported_custom_sql_within', 'id', 'id_within', 'name', 'name_within')
+        contains_unsupported_custom_sql = sgqlc.types.Field('Boolean', graphql_name='containsUnsupportedCustomSql')
+        contains_unsupported_custom_sql_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='containsUnsupportedCustomSqlWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return EmbeddedDatasource_Filter
+
+
+def ExtractType_Filter():
+    class ExtractType_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return ExtractType_Filter
+
+
+def FieldDataType_Filter():
+    class FieldDataType_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return FieldDataType_Filter
+
+
+def FieldReferencingFieldSortOrder():
+    class FieldReferencingFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('FieldReferencingFieldOrderField'), graphql_name='field')
+    return FieldReferencingFieldSortOrder
+
+
+def FieldReferencingField_Filter():
+    class FieldReferencingField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return FieldReferencingField_Filter
+
+
+def FieldRoleCategory_Filter():
+    class FieldRoleCategory_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return FieldRoleCategory_Filter
+
+
+def FieldRole_Filter():
+    class FieldRole_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return FieldRole_Filter
+
+
+def FieldSortOrder():
+    class FieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('FieldOrderField'), graphql_name='field')
+    return FieldSortOrder
+
+
+def Field_Filter():
+    class Field_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'is_hidden', 'is_hidden_within', 'name', 'name_within', 'text')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_hidden = sgqlc.types.Field('Boolean', graphql_name='isHidden')
+        is_hidden_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isHiddenWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return Field_Filter
+
+
+def Field_Required_Filter():
+    class Field_Required_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return Field_Required_Filter
+
+
+def FileSortOrder():
+    class FileSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('FileOrderField'), graphql_name='field')
+    return FileSortOrder
+
+
+def File_Filter():
+    class File_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('connection_type', 'connection_type_within', 'has_active_warning', 'has_active_warning_within', 'id', 'id_within', 'is_certified', 'is_certified_within', 'is_embedded', 'is_embedded_within', 'luid', 'luid_within', 'name', 'name_within', 'project_name', 'project_name_within', 'text')
+        connection_type = sgqlc.types.Field('String', graphql_name='connectionType')
+        connection_type_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='connectionTypeWithin')
+        has_active_warning = sgqlc.types.Field('Boolean', graphql_name='hasActiveWarning')
+        has_active_warning_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='hasActiveWarningWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_certified = sgqlc.types.Field('Boolean', graphql_name='isCertified')
+        is_certified_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isCertifiedWithin')
+        is_embedded = sgqlc.types.Field('Boolean', graphql_name='isEmbedded')
+        is_embedded_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isEmbeddedWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='projectNameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return File_Filter
+
+
+def FlowColumnInputFieldSortOrder():
+    class FlowColumnInputFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('FlowColumnInputFieldOrderField'), graphql_name='field')
+    return FlowColumnInputFieldSortOrder
+
+
+def FlowColumnInputField_Filter():
+    class FlowColumnInputField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return FlowColumnInputField_Filter
+
+
+def FlowColumnOutputFieldSortOrder():
+    class FlowColumnOutputFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('FlowColumnOutputFieldOrderField'), graphql_name='field')
+    return FlowColumnOutputFieldSortOrder
+
+
+def FlowColumnOutputField_Filter():
+    class FlowColumnOutputField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return FlowColumnOutputField_Filter
+
+
+def FlowFieldInputFieldSortOrder():
+    class FlowFieldInputFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('FlowFieldInputFieldOrderField'), graphql_name='field')
+    return FlowFieldInputFieldSortOrder
+
+
+def FlowFieldInputField_Filter():
+    class FlowFieldInputField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return FlowFieldInputField_Filter
+
+
+def FlowFieldOutputFieldSortOrder():
+    class FlowFieldOutputFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('FlowFieldOutputFieldOrderField'), graphql_name='field')
+    return FlowFieldOutputFieldSortOrder
+
+
+def FlowFieldOutputField_Filter():
+    class FlowFieldOutputField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return FlowFieldOutputField_Filter
+
+
+def FlowInputFieldSortOrder():
+    class FlowInputFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('FlowInputFieldOrderField'), graphql_name='field')
+    return FlowInputFieldSortOrder
+
+
+def FlowInputField_Filter():
+    class FlowInputField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return FlowInputField_Filter
+
+
+def FlowOutputFieldSortOrder():
+    class FlowOutputFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('FlowOutputFieldOrderField'), graphql_name='field')
+    return FlowOutputFieldSortOrder
+
+
+def FlowOutputField_Filter():
+    class FlowOutputField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return FlowOutputField_Filter
+
+
+def FlowOutputStepSortOrder():
+    class FlowOutputStepSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('FlowOutputStepOrderField'), graphql_name='field')
+    return FlowOutputStepSortOrder
+
+
+def FlowOutputStep_Filter():
+    class FlowOutputStep_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return FlowOutputStep_Filter
+
+
+def FlowSortOrder():
+    class FlowSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('FlowOrderField'), graphql_name='field')
+    return FlowSortOrder
+
+
+def Flow_Filter():
+    class Flow_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('container_name', 'container_name_within', 'contains_unsupported_custom_sql', 'contains_unsupported_custom_sql_within', 'has_active_warning', 'has_active_warning_within', 'id', 'id_within', 'luid', 'luid_within', 'name', 'name_within', 'project_name', 'project_name_within', 'vizportal_url_id', 'vizportal_url_id_within')
+        container_name = sgqlc.types.Field('String', graphql_name='containerName')
+        container_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='containerNameWithin')
+        contains_unsupported_custom_sql = sgqlc.types.Field('Boolean', graphql_name='containsUnsupportedCustomSql')
+        contains_unsupported_custom_sql_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='containsUnsupportedCustomSqlWithin')
+        has_active_warning = sgqlc.types.Field('Boolean', graphql_name='hasActiveWarning')
+        has_active_warning_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='hasActiveWarningWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='projectNameWithin')
+        vizportal_url_id = sgqlc.types.Field('String', graphql_name='vizportalUrlId')
+        vizportal_url_id_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='vizportalUrlIdWithin')
+    return Flow_Filter
+
+
+def GenericLabelSortOrder():
+    class GenericLabelSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('GenericLabelOrderField'), graphql_name='field')
+    return GenericLabelSortOrder
+
+
+def GenericLabel_Filter():
+    class GenericLabel_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('category', 'category_within', 'id', 'id_within', 'is_active', 'is_active_within', 'is_elevated', 'is_elevated_within', 'luid', 'luid_within', 'value', 'value_within')
+        category = sgqlc.types.Field('String', graphql_name='category')
+        category_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='categoryWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_active = sgqlc.types.Field('Boolean', graphql_name='isActive')
+        is_active_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isActiveWithin')
+        is_elevated = sgqlc.types.Field('Boolean', graphql_name='isElevated')
+        is_elevated_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isElevatedWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        value = sgqlc.types.Field('String', graphql_name='value')
+        value_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='valueWithin')
+    return GenericLabel_Filter
+
+
+def GroupFieldSortOrder():
+    class GroupFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('GroupFieldOrderField'), graphql_name='field')
+    return GroupFieldSortOrder
+
+
+def GroupField_Filter():
+    class GroupField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'is_hidden', 'is_hidden_within', 'name', 'name_within', 'text')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_hidden = sgqlc.types.Field('Boolean', graphql_name='isHidden')
+        is_hidden_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isHiddenWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return GroupField_Filter
+
+
+def GroupField_Required_Filter():
+    class GroupField_Required_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return GroupField_Required_Filter
+
+
+def HierarchyFieldSortOrder():
+    class HierarchyFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('HierarchyFieldOrderField'), graphql_name='field')
+    return HierarchyFieldSortOrder
+
+
+def HierarchyField_Filter():
+    class HierarchyField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'is_hidden', 'is_hidden_within', 'name', 'name_within', 'text')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_hidden = sgqlc.types.Field('Boolean', graphql_name='isHidden')
+        is_hidden_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isHiddenWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return HierarchyField_Filter
+
+
+def HierarchyField_Required_Filter():
+    class HierarchyField_Required_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return HierarchyField_Required_Filter
+
+
+def LabelSortOrder():
+    class LabelSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('LabelOrderField'), graphql_name='field')
+    return LabelSortOrder
+
+
+def Label_Filter():
+    class Label_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('category', 'category_within', 'id', 'id_within', 'is_active', 'is_active_within', 'is_elevated', 'is_elevated_within', 'luid', 'luid_within', 'value', 'value_within')
+        category = sgqlc.types.Field('String', graphql_name='category')
+        category_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='categoryWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_active = sgqlc.types.Field('Boolean', graphql_name='isActive')
+        is_active_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isActiveWithin')
+        is_elevated = sgqlc.types.Field('Boolean', graphql_name='isElevated')
+        is_elevated_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isElevatedWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        value = sgqlc.types.Field('String', graphql_name='value')
+        value_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='valueWithin')
+    return Label_Filter
+
+
+def LensFieldSortOrder():
+    class LensFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('LensFieldOrderField'), graphql_name='field')
+    return LensFieldSortOrder
+
+
+def LensField_Filter():
+    class LensField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return LensField_Filter
+
+
+def LensField_Required_Filter():
+    class LensField_Required_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return LensField_Required_Filter
+
+
+def LensSortOrder():
+    class LensSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('LensOrderField'), graphql_name='field')
+    return LensSortOrder
+
+
+def Lens_Filter():
+    class Lens_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'luid', 'luid_within', 'name', 'name_within', 'vizportal_url_id', 'vizportal_url_id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        vizportal_url_id = sgqlc.types.Field('String', graphql_name='vizportalUrlId')
+        vizportal_url_id_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='vizportalUrlIdWithin')
+    return Lens_Filter
+
+
+def LinkedFlowSortOrder():
+    class LinkedFlowSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('LinkedFlowOrderField'), graphql_name='field')
+    return LinkedFlowSortOrder
+
+
+def LinkedFlow_Filter():
+    class LinkedFlow_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return LinkedFlow_Filter
+
+
+def MetricDefinitionSortOrder():
+    class MetricDefinitionSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('MetricDefinitionOrderField'), graphql_name='field')
+    return MetricDefinitionSortOrder
+
+
+def MetricDefinition_Filter():
+    class MetricDefinition_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'luid', 'luid_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return MetricDefinition_Filter
+
+
+def MetricSortOrder():
+    class MetricSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('MetricOrderField'), graphql_name='field')
+    return MetricSortOrder
+
+
+def Metric_Filter():
+    class Metric_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('container_name', 'container_name_within', 'id', 'id_within', 'luid', 'luid_within', 'name', 'name_within', 'project_name', 'project_name_within', 'vizportal_url_id', 'vizportal_url_id_within')
+        container_name = sgqlc.types.Field('String', graphql_name='containerName')
+        container_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='containerNameWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='projectNameWithin')
+        vizportal_url_id = sgqlc.types.Field('String', graphql_name='vizportalUrlId')
+        vizportal_url_id_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='vizportalUrlIdWithin')
+    return Metric_Filter
+
+
+def NodeSortOrder():
+    class NodeSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('NodeOrderField'), graphql_name='field')
+    return NodeSortOrder
+
+
+def Node_Filter():
+    class Node_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return Node_Filter
+
+
+def ParameterSortOrder():
+    class ParameterSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ParameterOrderField'), graphql_name='field')
+    return ParameterSortOrder
+
+
+def Parameter_Filter():
+    class Parameter_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within', 'parent_name', 'parent_name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        parent_name = sgqlc.types.Field('String', graphql_name='parentName')
+        parent_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='parentNameWithin')
+    return Parameter_Filter
+
+
+def PublishedDatasourceSortOrder():
+    class PublishedDatasourceSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('PublishedDatasourceOrderField'), graphql_name='field')
+    return PublishedDatasourceSortOrder
+
+
+def PublishedDatasource_Filter():
+    class PublishedDatasource_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('container_name', 'container_name_within', 'contains_unsupported_custom_sql', 'contains_unsupported_custom_sql_within', 'has_active_warning', 'has_active_warning_within', 'id', 'id_within', 'is_certified', 'is_certified_within', 'luid', 'luid_within', 'name', 'name_within', 'project_name', 'project_name_within', 'vizportal_url_id', 'vizportal_url_id_within')
+        container_name = sgqlc.types.Field('String', graphql_name='containerName')
+        container_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='containerNameWithin')
+        contains_unsupported_custom_sql = sgqlc.types.Field('Boolean', graphql_name='containsUnsupportedCustomSql')
+        contains_unsupported_custom_sql_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='containsUnsupportedCustomSqlWithin')
+        has_active_warning = sgqlc.types.Field('Boolean', graphql_name='hasActiveWarning')
+        has_active_warning_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='hasActiveWarningWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_certified = sgqlc.types.Field('Boolean', graphql_name='isCertified')
+        is_certified_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isCertifiedWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='projectNameWithin')
+        vizportal_url_id = sgqlc.types.Field('String', graphql_name='vizportalUrlId')
+        vizportal_url_id_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='vizportalUrlIdWithin')
+    return PublishedDatasource_Filter
+
+
+def RemoteType_Filter():
+    class RemoteType_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return RemoteType_Filter
+
+
+def SetFieldSortOrder():
+    class SetFieldSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('SetFieldOrderField'), graphql_name='field')
+    return SetFieldSortOrder
+
+
+def SetField_Filter():
+    class SetField_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'is_hidden', 'is_hidden_within', 'name', 'name_within', 'text')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_hidden = sgqlc.types.Field('Boolean', graphql_name='isHidden')
+        is_hidden_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isHiddenWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return SetField_Filter
+
+
+def SetField_Required_Filter():
+    class SetField_Required_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return SetField_Required_Filter
+
+
+def SheetSortOrder():
+    class SheetSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('SheetOrderField'), graphql_name='field')
+    return SheetSortOrder
+
+
+def Sheet_Filter():
+    class Sheet_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('document_view_id', 'document_view_id_within', 'id', 'id_within', 'luid', 'luid_within', 'name', 'name_within', 'path', 'path_within')
+        document_view_id = sgqlc.types.Field('String', graphql_name='documentViewId')
+        document_view_id_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='documentViewIdWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        path = sgqlc.types.Field('String', graphql_name='path')
+        path_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='pathWithin')
+    return Sheet_Filter
+
+
+def TableAdditionalDetailsSortOrder():
+    class TableAdditionalDetailsSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('TableAdditionalDetailsOrderField'), graphql_name='field')
+    return TableAdditionalDetailsSortOrder
+
+
+def TableAdditionalDetails_Filter():
+    class TableAdditionalDetails_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return TableAdditionalDetails_Filter
+
+
+def TableSortOrder():
+    class TableSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('TableOrderField'), graphql_name='field')
+    return TableSortOrder
+
+
+def TableType_Filter():
+    class TableType_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+    return TableType_Filter
+
+
+def Table_Filter():
+    class Table_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within', 'text')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return Table_Filter
+
+
+def TableauSiteSortOrder():
+    class TableauSiteSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('TableauSiteOrderField'), graphql_name='field')
+    return TableauSiteSortOrder
+
+
+def TableauSite_Filter():
+    class TableauSite_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'luid', 'luid_within', 'name', 'name_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+    return TableauSite_Filter
+
+
+def TableauUserSortOrder():
+    class TableauUserSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('TableauUserOrderField'), graphql_name='field')
+    return TableauUserSortOrder
+
+
+def TableauUser_Filter():
+    class TableauUser_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('domain', 'domain_within', 'email', 'email_within', 'id', 'id_within', 'luid', 'luid_within', 'name', 'name_within', 'username', 'username_within')
+        domain = sgqlc.types.Field('String', graphql_name='domain')
+        domain_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='domainWithin')
+        email = sgqlc.types.Field('String', graphql_name='email')
+        email_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='emailWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        username = sgqlc.types.Field('String', graphql_name='username')
+        username_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='usernameWithin')
+    return TableauUser_Filter
+
+
+def TagSortOrder():
+    class TagSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('TagOrderField'), graphql_name='field')
+    return TagSortOrder
+
+
+def Tag_Filter():
+    class Tag_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'name', 'name_within', 'text')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return Tag_Filter
+
+
+def TaggableSortOrder():
+    class TaggableSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('TaggableOrderField'), graphql_name='field')
+    return TaggableSortOrder
+
+
+def Taggable_Filter():
+    class Taggable_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'id_within', 'luid', 'luid_within')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+    return Taggable_Filter
+
+
+def ViewSortOrder():
+    class ViewSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('ViewOrderField'), graphql_name='field')
+    return ViewSortOrder
+
+
+def View_Filter():
+    class View_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('document_view_id', 'document_view_id_within', 'id', 'id_within', 'luid', 'luid_within', 'name', 'name_within', 'path', 'path_within')
+        document_view_id = sgqlc.types.Field('String', graphql_name='documentViewId')
+        document_view_id_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='documentViewIdWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        path = sgqlc.types.Field('String', graphql_name='path')
+        path_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='pathWithin')
+    return View_Filter
+
+
+def VirtualConnectionSortOrder():
+    class VirtualConnectionSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('VirtualConnectionOrderField'), graphql_name='field')
+    return VirtualConnectionSortOrder
+
+
+def VirtualConnectionTableSortOrder():
+    class VirtualConnectionTableSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('VirtualConnectionTableOrderField'), graphql_name='field')
+    return VirtualConnectionTableSortOrder
+
+
+def VirtualConnectionTable_Filter():
+    class VirtualConnectionTable_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('contains_unsupported_custom_sql', 'contains_unsupported_custom_sql_within', 'extract_last_refreshed_at', 'extract_last_refreshed_at_within', 'has_active_warning', 'has_active_warning_within', 'id', 'id_within', 'is_certified', 'is_certified_within', 'is_extracted', 'is_extracted_within', 'luid', 'luid_within', 'name', 'name_within', 'vizportal_url_id', 'vizportal_url_id_within')
+        contains_unsupported_custom_sql = sgqlc.types.Field('Boolean', graphql_name='containsUnsupportedCustomSql')
+        contains_unsupported_custom_sql_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='containsUnsupportedCustomSqlWithin')
+        extract_last_refreshed_at = sgqlc.types.Field('DateTime', graphql_name='extractLastRefreshedAt')
+        extract_last_refreshed_at_within = sgqlc.types.Field(sgqlc.types.list_of('DateTime'), graphql_name='extractLastRefreshedAtWithin')
+        has_active_warning = sgqlc.types.Field('Boolean', graphql_name='hasActiveWarning')
+        has_active_warning_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='hasActiveWarningWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_certified = sgqlc.types.Field('Boolean', graphql_name='isCertified')
+        is_certified_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isCertifiedWithin')
+        is_extracted = sgqlc.types.Field('Boolean', graphql_name='isExtracted')
+        is_extracted_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isExtractedWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        vizportal_url_id = sgqlc.types.Field('String', graphql_name='vizportalUrlId')
+        vizportal_url_id_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='vizportalUrlIdWithin')
+    return VirtualConnectionTable_Filter
+
+
+def VirtualConnection_Filter():
+    class VirtualConnection_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('connection_type', 'connection_type_within', 'container_name', 'container_name_within', 'has_active_warning', 'has_active_warning_within', 'id', 'id_within', 'is_certified', 'is_certified_within', 'luid', 'luid_within', 'name', 'name_within', 'project_name', 'project_name_within', 'vizportal_url_id', 'vizportal_url_id_within')
+        connection_type = sgqlc.types.Field('String', graphql_name='connectionType')
+        connection_type_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='connectionTypeWithin')
+        container_name = sgqlc.types.Field('String', graphql_name='containerName')
+        container_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='containerNameWithin')
+        has_active_warning = sgqlc.types.Field('Boolean', graphql_name='hasActiveWarning')
+        has_active_warning_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='hasActiveWarningWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_certified = sgqlc.types.Field('Boolean', graphql_name='isCertified')
+        is_certified_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isCertifiedWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='projectNameWithin')
+        vizportal_url_id = sgqlc.types.Field('String', graphql_name='vizportalUrlId')
+        vizportal_url_id_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='vizportalUrlIdWithin')
+    return VirtualConnection_Filter
+
+
+def WarnableSortOrder():
+    class WarnableSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('WarnableOrderField'), graphql_name='field')
+    return WarnableSortOrder
+
+
+def Warnable_Filter():
+    class Warnable_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('has_active_warning', 'has_active_warning_within', 'id', 'id_within', 'luid', 'luid_within')
+        has_active_warning = sgqlc.types.Field('Boolean', graphql_name='hasActiveWarning')
+        has_active_warning_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='hasActiveWarningWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+    return Warnable_Filter
+
+
+def WebDataConnectorSortOrder():
+    class WebDataConnectorSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('WebDataConnectorOrderField'), graphql_name='field')
+    return WebDataConnectorSortOrder
+
+
+def WebDataConnector_Filter():
+    class WebDataConnector_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('connection_type', 'connection_type_within', 'has_active_warning', 'has_active_warning_within', 'id', 'id_within', 'is_certified', 'is_certified_within', 'is_embedded', 'is_embedded_within', 'luid', 'luid_within', 'name', 'name_within', 'project_name', 'project_name_within', 'text')
+        connection_type = sgqlc.types.Field('String', graphql_name='connectionType')
+        connection_type_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='connectionTypeWithin')
+        has_active_warning = sgqlc.types.Field('Boolean', graphql_name='hasActiveWarning')
+        has_active_warning_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='hasActiveWarningWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        is_certified = sgqlc.types.Field('Boolean', graphql_name='isCertified')
+        is_certified_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isCertifiedWithin')
+        is_embedded = sgqlc.types.Field('Boolean', graphql_name='isEmbedded')
+        is_embedded_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='isEmbeddedWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='projectNameWithin')
+        text = sgqlc.types.Field('String', graphql_name='text')
+    return WebDataConnector_Filter
+
+
+def WorkbookSortOrder():
+    class WorkbookSortOrder(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('direction', 'field')
+        direction = sgqlc.types.Field(sgqlc.types.non_null('OrderDirection'), graphql_name='direction')
+        field = sgqlc.types.Field(sgqlc.types.non_null('WorkbookOrderField'), graphql_name='field')
+    return WorkbookSortOrder
+
+
+def Workbook_Filter():
+    class Workbook_Filter(sgqlc.types.Input):
+        __schema__ = tableau_schema
+        __field_names__ = ('container_name', 'container_name_within', 'contains_unsupported_custom_sql', 'contains_unsupported_custom_sql_within', 'id', 'id_within', 'luid', 'luid_within', 'name', 'name_within', 'project_luid', 'project_luid_within', 'project_name', 'project_name_within', 'vizportal_url_id', 'vizportal_url_id_within')
+        container_name = sgqlc.types.Field('String', graphql_name='containerName')
+        container_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='containerNameWithin')
+        contains_unsupported_custom_sql = sgqlc.types.Field('Boolean', graphql_name='containsUnsupportedCustomSql')
+        contains_unsupported_custom_sql_within = sgqlc.types.Field(sgqlc.types.list_of('Boolean'), graphql_name='containsUnsupportedCustomSqlWithin')
+        id = sgqlc.types.Field('ID', graphql_name='id')
+        id_within = sgqlc.types.Field(sgqlc.types.list_of('ID'), graphql_name='idWithin')
+        luid = sgqlc.types.Field('String', graphql_name='luid')
+        luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='luidWithin')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='nameWithin')
+        project_luid = sgqlc.types.Field('String', graphql_name='projectLuid')
+        project_luid_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='projectLuidWithin')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_name_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='projectNameWithin')
+        vizportal_url_id = sgqlc.types.Field('String', graphql_name='vizportalUrlId')
+        vizportal_url_id_within = sgqlc.types.Field(sgqlc.types.list_of('String'), graphql_name='vizportalUrlIdWithin')
+    return Workbook_Filter
@@ -0,0 +1,575 @@
+# Generated by tools/sgqlc_fast_schema.py
+# Source: tableau_schema.py
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+from . import tableau_schema
+
+
+def AnalyticsField():
+    class AnalyticsField(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('aggregation', 'aggregation_param', 'datasource', 'default_format', 'derived_lens_fields', 'derived_lens_fields_connection', 'direct_sheets', 'direct_sheets_connection', 'metric_definitions', 'metric_definitions_connection', 'referenced_by_bins', 'referenced_by_bins_connection', 'referenced_by_calculations', 'referenced_by_calculations_connection', 'referenced_by_combined_fields', 'referenced_by_combined_fields_connection', 'referenced_by_combined_sets', 'referenced_by_combined_sets_connection', 'referenced_by_fields', 'referenced_by_fields_connection', 'referenced_by_filters', 'referenced_by_filters_connection', 'referenced_by_flow_field_input_field', 'referenced_by_flow_field_input_field_connection', 'referenced_by_flow_field_output_field', 'referenced_by_flow_field_output_field_connection', 'referenced_by_groups', 'referenced_by_groups_connection', 'referenced_by_hierarchies', 'referenced_by_hierarchies_connection', 'referenced_by_remote_fields', 'referenced_by_remote_fields_connection', 'referenced_by_sets', 'referenced_by_sets_connection', 'semantic_role', 'sheets', 'sheets_connection')
+        aggregation = sgqlc.types.Field('String', graphql_name='aggregation')
+        aggregation_param = sgqlc.types.Field('String', graphql_name='aggregationParam')
+        datasource = sgqlc.types.Field('Datasource', graphql_name='datasource')
+        default_format = sgqlc.types.Field('String', graphql_name='defaultFormat')
+        derived_lens_fields = sgqlc.types.Field(sgqlc.types.list_of('LensField'), graphql_name='derivedLensFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('LensField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        derived_lens_fields_connection = sgqlc.types.Field('LensFieldsConnection', graphql_name='derivedLensFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('LensField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        direct_sheets = sgqlc.types.Field(sgqlc.types.list_of('Sheet'), graphql_name='directSheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        direct_sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='directSheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        metric_definitions = sgqlc.types.Field(sgqlc.types.list_of('MetricDefinition'), graphql_name='metricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        metric_definitions_connection = sgqlc.types.Field('MetricDefinitionsConnection', graphql_name='metricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_bins = sgqlc.types.Field(sgqlc.types.list_of('BinField'), graphql_name='referencedByBins', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('BinField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('BinFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_bins_connection = sgqlc.types.Field('BinFieldsConnection', graphql_name='referencedByBinsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('BinField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('BinFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_calculations = sgqlc.types.Field(sgqlc.types.list_of('CalculatedField'), graphql_name='referencedByCalculations', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CalculatedField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CalculatedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_calculations_connection = sgqlc.types.Field('CalculatedFieldsConnection', graphql_name='referencedByCalculationsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CalculatedField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CalculatedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_fields = sgqlc.types.Field(sgqlc.types.list_of('CombinedField'), graphql_name='referencedByCombinedFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CombinedField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CombinedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_fields_connection = sgqlc.types.Field('CombinedFieldsConnection', graphql_name='referencedByCombinedFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CombinedField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CombinedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_sets = sgqlc.types.Field(sgqlc.types.list_of('CombinedSetField'), graphql_name='referencedByCombinedSets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CombinedSetField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CombinedSetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_sets_connection = sgqlc.types.Field('CombinedSetFieldsConnection', graphql_name='referencedByCombinedSetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CombinedSetField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CombinedSetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_fields = sgqlc.types.Field(sgqlc.types.list_of('FieldReferencingField'), graphql_name='referencedByFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FieldReferencingField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldReferencingFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_fields_connection = sgqlc.types.Field('FieldReferencingFieldsConnection', graphql_name='referencedByFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FieldReferencingField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldReferencingFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_filters = sgqlc.types.Field(sgqlc.types.list_of('DatasourceFilter'), graphql_name='referencedByFilters', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatasourceFilter_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFilterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_filters_connection = sgqlc.types.Field('DatasourceFiltersConnection', graphql_name='referencedByFiltersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatasourceFilter_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFilterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_flow_field_input_field = sgqlc.types.Field(sgqlc.types.list_of('FlowFieldInputField'), graphql_name='referencedByFlowFieldInputField', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowFieldInputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldInputFieldSortOrder', graphql_name='orderBy', default=None)))))
+        referenced_by_flow_field_input_field_connection = sgqlc.types.Field('FlowFieldInputFieldsConnection', graphql_name='referencedByFlowFieldInputFieldConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowFieldInputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldInputFieldSortOrder', graphql_name='orderBy', default=None)))))
+        referenced_by_flow_field_output_field = sgqlc.types.Field(sgqlc.types.list_of('FlowFieldOutputField'), graphql_name='referencedByFlowFieldOutputField', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowFieldOutputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_flow_field_output_field_connection = sgqlc.types.Field('FlowFieldOutputFieldsConnection', graphql_name='referencedByFlowFieldOutputFieldConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowFieldOutputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_groups = sgqlc.types.Field(sgqlc.types.list_of('GroupField'), graphql_name='referencedByGroups', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('GroupField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('GroupFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_groups_connection = sgqlc.types.Field('GroupFieldsConnection', graphql_name='referencedByGroupsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('GroupField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('GroupFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_hierarchies = sgqlc.types.Field(sgqlc.types.list_of('HierarchyField'), graphql_name='referencedByHierarchies', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('HierarchyField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('HierarchyFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_hierarchies_connection = sgqlc.types.Field('HierarchyFieldsConnection', graphql_name='referencedByHierarchiesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('HierarchyField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('HierarchyFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_remote_fields = sgqlc.types.Field(sgqlc.types.list_of('DatasourceField'), graphql_name='referencedByRemoteFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatasourceField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_remote_fields_connection = sgqlc.types.Field('DatasourceFieldsConnection', graphql_name='referencedByRemoteFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatasourceField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_sets = sgqlc.types.Field(sgqlc.types.list_of('SetField'), graphql_name='referencedBySets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('SetField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_sets_connection = sgqlc.types.Field('SetFieldsConnection', graphql_name='referencedBySetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('SetField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        semantic_role = sgqlc.types.Field('String', graphql_name='semanticRole')
+        sheets = sgqlc.types.Field(sgqlc.types.list_of('Sheet'), graphql_name='sheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='sheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return AnalyticsField
+
+
+def CanHaveLabels():
+    class CanHaveLabels(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'labels', 'labels_connection', 'luid', 'name')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        labels = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Label'))), graphql_name='labels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        labels_connection = sgqlc.types.Field('LabelsConnection', graphql_name='labelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        luid = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='luid')
+        name = sgqlc.types.Field('String', graphql_name='name')
+    return CanHaveLabels
+
+
+def Certifiable():
+    class Certifiable(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('data_quality_certifications', 'data_quality_certifications_connection', 'id', 'is_certified', 'luid', 'name')
+        data_quality_certifications = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityCertification'))), graphql_name='dataQualityCertifications', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityCertification_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityCertificationSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        data_quality_certifications_connection = sgqlc.types.Field('DataQualityCertificationsConnection', graphql_name='dataQualityCertificationsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityCertification_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityCertificationSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        is_certified = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isCertified')
+        luid = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='luid')
+        name = sgqlc.types.Field('String', graphql_name='name')
+    return Certifiable
+
+
+def DataField():
+    class DataField(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('data_category', 'data_type', 'datasource', 'derived_lens_fields', 'derived_lens_fields_connection', 'direct_sheets', 'direct_sheets_connection', 'metric_definitions', 'metric_definitions_connection', 'referenced_by_bins', 'referenced_by_bins_connection', 'referenced_by_calculations', 'referenced_by_calculations_connection', 'referenced_by_combined_fields', 'referenced_by_combined_fields_connection', 'referenced_by_combined_sets', 'referenced_by_combined_sets_connection', 'referenced_by_fields', 'referenced_by_fields_connection', 'referenced_by_filters', 'referenced_by_filters_connection', 'referenced_by_flow_field_input_field', 'referenced_by_flow_field_input_field_connection', 'referenced_by_flow_field_output_field', 'referenced_by_flow_field_output_field_connection', 'referenced_by_groups', 'referenced_by_groups_connection', 'referenced_by_hierarchies', 'referenced_by_hierarchies_connection', 'referenced_by_remote_fields', 'referenced_by_remote_fields_connection', 'referenced_by_sets', 'referenced_by_sets_connection', 'role', 'sheets', 'sheets_connection')
+        data_category = sgqlc.types.Field('FieldRoleCategory', graphql_name='dataCategory')
+        data_type = sgqlc.types.Field('FieldDataType', graphql_name='dataType')
+        datasource = sgqlc.types.Field('Datasource', graphql_name='datasource')
+        derived_lens_fields = sgqlc.types.Field(sgqlc.types.list_of('LensField'), graphql_name='derivedLensFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('LensField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        derived_lens_fields_connection = sgqlc.types.Field('LensFieldsConnection', graphql_name='derivedLensFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('LensField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        direct_sheets = sgqlc.types.Field(sgqlc.types.list_of('Sheet'), graphql_name='directSheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        direct_sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='directSheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        metric_definitions = sgqlc.types.Field(sgqlc.types.list_of('MetricDefinition'), graphql_name='metricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        metric_definitions_connection = sgqlc.types.Field('MetricDefinitionsConnection', graphql_name='metricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_bins = sgqlc.types.Field(sgqlc.types.list_of('BinField'), graphql_name='referencedByBins', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('BinField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('BinFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_bins_connection = sgqlc.types.Field('BinFieldsConnection', graphql_name='referencedByBinsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('BinField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('BinFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_calculations = sgqlc.types.Field(sgqlc.types.list_of('CalculatedField'), graphql_name='referencedByCalculations', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CalculatedField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CalculatedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_calculations_connection = sgqlc.types.Field('CalculatedFieldsConnection', graphql_name='referencedByCalculationsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CalculatedField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CalculatedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_fields = sgqlc.types.Field(sgqlc.types.list_of('CombinedField'), graphql_name='referencedByCombinedFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CombinedField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CombinedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_fields_connection = sgqlc.types.Field('CombinedFieldsConnection', graphql_name='referencedByCombinedFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CombinedField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CombinedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_sets = sgqlc.types.Field(sgqlc.types.list_of('CombinedSetField'), graphql_name='referencedByCombinedSets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CombinedSetField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CombinedSetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_sets_connection = sgqlc.types.Field('CombinedSetFieldsConnection', graphql_name='referencedByCombinedSetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CombinedSetField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CombinedSetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_fields = sgqlc.types.Field(sgqlc.types.list_of('FieldReferencingField'), graphql_name='referencedByFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FieldReferencingField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldReferencingFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_fields_connection = sgqlc.types.Field('FieldReferencingFieldsConnection', graphql_name='referencedByFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FieldReferencingField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldReferencingFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_filters = sgqlc.types.Field(sgqlc.types.list_of('DatasourceFilter'), graphql_name='referencedByFilters', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatasourceFilter_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFilterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_filters_connection = sgqlc.types.Field('DatasourceFiltersConnection', graphql_name='referencedByFiltersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatasourceFilter_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFilterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_flow_field_input_field = sgqlc.types.Field(sgqlc.types.list_of('FlowFieldInputField'), graphql_name='referencedByFlowFieldInputField', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowFieldInputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldInputFieldSortOrder', graphql_name='orderBy', default=None)))))
+        referenced_by_flow_field_input_field_connection = sgqlc.types.Field('FlowFieldInputFieldsConnection', graphql_name='referencedByFlowFieldInputFieldConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowFieldInputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldInputFieldSortOrder', graphql_name='orderBy', default=None)))))
+        referenced_by_flow_field_output_field = sgqlc.types.Field(sgqlc.types.list_of('FlowFieldOutputField'), graphql_name='referencedByFlowFieldOutputField', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowFieldOutputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_flow_field_output_field_connection = sgqlc.types.Field('FlowFieldOutputFieldsConnection', graphql_name='referencedByFlowFieldOutputFieldConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowFieldOutputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_groups = sgqlc.types.Field(sgqlc.types.list_of('GroupField'), graphql_name='referencedByGroups', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('GroupField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('GroupFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_groups_connection = sgqlc.types.Field('GroupFieldsConnection', graphql_name='referencedByGroupsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('GroupField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('GroupFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_hierarchies = sgqlc.types.Field(sgqlc.types.list_of('HierarchyField'), graphql_name='referencedByHierarchies', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('HierarchyField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('HierarchyFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_hierarchies_connection = sgqlc.types.Field('HierarchyFieldsConnection', graphql_name='referencedByHierarchiesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('HierarchyField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('HierarchyFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_remote_fields = sgqlc.types.Field(sgqlc.types.list_of('DatasourceField'), graphql_name='referencedByRemoteFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatasourceField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_remote_fields_connection = sgqlc.types.Field('DatasourceFieldsConnection', graphql_name='referencedByRemoteFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatasourceField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_sets = sgqlc.types.Field(sgqlc.types.list_of('SetField'), graphql_name='referencedBySets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('SetField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_sets_connection = sgqlc.types.Field('SetFieldsConnection', graphql_name='referencedBySetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('SetField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        role = sgqlc.types.Field('FieldRole', graphql_name='role')
+        sheets = sgqlc.types.Field(sgqlc.types.list_of('Sheet'), graphql_name='sheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='sheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return DataField
+
+
+def Database():
+    class Database(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('certification_note', 'certifier', 'connection_type', 'contact', 'data_quality_certifications', 'data_quality_certifications_connection', 'data_quality_warning', 'data_quality_warnings', 'data_quality_warnings_connection', 'description', 'downstream_dashboards', 'downstream_dashboards_connection', 'downstream_databases', 'downstream_databases_connection', 'downstream_datasources', 'downstream_datasources_connection', 'downstream_flows', 'downstream_flows_connection', 'downstream_lenses', 'downstream_lenses_connection', 'downstream_metric_definitions', 'downstream_metric_definitions_connection', 'downstream_metrics', 'downstream_metrics_connection', 'downstream_owners', 'downstream_owners_connection', 'downstream_sheets', 'downstream_sheets_connection', 'downstream_tables', 'downstream_tables_connection', 'downstream_virtual_connection_tables', 'downstream_virtual_connection_tables_connection', 'downstream_virtual_connections', 'downstream_virtual_connections_connection', 'downstream_workbooks', 'downstream_workbooks_connection', 'has_active_warning', 'id', 'is_certified', 'is_controlled_permissions_enabled', 'is_embedded', 'is_grouped', 'labels', 'labels_connection', 'luid', 'name', 'project_name', 'project_vizportal_url_id', 'referenced_by_queries', 'referenced_by_queries_connection', 'tables', 'tables_connection', 'tags', 'tags_connection', 'upstream_data_quality_warnings', 'upstream_data_quality_warnings_connection', 'upstream_databases', 'upstream_databases_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_labels', 'upstream_labels_connection', 'upstream_tables', 'upstream_tables_connection', 'upstream_virtual_connection_tables', 'upstream_virtual_connection_tables_connection', 'upstream_virtual_connections', 'upstream_virtual_connections_connection', 'vizportal_id')
+        certification_note = sgqlc.types.Field('String', graphql_name='certificationNote')
+        certifier = sgqlc.types.Field('TableauUser', graphql_name='certifier')
+        connection_type = sgqlc.types.Field('String', graphql_name='connectionType')
+        contact = sgqlc.types.Field('TableauUser', graphql_name='contact')
+        data_quality_certifications = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityCertification'))), graphql_name='dataQualityCertifications', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityCertification_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityCertificationSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        data_quality_certifications_connection = sgqlc.types.Field('DataQualityCertificationsConnection', graphql_name='dataQualityCertificationsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityCertification_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityCertificationSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        data_quality_warning = sgqlc.types.Field('DataQualityWarning', graphql_name='dataQualityWarning')
+        data_quality_warnings = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityWarning'))), graphql_name='dataQualityWarnings', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        data_quality_warnings_connection = sgqlc.types.Field('DataQualityWarningsConnection', graphql_name='dataQualityWarningsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        description = sgqlc.types.Field('String', graphql_name='description')
+        downstream_dashboards = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Dashboard'))), graphql_name='downstreamDashboards', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_dashboards_connection = sgqlc.types.Field('DashboardsConnection', graphql_name='downstreamDashboardsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='downstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='downstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='downstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='downstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='downstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='downstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Lens'))), graphql_name='downstreamLenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses_connection = sgqlc.types.Field('LensesConnection', graphql_name='downstreamLensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('MetricDefinition')), graphql_name='downstreamMetricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions_connection = sgqlc.types.Field('MetricDefinitionsConnection', graphql_name='downstreamMetricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Metric'))), graphql_name='downstreamMetrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics_connection = sgqlc.types.Field('MetricsConnection', graphql_name='downstreamMetricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_owners = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableauUser'))), graphql_name='downstreamOwners', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_owners_connection = sgqlc.types.Field('TableauUsersConnection', graphql_name='downstreamOwnersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_sheets = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Sheet'))), graphql_name='downstreamSheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='downstreamSheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='downstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='downstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='downstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='downstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='downstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='downstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Workbook'))), graphql_name='downstreamWorkbooks', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks_connection = sgqlc.types.Field('WorkbooksConnection', graphql_name='downstreamWorkbooksConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        has_active_warning = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasActiveWarning')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        is_certified = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isCertified')
+        is_controlled_permissions_enabled = sgqlc.types.Field('Boolean', graphql_name='isControlledPermissionsEnabled')
+        is_embedded = sgqlc.types.Field('Boolean', graphql_name='isEmbedded')
+        is_grouped = sgqlc.types.Field('Boolean', graphql_name='isGrouped')
+        labels = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Label'))), graphql_name='labels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        labels_connection = sgqlc.types.Field('LabelsConnection', graphql_name='labelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        luid = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='luid')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_vizportal_url_id = sgqlc.types.Field('String', graphql_name='projectVizportalUrlId')
+        referenced_by_queries = sgqlc.types.Field(sgqlc.types.list_of('CustomSQLTable'), graphql_name='referencedByQueries', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CustomSQLTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CustomSQLTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_queries_connection = sgqlc.types.Field('CustomSQLTablesConnection', graphql_name='referencedByQueriesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CustomSQLTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CustomSQLTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        tables = sgqlc.types.Field(sgqlc.types.list_of('DatabaseTable'), graphql_name='tables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='tablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        tags = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Tag'))), graphql_name='tags', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Tag_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TagSortOrder', graphql_name='orderBy', default=None)))))
+        tags_connection = sgqlc.types.Field('TagsConnection', graphql_name='tagsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Tag_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TagSortOrder', graphql_name='orderBy', default=None)))))
+        upstream_data_quality_warnings = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityWarning'))), graphql_name='upstreamDataQualityWarnings', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_data_quality_warnings_connection = sgqlc.types.Field('DataQualityWarningsConnection', graphql_name='upstreamDataQualityWarningsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Label'))), graphql_name='upstreamLabels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels_connection = sgqlc.types.Field('LabelsConnection', graphql_name='upstreamLabelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='upstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='upstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='upstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='upstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        vizportal_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vizportalId')
+    return Database
+
+
+def Datasource():
+    class Datasource(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('contains_unsupported_custom_sql', 'created_at', 'datasource_filters', 'datasource_filters_connection', 'downstream_dashboards', 'downstream_dashboards_connection', 'downstream_owners', 'downstream_owners_connection', 'downstream_sheets', 'downstream_sheets_connection', 'downstream_workbooks', 'downstream_workbooks_connection', 'extract_last_incremental_update_time', 'extract_last_refresh_time', 'extract_last_update_time', 'fields', 'fields_connection', 'has_extracts', 'has_user_reference', 'id', 'lenses', 'lenses_connection', 'name', 'updated_at', 'upstream_databases', 'upstream_databases_connection', 'upstream_tables', 'upstream_tables_connection')
+        contains_unsupported_custom_sql = sgqlc.types.Field('Boolean', graphql_name='containsUnsupportedCustomSql')
+        created_at = sgqlc.types.Field('DateTime', graphql_name='createdAt')
+        datasource_filters = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatasourceFilter'))), graphql_name='datasourceFilters', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatasourceFilter_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFilterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        datasource_filters_connection = sgqlc.types.Field('DatasourceFiltersConnection', graphql_name='datasourceFiltersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatasourceFilter_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFilterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_dashboards = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Dashboard'))), graphql_name='downstreamDashboards', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_dashboards_connection = sgqlc.types.Field('DashboardsConnection', graphql_name='downstreamDashboardsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_owners = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableauUser'))), graphql_name='downstreamOwners', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_owners_connection = sgqlc.types.Field('TableauUsersConnection', graphql_name='downstreamOwnersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_sheets = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Sheet'))), graphql_name='downstreamSheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='downstreamSheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Workbook'))), graphql_name='downstreamWorkbooks', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks_connection = sgqlc.types.Field('WorkbooksConnection', graphql_name='downstreamWorkbooksConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        extract_last_incremental_update_time = sgqlc.types.Field('DateTime', graphql_name='extractLastIncrementalUpdateTime')
+        extract_last_refresh_time = sgqlc.types.Field('DateTime', graphql_name='extractLastRefreshTime')
+        extract_last_update_time = sgqlc.types.Field('DateTime', graphql_name='extractLastUpdateTime')
+        fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Field'))), graphql_name='fields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        fields_connection = sgqlc.types.Field('FieldsConnection', graphql_name='fieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        has_extracts = sgqlc.types.Field('Boolean', graphql_name='hasExtracts')
+        has_user_reference = sgqlc.types.Field('Boolean', graphql_name='hasUserReference')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        lenses = sgqlc.types.Field(sgqlc.types.list_of('Lens'), graphql_name='lenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        lenses_connection = sgqlc.types.Field('LensesConnection', graphql_name='lensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        name = sgqlc.types.Field('String', graphql_name='name')
+        updated_at = sgqlc.types.Field('DateTime', graphql_name='updatedAt')
+        upstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return Datasource
+
+
+def Field():
+    class Field(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('datasource', 'derived_lens_fields', 'derived_lens_fields_connection', 'description', 'description_inherited', 'direct_sheets', 'direct_sheets_connection', 'downstream_columns', 'downstream_columns_connection', 'downstream_dashboards', 'downstream_dashboards_connection', 'downstream_databases', 'downstream_databases_connection', 'downstream_datasources', 'downstream_datasources_connection', 'downstream_fields', 'downstream_fields_connection', 'downstream_flows', 'downstream_flows_connection', 'downstream_lenses', 'downstream_lenses_connection', 'downstream_metric_definitions', 'downstream_metric_definitions_connection', 'downstream_metrics', 'downstream_metrics_connection', 'downstream_owners', 'downstream_owners_connection', 'downstream_sheets', 'downstream_sheets_connection', 'downstream_tables', 'downstream_tables_connection', 'downstream_virtual_connection_tables', 'downstream_virtual_connection_tables_connection', 'downstream_virtual_connections', 'downstream_virtual_connections_connection', 'downstream_workbooks', 'downstream_workbooks_connection', 'folder_name', 'fully_qualified_name', 'id', 'is_hidden', 'metric_definitions', 'metric_definitions_connection', 'name', 'referenced_by_bins', 'referenced_by_bins_connection', 'referenced_by_calculations', 'referenced_by_calculations_connection', 'referenced_by_combined_fields', 'referenced_by_combined_fields_connection', 'referenced_by_combined_sets', 'referenced_by_combined_sets_connection', 'referenced_by_fields', 'referenced_by_fields_connection', 'referenced_by_filters', 'referenced_by_filters_connection', 'referenced_by_flow_field_input_field', 'referenced_by_flow_field_input_field_connection', 'referenced_by_flow_field_output_field', 'referenced_by_flow_field_output_field_connection', 'referenced_by_groups', 'referenced_by_groups_connection', 'referenced_by_hierarchies', 'referenced_by_hierarchies_connection', 'referenced_by_remote_fields', 'referenced_by_remote_fields_connection', 'referenced_by_sets', 'referenced_by_sets_connection', 'sheets', 'sheets_connection', 'upstream_columns', 'upstream_columns_connection', 'upstream_databases', 'upstream_databases_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_fields', 'upstream_fields_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_tables', 'upstream_tables_connection', 'upstream_virtual_connection_tables', 'upstream_virtual_connection_tables_connection', 'upstream_virtual_connections', 'upstream_virtual_connections_connection')
+        datasource = sgqlc.types.Field('Datasource', graphql_name='datasource')
+        derived_lens_fields = sgqlc.types.Field(sgqlc.types.list_of('LensField'), graphql_name='derivedLensFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('LensField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        derived_lens_fields_connection = sgqlc.types.Field('LensFieldsConnection', graphql_name='derivedLensFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('LensField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        description = sgqlc.types.Field('String', graphql_name='description')
+        description_inherited = sgqlc.types.Field(sgqlc.types.list_of('InheritedStringResult'), graphql_name='descriptionInherited', args=sgqlc.types.ArgDict((('inheritance_type', sgqlc.types.Arg('InheritanceType', graphql_name='inheritanceType', default=None)), ('permission_mode', sgqlc.types.Arg('PermissionMode', graphql_name='permissionMode', default=None)))))
+        direct_sheets = sgqlc.types.Field(sgqlc.types.list_of('Sheet'), graphql_name='directSheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        direct_sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='directSheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_columns = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Column'))), graphql_name='downstreamColumns', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_columns_connection = sgqlc.types.Field('ColumnsConnection', graphql_name='downstreamColumnsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_dashboards = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Dashboard'))), graphql_name='downstreamDashboards', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_dashboards_connection = sgqlc.types.Field('DashboardsConnection', graphql_name='downstreamDashboardsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='downstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='downstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource')), graphql_name='downstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='downstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Field'))), graphql_name='downstreamFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_fields_connection = sgqlc.types.Field('FieldsConnection', graphql_name='downstreamFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='downstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='downstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('Lens')), graphql_name='downstreamLenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses_connection = sgqlc.types.Field('LensesConnection', graphql_name='downstreamLensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions = sgqlc.types.Field(sgqlc.types.list_of('MetricDefinition'), graphql_name='downstreamMetricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions_connection = sgqlc.types.Field('MetricDefinitionsConnection', graphql_name='downstreamMetricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('Metric')), graphql_name='downstreamMetrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics_connection = sgqlc.types.Field('MetricsConnection', graphql_name='downstreamMetricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_owners = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('TableauUser')), graphql_name='downstreamOwners', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_owners_connection = sgqlc.types.Field('TableauUsersConnection', graphql_name='downstreamOwnersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_sheets = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Sheet'))), graphql_name='downstreamSheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='downstreamSheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='downstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='downstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='downstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='downstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='downstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='downstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('Workbook')), graphql_name='downstreamWorkbooks', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks_connection = sgqlc.types.Field('WorkbooksConnection', graphql_name='downstreamWorkbooksConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        folder_name = sgqlc.types.Field('String', graphql_name='folderName')
+        fully_qualified_name = sgqlc.types.Field('String', graphql_name='fullyQualifiedName')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        is_hidden = sgqlc.types.Field('Boolean', graphql_name='isHidden')
+        metric_definitions = sgqlc.types.Field(sgqlc.types.list_of('MetricDefinition'), graphql_name='metricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        metric_definitions_connection = sgqlc.types.Field('MetricDefinitionsConnection', graphql_name='metricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        name = sgqlc.types.Field('String', graphql_name='name')
+        referenced_by_bins = sgqlc.types.Field(sgqlc.types.list_of('BinField'), graphql_name='referencedByBins', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('BinField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('BinFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_bins_connection = sgqlc.types.Field('BinFieldsConnection', graphql_name='referencedByBinsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('BinField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('BinFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_calculations = sgqlc.types.Field(sgqlc.types.list_of('CalculatedField'), graphql_name='referencedByCalculations', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CalculatedField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CalculatedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_calculations_connection = sgqlc.types.Field('CalculatedFieldsConnection', graphql_name='referencedByCalculationsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CalculatedField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CalculatedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_fields = sgqlc.types.Field(sgqlc.types.list_of('CombinedField'), graphql_name='referencedByCombinedFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CombinedField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CombinedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_fields_connection = sgqlc.types.Field('CombinedFieldsConnection', graphql_name='referencedByCombinedFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CombinedField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CombinedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_sets = sgqlc.types.Field(sgqlc.types.list_of('CombinedSetField'), graphql_name='referencedByCombinedSets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CombinedSetField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CombinedSetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_sets_connection = sgqlc.types.Field('CombinedSetFieldsConnection', graphql_name='referencedByCombinedSetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CombinedSetField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CombinedSetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_fields = sgqlc.types.Field(sgqlc.types.list_of('FieldReferencingField'), graphql_name='referencedByFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FieldReferencingField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldReferencingFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_fields_connection = sgqlc.types.Field('FieldReferencingFieldsConnection', graphql_name='referencedByFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FieldReferencingField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldReferencingFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_filters = sgqlc.types.Field(sgqlc.types.list_of('DatasourceFilter'), graphql_name='referencedByFilters', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatasourceFilter_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFilterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_filters_connection = sgqlc.types.Field('DatasourceFiltersConnection', graphql_name='referencedByFiltersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatasourceFilter_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFilterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_flow_field_input_field = sgqlc.types.Field(sgqlc.types.list_of('FlowFieldInputField'), graphql_name='referencedByFlowFieldInputField', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowFieldInputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldInputFieldSortOrder', graphql_name='orderBy', default=None)))))
+        referenced_by_flow_field_input_field_connection = sgqlc.types.Field('FlowFieldInputFieldsConnection', graphql_name='referencedByFlowFieldInputFieldConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowFieldInputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldInputFieldSortOrder', graphql_name='orderBy', default=None)))))
+        referenced_by_flow_field_output_field = sgqlc.types.Field(sgqlc.types.list_of('FlowFieldOutputField'), graphql_name='referencedByFlowFieldOutputField', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowFieldOutputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_flow_field_output_field_connection = sgqlc.types.Field('FlowFieldOutputFieldsConnection', graphql_name='referencedByFlowFieldOutputFieldConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowFieldOutputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_groups = sgqlc.types.Field(sgqlc.types.list_of('GroupField'), graphql_name='referencedByGroups', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('GroupField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('GroupFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_groups_connection = sgqlc.types.Field('GroupFieldsConnection', graphql_name='referencedByGroupsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('GroupField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('GroupFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_hierarchies = sgqlc.types.Field(sgqlc.types.list_of('HierarchyField'), graphql_name='referencedByHierarchies', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('HierarchyField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('HierarchyFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_hierarchies_connection = sgqlc.types.Field('HierarchyFieldsConnection', graphql_name='referencedByHierarchiesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('HierarchyField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('HierarchyFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_remote_fields = sgqlc.types.Field(sgqlc.types.list_of('DatasourceField'), graphql_name='referencedByRemoteFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatasourceField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_remote_fields_connection = sgqlc.types.Field('DatasourceFieldsConnection', graphql_name='referencedByRemoteFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatasourceField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_sets = sgqlc.types.Field(sgqlc.types.list_of('SetField'), graphql_name='referencedBySets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('SetField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_sets_connection = sgqlc.types.Field('SetFieldsConnection', graphql_name='referencedBySetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('SetField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        sheets = sgqlc.types.Field(sgqlc.types.list_of('Sheet'), graphql_name='sheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='sheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_columns = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('Column')), graphql_name='upstreamColumns', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_columns_connection = sgqlc.types.Field('ColumnsConnection', graphql_name='upstreamColumnsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('Field')), graphql_name='upstreamFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_fields_connection = sgqlc.types.Field('FieldsConnection', graphql_name='upstreamFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='upstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='upstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='upstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='upstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return Field
+
+
+def FieldReferencingField():
+    class FieldReferencingField(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('datasource', 'derived_lens_fields', 'derived_lens_fields_connection', 'direct_sheets', 'direct_sheets_connection', 'fields', 'fields_connection', 'fully_qualified_name', 'id', 'metric_definitions', 'metric_definitions_connection', 'referenced_by_bins', 'referenced_by_bins_connection', 'referenced_by_calculations', 'referenced_by_calculations_connection', 'referenced_by_combined_fields', 'referenced_by_combined_fields_connection', 'referenced_by_combined_sets', 'referenced_by_combined_sets_connection', 'referenced_by_fields', 'referenced_by_fields_connection', 'referenced_by_filters', 'referenced_by_filters_connection', 'referenced_by_flow_field_input_field', 'referenced_by_flow_field_input_field_connection', 'referenced_by_flow_field_output_field', 'referenced_by_flow_field_output_field_connection', 'referenced_by_groups', 'referenced_by_groups_connection', 'referenced_by_hierarchies', 'referenced_by_hierarchies_connection', 'referenced_by_remote_fields', 'referenced_by_remote_fields_connection', 'referenced_by_sets', 'referenced_by_sets_connection', 'sheets', 'sheets_connection', 'upstream_databases', 'upstream_databases_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_tables', 'upstream_tables_connection')
+        datasource = sgqlc.types.Field('Datasource', graphql_name='datasource')
+        derived_lens_fields = sgqlc.types.Field(sgqlc.types.list_of('LensField'), graphql_name='derivedLensFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('LensField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        derived_lens_fields_connection = sgqlc.types.Field('LensFieldsConnection', graphql_name='derivedLensFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('LensField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        direct_sheets = sgqlc.types.Field(sgqlc.types.list_of('Sheet'), graphql_name='directSheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        direct_sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='directSheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Field'))), graphql_name='fields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        fields_connection = sgqlc.types.Field('FieldsConnection', graphql_name='fieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        fully_qualified_name = sgqlc.types.Field('String', graphql_name='fullyQualifiedName')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        metric_definitions = sgqlc.types.Field(sgqlc.types.list_of('MetricDefinition'), graphql_name='metricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        metric_definitions_connection = sgqlc.types.Field('MetricDefinitionsConnection', graphql_name='metricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_bins = sgqlc.types.Field(sgqlc.types.list_of('BinField'), graphql_name='referencedByBins', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('BinField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('BinFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_bins_connection = sgqlc.types.Field('BinFieldsConnection', graphql_name='referencedByBinsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('BinField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('BinFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_calculations = sgqlc.types.Field(sgqlc.types.list_of('CalculatedField'), graphql_name='referencedByCalculations', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CalculatedField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CalculatedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_calculations_connection = sgqlc.types.Field('CalculatedFieldsConnection', graphql_name='referencedByCalculationsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CalculatedField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CalculatedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_fields = sgqlc.types.Field(sgqlc.types.list_of('CombinedField'), graphql_name='referencedByCombinedFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CombinedField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CombinedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_fields_connection = sgqlc.types.Field('CombinedFieldsConnection', graphql_name='referencedByCombinedFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CombinedField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CombinedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_sets = sgqlc.types.Field(sgqlc.types.list_of('CombinedSetField'), graphql_name='referencedByCombinedSets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CombinedSetField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CombinedSetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_combined_sets_connection = sgqlc.types.Field('CombinedSetFieldsConnection', graphql_name='referencedByCombinedSetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CombinedSetField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CombinedSetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_fields = sgqlc.types.Field(sgqlc.types.list_of('FieldReferencingField'), graphql_name='referencedByFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FieldReferencingField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldReferencingFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_fields_connection = sgqlc.types.Field('FieldReferencingFieldsConnection', graphql_name='referencedByFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FieldReferencingField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldReferencingFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_filters = sgqlc.types.Field(sgqlc.types.list_of('DatasourceFilter'), graphql_name='referencedByFilters', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatasourceFilter_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFilterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_filters_connection = sgqlc.types.Field('DatasourceFiltersConnection', graphql_name='referencedByFiltersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatasourceFilter_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFilterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_flow_field_input_field = sgqlc.types.Field(sgqlc.types.list_of('FlowFieldInputField'), graphql_name='referencedByFlowFieldInputField', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowFieldInputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldInputFieldSortOrder', graphql_name='orderBy', default=None)))))
+        referenced_by_flow_field_input_field_connection = sgqlc.types.Field('FlowFieldInputFieldsConnection', graphql_name='referencedByFlowFieldInputFieldConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowFieldInputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldInputFieldSortOrder', graphql_name='orderBy', default=None)))))
+        referenced_by_flow_field_output_field = sgqlc.types.Field(sgqlc.types.list_of('FlowFieldOutputField'), graphql_name='referencedByFlowFieldOutputField', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowFieldOutputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_flow_field_output_field_connection = sgqlc.types.Field('FlowFieldOutputFieldsConnection', graphql_name='referencedByFlowFieldOutputFieldConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowFieldOutputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_groups = sgqlc.types.Field(sgqlc.types.list_of('GroupField'), graphql_name='referencedByGroups', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('GroupField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('GroupFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_groups_connection = sgqlc.types.Field('GroupFieldsConnection', graphql_name='referencedByGroupsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('GroupField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('GroupFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_hierarchies = sgqlc.types.Field(sgqlc.types.list_of('HierarchyField'), graphql_name='referencedByHierarchies', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('HierarchyField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('HierarchyFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_hierarchies_connection = sgqlc.types.Field('HierarchyFieldsConnection', graphql_name='referencedByHierarchiesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('HierarchyField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('HierarchyFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_remote_fields = sgqlc.types.Field(sgqlc.types.list_of('DatasourceField'), graphql_name='referencedByRemoteFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatasourceField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_remote_fields_connection = sgqlc.types.Field('DatasourceFieldsConnection', graphql_name='referencedByRemoteFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatasourceField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_sets = sgqlc.types.Field(sgqlc.types.list_of('SetField'), graphql_name='referencedBySets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('SetField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_sets_connection = sgqlc.types.Field('SetFieldsConnection', graphql_name='referencedBySetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('SetField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        sheets = sgqlc.types.Field(sgqlc.types.list_of('Sheet'), graphql_name='sheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='sheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return FieldReferencingField
+
+
+def FlowInputField():
+    class FlowInputField(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('child_fields', 'child_fields_connection', 'flow', 'id', 'name', 'upstream_databases', 'upstream_databases_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_tables', 'upstream_tables_connection')
+        child_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowOutputField'))), graphql_name='childFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowOutputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        child_fields_connection = sgqlc.types.Field('FlowOutputFieldsConnection', graphql_name='childFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowOutputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flow = sgqlc.types.Field('Flow', graphql_name='flow')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        upstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return FlowInputField
+
+
+def FlowOutputField():
+    class FlowOutputField(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('downstream_dashboards', 'downstream_dashboards_connection', 'downstream_databases', 'downstream_databases_connection', 'downstream_datasources', 'downstream_datasources_connection', 'downstream_flows', 'downstream_flows_connection', 'downstream_lenses', 'downstream_lenses_connection', 'downstream_metric_definitions', 'downstream_metric_definitions_connection', 'downstream_metrics', 'downstream_metrics_connection', 'downstream_owners', 'downstream_owners_connection', 'downstream_sheets', 'downstream_sheets_connection', 'downstream_tables', 'downstream_tables_connection', 'downstream_virtual_connection_tables', 'downstream_virtual_connection_tables_connection', 'downstream_virtual_connections', 'downstream_virtual_connections_connection', 'downstream_workbooks', 'downstream_workbooks_connection', 'flow', 'flow_connection', 'flow_output_step', 'id', 'name', 'parent_fields', 'parent_fields_connection', 'upstream_databases', 'upstream_databases_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_tables', 'upstream_tables_connection', 'upstream_virtual_connection_tables', 'upstream_virtual_connection_tables_connection', 'upstream_virtual_connections', 'upstream_virtual_connections_connection')
+        downstream_dashboards = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Dashboard'))), graphql_name='downstreamDashboards', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_dashboards_connection = sgqlc.types.Field('DashboardsConnection', graphql_name='downstreamDashboardsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='downstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='downstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='downstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='downstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='downstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='downstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Lens'))), graphql_name='downstreamLenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses_connection = sgqlc.types.Field('LensesConnection', graphql_name='downstreamLensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions = sgqlc.types.Field(sgqlc.types.list_of('MetricDefinition'), graphql_name='downstreamMetricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions_connection = sgqlc.types.Field('MetricDefinitionsConnection', graphql_name='downstreamMetricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Metric'))), graphql_name='downstreamMetrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics_connection = sgqlc.types.Field('MetricsConnection', graphql_name='downstreamMetricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_owners = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableauUser'))), graphql_name='downstreamOwners', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_owners_connection = sgqlc.types.Field('TableauUsersConnection', graphql_name='downstreamOwnersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_sheets = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Sheet'))), graphql_name='downstreamSheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='downstreamSheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='downstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='downstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='downstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='downstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='downstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='downstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Workbook'))), graphql_name='downstreamWorkbooks', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks_connection = sgqlc.types.Field('WorkbooksConnection', graphql_name='downstreamWorkbooksConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flow = sgqlc.types.Field(sgqlc.types.list_of('Flow'), graphql_name='flow', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flow_connection = sgqlc.types.Field('FlowsConnection', graphql_name='flowConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flow_output_step = sgqlc.types.Field('FlowOutputStep', graphql_name='flowOutputStep')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        parent_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowInputField'))), graphql_name='parentFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowInputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowInputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        parent_fields_connection = sgqlc.types.Field('FlowInputFieldsConnection', graphql_name='parentFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowInputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowInputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='upstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='upstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='upstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='upstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return FlowOutputField
+
+
+def Label():
+    class Label(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('asset', 'author', 'author_display_name', 'category', 'created_at', 'id', 'is_active', 'is_elevated', 'luid', 'message', 'updated_at', 'value', 'vizportal_id')
+        asset = sgqlc.types.Field('CanHaveLabels', graphql_name='asset')
+        author = sgqlc.types.Field('TableauUser', graphql_name='author')
+        author_display_name = sgqlc.types.Field('String', graphql_name='authorDisplayName')
+        category = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='category')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        is_active = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isActive')
+        is_elevated = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isElevated')
+        luid = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='luid')
+        message = sgqlc.types.Field('String', graphql_name='message')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        value = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='value')
+        vizportal_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vizportalId')
+    return Label
+
+
+def Node():
+    class Node(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('id',)
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+    return Node
+
+
+def Table():
+    class Table(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('columns', 'columns_connection', 'description', 'downstream_dashboards', 'downstream_dashboards_connection', 'downstream_databases', 'downstream_databases_connection', 'downstream_datasources', 'downstream_datasources_connection', 'downstream_flows', 'downstream_flows_connection', 'downstream_lenses', 'downstream_lenses_connection', 'downstream_metrics', 'downstream_metrics_connection', 'downstream_owners', 'downstream_owners_connection', 'downstream_sheets', 'downstream_sheets_connection', 'downstream_tables', 'downstream_tables_connection', 'downstream_virtual_connection_tables', 'downstream_virtual_connection_tables_connection', 'downstream_virtual_connections', 'downstream_virtual_connections_connection', 'downstream_workbooks', 'downstream_workbooks_connection', 'id', 'is_embedded', 'name', 'upstream_databases', 'upstream_databases_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_tables', 'upstream_tables_connection', 'upstream_virtual_connection_tables', 'upstream_virtual_connection_tables_connection', 'upstream_virtual_connections', 'upstream_virtual_connections_connection')
+        columns = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Column'))), graphql_name='columns', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        columns_connection = sgqlc.types.Field('ColumnsConnection', graphql_name='columnsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        description = sgqlc.types.Field('String', graphql_name='description')
+        downstream_dashboards = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Dashboard'))), graphql_name='downstreamDashboards', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_dashboards_connection = sgqlc.types.Field('DashboardsConnection', graphql_name='downstreamDashboardsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='downstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='downstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='downstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='downstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='downstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='downstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Lens'))), graphql_name='downstreamLenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses_connection = sgqlc.types.Field('LensesConnection', graphql_name='downstreamLensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Metric'))), graphql_name='downstreamMetrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics_connection = sgqlc.types.Field('MetricsConnection', graphql_name='downstreamMetricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_owners = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableauUser'))), graphql_name='downstreamOwners', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_owners_connection = sgqlc.types.Field('TableauUsersConnection', graphql_name='downstreamOwnersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_sheets = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Sheet'))), graphql_name='downstreamSheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='downstreamSheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='downstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='downstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='downstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='downstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='downstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='downstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Workbook'))), graphql_name='downstreamWorkbooks', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks_connection = sgqlc.types.Field('WorkbooksConnection', graphql_name='downstreamWorkbooksConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        is_embedded = sgqlc.types.Field('Boolean', graphql_name='isEmbedded')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        upstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='upstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='upstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='upstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='upstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return Table
+
+
+def Taggable():
+    class Taggable(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('id', 'luid', 'name', 'tags', 'tags_connection')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        luid = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='luid')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        tags = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Tag'))), graphql_name='tags', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Tag_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TagSortOrder', graphql_name='orderBy', default=None)))))
+        tags_connection = sgqlc.types.Field('TagsConnection', graphql_name='tagsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Tag_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TagSortOrder', graphql_name='orderBy', default=None)))))
+    return Taggable
+
+
+def View():
+    class View(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('created_at', 'document_view_id', 'id', 'index', 'luid', 'name', 'path', 'referenced_by_metrics', 'referenced_by_metrics_connection', 'tags', 'tags_connection', 'updated_at', 'upstream_data_quality_warnings', 'upstream_data_quality_warnings_connection', 'upstream_labels', 'upstream_labels_connection', 'workbook')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        document_view_id = sgqlc.types.Field('String', graphql_name='documentViewId')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        index = sgqlc.types.Field('Int', graphql_name='index')
+        luid = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='luid')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        path = sgqlc.types.Field('String', graphql_name='path')
+        referenced_by_metrics = sgqlc.types.Field(sgqlc.types.list_of('Metric'), graphql_name='referencedByMetrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_metrics_connection = sgqlc.types.Field('MetricsConnection', graphql_name='referencedByMetricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        tags = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Tag'))), graphql_name='tags', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Tag_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TagSortOrder', graphql_name='orderBy', default=None)))))
+        tags_connection = sgqlc.types.Field('TagsConnection', graphql_name='tagsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Tag_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TagSortOrder', graphql_name='orderBy', default=None)))))
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        upstream_data_quality_warnings = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityWarning'))), graphql_name='upstreamDataQualityWarnings', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_data_quality_warnings_connection = sgqlc.types.Field('DataQualityWarningsConnection', graphql_name='upstreamDataQualityWarningsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Label'))), graphql_name='upstreamLabels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels_connection = sgqlc.types.Field('LabelsConnection', graphql_name='upstreamLabelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        workbook = sgqlc.types.Field('Workbook', graphql_name='workbook')
+    return View
+
+
+def Warnable():
+    class Warnable(sgqlc.types.Interface):
+        __schema__ = tableau_schema
+        __field_names__ = ('data_quality_warning', 'data_quality_warnings', 'data_quality_warnings_connection', 'has_active_warning', 'id', 'luid', 'name')
+        data_quality_warning = sgqlc.types.Field('DataQualityWarning', graphql_name='dataQualityWarning')
+        data_quality_warnings = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityWarning'))), graphql_name='dataQualityWarnings', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        data_quality_warnings_connection = sgqlc.types.Field('DataQualityWarningsConnection', graphql_name='dataQualityWarningsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        has_active_warning = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasActiveWarning')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        luid = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='luid')
+        name = sgqlc.types.Field('String', graphql_name='name')
+    return Warnable
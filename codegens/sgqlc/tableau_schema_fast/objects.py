@@ -0,0 +1,1019 @@
+# Generated by tools/sgqlc_fast_schema.py
+# Source: tableau_schema.py
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+from . import tableau_schema
+
+
+def AskDataExtension():
+    class AskDataExtension(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('dashboard', 'id', 'lens')
+        dashboard = sgqlc.types.Field('Dashboard', graphql_name='dashboard')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        lens = sgqlc.types.Field('Lens', graphql_name='lens')
+    return AskDataExtension
+
+
+def DatasourceFilter():
+    class DatasourceFilter(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('datasource', 'field', 'id')
+        datasource = sgqlc.types.Field('Datasource', graphql_name='datasource')
+        field = sgqlc.types.Field(sgqlc.types.non_null('Field'), graphql_name='field')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+    return DatasourceFilter
+
+
+def FlowOutputStep():
+    class FlowOutputStep(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('flow', 'id', 'name', 'output_fields', 'output_fields_connection', 'step_id')
+        flow = sgqlc.types.Field('Flow', graphql_name='flow')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        output_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowOutputField'))), graphql_name='outputFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowOutputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        output_fields_connection = sgqlc.types.Field('FlowOutputFieldsConnection', graphql_name='outputFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowOutputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        step_id = sgqlc.types.Field('String', graphql_name='stepId')
+    return FlowOutputStep
+
+
+def InheritedStringResult():
+    class InheritedStringResult(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('asset', 'asset_id', 'attribute', 'distance', 'edges', 'value')
+        asset = sgqlc.types.Field('Node', graphql_name='asset')
+        asset_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='assetId')
+        attribute = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='attribute')
+        distance = sgqlc.types.Field('Int', graphql_name='distance')
+        edges = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='edges')
+        value = sgqlc.types.Field('String', graphql_name='value')
+    return InheritedStringResult
+
+
+def Lens():
+    class Lens(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('ask_data_extensions', 'ask_data_extensions_connection', 'created_at', 'datasource', 'description', 'downstream_dashboards', 'downstream_dashboards_connection', 'downstream_metrics', 'downstream_metrics_connection', 'downstream_owners', 'downstream_owners_connection', 'downstream_workbooks', 'downstream_workbooks_connection', 'fields', 'fields_connection', 'id', 'luid', 'name', 'owner', 'project_vizportal_url_id', 'site', 'updated_at', 'upstream_databases', 'upstream_databases_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_fields', 'upstream_fields_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_tables', 'upstream_tables_connection', 'upstream_virtual_connection_tables', 'upstream_virtual_connection_tables_connection', 'upstream_virtual_connections', 'upstream_virtual_connections_connection', 'vizportal_url_id')
+        ask_data_extensions = sgqlc.types.Field(sgqlc.types.list_of('AskDataExtension'), graphql_name='askDataExtensions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('AskDataExtension_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('AskDataExtensionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        ask_data_extensions_connection = sgqlc.types.Field('AskDataExtensionsConnection', graphql_name='askDataExtensionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('AskDataExtension_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('AskDataExtensionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        datasource = sgqlc.types.Field(sgqlc.types.non_null('Datasource'), graphql_name='datasource')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        downstream_dashboards = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Dashboard'))), graphql_name='downstreamDashboards', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_dashboards_connection = sgqlc.types.Field('DashboardsConnection', graphql_name='downstreamDashboardsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Metric'))), graphql_name='downstreamMetrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics_connection = sgqlc.types.Field('MetricsConnection', graphql_name='downstreamMetricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_owners = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableauUser'))), graphql_name='downstreamOwners', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_owners_connection = sgqlc.types.Field('TableauUsersConnection', graphql_name='downstreamOwnersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_workbooks = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Workbook'))), graphql_name='downstreamWorkbooks', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks_connection = sgqlc.types.Field('WorkbooksConnection', graphql_name='downstreamWorkbooksConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('LensField'))), graphql_name='fields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('LensField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        fields_connection = sgqlc.types.Field('LensFieldsConnection', graphql_name='fieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('LensField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        luid = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='luid')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        owner = sgqlc.types.Field(sgqlc.types.non_null('TableauUser'), graphql_name='owner')
+        project_vizportal_url_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='projectVizportalUrlId')
+        site = sgqlc.types.Field(sgqlc.types.non_null('TableauSite'), graphql_name='site')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        upstream_databases = sgqlc.types.Field(sgqlc.types.list_of('Database'), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.list_of('PublishedDatasource'), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_fields = sgqlc.types.Field(sgqlc.types.list_of('Field'), graphql_name='upstreamFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_fields_connection = sgqlc.types.Field('FieldsConnection', graphql_name='upstreamFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.list_of('Flow'), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Table'))), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Table_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('TablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Table_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.list_of('VirtualConnectionTable'), graphql_name='upstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='upstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections = sgqlc.types.Field(sgqlc.types.list_of('VirtualConnection'), graphql_name='upstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='upstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        vizportal_url_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vizportalUrlId')
+    return Lens
+
+
+def LensField():
+    class LensField(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('containing_lens', 'datasource_field', 'description', 'id', 'name')
+        containing_lens = sgqlc.types.Field('Lens', graphql_name='containingLens')
+        datasource_field = sgqlc.types.Field(sgqlc.types.non_null('Field'), graphql_name='datasourceField')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        name = sgqlc.types.Field('String', graphql_name='name')
+    return LensField
+
+
+def LinkedFlow():
+    class LinkedFlow(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('asset', 'asset_id', 'from_edges', 'to_edges')
+        asset = sgqlc.types.Field(sgqlc.types.non_null('Flow'), graphql_name='asset')
+        asset_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='assetId')
+        from_edges = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='fromEdges')
+        to_edges = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('String')), graphql_name='toEdges')
+    return LinkedFlow
+
+
+def MetricDefinition():
+    class MetricDefinition(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('fields', 'fields_connection', 'id', 'luid', 'name', 'site', 'upstream_columns', 'upstream_columns_connection', 'upstream_databases', 'upstream_databases_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_fields', 'upstream_fields_connection', 'upstream_flow_output_fields', 'upstream_flow_output_fields_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_labels', 'upstream_labels_connection', 'upstream_tables', 'upstream_tables_connection', 'upstream_virtual_connection_tables', 'upstream_virtual_connection_tables_connection', 'upstream_virtual_connections', 'upstream_virtual_connections_connection')
+        fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Field'))), graphql_name='fields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        fields_connection = sgqlc.types.Field('FieldsConnection', graphql_name='fieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        luid = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='luid')
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        site = sgqlc.types.Field(sgqlc.types.non_null('TableauSite'), graphql_name='site')
+        upstream_columns = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Column'))), graphql_name='upstreamColumns', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_columns_connection = sgqlc.types.Field('ColumnsConnection', graphql_name='upstreamColumnsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Field'))), graphql_name='upstreamFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_fields_connection = sgqlc.types.Field('FieldsConnection', graphql_name='upstreamFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flow_output_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowOutputField'))), graphql_name='upstreamFlowOutputFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowOutputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flow_output_fields_connection = sgqlc.types.Field('FlowOutputFieldsConnection', graphql_name='upstreamFlowOutputFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowOutputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Label'))), graphql_name='upstreamLabels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels_connection = sgqlc.types.Field('LabelsConnection', graphql_name='upstreamLabelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='upstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='upstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='upstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='upstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return MetricDefinition
+
+
+def PageInfo():
+    class PageInfo(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('end_cursor', 'has_next_page')
+        end_cursor = sgqlc.types.Field('String', graphql_name='endCursor')
+        has_next_page = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='hasNextPage')
+    return PageInfo
+
+
+def Parameter():
+    class Parameter(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('datasource', 'id', 'name', 'parent_name', 'referenced_by_bins', 'referenced_by_bins_connection', 'referenced_by_calculations', 'referenced_by_calculations_connection', 'referenced_by_sets', 'referenced_by_sets_connection', 'workbook')
+        datasource = sgqlc.types.Field('PublishedDatasource', graphql_name='datasource')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        parent_name = sgqlc.types.Field('String', graphql_name='parentName')
+        referenced_by_bins = sgqlc.types.Field(sgqlc.types.list_of('BinField'), graphql_name='referencedByBins', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('BinField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('BinFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_bins_connection = sgqlc.types.Field('BinFieldsConnection', graphql_name='referencedByBinsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('BinField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('BinFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_calculations = sgqlc.types.Field(sgqlc.types.list_of('CalculatedField'), graphql_name='referencedByCalculations', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CalculatedField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CalculatedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_calculations_connection = sgqlc.types.Field('CalculatedFieldsConnection', graphql_name='referencedByCalculationsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CalculatedField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CalculatedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_sets = sgqlc.types.Field(sgqlc.types.list_of('SetField'), graphql_name='referencedBySets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('SetField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_sets_connection = sgqlc.types.Field('SetFieldsConnection', graphql_name='referencedBySetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('SetField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        workbook = sgqlc.types.Field('Workbook', graphql_name='workbook')
+    return Parameter
+
+
+def Query():
+    class Query(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('ask_data_extensions', 'ask_data_extensions_connection', 'bin_fields', 'bin_fields_connection', 'calculated_fields', 'calculated_fields_connection', 'cloud_files', 'cloud_files_connection', 'column_fields', 'column_fields_connection', 'columns', 'columns_connection', 'combined_fields', 'combined_fields_connection', 'combined_set_fields', 'combined_set_fields_connection', 'custom_sqltables', 'custom_sqltables_connection', 'dashboards', 'dashboards_connection', 'data_clouds', 'data_clouds_connection', 'data_quality_certifications', 'data_quality_certifications_connection', 'data_quality_warnings', 'data_quality_warnings_connection', 'database_servers', 'database_servers_connection', 'database_tables', 'database_tables_connection', 'databases', 'databases_connection', 'datasource_fields', 'datasource_fields_connection', 'datasource_filters', 'datasource_filters_connection', 'datasources', 'datasources_connection', 'embedded_datasources', 'embedded_datasources_connection', 'fields', 'fields_connection', 'files', 'files_connection', 'flow_column_input_fields', 'flow_column_input_fields_connection', 'flow_column_output_fields', 'flow_column_output_fields_connection', 'flow_field_input_fields', 'flow_field_input_fields_connection', 'flow_field_output_fields', 'flow_field_output_fields_connection', 'flow_output_steps', 'flow_output_steps_connection', 'flows', 'flows_connection', 'generic_labels', 'generic_labels_connection', 'group_fields', 'group_fields_connection', 'hierarchy_fields', 'hierarchy_fields_connection', 'lens_fields', 'lens_fields_connection', 'lenses', 'lenses_connection', 'metric_definitions', 'metric_definitions_connection', 'metrics', 'metrics_connection', 'parameters', 'parameters_connection', 'published_datasources', 'published_datasources_connection', 'set_fields', 'set_fields_connection', 'sheets', 'sheets_connection', 'table_additional_detailses', 'table_additional_detailses_connection', 'tableau_sites', 'tableau_sites_connection', 'tableau_users', 'tableau_users_connection', 'tables', 'tables_connection', 'tags', 'tags_connection', 'views', 'views_connection', 'virtual_connection_tables', 'virtual_connection_tables_connection', 'virtual_connections', 'virtual_connections_connection', 'web_data_connectors', 'web_data_connectors_connection', 'workbooks', 'workbooks_connection')
+        ask_data_extensions = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('AskDataExtension'))), graphql_name='askDataExtensions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('AskDataExtension_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('AskDataExtensionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        ask_data_extensions_connection = sgqlc.types.Field(sgqlc.types.non_null('AskDataExtensionsConnection'), graphql_name='askDataExtensionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('AskDataExtension_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('AskDataExtensionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        bin_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('BinField'))), graphql_name='binFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('BinField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('BinFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        bin_fields_connection = sgqlc.types.Field(sgqlc.types.non_null('BinFieldsConnection'), graphql_name='binFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('BinField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('BinFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        calculated_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('CalculatedField'))), graphql_name='calculatedFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CalculatedField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CalculatedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        calculated_fields_connection = sgqlc.types.Field(sgqlc.types.non_null('CalculatedFieldsConnection'), graphql_name='calculatedFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CalculatedField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CalculatedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        cloud_files = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('CloudFile'))), graphql_name='cloudFiles', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CloudFile_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CloudFileSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        cloud_files_connection = sgqlc.types.Field(sgqlc.types.non_null('CloudFilesConnection'), graphql_name='cloudFilesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CloudFile_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CloudFileSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        column_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('ColumnField'))), graphql_name='columnFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('ColumnField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        column_fields_connection = sgqlc.types.Field(sgqlc.types.non_null('ColumnFieldsConnection'), graphql_name='columnFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('ColumnField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        columns = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Column'))), graphql_name='columns', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        columns_connection = sgqlc.types.Field(sgqlc.types.non_null('ColumnsConnection'), graphql_name='columnsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        combined_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('CombinedField'))), graphql_name='combinedFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CombinedField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CombinedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        combined_fields_connection = sgqlc.types.Field(sgqlc.types.non_null('CombinedFieldsConnection'), graphql_name='combinedFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CombinedField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CombinedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        combined_set_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('CombinedSetField'))), graphql_name='combinedSetFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CombinedSetField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CombinedSetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        combined_set_fields_connection = sgqlc.types.Field(sgqlc.types.non_null('CombinedSetFieldsConnection'), graphql_name='combinedSetFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CombinedSetField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CombinedSetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        custom_sqltables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('CustomSQLTable'))), graphql_name='customSQLTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CustomSQLTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CustomSQLTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        custom_sqltables_connection = sgqlc.types.Field(sgqlc.types.non_null('CustomSQLTablesConnection'), graphql_name='customSQLTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CustomSQLTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CustomSQLTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        dashboards = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Dashboard'))), graphql_name='dashboards', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        dashboards_connection = sgqlc.types.Field(sgqlc.types.non_null('DashboardsConnection'), graphql_name='dashboardsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        data_clouds = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataCloud'))), graphql_name='dataClouds', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataCloud_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataCloudSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        data_clouds_connection = sgqlc.types.Field(sgqlc.types.non_null('DataCloudsConnection'), graphql_name='dataCloudsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataCloud_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataCloudSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        data_quality_certifications = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityCertification'))), graphql_name='dataQualityCertifications', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityCertification_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityCertificationSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        data_quality_certifications_connection = sgqlc.types.Field(sgqlc.types.non_null('DataQualityCertificationsConnection'), graphql_name='dataQualityCertificationsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityCertification_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityCertificationSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        data_quality_warnings = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityWarning'))), graphql_name='dataQualityWarnings', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        data_quality_warnings_connection = sgqlc.types.Field(sgqlc.types.non_null('DataQualityWarningsConnection'), graphql_name='dataQualityWarningsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        database_servers = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseServer'))), graphql_name='databaseServers', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseServer_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseServerSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        database_servers_connection = sgqlc.types.Field(sgqlc.types.non_null('DatabaseServersConnection'), graphql_name='databaseServersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseServer_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseServerSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        database_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='databaseTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        database_tables_connection = sgqlc.types.Field(sgqlc.types.non_null('DatabaseTablesConnection'), graphql_name='databaseTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='databases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        databases_connection = sgqlc.types.Field(sgqlc.types.non_null('DatabasesConnection'), graphql_name='databasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        datasource_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatasourceField'))), graphql_name='datasourceFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatasourceField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        datasource_fields_connection = sgqlc.types.Field(sgqlc.types.non_null('DatasourceFieldsConnection'), graphql_name='datasourceFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatasourceField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        datasource_filters = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatasourceFilter'))), graphql_name='datasourceFilters', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatasourceFilter_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFilterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        datasource_filters_connection = sgqlc.types.Field(sgqlc.types.non_null('DatasourceFiltersConnection'), graphql_name='datasourceFiltersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatasourceFilter_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatasourceFilterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Datasource'))), graphql_name='datasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Datasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        datasources_connection = sgqlc.types.Field(sgqlc.types.non_null('DatasourcesConnection'), graphql_name='datasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Datasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        embedded_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('EmbeddedDatasource'))), graphql_name='embeddedDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('EmbeddedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('EmbeddedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        embedded_datasources_connection = sgqlc.types.Field(sgqlc.types.non_null('EmbeddedDatasourcesConnection'), graphql_name='embeddedDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('EmbeddedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('EmbeddedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Field'))), graphql_name='fields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        fields_connection = sgqlc.types.Field(sgqlc.types.non_null('FieldsConnection'), graphql_name='fieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        files = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('File'))), graphql_name='files', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('File_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FileSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        files_connection = sgqlc.types.Field(sgqlc.types.non_null('FilesConnection'), graphql_name='filesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('File_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FileSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flow_column_input_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowColumnInputField'))), graphql_name='flowColumnInputFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowColumnInputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowColumnInputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flow_column_input_fields_connection = sgqlc.types.Field(sgqlc.types.non_null('FlowColumnInputFieldsConnection'), graphql_name='flowColumnInputFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowColumnInputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowColumnInputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flow_column_output_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowColumnOutputField'))), graphql_name='flowColumnOutputFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowColumnOutputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowColumnOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flow_column_output_fields_connection = sgqlc.types.Field(sgqlc.types.non_null('FlowColumnOutputFieldsConnection'), graphql_name='flowColumnOutputFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowColumnOutputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowColumnOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flow_field_input_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowFieldInputField'))), graphql_name='flowFieldInputFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowFieldInputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldInputFieldSortOrder', graphql_name='orderBy', default=None)))))
+        flow_field_input_fields_connection = sgqlc.types.Field(sgqlc.types.non_null('FlowFieldInputFieldsConnection'), graphql_name='flowFieldInputFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowFieldInputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldInputFieldSortOrder', graphql_name='orderBy', default=None)))))
+        flow_field_output_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowFieldOutputField'))), graphql_name='flowFieldOutputFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowFieldOutputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flow_field_output_fields_connection = sgqlc.types.Field(sgqlc.types.non_null('FlowFieldOutputFieldsConnection'), graphql_name='flowFieldOutputFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowFieldOutputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flow_output_steps = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowOutputStep'))), graphql_name='flowOutputSteps', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowOutputStep_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowOutputStepSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flow_output_steps_connection = sgqlc.types.Field(sgqlc.types.non_null('FlowOutputStepsConnection'), graphql_name='flowOutputStepsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowOutputStep_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowOutputStepSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='flows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flows_connection = sgqlc.types.Field(sgqlc.types.non_null('FlowsConnection'), graphql_name='flowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        generic_labels = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('GenericLabel'))), graphql_name='genericLabels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('GenericLabel_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('GenericLabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        generic_labels_connection = sgqlc.types.Field(sgqlc.types.non_null('GenericLabelsConnection'), graphql_name='genericLabelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('GenericLabel_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('GenericLabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        group_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('GroupField'))), graphql_name='groupFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('GroupField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('GroupFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        group_fields_connection = sgqlc.types.Field(sgqlc.types.non_null('GroupFieldsConnection'), graphql_name='groupFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('GroupField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('GroupFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        hierarchy_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('HierarchyField'))), graphql_name='hierarchyFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('HierarchyField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('HierarchyFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        hierarchy_fields_connection = sgqlc.types.Field(sgqlc.types.non_null('HierarchyFieldsConnection'), graphql_name='hierarchyFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('HierarchyField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('HierarchyFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        lens_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('LensField'))), graphql_name='lensFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('LensField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        lens_fields_connection = sgqlc.types.Field(sgqlc.types.non_null('LensFieldsConnection'), graphql_name='lensFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('LensField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        lenses = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Lens'))), graphql_name='lenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        lenses_connection = sgqlc.types.Field(sgqlc.types.non_null('LensesConnection'), graphql_name='lensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        metric_definitions = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('MetricDefinition'))), graphql_name='metricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        metric_definitions_connection = sgqlc.types.Field(sgqlc.types.non_null('MetricDefinitionsConnection'), graphql_name='metricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        metrics = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Metric'))), graphql_name='metrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        metrics_connection = sgqlc.types.Field(sgqlc.types.non_null('MetricsConnection'), graphql_name='metricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        parameters = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Parameter'))), graphql_name='parameters', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Parameter_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ParameterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        parameters_connection = sgqlc.types.Field(sgqlc.types.non_null('ParametersConnection'), graphql_name='parametersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Parameter_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ParameterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        published_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='publishedDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        published_datasources_connection = sgqlc.types.Field(sgqlc.types.non_null('PublishedDatasourcesConnection'), graphql_name='publishedDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        set_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('SetField'))), graphql_name='setFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('SetField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        set_fields_connection = sgqlc.types.Field(sgqlc.types.non_null('SetFieldsConnection'), graphql_name='setFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('SetField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SetFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        sheets = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Sheet'))), graphql_name='sheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        sheets_connection = sgqlc.types.Field(sgqlc.types.non_null('SheetsConnection'), graphql_name='sheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        table_additional_detailses = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableAdditionalDetails'))), graphql_name='tableAdditionalDetailses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('TableAdditionalDetails_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableAdditionalDetailsSortOrder', graphql_name='orderBy', default=None)))))
+        table_additional_detailses_connection = sgqlc.types.Field(sgqlc.types.non_null('TableAdditionalDetailsesConnection'), graphql_name='tableAdditionalDetailsesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('TableAdditionalDetails_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableAdditionalDetailsSortOrder', graphql_name='orderBy', default=None)))))
+        tableau_sites = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableauSite'))), graphql_name='tableauSites', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('TableauSite_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableauSiteSortOrder', graphql_name='orderBy', default=None)))))
+        tableau_sites_connection = sgqlc.types.Field(sgqlc.types.non_null('TableauSitesConnection'), graphql_name='tableauSitesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('TableauSite_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableauSiteSortOrder', graphql_name='orderBy', default=None)))))
+        tableau_users = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableauUser'))), graphql_name='tableauUsers', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        tableau_users_connection = sgqlc.types.Field(sgqlc.types.non_null('TableauUsersConnection'), graphql_name='tableauUsersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Table'))), graphql_name='tables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Table_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        tables_connection = sgqlc.types.Field(sgqlc.types.non_null('TablesConnection'), graphql_name='tablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Table_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        tags = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Tag'))), graphql_name='tags', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Tag_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TagSortOrder', graphql_name='orderBy', default=None)))))
+        tags_connection = sgqlc.types.Field(sgqlc.types.non_null('TagsConnection'), graphql_name='tagsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Tag_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TagSortOrder', graphql_name='orderBy', default=None)))))
+        views = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('View'))), graphql_name='views', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('View_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ViewSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        views_connection = sgqlc.types.Field(sgqlc.types.non_null('ViewsConnection'), graphql_name='viewsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('View_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ViewSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='virtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        virtual_connection_tables_connection = sgqlc.types.Field(sgqlc.types.non_null('VirtualConnectionTablesConnection'), graphql_name='virtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='virtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        virtual_connections_connection = sgqlc.types.Field(sgqlc.types.non_null('VirtualConnectionsConnection'), graphql_name='virtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        web_data_connectors = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('WebDataConnector'))), graphql_name='webDataConnectors', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('WebDataConnector_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WebDataConnectorSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        web_data_connectors_connection = sgqlc.types.Field(sgqlc.types.non_null('WebDataConnectorsConnection'), graphql_name='webDataConnectorsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('WebDataConnector_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WebDataConnectorSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        workbooks = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Workbook'))), graphql_name='workbooks', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        workbooks_connection = sgqlc.types.Field(sgqlc.types.non_null('WorkbooksConnection'), graphql_name='workbooksConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return Query
+
+
+def TableAdditionalDetails():
+    class TableAdditionalDetails(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('category', 'cdp_internal_id', 'created_by', 'data_cloud_api_name', 'id', 'table', 'table_connection')
+        category = sgqlc.types.Field('String', graphql_name='category')
+        cdp_internal_id = sgqlc.types.Field('String', graphql_name='cdpInternalId')
+        created_by = sgqlc.types.Field('String', graphql_name='createdBy')
+        data_cloud_api_name = sgqlc.types.Field('String', graphql_name='dataCloudApiName')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        table = sgqlc.types.Field(sgqlc.types.list_of('DatabaseTable'), graphql_name='table', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        table_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='tableConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return TableAdditionalDetails
+
+
+def TableauSite():
+    class TableauSite(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('created_at', 'flows', 'flows_connection', 'id', 'lenses', 'lenses_connection', 'luid', 'metric_definitions', 'metric_definitions_connection', 'metrics', 'metrics_connection', 'name', 'published_datasources', 'published_datasources_connection', 'uri', 'virtual_connections', 'virtual_connections_connection', 'workbooks', 'workbooks_connection')
+        created_at = sgqlc.types.Field('DateTime', graphql_name='createdAt')
+        flows = sgqlc.types.Field(sgqlc.types.list_of('Flow'), graphql_name='flows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='flowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        lenses = sgqlc.types.Field(sgqlc.types.list_of('Lens'), graphql_name='lenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        lenses_connection = sgqlc.types.Field('LensesConnection', graphql_name='lensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        luid = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='luid')
+        metric_definitions = sgqlc.types.Field(sgqlc.types.list_of('MetricDefinition'), graphql_name='metricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        metric_definitions_connection = sgqlc.types.Field('MetricDefinitionsConnection', graphql_name='metricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        metrics = sgqlc.types.Field(sgqlc.types.list_of('Metric'), graphql_name='metrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        metrics_connection = sgqlc.types.Field('MetricsConnection', graphql_name='metricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        name = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='name')
+        published_datasources = sgqlc.types.Field(sgqlc.types.list_of('PublishedDatasource'), graphql_name='publishedDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        published_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='publishedDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        uri = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='uri')
+        virtual_connections = sgqlc.types.Field(sgqlc.types.list_of('VirtualConnection'), graphql_name='virtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='virtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        workbooks = sgqlc.types.Field(sgqlc.types.list_of('Workbook'), graphql_name='workbooks', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        workbooks_connection = sgqlc.types.Field('WorkbooksConnection', graphql_name='workbooksConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return TableauSite
+
+
+def TableauUser():
+    class TableauUser(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('authored_data_quality_certifications', 'authored_data_quality_certifications_connection', 'authored_data_quality_warnings', 'authored_data_quality_warnings_connection', 'authored_labels', 'authored_labels_connection', 'certified_databases', 'certified_databases_connection', 'certified_datasources', 'certified_datasources_connection', 'certified_tables', 'certified_tables_connection', 'contact_for_databases', 'contact_for_databases_connection', 'contact_for_tables', 'contact_for_tables_connection', 'domain', 'email', 'id', 'luid', 'name', 'owned_datasources', 'owned_datasources_connection', 'owned_flows', 'owned_flows_connection', 'owned_lenses', 'owned_lenses_connection', 'owned_metrics', 'owned_metrics_connection', 'owned_virtual_connection_tables', 'owned_virtual_connection_tables_connection', 'owned_virtual_connections', 'owned_virtual_connections_connection', 'owned_workbooks', 'owned_workbooks_connection', 'uri', 'username', 'vizportal_id')
+        authored_data_quality_certifications = sgqlc.types.Field(sgqlc.types.list_of('DataQualityCertification'), graphql_name='authoredDataQualityCertifications', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityCertification_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityCertificationSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        authored_data_quality_certifications_connection = sgqlc.types.Field('DataQualityCertificationsConnection', graphql_name='authoredDataQualityCertificationsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityCertification_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityCertificationSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        authored_data_quality_warnings = sgqlc.types.Field(sgqlc.types.list_of('DataQualityWarning'), graphql_name='authoredDataQualityWarnings', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        authored_data_quality_warnings_connection = sgqlc.types.Field('DataQualityWarningsConnection', graphql_name='authoredDataQualityWarningsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        authored_labels = sgqlc.types.Field(sgqlc.types.list_of('Label'), graphql_name='authoredLabels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        authored_labels_connection = sgqlc.types.Field('LabelsConnection', graphql_name='authoredLabelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        certified_databases = sgqlc.types.Field(sgqlc.types.list_of('Database'), graphql_name='certifiedDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        certified_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='certifiedDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        certified_datasources = sgqlc.types.Field(sgqlc.types.list_of('PublishedDatasource'), graphql_name='certifiedDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        certified_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='certifiedDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        certified_tables = sgqlc.types.Field(sgqlc.types.list_of('DatabaseTable'), graphql_name='certifiedTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        certified_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='certifiedTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        contact_for_databases = sgqlc.types.Field(sgqlc.types.list_of('Database'), graphql_name='contactForDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        contact_for_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='contactForDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        contact_for_tables = sgqlc.types.Field(sgqlc.types.list_of('DatabaseTable'), graphql_name='contactForTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        contact_for_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='contactForTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        domain = sgqlc.types.Field('String', graphql_name='domain')
+        email = sgqlc.types.Field('String', graphql_name='email')
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        luid = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='luid')
+        name = sgqlc.types.Field('String', graphql_name='name')
+        owned_datasources = sgqlc.types.Field(sgqlc.types.list_of('PublishedDatasource'), graphql_name='ownedDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owned_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='ownedDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owned_flows = sgqlc.types.Field(sgqlc.types.list_of('Flow'), graphql_name='ownedFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owned_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='ownedFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owned_lenses = sgqlc.types.Field(sgqlc.types.list_of('Lens'), graphql_name='ownedLenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owned_lenses_connection = sgqlc.types.Field('LensesConnection', graphql_name='ownedLensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owned_metrics = sgqlc.types.Field(sgqlc.types.list_of('Metric'), graphql_name='ownedMetrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owned_metrics_connection = sgqlc.types.Field('MetricsConnection', graphql_name='ownedMetricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owned_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.list_of('VirtualConnectionTable'), graphql_name='ownedVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owned_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='ownedVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owned_virtual_connections = sgqlc.types.Field(sgqlc.types.list_of('VirtualConnection'), graphql_name='ownedVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owned_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='ownedVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owned_workbooks = sgqlc.types.Field(sgqlc.types.list_of('Workbook'), graphql_name='ownedWorkbooks', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owned_workbooks_connection = sgqlc.types.Field('WorkbooksConnection', graphql_name='ownedWorkbooksConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        uri = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='uri')
+        username = sgqlc.types.Field('String', graphql_name='username')
+        vizportal_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vizportalId')
+    return TableauUser
+
+
+def Tag():
+    class Tag(sgqlc.types.Type):
+        __schema__ = tableau_schema
+        __field_names__ = ('assets', 'assets_connection', 'columns', 'columns_connection', 'database_tables', 'database_tables_connection', 'databases', 'databases_connection', 'flows', 'flows_connection', 'id', 'metrics', 'metrics_connection', 'name', 'published_datasources', 'published_datasources_connection', 'views', 'views_connection', 'virtual_connection_tables', 'virtual_connection_tables_connection', 'virtual_connections', 'virtual_connections_connection', 'workbooks', 'workbooks_connection')
+        assets = sgqlc.types.Field(sgqlc.types.list_of('Taggable'), graphql_name='assets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Taggable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TaggableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        assets_connection = sgqlc.types.Field('TaggablesConnection', graphql_name='assetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Taggable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TaggableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        columns = sgqlc.types.Field(sgqlc.types.list_of('Column'), graphql_name='columns', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        columns_connection = sgqlc.types.Field('ColumnsConnection', graphql_name='columnsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        database_tables = sgqlc.types.Field(sgqlc.types.list_of('DatabaseTable'), graphql_name='databaseTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        database_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='databaseTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        databases = sgqlc.types.Field(sgqlc.types.list_of('Database'), graphql_name='databases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='databasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flows = sgqlc.types.Field(sgqlc.types.list_of('Flow'), graphql_name='flows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='flowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        id = sgqlc.types.Field(sgqlc.types.non_null('ID'), graphql_name='id')
+        metrics = sgqlc.types.Field(sgqlc.types.list_of('Metric'), graphql_name='metrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        metrics_connection = sgqlc.types.Field('MetricsConnection', graphql_name='metricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        name = sgqlc.types.Field('String', graphql_name='name')
+        published_datasources = sgqlc.types.Field(sgqlc.types.list_of('PublishedDatasource'), graphql_name='publishedDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        published_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='publishedDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        views = sgqlc.types.Field(sgqlc.types.list_of('View'), graphql_name='views', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('View_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ViewSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        views_connection = sgqlc.types.Field('ViewsConnection', graphql_name='viewsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('View_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ViewSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        virtual_connection_tables = sgqlc.types.Field(sgqlc.types.list_of('VirtualConnectionTable'), graphql_name='virtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='virtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        virtual_connections = sgqlc.types.Field(sgqlc.types.list_of('VirtualConnection'), graphql_name='virtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='virtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        workbooks = sgqlc.types.Field(sgqlc.types.list_of('Workbook'), graphql_name='workbooks', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        workbooks_connection = sgqlc.types.Field('WorkbooksConnection', graphql_name='workbooksConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return Tag
+
+
+def BinField():
+    class BinField(sgqlc.types.Type, tableau_schema.DataField, tableau_schema.Field, tableau_schema.FieldReferencingField, tableau_schema.Node):
+        __schema__ = tableau_schema
+        __field_names__ = ('bin_size', 'formula', 'parameters', 'parameters_connection')
+        bin_size = sgqlc.types.Field('String', graphql_name='binSize')
+        formula = sgqlc.types.Field('String', graphql_name='formula')
+        parameters = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Parameter'))), graphql_name='parameters', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Parameter_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ParameterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        parameters_connection = sgqlc.types.Field('ParametersConnection', graphql_name='parametersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Parameter_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ParameterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return BinField
+
+
+def CalculatedField():
+    class CalculatedField(sgqlc.types.Type, tableau_schema.AnalyticsField, tableau_schema.DataField, tableau_schema.Field, tableau_schema.FieldReferencingField, tableau_schema.Node):
+        __schema__ = tableau_schema
+        __field_names__ = ('formula', 'has_user_reference', 'is_auto_generated', 'parameters', 'parameters_connection', 'sheet')
+        formula = sgqlc.types.Field('String', graphql_name='formula')
+        has_user_reference = sgqlc.types.Field('Boolean', graphql_name='hasUserReference')
+        is_auto_generated = sgqlc.types.Field('Boolean', graphql_name='isAutoGenerated')
+        parameters = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Parameter'))), graphql_name='parameters', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Parameter_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ParameterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        parameters_connection = sgqlc.types.Field('ParametersConnection', graphql_name='parametersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Parameter_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ParameterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        sheet = sgqlc.types.Field('Sheet', graphql_name='sheet')
+    return CalculatedField
+
+
+def CloudFile():
+    class CloudFile(sgqlc.types.Type, tableau_schema.CanHaveLabels, tableau_schema.Certifiable, tableau_schema.Database, tableau_schema.Taggable, tableau_schema.Warnable):
+        __schema__ = tableau_schema
+        __field_names__ = ('file_extension', 'file_id', 'mime_type', 'provider', 'request_url')
+        file_extension = sgqlc.types.Field('String', graphql_name='fileExtension')
+        file_id = sgqlc.types.Field('String', graphql_name='fileId')
+        mime_type = sgqlc.types.Field('String', graphql_name='mimeType')
+        provider = sgqlc.types.Field('String', graphql_name='provider')
+        request_url = sgqlc.types.Field('String', graphql_name='requestUrl')
+    return CloudFile
+
+
+def Column():
+    class Column(sgqlc.types.Type, tableau_schema.CanHaveLabels, tableau_schema.Node, tableau_schema.Taggable, tableau_schema.Warnable):
+        __schema__ = tableau_schema
+        __field_names__ = ('description', 'description_inherited', 'display_name', 'downstream_columns', 'downstream_columns_connection', 'downstream_dashboards', 'downstream_dashboards_connection', 'downstream_databases', 'downstream_databases_connection', 'downstream_datasources', 'downstream_datasources_connection', 'downstream_fields', 'downstream_fields_connection', 'downstream_flows', 'downstream_flows_connection', 'downstream_lenses', 'downstream_lenses_connection', 'downstream_metric_definitions', 'downstream_metric_definitions_connection', 'downstream_metrics', 'downstream_metrics_connection', 'downstream_owners', 'downstream_owners_connection', 'downstream_sheets', 'downstream_sheets_connection', 'downstream_tables', 'downstream_tables_connection', 'downstream_virtual_connection_tables', 'downstream_virtual_connection_tables_connection', 'downstream_virtual_connections', 'downstream_virtual_connections_connection', 'downstream_workbooks', 'downstream_workbooks_connection', 'is_nullable', 'referenced_by_fields', 'referenced_by_fields_connection', 'referenced_by_flow_column_input_field', 'referenced_by_flow_column_input_field_connection', 'referenced_by_flow_column_output_field', 'referenced_by_flow_column_output_field_connection', 'referenced_by_remote_column', 'referenced_by_remote_column_connection', 'remote_column', 'remote_type', 'table', 'upstream_columns', 'upstream_columns_connection', 'upstream_databases', 'upstream_databases_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_fields', 'upstream_fields_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_tables', 'upstream_tables_connection', 'upstream_virtual_connection_tables', 'upstream_virtual_connection_tables_connection', 'upstream_virtual_connections', 'upstream_virtual_connections_connection', 'vizportal_id')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        description_inherited = sgqlc.types.Field(sgqlc.types.list_of('InheritedStringResult'), graphql_name='descriptionInherited', args=sgqlc.types.ArgDict((('inheritance_type', sgqlc.types.Arg('InheritanceType', graphql_name='inheritanceType', default=None)), ('permission_mode', sgqlc.types.Arg('PermissionMode', graphql_name='permissionMode', default=None)))))
+        display_name = sgqlc.types.Field('String', graphql_name='displayName')
+        downstream_columns = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Column'))), graphql_name='downstreamColumns', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_columns_connection = sgqlc.types.Field('ColumnsConnection', graphql_name='downstreamColumnsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_dashboards = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Dashboard'))), graphql_name='downstreamDashboards', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_dashboards_connection = sgqlc.types.Field('DashboardsConnection', graphql_name='downstreamDashboardsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='downstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='downstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='downstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='downstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Field'))), graphql_name='downstreamFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_fields_connection = sgqlc.types.Field('FieldsConnection', graphql_name='downstreamFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='downstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='downstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Lens'))), graphql_name='downstreamLenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses_connection = sgqlc.types.Field('LensesConnection', graphql_name='downstreamLensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions = sgqlc.types.Field(sgqlc.types.list_of('MetricDefinition'), graphql_name='downstreamMetricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions_connection = sgqlc.types.Field('MetricDefinitionsConnection', graphql_name='downstreamMetricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Metric'))), graphql_name='downstreamMetrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics_connection = sgqlc.types.Field('MetricsConnection', graphql_name='downstreamMetricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_owners = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableauUser'))), graphql_name='downstreamOwners', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_owners_connection = sgqlc.types.Field('TableauUsersConnection', graphql_name='downstreamOwnersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_sheets = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Sheet'))), graphql_name='downstreamSheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='downstreamSheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='downstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='downstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='downstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='downstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='downstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='downstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Workbook'))), graphql_name='downstreamWorkbooks', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks_connection = sgqlc.types.Field('WorkbooksConnection', graphql_name='downstreamWorkbooksConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        is_nullable = sgqlc.types.Field('Boolean', graphql_name='isNullable')
+        referenced_by_fields = sgqlc.types.Field(sgqlc.types.list_of('ColumnField'), graphql_name='referencedByFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('ColumnField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_fields_connection = sgqlc.types.Field('ColumnFieldsConnection', graphql_name='referencedByFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('ColumnField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_flow_column_input_field = sgqlc.types.Field(sgqlc.types.list_of('FlowColumnInputField'), graphql_name='referencedByFlowColumnInputField', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowColumnInputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowColumnInputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_flow_column_input_field_connection = sgqlc.types.Field('FlowColumnInputFieldsConnection', graphql_name='referencedByFlowColumnInputFieldConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowColumnInputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowColumnInputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_flow_column_output_field = sgqlc.types.Field(sgqlc.types.list_of('FlowColumnOutputField'), graphql_name='referencedByFlowColumnOutputField', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowColumnOutputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowColumnOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_flow_column_output_field_connection = sgqlc.types.Field('FlowColumnOutputFieldsConnection', graphql_name='referencedByFlowColumnOutputFieldConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowColumnOutputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowColumnOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_remote_column = sgqlc.types.Field(sgqlc.types.list_of('Column'), graphql_name='referencedByRemoteColumn', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_remote_column_connection = sgqlc.types.Field('ColumnsConnection', graphql_name='referencedByRemoteColumnConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        remote_column = sgqlc.types.Field('Column', graphql_name='remoteColumn')
+        remote_type = sgqlc.types.Field(sgqlc.types.non_null('RemoteType'), graphql_name='remoteType')
+        table = sgqlc.types.Field('Table', graphql_name='table')
+        upstream_columns = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('Column')), graphql_name='upstreamColumns', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_columns_connection = sgqlc.types.Field('ColumnsConnection', graphql_name='upstreamColumnsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('Field')), graphql_name='upstreamFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_fields_connection = sgqlc.types.Field('FieldsConnection', graphql_name='upstreamFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='upstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='upstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='upstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='upstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        vizportal_id = sgqlc.types.Field('String', graphql_name='vizportalId')
+    return Column
+
+
+def ColumnField():
+    class ColumnField(sgqlc.types.Type, tableau_schema.AnalyticsField, tableau_schema.DataField, tableau_schema.Field, tableau_schema.Node):
+        __schema__ = tableau_schema
+        __field_names__ = ('columns', 'columns_connection')
+        columns = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Column'))), graphql_name='columns', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        columns_connection = sgqlc.types.Field('ColumnsConnection', graphql_name='columnsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return ColumnField
+
+
+def CombinedField():
+    class CombinedField(sgqlc.types.Type, tableau_schema.Field, tableau_schema.FieldReferencingField, tableau_schema.Node):
+        __schema__ = tableau_schema
+        __field_names__ = ()
+    return CombinedField
+
+
+def CombinedSetField():
+    class CombinedSetField(sgqlc.types.Type, tableau_schema.Field, tableau_schema.FieldReferencingField, tableau_schema.Node):
+        __schema__ = tableau_schema
+        __field_names__ = ('combination_type', 'delimiter')
+        combination_type = sgqlc.types.Field('String', graphql_name='combinationType')
+        delimiter = sgqlc.types.Field('String', graphql_name='delimiter')
+    return CombinedSetField
+
+
+def CustomSQLTable():
+    class CustomSQLTable(sgqlc.types.Type, tableau_schema.Table):
+        __schema__ = tableau_schema
+        __field_names__ = ('connection_type', 'database', 'is_unsupported_custom_sql', 'query', 'tables', 'tables_connection')
+        connection_type = sgqlc.types.Field('String', graphql_name='connectionType')
+        database = sgqlc.types.Field('Database', graphql_name='database')
+        is_unsupported_custom_sql = sgqlc.types.Field('Boolean', graphql_name='isUnsupportedCustomSql')
+        query = sgqlc.types.Field('String', graphql_name='query')
+        tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='tables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='tablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return CustomSQLTable
+
+
+def Dashboard():
+    class Dashboard(sgqlc.types.Type, tableau_schema.Taggable, tableau_schema.View):
+        __schema__ = tableau_schema
+        __field_names__ = ('ask_data_extensions', 'ask_data_extensions_connection', 'sheets', 'sheets_connection', 'upstream_columns', 'upstream_columns_connection', 'upstream_databases', 'upstream_databases_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_fields', 'upstream_fields_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_lenses', 'upstream_lenses_connection', 'upstream_sheet_field_instances', 'upstream_sheet_field_instances_connection', 'upstream_tables', 'upstream_tables_connection')
+        ask_data_extensions = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('AskDataExtension'))), graphql_name='askDataExtensions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('AskDataExtension_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('AskDataExtensionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        ask_data_extensions_connection = sgqlc.types.Field('AskDataExtensionsConnection', graphql_name='askDataExtensionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('AskDataExtension_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('AskDataExtensionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        sheets = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Sheet'))), graphql_name='sheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='sheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_columns = sgqlc.types.Field(sgqlc.types.list_of('Column'), graphql_name='upstreamColumns', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_columns_connection = sgqlc.types.Field('ColumnsConnection', graphql_name='upstreamColumnsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases = sgqlc.types.Field(sgqlc.types.list_of('Database'), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.list_of('Datasource'), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Datasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('DatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Datasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_fields = sgqlc.types.Field(sgqlc.types.list_of('Field'), graphql_name='upstreamFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_fields_connection = sgqlc.types.Field('FieldsConnection', graphql_name='upstreamFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.list_of('Flow'), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_lenses = sgqlc.types.Field(sgqlc.types.list_of('Lens'), graphql_name='upstreamLenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_lenses_connection = sgqlc.types.Field('LensesConnection', graphql_name='upstreamLensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_sheet_field_instances = sgqlc.types.Field(sgqlc.types.list_of('Field'), graphql_name='upstreamSheetFieldInstances', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_sheet_field_instances_connection = sgqlc.types.Field('FieldsConnection', graphql_name='upstreamSheetFieldInstancesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.list_of('Table'), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Table_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('TablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Table_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return Dashboard
+
+
+def DataCloud():
+    class DataCloud(sgqlc.types.Type, tableau_schema.CanHaveLabels, tableau_schema.Certifiable, tableau_schema.Database, tableau_schema.Taggable, tableau_schema.Warnable):
+        __schema__ = tableau_schema
+        __field_names__ = ()
+    return DataCloud
+
+
+def DataQualityCertification():
+    class DataQualityCertification(sgqlc.types.Type, tableau_schema.Label):
+        __schema__ = tableau_schema
+        __field_names__ = ()
+    return DataQualityCertification
+
+
+def DataQualityWarning():
+    class DataQualityWarning(sgqlc.types.Type, tableau_schema.Label):
+        __schema__ = tableau_schema
+        __field_names__ = ('is_severe', 'warning_type')
+        is_severe = sgqlc.types.Field(sgqlc.types.non_null('Boolean'), graphql_name='isSevere')
+        warning_type = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='warningType')
+    return DataQualityWarning
+
+
+def DatabaseServer():
+    class DatabaseServer(sgqlc.types.Type, tableau_schema.CanHaveLabels, tableau_schema.Certifiable, tableau_schema.Database, tableau_schema.Taggable, tableau_schema.Warnable):
+        __schema__ = tableau_schema
+        __field_names__ = ('extended_connection_type', 'host_name', 'port', 'service')
+        extended_connection_type = sgqlc.types.Field('String', graphql_name='extendedConnectionType')
+        host_name = sgqlc.types.Field('String', graphql_name='hostName')
+        port = sgqlc.types.Field('Int', graphql_name='port')
+        service = sgqlc.types.Field('String', graphql_name='service')
+    return DatabaseServer
+
+
+def DatabaseTable():
+    class DatabaseTable(sgqlc.types.Type, tableau_schema.CanHaveLabels, tableau_schema.Certifiable, tableau_schema.Table, tableau_schema.Taggable, tableau_schema.Warnable):
+        __schema__ = tableau_schema
+        __field_names__ = ('additional_details', 'certification_note', 'certifier', 'connection_type', 'contact', 'database', 'downstream_metric_definitions', 'downstream_metric_definitions_connection', 'full_name', 'project_name', 'project_vizportal_url_id', 'referenced_by_queries', 'referenced_by_queries_connection', 'schema', 'table_type', 'upstream_data_quality_warnings', 'upstream_data_quality_warnings_connection', 'upstream_labels', 'upstream_labels_connection', 'vizportal_id')
+        additional_details = sgqlc.types.Field('TableAdditionalDetails', graphql_name='additionalDetails')
+        certification_note = sgqlc.types.Field('String', graphql_name='certificationNote')
+        certifier = sgqlc.types.Field('TableauUser', graphql_name='certifier')
+        connection_type = sgqlc.types.Field('String', graphql_name='connectionType')
+        contact = sgqlc.types.Field('TableauUser', graphql_name='contact')
+        database = sgqlc.types.Field('Database', graphql_name='database')
+        downstream_metric_definitions = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('MetricDefinition')), graphql_name='downstreamMetricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions_connection = sgqlc.types.Field('MetricDefinitionsConnection', graphql_name='downstreamMetricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        full_name = sgqlc.types.Field('String', graphql_name='fullName')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_vizportal_url_id = sgqlc.types.Field('String', graphql_name='projectVizportalUrlId')
+        referenced_by_queries = sgqlc.types.Field(sgqlc.types.list_of('CustomSQLTable'), graphql_name='referencedByQueries', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CustomSQLTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CustomSQLTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        referenced_by_queries_connection = sgqlc.types.Field('CustomSQLTablesConnection', graphql_name='referencedByQueriesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CustomSQLTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CustomSQLTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        schema = sgqlc.types.Field('String', graphql_name='schema')
+        table_type = sgqlc.types.Field(sgqlc.types.non_null('TableType'), graphql_name='tableType')
+        upstream_data_quality_warnings = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityWarning'))), graphql_name='upstreamDataQualityWarnings', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_data_quality_warnings_connection = sgqlc.types.Field('DataQualityWarningsConnection', graphql_name='upstreamDataQualityWarningsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Label'))), graphql_name='upstreamLabels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels_connection = sgqlc.types.Field('LabelsConnection', graphql_name='upstreamLabelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        vizportal_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vizportalId')
+    return DatabaseTable
+
+
+def DatasourceField():
+    class DatasourceField(sgqlc.types.Type, tableau_schema.Field, tableau_schema.Node):
+        __schema__ = tableau_schema
+        __field_names__ = ('remote_field',)
+        remote_field = sgqlc.types.Field('Field', graphql_name='remoteField')
+    return DatasourceField
+
+
+def EmbeddedDatasource():
+    class EmbeddedDatasource(sgqlc.types.Type, tableau_schema.Datasource):
+        __schema__ = tableau_schema
+        __field_names__ = ('downstream_flows', 'downstream_flows_connection', 'parent_published_datasources', 'parent_published_datasources_connection', 'upstream_data_quality_warnings', 'upstream_data_quality_warnings_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_labels', 'upstream_labels_connection', 'workbook')
+        downstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='downstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='downstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        parent_published_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='parentPublishedDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        parent_published_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='parentPublishedDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_data_quality_warnings = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityWarning'))), graphql_name='upstreamDataQualityWarnings', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_data_quality_warnings_connection = sgqlc.types.Field('DataQualityWarningsConnection', graphql_name='upstreamDataQualityWarningsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Label'))), graphql_name='upstreamLabels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels_connection = sgqlc.types.Field('LabelsConnection', graphql_name='upstreamLabelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        workbook = sgqlc.types.Field('Workbook', graphql_name='workbook')
+    return EmbeddedDatasource
+
+
+def File():
+    class File(sgqlc.types.Type, tableau_schema.CanHaveLabels, tableau_schema.Certifiable, tableau_schema.Database, tableau_schema.Taggable, tableau_schema.Warnable):
+        __schema__ = tableau_schema
+        __field_names__ = ('file_path',)
+        file_path = sgqlc.types.Field('String', graphql_name='filePath')
+    return File
+
+
+def Flow():
+    class Flow(sgqlc.types.Type, tableau_schema.CanHaveLabels, tableau_schema.Taggable, tableau_schema.Warnable):
+        __schema__ = tableau_schema
+        __field_names__ = ('container_name', 'container_type', 'contains_unsupported_custom_sql', 'created_at', 'description', 'downstream_dashboards', 'downstream_dashboards_connection', 'downstream_databases', 'downstream_databases_connection', 'downstream_datasources', 'downstream_datasources_connection', 'downstream_flows', 'downstream_flows_connection', 'downstream_lenses', 'downstream_lenses_connection', 'downstream_linked_flows', 'downstream_linked_flows_connection', 'downstream_metric_definitions', 'downstream_metric_definitions_connection', 'downstream_metrics', 'downstream_metrics_connection', 'downstream_owners', 'downstream_owners_connection', 'downstream_sheets', 'downstream_sheets_connection', 'downstream_tables', 'downstream_tables_connection', 'downstream_virtual_connection_tables', 'downstream_virtual_connection_tables_connection', 'downstream_virtual_connections', 'downstream_virtual_connections_connection', 'downstream_workbooks', 'downstream_workbooks_connection', 'input_fields', 'input_fields_connection', 'next_downstream_flows', 'next_downstream_flows_connection', 'next_upstream_flows', 'next_upstream_flows_connection', 'output_fields', 'output_fields_connection', 'output_steps', 'output_steps_connection', 'owner', 'personal_space_url_link', 'project_name', 'project_vizportal_url_id', 'site', 'updated_at', 'upstream_data_quality_warnings', 'upstream_data_quality_warnings_connection', 'upstream_databases', 'upstream_databases_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_labels', 'upstream_labels_connection', 'upstream_linked_flows', 'upstream_linked_flows_connection', 'upstream_tables', 'upstream_tables_connection', 'upstream_virtual_connection_tables', 'upstream_virtual_connection_tables_connection', 'upstream_virtual_connections', 'upstream_virtual_connections_connection', 'uri', 'vizportal_url_id')
+        container_name = sgqlc.types.Field('String', graphql_name='containerName')
+        container_type = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='containerType')
+        contains_unsupported_custom_sql = sgqlc.types.Field('Boolean', graphql_name='containsUnsupportedCustomSql')
+        created_at = sgqlc.types.Field('DateTime', graphql_name='createdAt')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        downstream_dashboards = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Dashboard'))), graphql_name='downstreamDashboards', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_dashboards_connection = sgqlc.types.Field('DashboardsConnection', graphql_name='downstreamDashboardsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='downstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='downstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='downstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='downstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='downstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='downstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Lens'))), graphql_name='downstreamLenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses_connection = sgqlc.types.Field('LensesConnection', graphql_name='downstreamLensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_linked_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('LinkedFlow'))), graphql_name='downstreamLinkedFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('LinkedFlow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LinkedFlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_linked_flows_connection = sgqlc.types.Field('LinkedFlowsConnection', graphql_name='downstreamLinkedFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('LinkedFlow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LinkedFlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('MetricDefinition')), graphql_name='downstreamMetricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions_connection = sgqlc.types.Field('MetricDefinitionsConnection', graphql_name='downstreamMetricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Metric'))), graphql_name='downstreamMetrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics_connection = sgqlc.types.Field('MetricsConnection', graphql_name='downstreamMetricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_owners = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableauUser'))), graphql_name='downstreamOwners', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_owners_connection = sgqlc.types.Field('TableauUsersConnection', graphql_name='downstreamOwnersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_sheets = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Sheet'))), graphql_name='downstreamSheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='downstreamSheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='downstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='downstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='downstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='downstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='downstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='downstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Workbook'))), graphql_name='downstreamWorkbooks', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_workbooks_connection = sgqlc.types.Field('WorkbooksConnection', graphql_name='downstreamWorkbooksConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        input_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowInputField'))), graphql_name='inputFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowInputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowInputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        input_fields_connection = sgqlc.types.Field('FlowInputFieldsConnection', graphql_name='inputFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowInputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowInputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        next_downstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='nextDownstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        next_downstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='nextDownstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        next_upstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('Flow')), graphql_name='nextUpstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        next_upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='nextUpstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        output_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowOutputField'))), graphql_name='outputFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowOutputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        output_fields_connection = sgqlc.types.Field('FlowOutputFieldsConnection', graphql_name='outputFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowOutputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        output_steps = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('FlowOutputStep'))), graphql_name='outputSteps', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowOutputStep_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowOutputStepSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        output_steps_connection = sgqlc.types.Field('FlowOutputStepsConnection', graphql_name='outputStepsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowOutputStep_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowOutputStepSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owner = sgqlc.types.Field('TableauUser', graphql_name='owner')
+        personal_space_url_link = sgqlc.types.Field('String', graphql_name='personalSpaceUrlLink')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_vizportal_url_id = sgqlc.types.Field('String', graphql_name='projectVizportalUrlId')
+        site = sgqlc.types.Field('TableauSite', graphql_name='site')
+        updated_at = sgqlc.types.Field('DateTime', graphql_name='updatedAt')
+        upstream_data_quality_warnings = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityWarning'))), graphql_name='upstreamDataQualityWarnings', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_data_quality_warnings_connection = sgqlc.types.Field('DataQualityWarningsConnection', graphql_name='upstreamDataQualityWarningsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Label'))), graphql_name='upstreamLabels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels_connection = sgqlc.types.Field('LabelsConnection', graphql_name='upstreamLabelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_linked_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('LinkedFlow'))), graphql_name='upstreamLinkedFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('LinkedFlow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LinkedFlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_linked_flows_connection = sgqlc.types.Field('LinkedFlowsConnection', graphql_name='upstreamLinkedFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('LinkedFlow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LinkedFlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('VirtualConnectionTable')), graphql_name='upstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='upstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections = sgqlc.types.Field(sgqlc.types.list_of('VirtualConnection'), graphql_name='upstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='upstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        uri = sgqlc.types.Field('String', graphql_name='uri')
+        vizportal_url_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vizportalUrlId')
+    return Flow
+
+
+def FlowColumnInputField():
+    class FlowColumnInputField(sgqlc.types.Type, tableau_schema.FlowInputField):
+        __schema__ = tableau_schema
+        __field_names__ = ('column', 'field_id')
+        column = sgqlc.types.Field('Column', graphql_name='column')
+        field_id = sgqlc.types.Field('String', graphql_name='fieldId')
+    return FlowColumnInputField
+
+
+def FlowColumnOutputField():
+    class FlowColumnOutputField(sgqlc.types.Type, tableau_schema.FlowOutputField):
+        __schema__ = tableau_schema
+        __field_names__ = ('column', 'field_id')
+        column = sgqlc.types.Field('Column', graphql_name='column')
+        field_id = sgqlc.types.Field('String', graphql_name='fieldId')
+    return FlowColumnOutputField
+
+
+def FlowFieldInputField():
+    class FlowFieldInputField(sgqlc.types.Type, tableau_schema.FlowInputField):
+        __schema__ = tableau_schema
+        __field_names__ = ('field', 'field_id')
+        field = sgqlc.types.Field('Field', graphql_name='field')
+        field_id = sgqlc.types.Field('String', graphql_name='fieldId')
+    return FlowFieldInputField
+
+
+def FlowFieldOutputField():
+    class FlowFieldOutputField(sgqlc.types.Type, tableau_schema.FlowOutputField):
+        __schema__ = tableau_schema
+        __field_names__ = ('field', 'field_id')
+        field = sgqlc.types.Field('Field', graphql_name='field')
+        field_id = sgqlc.types.Field('String', graphql_name='fieldId')
+    return FlowFieldOutputField
+
+
+def GenericLabel():
+    class GenericLabel(sgqlc.types.Type, tableau_schema.Label):
+        __schema__ = tableau_schema
+        __field_names__ = ()
+    return GenericLabel
+
+
+def GroupField():
+    class GroupField(sgqlc.types.Type, tableau_schema.DataField, tableau_schema.Field, tableau_schema.FieldReferencingField, tableau_schema.Node):
+        __schema__ = tableau_schema
+        __field_names__ = ('has_other',)
+        has_other = sgqlc.types.Field('Boolean', graphql_name='hasOther')
+    return GroupField
+
+
+def HierarchyField():
+    class HierarchyField(sgqlc.types.Type, tableau_schema.Field, tableau_schema.FieldReferencingField, tableau_schema.Node):
+        __schema__ = tableau_schema
+        __field_names__ = ()
+    return HierarchyField
+
+
+def Metric():
+    class Metric(sgqlc.types.Type, tableau_schema.Taggable):
+        __schema__ = tableau_schema
+        __field_names__ = ('container_name', 'container_type', 'created_at', 'description', 'owner', 'project_name', 'project_vizportal_url_id', 'site', 'underlying_view', 'updated_at', 'upstream_columns', 'upstream_columns_connection', 'upstream_data_quality_warnings', 'upstream_data_quality_warnings_connection', 'upstream_databases', 'upstream_databases_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_fields', 'upstream_fields_connection', 'upstream_flow_column_output_fields', 'upstream_flow_column_output_fields_connection', 'upstream_flow_field_output_fields', 'upstream_flow_field_output_fields_connection', 'upstream_flow_output_fields', 'upstream_flow_output_fields_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_labels', 'upstream_labels_connection', 'upstream_lenses', 'upstream_lenses_connection', 'upstream_tables', 'upstream_tables_connection', 'upstream_workbooks', 'upstream_workbooks_connection', 'vizportal_url_id')
+        container_name = sgqlc.types.Field('String', graphql_name='containerName')
+        container_type = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='containerType')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        owner = sgqlc.types.Field(sgqlc.types.non_null('TableauUser'), graphql_name='owner')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_vizportal_url_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='projectVizportalUrlId')
+        site = sgqlc.types.Field(sgqlc.types.non_null('TableauSite'), graphql_name='site')
+        underlying_view = sgqlc.types.Field('View', graphql_name='underlyingView')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        upstream_columns = sgqlc.types.Field(sgqlc.types.list_of('Column'), graphql_name='upstreamColumns', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_columns_connection = sgqlc.types.Field('ColumnsConnection', graphql_name='upstreamColumnsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_data_quality_warnings = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityWarning'))), graphql_name='upstreamDataQualityWarnings', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_data_quality_warnings_connection = sgqlc.types.Field('DataQualityWarningsConnection', graphql_name='upstreamDataQualityWarningsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases = sgqlc.types.Field(sgqlc.types.list_of('Database'), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.list_of('PublishedDatasource'), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_fields = sgqlc.types.Field(sgqlc.types.list_of('Field'), graphql_name='upstreamFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_fields_connection = sgqlc.types.Field('FieldsConnection', graphql_name='upstreamFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flow_column_output_fields = sgqlc.types.Field(sgqlc.types.list_of('FlowColumnOutputField'), graphql_name='upstreamFlowColumnOutputFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowColumnOutputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowColumnOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flow_column_output_fields_connection = sgqlc.types.Field('FlowColumnOutputFieldsConnection', graphql_name='upstreamFlowColumnOutputFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowColumnOutputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowColumnOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flow_field_output_fields = sgqlc.types.Field(sgqlc.types.list_of('FlowFieldOutputField'), graphql_name='upstreamFlowFieldOutputFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowFieldOutputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flow_field_output_fields_connection = sgqlc.types.Field('FlowFieldOutputFieldsConnection', graphql_name='upstreamFlowFieldOutputFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowFieldOutputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowFieldOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flow_output_fields = sgqlc.types.Field(sgqlc.types.list_of('FlowOutputField'), graphql_name='upstreamFlowOutputFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('FlowOutputField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flow_output_fields_connection = sgqlc.types.Field('FlowOutputFieldsConnection', graphql_name='upstreamFlowOutputFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('FlowOutputField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowOutputFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.list_of('Flow'), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Label'))), graphql_name='upstreamLabels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels_connection = sgqlc.types.Field('LabelsConnection', graphql_name='upstreamLabelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_lenses = sgqlc.types.Field(sgqlc.types.list_of('Lens'), graphql_name='upstreamLenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_lenses_connection = sgqlc.types.Field('LensesConnection', graphql_name='upstreamLensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('DatabaseTable')), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_workbooks = sgqlc.types.Field(sgqlc.types.list_of('Workbook'), graphql_name='upstreamWorkbooks', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_workbooks_connection = sgqlc.types.Field('WorkbooksConnection', graphql_name='upstreamWorkbooksConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Workbook_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('WorkbookSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        vizportal_url_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vizportalUrlId')
+    return Metric
+
+
+def PublishedDatasource():
+    class PublishedDatasource(sgqlc.types.Type, tableau_schema.CanHaveLabels, tableau_schema.Certifiable, tableau_schema.Datasource, tableau_schema.Taggable, tableau_schema.Warnable):
+        __schema__ = tableau_schema
+        __field_names__ = ('certification_note', 'certifier', 'certifier_display_name', 'container_name', 'container_type', 'description', 'downstream_databases', 'downstream_databases_connection', 'downstream_datasources', 'downstream_datasources_connection', 'downstream_flows', 'downstream_flows_connection', 'downstream_lenses', 'downstream_lenses_connection', 'downstream_metric_definitions', 'downstream_metric_definitions_connection', 'downstream_metrics', 'downstream_metrics_connection', 'downstream_tables', 'downstream_tables_connection', 'downstream_virtual_connection_tables', 'downstream_virtual_connection_tables_connection', 'downstream_virtual_connections', 'downstream_virtual_connections_connection', 'owner', 'parameters', 'parameters_connection', 'project_name', 'project_vizportal_url_id', 'site', 'upstream_data_quality_warnings', 'upstream_data_quality_warnings_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_labels', 'upstream_labels_connection', 'upstream_virtual_connection_tables', 'upstream_virtual_connection_tables_connection', 'upstream_virtual_connections', 'upstream_virtual_connections_connection', 'uri', 'vizportal_id', 'vizportal_url_id')
+        certification_note = sgqlc.types.Field('String', graphql_name='certificationNote')
+        certifier = sgqlc.types.Field('TableauUser', graphql_name='certifier')
+        certifier_display_name = sgqlc.types.Field('String', graphql_name='certifierDisplayName')
+        container_name = sgqlc.types.Field('String', graphql_name='containerName')
+        container_type = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='containerType')
+        description = sgqlc.types.Field('String', graphql_name='description')
+        downstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Database'))), graphql_name='downstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='downstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='downstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='downstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='downstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='downstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null('Lens')), graphql_name='downstreamLenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_lenses_connection = sgqlc.types.Field('LensesConnection', graphql_name='downstreamLensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('MetricDefinition')), graphql_name='downstreamMetricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions_connection = sgqlc.types.Field('MetricDefinitionsConnection', graphql_name='downstreamMetricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Metric'))), graphql_name='downstreamMetrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics_connection = sgqlc.types.Field('MetricsConnection', graphql_name='downstreamMetricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DatabaseTable'))), graphql_name='downstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='downstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnectionTable'))), graphql_name='downstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='downstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('VirtualConnection'))), graphql_name='downstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='downstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owner = sgqlc.types.Field(sgqlc.types.non_null('TableauUser'), graphql_name='owner')
+        parameters = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Parameter'))), graphql_name='parameters', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Parameter_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ParameterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        parameters_connection = sgqlc.types.Field('ParametersConnection', graphql_name='parametersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Parameter_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ParameterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_vizportal_url_id = sgqlc.types.Field('String', graphql_name='projectVizportalUrlId')
+        site = sgqlc.types.Field(sgqlc.types.non_null('TableauSite'), graphql_name='site')
+        upstream_data_quality_warnings = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityWarning'))), graphql_name='upstreamDataQualityWarnings', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_data_quality_warnings_connection = sgqlc.types.Field('DataQualityWarningsConnection', graphql_name='upstreamDataQualityWarningsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('PublishedDatasource'))), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Flow'))), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Label'))), graphql_name='upstreamLabels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels_connection = sgqlc.types.Field('LabelsConnection', graphql_name='upstreamLabelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('VirtualConnectionTable')), graphql_name='upstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='upstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('VirtualConnection')), graphql_name='upstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='upstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        uri = sgqlc.types.Field('String', graphql_name='uri')
+        vizportal_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vizportalId')
+        vizportal_url_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vizportalUrlId')
+    return PublishedDatasource
+
+
+def SetField():
+    class SetField(sgqlc.types.Type, tableau_schema.Field, tableau_schema.FieldReferencingField, tableau_schema.Node):
+        __schema__ = tableau_schema
+        __field_names__ = ('parameters', 'parameters_connection')
+        parameters = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Parameter'))), graphql_name='parameters', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Parameter_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ParameterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        parameters_connection = sgqlc.types.Field('ParametersConnection', graphql_name='parametersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Parameter_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ParameterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return SetField
+
+
+def Sheet():
+    class Sheet(sgqlc.types.Type, tableau_schema.Taggable, tableau_schema.View):
+        __schema__ = tableau_schema
+        __field_names__ = ('contained_in_dashboards', 'contained_in_dashboards_connection', 'datasource_fields', 'datasource_fields_connection', 'parent_embedded_datasources', 'parent_embedded_datasources_connection', 'sheet_field_instances', 'sheet_field_instances_connection', 'upstream_columns', 'upstream_columns_connection', 'upstream_databases', 'upstream_databases_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_fields', 'upstream_fields_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_tables', 'upstream_tables_connection', 'worksheet_fields', 'worksheet_fields_connection')
+        contained_in_dashboards = sgqlc.types.Field(sgqlc.types.list_of('Dashboard'), graphql_name='containedInDashboards', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        contained_in_dashboards_connection = sgqlc.types.Field('DashboardsConnection', graphql_name='containedInDashboardsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        datasource_fields = sgqlc.types.Field(sgqlc.types.list_of('Field'), graphql_name='datasourceFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        datasource_fields_connection = sgqlc.types.Field('FieldsConnection', graphql_name='datasourceFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        parent_embedded_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('EmbeddedDatasource'))), graphql_name='parentEmbeddedDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('EmbeddedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('EmbeddedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        parent_embedded_datasources_connection = sgqlc.types.Field('EmbeddedDatasourcesConnection', graphql_name='parentEmbeddedDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('EmbeddedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('EmbeddedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        sheet_field_instances = sgqlc.types.Field(sgqlc.types.list_of('Field'), graphql_name='sheetFieldInstances', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        sheet_field_instances_connection = sgqlc.types.Field('FieldsConnection', graphql_name='sheetFieldInstancesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_columns = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('Column')), graphql_name='upstreamColumns', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_columns_connection = sgqlc.types.Field('ColumnsConnection', graphql_name='upstreamColumnsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Column_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ColumnSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases = sgqlc.types.Field(sgqlc.types.list_of('Database'), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.list_of('Datasource'), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Datasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('DatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Datasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_fields = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('Field')), graphql_name='upstreamFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_fields_connection = sgqlc.types.Field('FieldsConnection', graphql_name='upstreamFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Field_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.list_of('Flow'), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.list_of('Table'), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Table_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('TablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Table_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        worksheet_fields = sgqlc.types.Field(sgqlc.types.list_of('CalculatedField'), graphql_name='worksheetFields', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('CalculatedField_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('CalculatedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        worksheet_fields_connection = sgqlc.types.Field('CalculatedFieldsConnection', graphql_name='worksheetFieldsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('CalculatedField_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('CalculatedFieldSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+    return Sheet
+
+
+def VirtualConnectionTable():
+    class VirtualConnectionTable(sgqlc.types.Type, tableau_schema.CanHaveLabels, tableau_schema.Certifiable, tableau_schema.Table, tableau_schema.Taggable, tableau_schema.Warnable):
+        __schema__ = tableau_schema
+        __field_names__ = ('contains_unsupported_custom_sql', 'downstream_metric_definitions', 'downstream_metric_definitions_connection', 'extract_last_refresh_type', 'extract_last_refreshed_at', 'is_extracted', 'owner', 'upstream_data_quality_warnings', 'upstream_data_quality_warnings_connection', 'upstream_labels', 'upstream_labels_connection', 'uri', 'virtual_connection', 'vizportal_id', 'vizportal_url_id')
+        contains_unsupported_custom_sql = sgqlc.types.Field('Boolean', graphql_name='containsUnsupportedCustomSql')
+        downstream_metric_definitions = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('MetricDefinition')), graphql_name='downstreamMetricDefinitions', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metric_definitions_connection = sgqlc.types.Field('MetricDefinitionsConnection', graphql_name='downstreamMetricDefinitionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('MetricDefinition_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricDefinitionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        extract_last_refresh_type = sgqlc.types.Field('ExtractType', graphql_name='extractLastRefreshType')
+        extract_last_refreshed_at = sgqlc.types.Field('DateTime', graphql_name='extractLastRefreshedAt')
+        is_extracted = sgqlc.types.Field('Boolean', graphql_name='isExtracted')
+        owner = sgqlc.types.Field(sgqlc.types.non_null('TableauUser'), graphql_name='owner')
+        upstream_data_quality_warnings = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityWarning'))), graphql_name='upstreamDataQualityWarnings', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_data_quality_warnings_connection = sgqlc.types.Field('DataQualityWarningsConnection', graphql_name='upstreamDataQualityWarningsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Label'))), graphql_name='upstreamLabels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels_connection = sgqlc.types.Field('LabelsConnection', graphql_name='upstreamLabelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        uri = sgqlc.types.Field('String', graphql_name='uri')
+        virtual_connection = sgqlc.types.Field('VirtualConnection', graphql_name='virtualConnection')
+        vizportal_id = sgqlc.types.Field('String', graphql_name='vizportalId')
+        vizportal_url_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vizportalUrlId')
+    return VirtualConnectionTable
+
+
+def WebDataConnector():
+    class WebDataConnector(sgqlc.types.Type, tableau_schema.CanHaveLabels, tableau_schema.Certifiable, tableau_schema.Database, tableau_schema.Taggable, tableau_schema.Warnable):
+        __schema__ = tableau_schema
+        __field_names__ = ('connector_url',)
+        connector_url = sgqlc.types.Field('String', graphql_name='connectorUrl')
+    return WebDataConnector
+
+
+def Workbook():
+    class Workbook(sgqlc.types.Type, tableau_schema.Taggable):
+        __schema__ = tableau_schema
+        __field_names__ = ('container_name', 'container_type', 'contains_unsupported_custom_sql', 'created_at', 'dashboards', 'dashboards_connection', 'description', 'downstream_metrics', 'downstream_metrics_connection', 'downstream_owners', 'downstream_owners_connection', 'embedded_datasources', 'embedded_datasources_connection', 'owner', 'parameters', 'parameters_connection', 'project_luid', 'project_name', 'project_vizportal_url_id', 'sheets', 'sheets_connection', 'site', 'updated_at', 'upstream_data_quality_warnings', 'upstream_data_quality_warnings_connection', 'upstream_databases', 'upstream_databases_connection', 'upstream_datasources', 'upstream_datasources_connection', 'upstream_flows', 'upstream_flows_connection', 'upstream_labels', 'upstream_labels_connection', 'upstream_lenses', 'upstream_lenses_connection', 'upstream_tables', 'upstream_tables_connection', 'upstream_virtual_connection_tables', 'upstream_virtual_connection_tables_connection', 'upstream_virtual_connections', 'upstream_virtual_connections_connection', 'uri', 'views', 'views_connection', 'vizportal_url_id')
+        container_name = sgqlc.types.Field('String', graphql_name='containerName')
+        container_type = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='containerType')
+        contains_unsupported_custom_sql = sgqlc.types.Field('Boolean', graphql_name='containsUnsupportedCustomSql')
+        created_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='createdAt')
+        dashboards = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Dashboard'))), graphql_name='dashboards', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        dashboards_connection = sgqlc.types.Field('DashboardsConnection', graphql_name='dashboardsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Dashboard_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DashboardSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        description = sgqlc.types.Field('String', graphql_name='description')
+        downstream_metrics = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Metric'))), graphql_name='downstreamMetrics', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_metrics_connection = sgqlc.types.Field('MetricsConnection', graphql_name='downstreamMetricsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Metric_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('MetricSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        downstream_owners = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('TableauUser'))), graphql_name='downstreamOwners', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        downstream_owners_connection = sgqlc.types.Field('TableauUsersConnection', graphql_name='downstreamOwnersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('TableauUser_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('TableauUserSortOrder', graphql_name='orderBy', default=None)))))
+        embedded_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('EmbeddedDatasource'))), graphql_name='embeddedDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('EmbeddedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('EmbeddedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        embedded_datasources_connection = sgqlc.types.Field('EmbeddedDatasourcesConnection', graphql_name='embeddedDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('EmbeddedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('EmbeddedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        owner = sgqlc.types.Field(sgqlc.types.non_null('TableauUser'), graphql_name='owner')
+        parameters = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Parameter'))), graphql_name='parameters', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Parameter_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ParameterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        parameters_connection = sgqlc.types.Field('ParametersConnection', graphql_name='parametersConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Parameter_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ParameterSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        project_luid = sgqlc.types.Field('String', graphql_name='projectLuid')
+        project_name = sgqlc.types.Field('String', graphql_name='projectName')
+        project_vizportal_url_id = sgqlc.types.Field('String', graphql_name='projectVizportalUrlId')
+        sheets = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Sheet'))), graphql_name='sheets', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        sheets_connection = sgqlc.types.Field('SheetsConnection', graphql_name='sheetsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Sheet_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('SheetSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        site = sgqlc.types.Field(sgqlc.types.non_null('TableauSite'), graphql_name='site')
+        updated_at = sgqlc.types.Field(sgqlc.types.non_null('DateTime'), graphql_name='updatedAt')
+        upstream_data_quality_warnings = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('DataQualityWarning'))), graphql_name='upstreamDataQualityWarnings', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_data_quality_warnings_connection = sgqlc.types.Field('DataQualityWarningsConnection', graphql_name='upstreamDataQualityWarningsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DataQualityWarning_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DataQualityWarningSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('Database')), graphql_name='upstreamDatabases', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_databases_connection = sgqlc.types.Field('DatabasesConnection', graphql_name='upstreamDatabasesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Database_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('PublishedDatasource')), graphql_name='upstreamDatasources', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_datasources_connection = sgqlc.types.Field('PublishedDatasourcesConnection', graphql_name='upstreamDatasourcesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('PublishedDatasource_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('PublishedDatasourceSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows = sgqlc.types.Field(sgqlc.types.list_of('Flow'), graphql_name='upstreamFlows', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_flows_connection = sgqlc.types.Field('FlowsConnection', graphql_name='upstreamFlowsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Flow_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('FlowSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('Label'))), graphql_name='upstreamLabels', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_labels_connection = sgqlc.types.Field('LabelsConnection', graphql_name='upstreamLabelsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Label_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LabelSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_lenses = sgqlc.types.Field(sgqlc.types.list_of('Lens'), graphql_name='upstreamLenses', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_lenses_connection = sgqlc.types.Field('LensesConnection', graphql_name='upstreamLensesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('Lens_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('LensSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('DatabaseTable')), graphql_name='upstreamTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_tables_connection = sgqlc.types.Field('DatabaseTablesConnection', graphql_name='upstreamTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('DatabaseTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('DatabaseTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('VirtualConnectionTable')), graphql_name='upstreamVirtualConnectionTables', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connection_tables_connection = sgqlc.types.Field('VirtualConnectionTablesConnection', graphql_name='upstreamVirtualConnectionTablesConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnectionTable_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionTableSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of('VirtualConnection')), graphql_name='upstreamVirtualConnections', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        upstream_virtual_connections_connection = sgqlc.types.Field('VirtualConnectionsConnection', graphql_name='upstreamVirtualConnectionsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('VirtualConnection_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('VirtualConnectionSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        uri = sgqlc.types.Field('String', graphql_name='uri')
+        views = sgqlc.types.Field(sgqlc.types.non_null(sgqlc.types.list_of(sgqlc.types.non_null('View'))), graphql_name='views', args=sgqlc.types.ArgDict((('filter', sgqlc.types.Arg('View_Filter', graphql_name='filter', default=None)), ('order_by', sgqlc.types.Arg('ViewSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        views_connection = sgqlc.types.Field('ViewsConnection', graphql_name='viewsConnection', args=sgqlc.types.ArgDict((('after', sgqlc.types.Arg('String', graphql_name='after', default=None)), ('filter', sgqlc.types.Arg('View_Filter', graphql_name='filter', default=None)), ('first', sgqlc.types.Arg('Int', graphql_name='first', default=None)), ('offset', sgqlc.types.Arg('Int', graphql_name='offset', default=None)), ('order_by', sgqlc.types.Arg('ViewSortOrder', graphql_name='orderBy', default=None)), ('permission_mode', sgqlc.types.Arg(tableau_schema.PermissionMode, graphql_name='permissionMode', default='OBFUSCATE_RESULTS')))))
+        vizportal_url_id = sgqlc.types.Field(sgqlc.types.non_null('String'), graphql_name='vizportalUrlId')
+    return Workbook
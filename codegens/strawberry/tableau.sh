@@ -1 +1,2 @@
 strawberry schema-codegen ../../schemas/tableau/schema-strawberry.graphql -o tableau_schema.py
+python ../../tools/loaders_codegen.py ../../schemas/tableau/schema-strawberry.graphql -o tableau_loaders.py
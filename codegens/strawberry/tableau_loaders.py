@@ -0,0 +1,1173 @@
+# Generated by tools/loaders_codegen.py
+# Source: ../../schemas/tableau/schema-strawberry.graphql
+
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from graphql import default_field_resolver
+from strawberry.dataloader import DataLoader
+
+
+class Reference(NamedTuple):
+    type: str
+    is_list: bool
+
+
+REFERENCES: Dict[str, Dict[str, Reference]] = {
+    "AskDataExtension": {
+        "dashboard": Reference("Dashboard", False),
+        "lens": Reference("Lens", False),
+    },
+    "BinField": {
+        "datasource": Reference("Datasource", False),
+        "derivedLensFields": Reference("LensField", True),
+        "descriptionInherited": Reference("InheritedStringResult", True),
+        "directSheets": Reference("Sheet", True),
+        "downstreamColumns": Reference("Column", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFields": Reference("Field", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "fields": Reference("Field", True),
+        "metricDefinitions": Reference("MetricDefinition", True),
+        "parameters": Reference("Parameter", True),
+        "referencedByBins": Reference("BinField", True),
+        "referencedByCalculations": Reference("CalculatedField", True),
+        "referencedByCombinedFields": Reference("CombinedField", True),
+        "referencedByCombinedSets": Reference("CombinedSetField", True),
+        "referencedByFields": Reference("FieldReferencingField", True),
+        "referencedByFilters": Reference("DatasourceFilter", True),
+        "referencedByFlowFieldInputField": Reference("FlowFieldInputField", True),
+        "referencedByFlowFieldOutputField": Reference("FlowFieldOutputField", True),
+        "referencedByGroups": Reference("GroupField", True),
+        "referencedByHierarchies": Reference("HierarchyField", True),
+        "referencedByRemoteFields": Reference("DatasourceField", True),
+        "referencedBySets": Reference("SetField", True),
+        "sheets": Reference("Sheet", True),
+        "upstreamColumns": Reference("Column", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "CalculatedField": {
+        "datasource": Reference("Datasource", False),
+        "derivedLensFields": Reference("LensField", True),
+        "descriptionInherited": Reference("InheritedStringResult", True),
+        "directSheets": Reference("Sheet", True),
+        "downstreamColumns": Reference("Column", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFields": Reference("Field", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "fields": Reference("Field", True),
+        "metricDefinitions": Reference("MetricDefinition", True),
+        "parameters": Reference("Parameter", True),
+        "referencedByBins": Reference("BinField", True),
+        "referencedByCalculations": Reference("CalculatedField", True),
+        "referencedByCombinedFields": Reference("CombinedField", True),
+        "referencedByCombinedSets": Reference("CombinedSetField", True),
+        "referencedByFields": Reference("FieldReferencingField", True),
+        "referencedByFilters": Reference("DatasourceFilter", True),
+        "referencedByFlowFieldInputField": Reference("FlowFieldInputField", True),
+        "referencedByFlowFieldOutputField": Reference("FlowFieldOutputField", True),
+        "referencedByGroups": Reference("GroupField", True),
+        "referencedByHierarchies": Reference("HierarchyField", True),
+        "referencedByRemoteFields": Reference("DatasourceField", True),
+        "referencedBySets": Reference("SetField", True),
+        "sheet": Reference("Sheet", False),
+        "sheets": Reference("Sheet", True),
+        "upstreamColumns": Reference("Column", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "CloudFile": {
+        "certifier": Reference("TableauUser", False),
+        "contact": Reference("TableauUser", False),
+        "dataQualityCertifications": Reference("DataQualityCertification", True),
+        "dataQualityWarning": Reference("DataQualityWarning", False),
+        "dataQualityWarnings": Reference("DataQualityWarning", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "labels": Reference("Label", True),
+        "referencedByQueries": Reference("CustomSQLTable", True),
+        "tables": Reference("DatabaseTable", True),
+        "tags": Reference("Tag", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "Column": {
+        "dataQualityWarning": Reference("DataQualityWarning", False),
+        "dataQualityWarnings": Reference("DataQualityWarning", True),
+        "descriptionInherited": Reference("InheritedStringResult", True),
+        "downstreamColumns": Reference("Column", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFields": Reference("Field", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "labels": Reference("Label", True),
+        "referencedByFields": Reference("ColumnField", True),
+        "referencedByFlowColumnInputField": Reference("FlowColumnInputField", True),
+        "referencedByFlowColumnOutputField": Reference("FlowColumnOutputField", True),
+        "referencedByRemoteColumn": Reference("Column", True),
+        "remoteColumn": Reference("Column", False),
+        "table": Reference("Table", False),
+        "tags": Reference("Tag", True),
+        "upstreamColumns": Reference("Column", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "ColumnField": {
+        "columns": Reference("Column", True),
+        "datasource": Reference("Datasource", False),
+        "derivedLensFields": Reference("LensField", True),
+        "descriptionInherited": Reference("InheritedStringResult", True),
+        "directSheets": Reference("Sheet", True),
+        "downstreamColumns": Reference("Column", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFields": Reference("Field", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "metricDefinitions": Reference("MetricDefinition", True),
+        "referencedByBins": Reference("BinField", True),
+        "referencedByCalculations": Reference("CalculatedField", True),
+        "referencedByCombinedFields": Reference("CombinedField", True),
+        "referencedByCombinedSets": Reference("CombinedSetField", True),
+        "referencedByFields": Reference("FieldReferencingField", True),
+        "referencedByFilters": Reference("DatasourceFilter", True),
+        "referencedByFlowFieldInputField": Reference("FlowFieldInputField", True),
+        "referencedByFlowFieldOutputField": Reference("FlowFieldOutputField", True),
+        "referencedByGroups": Reference("GroupField", True),
+        "referencedByHierarchies": Reference("HierarchyField", True),
+        "referencedByRemoteFields": Reference("DatasourceField", True),
+        "referencedBySets": Reference("SetField", True),
+        "sheets": Reference("Sheet", True),
+        "upstreamColumns": Reference("Column", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "CombinedField": {
+        "datasource": Reference("Datasource", False),
+        "derivedLensFields": Reference("LensField", True),
+        "descriptionInherited": Reference("InheritedStringResult", True),
+        "directSheets": Reference("Sheet", True),
+        "downstreamColumns": Reference("Column", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFields": Reference("Field", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "fields": Reference("Field", True),
+        "metricDefinitions": Reference("MetricDefinition", True),
+        "referencedByBins": Reference("BinField", True),
+        "referencedByCalculations": Reference("CalculatedField", True),
+        "referencedByCombinedFields": Reference("CombinedField", True),
+        "referencedByCombinedSets": Reference("CombinedSetField", True),
+        "referencedByFields": Reference("FieldReferencingField", True),
+        "referencedByFilters": Reference("DatasourceFilter", True),
+        "referencedByFlowFieldInputField": Reference("FlowFieldInputField", True),
+        "referencedByFlowFieldOutputField": Reference("FlowFieldOutputField", True),
+        "referencedByGroups": Reference("GroupField", True),
+        "referencedByHierarchies": Reference("HierarchyField", True),
+        "referencedByRemoteFields": Reference("DatasourceField", True),
+        "referencedBySets": Reference("SetField", True),
+        "sheets": Reference("Sheet", True),
+        "upstreamColumns": Reference("Column", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "CombinedSetField": {
+        "datasource": Reference("Datasource", False),
+        "derivedLensFields": Reference("LensField", True),
+        "descriptionInherited": Reference("InheritedStringResult", True),
+        "directSheets": Reference("Sheet", True),
+        "downstreamColumns": Reference("Column", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFields": Reference("Field", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "fields": Reference("Field", True),
+        "metricDefinitions": Reference("MetricDefinition", True),
+        "referencedByBins": Reference("BinField", True),
+        "referencedByCalculations": Reference("CalculatedField", True),
+        "referencedByCombinedFields": Reference("CombinedField", True),
+        "referencedByCombinedSets": Reference("CombinedSetField", True),
+        "referencedByFields": Reference("FieldReferencingField", True),
+        "referencedByFilters": Reference("DatasourceFilter", True),
+        "referencedByFlowFieldInputField": Reference("FlowFieldInputField", True),
+        "referencedByFlowFieldOutputField": Reference("FlowFieldOutputField", True),
+        "referencedByGroups": Reference("GroupField", True),
+        "referencedByHierarchies": Reference("HierarchyField", True),
+        "referencedByRemoteFields": Reference("DatasourceField", True),
+        "referencedBySets": Reference("SetField", True),
+        "sheets": Reference("Sheet", True),
+        "upstreamColumns": Reference("Column", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "CustomSQLTable": {
+        "columns": Reference("Column", True),
+        "database": Reference("Database", False),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "tables": Reference("DatabaseTable", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "Dashboard": {
+        "askDataExtensions": Reference("AskDataExtension", True),
+        "referencedByMetrics": Reference("Metric", True),
+        "sheets": Reference("Sheet", True),
+        "tags": Reference("Tag", True),
+        "upstreamColumns": Reference("Column", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("Datasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamLenses": Reference("Lens", True),
+        "upstreamSheetFieldInstances": Reference("Field", True),
+        "upstreamTables": Reference("Table", True),
+        "workbook": Reference("Workbook", False),
+    },
+    "DataCloud": {
+        "certifier": Reference("TableauUser", False),
+        "contact": Reference("TableauUser", False),
+        "dataQualityCertifications": Reference("DataQualityCertification", True),
+        "dataQualityWarning": Reference("DataQualityWarning", False),
+        "dataQualityWarnings": Reference("DataQualityWarning", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "labels": Reference("Label", True),
+        "referencedByQueries": Reference("CustomSQLTable", True),
+        "tables": Reference("DatabaseTable", True),
+        "tags": Reference("Tag", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "DataQualityCertification": {
+        "asset": Reference("CanHaveLabels", False),
+        "author": Reference("TableauUser", False),
+    },
+    "DataQualityWarning": {
+        "asset": Reference("CanHaveLabels", False),
+        "author": Reference("TableauUser", False),
+    },
+    "DatabaseServer": {
+        "certifier": Reference("TableauUser", False),
+        "contact": Reference("TableauUser", False),
+        "dataQualityCertifications": Reference("DataQualityCertification", True),
+        "dataQualityWarning": Reference("DataQualityWarning", False),
+        "dataQualityWarnings": Reference("DataQualityWarning", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "labels": Reference("Label", True),
+        "referencedByQueries": Reference("CustomSQLTable", True),
+        "tables": Reference("DatabaseTable", True),
+        "tags": Reference("Tag", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "DatabaseTable": {
+        "additionalDetails": Reference("TableAdditionalDetails", False),
+        "certifier": Reference("TableauUser", False),
+        "columns": Reference("Column", True),
+        "contact": Reference("TableauUser", False),
+        "dataQualityCertifications": Reference("DataQualityCertification", True),
+        "dataQualityWarning": Reference("DataQualityWarning", False),
+        "dataQualityWarnings": Reference("DataQualityWarning", True),
+        "database": Reference("Database", False),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "labels": Reference("Label", True),
+        "referencedByQueries": Reference("CustomSQLTable", True),
+        "tags": Reference("Tag", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "DatasourceField": {
+        "datasource": Reference("Datasource", False),
+        "derivedLensFields": Reference("LensField", True),
+        "descriptionInherited": Reference("InheritedStringResult", True),
+        "directSheets": Reference("Sheet", True),
+        "downstreamColumns": Reference("Column", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFields": Reference("Field", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "metricDefinitions": Reference("MetricDefinition", True),
+        "referencedByBins": Reference("BinField", True),
+        "referencedByCalculations": Reference("CalculatedField", True),
+        "referencedByCombinedFields": Reference("CombinedField", True),
+        "referencedByCombinedSets": Reference("CombinedSetField", True),
+        "referencedByFields": Reference("FieldReferencingField", True),
+        "referencedByFilters": Reference("DatasourceFilter", True),
+        "referencedByFlowFieldInputField": Reference("FlowFieldInputField", True),
+        "referencedByFlowFieldOutputField": Reference("FlowFieldOutputField", True),
+        "referencedByGroups": Reference("GroupField", True),
+        "referencedByHierarchies": Reference("HierarchyField", True),
+        "referencedByRemoteFields": Reference("DatasourceField", True),
+        "referencedBySets": Reference("SetField", True),
+        "remoteField": Reference("Field", False),
+        "sheets": Reference("Sheet", True),
+        "upstreamColumns": Reference("Column", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "DatasourceFilter": {
+        "datasource": Reference("Datasource", False),
+        "field": Reference("Field", False),
+    },
+    "EmbeddedDatasource": {
+        "datasourceFilters": Reference("DatasourceFilter", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "fields": Reference("Field", True),
+        "lenses": Reference("Lens", True),
+        "parentPublishedDatasources": Reference("PublishedDatasource", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "workbook": Reference("Workbook", False),
+    },
+    "File": {
+        "certifier": Reference("TableauUser", False),
+        "contact": Reference("TableauUser", False),
+        "dataQualityCertifications": Reference("DataQualityCertification", True),
+        "dataQualityWarning": Reference("DataQualityWarning", False),
+        "dataQualityWarnings": Reference("DataQualityWarning", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "labels": Reference("Label", True),
+        "referencedByQueries": Reference("CustomSQLTable", True),
+        "tables": Reference("DatabaseTable", True),
+        "tags": Reference("Tag", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "Flow": {
+        "dataQualityWarning": Reference("DataQualityWarning", False),
+        "dataQualityWarnings": Reference("DataQualityWarning", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamLinkedFlows": Reference("LinkedFlow", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "inputFields": Reference("FlowInputField", True),
+        "labels": Reference("Label", True),
+        "nextDownstreamFlows": Reference("Flow", True),
+        "nextUpstreamFlows": Reference("Flow", True),
+        "outputFields": Reference("FlowOutputField", True),
+        "outputSteps": Reference("FlowOutputStep", True),
+        "owner": Reference("TableauUser", False),
+        "site": Reference("TableauSite", False),
+        "tags": Reference("Tag", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamLinkedFlows": Reference("LinkedFlow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "FlowColumnInputField": {
+        "childFields": Reference("FlowOutputField", True),
+        "column": Reference("Column", False),
+        "flow": Reference("Flow", False),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+    },
+    "FlowColumnOutputField": {
+        "column": Reference("Column", False),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "flow": Reference("Flow", True),
+        "flowOutputStep": Reference("FlowOutputStep", False),
+        "parentFields": Reference("FlowInputField", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "FlowFieldInputField": {
+        "childFields": Reference("FlowOutputField", True),
+        "field": Reference("Field", False),
+        "flow": Reference("Flow", False),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+    },
+    "FlowFieldOutputField": {
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "field": Reference("Field", False),
+        "flow": Reference("Flow", True),
+        "flowOutputStep": Reference("FlowOutputStep", False),
+        "parentFields": Reference("FlowInputField", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "FlowOutputStep": {
+        "flow": Reference("Flow", False),
+        "outputFields": Reference("FlowOutputField", True),
+    },
+    "GenericLabel": {
+        "asset": Reference("CanHaveLabels", False),
+        "author": Reference("TableauUser", False),
+    },
+    "GroupField": {
+        "datasource": Reference("Datasource", False),
+        "derivedLensFields": Reference("LensField", True),
+        "descriptionInherited": Reference("InheritedStringResult", True),
+        "directSheets": Reference("Sheet", True),
+        "downstreamColumns": Reference("Column", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFields": Reference("Field", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "fields": Reference("Field", True),
+        "metricDefinitions": Reference("MetricDefinition", True),
+        "referencedByBins": Reference("BinField", True),
+        "referencedByCalculations": Reference("CalculatedField", True),
+        "referencedByCombinedFields": Reference("CombinedField", True),
+        "referencedByCombinedSets": Reference("CombinedSetField", True),
+        "referencedByFields": Reference("FieldReferencingField", True),
+        "referencedByFilters": Reference("DatasourceFilter", True),
+        "referencedByFlowFieldInputField": Reference("FlowFieldInputField", True),
+        "referencedByFlowFieldOutputField": Reference("FlowFieldOutputField", True),
+        "referencedByGroups": Reference("GroupField", True),
+        "referencedByHierarchies": Reference("HierarchyField", True),
+        "referencedByRemoteFields": Reference("DatasourceField", True),
+        "referencedBySets": Reference("SetField", True),
+        "sheets": Reference("Sheet", True),
+        "upstreamColumns": Reference("Column", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "HierarchyField": {
+        "datasource": Reference("Datasource", False),
+        "derivedLensFields": Reference("LensField", True),
+        "descriptionInherited": Reference("InheritedStringResult", True),
+        "directSheets": Reference("Sheet", True),
+        "downstreamColumns": Reference("Column", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFields": Reference("Field", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "fields": Reference("Field", True),
+        "metricDefinitions": Reference("MetricDefinition", True),
+        "referencedByBins": Reference("BinField", True),
+        "referencedByCalculations": Reference("CalculatedField", True),
+        "referencedByCombinedFields": Reference("CombinedField", True),
+        "referencedByCombinedSets": Reference("CombinedSetField", True),
+        "referencedByFields": Reference("FieldReferencingField", True),
+        "referencedByFilters": Reference("DatasourceFilter", True),
+        "referencedByFlowFieldInputField": Reference("FlowFieldInputField", True),
+        "referencedByFlowFieldOutputField": Reference("FlowFieldOutputField", True),
+        "referencedByGroups": Reference("GroupField", True),
+        "referencedByHierarchies": Reference("HierarchyField", True),
+        "referencedByRemoteFields": Reference("DatasourceField", True),
+        "referencedBySets": Reference("SetField", True),
+        "sheets": Reference("Sheet", True),
+        "upstreamColumns": Reference("Column", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "Lens": {
+        "askDataExtensions": Reference("AskDataExtension", True),
+        "datasource": Reference("Datasource", False),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "fields": Reference("LensField", True),
+        "owner": Reference("TableauUser", False),
+        "site": Reference("TableauSite", False),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("Table", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "LensField": {
+        "containingLens": Reference("Lens", False),
+        "datasourceField": Reference("Field", False),
+    },
+    "Metric": {
+        "owner": Reference("TableauUser", False),
+        "site": Reference("TableauSite", False),
+        "tags": Reference("Tag", True),
+        "underlyingView": Reference("View", False),
+        "upstreamColumns": Reference("Column", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlowColumnOutputFields": Reference("FlowColumnOutputField", True),
+        "upstreamFlowFieldOutputFields": Reference("FlowFieldOutputField", True),
+        "upstreamFlowOutputFields": Reference("FlowOutputField", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamLenses": Reference("Lens", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamWorkbooks": Reference("Workbook", True),
+    },
+    "MetricDefinition": {
+        "fields": Reference("Field", True),
+        "site": Reference("TableauSite", False),
+        "upstreamColumns": Reference("Column", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlowOutputFields": Reference("FlowOutputField", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "Parameter": {
+        "datasource": Reference("PublishedDatasource", False),
+        "referencedByBins": Reference("BinField", True),
+        "referencedByCalculations": Reference("CalculatedField", True),
+        "referencedBySets": Reference("SetField", True),
+        "workbook": Reference("Workbook", False),
+    },
+    "PublishedDatasource": {
+        "certifier": Reference("TableauUser", False),
+        "dataQualityCertifications": Reference("DataQualityCertification", True),
+        "dataQualityWarning": Reference("DataQualityWarning", False),
+        "dataQualityWarnings": Reference("DataQualityWarning", True),
+        "datasourceFilters": Reference("DatasourceFilter", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "fields": Reference("Field", True),
+        "labels": Reference("Label", True),
+        "lenses": Reference("Lens", True),
+        "owner": Reference("TableauUser", False),
+        "parameters": Reference("Parameter", True),
+        "site": Reference("TableauSite", False),
+        "tags": Reference("Tag", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "SetField": {
+        "datasource": Reference("Datasource", False),
+        "derivedLensFields": Reference("LensField", True),
+        "descriptionInherited": Reference("InheritedStringResult", True),
+        "directSheets": Reference("Sheet", True),
+        "downstreamColumns": Reference("Column", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFields": Reference("Field", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "fields": Reference("Field", True),
+        "metricDefinitions": Reference("MetricDefinition", True),
+        "parameters": Reference("Parameter", True),
+        "referencedByBins": Reference("BinField", True),
+        "referencedByCalculations": Reference("CalculatedField", True),
+        "referencedByCombinedFields": Reference("CombinedField", True),
+        "referencedByCombinedSets": Reference("CombinedSetField", True),
+        "referencedByFields": Reference("FieldReferencingField", True),
+        "referencedByFilters": Reference("DatasourceFilter", True),
+        "referencedByFlowFieldInputField": Reference("FlowFieldInputField", True),
+        "referencedByFlowFieldOutputField": Reference("FlowFieldOutputField", True),
+        "referencedByGroups": Reference("GroupField", True),
+        "referencedByHierarchies": Reference("HierarchyField", True),
+        "referencedByRemoteFields": Reference("DatasourceField", True),
+        "referencedBySets": Reference("SetField", True),
+        "sheets": Reference("Sheet", True),
+        "upstreamColumns": Reference("Column", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "Sheet": {
+        "containedInDashboards": Reference("Dashboard", True),
+        "datasourceFields": Reference("Field", True),
+        "parentEmbeddedDatasources": Reference("EmbeddedDatasource", True),
+        "referencedByMetrics": Reference("Metric", True),
+        "sheetFieldInstances": Reference("Field", True),
+        "tags": Reference("Tag", True),
+        "upstreamColumns": Reference("Column", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("Datasource", True),
+        "upstreamFields": Reference("Field", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamTables": Reference("Table", True),
+        "workbook": Reference("Workbook", False),
+        "worksheetFields": Reference("CalculatedField", True),
+    },
+    "TableAdditionalDetails": {
+        "table": Reference("DatabaseTable", True),
+    },
+    "TableauSite": {
+        "flows": Reference("Flow", True),
+        "lenses": Reference("Lens", True),
+        "metricDefinitions": Reference("MetricDefinition", True),
+        "metrics": Reference("Metric", True),
+        "publishedDatasources": Reference("PublishedDatasource", True),
+        "virtualConnections": Reference("VirtualConnection", True),
+        "workbooks": Reference("Workbook", True),
+    },
+    "TableauUser": {
+        "authoredDataQualityCertifications": Reference(
+            "DataQualityCertification", True
+        ),
+        "authoredDataQualityWarnings": Reference("DataQualityWarning", True),
+        "authoredLabels": Reference("Label", True),
+        "certifiedDatabases": Reference("Database", True),
+        "certifiedDatasources": Reference("PublishedDatasource", True),
+        "certifiedTables": Reference("DatabaseTable", True),
+        "contactForDatabases": Reference("Database", True),
+        "contactForTables": Reference("DatabaseTable", True),
+        "ownedDatasources": Reference("PublishedDatasource", True),
+        "ownedFlows": Reference("Flow", True),
+        "ownedLenses": Reference("Lens", True),
+        "ownedMetrics": Reference("Metric", True),
+        "ownedVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "ownedVirtualConnections": Reference("VirtualConnection", True),
+        "ownedWorkbooks": Reference("Workbook", True),
+    },
+    "Tag": {
+        "assets": Reference("Taggable", True),
+        "columns": Reference("Column", True),
+        "databaseTables": Reference("DatabaseTable", True),
+        "databases": Reference("Database", True),
+        "flows": Reference("Flow", True),
+        "metrics": Reference("Metric", True),
+        "publishedDatasources": Reference("PublishedDatasource", True),
+        "views": Reference("View", True),
+        "virtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "virtualConnections": Reference("VirtualConnection", True),
+        "workbooks": Reference("Workbook", True),
+    },
+    "VirtualConnection": {
+        "dataQualityCertifications": Reference("DataQualityCertification", True),
+        "dataQualityWarning": Reference("DataQualityWarning", False),
+        "dataQualityWarnings": Reference("DataQualityWarning", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "labels": Reference("Label", True),
+        "owner": Reference("TableauUser", False),
+        "site": Reference("TableauSite", False),
+        "tables": Reference("VirtualConnectionTable", True),
+        "tags": Reference("Tag", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+    },
+    "VirtualConnectionTable": {
+        "columns": Reference("Column", True),
+        "dataQualityCertifications": Reference("DataQualityCertification", True),
+        "dataQualityWarning": Reference("DataQualityWarning", False),
+        "dataQualityWarnings": Reference("DataQualityWarning", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "labels": Reference("Label", True),
+        "owner": Reference("TableauUser", False),
+        "tags": Reference("Tag", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+        "virtualConnection": Reference("VirtualConnection", False),
+    },
+    "WebDataConnector": {
+        "certifier": Reference("TableauUser", False),
+        "contact": Reference("TableauUser", False),
+        "dataQualityCertifications": Reference("DataQualityCertification", True),
+        "dataQualityWarning": Reference("DataQualityWarning", False),
+        "dataQualityWarnings": Reference("DataQualityWarning", True),
+        "downstreamDashboards": Reference("Dashboard", True),
+        "downstreamDatabases": Reference("Database", True),
+        "downstreamDatasources": Reference("PublishedDatasource", True),
+        "downstreamFlows": Reference("Flow", True),
+        "downstreamLenses": Reference("Lens", True),
+        "downstreamMetricDefinitions": Reference("MetricDefinition", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "downstreamSheets": Reference("Sheet", True),
+        "downstreamTables": Reference("DatabaseTable", True),
+        "downstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "downstreamVirtualConnections": Reference("VirtualConnection", True),
+        "downstreamWorkbooks": Reference("Workbook", True),
+        "labels": Reference("Label", True),
+        "referencedByQueries": Reference("CustomSQLTable", True),
+        "tables": Reference("DatabaseTable", True),
+        "tags": Reference("Tag", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+    },
+    "Workbook": {
+        "dashboards": Reference("Dashboard", True),
+        "downstreamMetrics": Reference("Metric", True),
+        "downstreamOwners": Reference("TableauUser", True),
+        "embeddedDatasources": Reference("EmbeddedDatasource", True),
+        "owner": Reference("TableauUser", False),
+        "parameters": Reference("Parameter", True),
+        "sheets": Reference("Sheet", True),
+        "site": Reference("TableauSite", False),
+        "tags": Reference("Tag", True),
+        "upstreamDataQualityWarnings": Reference("DataQualityWarning", True),
+        "upstreamDatabases": Reference("Database", True),
+        "upstreamDatasources": Reference("PublishedDatasource", True),
+        "upstreamFlows": Reference("Flow", True),
+        "upstreamLabels": Reference("Label", True),
+        "upstreamLenses": Reference("Lens", True),
+        "upstreamTables": Reference("DatabaseTable", True),
+        "upstreamVirtualConnectionTables": Reference("VirtualConnectionTable", True),
+        "upstreamVirtualConnections": Reference("VirtualConnection", True),
+        "views": Reference("View", True),
+    },
+}
+
+
+BatchLoad = Callable[[str, str, List[str], Dict[str, Any]], Awaitable[Sequence[Any]]]
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _cache_key(key: Tuple[str, Hashable, Any]) -> Hashable:
+    return key[:2]
+
+
+def _parent_id(source: Any) -> Optional[str]:
+    if isinstance(source, dict):
+        return source.get("id")
+    return getattr(source, "id", None)
+
+
+class ReferenceLoaders:
+    """
+    Per-request DataLoaders for every field in `REFERENCES`.
+
+    `batch_load(parent_type, field, parent_ids, args)` is the backend
+    call: it returns one result per parent id, in order, `None` or a list
+    as the field's type requires. Loads of the same field with the same
+    arguments that are issued in one tick of the event loop, like the
+    `workbook` of every sheet of a page, are passed to one call. Create a
+    new instance per request so results are not cached across requests.
+    """
+
+    def __init__(
+        self, batch_load: BatchLoad, max_batch_size: Optional[int] = None
+    ) -> None:
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self._loaders: Dict[Tuple[str, str], DataLoader] = {}
+
+    def loader(self, parent_type: str, field: str) -> DataLoader:
+        key = (parent_type, field)
+        loader = self._loaders.get(key)
+        if loader is None:
+            loader = self._loaders[key] = DataLoader(
+                load_fn=partial(self._load_batch, parent_type, field),
+                max_batch_size=self.max_batch_size,
+                cache_key_fn=_cache_key,
+            )
+        return loader
+
+    def load(
+        self,
+        parent_type: str,
+        field: str,
+        parent_id: str,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> Awaitable[Any]:
+        return self.loader(parent_type, field).load(
+            (parent_id, _freeze(args or {}), args or {})
+        )
+
+    def field_resolver(self, source: Any, info: Any, **args: Any) -> Any:
+        """
+        A graphql-core `field_resolver` that batches reference fields and
+        resolves everything else like `default_field_resolver`.
+        """
+        parent_type = info.parent_type.name
+        parent_id = _parent_id(source)
+        if info.field_name in REFERENCES.get(parent_type, ()) and parent_id:
+            return self.load(parent_type, info.field_name, parent_id, args)
+        return default_field_resolver(source, info, **args)
+
+    async def _load_batch(
+        self, parent_type: str, field: str, keys: List[Tuple[str, Hashable, Any]]
+    ) -> List[Any]:
+        groups: Dict[Hashable, List[int]] = {}
+        for index, (_, frozen_args, _) in enumerate(keys):
+            groups.setdefault(frozen_args, []).append(index)
+
+        results: List[Any] = [None] * len(keys)
+        for indexes in groups.values():
+            args = keys[indexes[0]][2]
+            values = await self.batch_load(
+                parent_type, field, [keys[index][0] for index in indexes], args
+            )
+            for index, value in zip(indexes, values):
+                results[index] = value
+        return results
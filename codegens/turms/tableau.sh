@@ -1 +1,5 @@
 turms gen
+# this minifies Meta.document and keeps __typename only on unions and interfaces
+# (add --keep-typename to only minify)
+python ../../tools/minify_documents.py tableau_api/schema.py
+python ../../tools/msgspec_codegen.py tableau_api.schema -o tableau_structs.py
@@ -152,7 +152,7 @@ class GetItems_databaseTablesConnection(BaseModel):
         after: Optional[str] = Field(default=None)
 
     class Meta:
-        document = 'query GetItems_databaseTablesConnection($first: Int, $after: String) {\n  databaseTablesConnection(\n    first: $first\n    after: $after\n    filter: {idWithin: ["76e2151b-124f-7ec8-896b-dd107eafca05", "a1b165ad-c7c2-282d-94c5-1b8a877936ee", "2d3bdb4e-08da-a6da-fecb-a3c10abba357", "92b0a3ae-2fc9-1b42-47e0-c17d0f0b615a", "63ffbbfe-8c2d-c4f3-7a28-e11f247227c7", "06d776e1-9376-bc06-84d5-c7a5c4253bf5", "159ed86e-796f-3f13-8f07-3e63c271015e", "2f2ccb48-edd5-0e02-4d51-eb3b0819fbf1", "2fe499f7-9c5a-81ef-f32d-9553dcc86044", "4a34ada9-ed4a-089f-01d0-4a1f230ee2e6"]}\n  ) {\n    nodes {\n      id\n      isEmbedded\n      columns {\n        remoteType\n        name\n        __typename\n      }\n      __typename\n    }\n    pageInfo {\n      hasNextPage\n      endCursor\n      __typename\n    }\n    __typename\n  }\n}'
+        document = 'query GetItems_databaseTablesConnection($first:Int$after:String){databaseTablesConnection(first:$first after:$after filter:{idWithin:["76e2151b-124f-7ec8-896b-dd107eafca05" "a1b165ad-c7c2-282d-94c5-1b8a877936ee" "2d3bdb4e-08da-a6da-fecb-a3c10abba357" "92b0a3ae-2fc9-1b42-47e0-c17d0f0b615a" "63ffbbfe-8c2d-c4f3-7a28-e11f247227c7" "06d776e1-9376-bc06-84d5-c7a5c4253bf5" "159ed86e-796f-3f13-8f07-3e63c271015e" "2f2ccb48-edd5-0e02-4d51-eb3b0819fbf1" "2fe499f7-9c5a-81ef-f32d-9553dcc86044" "4a34ada9-ed4a-089f-01d0-4a1f230ee2e6"]}){nodes{id isEmbedded columns{remoteType name}}pageInfo{hasNextPage endCursor}}}'
 
 
 class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtablesDatabaseBase(
@@ -538,7 +538,7 @@ class GetItems_customSQLTablesConnection(BaseModel):
         after: Optional[str] = Field(default=None)
 
     class Meta:
-        document = 'query GetItems_customSQLTablesConnection($first: Int, $after: String) {\n  customSQLTablesConnection(\n    first: $first\n    after: $after\n    filter: {idWithin: ["81335c49-5edc-bbfa-77c9-c4a1cd444501", "48c19c5f-4300-07bb-17ee-1fbdf6824ff6"]}\n  ) {\n    nodes {\n      id\n      name\n      query\n      columns {\n        id\n        name\n        remoteType\n        description\n        referencedByFields {\n          datasource {\n            __typename\n            id\n            name\n            upstreamTables {\n              id\n              name\n              database {\n                name\n                id\n                __typename\n              }\n              schema\n              fullName\n              connectionType\n              __typename\n            }\n            ... on PublishedDatasource {\n              projectName\n              luid\n            }\n            ... on EmbeddedDatasource {\n              workbook {\n                id\n                name\n                projectName\n                luid\n              }\n            }\n          }\n          __typename\n        }\n        __typename\n      }\n      tables {\n        id\n        name\n        database {\n          name\n          id\n          __typename\n        }\n        schema\n        fullName\n        connectionType\n        description\n        columnsConnection {\n          totalCount\n          __typename\n        }\n        __typename\n      }\n      connectionType\n      database {\n        name\n        id\n        connectionType\n        __typename\n      }\n      __typename\n    }\n    pageInfo {\n      hasNextPage\n      endCursor\n      __typename\n    }\n    __typename\n  }\n}'
+        document = 'query GetItems_customSQLTablesConnection($first:Int$after:String){customSQLTablesConnection(first:$first after:$after filter:{idWithin:["81335c49-5edc-bbfa-77c9-c4a1cd444501" "48c19c5f-4300-07bb-17ee-1fbdf6824ff6"]}){nodes{id name query columns{id name remoteType description referencedByFields{datasource{__typename id name upstreamTables{id name database{name id __typename}schema fullName connectionType}...on PublishedDatasource{projectName luid}...on EmbeddedDatasource{workbook{id name projectName luid}}}}}tables{id name database{name id __typename}schema fullName connectionType description columnsConnection{totalCount}}connectionType database{name id connectionType __typename}}pageInfo{hasNextPage endCursor}}}'
 
 
 class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtablesDatabaseBase(
@@ -856,7 +856,7 @@ class GetItems_publishedDatasourcesConnection(BaseModel):
         after: Optional[str] = Field(default=None)
 
     class Meta:
-        document = 'query GetItems_publishedDatasourcesConnection($first: Int, $after: String) {\n  publishedDatasourcesConnection(\n    first: $first\n    after: $after\n    filter: {idWithin: ["35d62018-68e1-6ad4-2cf0-d3ede4ee9a67", "87d9d9d8-59a8-adc3-3e06-f75c5b98ec52", "ae8b52c9-1481-06fd-fe96-e6d4938f9fcb"]}\n  ) {\n    nodes {\n      __typename\n      id\n      name\n      luid\n      hasExtracts\n      extractLastRefreshTime\n      extractLastIncrementalUpdateTime\n      extractLastUpdateTime\n      upstreamTables {\n        id\n        name\n        database {\n          name\n          id\n          __typename\n        }\n        schema\n        fullName\n        connectionType\n        description\n        columnsConnection {\n          totalCount\n          __typename\n        }\n        __typename\n      }\n      fields {\n        __typename\n        id\n        name\n        description\n        isHidden\n        folderName\n        ... on ColumnField {\n          dataCategory\n          role\n          dataType\n          defaultFormat\n          aggregation\n        }\n        ... on CalculatedField {\n          role\n          dataType\n          defaultFormat\n          aggregation\n          formula\n        }\n        ... on GroupField {\n          role\n          dataType\n        }\n      }\n      owner {\n        username\n        __typename\n      }\n      description\n      uri\n      projectName\n      tags {\n        name\n        __typename\n      }\n    }\n    pageInfo {\n      hasNextPage\n      endCursor\n      __typename\n    }\n    __typename\n  }\n}'
+        document = 'query GetItems_publishedDatasourcesConnection($first:Int$after:String){publishedDatasourcesConnection(first:$first after:$after filter:{idWithin:["35d62018-68e1-6ad4-2cf0-d3ede4ee9a67" "87d9d9d8-59a8-adc3-3e06-f75c5b98ec52" "ae8b52c9-1481-06fd-fe96-e6d4938f9fcb"]}){nodes{id name luid hasExtracts extractLastRefreshTime extractLastIncrementalUpdateTime extractLastUpdateTime upstreamTables{id name database{name id __typename}schema fullName connectionType description columnsConnection{totalCount}}fields{__typename id name description isHidden folderName ...on ColumnField{dataCategory role dataType defaultFormat aggregation}...on CalculatedField{role dataType defaultFormat aggregation formula}...on GroupField{role dataType}}owner{username}description uri projectName tags{name}}pageInfo{hasNextPage endCursor}}}'
 
 
 class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBase(
@@ -1165,7 +1165,7 @@ class GetItems_fieldsConnection(BaseModel):
         after: Optional[str] = Field(default=None)
 
     class Meta:
-        document = 'query GetItems_fieldsConnection($first: Int, $after: String) {\n  fieldsConnection(\n    first: $first\n    after: $after\n    filter: {idWithin: ["668470bc-f0c9-ec5d-7a4b-172370d6ef45", "66bd48ba-a895-4951-a4e1-d26fc191eae9", "672a63ee-c34b-8cb4-506b-163fcb131a52", "72684adf-d214-0a9a-946c-dd7b3879b51f", "76636a30-dfbf-0107-0190-a0fc6ce201be", "77aa21d6-3b79-0be0-d309-3d36ef1efe71", "8fbf178a-ceef-2c97-3ac8-26f95a004d67", "968608d1-5da4-1a97-e96a-269010d4ef5b", "b5ae252a-c3c0-3a2d-c147-7a39a8de59ef", "bc1641b9-525d-00c5-f163-02519d46f0fd"]}\n  ) {\n    nodes {\n      id\n      upstreamFields {\n        name\n        datasource {\n          id\n          __typename\n        }\n        __typename\n      }\n      upstreamColumns {\n        name\n        table {\n          __typename\n          id\n        }\n        __typename\n      }\n      __typename\n    }\n    pageInfo {\n      hasNextPage\n      endCursor\n      __typename\n    }\n    __typename\n  }\n}'
+        document = 'query GetItems_fieldsConnection($first:Int$after:String){fieldsConnection(first:$first after:$after filter:{idWithin:["668470bc-f0c9-ec5d-7a4b-172370d6ef45" "66bd48ba-a895-4951-a4e1-d26fc191eae9" "672a63ee-c34b-8cb4-506b-163fcb131a52" "72684adf-d214-0a9a-946c-dd7b3879b51f" "76636a30-dfbf-0107-0190-a0fc6ce201be" "77aa21d6-3b79-0be0-d309-3d36ef1efe71" "8fbf178a-ceef-2c97-3ac8-26f95a004d67" "968608d1-5da4-1a97-e96a-269010d4ef5b" "b5ae252a-c3c0-3a2d-c147-7a39a8de59ef" "bc1641b9-525d-00c5-f163-02519d46f0fd"]}){nodes{id upstreamFields{name datasource{id __typename}__typename}upstreamColumns{name table{__typename id}}__typename}pageInfo{hasNextPage endCursor}}}'
 
 
 class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesDownstreamsheets(
@@ -1513,7 +1513,7 @@ class GetItems_embeddedDatasourcesConnection(BaseModel):
         after: Optional[str] = Field(default=None)
 
     class Meta:
-        document = 'query GetItems_embeddedDatasourcesConnection($first: Int, $after: String) {\n  embeddedDatasourcesConnection(\n    first: $first\n    after: $after\n    filter: {idWithin: ["7437c561-4e94-0283-3462-c6205c2288cd", "797a69b1-c32a-2fd4-62aa-99989c1858a6", "79871b17-d526-17be-df59-e001f7140924", "8f5e3006-6756-8eea-4fd3-44781cea1493", "1c5653d6-c448-0850-108b-5c78aeaf6b51", "6731f648-b756-31ea-fcdd-77309dd3b0c3", "6bd53e72-9fe4-ea86-3d23-14b826c13fa5", "3f46592d-f789-8f48-466e-69606990d589", "415ddd3e-be04-b466-bc7c-5678a4b0a733", "e9b47a00-12ff-72cc-9dfb-d34e0c65095d"]}\n  ) {\n    nodes {\n      __typename\n      id\n      name\n      hasExtracts\n      extractLastRefreshTime\n      extractLastIncrementalUpdateTime\n      extractLastUpdateTime\n      downstreamSheets {\n        name\n        id\n        __typename\n      }\n      upstreamTables {\n        id\n        name\n        database {\n          name\n          id\n          __typename\n        }\n        schema\n        fullName\n        connectionType\n        description\n        columnsConnection {\n          totalCount\n          __typename\n        }\n        __typename\n      }\n      fields {\n        __typename\n        id\n        name\n        description\n        isHidden\n        folderName\n        ... on ColumnField {\n          dataCategory\n          role\n          dataType\n          defaultFormat\n          aggregation\n        }\n        ... on CalculatedField {\n          role\n          dataType\n          defaultFormat\n          aggregation\n          formula\n        }\n        ... on GroupField {\n          role\n          dataType\n        }\n      }\n      upstreamDatasources {\n        id\n        name\n        __typename\n      }\n      workbook {\n        id\n        name\n        projectName\n        luid\n        owner {\n          username\n          __typename\n        }\n        __typename\n      }\n    }\n    pageInfo {\n      hasNextPage\n      endCursor\n      __typename\n    }\n    __typename\n  }\n}'
+        document = 'query GetItems_embeddedDatasourcesConnection($first:Int$after:String){embeddedDatasourcesConnection(first:$first after:$after filter:{idWithin:["7437c561-4e94-0283-3462-c6205c2288cd" "797a69b1-c32a-2fd4-62aa-99989c1858a6" "79871b17-d526-17be-df59-e001f7140924" "8f5e3006-6756-8eea-4fd3-44781cea1493" "1c5653d6-c448-0850-108b-5c78aeaf6b51" "6731f648-b756-31ea-fcdd-77309dd3b0c3" "6bd53e72-9fe4-ea86-3d23-14b826c13fa5" "3f46592d-f789-8f48-466e-69606990d589" "415ddd3e-be04-b466-bc7c-5678a4b0a733" "e9b47a00-12ff-72cc-9dfb-d34e0c65095d"]}){nodes{id name hasExtracts extractLastRefreshTime extractLastIncrementalUpdateTime extractLastUpdateTime downstreamSheets{name id}upstreamTables{id name database{name id __typename}schema fullName connectionType description columnsConnection{totalCount}}fields{__typename id name description isHidden folderName ...on ColumnField{dataCategory role dataType defaultFormat aggregation}...on CalculatedField{role dataType defaultFormat aggregation formula}...on GroupField{role dataType}}upstreamDatasources{id name}workbook{id name projectName luid owner{username}}}pageInfo{hasNextPage endCursor}}}'
 
 
 class GetItems_sheetsConnectionSheetsconnectionNodesTags(BaseModel):
@@ -1764,7 +1764,7 @@ class GetItems_sheetsConnection(BaseModel):
         after: Optional[str] = Field(default=None)
 
     class Meta:
-        document = 'query GetItems_sheetsConnection($first: Int, $after: String) {\n  sheetsConnection(\n    first: $first\n    after: $after\n    filter: {idWithin: ["fa9e30e8-645e-1105-642d-c292c70a921c", "cea027c2-24a2-d009-4ccf-ac172a3fac6e", "b4f94b9f-26dc-3fb3-1973-796e4c91cb21", "f6682a87-7396-f12e-2fd1-0424157c6ceb", "8fb398c1-0b18-528a-c3bd-2a03c35528f5", "ffe3435f-3e0b-9618-389c-055cbed13ac9", "4e51108f-3ba4-0749-6518-8104fc62c202", "67f86c94-c102-447a-8752-b1e497bf4551", "cbb0b196-5f2a-ecd4-0b2b-e87db220ff47", "1359177d-c634-2cff-4408-1751152c7fc2"]}\n  ) {\n    nodes {\n      id\n      name\n      path\n      luid\n      createdAt\n      updatedAt\n      tags {\n        name\n        __typename\n      }\n      containedInDashboards {\n        name\n        path\n        __typename\n      }\n      workbook {\n        id\n        name\n        projectName\n        luid\n        owner {\n          username\n          __typename\n        }\n        __typename\n      }\n      datasourceFields {\n        __typename\n        id\n        name\n        description\n        datasource {\n          id\n          name\n          __typename\n        }\n        ... on ColumnField {\n          dataCategory\n          role\n          dataType\n          aggregation\n        }\n        ... on CalculatedField {\n          role\n          dataType\n          aggregation\n          formula\n        }\n        ... on GroupField {\n          role\n          dataType\n        }\n        ... on DatasourceField {\n          remoteField {\n            __typename\n            id\n            name\n            description\n            folderName\n            ... on ColumnField {\n              dataCategory\n              role\n              dataType\n              aggregation\n            }\n            ... on CalculatedField {\n              role\n              dataType\n              aggregation\n              formula\n            }\n            ... on GroupField {\n              role\n              dataType\n            }\n          }\n        }\n      }\n      __typename\n    }\n    pageInfo {\n      hasNextPage\n      endCursor\n      __typename\n    }\n    __typename\n  }\n}'
+        document = 'query GetItems_sheetsConnection($first:Int$after:String){sheetsConnection(first:$first after:$after filter:{idWithin:["fa9e30e8-645e-1105-642d-c292c70a921c" "cea027c2-24a2-d009-4ccf-ac172a3fac6e" "b4f94b9f-26dc-3fb3-1973-796e4c91cb21" "f6682a87-7396-f12e-2fd1-0424157c6ceb" "8fb398c1-0b18-528a-c3bd-2a03c35528f5" "ffe3435f-3e0b-9618-389c-055cbed13ac9" "4e51108f-3ba4-0749-6518-8104fc62c202" "67f86c94-c102-447a-8752-b1e497bf4551" "cbb0b196-5f2a-ecd4-0b2b-e87db220ff47" "1359177d-c634-2cff-4408-1751152c7fc2"]}){nodes{id name path luid createdAt updatedAt tags{name}containedInDashboards{name path}workbook{id name projectName luid owner{username}}datasourceFields{__typename id name description datasource{id name __typename}...on ColumnField{dataCategory role dataType aggregation}...on CalculatedField{role dataType aggregation formula}...on GroupField{role dataType}...on DatasourceField{remoteField{__typename id name description folderName ...on ColumnField{dataCategory role dataType aggregation}...on CalculatedField{role dataType aggregation formula}...on GroupField{role dataType}}}}}pageInfo{hasNextPage endCursor}}}'
 
 
 class GetItems_workbooksConnectionWorkbooksconnectionNodesOwner(BaseModel):
@@ -1882,4 +1882,4 @@ class GetItems_workbooksConnection(BaseModel):
         after: Optional[str] = Field(default=None)
 
     class Meta:
-        document = 'query GetItems_workbooksConnection($first: Int, $after: String) {\n  workbooksConnection(\n    first: $first\n    after: $after\n    filter: {projectNameWithin: ["project_test2"]}\n  ) {\n    nodes {\n      id\n      name\n      luid\n      uri\n      projectName\n      owner {\n        username\n        __typename\n      }\n      description\n      uri\n      createdAt\n      updatedAt\n      tags {\n        name\n        __typename\n      }\n      sheets {\n        id\n        __typename\n      }\n      dashboards {\n        id\n        __typename\n      }\n      embeddedDatasources {\n        id\n        __typename\n      }\n      __typename\n    }\n    pageInfo {\n      hasNextPage\n      endCursor\n      __typename\n    }\n    __typename\n  }\n}'
+        document = 'query GetItems_workbooksConnection($first:Int$after:String){workbooksConnection(first:$first after:$after filter:{projectNameWithin:["project_test2"]}){nodes{id name luid uri projectName owner{username}description uri createdAt updatedAt tags{name}sheets{id}dashboards{id}embeddedDatasources{id}}pageInfo{hasNextPage endCursor}}}'
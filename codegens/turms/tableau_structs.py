@@ -0,0 +1,2399 @@
+# Generated by tools/msgspec_codegen.py
+# Source: tableau_api.schema
+
+from datetime import datetime
+from typing import Any, List, Literal, Optional, Union
+
+import msgspec
+
+from tableau_api.schema import RemoteType
+
+
+class GetItems_databaseTablesConnectionDatabasetablesconnectionNodesColumns(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "remote_type": "remoteType"},
+):
+    typename: Literal["Column"] = "Column"
+    remote_type: RemoteType
+    name: Optional[str] = None
+
+
+class GetItems_databaseTablesConnectionDatabasetablesconnectionNodes(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "is_embedded": "isEmbedded"},
+):
+    typename: Literal["DatabaseTable"] = "DatabaseTable"
+    id: str
+    is_embedded: Optional[bool] = None
+    columns: List[
+        "GetItems_databaseTablesConnectionDatabasetablesconnectionNodesColumns"
+    ]
+
+
+class GetItems_databaseTablesConnectionDatabasetablesconnectionPageinfo(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "has_next_page": "hasNextPage",
+        "end_cursor": "endCursor",
+    },
+):
+    typename: Literal["PageInfo"] = "PageInfo"
+    has_next_page: bool
+    end_cursor: Optional[str] = None
+
+
+class GetItems_databaseTablesConnectionDatabasetablesconnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "page_info": "pageInfo"},
+):
+    typename: Literal["DatabaseTablesConnection"] = "DatabaseTablesConnection"
+    nodes: List["GetItems_databaseTablesConnectionDatabasetablesconnectionNodes"]
+    page_info: "GetItems_databaseTablesConnectionDatabasetablesconnectionPageinfo"
+
+
+class GetItems_databaseTablesConnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"database_tables_connection": "databaseTablesConnection"},
+):
+    database_tables_connection: (
+        "GetItems_databaseTablesConnectionDatabasetablesconnection"
+    )
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtablesDatabaseBase(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    name: Optional[str] = None
+    id: str
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtablesDatabaseBaseCloudFile(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="CloudFile"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtablesDatabaseBaseDataCloud(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="DataCloud"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtablesDatabaseBaseDatabaseServer(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="DatabaseServer"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtablesDatabaseBaseFile(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="File"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtablesDatabaseBaseWebDataConnector(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="WebDataConnector",
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtables(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "full_name": "fullName",
+        "connection_type": "connectionType",
+    },
+):
+    typename: Literal["DatabaseTable"] = "DatabaseTable"
+    id: str
+    name: Optional[str] = None
+    database: Optional[
+        Union[
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtablesDatabaseBaseCloudFile",
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtablesDatabaseBaseDataCloud",
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtablesDatabaseBaseDatabaseServer",
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtablesDatabaseBaseFile",
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtablesDatabaseBaseWebDataConnector",
+        ]
+    ] = None
+    schema: Optional[str] = None
+    full_name: Optional[str] = None
+    connection_type: Optional[str] = None
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceBase(
+    msgspec.Struct, kw_only=True, gc=False, rename={"upstream_tables": "upstreamTables"}
+):
+    id: str
+    name: Optional[str] = None
+    upstream_tables: List[
+        "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtables"
+    ]
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceBaseEmbeddedDatasource(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="EmbeddedDatasource",
+    rename={"upstream_tables": "upstreamTables"},
+):
+    id: str
+    name: Optional[str] = None
+    upstream_tables: List[
+        "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtables"
+    ]
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceBasePublishedDatasource(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="PublishedDatasource",
+    rename={"upstream_tables": "upstreamTables"},
+):
+    id: str
+    name: Optional[str] = None
+    upstream_tables: List[
+        "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceUpstreamtables"
+    ]
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfields(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["ColumnField"] = "ColumnField"
+    datasource: Optional[
+        Union[
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumns(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "remote_type": "remoteType",
+        "referenced_by_fields": "referencedByFields",
+    },
+):
+    typename: Literal["Column"] = "Column"
+    id: str
+    name: Optional[str] = None
+    remote_type: RemoteType
+    description: Optional[str] = None
+    referenced_by_fields: Optional[
+        List[
+            Optional[
+                "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumnsReferencedbyfields"
+            ]
+        ]
+    ] = None
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTablesDatabaseBase(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    name: Optional[str] = None
+    id: str
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTablesDatabaseBaseCloudFile(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="CloudFile"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTablesDatabaseBaseDataCloud(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="DataCloud"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTablesDatabaseBaseDatabaseServer(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="DatabaseServer"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTablesDatabaseBaseFile(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="File"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTablesDatabaseBaseWebDataConnector(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="WebDataConnector",
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTablesColumnsconnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "total_count": "totalCount"},
+):
+    typename: Literal["ColumnsConnection"] = "ColumnsConnection"
+    total_count: int
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTables(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "full_name": "fullName",
+        "connection_type": "connectionType",
+        "columns_connection": "columnsConnection",
+    },
+):
+    typename: Literal["DatabaseTable"] = "DatabaseTable"
+    id: str
+    name: Optional[str] = None
+    database: Optional[
+        Union[
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTablesDatabaseBaseCloudFile",
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTablesDatabaseBaseDataCloud",
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTablesDatabaseBaseDatabaseServer",
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTablesDatabaseBaseFile",
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTablesDatabaseBaseWebDataConnector",
+        ]
+    ] = None
+    schema: Optional[str] = None
+    full_name: Optional[str] = None
+    connection_type: Optional[str] = None
+    description: Optional[str] = None
+    columns_connection: Optional[
+        "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTablesColumnsconnection"
+    ] = None
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesDatabaseBase(
+    msgspec.Struct, kw_only=True, gc=False, rename={"connection_type": "connectionType"}
+):
+    name: Optional[str] = None
+    id: str
+    connection_type: Optional[str] = None
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesDatabaseBaseCloudFile(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CloudFile",
+    rename={"connection_type": "connectionType"},
+):
+    name: Optional[str] = None
+    id: str
+    connection_type: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesDatabaseBaseDataCloud(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="DataCloud",
+    rename={"connection_type": "connectionType"},
+):
+    name: Optional[str] = None
+    id: str
+    connection_type: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesDatabaseBaseDatabaseServer(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="DatabaseServer",
+    rename={"connection_type": "connectionType"},
+):
+    name: Optional[str] = None
+    id: str
+    connection_type: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesDatabaseBaseFile(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="File",
+    rename={"connection_type": "connectionType"},
+):
+    name: Optional[str] = None
+    id: str
+    connection_type: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesDatabaseBaseWebDataConnector(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="WebDataConnector",
+    rename={"connection_type": "connectionType"},
+):
+    name: Optional[str] = None
+    id: str
+    connection_type: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodes(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "connection_type": "connectionType"},
+):
+    typename: Literal["CustomSQLTable"] = "CustomSQLTable"
+    id: str
+    name: Optional[str] = None
+    query: Optional[str] = None
+    columns: List[
+        "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesColumns"
+    ]
+    tables: List[
+        "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesTables"
+    ]
+    connection_type: Optional[str] = None
+    database: Optional[
+        Union[
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesDatabaseBaseCloudFile",
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesDatabaseBaseDataCloud",
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesDatabaseBaseDatabaseServer",
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesDatabaseBaseFile",
+            "GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodesDatabaseBaseWebDataConnector",
+        ]
+    ] = None
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnectionPageinfo(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "has_next_page": "hasNextPage",
+        "end_cursor": "endCursor",
+    },
+):
+    typename: Literal["PageInfo"] = "PageInfo"
+    has_next_page: bool
+    end_cursor: Optional[str] = None
+
+
+class GetItems_customSQLTablesConnectionCustomsqltablesconnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "page_info": "pageInfo"},
+):
+    typename: Literal["CustomSQLTablesConnection"] = "CustomSQLTablesConnection"
+    nodes: List["GetItems_customSQLTablesConnectionCustomsqltablesconnectionNodes"]
+    page_info: "GetItems_customSQLTablesConnectionCustomsqltablesconnectionPageinfo"
+
+
+class GetItems_customSQLTablesConnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"custom_sql_tables_connection": "customSQLTablesConnection"},
+):
+    custom_sql_tables_connection: (
+        "GetItems_customSQLTablesConnectionCustomsqltablesconnection"
+    )
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtablesDatabaseBase(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    name: Optional[str] = None
+    id: str
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtablesDatabaseBaseCloudFile(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="CloudFile"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtablesDatabaseBaseDataCloud(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="DataCloud"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtablesDatabaseBaseDatabaseServer(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="DatabaseServer"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtablesDatabaseBaseFile(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="File"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtablesDatabaseBaseWebDataConnector(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="WebDataConnector",
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtablesColumnsconnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "total_count": "totalCount"},
+):
+    typename: Literal["ColumnsConnection"] = "ColumnsConnection"
+    total_count: int
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtables(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "full_name": "fullName",
+        "connection_type": "connectionType",
+        "columns_connection": "columnsConnection",
+    },
+):
+    typename: Literal["DatabaseTable"] = "DatabaseTable"
+    id: str
+    name: Optional[str] = None
+    database: Optional[
+        Union[
+            "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtablesDatabaseBaseCloudFile",
+            "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtablesDatabaseBaseDataCloud",
+            "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtablesDatabaseBaseDatabaseServer",
+            "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtablesDatabaseBaseFile",
+            "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtablesDatabaseBaseWebDataConnector",
+        ]
+    ] = None
+    schema: Optional[str] = None
+    full_name: Optional[str] = None
+    connection_type: Optional[str] = None
+    description: Optional[str] = None
+    columns_connection: Optional[
+        "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtablesColumnsconnection"
+    ] = None
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBase(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseBinField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="BinField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseCalculatedField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CalculatedField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseColumnField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="ColumnField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseCombinedField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CombinedField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseCombinedSetField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CombinedSetField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseDatasourceField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="DatasourceField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseGroupField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="GroupField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseHierarchyField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="HierarchyField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseSetField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="SetField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesOwner(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["TableauUser"] = "TableauUser"
+    username: Optional[str] = None
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesTags(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["Tag"] = "Tag"
+    name: Optional[str] = None
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodes(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "has_extracts": "hasExtracts",
+        "extract_last_refresh_time": "extractLastRefreshTime",
+        "extract_last_incremental_update_time": "extractLastIncrementalUpdateTime",
+        "extract_last_update_time": "extractLastUpdateTime",
+        "upstream_tables": "upstreamTables",
+        "project_name": "projectName",
+    },
+):
+    typename: Literal["PublishedDatasource"] = "PublishedDatasource"
+    id: str
+    name: Optional[str] = None
+    luid: str
+    has_extracts: Optional[bool] = None
+    extract_last_refresh_time: Optional[datetime] = None
+    extract_last_incremental_update_time: Optional[datetime] = None
+    extract_last_update_time: Optional[datetime] = None
+    upstream_tables: List[
+        "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesUpstreamtables"
+    ]
+    fields: List[
+        Union[
+            "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseBinField",
+            "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseCalculatedField",
+            "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseColumnField",
+            "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseCombinedField",
+            "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseCombinedSetField",
+            "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseDatasourceField",
+            "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseGroupField",
+            "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseHierarchyField",
+            "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesFieldsBaseSetField",
+        ]
+    ]
+    owner: "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesOwner"
+    description: Optional[str] = None
+    uri: Optional[str] = None
+    project_name: Optional[str] = None
+    tags: List[
+        "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodesTags"
+    ]
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionPageinfo(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "has_next_page": "hasNextPage",
+        "end_cursor": "endCursor",
+    },
+):
+    typename: Literal["PageInfo"] = "PageInfo"
+    has_next_page: bool
+    end_cursor: Optional[str] = None
+
+
+class GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "page_info": "pageInfo"},
+):
+    typename: Literal["PublishedDatasourcesConnection"] = (
+        "PublishedDatasourcesConnection"
+    )
+    nodes: List[
+        "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionNodes"
+    ]
+    page_info: (
+        "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnectionPageinfo"
+    )
+
+
+class GetItems_publishedDatasourcesConnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"published_datasources_connection": "publishedDatasourcesConnection"},
+):
+    published_datasources_connection: (
+        "GetItems_publishedDatasourcesConnectionPublisheddatasourcesconnection"
+    )
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBase(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    id: str
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBaseEmbeddedDatasource(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="EmbeddedDatasource",
+):
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBasePublishedDatasource(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="PublishedDatasource",
+):
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBase(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    name: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseBinField(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="BinField"
+):
+    name: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCalculatedField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CalculatedField",
+):
+    name: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseColumnField(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="ColumnField"
+):
+    name: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedField(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="CombinedField"
+):
+    name: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedSetField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CombinedSetField",
+):
+    name: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseDatasourceField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="DatasourceField",
+):
+    name: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseGroupField(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="GroupField"
+):
+    name: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseHierarchyField(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="HierarchyField"
+):
+    name: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseSetField(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="SetField"
+):
+    name: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumnsTableBase(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    id: str
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumnsTableBaseCustomSQLTable(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="CustomSQLTable"
+):
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumnsTableBaseDatabaseTable(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="DatabaseTable"
+):
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumnsTableBaseVirtualConnectionTable(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="VirtualConnectionTable",
+):
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumns(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["Column"] = "Column"
+    name: Optional[str] = None
+    table: Optional[
+        Union[
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumnsTableBaseCustomSQLTable",
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumnsTableBaseDatabaseTable",
+            "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumnsTableBaseVirtualConnectionTable",
+        ]
+    ] = None
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesBase(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"upstream_fields": "upstreamFields", "upstream_columns": "upstreamColumns"},
+):
+    id: str
+    upstream_fields: List[
+        Optional[
+            Union[
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseBinField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCalculatedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseColumnField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedSetField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseDatasourceField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseGroupField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseHierarchyField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseSetField",
+            ]
+        ]
+    ]
+    upstream_columns: List[
+        Optional["GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumns"]
+    ]
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesBaseBinField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="BinField",
+    rename={"upstream_fields": "upstreamFields", "upstream_columns": "upstreamColumns"},
+):
+    id: str
+    upstream_fields: List[
+        Optional[
+            Union[
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseBinField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCalculatedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseColumnField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedSetField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseDatasourceField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseGroupField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseHierarchyField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseSetField",
+            ]
+        ]
+    ]
+    upstream_columns: List[
+        Optional["GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumns"]
+    ]
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesBaseCalculatedField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CalculatedField",
+    rename={"upstream_fields": "upstreamFields", "upstream_columns": "upstreamColumns"},
+):
+    id: str
+    upstream_fields: List[
+        Optional[
+            Union[
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseBinField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCalculatedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseColumnField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedSetField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseDatasourceField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseGroupField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseHierarchyField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseSetField",
+            ]
+        ]
+    ]
+    upstream_columns: List[
+        Optional["GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumns"]
+    ]
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesBaseColumnField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="ColumnField",
+    rename={"upstream_fields": "upstreamFields", "upstream_columns": "upstreamColumns"},
+):
+    id: str
+    upstream_fields: List[
+        Optional[
+            Union[
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseBinField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCalculatedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseColumnField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedSetField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseDatasourceField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseGroupField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseHierarchyField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseSetField",
+            ]
+        ]
+    ]
+    upstream_columns: List[
+        Optional["GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumns"]
+    ]
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesBaseCombinedField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CombinedField",
+    rename={"upstream_fields": "upstreamFields", "upstream_columns": "upstreamColumns"},
+):
+    id: str
+    upstream_fields: List[
+        Optional[
+            Union[
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseBinField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCalculatedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseColumnField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedSetField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseDatasourceField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseGroupField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseHierarchyField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseSetField",
+            ]
+        ]
+    ]
+    upstream_columns: List[
+        Optional["GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumns"]
+    ]
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesBaseCombinedSetField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CombinedSetField",
+    rename={"upstream_fields": "upstreamFields", "upstream_columns": "upstreamColumns"},
+):
+    id: str
+    upstream_fields: List[
+        Optional[
+            Union[
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseBinField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCalculatedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseColumnField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedSetField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseDatasourceField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseGroupField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseHierarchyField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseSetField",
+            ]
+        ]
+    ]
+    upstream_columns: List[
+        Optional["GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumns"]
+    ]
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesBaseDatasourceField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="DatasourceField",
+    rename={"upstream_fields": "upstreamFields", "upstream_columns": "upstreamColumns"},
+):
+    id: str
+    upstream_fields: List[
+        Optional[
+            Union[
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseBinField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCalculatedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseColumnField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedSetField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseDatasourceField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseGroupField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseHierarchyField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseSetField",
+            ]
+        ]
+    ]
+    upstream_columns: List[
+        Optional["GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumns"]
+    ]
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesBaseGroupField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="GroupField",
+    rename={"upstream_fields": "upstreamFields", "upstream_columns": "upstreamColumns"},
+):
+    id: str
+    upstream_fields: List[
+        Optional[
+            Union[
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseBinField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCalculatedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseColumnField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedSetField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseDatasourceField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseGroupField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseHierarchyField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseSetField",
+            ]
+        ]
+    ]
+    upstream_columns: List[
+        Optional["GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumns"]
+    ]
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesBaseHierarchyField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="HierarchyField",
+    rename={"upstream_fields": "upstreamFields", "upstream_columns": "upstreamColumns"},
+):
+    id: str
+    upstream_fields: List[
+        Optional[
+            Union[
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseBinField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCalculatedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseColumnField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedSetField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseDatasourceField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseGroupField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseHierarchyField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseSetField",
+            ]
+        ]
+    ]
+    upstream_columns: List[
+        Optional["GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumns"]
+    ]
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionNodesBaseSetField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="SetField",
+    rename={"upstream_fields": "upstreamFields", "upstream_columns": "upstreamColumns"},
+):
+    id: str
+    upstream_fields: List[
+        Optional[
+            Union[
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseBinField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCalculatedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseColumnField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseCombinedSetField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseDatasourceField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseGroupField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseHierarchyField",
+                "GetItems_fieldsConnectionFieldsconnectionNodesUpstreamfieldsBaseSetField",
+            ]
+        ]
+    ]
+    upstream_columns: List[
+        Optional["GetItems_fieldsConnectionFieldsconnectionNodesUpstreamcolumns"]
+    ]
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_fieldsConnectionFieldsconnectionPageinfo(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "has_next_page": "hasNextPage",
+        "end_cursor": "endCursor",
+    },
+):
+    typename: Literal["PageInfo"] = "PageInfo"
+    has_next_page: bool
+    end_cursor: Optional[str] = None
+
+
+class GetItems_fieldsConnectionFieldsconnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "page_info": "pageInfo"},
+):
+    typename: Literal["FieldsConnection"] = "FieldsConnection"
+    nodes: List[
+        Union[
+            "GetItems_fieldsConnectionFieldsconnectionNodesBaseBinField",
+            "GetItems_fieldsConnectionFieldsconnectionNodesBaseCalculatedField",
+            "GetItems_fieldsConnectionFieldsconnectionNodesBaseColumnField",
+            "GetItems_fieldsConnectionFieldsconnectionNodesBaseCombinedField",
+            "GetItems_fieldsConnectionFieldsconnectionNodesBaseCombinedSetField",
+            "GetItems_fieldsConnectionFieldsconnectionNodesBaseDatasourceField",
+            "GetItems_fieldsConnectionFieldsconnectionNodesBaseGroupField",
+            "GetItems_fieldsConnectionFieldsconnectionNodesBaseHierarchyField",
+            "GetItems_fieldsConnectionFieldsconnectionNodesBaseSetField",
+        ]
+    ]
+    page_info: "GetItems_fieldsConnectionFieldsconnectionPageinfo"
+
+
+class GetItems_fieldsConnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"fields_connection": "fieldsConnection"},
+):
+    fields_connection: "GetItems_fieldsConnectionFieldsconnection"
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesDownstreamsheets(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["Sheet"] = "Sheet"
+    name: Optional[str] = None
+    id: str
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtablesDatabaseBase(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    name: Optional[str] = None
+    id: str
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtablesDatabaseBaseCloudFile(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="CloudFile"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtablesDatabaseBaseDataCloud(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="DataCloud"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtablesDatabaseBaseDatabaseServer(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="DatabaseServer"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtablesDatabaseBaseFile(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="File"
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtablesDatabaseBaseWebDataConnector(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="WebDataConnector",
+):
+    name: Optional[str] = None
+    id: str
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtablesColumnsconnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "total_count": "totalCount"},
+):
+    typename: Literal["ColumnsConnection"] = "ColumnsConnection"
+    total_count: int
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtables(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "full_name": "fullName",
+        "connection_type": "connectionType",
+        "columns_connection": "columnsConnection",
+    },
+):
+    typename: Literal["DatabaseTable"] = "DatabaseTable"
+    id: str
+    name: Optional[str] = None
+    database: Optional[
+        Union[
+            "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtablesDatabaseBaseCloudFile",
+            "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtablesDatabaseBaseDataCloud",
+            "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtablesDatabaseBaseDatabaseServer",
+            "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtablesDatabaseBaseFile",
+            "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtablesDatabaseBaseWebDataConnector",
+        ]
+    ] = None
+    schema: Optional[str] = None
+    full_name: Optional[str] = None
+    connection_type: Optional[str] = None
+    description: Optional[str] = None
+    columns_connection: Optional[
+        "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtablesColumnsconnection"
+    ] = None
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBase(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseBinField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="BinField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseCalculatedField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CalculatedField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseColumnField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="ColumnField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseCombinedField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CombinedField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseCombinedSetField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CombinedSetField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseDatasourceField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="DatasourceField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseGroupField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="GroupField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseHierarchyField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="HierarchyField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseSetField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="SetField",
+    rename={"is_hidden": "isHidden", "folder_name": "folderName"},
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    is_hidden: Optional[bool] = None
+    folder_name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamdatasources(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["PublishedDatasource"] = "PublishedDatasource"
+    id: str
+    name: Optional[str] = None
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesWorkbookOwner(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["TableauUser"] = "TableauUser"
+    username: Optional[str] = None
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesWorkbook(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "project_name": "projectName"},
+):
+    typename: Literal["Workbook"] = "Workbook"
+    id: str
+    name: Optional[str] = None
+    project_name: Optional[str] = None
+    luid: str
+    owner: "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesWorkbookOwner"
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodes(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "has_extracts": "hasExtracts",
+        "extract_last_refresh_time": "extractLastRefreshTime",
+        "extract_last_incremental_update_time": "extractLastIncrementalUpdateTime",
+        "extract_last_update_time": "extractLastUpdateTime",
+        "downstream_sheets": "downstreamSheets",
+        "upstream_tables": "upstreamTables",
+        "upstream_datasources": "upstreamDatasources",
+    },
+):
+    typename: Literal["EmbeddedDatasource"] = "EmbeddedDatasource"
+    id: str
+    name: Optional[str] = None
+    has_extracts: Optional[bool] = None
+    extract_last_refresh_time: Optional[datetime] = None
+    extract_last_incremental_update_time: Optional[datetime] = None
+    extract_last_update_time: Optional[datetime] = None
+    downstream_sheets: List[
+        "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesDownstreamsheets"
+    ]
+    upstream_tables: List[
+        "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamtables"
+    ]
+    fields: List[
+        Union[
+            "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseBinField",
+            "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseCalculatedField",
+            "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseColumnField",
+            "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseCombinedField",
+            "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseCombinedSetField",
+            "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseDatasourceField",
+            "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseGroupField",
+            "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseHierarchyField",
+            "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesFieldsBaseSetField",
+        ]
+    ]
+    upstream_datasources: List[
+        "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesUpstreamdatasources"
+    ]
+    workbook: Optional[
+        "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodesWorkbook"
+    ] = None
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionPageinfo(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "has_next_page": "hasNextPage",
+        "end_cursor": "endCursor",
+    },
+):
+    typename: Literal["PageInfo"] = "PageInfo"
+    has_next_page: bool
+    end_cursor: Optional[str] = None
+
+
+class GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "page_info": "pageInfo"},
+):
+    typename: Literal["EmbeddedDatasourcesConnection"] = "EmbeddedDatasourcesConnection"
+    nodes: List[
+        "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionNodes"
+    ]
+    page_info: (
+        "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnectionPageinfo"
+    )
+
+
+class GetItems_embeddedDatasourcesConnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"embedded_datasources_connection": "embeddedDatasourcesConnection"},
+):
+    embedded_datasources_connection: (
+        "GetItems_embeddedDatasourcesConnectionEmbeddeddatasourcesconnection"
+    )
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesTags(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["Tag"] = "Tag"
+    name: Optional[str] = None
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesContainedindashboards(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["Dashboard"] = "Dashboard"
+    name: Optional[str] = None
+    path: Optional[str] = None
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesWorkbookOwner(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["TableauUser"] = "TableauUser"
+    username: Optional[str] = None
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesWorkbook(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "project_name": "projectName"},
+):
+    typename: Literal["Workbook"] = "Workbook"
+    id: str
+    name: Optional[str] = None
+    project_name: Optional[str] = None
+    luid: str
+    owner: "GetItems_sheetsConnectionSheetsconnectionNodesWorkbookOwner"
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBase(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    id: str
+    name: Optional[str] = None
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBaseEmbeddedDatasource(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="EmbeddedDatasource",
+):
+    id: str
+    name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBasePublishedDatasource(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="PublishedDatasource",
+):
+    id: str
+    name: Optional[str] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBase(
+    msgspec.Struct, kw_only=True, gc=False
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseBinField(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="BinField"
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseCalculatedField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CalculatedField",
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseColumnField(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="ColumnField"
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseCombinedField(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="CombinedField"
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseCombinedSetField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="CombinedSetField",
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseDatasourceField(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    tag_field="__typename",
+    tag="DatasourceField",
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseGroupField(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="GroupField"
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseHierarchyField(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="HierarchyField"
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseSetField(
+    msgspec.Struct, kw_only=True, gc=False, tag_field="__typename", tag="SetField"
+):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    datasource: Optional[
+        Union[
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBaseEmbeddedDatasource",
+            "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsDatasourceBasePublishedDatasource",
+        ]
+    ] = None
+
+    @property
+    def typename(self) -> str:
+        return self.__struct_config__.tag
+
+
+class GetItems_sheetsConnectionSheetsconnectionNodes(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "created_at": "createdAt",
+        "updated_at": "updatedAt",
+        "contained_in_dashboards": "containedInDashboards",
+        "datasource_fields": "datasourceFields",
+    },
+):
+    typename: Literal["Sheet"] = "Sheet"
+    id: str
+    name: Optional[str] = None
+    path: Optional[str] = None
+    luid: str
+    created_at: datetime
+    updated_at: datetime
+    tags: List["GetItems_sheetsConnectionSheetsconnectionNodesTags"]
+    contained_in_dashboards: Optional[
+        List[
+            Optional[
+                "GetItems_sheetsConnectionSheetsconnectionNodesContainedindashboards"
+            ]
+        ]
+    ] = None
+    workbook: Optional["GetItems_sheetsConnectionSheetsconnectionNodesWorkbook"] = None
+    datasource_fields: Optional[
+        List[
+            Optional[
+                Union[
+                    "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseBinField",
+                    "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseCalculatedField",
+                    "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseColumnField",
+                    "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseCombinedField",
+                    "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseCombinedSetField",
+                    "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseDatasourceField",
+                    "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseGroupField",
+                    "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseHierarchyField",
+                    "GetItems_sheetsConnectionSheetsconnectionNodesDatasourcefieldsBaseSetField",
+                ]
+            ]
+        ]
+    ] = None
+
+
+class GetItems_sheetsConnectionSheetsconnectionPageinfo(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "has_next_page": "hasNextPage",
+        "end_cursor": "endCursor",
+    },
+):
+    typename: Literal["PageInfo"] = "PageInfo"
+    has_next_page: bool
+    end_cursor: Optional[str] = None
+
+
+class GetItems_sheetsConnectionSheetsconnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "page_info": "pageInfo"},
+):
+    typename: Literal["SheetsConnection"] = "SheetsConnection"
+    nodes: List["GetItems_sheetsConnectionSheetsconnectionNodes"]
+    page_info: "GetItems_sheetsConnectionSheetsconnectionPageinfo"
+
+
+class GetItems_sheetsConnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"sheets_connection": "sheetsConnection"},
+):
+    sheets_connection: "GetItems_sheetsConnectionSheetsconnection"
+
+
+class GetItems_workbooksConnectionWorkbooksconnectionNodesOwner(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["TableauUser"] = "TableauUser"
+    username: Optional[str] = None
+
+
+class GetItems_workbooksConnectionWorkbooksconnectionNodesTags(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["Tag"] = "Tag"
+    name: Optional[str] = None
+
+
+class GetItems_workbooksConnectionWorkbooksconnectionNodesSheets(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["Sheet"] = "Sheet"
+    id: str
+
+
+class GetItems_workbooksConnectionWorkbooksconnectionNodesDashboards(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["Dashboard"] = "Dashboard"
+    id: str
+
+
+class GetItems_workbooksConnectionWorkbooksconnectionNodesEmbeddeddatasources(
+    msgspec.Struct, kw_only=True, gc=False, rename={"typename": "__typename"}
+):
+    typename: Literal["EmbeddedDatasource"] = "EmbeddedDatasource"
+    id: str
+
+
+class GetItems_workbooksConnectionWorkbooksconnectionNodes(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "project_name": "projectName",
+        "created_at": "createdAt",
+        "updated_at": "updatedAt",
+        "embedded_datasources": "embeddedDatasources",
+    },
+):
+    typename: Literal["Workbook"] = "Workbook"
+    id: str
+    name: Optional[str] = None
+    luid: str
+    uri: Optional[str] = None
+    project_name: Optional[str] = None
+    owner: "GetItems_workbooksConnectionWorkbooksconnectionNodesOwner"
+    description: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    tags: List["GetItems_workbooksConnectionWorkbooksconnectionNodesTags"]
+    sheets: List["GetItems_workbooksConnectionWorkbooksconnectionNodesSheets"]
+    dashboards: List["GetItems_workbooksConnectionWorkbooksconnectionNodesDashboards"]
+    embedded_datasources: List[
+        "GetItems_workbooksConnectionWorkbooksconnectionNodesEmbeddeddatasources"
+    ]
+
+
+class GetItems_workbooksConnectionWorkbooksconnectionPageinfo(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={
+        "typename": "__typename",
+        "has_next_page": "hasNextPage",
+        "end_cursor": "endCursor",
+    },
+):
+    typename: Literal["PageInfo"] = "PageInfo"
+    has_next_page: bool
+    end_cursor: Optional[str] = None
+
+
+class GetItems_workbooksConnectionWorkbooksconnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"typename": "__typename", "page_info": "pageInfo"},
+):
+    typename: Literal["WorkbooksConnection"] = "WorkbooksConnection"
+    nodes: List["GetItems_workbooksConnectionWorkbooksconnectionNodes"]
+    page_info: "GetItems_workbooksConnectionWorkbooksconnectionPageinfo"
+
+
+class GetItems_workbooksConnection(
+    msgspec.Struct,
+    kw_only=True,
+    gc=False,
+    rename={"workbooks_connection": "workbooksConnection"},
+):
+    workbooks_connection: "GetItems_workbooksConnectionWorkbooksconnection"
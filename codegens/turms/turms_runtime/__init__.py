@@ -0,0 +1,19 @@
+from .client import AsyncClient, GraphQLErrors, operation_variables
+from .pagination import (
+    connection_path,
+    get_connection,
+    paginate,
+    paginate_data,
+    paginate_nodes,
+)
+
+__all__ = [
+    "AsyncClient",
+    "GraphQLErrors",
+    "connection_path",
+    "get_connection",
+    "operation_variables",
+    "paginate",
+    "paginate_data",
+    "paginate_nodes",
+]
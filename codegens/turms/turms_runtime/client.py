@@ -0,0 +1,124 @@
+import asyncio
+from typing import Any, Dict, Optional, Type, TypeVar
+
+import httpx
+from pydantic import BaseModel
+
+OperationT = TypeVar("OperationT", bound=BaseModel)
+
+
+class GraphQLErrors(Exception):
+    """The `errors` of a response, or an HTTP error without any."""
+
+    def __init__(self, errors: list, response: Optional[Dict[str, Any]] = None):
+        self.errors = errors
+        self.response = response
+        messages = "; ".join(str(error.get("message", error)) for error in errors)
+        super().__init__(messages or "GraphQL request failed")
+
+
+def operation_variables(
+    operation: Type[BaseModel], arguments: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Validates `arguments` with `operation.Arguments` and returns the
+    variables to send. Arguments that are not given are left out, so the
+    server applies the defaults of the document.
+    """
+    validated = operation.Arguments.model_validate(arguments)  # type: ignore[attr-defined]
+    return validated.model_dump(mode="json", by_alias=True, exclude_unset=True)
+
+
+class AsyncClient:
+    """
+    Runs turms operations over a pooled `httpx.AsyncClient`.
+
+    Every operation class carries its GraphQL text in `Meta.document`,
+    which is posted as is, and its `data` is validated into the class
+    itself. The client keeps up to `max_connections` connections alive,
+    and at most `max_concurrency` requests (default: `max_connections`)
+    are in flight at once; the others wait for their turn instead of
+    failing with a pool timeout.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_connections: int = 10,
+        max_concurrency: Optional[int] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        if http_client is None:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+                timeout=timeout,
+            )
+        self.url = url
+        self.headers = headers or {}
+        self.http_client = http_client
+        self.max_concurrency = max_concurrency or max_connections
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+
+    async def execute_raw(
+        self,
+        document: str,
+        variables: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Posts `document` and returns the response JSON."""
+        payload: Dict[str, Any] = {"query": document}
+        if variables:
+            payload["variables"] = variables
+        headers = {**self.headers, **kwargs.pop("headers", {})}
+        async with self._slots:
+            response = await self.http_client.post(
+                self.url, json=payload, headers=headers, **kwargs
+            )
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        if not isinstance(body, dict) or not ("data" in body or "errors" in body):
+            response.raise_for_status()
+            raise GraphQLErrors([], {"status": response.status_code})
+        return body
+
+    async def execute_data(
+        self,
+        operation: Type[BaseModel],
+        variables: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Sends `operation` with already validated `variables` and returns
+        the response `data`, raising `GraphQLErrors` on errors.
+        """
+        response = await self.execute_raw(
+            operation.Meta.document, variables, **kwargs  # type: ignore[attr-defined]
+        )
+        if response.get("errors") or not response.get("data"):
+            raise GraphQLErrors(response.get("errors") or [], response)
+        return response["data"]
+
+    async def execute(
+        self, operation: Type[OperationT], **arguments: Any
+    ) -> OperationT:
+        """Sends `operation` with `arguments` and validates the response."""
+        data = await self.execute_data(
+            operation, operation_variables(operation, arguments)
+        )
+        return operation.model_validate(data)
+
+    async def aclose(self) -> None:
+        await self.http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
@@ -0,0 +1,129 @@
+import typing
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from .client import AsyncClient, operation_variables
+
+OperationT = TypeVar("OperationT", bound=BaseModel)
+
+# (field names, JSON keys) from the operation to its paginated connection.
+ConnectionPath = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+
+def _model(annotation: Any) -> Optional[Type[BaseModel]]:
+    # Optional[Model] is the only wrapper a connection field has.
+    for candidate in (annotation, *typing.get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+    return None
+
+
+@lru_cache(maxsize=None)
+def connection_path(operation: Type[BaseModel]) -> ConnectionPath:
+    """
+    The field names and JSON keys from an operation to the connection
+    whose `pageInfo` is selected, like
+    `(("sheets_connection",), ("sheetsConnection",))`.
+    """
+
+    def search(
+        model: Type[BaseModel], path: ConnectionPath
+    ) -> Optional[ConnectionPath]:
+        nested = []
+        for name, field in model.model_fields.items():
+            if name == "page_info":
+                return path
+            child = _model(field.annotation)
+            if child is not None:
+                nested.append((name, field.alias or name, child))
+        for name, key, child in nested:
+            found = search(child, (path[0] + (name,), path[1] + (key,)))
+            if found is not None:
+                return found
+        return None
+
+    found = search(operation, ((), ()))
+    if found is None:
+        raise ValueError(f"{operation.__name__} selects no pageInfo")
+    return found
+
+
+def get_connection(page: Any, path: Tuple[str, ...]) -> Any:
+    """
+    The connection at `path` in a validated page (field names) or in the
+    response `data` (JSON keys).
+    """
+    for key in path:
+        page = page[key] if isinstance(page, dict) else getattr(page, key)
+    return page
+
+
+def _paginated_variables(
+    operation: Type[BaseModel], first: Optional[int], arguments: Dict[str, Any]
+) -> Dict[str, Any]:
+    fields = operation.Arguments.model_fields  # type: ignore[attr-defined]
+    if "after" not in fields or (first is not None and "first" not in fields):
+        raise ValueError(
+            f"{operation.__name__} takes {list(fields)},"
+            " pagination needs after (and first to set it)"
+        )
+    if first is not None:
+        arguments["first"] = first
+    return operation_variables(operation, arguments)
+
+
+async def paginate_data(
+    client: AsyncClient,
+    operation: Type[BaseModel],
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    **arguments: Any,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yields the `data` of every page of `operation`, following
+    `pageInfo.endCursor` through its `after` argument.
+
+    `first` and the other `arguments` are validated once with
+    `operation.Arguments`. A response with errors raises `GraphQLErrors`
+    instead of being yielded, since the crawl cannot tell where to
+    continue from.
+    """
+    variables = _paginated_variables(operation, first, arguments)
+    keys = connection_path(operation)[1]
+
+    while True:
+        data = await client.execute_data(operation, {**variables, "after": after})
+        yield data
+
+        page_info = get_connection(data, keys)["pageInfo"]
+        if not page_info["hasNextPage"]:
+            return
+        after = page_info["endCursor"]
+
+
+async def paginate(
+    client: AsyncClient,
+    operation: Type[OperationT],
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    **arguments: Any,
+) -> AsyncIterator[OperationT]:
+    """Like `paginate_data()`, but yields pages validated into `operation`."""
+    async for data in paginate_data(client, operation, first, after, **arguments):
+        yield operation.model_validate(data)
+
+
+async def paginate_nodes(
+    client: AsyncClient,
+    operation: Type[BaseModel],
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    **arguments: Any,
+) -> AsyncIterator[Any]:
+    """Like `paginate()`, but yields the `nodes` of every page one by one."""
+    names = connection_path(operation)[0]
+    async for page in paginate(client, operation, first, after, **arguments):
+        for node in get_connection(page, names).nodes:
+            yield node
@@ -0,0 +1,141 @@
+"""
+Compares request and response sizes of turms documents before and after
+`minify_documents.py`.
+
+Usage (from codegens/turms):
+
+    python ../../tools/bench_documents.py tableau_api.schema --nodes 1000
+
+Since the module may already be minified, the turms output is rebuilt
+from each `Meta.document`: like `turms gen`, `__typename` is selected
+in the selection set of every field outside inline fragments and the
+document is pretty-printed. Both versions of a document get the same synthetic response from
+`synthetic.py` (`--nodes` nodes, same seed), and both responses are
+validated into the operation model and compared, so pruning a
+`__typename` a model needs fails the benchmark instead of shrinking it.
+Sizes are the compact JSON bodies, raw and gzipped.
+"""
+
+import argparse
+import gzip
+import importlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from graphql import (
+    FieldNode,
+    InlineFragmentNode,
+    NameNode,
+    SelectionSetNode,
+    Visitor,
+    parse,
+    print_ast,
+    visit,
+)
+
+from minify_documents import minify_document
+from synthetic import ResponseGenerator, load_schema
+
+
+class _TypenameAdder(Visitor):
+    def enter_selection_set(
+        self, node: SelectionSetNode, key: Any, parent: Any, path: Any, ancestors: Any
+    ):
+        # turms adds no `__typename` within inline fragments.
+        if not isinstance(parent, FieldNode) or any(
+            isinstance(ancestor, InlineFragmentNode) for ancestor in ancestors
+        ):
+            return None
+        if any(
+            isinstance(selection, FieldNode)
+            and selection.name.value == "__typename"
+            and selection.alias is None
+            for selection in node.selections
+        ):
+            return None
+        typename = FieldNode(
+            name=NameNode(value="__typename"), arguments=(), directives=()
+        )
+        return SelectionSetNode(selections=(*node.selections, typename))
+
+
+def turms_document(document: str) -> str:
+    """`document` as `turms gen` prints it, with `__typename` everywhere."""
+    return print_ast(visit(parse(document, no_location=True), _TypenameAdder()))
+
+
+def _sizes(body: bytes) -> Tuple[int, int]:
+    return len(body), len(gzip.compress(body, 6))
+
+
+def _body(payload: Dict[str, Any]) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("module", help="module generated by turms")
+    parser.add_argument("--nodes", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(Path.cwd()))
+    module = importlib.import_module(args.module)
+    operations = [
+        value
+        for value in vars(module).values()
+        if isinstance(value, type)
+        and value.__module__ == module.__name__
+        and hasattr(value, "Meta")
+        and hasattr(value, "Arguments")
+    ]
+    schema = load_schema()
+    variables = {"first": args.nodes, "after": None}
+
+    totals = [0] * 8
+    print(
+        f"{'operation':42} {'request (raw / gzip)':>28}"
+        f" {'response (raw / gzip)':>36}"
+    )
+    for operation in operations:
+        before = turms_document(operation.Meta.document)
+        after = minify_document(before, schema)
+        sizes = []
+        validated = []
+        for document in (before, after):
+            request = _body({"query": document, "variables": variables})
+            response = ResponseGenerator(schema, seed=args.seed).generate(
+                document, nodes=args.nodes
+            )
+            validated.append(
+                operation.model_validate(response["data"]).model_dump(mode="json")
+            )
+            sizes.append(_sizes(request) + _sizes(_body(response)))
+        if validated[0] != validated[1]:
+            raise SystemExit(f"{operation.__name__}: responses validate differently")
+
+        (rq, rqz, rs, rsz), (mq, mqz, ms, msz) = sizes
+        for index, value in enumerate((rq, rqz, rs, rsz, mq, mqz, ms, msz)):
+            totals[index] += value
+        print(
+            f"{operation.__name__:42}"
+            f" {rq:>6,} / {rqz:>5,} -> {mq:>5,} / {mqz:>5,}"
+            f" {rs:>9,} / {rsz:>7,} -> {ms:>9,} / {msz:>7,}"
+        )
+
+    rq, rqz, rs, rsz, mq, mqz, ms, msz = totals
+    print(
+        f"{'total':42}"
+        f" {rq:>6,} / {rqz:>5,} -> {mq:>5,} / {mqz:>5,}"
+        f" {rs:>9,} / {rsz:>7,} -> {ms:>9,} / {msz:>7,}"
+    )
+    print(
+        f"{'saved':42} {1 - mq / rq:>27.0%} {1 - ms / rs:>35.0%}"
+        f"  (gzip: {1 - mqz / rqz:.0%} / {1 - msz / rsz:.0%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
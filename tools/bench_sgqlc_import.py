@@ -0,0 +1,94 @@
+"""
+Compares the import time and memory of sgqlc schema modules.
+
+Usage (from codegens/sgqlc):
+
+    python ../../tools/bench_sgqlc_import.py tableau_schema tableau_schema_fast \\
+        github_schema github_schema_fast --repeat 7
+
+Every measurement runs in a fresh interpreter, after sgqlc itself is
+imported, so only the schema module is measured: the time to import it,
+the time to then render its query type (which builds the query type and
+its field types in the fast packages), and the growth of the peak RSS.
+Bytecode is written to a temporary cache that is warmed up first, as an
+installed package would be; pass `--no-bytecode` to include compiling.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+_PROBE = """
+import importlib, json, resource, sys, time
+import sgqlc.types, sgqlc.types.datetime, sgqlc.types.relay
+
+def rss():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+rss_before = rss()
+start = time.perf_counter()
+module = importlib.import_module(sys.argv[1])
+imported = time.perf_counter()
+schema = next(
+    value for value in vars(module).values()
+    if isinstance(value, sgqlc.types.Schema)
+)
+str(schema.query_type)
+used = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "first use": used - imported,
+    "rss": rss() - rss_before,
+}))
+"""
+
+
+def measure(module: str, env: Dict[str, str]) -> Dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE, module],
+        env=env,
+        cwd=Path.cwd(),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("modules", nargs="+", help="schema modules or packages")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-bytecode", action="store_true")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as cache:
+        env = dict(os.environ, PYTHONPATH=str(Path.cwd()))
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        if args.no_bytecode:
+            env["PYTHONDONTWRITEBYTECODE"] = "1"
+        else:
+            env["PYTHONPYCACHEPREFIX"] = cache
+
+        print(f"{'module':24} {'import':>10} {'first use':>10} {'RSS':>10}")
+        for module in args.modules:
+            measure(module, env)
+            runs = [measure(module, env) for _ in range(args.repeat)]
+            median = {
+                key: statistics.median(run[key] for run in runs) for key in runs[0]
+            }
+            print(
+                f"{module:24} {median['import'] * 1e3:>8.1f}ms"
+                f" {median['first use'] * 1e3:>8.1f}ms"
+                f" {median['rss'] / 2**20:>8.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Compares `operation + response` with the compiled `OperationInterpreter`.
+
+Usage (from codegens/sgqlc):
+
+    python ../../tools/bench_sgqlc_interpreter.py tableau_operations \\
+        get_items_sheets_connection --nodes 2000 --repeat 5
+
+The response is synthesised for the rendered operation by `synthetic.py`
+(`--schema` is the SDL it uses, the Tableau schema by default). Before
+timing, the objects built both ways are compared: classes, attributes and
+`__fields_cache__`.
+"""
+
+import argparse
+import copy
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from sgqlc.types import ContainerType
+
+from sgqlc_interpreter import OperationInterpreter, load_operation
+from synthetic import ResponseGenerator, load_schema
+
+
+def compare(expected: Any, actual: Any, path: str = "data") -> None:
+    """Raises `AssertionError` where `actual` differs from `expected`."""
+    assert type(expected) is type(actual), f"{path}: {type(expected)} {type(actual)}"
+    if isinstance(expected, list):
+        assert len(expected) == len(actual), f"{path}: length"
+        for index, (left, right) in enumerate(zip(expected, actual, strict=True)):
+            compare(left, right, f"{path}[{index}]")
+    elif isinstance(expected, ContainerType):
+        expected_fields = dict(expected.__fields_cache__)
+        actual_fields = dict(actual.__fields_cache__)
+        assert list(expected_fields) == list(actual_fields), f"{path}: fields"
+        for name, field in expected_fields.items():
+            other = actual_fields[name]
+            assert (field.graphql_name, field.type) == (
+                other.graphql_name,
+                other.type,
+            ), f"{path}.{name}: Field"
+            compare(getattr(expected, name), getattr(actual, name), f"{path}.{name}")
+    else:
+        assert expected == actual, f"{path}: {expected!r} != {actual!r}"
+
+
+def timed(function: Callable[[], Any], repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        runs.append(time.perf_counter() - start)
+    return statistics.median(runs)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("module", help="module generated by sgqlc-codegen operation")
+    parser.add_argument("operation", help="attribute of Operations.query, ...")
+    parser.add_argument("--nodes", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--schema", help="SDL file (default: the Tableau schema)")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(Path.cwd()))
+    operation = load_operation(args.module, args.operation)
+    generator = ResponseGenerator(load_schema(args.schema), seed=args.seed)
+    response = generator.generate(str(operation), nodes=args.nodes)
+    interpreter = OperationInterpreter(operation)
+
+    # `operation + response` rewrites parts of the response it is given.
+    compare(operation + copy.deepcopy(response), interpreter(response))
+
+    generic = timed(lambda: operation + response, args.repeat)
+    compiled = timed(lambda: interpreter(response), args.repeat)
+    print(f"{'operation + response':24} {generic * 1e3:>10.1f}ms")
+    print(f"{'OperationInterpreter':24} {compiled * 1e3:>10.1f}ms")
+    print(f"{'speed-up':24} {generic / compiled:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Compares decoding a page into the pydantic models and into the msgspec
+structs generated by `msgspec_codegen.py`.
+
+Usage (from a codegen directory):
+
+    python ../../tools/bench_structs.py tableau_queries tableau_structs \\
+        GetItemsSheetsConnection --nodes 100000
+
+The page is a `synthetic.py` response to the document the generated
+client sends for the operation: the connection gets `--nodes` nodes and
+every other list `--fan-out` items on average. Before timing, a small
+page is decoded with both and the results are compared field by field.
+"""
+
+import argparse
+import gc
+import importlib
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple, Type
+
+import msgspec
+from graphql import OperationDefinitionNode, parse
+from pydantic import BaseModel, create_model
+
+from synthetic import ResponseGenerator
+
+
+def operation_document(model: Type[BaseModel]) -> Tuple[str, str]:
+    """
+    The document and operation name the generated client sends for
+    `model`: turms keeps them on the model, ariadne-codegen in the client
+    methods, which `tableau_runtime` reads.
+    """
+    meta = getattr(model, "Meta", None)
+    if meta is not None and hasattr(meta, "document"):
+        definition = next(
+            definition
+            for definition in parse(meta.document).definitions
+            if isinstance(definition, OperationDefinitionNode)
+        )
+        return meta.document, definition.name.value
+    from tableau_runtime import list_operations
+
+    for operation in list_operations().values():
+        if operation.model is model:
+            return operation.document, operation.name
+    raise SystemExit(f"no operation of the generated client returns {model.__name__}")
+
+
+def _retained(decode: Callable[[bytes], Any], body: bytes) -> int:
+    gc.collect()
+    tracemalloc.start()
+    result = decode(body)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def _best(decode: Callable[[bytes], Any], body: bytes, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decode(body)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("models", help="module with the pydantic models")
+    parser.add_argument("structs", help="module generated by msgspec_codegen.py")
+    parser.add_argument("operation", help="name of the operation's response model")
+    parser.add_argument("--nodes", type=int, default=100000)
+    parser.add_argument("--fan-out", type=float, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(Path.cwd()))
+    model = getattr(importlib.import_module(args.models), args.operation)
+    struct = getattr(importlib.import_module(args.structs), args.operation)
+
+    envelope = create_model(f"{args.operation}Response", data=(model, ...))
+    struct_decoder = msgspec.json.Decoder(
+        msgspec.defstruct(f"{args.operation}Response", [("data", struct)])
+    )
+    decoders = {
+        "pydantic (json.loads + model_validate)": lambda body: model.model_validate(
+            json.loads(body)["data"]
+        ),
+        "pydantic (model_validate_json)": envelope.model_validate_json,
+        "msgspec": struct_decoder.decode,
+    }
+
+    document, operation_name = operation_document(model)
+    generator = ResponseGenerator(seed=args.seed, fan_out=args.fan_out)
+
+    def page(nodes: int) -> bytes:
+        response = generator.generate(
+            document, nodes=nodes, operation_name=operation_name
+        )
+        return json.dumps(response).encode()
+
+    sample = page(50)
+    expected = envelope.model_validate_json(sample).data.model_dump(
+        by_alias=True, mode="json"
+    )
+    if msgspec.to_builtins(struct_decoder.decode(sample).data) != expected:
+        raise SystemExit("msgspec structs do not decode like the pydantic models")
+
+    body = page(args.nodes)
+    print(f"{args.operation}: {args.nodes} nodes, {len(body) / 1e6:.1f} MB of JSON")
+    for label, decode in decoders.items():
+        seconds = _best(decode, body, args.repeat)
+        retained = _retained(decode, body)
+        print(
+            f"  {label:40} {args.nodes / seconds:>11,.0f} nodes/s"
+            f" {len(body) / seconds / 1e6:>7.1f} MB/s"
+            f" {retained / args.nodes:>8,.0f} B/node"
+        )
+
+
+if __name__ == "__main__":
+    main()
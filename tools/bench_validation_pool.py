@@ -0,0 +1,98 @@
+"""
+Measures what validating pages costs the event loop, inline and through
+`tableau_runtime.ValidationPool`.
+
+Usage (from codegens/ariadne-codegen):
+
+    python ../../tools/bench_validation_pool.py get_items_sheets_connection \\
+        --nodes 5000 --pages 8
+
+`--pages` synthetic responses of `--nodes` nodes (`synthetic.py`, one
+seed per page) are validated into the pydantic model two ways: on the
+event loop, as the generated client does, and through a
+`ValidationPool`, all pages at once. The parent's CPU time per page is
+the time the event loop (and the GIL) is busy with a page, workers
+excluded; wall time is for all pages. Before timing, the pool's model of
+the first page is compared with the one validated on the event loop.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+import httpx
+
+from synthetic import ResponseGenerator
+
+
+def _timed(run: Callable[[], Any]) -> Tuple[float, float]:
+    cpu, wall = time.process_time(), time.perf_counter()
+    run()
+    return time.process_time() - cpu, time.perf_counter() - wall
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "method", help="generated client method, e.g. get_items_sheets_connection"
+    )
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--pages", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(Path.cwd()))
+    from tableau_runtime import ValidationPool, get_operation
+
+    operation = get_operation(args.method)
+    model = operation.model
+    bodies = [
+        json.dumps(
+            ResponseGenerator(seed=page).generate(
+                operation.document, nodes=args.nodes, operation_name=operation.name
+            )
+        ).encode()
+        for page in range(args.pages)
+    ]
+    responses = [httpx.Response(200, content=body) for body in bodies]
+    print(
+        f"{operation.name}: {args.pages} pages of {args.nodes} nodes,"
+        f" {sum(map(len, bodies)) / len(bodies) / 1e6:.1f} MB of JSON each"
+    )
+
+    with ValidationPool(max_workers=args.workers) as pool:
+
+        pages: List[Any] = []
+
+        async def pooled() -> None:
+            # Not returned: `asyncio.run` formats the repr of its result on
+            # Python 3.11, which takes longer than validating the pages.
+            pages[:] = await asyncio.gather(
+                *(pool.validate(model, response) for response in responses)
+            )
+
+        # Warms the workers up, and checks what they validate.
+        asyncio.run(pooled())
+        if pages[0] != model.model_validate(json.loads(bodies[0])["data"]):
+            raise SystemExit("the pool does not validate like the event loop")
+
+        timings = {
+            "pydantic, on the event loop": _timed(
+                lambda: [
+                    model.model_validate(json.loads(body)["data"]) for body in bodies
+                ]
+            ),
+            "ValidationPool": _timed(lambda: asyncio.run(pooled())),
+        }
+
+    print(f"  {'':32} {'parent CPU / page':>18} {'wall, all pages':>16}")
+    for label, (cpu, wall) in timings.items():
+        print(f"  {label:32} {cpu / args.pages * 1e3:>15.1f} ms {wall:>14.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,844 @@
+"""
+Caching GraphQL proxy in front of the Tableau Metadata API.
+
+Usage:
+
+    python tools/caching_proxy.py https://tableau.example.com/api/metadata/graphql \\
+        --header "X-Tableau-Auth: <token>" --port 8001 \\
+        --default-ttl 300 --ttl TableauUser=3600 --ttl Sheet=60
+
+and point clients at `http://127.0.0.1:8001/` instead of the site.
+`CachingProxy` is also an ASGI app, served the same way as `mock_server`.
+
+Queries are validated against `schemas/tableau/schema-strawberry.graphql`
+and answered from a normalized store: every object with an `id` is kept
+once under `__typename:id`, root fields under their name and arguments.
+For the parts of a query the store does not have (or that are older than
+the TTL of their type), the proxy sends one upstream request per level of
+the query: missing root fields as they are, missing fields of known
+entities as `<type>s(filter: {idWithin: [...]})` lookups that fetch only
+those fields. Every upstream selection also asks for `__typename` and
+`id`, so the response can be normalized. The query is then executed
+against the store.
+
+Mutations, and requests whose upstream responses carry errors, are
+forwarded unchanged and not cached. The store is shared by every client,
+so the proxy authenticates upstream with its own `--header`s: clients
+see what that user may see.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from copy import copy
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+from graphql import (
+    ArgumentNode,
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    ListValueNode,
+    NamedTypeNode,
+    NameNode,
+    ObjectFieldNode,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    StringValueNode,
+    VariableNode,
+    Visitor,
+    execute,
+    get_named_type,
+    get_operation_ast,
+    is_abstract_type,
+    is_composite_type,
+    parse,
+    print_ast,
+    validate,
+    visit,
+)
+from graphql.execution.collect_fields import collect_fields, collect_sub_fields
+from graphql.execution.values import get_argument_values, get_variable_values
+
+from mock_server import SCHEMA_PATH, Receive, Scope, Send, respond, serve
+from synthetic import load_schema
+
+ROOT = "ROOT_QUERY"
+
+
+class _Record:
+    """Field values of one object, by field name and arguments."""
+
+    __slots__ = ("key", "typename", "values", "expires")
+
+    def __init__(self, key: Optional[str], typename: str) -> None:
+        # `__typename:id` for entities, `ROOT` for the root, None for
+        # objects without an id, which live inside their parent's record.
+        self.key = key
+        self.typename = typename
+        self.values: Dict[str, Any] = {}
+        self.expires: Dict[str, float] = {}
+
+
+def _store_key(name: str, args: Dict[str, Any]) -> str:
+    if not args:
+        return name
+    return f"{name}({json.dumps(args, sort_keys=True, separators=(',', ':'))})"
+
+
+def _records(value: Any) -> Iterable[_Record]:
+    if isinstance(value, _Record):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            yield from _records(item)
+
+
+def _field(name: str) -> FieldNode:
+    return FieldNode(name=NameNode(value=name), arguments=(), directives=())
+
+
+class EntityStore:
+    """Normalized response data with per-type TTLs."""
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.root = _Record(ROOT, "Query")
+        self.entities: Dict[str, _Record] = {}
+
+    def ttl(self, type_name: str) -> float:
+        return self.ttls.get(type_name, self.default_ttl)
+
+    def entity(self, type_name: str, entity_id: str) -> _Record:
+        key = f"{type_name}:{entity_id}"
+        record = self.entities.get(key)
+        if record is None:
+            record = self.entities[key] = _Record(key, type_name)
+        return record
+
+    def purge(self, now: Optional[float] = None) -> int:
+        """Drops expired values, and entities left without any; returns how many."""
+        now = self.clock() if now is None else now
+        dropped = 0
+        for key, record in list(self.entities.items()) + [(ROOT, self.root)]:
+            for field in [f for f, expires in record.expires.items() if expires < now]:
+                del record.values[field], record.expires[field]
+                dropped += 1
+            if not record.values and key != ROOT:
+                del self.entities[key]
+        return dropped
+
+
+class UpstreamError(Exception):
+    """The upstream answered with a status other than 200."""
+
+    def __init__(
+        self, status: int, payload: Dict[str, Any], headers: List[Tuple[bytes, bytes]]
+    ) -> None:
+        super().__init__(f"Upstream responded with {status}")
+        self.status = status
+        self.payload = payload
+        self.headers = headers
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+class _Operation:
+    """An incoming query with its fragments and coerced variables."""
+
+    def __init__(
+        self,
+        definition: OperationDefinitionNode,
+        fragments: Dict[str, FragmentDefinitionNode],
+        variables: Dict[str, Any],
+        raw_variables: Dict[str, Any],
+    ) -> None:
+        self.definition = definition
+        self.fragments = fragments
+        self.variables = variables
+        self.raw_variables = raw_variables
+
+
+class _Misses:
+    def __init__(self) -> None:
+        self.root: Dict[str, List[FieldNode]] = {}
+        # type name -> (ids, missing field nodes by identity)
+        self.entities: Dict[str, Tuple[Dict[str, None], Dict[int, FieldNode]]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.root or self.entities)
+
+    def add(self, record: _Record, response_key: str, nodes: List[FieldNode]) -> None:
+        if record.key == ROOT:
+            self.root[response_key] = nodes
+            return
+        ids, fields = self.entities.setdefault(record.typename, ({}, {}))
+        ids[record.key.split(":", 1)[1]] = None
+        for node in nodes:
+            fields[id(node)] = node
+
+
+class _Usage(Visitor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.fragments: Dict[str, None] = {}
+        self.variables: Dict[str, None] = {}
+
+    def enter_fragment_spread(self, node: FragmentSpreadNode, *_: Any) -> None:
+        self.fragments[node.name.value] = None
+
+    def enter_variable(self, node: VariableNode, *_: Any) -> None:
+        self.variables[node.name.value] = None
+
+
+class CachingProxy:
+    """ASGI app answering Metadata API queries from an `EntityStore`."""
+
+    def __init__(
+        self,
+        upstream: str,
+        schema: Optional[GraphQLSchema] = None,
+        store: Optional[EntityStore] = None,
+        headers: Optional[Dict[str, str]] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        max_ids: int = 100,
+        max_rounds: int = 10,
+        purge_every: int = 1000,
+    ) -> None:
+        self.upstream = upstream
+        self.schema = schema or load_schema(str(SCHEMA_PATH))
+        self.store = store or EntityStore()
+        self.headers = headers or {}
+        self.client = client or httpx.AsyncClient(timeout=None)
+        self.max_ids = max_ids
+        self.max_rounds = max_rounds
+        self.purge_every = purge_every
+        self.requests = 0
+        self.hits = 0
+        self.upstream_requests = 0
+        self._lookups = self._find_lookups()
+
+    def _find_lookups(self) -> Dict[str, str]:
+        """Root list fields that select objects of a type by `idWithin`."""
+        lookups: Dict[str, str] = {}
+        for name, field in self.schema.query_type.fields.items():
+            type_ = field.type
+            if isinstance(type_, GraphQLNonNull):
+                type_ = type_.of_type
+            filter_arg = field.args.get("filter")
+            if (
+                not isinstance(type_, GraphQLList)
+                or filter_arg is None
+                or "idWithin" not in get_named_type(filter_arg.type).fields
+            ):
+                continue
+            named = get_named_type(type_)
+            if isinstance(named, GraphQLObjectType):
+                lookups[named.name] = name
+        return lookups
+
+    async def execute(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Answers one GraphQL request, going upstream only for missing data."""
+        self.requests += 1
+        if self.purge_every and self.requests % self.purge_every == 0:
+            self.store.purge()
+        try:
+            document = parse(query)
+        except GraphQLError as error:
+            return {"errors": [error.formatted]}
+        errors = validate(self.schema, document)
+        if errors:
+            return {"errors": [error.formatted for error in errors]}
+        definition = get_operation_ast(document, operation_name)
+        if definition is None:
+            return {"errors": [{"message": "Unknown operation."}]}
+        if definition.operation != OperationType.QUERY:
+            return await self._post(query, variables, operation_name)
+        coerced = get_variable_values(
+            self.schema, definition.variable_definitions or (), variables or {}
+        )
+        if isinstance(coerced, list):
+            return {"errors": [error.formatted for error in coerced]}
+
+        operation = _Operation(
+            definition,
+            {
+                fragment.name.value: fragment
+                for fragment in document.definitions
+                if isinstance(fragment, FragmentDefinitionNode)
+            },
+            coerced,
+            variables or {},
+        )
+        now = self.store.clock()
+        upstream_requests = self.upstream_requests
+        warnings: List[Dict[str, Any]] = []
+        try:
+            for _ in range(self.max_rounds):
+                misses = self._missing(operation, now)
+                if not misses:
+                    break
+                warnings += await self._fetch_missing(operation, misses, now)
+            else:
+                warnings += await self._fetch(operation, None, now)
+        except _Uncacheable:
+            return await self._post(query, variables, operation_name)
+        if self.upstream_requests == upstream_requests:
+            self.hits += 1
+        result = execute(
+            self.schema,
+            document,
+            root_value=self.store.root,
+            variable_values=variables,
+            operation_name=operation_name,
+            field_resolver=self._resolve,
+            type_resolver=self._resolve_type,
+        )
+        response: Dict[str, Any] = {"data": result.data}
+        response_errors = [error.formatted for error in result.errors or ()]
+        response_errors += warnings
+        if response_errors:
+            response["errors"] = response_errors
+        return response
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await self.client.aclose()
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        if scope["method"] != "POST":
+            await respond(send, 405, {"errors": [{"message": "Use POST."}]})
+            return
+        try:
+            payload = json.loads(body)
+            query = payload["query"]
+        except (ValueError, KeyError, TypeError):
+            await respond(send, 400, {"errors": [{"message": "Invalid request."}]})
+            return
+        try:
+            response = await self.execute(
+                query, payload.get("variables"), payload.get("operationName")
+            )
+        except UpstreamError as error:
+            await respond(send, error.status, error.payload, error.headers)
+            return
+        except httpx.HTTPError as error:
+            await respond(send, 502, {"errors": [{"message": str(error)}]})
+            return
+        await respond(send, 200, response)
+
+    # Reading the store
+
+    def _resolve(self, source: _Record, info: Any, **args: Any) -> Any:
+        return source.values.get(_store_key(info.field_name, args))
+
+    def _resolve_type(self, value: _Record, *_: Any) -> str:
+        return value.typename
+
+    def _missing(self, operation: _Operation, now: float) -> _Misses:
+        misses = _Misses()
+        fields = collect_fields(
+            self.schema,
+            operation.fragments,
+            operation.variables,
+            self.schema.query_type,
+            operation.definition.selection_set,
+        )
+        self._walk(operation, self.store.root, fields, None, now, misses)
+        return misses
+
+    def _walk(
+        self,
+        operation: _Operation,
+        record: _Record,
+        fields: Dict[str, List[FieldNode]],
+        owner: Optional[Tuple[_Record, str, List[FieldNode]]],
+        now: float,
+        misses: _Misses,
+    ) -> None:
+        type_ = self.schema.get_type(record.typename)
+        for response_key, nodes in fields.items():
+            name = nodes[0].name.value
+            if name.startswith("__"):
+                continue
+            field = type_.fields[name]
+            key = _store_key(
+                name, get_argument_values(field, nodes[0], operation.variables)
+            )
+            field_owner = owner or (record, response_key, nodes)
+            if key not in record.values or record.expires[key] < now:
+                # A field of an object without an id can only be fetched
+                # with the nearest entity's field that leads to it.
+                misses.add(*field_owner)
+                continue
+            for item in _records(record.values[key]):
+                self._walk(
+                    operation,
+                    item,
+                    collect_sub_fields(
+                        self.schema,
+                        operation.fragments,
+                        operation.variables,
+                        self.schema.get_type(item.typename),
+                        nodes,
+                    ),
+                    None if item.key else field_owner,
+                    now,
+                    misses,
+                )
+
+    # Fetching from upstream
+
+    async def _fetch_missing(
+        self, operation: _Operation, misses: _Misses, now: float
+    ) -> List[Dict[str, Any]]:
+        selections: List[FieldNode] = []
+        lookups: Dict[str, str] = {}
+        for nodes in misses.root.values():
+            for node in nodes:
+                selections.append(
+                    self._aliased(node, f"_{len(selections)}", self.schema.query_type)
+                )
+        for type_name, (ids, nodes) in misses.entities.items():
+            lookup = self._lookups.get(type_name)
+            if lookup is None:
+                return await self._fetch(operation, None, now)
+            type_ = self.schema.get_type(type_name)
+            inner = SelectionSetNode(
+                selections=tuple(
+                    self._aliased(node, f"_{index}", type_)
+                    for index, node in enumerate(nodes.values())
+                )
+            )
+            id_list = list(ids)
+            for start in range(0, len(id_list), self.max_ids):
+                chunk = id_list[start : start + self.max_ids]
+                alias = f"_{len(selections)}"
+                lookups[alias] = type_name
+                selections.append(
+                    FieldNode(
+                        alias=NameNode(value=alias),
+                        name=NameNode(value=lookup),
+                        arguments=(
+                            ArgumentNode(
+                                name=NameNode(value="filter"),
+                                value=ObjectValueNode(
+                                    fields=(
+                                        ObjectFieldNode(
+                                            name=NameNode(value="idWithin"),
+                                            value=ListValueNode(
+                                                values=tuple(
+                                                    StringValueNode(value=entity_id)
+                                                    for entity_id in chunk
+                                                )
+                                            ),
+                                        ),
+                                    )
+                                ),
+                            ),
+                        ),
+                        directives=(),
+                        selection_set=self._augment(inner, type_),
+                    )
+                )
+        return await self._fetch(operation, selections, now, lookups)
+
+    async def _fetch(
+        self,
+        operation: _Operation,
+        selections: Optional[List[FieldNode]],
+        now: float,
+        lookups: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Sends `selections` (by default the whole operation) upstream and
+        stores the response; returns its warnings.
+        """
+        if selections is None:
+            selection_set = SelectionSetNode(
+                selections=tuple(
+                    (
+                        self._aliased(selection, None, self.schema.query_type)
+                        if isinstance(selection, FieldNode)
+                        else selection
+                    )
+                    for selection in operation.definition.selection_set.selections
+                )
+            )
+        else:
+            selection_set = SelectionSetNode(selections=tuple(selections))
+        document, fragments = self._document(operation, selection_set)
+        used = {
+            definition.variable.name.value
+            for definition in document.definitions[0].variable_definitions
+        }
+        response = await self._post(
+            print_ast(document),
+            {
+                name: value
+                for name, value in operation.raw_variables.items()
+                if name in used
+            },
+            None,
+        )
+        errors = response.get("errors") or []
+        if any(
+            (error.get("extensions") or {}).get("severity") != "WARNING"
+            for error in errors
+        ) or not isinstance(response.get("data"), dict):
+            raise _Uncacheable()
+
+        data = response["data"]
+        fields = collect_fields(
+            self.schema,
+            fragments,
+            operation.variables,
+            self.schema.query_type,
+            selection_set,
+        )
+        for response_key, nodes in fields.items():
+            name = nodes[0].name.value
+            if name.startswith("__") or response_key not in data:
+                continue
+            field = self.schema.query_type.fields[name]
+            if lookups and response_key in lookups:
+                self._normalize(
+                    data[response_key],
+                    field.type,
+                    nodes,
+                    fragments,
+                    operation,
+                    self.store.ttl(lookups[response_key]),
+                    now,
+                )
+                continue
+            node_type = get_named_type(field.type)
+            if "nodes" in getattr(node_type, "fields", {}):
+                node_type = get_named_type(node_type.fields["nodes"].type)
+            ttl = self.store.ttl(node_type.name)
+            key = _store_key(
+                name, get_argument_values(field, nodes[0], operation.variables)
+            )
+            self._store(
+                self.store.root,
+                key,
+                self._normalize(
+                    data[response_key],
+                    field.type,
+                    nodes,
+                    fragments,
+                    operation,
+                    ttl,
+                    now,
+                ),
+                ttl,
+                now,
+            )
+        return errors
+
+    def _aliased(
+        self, node: FieldNode, alias: Optional[str], parent: GraphQLObjectType
+    ) -> FieldNode:
+        node = copy(node)
+        if alias is not None:
+            # Missing fields from different places may share a response
+            # key, so every one gets its own; the store keys by name.
+            node.alias = NameNode(value=alias)
+        if node.selection_set is not None:
+            node.selection_set = self._augment(
+                node.selection_set, get_named_type(parent.fields[node.name.value].type)
+            )
+        return node
+
+    def _augment(
+        self, selection_set: SelectionSetNode, type_: Any, identity: bool = True
+    ) -> SelectionSetNode:
+        """
+        Adds `__typename` and `id` to every selection set, recursively.
+        Fragments are covered by the selection set they are spread in.
+        """
+        selected = {
+            selection.name.value
+            for selection in selection_set.selections
+            if isinstance(selection, FieldNode) and selection.alias is None
+        }
+        selections: List[Any] = []
+        if identity and "__typename" not in selected:
+            selections.append(_field("__typename"))
+        if identity and "id" not in selected:
+            if "id" in getattr(type_, "fields", {}):
+                selections.append(_field("id"))
+            elif is_abstract_type(type_):
+                selections += [
+                    InlineFragmentNode(
+                        type_condition=NamedTypeNode(
+                            name=NameNode(value=possible.name)
+                        ),
+                        directives=(),
+                        selection_set=SelectionSetNode(selections=(_field("id"),)),
+                    )
+                    for possible in self.schema.get_possible_types(type_)
+                    if "id" in possible.fields
+                ]
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode) and selection.selection_set:
+                selection = copy(selection)
+                selection.selection_set = self._augment(
+                    selection.selection_set,
+                    get_named_type(type_.fields[selection.name.value].type),
+                )
+            elif isinstance(selection, InlineFragmentNode):
+                selection = copy(selection)
+                selection.selection_set = self._augment(
+                    selection.selection_set,
+                    (
+                        self.schema.get_type(selection.type_condition.name.value)
+                        if selection.type_condition
+                        else type_
+                    ),
+                    identity=False,
+                )
+            selections.append(selection)
+        return SelectionSetNode(selections=tuple(selections))
+
+    def _document(
+        self, operation: _Operation, selection_set: SelectionSetNode
+    ) -> Tuple[DocumentNode, Dict[str, FragmentDefinitionNode]]:
+        """An upstream query for `selection_set` with what it uses."""
+        usage = _Usage()
+        visit(selection_set, usage)
+        fragments: Dict[str, FragmentDefinitionNode] = {}
+        pending = list(usage.fragments)
+        while pending:
+            name = pending.pop()
+            if name in fragments:
+                continue
+            fragment = copy(operation.fragments[name])
+            fragment.selection_set = self._augment(
+                fragment.selection_set,
+                self.schema.get_type(fragment.type_condition.name.value),
+                identity=False,
+            )
+            fragments[name] = fragment
+            nested = _Usage()
+            visit(fragment.selection_set, nested)
+            pending += nested.fragments
+            usage.variables.update(nested.variables)
+
+        definition = OperationDefinitionNode(
+            operation=OperationType.QUERY,
+            name=operation.definition.name,
+            variable_definitions=tuple(
+                definition
+                for definition in operation.definition.variable_definitions or ()
+                if definition.variable.name.value in usage.variables
+            ),
+            directives=(),
+            selection_set=selection_set,
+        )
+        return DocumentNode(definitions=(definition, *fragments.values())), fragments
+
+    async def _post(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> Dict[str, Any]:
+        self.upstream_requests += 1
+        payload: Dict[str, Any] = {"query": query}
+        if variables:
+            payload["variables"] = variables
+        if operation_name:
+            payload["operationName"] = operation_name
+        response = await self.client.post(
+            self.upstream, json=payload, headers=self.headers
+        )
+        try:
+            body = response.json()
+        except ValueError:
+            body = {"errors": [{"message": response.text}]}
+        if response.status_code != 200:
+            retry_after = response.headers.get("retry-after")
+            raise UpstreamError(
+                response.status_code,
+                body,
+                [(b"retry-after", retry_after.encode())] if retry_after else [],
+            )
+        return body
+
+    # Writing the store
+
+    def _normalize(
+        self,
+        value: Any,
+        type_: Any,
+        nodes: List[FieldNode],
+        fragments: Dict[str, FragmentDefinitionNode],
+        operation: _Operation,
+        ttl: float,
+        now: float,
+    ) -> Any:
+        if value is None:
+            return None
+        if isinstance(type_, GraphQLNonNull):
+            type_ = type_.of_type
+        if isinstance(type_, GraphQLList):
+            return [
+                self._normalize(
+                    item, type_.of_type, nodes, fragments, operation, ttl, now
+                )
+                for item in value
+            ]
+        if not is_composite_type(type_):
+            return value
+
+        runtime: GraphQLObjectType = self.schema.get_type(value["__typename"])
+        if value.get("id") is not None and "id" in runtime.fields:
+            record = self.store.entity(runtime.name, value["id"])
+            ttl = self.store.ttl(runtime.name)
+        else:
+            record = _Record(None, runtime.name)
+        fields = collect_sub_fields(
+            self.schema, fragments, operation.variables, runtime, nodes
+        )
+        for response_key, sub_nodes in fields.items():
+            name = sub_nodes[0].name.value
+            if name.startswith("__") or response_key not in value:
+                continue
+            field = runtime.fields[name]
+            key = _store_key(
+                name, get_argument_values(field, sub_nodes[0], operation.variables)
+            )
+            self._store(
+                record,
+                key,
+                self._normalize(
+                    value[response_key],
+                    field.type,
+                    sub_nodes,
+                    fragments,
+                    operation,
+                    ttl,
+                    now,
+                ),
+                ttl,
+                now,
+            )
+        return record
+
+    def _store(
+        self, record: _Record, key: str, value: Any, ttl: float, now: float
+    ) -> None:
+        previous = record.values.get(key)
+        if (
+            isinstance(value, _Record)
+            and isinstance(previous, _Record)
+            and value.key is None
+            and previous.key is None
+            and value.typename == previous.typename
+        ):
+            # Two selections of the same object without an id (`pageInfo`
+            # under two aliases, say) add up.
+            previous.values.update(value.values)
+            previous.expires.update(value.expires)
+            value = previous
+        record.values[key] = value
+        record.expires[key] = now + ttl
+
+
+def _header(value: str) -> Tuple[str, str]:
+    name, _, header_value = value.partition(":")
+    return name.strip(), header_value.strip()
+
+
+def _ttl(value: str) -> Tuple[str, float]:
+    type_name, _, seconds = value.partition("=")
+    return type_name, float(seconds)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("upstream", help="Metadata API URL")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument(
+        "--header",
+        type=_header,
+        action="append",
+        default=[],
+        help='upstream header, e.g. "X-Tableau-Auth: <token>" (repeatable)',
+    )
+    parser.add_argument("--default-ttl", type=float, default=300.0, help="seconds")
+    parser.add_argument(
+        "--ttl",
+        type=_ttl,
+        action="append",
+        default=[],
+        help="TYPE=SECONDS, e.g. Sheet=60 (repeatable)",
+    )
+    parser.add_argument("--max-ids", type=int, default=100, help="per lookup")
+    parser.add_argument("--schema", help="SDL file (default: the strawberry SDL)")
+    args = parser.parse_args(argv)
+
+    app = CachingProxy(
+        args.upstream,
+        load_schema(args.schema or str(SCHEMA_PATH)),
+        EntityStore(dict(args.ttl), args.default_ttl),
+        headers=dict(args.header),
+        max_ids=args.max_ids,
+    )
+
+    async def run() -> None:
+        server = await serve(app, args.host, args.port)
+        print(f"Proxying {args.upstream} on http://{args.host}:{args.port}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,485 @@
+"""
+Local stand-in for the GitHub GraphQL API, enough to crawl issues.
+
+Usage:
+
+    python tools/github_stub_server.py --port 8001 --issues 250 \\
+        --points 50 --window 10 --max-concurrent 4
+
+and point a client at `http://127.0.0.1:8001/graphql` (every path is
+accepted). `GitHubStubServer` is an ASGI app too, for `httpx.ASGITransport`.
+
+The schema is the subset of GitHub's that `codegens/sgqlc/github_operations.gql`
+selects: `repository(owner, name)` with its `issues` connection (`first` /
+`last` up to 100, `after` cursors, `orderBy`, `states`) and `rulesets`, and
+`rateLimit`. Every repository has `--issues` issues, numbered from 1, whose
+state and title are drawn from a stream seeded by the repository and the
+number. Rate limiting follows GitHub's rules:
+
+- a query costs one point per hundred connection requests, at least one;
+  `rateLimit { cost remaining resetAt }` reports the cost, the points
+  left and when the budget of `--points` refills, `--window` seconds
+  (rounded up to a whole second) after the first request of the window;
+- a query that costs more than the points left is answered with a
+  `RATE_LIMITED` error and no data;
+- more than `--max-concurrent` requests in flight get `403 Forbidden`
+  with a `retry-after` header (GitHub's secondary rate limit).
+
+`x-ratelimit-*` headers come with every response.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    GraphQLError,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    IntValueNode,
+    OperationDefinitionNode,
+    VariableNode,
+    build_schema,
+    execute,
+    parse,
+    validate,
+)
+
+from mock_server import Receive, Scope, Send, respond, serve
+
+SDL = """
+scalar DateTime
+
+interface Node {
+  id: ID!
+}
+
+enum IssueState {
+  OPEN
+  CLOSED
+}
+
+enum IssueOrderField {
+  CREATED_AT
+  UPDATED_AT
+  COMMENTS
+}
+
+enum OrderDirection {
+  ASC
+  DESC
+}
+
+input IssueOrder {
+  field: IssueOrderField!
+  direction: OrderDirection!
+}
+
+type PageInfo {
+  endCursor: String
+  hasNextPage: Boolean!
+  hasPreviousPage: Boolean!
+  startCursor: String
+}
+
+type Issue implements Node {
+  id: ID!
+  number: Int!
+  title: String!
+  state: IssueState!
+  createdAt: DateTime!
+}
+
+type IssueConnection {
+  nodes: [Issue]
+  pageInfo: PageInfo!
+  totalCount: Int!
+}
+
+type RepositoryRulesetConnection {
+  totalCount: Int!
+}
+
+type Repository implements Node {
+  id: ID!
+  name: String!
+  nameWithOwner: String!
+  issues(
+    first: Int
+    after: String
+    last: Int
+    before: String
+    orderBy: IssueOrder
+    states: [IssueState!]
+  ): IssueConnection!
+  rulesets(
+    first: Int
+    after: String
+    last: Int
+    before: String
+    includeParents: Boolean = true
+  ): RepositoryRulesetConnection
+}
+
+type RateLimit {
+  cost: Int!
+  limit: Int!
+  nodeCount: Int!
+  remaining: Int!
+  resetAt: DateTime!
+  used: Int!
+}
+
+type Query {
+  repository(owner: String!, name: String!): Repository
+  rateLimit(dryRun: Boolean = false): RateLimit
+}
+"""
+
+MAX_PAGE = 100
+
+_EPOCH = datetime(2015, 1, 1, tzinfo=timezone.utc)
+
+
+def _cursor(position: int) -> str:
+    return base64.b64encode(f"cursor:{position}".encode()).decode()
+
+
+def _position(cursor: str) -> int:
+    try:
+        return int(base64.b64decode(cursor).decode().split(":", 1)[1])
+    except (ValueError, IndexError):
+        raise GraphQLError(
+            f"`{cursor}` does not appear to be a valid cursor."
+        ) from None
+
+
+def _timestamp(moment: float) -> str:
+    return datetime.fromtimestamp(moment, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def query_cost(
+    document: DocumentNode,
+    variables: Optional[Dict[str, Any]] = None,
+    operation_name: Optional[str] = None,
+) -> Tuple[int, int]:
+    """
+    `(cost, node count)` of a query the way GitHub computes them: a
+    connection is requested once for each node its parent connections may
+    return (`first` or `last`), and a hundred requests cost one point.
+    """
+    operation = next(
+        definition
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+        and (operation_name is None or definition.name.value == operation_name)
+    )
+
+    def page_size(field: FieldNode) -> Optional[int]:
+        for argument in field.arguments:
+            if argument.name.value not in ("first", "last"):
+                continue
+            value = argument.value
+            if isinstance(value, IntValueNode):
+                return int(value.value)
+            if isinstance(value, VariableNode):
+                size = (variables or {}).get(value.name.value)
+                return size if isinstance(size, int) else None
+        return None
+
+    requests = 0
+    nodes = 0
+
+    def walk(selection_set: Any, multiplier: int) -> None:
+        nonlocal requests, nodes
+        for selection in selection_set.selections if selection_set else ():
+            if not isinstance(selection, FieldNode):
+                walk(getattr(selection, "selection_set", None), multiplier)
+                continue
+            size = page_size(selection)
+            if size is None:
+                walk(selection.selection_set, multiplier)
+                continue
+            requests += multiplier
+            nodes += multiplier * size
+            walk(selection.selection_set, multiplier * size)
+
+    walk(operation.selection_set, 1)
+    return max(1, round(requests / 100)), nodes
+
+
+class _RateLimit:
+    def __init__(self, limit: int, window: float, clock: Callable[[], float]):
+        self.limit = limit
+        self.window = window
+        self.clock = clock
+        self.used = 0
+        self.reset_at = 0.0
+
+    @property
+    def remaining(self) -> int:
+        if self.clock() >= self.reset_at:
+            return self.limit
+        return self.limit - self.used
+
+    def charge(self, cost: int) -> bool:
+        now = self.clock()
+        if now >= self.reset_at:
+            self.used = 0
+            self.reset_at = float(math.ceil(now + self.window))
+        if cost > self.limit - self.used:
+            return False
+        self.used += cost
+        return True
+
+    def headers(self) -> List[Tuple[bytes, bytes]]:
+        return [
+            (b"x-ratelimit-limit", str(self.limit).encode()),
+            (b"x-ratelimit-remaining", str(self.remaining).encode()),
+            (b"x-ratelimit-used", str(self.used).encode()),
+            (b"x-ratelimit-reset", str(int(self.reset_at)).encode()),
+            (b"x-ratelimit-resource", b"graphql"),
+        ]
+
+
+class GitHubStubServer:
+    """ASGI app answering issue queries with GitHub's rate limiting."""
+
+    def __init__(
+        self,
+        issues: int = 250,
+        repositories: Optional[Dict[str, int]] = None,
+        points: int = 5000,
+        window: float = 3600,
+        max_concurrent: int = 100,
+        retry_after: int = 1,
+        latency: float = 0.0,
+        seed: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.schema: GraphQLSchema = build_schema(SDL)
+        self.issues = issues
+        self.repositories = repositories or {}
+        self.max_concurrent = max_concurrent
+        self.retry_after = retry_after
+        self.latency = latency
+        self.seed = seed
+        self.rate_limit = _RateLimit(points, window, clock)
+        self.requests = 0
+        self.rate_limited = 0
+        self.secondary_limited = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+
+    def issue_count(self, owner: str, name: str) -> int:
+        return self.repositories.get(f"{owner}/{name}", self.issues)
+
+    def execute(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Executes one GraphQL request and returns the response payload."""
+        try:
+            document = parse(query)
+        except GraphQLError as error:
+            return {"errors": [error.formatted]}
+        errors = validate(self.schema, document)
+        if errors:
+            return {"errors": [error.formatted for error in errors]}
+
+        cost, nodes = query_cost(document, variables, operation_name)
+        if not self.rate_limit.charge(cost):
+            self.rate_limited += 1
+            return {
+                "errors": [
+                    {
+                        "type": "RATE_LIMITED",
+                        "message": "API rate limit exceeded for user ID 1.",
+                    }
+                ]
+            }
+        result = execute(
+            self.schema,
+            document,
+            root_value={"cost": cost, "nodeCount": nodes},
+            variable_values=variables,
+            operation_name=operation_name,
+            field_resolver=self._resolve,
+        )
+        response: Dict[str, Any] = {"data": result.data}
+        if result.errors:
+            response["errors"] = [error.formatted for error in result.errors]
+        return response
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        self.requests += 1
+        if scope["method"] != "POST":
+            await respond(send, 405, {"message": "Use POST."})
+            return
+        if self._in_flight >= self.max_concurrent:
+            self.secondary_limited += 1
+            await respond(
+                send,
+                403,
+                {"message": "You have exceeded a secondary rate limit."},
+                [(b"retry-after", str(self.retry_after).encode())],
+            )
+            return
+
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            try:
+                payload = json.loads(body)
+                query = payload["query"]
+            except (ValueError, KeyError, TypeError):
+                await respond(send, 400, {"message": "Problems parsing JSON"})
+                return
+            response = self.execute(
+                query, payload.get("variables"), payload.get("operationName")
+            )
+            await respond(send, 200, response, self.rate_limit.headers())
+        finally:
+            self._in_flight -= 1
+
+    # Resolvers
+
+    def _resolve(self, source: Any, info: GraphQLResolveInfo, **args: Any) -> Any:
+        name = info.field_name
+        if info.parent_type.name == "Query":
+            if name == "rateLimit":
+                rate_limit = self.rate_limit
+                return {
+                    "cost": source["cost"],
+                    "nodeCount": source["nodeCount"],
+                    "limit": rate_limit.limit,
+                    "remaining": rate_limit.remaining,
+                    "used": rate_limit.used,
+                    "resetAt": _timestamp(rate_limit.reset_at),
+                }
+            return {"owner": args["owner"], "name": args["name"]}
+        if info.parent_type.name == "Repository":
+            if name == "issues":
+                return self._issues(source, args)
+            if name == "rulesets":
+                return {"totalCount": 0}
+            if name == "id":
+                return f"R_{source['owner']}/{source['name']}"
+            if name == "nameWithOwner":
+                return f"{source['owner']}/{source['name']}"
+        return source.get(name)
+
+    def _issue(self, owner: str, name: str, number: int) -> Dict[str, Any]:
+        rng = random.Random(f"{self.seed}/{owner}/{name}/{number}")
+        return {
+            "id": f"I_{owner}/{name}#{number}",
+            "number": number,
+            "title": f"Issue {rng.randrange(100000)}",
+            "state": "OPEN" if rng.random() < 0.7 else "CLOSED",
+            "createdAt": _timestamp((_EPOCH + timedelta(hours=number)).timestamp()),
+        }
+
+    def _issues(self, repository: Dict[str, Any], args: Dict[str, Any]) -> Any:
+        first, last = args.get("first"), args.get("last")
+        if first is None and last is None:
+            raise GraphQLError(
+                "You must provide a `first` or `last` value to properly paginate"
+                " the `issues` connection."
+            )
+        size = first if first is not None else last
+        if not 0 <= size <= MAX_PAGE:
+            raise GraphQLError(
+                f"Requesting {size} records on the `issues` connection exceeds"
+                f" the `{'first' if first is not None else 'last'}` limit of"
+                f" {MAX_PAGE} records."
+            )
+
+        owner, name = repository["owner"], repository["name"]
+        issues = [
+            self._issue(owner, name, number)
+            for number in range(1, self.issue_count(owner, name) + 1)
+        ]
+        states = args.get("states")
+        if states:
+            issues = [issue for issue in issues if issue["state"] in states]
+        order = args.get("orderBy") or {}
+        if order.get("direction") == "DESC":
+            issues.reverse()
+
+        start = _position(args["after"]) + 1 if args.get("after") else 0
+        end = len(issues) if args.get("before") is None else _position(args["before"])
+        if first is not None:
+            page = list(range(start, min(end, start + first)))
+        else:
+            page = list(range(max(start, end - last), end))
+        return {
+            "nodes": [issues[position] for position in page],
+            "totalCount": len(issues),
+            "pageInfo": {
+                "startCursor": _cursor(page[0]) if page else None,
+                "endCursor": _cursor(page[-1]) if page else None,
+                "hasNextPage": bool(page) and page[-1] + 1 < end,
+                "hasPreviousPage": bool(page) and page[0] > 0,
+            },
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--issues", type=int, default=250, help="per repository")
+    parser.add_argument("--points", type=int, default=5000, help="per window")
+    parser.add_argument("--window", type=float, default=3600, help="seconds")
+    parser.add_argument("--max-concurrent", type=int, default=100)
+    parser.add_argument("--retry-after", type=int, default=1, help="seconds")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    app = GitHubStubServer(
+        issues=args.issues,
+        points=args.points,
+        window=args.window,
+        max_concurrent=args.max_concurrent,
+        retry_after=args.retry_after,
+        latency=args.latency,
+        seed=args.seed,
+    )
+
+    async def run() -> None:
+        server = await serve(app, args.host, args.port)
+        print(f"Serving the GitHub GraphQL stub on http://{args.host}:{args.port}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+"""
+Loads a schema introspection result into the datamodel-code-generator
+introspection models, or into a lookup index, in one pass.
+
+Usage (from codegens/datamodel-code-generator):
+
+    python ../../tools/introspection_loader.py ../../schemas/tableau/schema.graphql \\
+        tableau_pydantic_v2 --bench
+
+`Model.model_validate(json.load(...))` validates every object of the
+result, and most of them are the `type { kind name ofType { ... } }`
+chains of fields, arguments and input fields: a few thousand copies of
+a few hundred distinct type references. `ModelBuilder` compiles, once per
+model class, the table of `(JSON key, attribute, converter)` its fields
+need, builds instances without validating them (the result comes from
+the server, and the models were generated from such results), and builds
+each distinct type reference once per class: equal references share one
+instance, so the models must not be mutated.
+
+`SchemaIndex` is the lighter option for tools that only look types up:
+it indexes the types by name in one pass over the result, and resolves
+the fields, arguments and input fields of a type to interned `TypeRef`s
+the first time they are asked for, so a tool pays for the types it uses.
+
+The JSON is decoded with msgspec when it is installed. The introspection
+JSON the datamodel-code-generator models come from (`schema.json`) is
+not in the repository, so any of the `schemas/tableau` SDL files is
+accepted too: it is loaded with `synthetic.load_schema`, which drops the
+introspection types some of them re-declare, and introspected with
+graphql-core, which is much slower than reading the JSON. `--bench` then
+times decoding the JSON dump of that introspection.
+"""
+
+import argparse
+import dataclasses
+import gc
+import importlib
+import json
+import statistics
+import sys
+import time
+import typing
+from pathlib import Path
+from types import NoneType, UnionType
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import msgspec  # type: ignore[import-not-found,unused-ignore]
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
+
+Converter = Optional[Callable[[Any], Any]]
+
+_SCALARS = (str, int, float, bool, NoneType, Any)
+_TYPE_REF_KEYS = {"kind", "name", "ofType"}
+
+
+def read_introspection(path: Path) -> Dict[str, Any]:
+    """The introspection result in `path`, without its `data` envelope."""
+    if path.suffix == ".graphql":
+        from graphql import introspection_from_schema
+
+        from synthetic import load_schema
+
+        return dict(introspection_from_schema(load_schema(str(path))))
+    body = path.read_bytes()
+    result = msgspec.json.decode(body) if msgspec else json.loads(body)
+    return result.get("data", result)
+
+
+class TypeRef(NamedTuple):
+    """An interned `{kind, name, ofType}`: `String`, `[Column!]!`, ..."""
+
+    kind: str
+    name: Optional[str]
+    of_type: Optional["TypeRef"]
+
+    @property
+    def named(self) -> str:
+        """The name of the type under the `NON_NULL`/`LIST` wrappers."""
+        ref = self
+        while ref.of_type is not None:
+            ref = ref.of_type
+        return ref.name  # type: ignore[return-value]
+
+    def __str__(self) -> str:
+        if self.kind == "NON_NULL":
+            return f"{self.of_type}!"
+        if self.kind == "LIST":
+            return f"[{self.of_type}]"
+        return self.name or ""
+
+
+class TypeRefs:
+    """Memoized `TypeRef`s of `{kind, name, ofType}` objects."""
+
+    def __init__(self) -> None:
+        self._refs: Dict[Tuple[str, Optional[str], Optional[TypeRef]], TypeRef] = {}
+
+    def __call__(self, value: Dict[str, Any]) -> TypeRef:
+        of_type = value.get("ofType")
+        key = (value["kind"], value.get("name"), of_type and self(of_type))
+        ref = self._refs.get(key)
+        if ref is None:
+            ref = self._refs[key] = TypeRef(*key)
+        return ref
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+
+class SchemaIndex:
+    """
+    Types of a result by name, with their fields, arguments and input
+    fields resolved to `TypeRef`s the first time they are looked up.
+    """
+
+    def __init__(self, result: Dict[str, Any]) -> None:
+        schema = result["__schema"]
+        self.query_type: str = schema["queryType"]["name"]
+        self.types: Dict[str, Dict[str, Any]] = {
+            type_["name"]: type_ for type_ in schema["types"]
+        }
+        self.refs = TypeRefs()
+        self._fields: Dict[str, Dict[str, TypeRef]] = {}
+        self._args: Dict[Tuple[str, str], Dict[str, TypeRef]] = {}
+        self._input_fields: Dict[str, Dict[str, TypeRef]] = {}
+
+    def kind(self, type_name: str) -> str:
+        return self.types[type_name]["kind"]
+
+    def fields(self, type_name: str) -> Dict[str, TypeRef]:
+        """The types of the fields of an object or interface type."""
+        fields = self._fields.get(type_name)
+        if fields is None:
+            fields = self._fields[type_name] = {
+                field["name"]: self.refs(field["type"])
+                for field in self.types[type_name].get("fields") or ()
+            }
+        return fields
+
+    def args(self, type_name: str, field_name: str) -> Dict[str, TypeRef]:
+        """The types of the arguments of a field."""
+        args = self._args.get((type_name, field_name))
+        if args is None:
+            field = next(
+                field
+                for field in self.types[type_name]["fields"]
+                if field["name"] == field_name
+            )
+            args = self._args[type_name, field_name] = {
+                arg["name"]: self.refs(arg["type"]) for arg in field.get("args") or ()
+            }
+        return args
+
+    def input_fields(self, type_name: str) -> Dict[str, TypeRef]:
+        """The types of the fields of an input type."""
+        fields = self._input_fields.get(type_name)
+        if fields is None:
+            fields = self._input_fields[type_name] = {
+                field["name"]: self.refs(field["type"])
+                for field in self.types[type_name].get("inputFields") or ()
+            }
+        return fields
+
+    def possible_types(self, type_name: str) -> List[str]:
+        """The object types of a union or an interface."""
+        return [ref["name"] for ref in self.types[type_name].get("possibleTypes") or ()]
+
+    def interfaces(self, type_name: str) -> List[str]:
+        return [ref["name"] for ref in self.types[type_name].get("interfaces") or ()]
+
+    def enum_values(self, type_name: str) -> List[str]:
+        return [
+            value["name"] for value in self.types[type_name].get("enumValues") or ()
+        ]
+
+
+def _json_key(name: str) -> str:
+    # datamodel-codegen renames `__schema` to `field__schema`, and only
+    # pydantic models keep the original name as an alias.
+    if name.startswith("field__"):
+        return name[len("field") :]
+    return name
+
+
+def _field_table(model: type) -> List[Tuple[str, str, Any, Any]]:
+    # (JSON key, attribute, annotation, default) of pydantic models and
+    # dataclasses.
+    if dataclasses.is_dataclass(model):
+        hints = typing.get_type_hints(model)
+        return [
+            (
+                _json_key(field.name),
+                field.name,
+                hints[field.name],
+                None if field.default is dataclasses.MISSING else field.default,
+            )
+            for field in dataclasses.fields(model)
+        ]
+    return [
+        (
+            field.alias or name,
+            name,
+            field.annotation,
+            None if field.is_required() else field.default,
+        )
+        for name, field in model.model_fields.items()  # type: ignore[attr-defined]
+    ]
+
+
+class ModelBuilder:
+    """Builds instances of generated introspection models from JSON."""
+
+    def __init__(self, model: type) -> None:
+        self.model = model
+        self.refs = TypeRefs()
+        self._builders: Dict[type, Callable[[Any], Any]] = {}
+
+    def __call__(self, result: Dict[str, Any]) -> Any:
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self.builder(self.model)(result)
+        finally:
+            if enabled:
+                gc.enable()
+
+    def builder(self, model: type) -> Callable[[Any], Any]:
+        """Builds `model` from a JSON object, compiling its table on first use."""
+        build = self._builders.get(model)
+        if build is not None:
+            return build
+
+        plain: List[Tuple[str, str, Any]] = []
+        converted: List[Tuple[str, str, Callable[[Any], Any]]] = []
+        new = self._constructor(model)
+
+        def build(value: Dict[str, Any]) -> Any:
+            values = {
+                attribute: value.get(key, default) for key, attribute, default in plain
+            }
+            for key, attribute, convert in converted:
+                item = value.get(key)
+                values[attribute] = None if item is None else convert(item)
+            return new(values)
+
+        table = _field_table(model)
+        if {key for key, *_ in table} <= _TYPE_REF_KEYS:
+            build = self._memoized(build)
+        # Registered before the converters, for models that refer to
+        # themselves.
+        self._builders[model] = build
+        for key, attribute, annotation, default in table:
+            convert = self.converter(annotation)
+            if convert is None:
+                plain.append((key, attribute, default))
+            else:
+                converted.append((key, attribute, convert))
+        return build
+
+    def converter(self, annotation: Any) -> Converter:
+        """The conversion of a JSON value to `annotation`, `None` if none."""
+        origin = typing.get_origin(annotation)
+        args = typing.get_args(annotation)
+        if origin in (typing.Union, UnionType):
+            members = [arg for arg in args if arg is not NoneType]
+            if len(members) == 1:
+                # `None` is never converted.
+                return self.converter(members[0])
+            return None
+        if origin is list:
+            convert = self.converter(args[0])
+            if convert is None:
+                return None
+            return lambda items: [
+                convert(item) if item is not None else None for item in items
+            ]
+        if annotation in _SCALARS or annotation is None:
+            return None
+        if isinstance(annotation, type):
+            return self.builder(annotation)
+        return None
+
+    def _memoized(self, build: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        built: Dict[TypeRef, Any] = {}
+        refs = self.refs
+
+        def memoized(value: Dict[str, Any]) -> Any:
+            ref = refs(value)
+            instance = built.get(ref)
+            if instance is None:
+                instance = built[ref] = build(value)
+            return instance
+
+        return memoized
+
+    @staticmethod
+    def _constructor(model: type) -> Callable[[Dict[str, Any]], Any]:
+        new = object.__new__
+        setattr_ = object.__setattr__
+        if dataclasses.is_dataclass(model):
+
+            def construct(values: Dict[str, Any]) -> Any:
+                instance = new(model)
+                instance.__dict__.update(values)
+                return instance
+
+        else:
+            # What `model_construct()` does, without its per-field loop.
+            def construct(values: Dict[str, Any]) -> Any:
+                instance = new(model)
+                setattr_(instance, "__dict__", values)
+                setattr_(instance, "__pydantic_fields_set__", set(values))
+                setattr_(instance, "__pydantic_extra__", None)
+                setattr_(instance, "__pydantic_private__", None)
+                return instance
+
+        return construct
+
+
+def load_models(path: Path, model: type) -> Any:
+    """The introspection result in `path` as an instance of `model`."""
+    return ModelBuilder(model)(read_introspection(path))
+
+
+def load_index(path: Path) -> SchemaIndex:
+    """The introspection result in `path` as a `SchemaIndex`."""
+    return SchemaIndex(read_introspection(path))
+
+
+def _resolve_all(index: SchemaIndex) -> int:
+    for name in index.types:
+        index.fields(name)
+        index.input_fields(name)
+    return len(index.refs)
+
+
+def _median(function: Callable[[], Any], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _dump(value: Any) -> Any:
+    if dataclasses.is_dataclass(value):
+        return {
+            field.name: _dump(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+    if hasattr(type(value), "model_fields"):
+        return {name: _dump(getattr(value, name)) for name in type(value).model_fields}
+    if isinstance(value, list):
+        return [_dump(item) for item in value]
+    return value
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("path", type=Path, help="introspection JSON (or SDL)")
+    parser.add_argument(
+        "models",
+        nargs="?",
+        help="module generated by datamodel-codegen from the introspection JSON",
+    )
+    parser.add_argument("--model", default="Model", help="the root model class")
+    parser.add_argument(
+        "--bench",
+        action="store_true",
+        help="check against and time json.loads + model_validate (pydantic models)",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(Path.cwd()))
+    result = read_introspection(args.path)
+    if args.path.suffix == ".graphql":
+        body = json.dumps({"data": result}).encode()
+    else:
+        body = args.path.read_bytes()
+    index = SchemaIndex(result)
+    print(
+        f"{args.path}: {len(body) / 1e6:.1f} MB, {len(index.types)} types,"
+        f" {_resolve_all(index)} distinct type references"
+    )
+    reader = "graphql-core" if args.path.suffix == ".graphql" else "json"
+    reader = "msgspec" if msgspec and reader == "json" else reader
+    timings = {
+        f"read ({reader})": _median(lambda: read_introspection(args.path), 3),
+        "SchemaIndex": _median(lambda: SchemaIndex(result), args.repeat),
+        "SchemaIndex, every type resolved": _median(
+            lambda: _resolve_all(SchemaIndex(result)), args.repeat
+        ),
+    }
+
+    if args.models:
+        model = getattr(importlib.import_module(args.models), args.model)
+        bench = args.bench and hasattr(model, "model_validate")
+        if bench:
+            # graphql-core's own introspection types do not follow the
+            # shapes the models were inferred from.
+            schema = result["__schema"]
+            types = [type_ for type_ in schema["types"] if type_["name"][:2] != "__"]
+            result = {**result, "__schema": {**schema, "types": types}}
+            built = _dump(ModelBuilder(model)(result))
+            if built != _dump(model.model_validate(result)):
+                raise SystemExit("ModelBuilder does not build what model_validate does")
+        timings[f"ModelBuilder({args.models}.{args.model})"] = _median(
+            lambda: ModelBuilder(model)(result), args.repeat
+        )
+        if bench:
+            timings["json.loads"] = _median(lambda: json.loads(body), args.repeat)
+            timings["model_validate"] = _median(
+                lambda: model.model_validate(result), args.repeat
+            )
+
+    for label, seconds in timings.items():
+        print(f"  {label:48} {seconds * 1e3:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
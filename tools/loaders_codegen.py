@@ -0,0 +1,219 @@
+"""
+Generates batched DataLoader hooks for the object-reference fields of a
+GraphQL schema.
+
+Usage (from codegens/strawberry):
+
+    python ../../tools/loaders_codegen.py \\
+        ../../schemas/tableau/schema-strawberry.graphql -o tableau_loaders.py
+
+A reference field is a field of an object type with an `id` whose type
+is another object, interface or union, or a list of them (`Sheet.workbook`,
+`Field.datasource`, `DatabaseTable.database`, `Sheet.upstreamTables`,
+...). Paginated `*Connection` fields are left to the regular resolvers.
+The generated module lists every reference field in `REFERENCES` and
+ships `ReferenceLoaders`, which resolves them through one
+`strawberry.dataloader.DataLoader` per field, so all lookups of one field
+at one level of a request reach the backend as a single batch.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from graphql import (
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    get_named_type,
+    is_composite_type,
+)
+
+from synthetic import load_schema
+
+try:
+    import black  # type: ignore[import-not-found,unused-ignore]
+except ImportError:
+    black = None  # type: ignore[assignment]
+
+_RUNTIME = '''
+
+BatchLoad = Callable[
+    [str, str, List[str], Dict[str, Any]], Awaitable[Sequence[Any]]
+]
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _cache_key(key: Tuple[str, Hashable, Any]) -> Hashable:
+    return key[:2]
+
+
+def _parent_id(source: Any) -> Optional[str]:
+    if isinstance(source, dict):
+        return source.get("id")
+    return getattr(source, "id", None)
+
+
+class ReferenceLoaders:
+    """
+    Per-request DataLoaders for every field in `REFERENCES`.
+
+    `batch_load(parent_type, field, parent_ids, args)` is the backend
+    call: it returns one result per parent id, in order, `None` or a list
+    as the field's type requires. Loads of the same field with the same
+    arguments that are issued in one tick of the event loop, like the
+    `workbook` of every sheet of a page, are passed to one call. Create a
+    new instance per request so results are not cached across requests.
+    """
+
+    def __init__(
+        self, batch_load: BatchLoad, max_batch_size: Optional[int] = None
+    ) -> None:
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self._loaders: Dict[Tuple[str, str], DataLoader] = {}
+
+    def loader(self, parent_type: str, field: str) -> DataLoader:
+        key = (parent_type, field)
+        loader = self._loaders.get(key)
+        if loader is None:
+            loader = self._loaders[key] = DataLoader(
+                load_fn=partial(self._load_batch, parent_type, field),
+                max_batch_size=self.max_batch_size,
+                cache_key_fn=_cache_key,
+            )
+        return loader
+
+    def load(
+        self,
+        parent_type: str,
+        field: str,
+        parent_id: str,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> Awaitable[Any]:
+        return self.loader(parent_type, field).load(
+            (parent_id, _freeze(args or {}), args or {})
+        )
+
+    def field_resolver(self, source: Any, info: Any, **args: Any) -> Any:
+        """
+        A graphql-core `field_resolver` that batches reference fields and
+        resolves everything else like `default_field_resolver`.
+        """
+        parent_type = info.parent_type.name
+        parent_id = _parent_id(source)
+        if info.field_name in REFERENCES.get(parent_type, ()) and parent_id:
+            return self.load(parent_type, info.field_name, parent_id, args)
+        return default_field_resolver(source, info, **args)
+
+    async def _load_batch(
+        self, parent_type: str, field: str, keys: List[Tuple[str, Hashable, Any]]
+    ) -> List[Any]:
+        groups: Dict[Hashable, List[int]] = {}
+        for index, (_, frozen_args, _) in enumerate(keys):
+            groups.setdefault(frozen_args, []).append(index)
+
+        results: List[Any] = [None] * len(keys)
+        for indexes in groups.values():
+            args = keys[indexes[0]][2]
+            values = await self.batch_load(
+                parent_type, field, [keys[index][0] for index in indexes], args
+            )
+            for index, value in zip(indexes, values):
+                results[index] = value
+        return results
+'''
+
+
+def reference_fields(schema: GraphQLSchema) -> List[Tuple[str, str, str, bool]]:
+    """`(parent type, field, referenced type, is list)` of every reference."""
+    references = []
+    for type_ in schema.type_map.values():
+        if (
+            not isinstance(type_, GraphQLObjectType)
+            or type_.name.startswith("__")
+            or type_ in (schema.query_type, schema.mutation_type)
+            # Lookups are batched by parent id.
+            or "id" not in type_.fields
+        ):
+            continue
+        for name, field in type_.fields.items():
+            named = get_named_type(field.type)
+            if not is_composite_type(named) or name.startswith("__"):
+                continue
+            if isinstance(named, GraphQLObjectType) and (
+                "nodes" in named.fields or named.name == "PageInfo"
+            ):
+                continue
+            field_type = field.type
+            if isinstance(field_type, GraphQLNonNull):
+                field_type = field_type.of_type
+            references.append(
+                (type_.name, name, named.name, isinstance(field_type, GraphQLList))
+            )
+    return sorted(references)
+
+
+def render(schema: GraphQLSchema, source: str) -> str:
+    lines = [
+        "# Generated by tools/loaders_codegen.py",
+        f"# Source: {source}",
+        "",
+        "from functools import partial",
+        "from typing import (",
+        "    Any, Awaitable, Callable, Dict, Hashable, List, NamedTuple, Optional,",
+        "    Sequence, Tuple,",
+        ")",
+        "",
+        "from graphql import default_field_resolver",
+        "from strawberry.dataloader import DataLoader",
+        "",
+        "",
+        "class Reference(NamedTuple):",
+        "    type: str",
+        "    is_list: bool",
+        "",
+        "",
+        "REFERENCES: Dict[str, Dict[str, Reference]] = {",
+    ]
+    current = None
+    for parent_type, field, target, is_list in reference_fields(schema):
+        if parent_type != current:
+            if current is not None:
+                lines.append("    },")
+            lines.append(f"    {parent_type!r}: {{")
+            current = parent_type
+        lines.append(f"        {field!r}: Reference({target!r}, {is_list}),")
+    if current is not None:
+        lines.append("    },")
+    lines.append("}")
+    code = "\n".join(lines) + "\n" + _RUNTIME
+    if black is not None:
+        code = black.format_str(code, mode=black.Mode())
+    return code
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("schema", help="SDL file")
+    parser.add_argument("-o", "--output", type=Path, help="file to write")
+    args = parser.parse_args(argv)
+
+    code = render(load_schema(str(Path(args.schema).resolve())), args.schema)
+    if args.output:
+        args.output.write_text(code, encoding="utf-8")
+    else:
+        sys.stdout.write(code)
+
+
+if __name__ == "__main__":
+    main()
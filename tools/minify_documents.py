@@ -0,0 +1,164 @@
+"""
+Minifies the `Meta.document` of turms operations and prunes `__typename`.
+
+Usage (from codegens/turms, after `turms gen`):
+
+    python ../../tools/minify_documents.py tableau_api/schema.py
+
+turms pretty-prints every document and selects `__typename` in every
+selection set, so requests carry the indentation and responses echo
+`__typename` on every object. The documents are rewritten in place with
+insignificant whitespace stripped and with `__typename` kept only where
+the selection is on a union or an interface, where the models need it to
+tell the members apart. Every other model declares its `__typename` with
+a default, so responses without it validate to the same models.
+`--keep-typename` only strips the whitespace.
+"""
+
+import argparse
+import ast
+from pathlib import Path
+from typing import Any, List, Optional
+
+from graphql import (
+    REMOVE,
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    GraphQLSchema,
+    OperationDefinitionNode,
+    TypeInfo,
+    TypeInfoVisitor,
+    Visitor,
+    get_named_type,
+    is_abstract_type,
+    parse,
+    print_ast,
+    strip_ignored_characters,
+    visit,
+)
+
+from synthetic import load_schema
+
+
+class _TypenamePruner(Visitor):
+    def __init__(self, type_info: TypeInfo) -> None:
+        super().__init__()
+        self.type_info = type_info
+        # Named types of the selection sets being visited, innermost last.
+        self.parents: List[Any] = []
+
+    def enter_operation_definition(self, node: OperationDefinitionNode, *_: Any):
+        self.parents.append(self.type_info.get_type())
+
+    def leave_operation_definition(self, node: OperationDefinitionNode, *_: Any):
+        self.parents.pop()
+
+    def enter_fragment_definition(self, node: FragmentDefinitionNode, *_: Any):
+        self.parents.append(self.type_info.get_type())
+
+    def leave_fragment_definition(self, node: FragmentDefinitionNode, *_: Any):
+        self.parents.pop()
+
+    def enter_field(self, node: FieldNode, *_: Any):
+        if node.selection_set is not None:
+            self.parents.append(get_named_type(self.type_info.get_type()))
+        elif (
+            node.name.value == "__typename"
+            and node.alias is None
+            and not node.directives
+            and not is_abstract_type(self.parents[-1])
+        ):
+            return REMOVE
+        return None
+
+    def leave_field(self, node: FieldNode, *_: Any):
+        if node.selection_set is not None:
+            self.parents.pop()
+
+
+def prune_typename(document: DocumentNode, schema: GraphQLSchema) -> DocumentNode:
+    """
+    `document` without the `__typename` selections of object types.
+
+    Selections on a union or an interface keep their `__typename`, also
+    from within their inline fragments and fragment spreads.
+    """
+    type_info = TypeInfo(schema)
+    return visit(document, TypeInfoVisitor(type_info, _TypenamePruner(type_info)))
+
+
+def minify_document(
+    document: str,
+    schema: Optional[GraphQLSchema] = None,
+    keep_typename: bool = False,
+) -> str:
+    """`document` without insignificant whitespace nor needless `__typename`."""
+    ast_ = parse(document, no_location=True)
+    if not keep_typename:
+        ast_ = prune_typename(ast_, schema or load_schema())
+    return strip_ignored_characters(print_ast(ast_))
+
+
+def minify_module(
+    source: str,
+    schema: Optional[GraphQLSchema] = None,
+    keep_typename: bool = False,
+) -> str:
+    """`source` with the `document` of every `class Meta` minified."""
+    tree = ast.parse(source)
+    documents = [
+        statement.value
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ClassDef) and node.name == "Meta"
+        for statement in node.body
+        if isinstance(statement, ast.Assign)
+        and [getattr(target, "id", None) for target in statement.targets]
+        == ["document"]
+        and isinstance(statement.value, ast.Constant)
+        and isinstance(statement.value.value, str)
+    ]
+
+    lines = source.splitlines(keepends=True)
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line.encode()))
+    encoded = source.encode()
+
+    def position(line: int, column: int) -> int:
+        # ast columns are byte offsets within the line.
+        return offsets[line - 1] + column
+
+    # Replaced from the end, so the positions of the others stay valid.
+    for value in sorted(documents, key=lambda value: value.lineno, reverse=True):
+        start = position(value.lineno, value.col_offset)
+        end = position(value.end_lineno, value.end_col_offset)  # type: ignore[arg-type]
+        minified = minify_document(value.value, schema, keep_typename)
+        encoded = encoded[:start] + repr(minified).encode() + encoded[end:]
+    return encoded.decode()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("module", type=Path, help="module generated by turms")
+    parser.add_argument(
+        "--schema",
+        help="GraphQL SDL of the API (default: the Tableau schema)",
+    )
+    parser.add_argument(
+        "--keep-typename",
+        action="store_true",
+        help="only strip whitespace, keep every __typename",
+    )
+    args = parser.parse_args(argv)
+
+    source = args.module.read_text(encoding="utf-8")
+    minified = minify_module(source, load_schema(args.schema), args.keep_typename)
+    args.module.write_text(minified, encoding="utf-8")
+    print(
+        f"{args.module}: {len(source.encode()):,} -> {len(minified.encode()):,} bytes"
+    )
+
+
+if __name__ == "__main__":
+    main()
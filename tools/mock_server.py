@@ -0,0 +1,545 @@
+"""
+Local stand-in for the Tableau Metadata API, serving synthetic data.
+
+Usage:
+
+    python tools/mock_server.py --port 8000 --latency 0.05 --rate-limit 0.01
+
+and point any client at `http://127.0.0.1:8000/api/metadata/graphql`
+(every path is accepted). `MockTableauServer` is also an ASGI app, so
+httpx clients can talk to it in-process with `httpx.ASGITransport`.
+
+Queries are executed against `schemas/tableau/schema-strawberry.graphql`,
+the SDL the strawberry codegen is generated from. The generated strawberry
+module itself cannot back a server: it does not import (the introspection
+types it re-declares are name-mangled) and its fields carry no arguments.
+
+Every type has a pool of `--entities` entities with stable ids, and every
+field of an entity is drawn from a random stream seeded by the entity id
+and the field name, so an entity looks the same in every response and
+references (`Sheet.workbook`, `Field.datasource`, ...) point back into
+the pools; the pool of an interface or union is those of its types.
+Connections implement `first` (default 100, at most `--max-first`),
+`after` cursors, `offset` (not together with `after`) and `totalCount` /
+`pageInfo`, sorted by id. `idWithin` / `id` filters select exactly those
+ids; any other `<field>Within` / `<field>` filter makes the returned
+entities carry one of the given values. Responses with more than
+`--node-limit` objects come with a `NODE_LIMIT_EXCEEDED` error, like
+Tableau's, and `--rate-limit` is the share of requests that are answered
+with `429 Too Many Requests`.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from graphql import (
+    GraphQLEnumType,
+    GraphQLError,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    execute,
+    get_named_type,
+    is_abstract_type,
+    is_composite_type,
+    parse,
+    validate,
+)
+
+from synthetic import fake_scalar, load_schema
+
+SCHEMA_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "schemas"
+    / "tableau"
+    / "schema-strawberry.graphql"
+)
+
+DEFAULT_FIRST = 100
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+App = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+class _Entity:
+    __slots__ = ("type_name", "id", "overrides")
+
+    def __init__(
+        self, type_name: str, entity_id: str, overrides: Dict[str, List[Any]]
+    ) -> None:
+        self.type_name = type_name
+        self.id = entity_id
+        self.overrides = overrides
+
+
+def _is_connection(type_: Any) -> bool:
+    return isinstance(type_, GraphQLObjectType) and "nodes" in type_.fields
+
+
+def _cursor(position: int) -> str:
+    return base64.b64encode(f"cursor:{position}".encode()).decode()
+
+
+def _position(cursor: str) -> int:
+    try:
+        return int(base64.b64decode(cursor).decode().split(":", 1)[1])
+    except (ValueError, IndexError) as exc:
+        raise GraphQLError(f"Invalid cursor: {cursor}") from exc
+
+
+def _count_objects(value: Any) -> int:
+    if isinstance(value, dict):
+        return 1 + sum(_count_objects(item) for item in value.values())
+    if isinstance(value, list):
+        return sum(_count_objects(item) for item in value)
+    return 0
+
+
+class MockTableauServer:
+    """ASGI app answering Metadata API queries with synthetic entities."""
+
+    def __init__(
+        self,
+        schema: Optional[GraphQLSchema] = None,
+        seed: int = 0,
+        entities: int = 1000,
+        fan_out: float = 3,
+        null_rate: float = 0.05,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        node_limit: int = 20000,
+        max_first: int = 1000,
+        rate_limit: float = 0.0,
+        retry_after: int = 1,
+    ) -> None:
+        self.schema = schema or load_schema(str(SCHEMA_PATH))
+        self.seed = seed
+        self.entities = entities
+        self.fan_out = fan_out
+        self.null_rate = null_rate
+        self.latency = latency
+        self.jitter = jitter
+        self.node_limit = node_limit
+        self.max_first = max_first
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.requests = 0
+        self.rate_limited = 0
+        self._rng = random.Random(seed)
+        self._pools: Dict[str, List[str]] = {}
+        self._owners: Dict[str, str] = {}
+
+    def execute(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Executes one GraphQL request and returns the response payload."""
+        try:
+            document = parse(query)
+        except GraphQLError as error:
+            return {"errors": [error.formatted]}
+        errors = validate(self.schema, document)
+        if errors:
+            return {"errors": [error.formatted for error in errors]}
+
+        result = execute(
+            self.schema,
+            document,
+            variable_values=variables,
+            operation_name=operation_name,
+            field_resolver=self._resolve,
+            type_resolver=self._resolve_type,
+        )
+        response: Dict[str, Any] = {"data": result.data}
+        response_errors = [error.formatted for error in result.errors or ()]
+        nodes = _count_objects(result.data)
+        if nodes > self.node_limit:
+            response_errors.append(
+                {
+                    "message": (
+                        "Showing partial results. The request exceeded the "
+                        f"{self.node_limit} node limit. Use pagination, additional "
+                        "filtering, or both in the query to adjust results."
+                    ),
+                    "extensions": {
+                        "severity": "WARNING",
+                        "code": "NODE_LIMIT_EXCEEDED",
+                        "properties": {"nodeLimit": self.node_limit},
+                    },
+                }
+            )
+        if response_errors:
+            response["errors"] = response_errors
+        return response
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        self.requests += 1
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + self._rng.uniform(0, self.jitter))
+        if scope["method"] != "POST":
+            await respond(send, 405, {"errors": [{"message": "Use POST."}]})
+            return
+        if self.rate_limit and self._rng.random() < self.rate_limit:
+            self.rate_limited += 1
+            await respond(
+                send,
+                429,
+                {"errors": [{"message": "Too Many Requests"}]},
+                [(b"retry-after", str(self.retry_after).encode())],
+            )
+            return
+
+        try:
+            payload = json.loads(body)
+            query = payload["query"]
+        except (ValueError, KeyError, TypeError):
+            await respond(send, 400, {"errors": [{"message": "Invalid request."}]})
+            return
+        response = self.execute(
+            query, payload.get("variables"), payload.get("operationName")
+        )
+        await respond(send, 200, response)
+
+    # Resolvers
+
+    def _resolve(self, source: Any, info: GraphQLResolveInfo, **args: Any) -> Any:
+        if isinstance(source, _Entity):
+            return self._entity_field(source, info, args)
+        if isinstance(source, dict):
+            return source.get(info.field_name)
+        return self._root_field(info, args)
+
+    def _resolve_type(self, value: _Entity, *_: Any) -> str:
+        return value.type_name
+
+    def _root_field(self, info: GraphQLResolveInfo, args: Dict[str, Any]) -> Any:
+        named = get_named_type(info.return_type)
+        node_type = (
+            get_named_type(named.fields["nodes"].type)
+            if _is_connection(named)
+            else named
+        )
+        ids, overrides = self._filter(self._pool(node_type.name), args.get("filter"))
+        if _is_connection(named):
+            return self._connection(node_type, ids, overrides, args)
+        return [self._entity(node_type, entity_id, overrides) for entity_id in ids]
+
+    def _entity_field(
+        self, entity: _Entity, info: GraphQLResolveInfo, args: Dict[str, Any]
+    ) -> Any:
+        name = info.field_name
+        if name == "id":
+            return entity.id
+        rng = random.Random(f"{self.seed}/{entity.id}/{name}")
+        if name in entity.overrides:
+            return rng.choice(entity.overrides[name])
+
+        type_ = info.return_type
+        if isinstance(type_, GraphQLNonNull):
+            type_ = type_.of_type
+        elif rng.random() < self.null_rate:
+            return None
+
+        named = get_named_type(type_)
+        if _is_connection(named):
+            node_type = get_named_type(named.fields["nodes"].type)
+            ids = sorted(set(self._references(rng, node_type.name)))
+            ids, overrides = self._filter(ids, args.get("filter"))
+            return self._connection(node_type, ids, overrides, args)
+        if isinstance(type_, GraphQLList):
+            if is_composite_type(named):
+                return [
+                    self._entity(named, entity_id, {})
+                    for entity_id in self._references(rng, named.name)
+                ]
+            return [self._scalar(rng, named, name) for _ in range(self._length(rng))]
+        if is_composite_type(named):
+            pool = self._pool(named.name)
+            return self._entity(named, pool[rng.randrange(len(pool))], {})
+        return self._scalar(rng, named, name)
+
+    # Data
+
+    def _pool(self, type_name: str) -> List[str]:
+        """
+        The sorted ids of every entity of `type_name`: those of its
+        possible types for an interface or union.
+        """
+        pool = self._pools.get(type_name)
+        if pool is None:
+            type_ = self.schema.get_type(type_name)
+            if is_abstract_type(type_):
+                pool = sorted(
+                    entity_id
+                    for possible_type in self.schema.get_possible_types(type_)
+                    for entity_id in self._pool(possible_type.name)
+                )
+            else:
+                pool = sorted(
+                    str(
+                        uuid.UUID(
+                            int=random.Random(
+                                f"{self.seed}/{type_name}/{index}"
+                            ).getrandbits(128),
+                            version=4,
+                        )
+                    )
+                    for index in range(self.entities)
+                )
+                for entity_id in pool:
+                    self._owners[entity_id] = type_name
+            self._pools[type_name] = pool
+        return pool
+
+    def _length(self, rng: random.Random) -> int:
+        return int(rng.expovariate(1 / self.fan_out)) if self.fan_out else 0
+
+    def _references(self, rng: random.Random, type_name: str) -> List[str]:
+        pool = self._pool(type_name)
+        return [pool[rng.randrange(len(pool))] for _ in range(self._length(rng))]
+
+    def _entity(
+        self, type_: Any, entity_id: str, overrides: Dict[str, List[Any]]
+    ) -> _Entity:
+        if is_abstract_type(type_):
+            self._pool(type_.name)
+            type_name = self._owners.get(entity_id)
+            if type_name is None:
+                # An id from a filter, not from the pools.
+                possible_types = sorted(
+                    self.schema.get_possible_types(type_), key=lambda t: t.name
+                )
+                type_name = (
+                    random.Random(f"{self.seed}/{entity_id}")
+                    .choice(possible_types)
+                    .name
+                )
+            return _Entity(type_name, entity_id, overrides)
+        return _Entity(type_.name, entity_id, overrides)
+
+    def _scalar(self, rng: random.Random, type_: Any, field_name: str) -> Any:
+        if isinstance(type_, GraphQLEnumType):
+            return rng.choice(list(type_.values))
+        return fake_scalar(rng, type_.name, field_name)
+
+    def _filter(
+        self, ids: List[str], filter_: Optional[Dict[str, Any]]
+    ) -> Tuple[List[str], Dict[str, List[Any]]]:
+        overrides: Dict[str, List[Any]] = {}
+        for key, value in (filter_ or {}).items():
+            if value is None:
+                continue
+            if key == "idWithin":
+                ids = sorted(set(value))
+            elif key == "id":
+                ids = [value]
+            elif key.endswith("Within"):
+                overrides[key[: -len("Within")]] = list(value)
+            else:
+                overrides[key] = [value]
+        return ids, overrides
+
+    def _connection(
+        self,
+        node_type: Any,
+        ids: List[str],
+        overrides: Dict[str, List[Any]],
+        args: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        first = args.get("first")
+        first = DEFAULT_FIRST if first is None else first
+        if not 0 <= first <= self.max_first:
+            raise GraphQLError(f"first must be between 0 and {self.max_first}.")
+        after, offset = args.get("after"), args.get("offset")
+        if after is not None and offset is not None:
+            raise GraphQLError("Offset can not be set at the same time as after.")
+        start = _position(after) + 1 if after is not None else offset or 0
+
+        page = ids[start : start + first]
+        end = start + len(page)
+        return {
+            "nodes": [
+                self._entity(node_type, entity_id, overrides) for entity_id in page
+            ],
+            "totalCount": len(ids),
+            "pageInfo": {
+                "hasNextPage": end < len(ids),
+                "hasPreviousPage": start > 0,
+                "startCursor": _cursor(start) if page else None,
+                "endCursor": _cursor(end - 1) if page else None,
+            },
+        }
+
+
+async def respond(
+    send: Send,
+    status: int,
+    payload: Dict[str, Any],
+    headers: Optional[List[Tuple[bytes, bytes]]] = None,
+) -> None:
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                *(headers or []),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def serve(app: App, host: str, port: int) -> asyncio.Server:
+    """
+    Serves an ASGI app over plain HTTP/1.1 with keep-alive, so the mock
+    needs nothing beyond the standard library. Request bodies must come
+    with a `Content-Length`, which every GraphQL client here sends.
+    """
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode("latin-1").split()
+                headers: List[Tuple[bytes, bytes]] = []
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers.append(
+                        (name.strip().lower().encode(), value.strip().encode())
+                    )
+                header_map = dict(headers)
+                body = await reader.readexactly(
+                    int(header_map.get(b"content-length", b"0"))
+                )
+                keep_alive = (
+                    version == "HTTP/1.1"
+                    and header_map.get(b"connection", b"").lower() != b"close"
+                )
+
+                path, _, query_string = target.partition("?")
+                scope = {
+                    "type": "http",
+                    "http_version": version.split("/")[1],
+                    "method": method,
+                    "path": path,
+                    "query_string": query_string.encode(),
+                    "headers": headers,
+                }
+                response: List[Dict[str, Any]] = []
+
+                async def receive(body: bytes = body) -> Dict[str, Any]:
+                    return {"type": "http.request", "body": body, "more_body": False}
+
+                async def send(
+                    message: Dict[str, Any],
+                    response: List[Dict[str, Any]] = response,
+                ) -> None:
+                    response.append(message)
+
+                await app(scope, receive, send)
+                start, content = response[0], response[1]
+                status_line = f"HTTP/1.1 {start['status']} \r\n".encode()
+                writer.write(status_line)
+                for name, value in start["headers"]:
+                    writer.write(name + b": " + value + b"\r\n")
+                if not keep_alive:
+                    writer.write(b"connection: close\r\n")
+                writer.write(b"\r\n" + content["body"])
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--entities", type=int, default=1000, help="per type")
+    parser.add_argument("--fan-out", type=float, default=3)
+    parser.add_argument("--null-rate", type=float, default=0.05)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--node-limit", type=int, default=20000)
+    parser.add_argument("--max-first", type=int, default=1000)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="429 share")
+    parser.add_argument("--retry-after", type=int, default=1, help="seconds")
+    parser.add_argument("--schema", help="SDL file (default: the strawberry SDL)")
+    args = parser.parse_args(argv)
+
+    app = MockTableauServer(
+        load_schema(args.schema or str(SCHEMA_PATH)),
+        seed=args.seed,
+        entities=args.entities,
+        fan_out=args.fan_out,
+        null_rate=args.null_rate,
+        latency=args.latency,
+        jitter=args.jitter,
+        node_limit=args.node_limit,
+        max_first=args.max_first,
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after,
+    )
+
+    async def run() -> None:
+        server = await serve(app, args.host, args.port)
+        print(
+            f"Serving the Tableau Metadata API mock on http://{args.host}:{args.port}"
+        )
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+Generates msgspec `Struct` response types from generated pydantic models.
+
+Usage (from a codegen directory):
+
+    python ../../tools/msgspec_codegen.py tableau_queries -o tableau_structs.py
+
+Every pydantic model defined in the given module (or in the submodules of
+the given package) gets a `Struct` with the same name and field names.
+Field aliases become `rename` entries, enums are imported from where the
+models import them, and unions discriminated on `__typename` become
+msgspec tagged unions: each member is tagged with its `__typename`, and a
+member that stands for several types (ariadne's fallback classes) gets one
+tagged subclass per type. Structs are slotted and untracked by the GC
+(`gc=False`), since decoded responses are trees without cycles.
+"""
+
+import argparse
+import datetime
+import enum
+import importlib
+import pkgutil
+import sys
+import typing
+from pathlib import Path
+from types import NoneType, UnionType
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel
+
+try:
+    import black  # type: ignore[import-not-found,unused-ignore]
+except ImportError:
+    black = None  # type: ignore[assignment]
+
+_BUILTINS = {str: "str", int: "int", float: "float", bool: "bool"}
+
+
+def load_models(name: str, exclude: Iterable[str] = ()) -> List[Type[BaseModel]]:
+    """Pydantic models defined in module `name` or in its submodules."""
+    module = importlib.import_module(name)
+    modules = [module]
+    if hasattr(module, "__path__"):
+        modules += [
+            importlib.import_module(info.name)
+            for info in pkgutil.iter_modules(module.__path__, f"{name}.")
+            if info.name not in exclude
+        ]
+    models: List[Type[BaseModel]] = []
+    for submodule in modules:
+        for value in vars(submodule).values():
+            if (
+                isinstance(value, type)
+                and issubclass(value, BaseModel)
+                and value.__module__ == submodule.__name__
+                and value.model_fields
+                and value not in models
+            ):
+                models.append(value)
+    return models
+
+
+def _typename_field(model: Type[BaseModel]) -> Optional[Tuple[str, Tuple[str, ...]]]:
+    """Name and possible values of the `__typename` field of the model."""
+    for name, field in model.model_fields.items():
+        if field.alias == "__typename" and typing.get_origin(field.annotation) in (
+            typing.Literal,
+        ):
+            return name, typing.get_args(field.annotation)
+    return None
+
+
+def _tag_name(model: Type[BaseModel], typename: str, tags: Tuple[str, ...]) -> str:
+    return model.__name__ if len(tags) == 1 else f"{model.__name__}_{typename}"
+
+
+class StructGenerator:
+    """Renders msgspec `Struct` definitions for a list of pydantic models."""
+
+    def __init__(self, models: Iterable[Type[BaseModel]], source: str) -> None:
+        self.models = list(models)
+        self.source = source
+        self.imports: Dict[str, Set[str]] = {}
+        self.tagged = self._find_tagged()
+
+    def _find_tagged(self) -> Set[Type[BaseModel]]:
+        """Models that are members of a union discriminated on `__typename`."""
+        tagged: Set[Type[BaseModel]] = set()
+
+        def visit(annotation: Any, discriminated: bool) -> None:
+            origin = typing.get_origin(annotation)
+            if origin is typing.Annotated:
+                metadata = typing.get_args(annotation)[1:]
+                visit(
+                    typing.get_args(annotation)[0],
+                    any(getattr(item, "discriminator", None) for item in metadata),
+                )
+                return
+            args = typing.get_args(annotation)
+            members = [arg for arg in args if arg is not NoneType]
+            if origin in (typing.Union, UnionType) and len(members) > 1:
+                if discriminated or all(
+                    isinstance(arg, type)
+                    and issubclass(arg, BaseModel)
+                    and _typename_field(arg)
+                    for arg in members
+                ):
+                    tagged.update(members)
+            for arg in args:
+                visit(arg, discriminated)
+
+        for model in self.models:
+            for field in model.model_fields.values():
+                visit(field.annotation, bool(field.discriminator))
+        return tagged
+
+    def render(self) -> str:
+        body = "\n\n".join(self._render_model(model) for model in self.models)
+        imports = {
+            module: f"from {module} import {', '.join(sorted(names))}"
+            for module, names in sorted(self.imports.items())
+        }
+        header = [
+            "# Generated by tools/msgspec_codegen.py",
+            f"# Source: {self.source}",
+            "",
+            *([imports.pop("datetime")] if "datetime" in imports else []),
+            "from typing import Any, List, Literal, Optional, Union",
+            "",
+            "import msgspec",
+            *([""] if imports else []),
+            *imports.values(),
+        ]
+        source = "\n".join(header) + "\n\n\n" + body + "\n"
+        if black is not None:
+            source = black.format_str(source, mode=black.Mode())
+        return source
+
+    def _render_model(self, model: Type[BaseModel]) -> str:
+        typename = _typename_field(model)
+        tagged = model in self.tagged and typename is not None
+        options = ["msgspec.Struct", "kw_only=True", "gc=False"]
+        if tagged:
+            options.append('tag_field="__typename"')
+            if len(typename[1]) == 1:
+                options.append(f"tag={typename[1][0]!r}")
+
+        rename = {
+            name: field.alias
+            for name, field in model.model_fields.items()
+            if field.alias
+            and field.alias != name
+            and not (tagged and typename and name == typename[0])
+        }
+        if rename:
+            options.append(f"rename={rename!r}")
+
+        lines = [f"class {model.__name__}({', '.join(options)}):"]
+        for name, field in model.model_fields.items():
+            if tagged and typename and name == typename[0]:
+                continue
+            annotation = self._annotation(field.annotation)
+            if field.is_required():
+                lines.append(f"    {name}: {annotation}")
+            else:
+                lines.append(f"    {name}: {annotation} = {field.default!r}")
+        if tagged and typename:
+            lines += [
+                "",
+                "    @property",
+                f"    def {typename[0]}(self) -> str:",
+                "        return self.__struct_config__.tag",
+            ]
+
+        if tagged and typename and len(typename[1]) > 1:
+            for value in typename[1]:
+                lines += [
+                    "",
+                    "",
+                    f"class {_tag_name(model, value, typename[1])}"
+                    f"({model.__name__}, tag={value!r}):",
+                    "    pass",
+                ]
+        return "\n".join(lines)
+
+    def _annotation(self, annotation: Any) -> str:
+        origin = typing.get_origin(annotation)
+        args = typing.get_args(annotation)
+        if annotation is NoneType or annotation is None:
+            return "None"
+        if annotation is Any:
+            return "Any"
+        if annotation in _BUILTINS:
+            return _BUILTINS[annotation]
+        if origin is typing.Annotated:
+            return self._annotation(args[0])
+        if origin is typing.Literal:
+            return f"Literal[{', '.join(repr(arg) for arg in args)}]"
+        if origin in (list, List):
+            return f"List[{self._annotation(args[0])}]"
+        if origin in (typing.Union, UnionType):
+            members = [arg for arg in args if arg is not NoneType]
+            rendered: List[str] = []
+            for member in members:
+                rendered += self._union_member(member)
+            inner = (
+                rendered[0] if len(rendered) == 1 else f"Union[{', '.join(rendered)}]"
+            )
+            return f"Optional[{inner}]" if len(members) < len(args) else inner
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return f'"{annotation.__name__}"'
+        if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+            self.imports.setdefault(annotation.__module__, set()).add(
+                annotation.__name__
+            )
+            return annotation.__name__
+        if annotation in (datetime.datetime, datetime.date, datetime.time):
+            self.imports.setdefault("datetime", set()).add(annotation.__name__)
+            return annotation.__name__
+        raise TypeError(f"Unsupported annotation: {annotation!r}")
+
+    def _union_member(self, member: Any) -> List[str]:
+        typename = (
+            _typename_field(member)
+            if isinstance(member, type) and issubclass(member, BaseModel)
+            else None
+        )
+        if member in self.tagged and typename and len(typename[1]) > 1:
+            return [
+                f'"{_tag_name(member, value, typename[1])}"' for value in typename[1]
+            ]
+        return [self._annotation(member)]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("module", help="module or package with the pydantic models")
+    parser.add_argument("-o", "--output", type=Path, help="file to write")
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        help="submodule to skip, e.g. the input types (repeatable)",
+    )
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(Path.cwd()))
+    source = StructGenerator(
+        load_models(args.module, args.exclude), args.module
+    ).render()
+    if args.output:
+        args.output.write_text(source, encoding="utf-8")
+    else:
+        sys.stdout.write(source)
+
+
+if __name__ == "__main__":
+    main()
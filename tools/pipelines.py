@@ -0,0 +1,255 @@
+"""
+The steps of the `codegens/*/tableau.sh` pipelines, with what each reads.
+
+Usage:
+
+    python tools/pipelines.py
+
+lists the steps and checks them against the `tableau.sh` scripts, whose
+commands (comments aside) must be the steps' commands, in order.
+
+Every step runs in its codegen directory. `schema` is the schema file it
+generates from, relative to the repository; `documents` are the
+operations it generates code for (relative to the codegen directory,
+like every other path of a step), in which case only the parts of the
+schema the operations use, plus every type of the kinds in `kinds`, end
+up in its output. A step without `documents` generates the whole schema.
+`reads` are the other files and directories the step reads: configs,
+tools and the outputs of earlier steps of the same codegen.
+"""
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+CODEGENS = ROOT / "codegens"
+
+SCHEMA = "schemas/tableau/schema.graphql"
+SCHEMA_JSON = "schemas/tableau/schema.json"
+SCHEMA_STRAWBERRY = "schemas/tableau/schema-strawberry.graphql"
+SCHEMA_NO_INTROSPECTION = "schemas/tableau/schema-no-introspection-types.graphql"
+
+# Relative to a codegen directory, like every path of a step but `schema`.
+_SCHEMA_LOADER = "../ariadne-codegen/tableau_runtime/schema.py"
+
+
+@dataclass(frozen=True)
+class Step:
+    codegen: str
+    command: str
+    outputs: Tuple[str, ...]
+    schema: Optional[str] = None
+    documents: Tuple[str, ...] = ()
+    kinds: Tuple[str, ...] = ()
+    reads: Tuple[str, ...] = ()
+
+    @property
+    def directory(self) -> Path:
+        return CODEGENS / self.codegen
+
+    @property
+    def sdl(self) -> Optional[str]:
+        """The SDL of `schema`: the introspection JSON is `schema.graphql`'s."""
+        if self.schema == SCHEMA_JSON:
+            return SCHEMA
+        return self.schema
+
+    def __str__(self) -> str:
+        return f"{self.codegen}: {self.command}"
+
+
+STEPS: List[Step] = [
+    Step(
+        "ariadne-codegen",
+        "ariadne-codegen --config tableau-queries.toml",
+        outputs=("tableau_queries",),
+        schema=SCHEMA,
+        documents=("tableau-queries.graphql",),
+        # ariadne-codegen writes every enum and input type of the schema.
+        kinds=("ENUM", "INPUT_OBJECT"),
+        reads=("tableau-queries.toml",),
+    ),
+    Step(
+        "ariadne-codegen",
+        "ariadne-codegen --config tableau-customops.toml",
+        outputs=("tableau_customops",),
+        schema=SCHEMA,
+        reads=("tableau-customops.toml",),
+    ),
+    Step(
+        "ariadne-codegen",
+        "python ../../tools/msgspec_codegen.py tableau_queries"
+        " --exclude tableau_queries.input_types -o tableau_structs.py",
+        outputs=("tableau_structs.py",),
+        reads=("tableau_queries", "../../tools/msgspec_codegen.py"),
+    ),
+    *[
+        Step(
+            "datamodel-code-generator",
+            f"datamodel-codegen --input ../../{SCHEMA_JSON} --input-file-type json"
+            f" --output {output} --output-model-type {model_type}",
+            outputs=(output,),
+            schema=SCHEMA_JSON,
+        )
+        for output, model_type in [
+            ("tableau_dataclasses.py", "dataclasses.dataclass"),
+            ("tableau_pydantic.py", "pydantic.BaseModel"),
+            ("tableau_pydantic_v2.py", "pydantic_v2.BaseModel"),
+        ]
+    ],
+    Step(
+        "datamodel-code-generator",
+        f"datamodel-codegen --input ../../{SCHEMA} --input-file-type graphql"
+        " --output tableau_pydantic_v2_graphql.py"
+        " --output-model-type pydantic_v2.BaseModel",
+        outputs=("tableau_pydantic_v2_graphql.py",),
+        schema=SCHEMA,
+    ),
+    Step(
+        "sgqlc",
+        f"sgqlc-codegen schema --docstrings ../../{SCHEMA_JSON} tableau_schema.py",
+        outputs=("tableau_schema.py",),
+        schema=SCHEMA_JSON,
+    ),
+    Step(
+        "sgqlc",
+        f"sgqlc-codegen operation --schema ../../{SCHEMA_JSON} tableau_schema"
+        " tableau_operations.py tableau_operations.gql",
+        outputs=("tableau_operations.py",),
+        schema=SCHEMA_JSON,
+        documents=("tableau_operations.gql",),
+        # The operations are checked against the generated schema module.
+        reads=("tableau_schema.py",),
+    ),
+    Step(
+        "sgqlc",
+        "python ../../tools/sgqlc_lazy_operations.py tableau_operations.py",
+        outputs=("tableau_operations.py",),
+        reads=("tableau_operations.py", "../../tools/sgqlc_lazy_operations.py"),
+    ),
+    Step(
+        "sgqlc",
+        "python ../../tools/sgqlc_fast_schema.py tableau_schema.py"
+        " tableau_schema_fast",
+        outputs=("tableau_schema_fast",),
+        reads=("tableau_schema.py", "../../tools/sgqlc_fast_schema.py"),
+    ),
+    Step(
+        "strawberry",
+        f"strawberry schema-codegen ../../{SCHEMA_STRAWBERRY} -o tableau_schema.py",
+        outputs=("tableau_schema.py",),
+        schema=SCHEMA_STRAWBERRY,
+    ),
+    Step(
+        "strawberry",
+        f"python ../../tools/loaders_codegen.py ../../{SCHEMA_STRAWBERRY}"
+        " -o tableau_loaders.py",
+        outputs=("tableau_loaders.py",),
+        schema=SCHEMA_STRAWBERRY,
+        # The tools read the SDL with the runtime's schema loader.
+        reads=("../../tools/loaders_codegen.py", _SCHEMA_LOADER),
+    ),
+    Step(
+        "turms",
+        "turms gen",
+        outputs=("tableau_api",),
+        schema=SCHEMA_NO_INTROSPECTION,
+        documents=("tableau-queries.graphql",),
+        reads=("graphql.config.yaml",),
+    ),
+    Step(
+        "turms",
+        "python ../../tools/minify_documents.py tableau_api/schema.py",
+        outputs=("tableau_api",),
+        reads=("tableau_api", "../../tools/minify_documents.py", _SCHEMA_LOADER),
+    ),
+    Step(
+        "turms",
+        "python ../../tools/msgspec_codegen.py tableau_api.schema"
+        " -o tableau_structs.py",
+        outputs=("tableau_structs.py",),
+        reads=("tableau_api", "../../tools/msgspec_codegen.py"),
+    ),
+]
+
+
+def pipelines() -> Dict[str, List[Step]]:
+    """The steps of every codegen, in the order of its `tableau.sh`."""
+    steps: Dict[str, List[Step]] = {}
+    for step in STEPS:
+        steps.setdefault(step.codegen, []).append(step)
+    return steps
+
+
+def script_commands(codegen: str) -> List[str]:
+    """The commands of `codegens/<codegen>/tableau.sh`, without comments."""
+    script = CODEGENS / codegen / "tableau.sh"
+    lines = script.read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and line[0] != "#"]
+
+
+def check_steps() -> None:
+    """Raises `ValueError` when `STEPS` and the `tableau.sh` scripts differ."""
+    for codegen, steps in pipelines().items():
+        commands = script_commands(codegen)
+        if commands != [step.command for step in steps]:
+            raise ValueError(
+                f"codegens/{codegen}/tableau.sh does not run the steps of"
+                f" tools/pipelines.py: {commands}"
+            )
+
+
+def _overlap(paths: Iterable[str], others: Iterable[str]) -> bool:
+    # Whether a path of `paths` is, contains or is in a path of `others`.
+    return any(
+        path == other or path.startswith(f"{other}/") or other.startswith(f"{path}/")
+        for path in paths
+        for other in others
+    )
+
+
+def dependencies(step: Step) -> List[Step]:
+    """
+    The earlier steps of its codegen that `step` must run after: those
+    writing what it reads or writes.
+    """
+    steps = pipelines()[step.codegen]
+    return [
+        earlier
+        for earlier in steps[: steps.index(step)]
+        if _overlap(earlier.outputs, (*step.reads, *step.outputs))
+    ]
+
+
+def downstream(changed: Iterable[Step]) -> List[Step]:
+    """
+    `changed` and the later steps of their codegens that read their
+    outputs, in pipeline order.
+    """
+    changed = set(changed)
+    selected = []
+    for steps in pipelines().values():
+        outputs: Set[str] = set()
+        for step in steps:
+            if step in changed or _overlap(outputs, step.reads):
+                selected.append(step)
+                outputs.update(step.outputs)
+    return selected
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.parse_args(argv)
+
+    check_steps()
+    for codegen, steps in pipelines().items():
+        print(f"{codegen}:")
+        for step in steps:
+            source = step.schema or ", ".join(step.reads)
+            print(f"  {step.command}\n      {source} -> {', '.join(step.outputs)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+"""
+Runs the steps of every `codegens/*/tableau.sh` in parallel, with a cache.
+
+Usage:
+
+    python tools/regenerate.py                   # regenerate what changed
+    python tools/regenerate.py --dry-run         # list what would run
+    python tools/regenerate.py sgqlc turms -j 4  # some codegens only
+
+The steps of `pipelines.py` run as soon as the earlier steps they depend
+on are done, up to `--jobs` at once (default: one per core), so the
+codegens run side by side, as do the independent steps of one codegen
+(the four datamodel-codegen runs).
+
+Every step has a key: the hash of its command, the version of the tool
+it runs, the contents of its schema, documents and other inputs (with
+the tools its scripts import), and the keys of the steps whose outputs
+it reads. Its outputs are stored in the cache (`.cache/codegen` by
+default) under that key, and a step whose key is cached has its outputs
+restored instead of running. A codegen whose keys are all the ones of
+its last run, and whose outputs are untouched since, is skipped without
+copying anything: a regeneration after a no-op change only hashes the
+inputs.
+"""
+
+import argparse
+import ast
+import hashlib
+import importlib.metadata
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from pipelines import ROOT, STEPS, Step, check_steps, dependencies, pipelines
+
+CACHE_DIR = ROOT / ".cache" / "codegen"
+
+# The distribution of the program a step runs, for its version.
+_DISTRIBUTIONS = {
+    "ariadne-codegen": "ariadne-codegen",
+    "datamodel-codegen": "datamodel-code-generator",
+    "sgqlc-codegen": "sgqlc",
+    "strawberry": "strawberry-graphql",
+    "turms": "turms",
+}
+
+
+def _files(path: Path) -> Iterable[Path]:
+    if path.is_dir():
+        for child in sorted(path.rglob("*")):
+            if child.is_file() and "__pycache__" not in child.parts:
+                yield child
+    elif path.is_file():
+        yield path
+
+
+def hash_paths(base: Path, paths: Iterable[str]) -> str:
+    """The hash of the names and contents of `paths` (relative to `base`)."""
+    digest = hashlib.sha256()
+    for name in paths:
+        path = base / name
+        digest.update(f"\0{name}\0".encode())
+        if not path.exists():
+            digest.update(b"missing")
+        for file in _files(path):
+            digest.update(f"{file.relative_to(base).as_posix()}\0".encode())
+            digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def local_imports(script: Path) -> List[Path]:
+    """
+    The modules next to `script` that it imports, directly or not: the
+    tools import each other, and a step reads all of them.
+    """
+    found: List[Path] = []
+    queue = [script]
+    while queue:
+        tree = ast.parse(queue.pop().read_bytes())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                module = script.parent / f"{name.split('.')[0]}.py"
+                if module.is_file() and module != script and module not in found:
+                    found.append(module)
+                    queue.append(module)
+    return sorted(found)
+
+
+def tool_version(step: Step) -> str:
+    program = step.command.split()[0]
+    if program == "python":
+        return f"python {sys.version.split()[0]}"
+    distribution = _DISTRIBUTIONS.get(program, program)
+    try:
+        return f"{distribution} {importlib.metadata.version(distribution)}"
+    except importlib.metadata.PackageNotFoundError:
+        return f"{distribution} (not installed)"
+
+
+def step_keys(steps: Iterable[Step]) -> Dict[Step, str]:
+    """The cache key of every step, chained through its dependencies."""
+    keys: Dict[Step, str] = {}
+    for step in steps:
+        upstream = dependencies(step)
+        generated = {path for earlier in upstream for path in earlier.outputs}
+        digest = hashlib.sha256()
+        digest.update(step.command.encode())
+        digest.update(tool_version(step).encode())
+        if step.schema:
+            digest.update(hash_paths(ROOT, [step.schema]).encode())
+        own_inputs = [
+            path
+            for path in (*step.documents, *step.reads)
+            if not any(
+                path == output or path.startswith(f"{output}/") for output in generated
+            )
+        ]
+        scripts = [step.directory / path for path in own_inputs if path.endswith(".py")]
+        imported = {
+            os.path.relpath(module, step.directory)
+            for script in scripts
+            if script.is_file()
+            for module in local_imports(script)
+        }
+        own_inputs += sorted(imported - set(own_inputs))
+        digest.update(hash_paths(step.directory, own_inputs).encode())
+        for earlier in upstream:
+            digest.update(keys[earlier].encode())
+        keys[step] = digest.hexdigest()
+    return keys
+
+
+class Cache:
+    """Step outputs by key, and the keys of the last run of each codegen."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.state_path = directory / "state.json"
+        self._lock = threading.Lock()
+        try:
+            self.state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.state = {}
+
+    def entry(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def has(self, key: str) -> bool:
+        return (self.entry(key) / "done").exists()
+
+    def store(self, step: Step, key: str) -> None:
+        entry = self.entry(key)
+        staging = entry.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}")
+        shutil.rmtree(staging, ignore_errors=True)
+        for name in step.outputs:
+            _copy(step.directory / name, staging / name)
+        (staging / "done").parent.mkdir(parents=True, exist_ok=True)
+        (staging / "done").write_text(step.command, encoding="utf-8")
+        shutil.rmtree(entry, ignore_errors=True)
+        staging.rename(entry)
+
+    def restore(self, step: Step, key: str) -> None:
+        entry = self.entry(key)
+        for name in step.outputs:
+            _copy(entry / name, step.directory / name)
+
+    def up_to_date(self, codegen: str, keys: List[str]) -> bool:
+        last = self.state.get(codegen)
+        return bool(
+            last
+            and last["keys"] == keys
+            and last["outputs"] == _outputs_hash(pipelines()[codegen])
+        )
+
+    def record(self, codegen: str, keys: List[str]) -> None:
+        with self._lock:
+            self.state[codegen] = {
+                "keys": keys,
+                "outputs": _outputs_hash(pipelines()[codegen]),
+            }
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.state_path.write_text(
+                json.dumps(self.state, indent=2, sort_keys=True), encoding="utf-8"
+            )
+
+
+def _copy(source: Path, target: Path) -> None:
+    if target.is_dir():
+        shutil.rmtree(target)
+    elif target.exists():
+        target.unlink()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if source.is_dir():
+        shutil.copytree(
+            source, target, ignore=shutil.ignore_patterns("__pycache__", "*.pyc")
+        )
+    elif source.exists():
+        shutil.copy2(source, target)
+
+
+def _outputs_hash(steps: List[Step]) -> str:
+    outputs = sorted({path for step in steps for path in step.outputs})
+    return hash_paths(steps[0].directory, outputs)
+
+
+class Orchestrator:
+    """Runs steps once their dependencies are done, restoring cached ones."""
+
+    def __init__(
+        self, cache: Optional[Cache], jobs: int, dry_run: bool = False
+    ) -> None:
+        self.cache = cache
+        self.jobs = jobs
+        self.dry_run = dry_run
+        self.failed: List[Step] = []
+
+    def run(self, steps: List[Step]) -> bool:
+        """Runs `steps` (in pipeline order), returning whether all succeeded."""
+        keys = step_keys(steps)
+        pending = []
+        for codegen, codegen_steps in _by_codegen(steps).items():
+            codegen_keys = [keys[step] for step in codegen_steps]
+            if self.cache and self.cache.up_to_date(codegen, codegen_keys):
+                _report(f"{codegen}: up to date")
+            else:
+                pending += codegen_steps
+
+        done: Set[Step] = {step for step in steps if step not in pending}
+        blocked: Set[Step] = set()
+        running: Dict[Future, Step] = {}
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            while pending or running:
+                for step in list(pending):
+                    upstream = [dep for dep in dependencies(step) if dep in steps]
+                    if any(dep in blocked for dep in upstream):
+                        pending.remove(step)
+                        blocked.add(step)
+                        _report(f"{step}: skipped, an earlier step failed")
+                    elif all(dep in done for dep in upstream):
+                        pending.remove(step)
+                        future = executor.submit(self._step, step, keys[step])
+                        running[future] = step
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    if future.result():
+                        done.add(step)
+                    else:
+                        blocked.add(step)
+                        self.failed.append(step)
+                    self._record(step, steps, keys, done)
+        return not self.failed and not blocked
+
+    def _record(
+        self, step: Step, steps: List[Step], keys: Dict[Step, str], done: Set[Step]
+    ) -> None:
+        codegen_steps = _by_codegen(steps)[step.codegen]
+        if self.cache and not self.dry_run and all(s in done for s in codegen_steps):
+            self.cache.record(step.codegen, [keys[s] for s in codegen_steps])
+
+    def _step(self, step: Step, key: str) -> bool:
+        cached = self.cache is not None and self.cache.has(key)
+        if self.dry_run:
+            _report(f"{step}: {'restore from cache' if cached else 'run'}")
+            return True
+        if cached:
+            self.cache.restore(step, key)  # type: ignore[union-attr]
+            _report(f"{step}: restored from cache")
+            return True
+
+        start = time.perf_counter()
+        result = subprocess.run(
+            step.command,
+            shell=True,
+            cwd=step.directory,
+            capture_output=True,
+            text=True,
+        )
+        seconds = time.perf_counter() - start
+        if result.returncode:
+            output = (result.stdout + result.stderr).strip()
+            _report(f"{step}: failed ({result.returncode}) in {seconds:.1f}s\n{output}")
+            return False
+        if self.cache is not None:
+            self.cache.store(step, key)
+        _report(f"{step}: ran in {seconds:.1f}s")
+        return True
+
+
+_print_lock = threading.Lock()
+
+
+def _report(message: str) -> None:
+    # Steps report from worker threads: one write per message.
+    with _print_lock:
+        sys.stdout.write(f"{message}\n")
+        sys.stdout.flush()
+
+
+def _by_codegen(steps: List[Step]) -> Dict[str, List[Step]]:
+    by_codegen: Dict[str, List[Step]] = {}
+    for step in steps:
+        by_codegen.setdefault(step.codegen, []).append(step)
+    return by_codegen
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "codegens", nargs="*", help="codegen directories to regenerate (default: all)"
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR)
+    parser.add_argument(
+        "--no-cache", action="store_true", help="run every step, store nothing"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="list what would run or be restored"
+    )
+    args = parser.parse_args(argv)
+
+    check_steps()
+    unknown = set(args.codegens) - set(pipelines())
+    if unknown:
+        parser.error(f"unknown codegens: {', '.join(sorted(unknown))}")
+    steps = [
+        step for step in STEPS if not args.codegens or step.codegen in args.codegens
+    ]
+
+    start = time.perf_counter()
+    cache = None if args.no_cache else Cache(args.cache_dir)
+    orchestrator = Orchestrator(cache, args.jobs, args.dry_run)
+    succeeded = orchestrator.run(steps)
+    print(f"done in {time.perf_counter() - start:.2f}s")
+    if not succeeded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,423 @@
+"""
+Diffs the Tableau schemas and regenerates only the code they affect.
+
+Usage:
+
+    python tools/schema_diff.py              # working tree against HEAD
+    python tools/schema_diff.py --base v2024.3 --run
+
+Every `schemas/tableau/*.graphql` that differs from its version at
+`--base` is diffed definition by definition: types, fields, arguments,
+input fields, enum values, union members, implemented interfaces and
+descriptions are reported as added, removed or changed, by schema
+coordinate (`Type`, `Type.field`, `Type.field(arg:)`). The changes are
+then matched against the steps of `pipelines.py` that read the schema
+(the introspection JSON stands for `schema.graphql`):
+
+- a step generating the whole schema is affected by any change;
+- a step generating code for operations is affected by changes to the
+  fields they select, to the types of those fields and arguments (with
+  the members of unions and interfaces and the input types they reach),
+  and to every type of the kinds it always generates.
+
+The affected steps, and the later steps reading their outputs, are
+listed, and with `--run` run in their codegen directory.
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from graphql import (
+    DefinitionNode,
+    DocumentNode,
+    EnumTypeDefinitionNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    InputObjectTypeDefinitionNode,
+    InterfaceTypeDefinitionNode,
+    ListTypeNode,
+    NonNullTypeNode,
+    ObjectTypeDefinitionNode,
+    OperationDefinitionNode,
+    ScalarTypeDefinitionNode,
+    SchemaDefinitionNode,
+    SelectionSetNode,
+    TypeNode,
+    UnionTypeDefinitionNode,
+    parse,
+    print_ast,
+)
+
+from pipelines import ROOT, STEPS, Step, check_steps, downstream
+
+SCHEMAS = "schemas/tableau"
+
+_KINDS = {
+    ScalarTypeDefinitionNode: "SCALAR",
+    ObjectTypeDefinitionNode: "OBJECT",
+    InterfaceTypeDefinitionNode: "INTERFACE",
+    UnionTypeDefinitionNode: "UNION",
+    EnumTypeDefinitionNode: "ENUM",
+    InputObjectTypeDefinitionNode: "INPUT_OBJECT",
+}
+
+
+class Change(NamedTuple):
+    change: str  # "added", "removed" or "changed"
+    coordinate: str
+    detail: str = ""
+
+    def __str__(self) -> str:
+        detail = f": {self.detail}" if self.detail else ""
+        return f"{self.change:8} {self.coordinate}{detail}"
+
+
+def _named(type_: TypeNode) -> str:
+    while isinstance(type_, (ListTypeNode, NonNullTypeNode)):
+        type_ = type_.type
+    return type_.name.value  # type: ignore[attr-defined]
+
+
+def _description(node: DefinitionNode) -> Optional[str]:
+    description = getattr(node, "description", None)
+    return description.value if description else None
+
+
+class Schema:
+    """The type definitions of an SDL document, by name."""
+
+    def __init__(self, document: DocumentNode) -> None:
+        self.types: Dict[str, DefinitionNode] = {}
+        self.roots = {"query": "Query", "mutation": "Mutation"}
+        for definition in document.definitions:
+            if type(definition) in _KINDS:
+                self.types[definition.name.value] = definition  # type: ignore[attr-defined]
+            elif isinstance(definition, SchemaDefinitionNode):
+                for operation in definition.operation_types:
+                    self.roots[operation.operation.value] = operation.type.name.value
+        self.implementations: Dict[str, List[str]] = {}
+        for name, definition in self.types.items():
+            for interface in getattr(definition, "interfaces", None) or ():
+                self.implementations.setdefault(interface.name.value, []).append(name)
+
+    @classmethod
+    def parse(cls, source: str) -> "Schema":
+        return cls(parse(source, no_location=True))
+
+    def kind(self, name: str) -> Optional[str]:
+        definition = self.types.get(name)
+        return _KINDS[type(definition)] if definition is not None else None
+
+    def fields(self, name: str) -> Dict[str, DefinitionNode]:
+        definition = self.types.get(name)
+        return {
+            field.name.value: field
+            for field in getattr(definition, "fields", None) or ()
+        }
+
+    def possible_types(self, name: str) -> List[str]:
+        definition = self.types.get(name)
+        if isinstance(definition, UnionTypeDefinitionNode):
+            return [member.name.value for member in definition.types or ()]
+        return self.implementations.get(name, [])
+
+
+def _members(definition: DefinitionNode) -> Dict[str, DefinitionNode]:
+    # Fields, input fields or enum values.
+    members = getattr(definition, "fields", None) or getattr(definition, "values", None)
+    return {member.name.value: member for member in members or ()}
+
+
+def _members_of(node: DefinitionNode, attribute: str) -> Dict[str, DefinitionNode]:
+    return {
+        member.name.value: member for member in getattr(node, attribute, None) or ()
+    }
+
+
+def _names(nodes: Optional[Iterable]) -> List[str]:
+    return sorted(node.name.value for node in nodes or ())
+
+
+def _signature(node: DefinitionNode) -> str:
+    # The type, default value and directives of a member or an argument.
+    parts = []
+    if getattr(node, "type", None) is not None:
+        parts.append(print_ast(node.type))  # type: ignore[attr-defined]
+    if getattr(node, "default_value", None) is not None:
+        parts.append(f"= {print_ast(node.default_value)}")  # type: ignore[attr-defined]
+    parts.extend(print_ast(directive) for directive in node.directives or ())  # type: ignore[attr-defined]
+    return " ".join(parts)
+
+
+def _diff_named(
+    coordinate: str, old: List[str], new: List[str], what: str
+) -> List[Change]:
+    changes = []
+    for name in sorted(set(new) - set(old)):
+        changes.append(Change("changed", coordinate, f"{what} {name} added"))
+    for name in sorted(set(old) - set(new)):
+        changes.append(Change("changed", coordinate, f"{what} {name} removed"))
+    return changes
+
+
+def _diff_node(
+    coordinate: str, old: DefinitionNode, new: DefinitionNode
+) -> List[Change]:
+    changes = []
+    if _signature(old) != _signature(new):
+        changes.append(
+            Change("changed", coordinate, f"{_signature(old)} -> {_signature(new)}")
+        )
+    if _description(old) != _description(new):
+        changes.append(Change("changed", coordinate, "description"))
+    return changes
+
+
+def diff_schemas(old: Schema, new: Schema) -> List[Change]:
+    """The changes from `old` to `new`, sorted by coordinate."""
+    changes: List[Change] = []
+    for name in sorted(set(old.types) | set(new.types)):
+        if name not in new.types:
+            changes.append(Change("removed", name, old.kind(name) or ""))
+            continue
+        if name not in old.types:
+            changes.append(Change("added", name, new.kind(name) or ""))
+            continue
+        old_type, new_type = old.types[name], new.types[name]
+        if old.kind(name) != new.kind(name):
+            changes.append(
+                Change("changed", name, f"{old.kind(name)} -> {new.kind(name)}")
+            )
+            continue
+        if _description(old_type) != _description(new_type):
+            changes.append(Change("changed", name, "description"))
+        changes += _diff_named(
+            name,
+            _names(getattr(old_type, "interfaces", None)),
+            _names(getattr(new_type, "interfaces", None)),
+            "interface",
+        )
+        changes += _diff_named(
+            name,
+            _names(getattr(old_type, "types", None)),
+            _names(getattr(new_type, "types", None)),
+            "member",
+        )
+
+        old_members, new_members = _members(old_type), _members(new_type)
+        for member in sorted(set(old_members) | set(new_members)):
+            coordinate = f"{name}.{member}"
+            if member not in new_members:
+                changes.append(Change("removed", coordinate))
+            elif member not in old_members:
+                changes.append(Change("added", coordinate))
+            else:
+                changes += _diff_node(
+                    coordinate, old_members[member], new_members[member]
+                )
+                old_args = _members_of(old_members[member], "arguments")
+                new_args = _members_of(new_members[member], "arguments")
+                for arg in sorted(set(old_args) | set(new_args)):
+                    arg_coordinate = f"{coordinate}({arg}:)"
+                    if arg not in new_args:
+                        changes.append(Change("removed", arg_coordinate))
+                    elif arg not in old_args:
+                        changes.append(Change("added", arg_coordinate))
+                    else:
+                        changes += _diff_node(
+                            arg_coordinate, old_args[arg], new_args[arg]
+                        )
+    return changes
+
+
+class Usage:
+    """The types and fields that operations use in a schema."""
+
+    def __init__(self, schema: Schema) -> None:
+        self.schema = schema
+        self.types: Set[str] = set()
+        self.fields: Set[str] = set()
+        self._fragments: Dict[str, FragmentDefinitionNode] = {}
+        self._spread: Set[str] = set()
+
+    def add_document(self, document: DocumentNode) -> None:
+        for definition in document.definitions:
+            if isinstance(definition, FragmentDefinitionNode):
+                self._fragments[definition.name.value] = definition
+        for definition in document.definitions:
+            if isinstance(definition, OperationDefinitionNode):
+                root = self.schema.roots[definition.operation.value]
+                self.add_type(root)
+                for variable in definition.variable_definitions or ():
+                    self.add_input(_named(variable.type))
+                self._add_selections(root, definition.selection_set)
+
+    def add_type(self, name: str) -> None:
+        if name in self.types:
+            return
+        self.types.add(name)
+        for possible_type in self.schema.possible_types(name):
+            self.add_type(possible_type)
+
+    def add_input(self, name: str) -> None:
+        if name in self.types:
+            return
+        self.types.add(name)
+        for field in _members(self.schema.types.get(name)).values():  # type: ignore[arg-type]
+            if getattr(field, "type", None) is not None:
+                self.add_input(_named(field.type))  # type: ignore[attr-defined]
+
+    def _add_selections(self, parent: str, selection_set: SelectionSetNode) -> None:
+        fields = self.schema.fields(parent)
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                field = fields.get(selection.name.value)
+                if field is None:
+                    continue
+                self.fields.add(f"{parent}.{selection.name.value}")
+                arguments = _members_of(field, "arguments")
+                for argument in selection.arguments or ():
+                    if argument.name.value in arguments:
+                        self.fields.add(
+                            f"{parent}.{selection.name.value}({argument.name.value}:)"
+                        )
+                        self.add_input(_named(arguments[argument.name.value].type))  # type: ignore[attr-defined]
+                named = _named(field.type)  # type: ignore[attr-defined]
+                self.add_type(named)
+                if selection.selection_set is not None:
+                    self._add_selections(named, selection.selection_set)
+            elif isinstance(selection, InlineFragmentNode):
+                condition = selection.type_condition
+                type_name = condition.name.value if condition else parent
+                self.add_type(type_name)
+                self._add_selections(type_name, selection.selection_set)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self._fragments.get(name)
+                if fragment is not None and name not in self._spread:
+                    self._spread.add(name)
+                    type_name = fragment.type_condition.name.value
+                    self.add_type(type_name)
+                    self._add_selections(type_name, fragment.selection_set)
+
+
+def affecting(
+    step: Step, changes: List[Change], old: Schema, new: Schema
+) -> List[Change]:
+    """The changes that affect the output of `step`."""
+    if not step.documents:
+        return changes
+    usages = []
+    for schema in (old, new):
+        usage = Usage(schema)
+        for document in step.documents:
+            path = step.directory / document
+            usage.add_document(parse(path.read_text(encoding="utf-8")))
+        usages.append(usage)
+
+    selected = []
+    for change in changes:
+        type_name, _, member = change.coordinate.partition(".")
+        kinds = {old.kind(type_name), new.kind(type_name)}
+        if kinds.intersection(step.kinds):
+            selected.append(change)
+        elif member and kinds & {"OBJECT", "INTERFACE"}:
+            if any(change.coordinate in usage.fields for usage in usages):
+                selected.append(change)
+        elif any(type_name in usage.types for usage in usages):
+            selected.append(change)
+    return selected
+
+
+def _git_show(base: str, path: str) -> Optional[str]:
+    result = subprocess.run(
+        ["git", "show", f"{base}:{path}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout if result.returncode == 0 else None
+
+
+def changed_schemas(base: str) -> Dict[str, Tuple[Schema, Schema, List[Change]]]:
+    """The `(old, new, changes)` of every Tableau SDL changed since `base`."""
+    diffs = {}
+    for path in sorted((ROOT / SCHEMAS).glob("*.graphql")):
+        name = path.relative_to(ROOT).as_posix()
+        new_source = path.read_text(encoding="utf-8")
+        old_source = _git_show(base, name)
+        if old_source == new_source:
+            continue
+        old = (
+            Schema.parse(old_source)
+            if old_source is not None
+            else Schema(DocumentNode(definitions=()))
+        )
+        new = Schema.parse(new_source)
+        diffs[name] = old, new, diff_schemas(old, new)
+    return diffs
+
+
+def affected_steps(
+    diffs: Dict[str, Tuple[Schema, Schema, List[Change]]],
+) -> Dict[Step, List[Change]]:
+    """The steps whose output the schema changes affect, with the changes."""
+    affected = {}
+    for step in STEPS:
+        if step.sdl not in diffs:
+            continue
+        old, new, changes = diffs[step.sdl]
+        selected = affecting(step, changes, old, new)
+        if selected:
+            affected[step] = selected
+    return affected
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--base", default="HEAD", help="git revision to diff with")
+    parser.add_argument("--run", action="store_true", help="regenerate what changed")
+    parser.add_argument(
+        "--limit", type=int, default=20, help="changes listed per schema and step"
+    )
+    args = parser.parse_args(argv)
+
+    check_steps()
+    diffs = changed_schemas(args.base)
+    if not diffs:
+        print(f"No schema changed since {args.base}.")
+        return
+    for name, (_, _, changes) in diffs.items():
+        print(f"{name}: {len(changes)} changes")
+        for change in changes[: args.limit]:
+            print(f"  {change}")
+        if len(changes) > args.limit:
+            print(f"  ... {len(changes) - args.limit} more")
+
+    affected = affected_steps(diffs)
+    steps = downstream(affected)
+    print(f"\n{len(steps)} of {len(STEPS)} steps to run:")
+    for step in steps:
+        changes = affected.get(step)
+        reason = f"{len(changes)} changes" if changes else "reads an updated output"
+        print(f"  {step} ({reason})")
+    skipped = [step for step in STEPS if step not in steps]
+    if skipped:
+        print("unaffected:")
+        for step in skipped:
+            print(f"  {step}")
+
+    if args.run:
+        for step in steps:
+            print(f"\n$ cd codegens/{step.codegen} && {step.command}", flush=True)
+            result = subprocess.run(step.command, shell=True, cwd=step.directory)
+            if result.returncode:
+                sys.exit(result.returncode)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+Generates a fast-importing package from an `sgqlc-codegen schema` module.
+
+Usage (from codegens/sgqlc, after sgqlc-codegen):
+
+    python ../../tools/sgqlc_fast_schema.py tableau_schema.py tableau_schema_fast
+
+Importing the generated module builds every type of the schema, with its
+fields, arguments and docstrings. The generated package instead:
+
+- drops the docstrings;
+- puts each kind of type (`enums`, `scalars`, `inputs`, `interfaces`,
+  `objects`, `connections`, `unions`) in its own submodule, where every
+  type is a function that declares the class when called;
+- gives field and argument types by name, which sgqlc resolves only when
+  the field is used, so building a type does not build the types it
+  refers to (argument types with a default are the exception: sgqlc
+  checks the default when the argument is declared);
+- registers the types with a schema that builds each one, importing its
+  submodule if needed, the first time it is looked up: `schema["X"]`,
+  `schema.X`, `package.X`, a field of that type being used, or
+  `schema.query_type`.
+
+`package.X` and `schema.X` work as with the original module, so
+`sgqlc-codegen operation` modules can import the package instead.
+Iterating over the schema or printing it builds every type.
+"""
+
+import argparse
+import ast
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+_KINDS = {
+    "sgqlc.types.Enum": "enums",
+    "sgqlc.types.Scalar": "scalars",
+    "sgqlc.types.Input": "inputs",
+    "sgqlc.types.Interface": "interfaces",
+    "sgqlc.types.Type": "objects",
+    "sgqlc.types.relay.Connection": "connections",
+    "sgqlc.types.Union": "unions",
+}
+
+_ITEMS = {"Field", "Arg"}
+
+_LAZY_SCHEMA = '''\
+class _LazySchema(sgqlc.types.Schema):
+    """A schema that builds each type the first time it is looked up."""
+
+    def __init__(self, modules):
+        self._modules = dict(modules)
+        self._roots = {}
+        super().__init__()
+
+    def _build(self, name):
+        module = self._modules.pop(name, None)
+        if module is None:
+            return False
+        getattr(importlib.import_module(f"{__name__}.{module}"), name)()
+        return True
+
+    def _build_all(self):
+        while self._modules:
+            self._build(next(iter(self._modules)))
+
+    def __getitem__(self, key):
+        try:
+            return super().__getitem__(key)
+        except KeyError:
+            if not self._build(key):
+                raise
+        return super().__getitem__(key)
+
+    def __getattr__(self, key):
+        if key.startswith("_"):
+            raise AttributeError(key)
+        try:
+            return super().__getattr__(key)
+        except AttributeError:
+            if not self._build(key):
+                raise
+        return super().__getattr__(key)
+
+    def __contains__(self, key):
+        return key in self._modules or super().__contains__(key)
+
+    def __iter__(self):
+        self._build_all()
+        return super().__iter__()
+
+    def __to_graphql__(self, *args, **kwargs):
+        self._build_all()
+        return super().__to_graphql__(*args, **kwargs)
+
+    def _root(kind):
+        def get(self):
+            root = self._roots.get(kind)
+            # Registering a type reads the root types, also while the
+            # root type itself is being built.
+            if isinstance(root, str) and root in self:
+                root = self._roots[kind] = self[root]
+            return root
+
+        def set(self, value):
+            self._roots[kind] = value
+
+        return property(get, set)
+
+    query_type = _root("query")
+    mutation_type = _root("mutation")
+    subscription_type = _root("subscription")
+    del _root
+'''
+
+
+def _dotted(node: ast.AST) -> str:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return f"{_dotted(node.value)}.{node.attr}"
+    return ""
+
+
+def _is_docstring(node: ast.stmt) -> bool:
+    return (
+        isinstance(node, ast.Expr)
+        and isinstance(node.value, ast.Constant)
+        and isinstance(node.value.value, str)
+    )
+
+
+class _Deferrer(ast.NodeTransformer):
+    """Refers to schema types by name, or through the schema."""
+
+    def __init__(self, schema: str, types: Set[str]) -> None:
+        self.schema = schema
+        self.types = types
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if isinstance(node.ctx, ast.Load) and node.id in self.types:
+            return ast.Attribute(
+                value=ast.Name(id=self.schema, ctx=ast.Load()),
+                attr=node.id,
+                ctx=ast.Load(),
+            )
+        return node
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if _dotted(node.func).rsplit(".", 1)[-1] in _ITEMS and node.args:
+            has_default = any(
+                keyword.arg == "default"
+                and not (
+                    isinstance(keyword.value, ast.Constant)
+                    and keyword.value.value is None
+                )
+                for keyword in node.keywords
+            )
+            if not has_default:
+                node.args[0] = self._by_name(node.args[0])
+        self.generic_visit(node)
+        return node
+
+    def _by_name(self, node: ast.expr) -> ast.expr:
+        if isinstance(node, ast.Name) and node.id in self.types:
+            return ast.Constant(value=node.id)
+        if (
+            isinstance(node, ast.Call)
+            and _dotted(node.func).rsplit(".", 1)[-1] in ("non_null", "list_of")
+            and node.args
+        ):
+            node.args[0] = self._by_name(node.args[0])
+        return node
+
+
+class FastSchemaGenerator:
+    """Splits a generated sgqlc schema module into a lazy package."""
+
+    def __init__(self, source: str, source_name: str) -> None:
+        self.source_name = source_name
+        self.module = ast.parse(source)
+        self.imports: List[ast.stmt] = []
+        self.setup: List[ast.stmt] = []
+        self.aliases: List[ast.stmt] = []
+        self.roots: List[Tuple[str, Optional[str]]] = []
+        self.classes: Dict[str, Tuple[str, ast.ClassDef]] = {}
+        self.schema = ""
+        self._read()
+
+    def _read(self) -> None:
+        for node in self.module.body:
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                self.imports.append(node)
+            elif isinstance(node, ast.ClassDef):
+                kind = _KINDS[_dotted(node.bases[0])]
+                self.classes[node.name] = (kind, node)
+            elif (
+                isinstance(node, ast.Assign)
+                and isinstance(node.value, ast.Call)
+                and _dotted(node.value.func) == "sgqlc.types.Schema"
+            ):
+                self.schema = node.targets[0].id
+            elif isinstance(node, ast.AugAssign):
+                self.setup.append(node)
+            elif (
+                isinstance(node, ast.Assign)
+                and isinstance(node.targets[0], ast.Attribute)
+                and _dotted(node.targets[0].value) == self.schema
+            ):
+                value = node.value
+                self.roots.append(
+                    (
+                        node.targets[0].attr,
+                        value.id if isinstance(value, ast.Name) else None,
+                    )
+                )
+            elif isinstance(node, ast.Assign) and _dotted(node.value).startswith(
+                "sgqlc."
+            ):
+                self.aliases.append(node)
+
+    def render(self) -> Dict[str, str]:
+        """Source of every file of the package, by file name."""
+        header = [
+            "# Generated by tools/sgqlc_fast_schema.py",
+            f"# Source: {self.source_name}",
+            "",
+        ]
+        imports = [ast.unparse(node) for node in self.imports]
+        types = set(self.classes) | {
+            node.targets[0].id for node in self.aliases  # type: ignore[attr-defined]
+        }
+        deferrer = _Deferrer(self.schema, types)
+
+        files: Dict[str, List[str]] = {}
+        kinds: Dict[str, str] = {}
+        for name, (kind, node) in self.classes.items():
+            kinds[name] = kind
+            lines = files.setdefault(
+                f"{kind}.py",
+                header + imports + ["", f"from . import {self.schema}", ""],
+            )
+            body = [
+                statement for statement in node.body if not _is_docstring(statement)
+            ]
+            node = ast.ClassDef(
+                name=node.name,
+                bases=[deferrer.visit(base) for base in node.bases],
+                keywords=node.keywords,
+                body=[deferrer.visit(statement) for statement in body] or [ast.Pass()],
+                decorator_list=[],
+            )
+            class_source = ast.unparse(ast.fix_missing_locations(node))
+            lines += [
+                "",
+                f"def {name}():",
+                *(f"    {line}" for line in class_source.splitlines()),
+                f"    return {name}",
+                "",
+            ]
+
+        init = header + ["import importlib", "", *imports, "", "", _LAZY_SCHEMA]
+        init += [
+            "",
+            f"{self.schema} = _LazySchema({{",
+            *(f"    {name!r}: {kind!r}," for name, kind in sorted(kinds.items())),
+            "})",
+            *(ast.unparse(node) for node in self.setup),
+            "",
+            *(ast.unparse(node) for node in self.aliases),
+            "",
+            *(f"{self.schema}.{root} = {name!r}" for root, name in self.roots),
+            "",
+            "",
+            "def __getattr__(name):",
+            "    try:",
+            f"        return {self.schema}[name]",
+            "    except KeyError:",
+            "        raise AttributeError(name) from None",
+        ]
+        files["__init__.py"] = init
+        return {name: "\n".join(lines).rstrip() + "\n" for name, lines in files.items()}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("module", type=Path, help="module generated by sgqlc-codegen")
+    parser.add_argument("package", type=Path, help="package directory to write")
+    args = parser.parse_args(argv)
+
+    generator = FastSchemaGenerator(
+        args.module.read_text(encoding="utf-8"), args.module.name
+    )
+    args.package.mkdir(parents=True, exist_ok=True)
+    for stale in args.package.glob("*.py"):
+        stale.unlink()
+    for name, source in generator.render().items():
+        (args.package / name).write_text(source, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
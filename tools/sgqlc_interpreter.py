@@ -0,0 +1,350 @@
+"""
+Interprets responses into sgqlc objects with a plan compiled per operation.
+
+Usage (from codegens/sgqlc):
+
+    python ../../tools/sgqlc_interpreter.py tableau_operations \\
+        get_items_sheets_connection page.json
+
+`operation + response` walks the selection set of the operation for every
+object of the response: it resolves the selections (auto-selecting the
+fields of bare container selections), creates `Field`s, looks up the type
+of every field and calls it, and sets each value through
+`ContainerType.__setattr__`. `OperationInterpreter` does that walk once,
+on first use, and keeps for every selection a table of
+`(JSON key, attribute, Field, converter)` with the converters resolved for
+the field's type: scalar converters, enum choices, `non_null`/`list_of`
+wrappers and nested selections. Interpreting a response only goes through
+these tables, filling the same objects `operation + response` returns:
+same classes (including the concrete types of interfaces and unions),
+attributes, `__fields_cache__` and `__selection_list__`. Types it does
+not know are called as `operation + response` does.
+
+One difference: sgqlc initialises an object twice when an interface
+resolves to its concrete type, and the second time writes the fields back
+into the response (a `null` object becomes `{}`, nested objects lose
+their `__typename`). The interpreter leaves the response as received, so
+`__json_data__` is always the JSON object the fields were read from.
+"""
+
+import argparse
+import gc
+import importlib
+import json
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import sgqlc.types
+from sgqlc.operation import GraphQLErrors, Operation
+
+Converter = Callable[[Any], Any]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _failed(cls: type, name: str, value: Any, exc: Exception) -> ValueError:
+    # The error ContainerType raises for a field it cannot convert.
+    return ValueError("%s selection %r: %r (%s)" % (cls, name, value, exc))
+
+
+class _Plan:
+    """The fields one selection list fills on objects of one class."""
+
+    def __init__(
+        self,
+        entries: List[Tuple[str, str, Any, Optional[Converter]]],
+        casts: Dict[str, "_Plan"],
+        fragments: Dict[str, List["_Plan"]],
+    ) -> None:
+        self.entries = entries
+        self.casts = casts
+        self.fragments = fragments
+
+    def fill(self, obj: Any, values: Dict[str, Any], cache: Dict[str, Any]) -> None:
+        attributes = obj.__dict__
+        for key, name, field, convert in self.entries:
+            if key not in values:
+                continue
+            value = values[key]
+            try:
+                if convert is None:
+                    field, value = _aliased(obj, field, values)
+                else:
+                    value = convert(value)
+            except Exception as exc:
+                raise _failed(type(obj), name, values[key], exc) from exc
+            attributes[name] = value
+            cache[name] = field
+        if self.casts:
+            plan = self.casts.get(values.get("__typename"))  # type: ignore[arg-type]
+            if plan is not None:
+                plan.fill(obj, values, cache)
+        if self.fragments:
+            for plan in self.fragments.get(values.get("__typename"), ()):  # type: ignore[arg-type]
+                plan.fill(obj, values, cache)
+
+
+def _aliased(obj: Any, sel: Any, values: Dict[str, Any]) -> Tuple[Any, Any]:
+    # Aliases are rare enough to be interpreted as ContainerType does,
+    # which gives each a Field of its own.
+    field, alias = sel.__field__, sel.__alias__
+    type_ = field.type
+    if sel.__casts__:
+        value = values.get(field.graphql_name, {})
+        name = value.get("__typename") if isinstance(value, dict) else None
+        cast = sel.__casts__.get(name) if name else None
+        if cast is not None:
+            type_ = cast.__type__
+    aliased = sgqlc.types.Field(type_, alias, field.args)
+    aliased._set_container(obj.__schema__, obj, alias)
+    return aliased, type_(values[alias], sel)
+
+
+class OperationInterpreter:
+    """
+    `interpreter(response)` returns what `operation + response` returns.
+
+    The plan of every selection is compiled on first use and reused for
+    every response, so create one interpreter per operation and keep it,
+    or use `interpret()`, which does.
+    """
+
+    def __init__(self, operation: Operation) -> None:
+        self.operation = operation
+        self._type = operation._Operation__type  # type: ignore[attr-defined]
+        self._selection_list = operation._Operation__selection_list  # type: ignore[attr-defined]
+        self._objects: Dict[Tuple[type, int], Converter] = {}
+        self._plans: Dict[Tuple[type, int], _Plan] = {}
+        self._root: Optional[Converter] = None
+
+    def __call__(self, response: Dict[str, Any]) -> Any:
+        errors = response.get("errors")
+        data = response.get("data")
+        if not data:
+            raise (
+                GraphQLErrors(errors) if errors else ValueError("no data and no errors")
+            )
+        if self._root is None:
+            self._root = self._object(self._type, self._selection_list)
+        # Interpreting only allocates; collections would repeatedly walk
+        # the objects built so far.
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            result = self._root(data)
+        finally:
+            if enabled:
+                gc.enable()
+        result.__errors__ = errors
+        return result
+
+    def _object(self, cls: type, selection: Any) -> Converter:
+        """Converter of JSON objects into `cls` for `selection`."""
+        key = (cls, id(selection))
+        convert = self._objects.get(key)
+        if convert is not None:
+            return convert
+
+        plan = self._plan(cls, selection)
+        new = object.__new__
+
+        def build(values: Optional[Dict[str, Any]]) -> Any:
+            obj = new(cls)
+            attributes = obj.__dict__
+            attributes["__selection_list__"] = selection
+            attributes["__fields_cache__"] = cache = OrderedDict()
+            if values is None:
+                # Like ContainerType, `null` gives an object without fields.
+                values = {}
+            else:
+                plan.fill(obj, values, cache)
+            attributes["__json_data__"] = values
+            return obj
+
+        convert = build
+        possible_types = getattr(cls, "__possible_types__", None)
+        if issubclass(cls, sgqlc.types.Interface) and possible_types:
+            # Interfaces build their concrete type when it is known.
+            concrete: Dict[str, Converter] = {}
+
+            def build_concrete(values: Optional[Dict[str, Any]]) -> Any:
+                name = values.get("__typename") if values else None
+                if name:
+                    convert = concrete.get(name)
+                    if convert is None:
+                        type_ = possible_types.get(name)
+                        if type_ is None or type_ is cls:
+                            convert = build
+                        else:
+                            convert = self._object(type_, selection)
+                        concrete[name] = convert
+                    return convert(values)
+                return build(values)
+
+            convert = build_concrete
+
+        self._objects[key] = convert
+        return convert
+
+    def _plan(self, cls: type, selection: Any) -> _Plan:
+        key = (cls, id(selection))
+        plan = self._plans.get(key)
+        if plan is not None:
+            return plan
+
+        selections = selection.__get_selections_or_auto_select__()
+        if isinstance(selections, list):
+            casts, fragments = selection.__casts__, selection.__fragments__
+        else:
+            casts, fragments = selections.__casts__, selections.__fragments__
+
+        entries: List[Tuple[str, str, Any, Optional[Converter]]] = []
+        for sel in selections:
+            field, alias = sel.__field__, sel.__alias__
+            if alias is None:
+                entries.append(
+                    (field.graphql_name, field.name, field, self._field(sel))
+                )
+            else:
+                entries.append((alias, alias, sel, None))
+        plan = self._plans[key] = _Plan(entries, {}, {})
+        plan.casts = {
+            name: self._plan(cls, cast) for name, cast in (casts or {}).items()
+        }
+        plan.fragments = {
+            name: [self._plan(cls, fragment) for fragment in fragment_list]
+            for name, fragment_list in (fragments or {}).items()
+        }
+        return plan
+
+    def _field(self, sel: Any) -> Converter:
+        """Converter of the values of a selected field."""
+        convert = self._value(sel.__field__.type, sel)
+        casts = sel.__casts__
+        if not casts:
+            return convert
+        by_typename = {
+            name: self._value(cast.__type__, sel) for name, cast in casts.items()
+        }
+
+        def cast(value: Any) -> Any:
+            if isinstance(value, dict):
+                name = value.get("__typename")
+                if name:
+                    return by_typename.get(name, convert)(value)
+            return convert(value)
+
+        return cast
+
+    def _value(self, type_: Any, sel: Any) -> Converter:
+        """Converter of JSON values into `type_`, as `type_(value, sel)`."""
+        name = type_.__name__
+        if name.endswith("!"):
+            inner = self._value(type_.__bases__[0], sel)
+
+            def non_null(value: Any) -> Any:
+                if value is None:
+                    raise ValueError(name + " received null value")
+                return inner(value)
+
+            return non_null
+
+        if name.startswith("["):
+            inner = self._value(type_.__bases__[0], sel)
+
+            def list_of(value: Any) -> Any:
+                if value is None:
+                    return None
+                return [inner(item) for item in value]
+
+            return list_of
+
+        if issubclass(type_, sgqlc.types.Scalar):
+            converter = type_.converter
+            if converter is sgqlc.types.Scalar.converter:
+                return _identity
+
+            def scalar(value: Any) -> Any:
+                if value is None:
+                    return None
+                return converter(value)
+
+            return scalar
+
+        if issubclass(type_, sgqlc.types.Enum):
+            choices = frozenset(type_.__choices__)
+
+            def enum(value: Any) -> Any:
+                if value is None or value in choices:
+                    return value
+                raise ValueError("%s does not accept value %s" % (type_, value))
+
+            return enum
+
+        if issubclass(type_, sgqlc.types.ContainerType) and not issubclass(
+            type_, sgqlc.types.Input
+        ):
+            return self._object(type_, sel)
+
+        if issubclass(type_, sgqlc.types.Union):
+            members: Dict[str, Converter] = {}
+
+            def union(value: Any) -> Any:
+                if value is None:
+                    return None
+                member = type_.__typename_to_type__.get(value.get("__typename"))
+                if member is None:
+                    return type_(value, sel)
+                convert = members.get(member.__name__)
+                if convert is None:
+                    convert = members[member.__name__] = self._object(member, sel)
+                return convert(value)
+
+            return union
+
+        return lambda value: type_(value, sel)
+
+
+_interpreters: Dict[int, Tuple[Operation, OperationInterpreter]] = {}
+
+
+def interpret(operation: Operation, response: Dict[str, Any]) -> Any:
+    """`operation + response`, through a cached `OperationInterpreter`."""
+    entry = _interpreters.get(id(operation))
+    if entry is None or entry[0] is not operation:
+        entry = _interpreters[id(operation)] = (
+            operation,
+            OperationInterpreter(operation),
+        )
+    return entry[1](response)
+
+
+def load_operation(module: str, name: str) -> Operation:
+    """The operation `name` of the `Operations` of an operations module."""
+    operations = importlib.import_module(module).Operations
+    for kind in ("query", "mutation", "subscription"):
+        container = getattr(operations, kind, None)
+        if container is not None and hasattr(container, name):
+            return getattr(container, name)
+    raise LookupError(f"{module} has no operation {name}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("module", help="module generated by sgqlc-codegen operation")
+    parser.add_argument("operation", help="attribute of Operations.query, ...")
+    parser.add_argument("response", type=Path, help="JSON response")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(Path.cwd()))
+    operation = load_operation(args.module, args.operation)
+    response = json.loads(args.response.read_text(encoding="utf-8"))
+    print(repr(interpret(operation, response)))
+
+
+if __name__ == "__main__":
+    main()
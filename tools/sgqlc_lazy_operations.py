@@ -0,0 +1,74 @@
+"""
+Makes the operations of an `sgqlc-codegen operation` module lazy.
+
+Usage (from codegens/sgqlc, after sgqlc-codegen):
+
+    python ../../tools/sgqlc_lazy_operations.py tableau_operations.py
+
+sgqlc-codegen builds every operation while the module is imported:
+
+    class Query:
+        list_issues = query_list_issues()
+
+This rewrites such attributes to `_LazyOperation(query_list_issues)`, a
+descriptor that builds the operation on first access and replaces itself
+with it. The operation's `__to_graphql__()` is memoized, so `str()` and
+`bytes()` (what the sgqlc endpoints send) render the document once.
+Rewriting an already rewritten module changes nothing.
+"""
+
+import argparse
+import re
+from pathlib import Path
+from typing import List, Optional
+
+_ATTRIBUTE = re.compile(r"^(    \w+ = )(\w+)\(\)$", re.MULTILINE)
+_CLASS = re.compile(r"^class \w+:\n(?:    \w+ = \w+\(\)\n)+", re.MULTILINE)
+
+_LAZY_OPERATION = """\
+class _LazyOperation:
+    def __init__(self, build):
+        self.build = build
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        operation = self.build()
+        operation.__to_graphql__ = functools.lru_cache(maxsize=None)(
+            operation.__to_graphql__
+        )
+        setattr(owner, self.name, operation)
+        return operation
+
+
+"""
+
+
+def rewrite(source: str) -> str:
+    """`source` with its operation classes building operations lazily."""
+    if "class _LazyOperation:" in source:
+        return source
+    first = _CLASS.search(source)
+    if first is None:
+        return source
+    source = _CLASS.sub(
+        lambda match: _ATTRIBUTE.sub(r"\1_LazyOperation(\2)", match.group(0)),
+        source,
+    )
+    source = source[: first.start()] + _LAZY_OPERATION + source[first.start() :]
+    return "import functools\n" + source
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("modules", nargs="+", type=Path, help="files to rewrite")
+    args = parser.parse_args(argv)
+
+    for path in args.modules:
+        source = path.read_text(encoding="utf-8")
+        path.write_text(rewrite(source), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
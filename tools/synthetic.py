@@ -0,0 +1,388 @@
+"""
+Generates synthetic Tableau Metadata API responses for any operation.
+
+Usage:
+
+    python tools/synthetic.py codegens/ariadne-codegen/tableau-queries.graphql \\
+        --operation GetItems_sheetsConnection --nodes 10000 --seed 7 > page.json
+
+The selection set of the operation is walked against the Tableau schema,
+so every response is valid for the operation: `__typename` is a concrete
+type of the field, inline fragments and fragment spreads contribute their
+fields only when their type condition matches, aliases are honoured and
+enums only take declared values. The connection at the root of the query
+gets `--nodes` nodes; every other list has a random length averaging
+`--fan-out`. Entities below the root are drawn from a pool of
+`--entity-pool` ids per type, and an entity is always rendered from the
+same random stream, so a workbook or datasource repeated across nodes
+has the same values wherever it is selected the same way. The same
+seed, arguments and document always give the same response.
+"""
+
+import argparse
+import importlib.util
+import json
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLEnumType,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLOutputType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    is_abstract_type,
+    is_composite_type,
+    parse,
+)
+
+# The Tableau schema loader of `tableau_runtime`, shared by every tool. It is
+# loaded from its file rather than imported, so that the tools do not
+# import the whole runtime (and the ariadne-codegen client under it) just
+# to read the SDL.
+_loader = importlib.util.spec_from_file_location(
+    "tableau_runtime_schema",
+    Path(__file__).resolve().parents[1]
+    / "codegens"
+    / "ariadne-codegen"
+    / "tableau_runtime"
+    / "schema.py",
+)
+_schema_module = importlib.util.module_from_spec(_loader)  # type: ignore[arg-type]
+_loader.loader.exec_module(_schema_module)  # type: ignore[union-attr]
+SCHEMA_PATH: Path = _schema_module.SCHEMA_PATH
+load_schema: Callable[..., GraphQLSchema] = _schema_module.load_schema
+
+_EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+class ResponseGenerator:
+    """
+    Deterministic, size-parameterised fake responses for GraphQL operations.
+
+    `null_rate` is the probability that a nullable field is `null`.
+    """
+
+    def __init__(
+        self,
+        schema: Optional[GraphQLSchema] = None,
+        seed: int = 0,
+        fan_out: float = 3,
+        null_rate: float = 0.05,
+        entity_pool: int = 1000,
+    ) -> None:
+        self.schema = schema or load_schema()
+        self.seed = seed
+        self.fan_out = fan_out
+        self.null_rate = null_rate
+        self.entity_pool = entity_pool
+        self._fragments: Dict[str, FragmentDefinitionNode] = {}
+        self._possible_types: Dict[str, List[GraphQLObjectType]] = {}
+        self._collected: Dict[
+            Tuple[Tuple[int, ...], str], Dict[str, List[FieldNode]]
+        ] = {}
+
+    def generate(
+        self,
+        document: Union[str, DocumentNode],
+        nodes: int = 100,
+        operation_name: Optional[str] = None,
+        page: int = 0,
+        has_next_page: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Returns `{"data": ...}` for the operation. `page` selects which
+        slice of root nodes is generated, so consecutive pages of a crawl
+        have distinct, stable nodes.
+        """
+        ast = parse(document) if isinstance(document, str) else document
+        self._collected.clear()
+        self._fragments = {
+            definition.name.value: definition
+            for definition in ast.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        operation = next(
+            definition
+            for definition in ast.definitions
+            if isinstance(definition, OperationDefinitionNode)
+            and (
+                operation_name is None
+                or (definition.name and definition.name.value == operation_name)
+            )
+        )
+        root_type = self.schema.get_root_type(operation.operation)
+        assert root_type is not None
+
+        rng = random.Random(f"{self.seed}/{page}")
+        data: Dict[str, Any] = {}
+        for key, fields in self._collect(operation.selection_set, root_type).items():
+            field = fields[0]
+            if field.name.value == "__typename":
+                data[key] = root_type.name
+                continue
+            definition = root_type.fields[field.name.value]
+            data[key] = self._root_field(
+                rng, definition.type, fields, nodes, page, has_next_page
+            )
+        return {"data": data}
+
+    def _root_field(
+        self,
+        rng: random.Random,
+        type_: GraphQLOutputType,
+        fields: List[FieldNode],
+        nodes: int,
+        page: int,
+        has_next_page: bool,
+    ) -> Any:
+        named = _unwrap(type_)
+        if not isinstance(named, GraphQLObjectType) or "nodes" not in named.fields:
+            return self._value(rng, type_, fields, "value")
+
+        connection: Dict[str, Any] = {}
+        for key, subfields in self._collect_all(fields, named).items():
+            name = subfields[0].name.value
+            if name == "__typename":
+                connection[key] = named.name
+            elif name == "nodes":
+                node_type = _unwrap(named.fields["nodes"].type)
+                connection[key] = [
+                    self._object(
+                        self._concrete(rng, node_type),
+                        subfields,
+                        page * nodes + index,
+                        True,
+                    )
+                    for index in range(nodes)
+                ]
+            elif name == "pageInfo":
+                connection[key] = self._page_info(
+                    named.fields[name].type, subfields, nodes, page, has_next_page
+                )
+            elif name == "totalCount":
+                connection[key] = nodes * (page + 1) + (nodes if has_next_page else 0)
+            else:
+                connection[key] = self._value(
+                    rng, named.fields[name].type, subfields, name
+                )
+        return connection
+
+    def _page_info(
+        self,
+        type_: GraphQLOutputType,
+        fields: List[FieldNode],
+        nodes: int,
+        page: int,
+        has_next_page: bool,
+    ) -> Dict[str, Any]:
+        values = {
+            "__typename": "PageInfo",
+            "hasNextPage": has_next_page,
+            "hasPreviousPage": page > 0,
+            "startCursor": str(page * nodes),
+            "endCursor": str((page + 1) * nodes),
+        }
+        return {
+            key: values[subfields[0].name.value]
+            for key, subfields in self._collect_all(fields, _unwrap(type_)).items()
+        }
+
+    def _value(
+        self,
+        rng: random.Random,
+        type_: GraphQLOutputType,
+        fields: List[FieldNode],
+        name: str,
+    ) -> Any:
+        if isinstance(type_, GraphQLNonNull):
+            return self._non_null(rng, type_.of_type, fields, name)
+        if rng.random() < self.null_rate:
+            return None
+        return self._non_null(rng, type_, fields, name)
+
+    def _non_null(
+        self,
+        rng: random.Random,
+        type_: Any,
+        fields: List[FieldNode],
+        name: str,
+    ) -> Any:
+        if isinstance(type_, GraphQLList):
+            length = int(rng.expovariate(1 / self.fan_out)) if self.fan_out else 0
+            return [
+                self._value(rng, type_.of_type, fields, name) for _ in range(length)
+            ]
+        if is_composite_type(type_):
+            return self._object(
+                self._concrete(rng, type_),
+                fields,
+                rng.randrange(self.entity_pool),
+                False,
+            )
+        if isinstance(type_, GraphQLEnumType):
+            return rng.choice(list(type_.values))
+        return fake_scalar(rng, type_.name, name)
+
+    def _concrete(self, rng: random.Random, type_: Any) -> GraphQLObjectType:
+        if not is_abstract_type(type_):
+            return type_
+        possible_types = self._possible_types.get(type_.name)
+        if possible_types is None:
+            possible_types = self._possible_types[type_.name] = sorted(
+                self.schema.get_possible_types(type_), key=lambda t: t.name
+            )
+        return rng.choice(possible_types)
+
+    def _object(
+        self,
+        type_: GraphQLObjectType,
+        fields: List[FieldNode],
+        index: int,
+        root: bool,
+    ) -> Dict[str, Any]:
+        # Every entity renders from its own stream, so repeats are identical.
+        rng = random.Random(
+            f"{self.seed}/{'root' if root else 'pool'}/{type_.name}/{index}"
+        )
+        entity_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        result: Dict[str, Any] = {}
+        for key, subfields in self._collect_all(fields, type_).items():
+            name = subfields[0].name.value
+            if name == "__typename":
+                result[key] = type_.name
+            elif name == "id":
+                result[key] = entity_id
+            else:
+                result[key] = self._value(rng, type_.fields[name].type, subfields, name)
+        return result
+
+    def _collect_all(
+        self, fields: List[FieldNode], type_: GraphQLObjectType
+    ) -> Dict[str, List[FieldNode]]:
+        cache_key = (tuple(map(id, fields)), type_.name)
+        collected = self._collected.get(cache_key)
+        if collected is None:
+            collected = {}
+            for field in fields:
+                if field.selection_set:
+                    for key, subfields in self._collect(
+                        field.selection_set, type_
+                    ).items():
+                        collected.setdefault(key, []).extend(subfields)
+            self._collected[cache_key] = collected
+        return collected
+
+    def _collect(
+        self, selection_set: SelectionSetNode, type_: GraphQLObjectType
+    ) -> Dict[str, List[FieldNode]]:
+        """Fields selected on the concrete `type_`, grouped by response key."""
+        collected: Dict[str, List[FieldNode]] = {}
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                key = (selection.alias or selection.name).value
+                collected.setdefault(key, []).append(selection)
+                continue
+            if isinstance(selection, InlineFragmentNode):
+                condition = selection.type_condition
+                nested = selection.selection_set
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self._fragments[selection.name.value]
+                condition = fragment.type_condition
+                nested = fragment.selection_set
+            else:  # pragma: no cover
+                continue
+            if condition is None or self._applies(condition.name.value, type_):
+                for key, subfields in self._collect(nested, type_).items():
+                    collected.setdefault(key, []).extend(subfields)
+        return collected
+
+    def _applies(self, condition: str, type_: GraphQLObjectType) -> bool:
+        condition_type = self.schema.get_type(condition)
+        if condition_type is type_:
+            return True
+        return is_abstract_type(condition_type) and self.schema.is_sub_type(
+            condition_type, type_  # type: ignore[arg-type]
+        )
+
+
+def _unwrap(type_: Any) -> Any:
+    while isinstance(type_, (GraphQLNonNull, GraphQLList)):
+        type_ = type_.of_type
+    return type_
+
+
+def fake_scalar(rng: random.Random, type_name: str, field_name: str) -> Any:
+    """A plausible value of a built-in or Tableau scalar for `field_name`."""
+    if type_name == "ID":
+        return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    if type_name == "Int":
+        return rng.randrange(10000)
+    if type_name == "Float":
+        return round(rng.uniform(0, 10000), 3)
+    if type_name == "Boolean":
+        return rng.random() < 0.5
+    if type_name == "DateTime":
+        moment = _EPOCH + timedelta(seconds=rng.randrange(5 * 365 * 86400))
+        return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+    if field_name == "luid":
+        return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    return f"{field_name} {rng.randrange(100000)}"
+
+
+def generate_response(
+    document: Union[str, DocumentNode],
+    nodes: int = 100,
+    operation_name: Optional[str] = None,
+    **options: Any,
+) -> Dict[str, Any]:
+    """Shortcut for `ResponseGenerator(**options).generate(...)`."""
+    return ResponseGenerator(**options).generate(document, nodes, operation_name)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("document", type=Path, help="file with the operation")
+    parser.add_argument("--operation", help="operation name, if several")
+    parser.add_argument("--nodes", type=int, default=100)
+    parser.add_argument("--page", type=int, default=0)
+    parser.add_argument("--has-next-page", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fan-out", type=float, default=3)
+    parser.add_argument("--null-rate", type=float, default=0.05)
+    parser.add_argument("--entity-pool", type=int, default=1000)
+    parser.add_argument("--schema", help="SDL file (default: the Tableau schema)")
+    args = parser.parse_args(argv)
+
+    generator = ResponseGenerator(
+        load_schema(args.schema),
+        seed=args.seed,
+        fan_out=args.fan_out,
+        null_rate=args.null_rate,
+        entity_pool=args.entity_pool,
+    )
+    response = generator.generate(
+        args.document.read_text(encoding="utf-8"),
+        nodes=args.nodes,
+        operation_name=args.operation,
+        page=args.page,
+        has_next_page=args.has_next_page,
+    )
+    json.dump(response, sys.stdout, separators=(",", ":"))
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()